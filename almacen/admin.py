@@ -42,9 +42,12 @@ from .models import (
     RondaCotizacion,
 )
 
+from config.admin_rendimiento import AdminListaEficienteMixin
+from config.agregados import Total
 from config.constants import (
     ESTADO_UNIDAD_CHOICES,
     DISPONIBILIDAD_UNIDAD_CHOICES,
+    ESTADOS_UNIDAD_USABLES,
     ORIGEN_UNIDAD_CHOICES,
 )
 
@@ -53,12 +56,15 @@ from config.constants import (
 # ADMIN: PROVEEDOR
 # ============================================================================
 @admin.register(Proveedor)
-class ProveedorAdmin(admin.ModelAdmin):
+class ProveedorAdmin(AdminListaEficienteMixin, admin.ModelAdmin):
     """
     Configuración del admin para Proveedores.
     Permite gestionar la lista de proveedores del almacén.
     """
     
+    # Conteos anotados en la consulta de la lista (ver config/admin_rendimiento.py)
+    totales_lista = {'compras': Total('compras_realizadas')}
+    
     list_display = (
         'nombre',
         'contacto',
@@ -104,7 +110,7 @@ class ProveedorAdmin(admin.ModelAdmin):
     
     def total_compras(self, obj):
         """Muestra el número de compras realizadas a este proveedor"""
-        return obj.compras_realizadas.count()
+        return self.total_lista(obj, 'compras')
     total_compras.short_description = 'Compras'
 
 
@@ -112,11 +118,13 @@ class ProveedorAdmin(admin.ModelAdmin):
 # ADMIN: CATEGORÍA DE ALMACÉN
 # ============================================================================
 @admin.register(CategoriaAlmacen)
-class CategoriaAlmacenAdmin(admin.ModelAdmin):
+class CategoriaAlmacenAdmin(AdminListaEficienteMixin, admin.ModelAdmin):
     """
     Configuración del admin para Categorías de Almacén.
     """
     
+    totales_lista = {'productos_activos': Total('productos', filtro=('activo', (True,)))}
+    
     list_display = (
         'nombre',
         'descripcion_corta',
@@ -139,7 +147,7 @@ class CategoriaAlmacenAdmin(admin.ModelAdmin):
     
     def cantidad_productos(self, obj):
         """Muestra cuántos productos tiene la categoría"""
-        return obj.productos.filter(activo=True).count()
+        return self.total_lista(obj, 'productos_activos')
     cantidad_productos.short_description = 'Productos'
     
     def activo_badge(self, obj):
@@ -202,12 +210,23 @@ class UnidadInventarioInline(admin.TabularInline):
 # ADMIN: PRODUCTO DE ALMACÉN
 # ============================================================================
 @admin.register(ProductoAlmacen)
-class ProductoAlmacenAdmin(admin.ModelAdmin):
+class ProductoAlmacenAdmin(AdminListaEficienteMixin, admin.ModelAdmin):
     """
     Configuración del admin para Productos de Almacén.
     Este es el modelo principal - se configura con más detalle.
     """
     
+    list_select_related = ('categoria', 'proveedor_principal')
+    
+    # Mismos criterios que ProductoAlmacen.unidades / unidades_disponibles()
+    totales_lista = {
+        'unidades': Total('unidades'),
+        'unidades_disponibles': Total('unidades', filtro=(
+            ('disponibilidad', ('disponible',)),
+            ('estado', tuple(ESTADOS_UNIDAD_USABLES)),
+        )),
+    }
+    
     list_display = (
         'codigo_producto',
         'nombre',
@@ -305,9 +324,9 @@ class ProductoAlmacenAdmin(admin.ModelAdmin):
         - Si el producto tiene unidades rastreadas, muestra: "5 / 10" (5 rastreadas de 10 en stock)
         - Si no tiene unidades rastreadas, muestra un guion
         """
-        if obj.tiene_unidades_rastreadas():
-            disponibles = obj.cantidad_unidades_disponibles()
-            total = obj.unidades.count()
+        total = self.total_lista(obj, 'unidades')
+        if total:
+            disponibles = self.total_lista(obj, 'unidades_disponibles')
             return format_html(
                 '<span title="{} disponibles de {} rastreadas">📋 {} disp / {} total</span>',
                 disponibles, total, disponibles, total
@@ -28,6 +28,7 @@ from django.core.validators import (
     MaxValueValidator,
     FileExtensionValidator,
 )
+from config.agregados import Total, anotar_totales, leer_total, olvidar_totales
 from config.validators import FileSizeValidator
 from django.utils import timezone
 from PIL import Image
@@ -56,6 +57,7 @@ from config.constants import (
     # Constantes para SolicitudCotizacion (nuevo)
     ESTADO_SOLICITUD_COTIZACION_CHOICES,
     ESTADO_LINEA_COTIZACION_CHOICES,
+    ESTADOS_LINEA_COTIZACION_ACEPTADA,
     OPCION_PAGO_REAC_CHOICES,
     # Constantes para datos del cliente en cotizaciones
     MARCAS_EQUIPOS_CHOICES,
@@ -2865,6 +2867,71 @@ class UnidadInventario(models.Model):
 # ============================================================================
 # MODELO: SOLICITUD DE COTIZACIÓN (MULTI-PROVEEDOR)
 # ============================================================================
+
+def _costo_linea(linea):
+    if linea.costo_unitario is None:
+        return None
+    return linea.cantidad * linea.costo_unitario
+
+
+_ACEPTADAS_CLIENTE = ('estado_cliente', ESTADOS_LINEA_COTIZACION_ACEPTADA)
+
+# Totales de líneas (piezas) y servicios adicionales de una solicitud.
+# Ver config/agregados.py: se anotan con .con_totales(), se leen del prefetch
+# o, en último caso, se consultan.
+TOTALES_SOLICITUD = {
+    'total_lineas': Total('lineas'),
+    'lineas_aprobadas': Total('lineas', filtro=('estado_cliente', ('aprobada',))),
+    'lineas_rechazadas': Total('lineas', filtro=('estado_cliente', ('rechazada',))),
+    'lineas_pendientes': Total('lineas', filtro=('estado_cliente', ('pendiente',))),
+    'lineas_aceptadas': Total('lineas', filtro=_ACEPTADAS_CLIENTE),
+    'costo_total': Total(
+        'lineas', suma=(models.F('cantidad') * models.F('costo_unitario'), _costo_linea),
+    ),
+    'costo_aprobado': Total(
+        'lineas',
+        filtro=_ACEPTADAS_CLIENTE,
+        suma=(models.F('cantidad') * models.F('costo_unitario'), _costo_linea),
+    ),
+    'precio_cliente_aprobado_sin_iva': Total(
+        'lineas',
+        filtro=_ACEPTADAS_CLIENTE,
+        suma=(models.F('subtotal_cliente_sin_iva'), lambda linea: linea.subtotal_cliente_sin_iva),
+    ),
+    'total_servicios_adicionales': Total('servicios_adicionales'),
+    'servicios_aprobados': Total('servicios_adicionales', filtro=('estado_cliente', ('aprobada',))),
+    'servicios_rechazados': Total('servicios_adicionales', filtro=('estado_cliente', ('rechazada',))),
+    'servicios_pendientes': Total('servicios_adicionales', filtro=('estado_cliente', ('pendiente',))),
+    'servicios_aceptados': Total('servicios_adicionales', filtro=_ACEPTADAS_CLIENTE),
+    'costo_servicios_adicionales': Total(
+        'servicios_adicionales', suma=(models.F('costo'), lambda servicio: servicio.costo),
+    ),
+    'servicios_aprobados_con_iva': Total(
+        'servicios_adicionales',
+        filtro=_ACEPTADAS_CLIENTE,
+        suma=(models.F('costo'), lambda servicio: servicio.costo),
+    ),
+}
+
+
+class SolicitudCotizacionQuerySet(models.QuerySet):
+    """QuerySet de SolicitudCotizacion (SolicitudCotizacion.objects)."""
+
+    def con_totales(self):
+        """
+        Anota conteos y sumas de líneas/servicios en la misma consulta.
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Sin esto, cada fila de una lista ejecuta una consulta por propiedad
+        (total_lineas, lineas_aprobadas, costo_total, ...). Con esto, las
+        propiedades leen el valor ya anotado.
+
+        Returns:
+            QuerySet: el mismo QuerySet con las anotaciones de TOTALES_SOLICITUD.
+        """
+        return anotar_totales(self, TOTALES_SOLICITUD)
+
+
 class SolicitudCotizacion(models.Model):
     """
     Cabecera de cotización que agrupa múltiples líneas con diferentes proveedores.
@@ -3275,6 +3342,8 @@ class SolicitudCotizacion(models.Model):
             models.Index(fields=['numero_orden_cliente']),
             models.Index(fields=['estado']),
         ]
+
+    objects = SolicitudCotizacionQuerySet.as_manager()
     
     def __str__(self):
         """
@@ -3405,26 +3474,33 @@ class SolicitudCotizacion(models.Model):
             )
     
     # ========== PROPIEDADES CALCULADAS ==========
+    # EXPLICACIÓN PARA PRINCIPIANTES:
+    # Los conteos y sumas salen de _total(): primero lo anotado por
+    # SolicitudCotizacion.objects.con_totales(), luego las líneas precargadas
+    # con prefetch_related y, solo si no hay nada de eso, una consulta.
+
+    def _total(self, nombre):
+        return leer_total(self, nombre, TOTALES_SOLICITUD[nombre])
     
     @property
     def total_lineas(self):
         """Número total de líneas en esta solicitud"""
-        return self.lineas.count()
+        return self._total('total_lineas')
     
     @property
     def lineas_aprobadas(self):
         """Número de líneas aprobadas por el cliente"""
-        return self.lineas.filter(estado_cliente='aprobada').count()
+        return self._total('lineas_aprobadas')
     
     @property
     def lineas_rechazadas(self):
         """Número de líneas rechazadas por el cliente"""
-        return self.lineas.filter(estado_cliente='rechazada').count()
+        return self._total('lineas_rechazadas')
     
     @property
     def lineas_pendientes(self):
         """Número de líneas pendientes de respuesta"""
-        return self.lineas.filter(estado_cliente='pendiente').count()
+        return self._total('lineas_pendientes')
     
     @property
     def costo_total(self):
@@ -3434,11 +3510,7 @@ class SolicitudCotizacion(models.Model):
         Returns:
             Decimal: Suma de (cantidad × costo_unitario) de todas las líneas
         """
-        from django.db.models import Sum, F
-        total = self.lineas.aggregate(
-            total=Sum(F('cantidad') * F('costo_unitario'))
-        )['total']
-        return total or 0
+        return self._total('costo_total')
     
     @property
     def costo_aprobado(self):
@@ -3448,13 +3520,7 @@ class SolicitudCotizacion(models.Model):
         Returns:
             Decimal: Suma solo de líneas con estado_cliente='aprobada'
         """
-        from django.db.models import Sum, F
-        total = self.lineas.filter(
-            estado_cliente__in=['aprobada', 'compra_generada']
-        ).aggregate(
-            total=Sum(F('cantidad') * F('costo_unitario'))
-        )['total']
-        return total or 0
+        return self._total('costo_aprobado')
 
     @property
     def precio_cliente_aprobado_sin_iva(self):
@@ -3464,11 +3530,7 @@ class SolicitudCotizacion(models.Model):
         Returns:
             Decimal: Total precio cliente de piezas aceptadas
         """
-        from django.db.models import Sum
-        total = self.lineas.filter(
-            estado_cliente__in=['aprobada', 'compra_generada']
-        ).aggregate(total=Sum('subtotal_cliente_sin_iva'))['total']
-        return total or 0
+        return self._total('precio_cliente_aprobado_sin_iva')
 
     @property
     def margen_aprobado_estimado(self):
@@ -3501,13 +3563,8 @@ class SolicitudCotizacion(models.Model):
         Los servicios se cotizan con IVA incluido; este monto es lo que paga el cliente.
         """
         from decimal import Decimal
-        from django.db.models import Sum
-        from config.constants import ESTADOS_LINEA_COTIZACION_ACEPTADA
 
-        total = self.servicios_adicionales.filter(
-            estado_cliente__in=ESTADOS_LINEA_COTIZACION_ACEPTADA
-        ).aggregate(total=Sum('costo'))['total']
-        return total or Decimal('0')
+        return self._total('servicios_aprobados_con_iva') or Decimal('0')
 
     @property
     def servicios_aprobados_sin_iva(self):
@@ -3624,22 +3681,22 @@ class SolicitudCotizacion(models.Model):
     @property
     def total_servicios_adicionales(self):
         """Número total de servicios adicionales en esta solicitud."""
-        return self.servicios_adicionales.count()
+        return self._total('total_servicios_adicionales')
     
     @property
     def servicios_aprobados(self):
         """Número de servicios adicionales aprobados por el cliente."""
-        return self.servicios_adicionales.filter(estado_cliente='aprobada').count()
+        return self._total('servicios_aprobados')
     
     @property
     def servicios_rechazados(self):
         """Número de servicios adicionales rechazados por el cliente."""
-        return self.servicios_adicionales.filter(estado_cliente='rechazada').count()
+        return self._total('servicios_rechazados')
     
     @property
     def servicios_pendientes(self):
         """Número de servicios adicionales pendientes de respuesta."""
-        return self.servicios_adicionales.filter(estado_cliente='pendiente').count()
+        return self._total('servicios_pendientes')
 
     # ========== CONTEOS COMBINADOS (piezas + servicios) — UI Resumen ==========
 
@@ -3662,15 +3719,7 @@ class SolicitudCotizacion(models.Model):
         Incluye 'aprobada' y 'compra_generada' para que, tras generar compras,
         el Resumen no baje a cero.
         """
-        from config.constants import ESTADOS_LINEA_COTIZACION_ACEPTADA
-
-        piezas = self.lineas.filter(
-            estado_cliente__in=ESTADOS_LINEA_COTIZACION_ACEPTADA
-        ).count()
-        servicios = self.servicios_adicionales.filter(
-            estado_cliente__in=ESTADOS_LINEA_COTIZACION_ACEPTADA
-        ).count()
-        return piezas + servicios
+        return self._total('lineas_aceptadas') + self._total('servicios_aceptados')
 
     @property
     def items_rechazados_respuesta(self):
@@ -3690,11 +3739,7 @@ class SolicitudCotizacion(models.Model):
         Returns:
             Decimal: Suma de costos de todos los servicios adicionales
         """
-        from django.db.models import Sum
-        total = self.servicios_adicionales.aggregate(
-            total=Sum('costo')
-        )['total']
-        return total or 0
+        return self._total('costo_servicios_adicionales')
     
     @property
     def costo_servicios_aprobados(self):
@@ -3917,6 +3962,9 @@ class SolicitudCotizacion(models.Model):
         """
         if self.estado not in ['enviada_front', 'enviada_cliente', 'parcialmente_aprobada']:
             return self.estado
+
+        # Recién cambió una línea: contar en la BD, no sobre lo anotado/precargado
+        olvidar_totales(self, TOTALES_SOLICITUD)
         
         # Contar líneas de cotización (piezas)
         total_lineas = self.total_lineas
@@ -22,6 +22,7 @@ import logging
 import traceback
 
 from celery import shared_task
+from notificaciones.correo_service import adjuntar_recursos_inline, enviar_correo
 
 logger = logging.getLogger('almacen')
 
@@ -66,7 +67,6 @@ def notificar_front_cotizacion_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from email.mime.image import MIMEImage
     from PIL import Image
 
@@ -246,36 +246,8 @@ def notificar_front_cotizacion_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Adjuntar logo SIC
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[COTIZACION] Error al adjuntar logo: {e}")
-
-        # Adjuntar iconos de redes sociales
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[COTIZACION] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[COTIZACION]')
 
         # Adjuntar imágenes comprimidas de todas las líneas como inline (CID)
         for linea_data in lineas_con_imagenes:
@@ -285,7 +257,7 @@ def notificar_front_cotizacion_task(
                 img_mime.add_header('Content-Disposition', 'inline', filename=img_data['nombre'])
                 email_msg.attach(img_mime)
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[COTIZACION] Correo enviado a {', '.join(destinatarios)}")
 
         # ===================================================================
@@ -338,8 +310,6 @@ def notificar_compras_nueva_cotizacion_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
 
     from .models import SolicitudCotizacion
     from inventario.models import Empleado
@@ -448,38 +418,10 @@ def notificar_compras_nueva_cotizacion_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Adjuntar logo SIC (CID para mostrar inline en el correo)
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[COTIZACION-COMPRAS] Error al adjuntar logo: {e}")
-
-        # Adjuntar iconos de redes sociales (CID para mostrar inline)
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[COTIZACION-COMPRAS] Error al adjuntar iconos: {e}")
-
-        email_msg.send(fail_silently=False)
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[COTIZACION-COMPRAS]')
+
+        enviar_correo(email_msg)
         logger.info(
             f"[COTIZACION-COMPRAS] Correo enviado a {len(destinatarios)} destinatario(s): "
             f"{', '.join(destinatarios)}"
@@ -507,48 +449,13 @@ def _adjuntar_logo_e_iconos_email(email_msg, log_prefix: str) -> None:
     EXPLICACIÓN PARA PRINCIPIANTES:
     Los correos HTML no pueden usar {% static %}; las imágenes van embebidas
     con Content-ID (cid:logo_sic) para que el cliente de correo las muestre.
+    Las partes MIME se arman una vez por proceso (notificaciones.correo_service).
 
     Args:
         email_msg: EmailMessage ya creado.
         log_prefix: Prefijo para mensajes de log (ej. '[COTIZ-ACEPTADA]').
     """
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
-
-    try:
-        logo_path = finders.find('images/logos/logo_sic.png')
-        if logo_path:
-            with open(logo_path, 'rb') as f:
-                logo_mime = MIMEImage(f.read(), _subtype='png')
-                logo_mime.add_header('Content-ID', '<logo_sic>')
-                logo_mime.add_header(
-                    'Content-Disposition', 'inline', filename='logo_sic.png'
-                )
-                email_msg.attach(logo_mime)
-    except Exception as e:
-        logger.warning(f'{log_prefix} Error al adjuntar logo: {e}')
-
-    try:
-        iconos_sociales = {
-            'icon_link': 'images/utilitys/link.png',
-            'icon_instagram': 'images/utilitys/instagram.png',
-            'icon_facebook': 'images/utilitys/facebook.png',
-            'icon_whatsapp': 'images/utilitys/whatsapp.png',
-        }
-        for cid_name, icon_static_path in iconos_sociales.items():
-            icon_path = finders.find(icon_static_path)
-            if icon_path:
-                with open(icon_path, 'rb') as f:
-                    icon_mime = MIMEImage(f.read(), _subtype='png')
-                    icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                    icon_mime.add_header(
-                        'Content-Disposition',
-                        'inline',
-                        filename=f'{cid_name}.png',
-                    )
-                    email_msg.attach(icon_mime)
-    except Exception as e:
-        logger.warning(f'{log_prefix} Error al adjuntar iconos: {e}')
+    adjuntar_recursos_inline(email_msg, log_prefix=log_prefix)
 
 
 def _remitente_sistema_compras() -> str:
@@ -673,7 +580,7 @@ def notificar_compras_cotizacion_aceptada_task(
         )
         email_msg.content_subtype = 'html'
         _adjuntar_logo_e_iconos_email(email_msg, log_prefix)
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         logger.info(
             f'{log_prefix} Correo enviado a {len(destinatarios)}: '
@@ -825,7 +732,7 @@ def notificar_respuesta_cotizacion_rechazada_task(
         )
         email_msg.content_subtype = 'html'
         _adjuntar_logo_e_iconos_email(email_msg, log_prefix)
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         logger.info(
             f'{log_prefix} Correo enviado a {len(emails)}: {", ".join(emails)}'
@@ -906,8 +813,6 @@ def enviar_cotizacion_cliente_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
     from email.mime.application import MIMEApplication
 
     from .models import SolicitudCotizacion
@@ -1144,36 +1049,8 @@ def enviar_cotizacion_cliente_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Adjuntar el logo SIC como imagen inline (CID)
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[COTIZACION-CLIENTE] Error al adjuntar logo: {e}")
-
-        # Adjuntar iconos de redes sociales (CID inline)
-        try:
-            iconos = {
-                'icon_link':      'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook':  'images/utilitys/facebook.png',
-                'icon_whatsapp':  'images/utilitys/whatsapp.png',
-            }
-            for cid_name, static_path in iconos.items():
-                icon_path = finders.find(static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[COTIZACION-CLIENTE] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[COTIZACION-CLIENTE]')
 
         # Adjuntar el PDF generado como archivo descargable
         pdf_mime = MIMEApplication(pdf_bytes, _subtype='pdf')
@@ -1181,7 +1058,7 @@ def enviar_cotizacion_cliente_task(
         email_msg.attach(pdf_mime)
 
         # Enviar el correo
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(
             f"[COTIZACION-CLIENTE] Correo enviado a {email_cliente} "
             f"(CC: {', '.join(copia_empleados) if copia_empleados else 'ninguno'}) "
@@ -1242,11 +1119,9 @@ def notificar_cliente_pnc_task(
     """
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from django.core.mail import EmailMessage
     from django.template.loader import render_to_string
     from django.utils import timezone
-    from email.mime.image import MIMEImage
 
     from config.paises_config import fecha_local_pais, get_pais_actual
 
@@ -1366,42 +1241,10 @@ def notificar_cliente_pnc_task(
         )
         email_msg.content_subtype = 'html'
 
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header(
-                        'Content-Disposition', 'inline', filename='logo_sic.png'
-                    )
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f'[PNC-CLIENTE] Error al adjuntar logo: {e}')
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[PNC-CLIENTE]')
 
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header(
-                            'Content-Disposition',
-                            'inline',
-                            filename=f'{cid_name}.png',
-                        )
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f'[PNC-CLIENTE] Error al adjuntar iconos: {e}')
-
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f'[PNC-CLIENTE] Correo enviado a {email_cliente}')
 
         return {
@@ -58,6 +58,7 @@ def notificar_almacenista_solicitud_baja_task(
         _adjuntar_logo_e_iconos_email,
         _remitente_sistema_compras,
     )
+    from notificaciones.correo_service import enviar_correo
     from almacen.utils.notificar_solicitud_baja import (
         armar_destinatarios_email,
         url_absoluta_procesar_solicitud,
@@ -159,7 +160,7 @@ def notificar_almacenista_solicitud_baja_task(
         )
         email_msg.content_subtype = 'html'
         _adjuntar_logo_e_iconos_email(email_msg, log_prefix)
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         logger.info(
             '%s Correo enviado To=%s CC=%s solicitud #%s',
@@ -275,6 +276,7 @@ def notificar_solicitud_baja_procesada_task(
         _adjuntar_logo_e_iconos_email,
         _remitente_sistema_compras,
     )
+    from notificaciones.correo_service import enviar_correo
     from almacen.utils.notificar_solicitud_baja import (
         armar_destinatarios_email_procesada,
         url_absoluta_lista_solicitudes,
@@ -365,7 +367,7 @@ def notificar_solicitud_baja_procesada_task(
         )
         email_msg.content_subtype = 'html'
         _adjuntar_logo_e_iconos_email(email_msg, log_prefix)
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         logger.info(
             '%s Correo enviado To=%s CC=%s solicitud #%s estado=%s',
@@ -18,9 +18,10 @@ a partir del subdominio, así que hay que decirles explícitamente en qué base
 trabajar con el parámetro ``db_alias``.
 
 La tarea del Beat no puede recibir un solo ``db_alias`` (debe revisar TODOS los
-países), así que hace "fan-out": recorre la lista de países y encola una tarea
-hija por cada uno, ya con su ``db_alias``. Así el ORM se enruta solo y no hay
-que escribir ``.using()`` en cada consulta.
+países), así que hace "fan-out" con ``en_todos_los_paises``: revisa los países
+a la vez, cada uno dentro de su contexto de país, así el ORM se enruta solo y
+no hay que escribir ``.using()`` en cada consulta. Si un país falla, se encola
+su tarea hija (con reintentos) para ese país.
 
 Este archivo NO se registra solo en Celery: al final de ``almacen/tasks.py``
 hay un import que lo trae, porque Celery únicamente autodescubre el módulo
@@ -50,46 +51,59 @@ logger = logging.getLogger('almacen')
 )
 def verificar_vigencia_cotizaciones():
     """
-    Revisa todos los países y encola la revisión de vigencias de cada uno.
+    Revisa las vigencias de todos los países a la vez.
 
     Objetivo principal (contexto de negocio):
         Que ninguna cotización se quede olvidada. Corre una vez al día desde
-        Celery Beat y reparte el trabajo por país.
+        Celery Beat y revisa todos los países en paralelo.
 
     Returns:
-        dict: Países procesados, para que quede en los logs de Celery.
+        dict: Conteos sumados, países revisados y países reencolados.
 
     Efectos secundarios:
-        Encola una ``procesar_vigencias_pais_task`` por cada país configurado.
-        No toca la base de datos directamente.
+        Push, campanita y ``aviso_vencimiento_enviado`` en cada país. Los
+        países que fallan se reencolan como ``procesar_vigencias_pais_task``.
     """
+    from almacen.utils.notificar_vigencia_cotizacion import (
+        procesar_solicitudes_vencidas,
+    )
+    from config.middleware_pais import en_todos_los_paises, sumar_resultados
     from config.paises_config import PAISES_CONFIG
 
-    paises_encolados = []
+    resultados, errores = en_todos_los_paises(procesar_solicitudes_vencidas)
 
-    # EXPLICACIÓN: cada país tiene su propia base de datos. Encolamos una tarea
-    # hija por país en lugar de hacer .using() manual en cada consulta, así
-    # task_prerun configura el enrutamiento y el ORM funciona normal.
-    for subdominio, pais_config in PAISES_CONFIG.items():
-        db_alias = pais_config['db_alias']
+    # EXPLICACIÓN: un país con error (BD caída, lock) no se pierde: su tarea
+    # hija lo vuelve a intentar con los reintentos de Celery.
+    paises_encolados = []
+    for subdominio in errores:
         try:
-            procesar_vigencias_pais_task.delay(db_alias=db_alias)
+            procesar_vigencias_pais_task.delay(
+                db_alias=PAISES_CONFIG[subdominio]['db_alias'],
+            )
             paises_encolados.append(subdominio)
         except Exception as exc:
-            # Si un país falla al encolar, los demás deben seguir
             logger.error(
                 '[VIGENCIA] No se pudo encolar la revisión de %s: %s',
                 subdominio,
                 exc,
             )
 
+    totales = sumar_resultados(resultados)
     logger.info(
-        '[VIGENCIA] Revisión diaria encolada para %s país(es): %s',
-        len(paises_encolados),
+        '[VIGENCIA] Revisión diaria: %s país(es) revisados (%s), revisadas %s, '
+        'notificadas %s; reencolados: %s',
+        len(resultados),
+        ', '.join(resultados) or 'ninguno',
+        totales.get('revisadas', 0),
+        totales.get('notificadas', 0),
         ', '.join(paises_encolados) or 'ninguno',
     )
 
-    return {'paises_encolados': paises_encolados}
+    return {
+        **totales,
+        'paises_revisados': list(resultados),
+        'paises_encolados': paises_encolados,
+    }
 
 
 @shared_task(
@@ -178,18 +192,17 @@ def notificar_recotizacion_solicitada_task(
 
     Efectos secundarios:
         - Push y campanita a los empleados con rol Compras.
-        - Un correo HTML con el resumen de la cotización a recotizar.
+        - Un correo HTML con el resumen de la cotización a recotizar, en la
+          bandeja de salida (CorreoSaliente) una sola vez por ronda.
     """
     from django.contrib.auth.models import User
-    from django.core.mail import EmailMessage
     from django.template.loader import render_to_string
     from django.utils import timezone
 
     from almacen.models import SolicitudCotizacion
-    from almacen.tasks import (
-        _adjuntar_logo_e_iconos_email,
-        _remitente_sistema_compras,
-    )
+    from almacen.tasks import _remitente_sistema_compras
+    from notificaciones.correo_service import encolar_correo
+    from notificaciones.models import CorreoSaliente
     from almacen.utils.cotizacion_email_context import url_base_pais_email
     from almacen.utils.notificar_vigencia_cotizacion import (
         armar_destinatarios_email_recotizacion,
@@ -271,22 +284,39 @@ def notificar_recotizacion_solicitada_task(
             f'({referencia})'
         )
 
-        email_msg = EmailMessage(
-            subject=asunto,
-            body=html_content,
-            from_email=_remitente_sistema_compras(),
-            to=destinatarios,
-        )
-        email_msg.content_subtype = 'html'
-        _adjuntar_logo_e_iconos_email(email_msg, log_prefix)
-        email_msg.send(fail_silently=False)
-
-        logger.info(
-            '%s Correo enviado a %s destinatario(s) para %s',
-            log_prefix,
-            len(destinatarios),
-            solicitud.numero_solicitud,
+        # ---- Paso 4: bandeja de salida ----
+        # EXPLICACIÓN PARA PRINCIPIANTES:
+        # El correo no se manda aquí: se guarda en CorreoSaliente y el worker
+        # de correo lo envía con el cupo por dominio y los reintentos con
+        # espera de la bandeja. Un reintento de esta tarea no lo duplica: la
+        # referencia (solicitud + ronda) ya está en la bandeja.
+        referencia_bandeja = (
+            f'recotizacion:{solicitud.pk}:{solicitud.ronda_cotizacion}'
         )
+        ya_encolado = CorreoSaliente.objects.filter(
+            referencia=referencia_bandeja,
+        ).exclude(estado='fallido').exists()
+        if not ya_encolado:
+            encolar_correo(
+                asunto=asunto,
+                cuerpo_html=html_content,
+                para=destinatarios,
+                remitente=_remitente_sistema_compras(),
+                referencia=referencia_bandeja,
+                accion_enviado=(
+                    'almacen.tasks_vigencia_cotizacion.'
+                    'registrar_correo_recotizacion_enviado'
+                ),
+                datos_accion={
+                    'numero_solicitud': solicitud.numero_solicitud,
+                },
+            )
+            logger.info(
+                '%s Correo encolado a %s destinatario(s) para %s',
+                log_prefix,
+                len(destinatarios),
+                solicitud.numero_solicitud,
+            )
 
         return {
             'success': True,
@@ -304,3 +334,21 @@ def notificar_recotizacion_solicitada_task(
                 'success': False,
                 'mensaje': f'Error tras {self.max_retries} reintentos: {e}',
             }
+
+
+def registrar_correo_recotizacion_enviado(correo, numero_solicitud):
+    """
+    Acción post-envío del correo de recotización (la llama la bandeja de correo).
+
+    Args:
+        correo: CorreoSaliente recién enviado (su _state.db es la BD del país).
+        numero_solicitud (str): Folio de la solicitud, para el log.
+
+    Efectos secundarios:
+        Registra en el log el envío real (la tarea solo lo encoló).
+    """
+    logger.info(
+        '[RECOTIZACION-NOTIF] Correo enviado a %s destinatario(s) para %s',
+        len(correo.para),
+        numero_solicitud,
+    )
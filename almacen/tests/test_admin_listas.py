@@ -0,0 +1,102 @@
+"""
+Tests de presupuesto de consultas en las listas del admin de Almacén.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+Las columnas "Compras", "Productos" y "Unidades Rastreadas" antes hacían un
+.count() por fila. Ahora vienen anotadas en la consulta de la lista, así que
+el número de consultas no cambia al agregar filas, y los números son los
+mismos que los de las relaciones.
+"""
+
+from decimal import Decimal
+
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from almacen.models import CategoriaAlmacen, CompraProducto, ProductoAlmacen, Proveedor, UnidadInventario
+
+
+class AdminListasAlmacenTest(TestCase):
+    """Proveedor, categoría y producto: consultas constantes y conteos correctos."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.superusuario = get_user_model().objects.create_superuser(
+            username='admin_almacen', email='admin.almacen@test.local', password='x',
+        )
+        self.secuencia = 0
+
+    def _crear_lote(self, cantidad):
+        """Cada iteración: proveedor + categoría + producto con 1 compra y 2 unidades (1 disponible)."""
+        for _ in range(cantidad):
+            self.secuencia += 1
+            proveedor = Proveedor.objects.create(nombre=f'Proveedor {self.secuencia}')
+            categoria = CategoriaAlmacen.objects.create(nombre=f'Categoría {self.secuencia}')
+            producto = ProductoAlmacen.objects.create(
+                codigo_producto=f'SKU-ADM-{self.secuencia}',
+                nombre=f'Producto {self.secuencia}',
+                tipo_producto='unico',
+                costo_unitario=Decimal('10.00'),
+                categoria=categoria,
+                proveedor_principal=proveedor,
+            )
+            CompraProducto.objects.create(
+                tipo='compra',
+                estado='recibida',
+                producto=producto,
+                proveedor=proveedor,
+                cantidad=1,
+                costo_unitario=Decimal('10.00'),
+                fecha_pedido=timezone.now().date(),
+                registrado_por=self.superusuario,
+            )
+            for disponibilidad in ('disponible', 'asignada'):
+                UnidadInventario.objects.create(
+                    producto=producto,
+                    marca='Marca',
+                    modelo='Modelo',
+                    disponibilidad=disponibilidad,
+                    registrado_por=self.superusuario,
+                )
+
+    def _consultas_lista(self, modelo):
+        request = self.factory.get('/admin/')
+        request.user = self.superusuario
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = site._registry[modelo].changelist_view(request)
+            respuesta.render()
+        self.assertEqual(respuesta.status_code, 200)
+        return len(consultas), respuesta.context_data['cl']
+
+    def _assert_presupuesto(self, modelo, presupuesto):
+        self._crear_lote(2)
+        pocas, _ = self._consultas_lista(modelo)
+        self._crear_lote(8)
+        muchas, cl = self._consultas_lista(modelo)
+
+        self.assertEqual(pocas, muchas, 'La lista no debe hacer consultas por fila')
+        self.assertLessEqual(muchas, presupuesto)
+        return site._registry[modelo], cl
+
+    def test_proveedor(self):
+        model_admin, cl = self._assert_presupuesto(Proveedor, presupuesto=4)
+        for proveedor in cl.result_list:
+            self.assertEqual(model_admin.total_compras(proveedor), proveedor.compras_realizadas.count())
+
+    def test_categoria(self):
+        model_admin, cl = self._assert_presupuesto(CategoriaAlmacen, presupuesto=3)
+        for categoria in cl.result_list:
+            self.assertEqual(
+                model_admin.cantidad_productos(categoria),
+                categoria.productos.filter(activo=True).count(),
+            )
+
+    def test_producto(self):
+        model_admin, cl = self._assert_presupuesto(ProductoAlmacen, presupuesto=6)
+        producto = cl.result_list[0]
+        self.assertIn('1 disp / 2 total', model_admin.unidades_rastreadas(producto))
@@ -0,0 +1,131 @@
+"""
+Tests de SolicitudCotizacion.objects.con_totales() y las propiedades de totales.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+Cada total (total_lineas, costo_total, servicios_aprobados_con_iva, ...) se
+puede resolver de tres formas: anotado en la consulta, sobre las líneas
+precargadas o consultando. Las tres deben dar lo mismo, y las dos primeras
+no deben tocar la BD al leer la propiedad.
+"""
+
+from decimal import Decimal
+
+from django.test import TestCase
+
+from almacen.models import LineaCotizacion, LineaServicioAdicional, SolicitudCotizacion
+from almacen.tests.helpers_integracion_cotizacion import BaseIntegracionCotizacionMixin
+
+PROPIEDADES = (
+    'total_lineas',
+    'lineas_aprobadas',
+    'lineas_rechazadas',
+    'lineas_pendientes',
+    'costo_total',
+    'costo_aprobado',
+    'precio_cliente_aprobado_sin_iva',
+    'total_servicios_adicionales',
+    'servicios_aprobados',
+    'servicios_rechazados',
+    'servicios_pendientes',
+    'costo_servicios_adicionales',
+    'servicios_aprobados_con_iva',
+    'items_aceptados_respuesta',
+    'total_aprobado_con_iva',
+)
+
+
+class ConTotalesSolicitudTest(BaseIntegracionCotizacionMixin, TestCase):
+    """Anotación, prefetch y consulta dan los mismos totales."""
+
+    def setUp(self):
+        self._crear_contexto_base(sufijo='TOT')
+
+    def _solicitud(self, service_tag='SN-TOTALES'):
+        solicitud = SolicitudCotizacion.objects.create(
+            sin_orden_activa=True,
+            service_tag=service_tag,
+            estado='enviada_cliente',
+            creado_por=self.user,
+        )
+        lineas = (
+            ('aprobada', 2, Decimal('100.00'), Decimal('400.00')),
+            ('rechazada', 1, Decimal('50.00'), None),
+            ('compra_generada', 1, Decimal('30.00'), Decimal('60.00')),
+            ('pendiente', 1, None, None),
+        )
+        for estado, cantidad, costo, subtotal_cliente in lineas:
+            LineaCotizacion.objects.create(
+                solicitud=solicitud,
+                producto=self.producto,
+                proveedor=self.proveedor,
+                descripcion_pieza='Pieza',
+                cantidad=cantidad,
+                costo_unitario=costo,
+                subtotal_cliente_sin_iva=subtotal_cliente,
+                estado_cliente=estado,
+            )
+        for estado, costo in (('aprobada', Decimal('116.00')), ('pendiente', Decimal('200.00'))):
+            LineaServicioAdicional.objects.create(
+                solicitud=solicitud, tipo_servicio='paquete_plata', costo=costo, estado_cliente=estado,
+            )
+        return solicitud
+
+    def _valores(self, solicitud):
+        return {propiedad: getattr(solicitud, propiedad) for propiedad in PROPIEDADES}
+
+    def test_tres_caminos_mismo_resultado(self):
+        pk = self._solicitud().pk
+
+        consultando = self._valores(SolicitudCotizacion.objects.get(pk=pk))
+
+        anotada = SolicitudCotizacion.objects.con_totales().get(pk=pk)
+        with self.assertNumQueries(0):
+            anotado = self._valores(anotada)
+
+        precargada = SolicitudCotizacion.objects.prefetch_related(
+            'lineas', 'servicios_adicionales',
+        ).get(pk=pk)
+        with self.assertNumQueries(0):
+            en_memoria = self._valores(precargada)
+
+        self.assertEqual(consultando, anotado)
+        self.assertEqual(consultando, en_memoria)
+        self.assertEqual(consultando['costo_total'], Decimal('280.00'))
+        self.assertEqual(consultando['costo_aprobado'], Decimal('230.00'))
+        self.assertEqual(consultando['precio_cliente_aprobado_sin_iva'], Decimal('460.00'))
+        self.assertEqual(consultando['items_aceptados_respuesta'], 3)
+        self.assertEqual(consultando['total_aprobado_con_iva'], Decimal('649.60'))
+
+    def test_lista_en_una_consulta(self):
+        for numero in range(3):
+            self._solicitud(service_tag=f'SN-TOT-{numero}')
+
+        with self.assertNumQueries(1):
+            filas = [
+                (s.total_lineas, s.lineas_aprobadas, s.lineas_rechazadas, s.costo_total)
+                for s in SolicitudCotizacion.objects.con_totales()
+            ]
+
+        self.assertEqual(filas, [(4, 1, 1, Decimal('280.00'))] * 3)
+
+    def test_sin_lineas(self):
+        solicitud = SolicitudCotizacion.objects.create(
+            sin_orden_activa=True, service_tag='SN-VACIA', creado_por=self.user,
+        )
+        anotada = SolicitudCotizacion.objects.con_totales().get(pk=solicitud.pk)
+
+        self.assertEqual(anotada.total_lineas, 0)
+        self.assertEqual(anotada.costo_total, 0)
+        self.assertEqual(solicitud.costo_total, 0)
+
+    def test_estado_se_recalcula_con_la_bd(self):
+        """Una foto anotada vieja no decide el estado tras responder las líneas."""
+        pk = self._solicitud().pk
+        anotada = SolicitudCotizacion.objects.con_totales().get(pk=pk)
+        self.assertEqual(anotada.lineas_pendientes, 1)
+
+        LineaCotizacion.objects.filter(solicitud_id=pk).update(estado_cliente='rechazada')
+        LineaServicioAdicional.objects.filter(solicitud_id=pk).update(estado_cliente='rechazada')
+
+        self.assertEqual(anotada.actualizar_estado_segun_lineas(), 'totalmente_rechazada')
@@ -0,0 +1,84 @@
+"""
+Tests: hoja de etiquetas QR de una compra (almacen:etiquetas_compra).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+Al recibir una compra se imprime una etiqueta por pieza con el QR del SKU.
+Contamos etiquetas interceptando generar_hoja_etiquetas (el PDF en sí ya se
+prueba en inventario/tests/test_qr_productos.py).
+"""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from almacen.models import CompraProducto, UnidadCompra
+from almacen.tests.helpers_integracion_cotizacion import BaseIntegracionCotizacionMixin
+from almacen.views import etiquetas_compra
+
+
+class EtiquetasCompraTest(BaseIntegracionCotizacionMixin, TestCase):
+    """Una etiqueta por pieza; sin unidades, tantas como compra.cantidad (con tope)."""
+
+    def setUp(self) -> None:
+        self._crear_contexto_base(sufijo='ETQ-QR')
+        self.compra = CompraProducto.objects.create(
+            tipo='compra',
+            estado='pendiente_llegada',
+            producto=self.producto,
+            proveedor=self.proveedor,
+            cantidad=3,
+            costo_unitario=Decimal('150.00'),
+            fecha_pedido=timezone.now().date(),
+            registrado_por=self.user,
+        )
+
+    def _llamar(self):
+        """GET autenticado a la vista; devuelve (respuesta, etiquetas)."""
+        request = self.factory.get(reverse('almacen:etiquetas_compra', args=[self.compra.pk]))
+        request.user = self.user
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+        with patch('inventario.qr_productos.generar_hoja_etiquetas', return_value=b'%PDF-1.4') as hoja:
+            respuesta = etiquetas_compra(request, pk=self.compra.pk)
+        return respuesta, hoja.call_args.args[0]
+
+    def test_sin_unidades_usa_la_cantidad(self):
+        respuesta, etiquetas = self._llamar()
+
+        self.assertEqual(respuesta['Content-Type'], 'application/pdf')
+        self.assertEqual(len(etiquetas), 3)
+        self.assertEqual({e.codigo for e in etiquetas}, {'SKU-INT-ETQ-QR'})
+
+    def test_una_etiqueta_por_pieza_de_cada_unidad(self):
+        UnidadCompra.objects.create(compra=self.compra, numero_linea=1, cantidad=2, marca='Kingston')
+        UnidadCompra.objects.create(
+            compra=self.compra, numero_linea=2, cantidad=1, marca='Samsung', modelo='M471', numero_serie='S123',
+        )
+
+        _, etiquetas = self._llamar()
+
+        self.assertEqual(
+            [e.detalle for e in etiquetas],
+            ['Kingston', 'Kingston', 'Samsung M471 S/N S123'],
+        )
+
+    @override_settings(ETIQUETAS_QR_MAX=2)
+    def test_mas_del_maximo_redirige_con_aviso(self):
+        request = self.factory.get(reverse('almacen:etiquetas_compra', args=[self.compra.pk]))
+        request.user = self.user
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+
+        with patch('inventario.qr_productos.generar_hoja_etiquetas') as hoja:
+            respuesta = etiquetas_compra(request, pk=self.compra.pk)
+
+        hoja.assert_not_called()
+        self.assertEqual(respuesta.status_code, 302)
+        self.assertEqual(respuesta.url, reverse('almacen:detalle_compra', args=[self.compra.pk]))
+        self.assertIn('Máximo 2 etiquetas', [str(m) for m in request._messages][0])
@@ -0,0 +1,121 @@
+"""
+Tests del índice en memoria de resolver_componente.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+El autómata de keywords + nombres de ComponenteEquipo debe elegir el mismo
+componente que el recorrido original (una consulta por coincidencia), y
+resolver lotes sin tocar la BD una vez armado.
+"""
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from almacen.utils.resolver_componente import (
+    _keywords_ordenadas,
+    _normalizar_texto,
+    _texto_busqueda,
+    resolver_componente_desde_producto,
+    resolver_componentes_desde_productos,
+)
+from config.constants import NOMBRE_COMPONENTE_EQUIPO_REACONDICIONADO, PALABRAS_CLAVE_COMPONENTE
+from scorecard.models import ComponenteEquipo
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def _resolver_en_bd(nombre_producto, descripcion_pieza=''):
+    """Recorrido original (lineal, consultando la BD) para comparar resultados."""
+    def buscar(nombre):
+        return ComponenteEquipo.objects.filter(nombre__iexact=nombre, activo=True).first()
+
+    texto = _normalizar_texto(_texto_busqueda(nombre_producto, descripcion_pieza))
+    if not texto:
+        return None
+
+    nombres = [
+        (_normalizar_texto(nombre), nombre)
+        for nombre in ComponenteEquipo.objects.filter(activo=True).values_list('nombre', flat=True)
+    ]
+    nombres.sort(key=lambda item: len(item[0]), reverse=True)
+    por_nombre, len_nombre = None, 0
+    for nombre_norm, nombre_bd in nombres:
+        if nombre_norm and nombre_norm in texto and buscar(nombre_bd):
+            por_nombre, len_nombre = buscar(nombre_bd), len(nombre_norm)
+            break
+
+    por_keyword, len_keyword = None, 0
+    for keyword_norm, nombre_componente in _keywords_ordenadas():
+        if keyword_norm and keyword_norm in texto and buscar(nombre_componente):
+            por_keyword, len_keyword = buscar(nombre_componente), len(keyword_norm)
+            break
+
+    if len_keyword > len_nombre:
+        return por_keyword
+    return por_nombre or por_keyword
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class IndiceComponentesTest(TestCase):
+    """Mismas respuestas que el recorrido original, en lote y sin consultas."""
+
+    def setUp(self):
+        cache.clear()
+        nombres = {nombre for _, nombre in PALABRAS_CLAVE_COMPONENTE}
+        # Solo una parte del catálogo: algunas keywords apuntan a componentes inexistentes
+        for nombre in sorted(nombres)[::2] + ['Pantalla', 'Palmrest', 'Disco Duro / SSD']:
+            ComponenteEquipo.objects.get_or_create(
+                nombre=nombre, defaults={'activo': True, 'tipo_equipo': 'todos'},
+            )
+        ComponenteEquipo.objects.create(nombre='Teclado retroiluminado', activo=False)
+        ComponenteEquipo.objects.get_or_create(
+            nombre=NOMBRE_COMPONENTE_EQUIPO_REACONDICIONADO,
+            defaults={'activo': True, 'tipo_equipo': 'todos'},
+        )
+
+    def _productos(self):
+        productos = [(keyword, '') for keywords, _ in PALABRAS_CLAVE_COMPONENTE for keyword in keywords]
+        productos += [(nombre.upper(), '') for nombre in ComponenteEquipo.objects.values_list('nombre', flat=True)]
+        productos += [
+            ('BATERÍA / PILA DELL 40 W', ''),
+            ('CABLE AC PARA CARGADOR', ''),
+            ('SKU-GENERICO', 'PALMREST CON TECLADO'),
+            ('ACCESORIO GENERICO SIN CLAVE XYZ', ''),
+            ('', ''),
+        ]
+        return productos
+
+    def test_mismas_respuestas_que_la_bd(self):
+        productos = self._productos()
+        esperados = [_resolver_en_bd(nombre, descripcion) for nombre, descripcion in productos]
+
+        self.assertEqual(resolver_componentes_desde_productos(productos), esperados)
+        self.assertEqual(
+            [resolver_componente_desde_producto(nombre, descripcion) for nombre, descripcion in productos],
+            esperados,
+        )
+        self.assertTrue(any(esperados))
+
+    def test_lote_sin_consultas_con_indice_armado(self):
+        resolver_componente_desde_producto('PANTALLA')
+
+        with self.assertNumQueries(0):
+            componentes = resolver_componentes_desde_productos([
+                ('PANTALLA LCD 15.6 FHD', ''),
+                ('EQUIPO REACONDICIONADO', '', True),
+                ('ACCESORIO GENERICO SIN CLAVE XYZ', ''),
+            ] * 20)
+
+        self.assertEqual(
+            [componente.nombre if componente else None for componente in componentes],
+            ['Pantalla', NOMBRE_COMPONENTE_EQUIPO_REACONDICIONADO, None] * 20,
+        )
+
+    def test_editar_componentes_rearma_el_indice(self):
+        self.assertIsNone(resolver_componente_desde_producto('WIDGET ZETA'))
+
+        componente = ComponenteEquipo.objects.create(nombre='Widget Zeta', activo=True)
+        self.assertEqual(resolver_componente_desde_producto('WIDGET ZETA').pk, componente.pk)
+
+        componente.delete()
+        self.assertIsNone(resolver_componente_desde_producto('WIDGET ZETA'))
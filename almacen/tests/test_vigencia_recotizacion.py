@@ -763,3 +763,74 @@ class AvisoVigenciaVencidaTest(BaseIntegracionCotizacionMixin, TestCase):
         self.vencida.iniciar_vigencia_cotizacion()
         self.vencida.refresh_from_db()
         self.assertFalse(self.vencida.aviso_vencimiento_enviado)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    STORAGES={
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {
+            'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+        },
+    },
+)
+class CorreoRecotizacionBandejaTest(BaseIntegracionCotizacionMixin, TestCase):
+    """
+    Objetivo de negocio: el correo a Compras sale por la bandeja de salida.
+
+    Efectos secundarios: crea una solicitud y filas de CorreoSaliente.
+    """
+
+    def setUp(self) -> None:
+        """Un comprador con correo y una solicitud ya en la ronda 2."""
+        self._crear_contexto_base(sufijo='BAN')
+        self.empleado.rol = 'compras'
+        self.empleado.save(update_fields=['rol'])
+        self.solicitud = SolicitudCotizacion.objects.create(
+            estado='borrador',
+            creado_por=self.user,
+            sin_orden_activa=True,
+            service_tag='SN-BAN-RECOT',
+            ronda_cotizacion=2,
+        )
+
+    @patch('almacen.utils.notificar_vigencia_cotizacion.notificar_recotizacion_a_compras')
+    def test_correo_se_encola_una_vez_por_ronda(self, mock_push) -> None:
+        """
+        La tarea encola en vez de mandar; un reintento no duplica el correo.
+
+        EXPLICACIÓN: el worker de la bandeja es quien lo envía, con el cupo
+        por dominio y los reintentos con espera de CorreoSaliente.
+        """
+        from django.core import mail
+
+        from almacen.tasks_vigencia_cotizacion import (
+            notificar_recotizacion_solicitada_task,
+        )
+        from notificaciones.correo_service import procesar_bandeja
+        from notificaciones.models import CorreoSaliente
+
+        mock_push.return_value = 1
+
+        resultado = notificar_recotizacion_solicitada_task(
+            self.solicitud.pk, usuario_id=self.user.pk,
+        )
+        notificar_recotizacion_solicitada_task(
+            self.solicitud.pk, usuario_id=self.user.pk,
+        )
+
+        self.assertTrue(resultado['success'])
+        self.assertEqual(len(mail.outbox), 0)
+        correo = CorreoSaliente.objects.get()
+        self.assertEqual(correo.referencia, f'recotizacion:{self.solicitud.pk}:2')
+        self.assertEqual(correo.para, [self.empleado.email])
+
+        with self.assertLogs('almacen', level='INFO') as logs:
+            procesar_bandeja('default')
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(self.solicitud.numero_solicitud, mail.outbox[0].subject)
+        # La acción post-envío deja constancia del envío real
+        self.assertTrue(any('Correo enviado' in linea for linea in logs.output))
+        correo.refresh_from_db()
+        self.assertEqual(correo.estado, 'enviado')
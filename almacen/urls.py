@@ -78,6 +78,7 @@ urlpatterns = [
     path('compras/crear/', views.crear_compra, name='crear_compra'),
     path('compras/<int:pk>/', views.detalle_compra, name='detalle_compra'),
     path('compras/<int:pk>/editar/', views.editar_compra, name='editar_compra'),
+    path('compras/<int:pk>/etiquetas/', views.etiquetas_compra, name='etiquetas_compra'),
     
     # Workflow de cotizaciones
     path('compras/<int:pk>/aprobar/', views.aprobar_cotizacion, name='aprobar_cotizacion'),
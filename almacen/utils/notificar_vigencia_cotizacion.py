@@ -196,7 +196,8 @@ def procesar_solicitudes_vencidas() -> dict:
 
     Objetivo principal (contexto de negocio):
         Es el cuerpo de la tarea diaria. Corre sobre la base de datos del país
-        que Celery ya enrutó (por eso NO usa .using() aquí).
+        activo en el contexto (task_prerun o en_todos_los_paises), por eso NO
+        usa .using() aquí.
 
     Returns:
         dict: ``{'revisadas': int, 'notificadas': int}`` para los logs.
@@ -57,6 +57,8 @@ from django.contrib.staticfiles import finders
 # python-decouple — lectura de variables de entorno
 from decouple import config as env_config
 
+from config.pdf_cache import cachear_pdf, calcular_huella, version_modelo
+
 logger = logging.getLogger('almacen')
 
 
@@ -770,8 +772,14 @@ class PDFCotizacionCliente:
         gen = PDFCotizacionCliente(solicitud, tipo_servicio='estandar', items=items)
         resultado = gen.generar_pdf()
         buffer_bytes = resultado['buffer'].getvalue()   # Para adjuntar en email
+
+    El PDF se guarda en el caché de artefactos (config.pdf_cache): si la
+    previsualización y el envío usan los mismos datos, solo se dibuja una vez.
     """
 
+    # Subir si cambia el diseño sin tocar este archivo (ej. un estático del PDF)
+    VERSION_PLANTILLA_PDF = 1
+
     def __init__(
         self,
         solicitud,
@@ -971,6 +979,52 @@ class PDFCotizacionCliente:
     # MÉTODO PRINCIPAL
     # -------------------------------------------------------------------------
 
+    def _partes_huella_solicitud(self) -> List:
+        """
+        Datos de la solicitud que imprime el PDF (cliente, equipo, sucursal, fecha).
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Son las mismas relaciones que leen _construir_datos_cliente y
+        _construir_datos_equipo; si alguna cambia, la huella cambia.
+        """
+        solicitud = self.solicitud
+        orden = solicitud.orden_servicio
+        if orden:
+            detalle = getattr(orden, 'detalle_equipo', None)
+            sucursal = orden.sucursal
+        else:
+            detalle = None
+            try:
+                sucursal = solicitud.creado_por.empleado.sucursal
+            except Exception:
+                sucursal = None
+        return [
+            version_modelo(solicitud),
+            version_modelo(orden),
+            version_modelo(detalle),
+            version_modelo(sucursal),
+            self.pais_config,
+            date.today().isoformat(),
+        ]
+
+    def huella_artefacto(self) -> str:
+        """
+        Huella de todo lo que determina el PDF (para config.pdf_cache).
+
+        Returns:
+            str: SHA-256 de solicitud, ítems, perfil, overrides y config de profit.
+        """
+        return calcular_huella('cotizacion_cliente', self, [
+            self._partes_huella_solicitud(),
+            self.tipo_servicio,
+            self.titulo,
+            self.items,
+            self.mano_de_obra_override,
+            self.modo_final,
+            _profit_config_vigente(),
+        ])
+
+    @cachear_pdf
     def generar_pdf(self) -> Dict[str, Any]:
         """
         Genera el PDF completo y lo retorna en un buffer BytesIO.
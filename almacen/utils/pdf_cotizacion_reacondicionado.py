@@ -28,6 +28,7 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from config.pdf_cache import cachear_pdf, calcular_huella
 from .pdf_cotizacion_cliente import (
     COLOR_AZUL_TOTAL,
     COLOR_BLANCO,
@@ -106,6 +107,21 @@ class PDFCotizacionReacondicionado:
             alignment=TA_CENTER,
         ))
 
+    def huella_artefacto(self) -> str:
+        """
+        Huella para config.pdf_cache: datos del equipo, costeo y opción de pago.
+
+        Incluye la huella del generador de referencia (cliente + términos).
+        """
+        return calcular_huella('cotizacion_reacondicionado', self, [
+            self._gen_ref.huella_artefacto(),
+            self.datos_equipo,
+            self.costeo,
+            self.opcion_pago_aceptada,
+            self.modo_final,
+        ])
+
+    @cachear_pdf
     def generar_pdf(self) -> Dict[str, Any]:
         """
         Construye el PDF en memoria.
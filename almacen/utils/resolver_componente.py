@@ -5,17 +5,23 @@ EXPLICACIÓN PARA PRINCIPIANTES:
 Los productos del almacén tienen nombres largos ("BATERÍA / PILA DELL 40 W").
 Servicio Técnico usa ComponenteEquipo con nombres cortos y normalizados ("Batería").
 Este módulo hace ese emparejamiento automáticamente al sincronizar cotizaciones.
+
+Las keywords y los nombres de ComponenteEquipo se compilan en un índice en
+memoria por país (`INDICE_COMPONENTES`), que se rearma cuando cambia la tabla.
 """
 
 from __future__ import annotations
 
+import copy
 import logging
 import unicodedata
+from collections.abc import Iterable
 
 from config.constants import (
     NOMBRE_COMPONENTE_EQUIPO_REACONDICIONADO,
     PALABRAS_CLAVE_COMPONENTE,
 )
+from config.indice_texto import AutomataSubcadenas, IndicePorPais
 from scorecard.models import ComponenteEquipo
 
 logger = logging.getLogger(__name__)
@@ -71,49 +77,73 @@ def _keywords_ordenadas() -> list[tuple[str, str]]:
     return [(kw, nombre) for kw, nombre, _ in pares]
 
 
-def _nombres_componentes_ordenados() -> list[tuple[str, str]]:
+def _construir_indice_componentes(db_alias: str) -> dict:
     """
-    Lista (nombre_normalizado, nombre_bd) de ComponenteEquipo activos, más largos primero.
+    Índice en memoria de ComponenteEquipo activos y keywords de un país.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Antes, cada producto recorría todas las keywords y todos los nombres de
+    componentes, consultando la BD por cada coincidencia. Ahora se arma una
+    vez un autómata con ambas listas; cada clave guarda su posición en el
+    orden de siempre (más larga primero), así que gana la misma que ganaba.
+
+    Returns:
+        dict con:
+        - 'por_nombre': nombre en minúsculas → ComponenteEquipo (el primero
+          por orden alfabético, como `nombre__iexact=...).first()`).
+        - 'automata': clave normalizada → (tipo, posición, nombre_bd, longitud),
+          con tipo 'nombre' o 'keyword'.
     """
-    registros = ComponenteEquipo.objects.filter(activo=True).values_list('nombre', flat=True)
-    pares = [(_normalizar_texto(nombre), nombre) for nombre in registros]
-    pares.sort(key=lambda item: len(item[0]), reverse=True)
-    return pares
+    componentes = list(ComponenteEquipo.objects.using(db_alias).filter(activo=True))
 
+    por_nombre: dict[str, ComponenteEquipo] = {}
+    for componente in componentes:
+        por_nombre.setdefault(componente.nombre.lower(), componente)
 
-def _buscar_por_nombre_en_bd(nombre_canonico: str) -> ComponenteEquipo | None:
-    """Obtiene ComponenteEquipo activo por nombre exacto (case-insensitive)."""
-    return ComponenteEquipo.objects.filter(nombre__iexact=nombre_canonico, activo=True).first()
+    nombres = [(_normalizar_texto(c.nombre), c.nombre) for c in componentes]
+    nombres.sort(key=lambda item: len(item[0]), reverse=True)
 
+    claves = [
+        (nombre_norm, ('nombre', posicion, nombre_bd, len(nombre_norm)))
+        for posicion, (nombre_norm, nombre_bd) in enumerate(nombres)
+        if nombre_norm
+    ]
+    claves += [
+        (keyword_norm, ('keyword', posicion, nombre_componente, len(keyword_norm)))
+        for posicion, (keyword_norm, nombre_componente) in enumerate(_keywords_ordenadas())
+        if keyword_norm
+    ]
+    return {'por_nombre': por_nombre, 'automata': AutomataSubcadenas(claves)}
 
-def _buscar_por_substring_componente(texto: str) -> tuple[ComponenteEquipo | None, int]:
-    """
-    Si el nombre de un ComponenteEquipo aparece dentro del texto del producto, lo devuelve.
 
-    Returns:
-        tuple: (componente o None, longitud del nombre normalizado que coincidió).
-    """
-    for nombre_norm, nombre_bd in _nombres_componentes_ordenados():
-        if nombre_norm and nombre_norm in texto:
-            componente = _buscar_por_nombre_en_bd(nombre_bd)
-            if componente:
-                return componente, len(nombre_norm)
-    return None, 0
+INDICE_COMPONENTES = IndicePorPais('componentes_equipo', _construir_indice_componentes)
+
+
+def _buscar_por_nombre_en_bd(nombre_canonico: str, indice: dict | None = None) -> ComponenteEquipo | None:
+    """Obtiene ComponenteEquipo activo por nombre exacto (case-insensitive)."""
+    if indice is None:
+        indice = INDICE_COMPONENTES.obtener()
+    componente = indice['por_nombre'].get(nombre_canonico.lower())
+    # Copia: el índice es compartido entre llamadas y nadie debe modificarlo
+    return copy.copy(componente) if componente is not None else None
 
 
-def _buscar_por_keywords(texto: str) -> tuple[ComponenteEquipo | None, int]:
+def _mejores_coincidencias(texto: str, indice: dict) -> dict[str, tuple[ComponenteEquipo | None, int]]:
     """
-    Empareja palabras clave del catálogo de almacén con ComponenteEquipo.
+    Para cada tipo de pista, la primera coincidencia (en el orden del índice)
+    cuyo componente existe.
 
     Returns:
-        tuple: (componente o None, longitud de la keyword que coincidió).
+        dict: {'nombre': (componente o None, longitud), 'keyword': (...)}.
     """
-    for keyword_norm, nombre_componente in _keywords_ordenadas():
-        if keyword_norm and keyword_norm in texto:
-            componente = _buscar_por_nombre_en_bd(nombre_componente)
-            if componente:
-                return componente, len(keyword_norm)
-    return None, 0
+    mejores = {'nombre': (None, 0), 'keyword': (None, 0)}
+    for tipo, _, nombre_bd, longitud in sorted(indice['automata'].buscar(texto)):
+        if mejores[tipo][0] is not None:
+            continue
+        componente = _buscar_por_nombre_en_bd(nombre_bd, indice)
+        if componente:
+            mejores[tipo] = (componente, longitud)
+    return mejores
 
 
 def obtener_componente_equipo_reacondicionado() -> ComponenteEquipo | None:
@@ -162,14 +192,50 @@ def resolver_componente_desde_producto(
     """
     if es_reacondicionado:
         return obtener_componente_equipo_reacondicionado()
+    return _resolver_con_indice(nombre_producto, descripcion_pieza, INDICE_COMPONENTES.obtener())
 
+
+def resolver_componentes_desde_productos(
+    productos: Iterable[tuple],
+) -> list[ComponenteEquipo | None]:
+    """
+    Versión por lote de resolver_componente_desde_producto().
+
+    Args:
+        productos: iterable de (nombre_producto, descripcion_pieza) o
+            (nombre_producto, descripcion_pieza, es_reacondicionado).
+
+    Returns:
+        list: ComponenteEquipo o None por producto, en el mismo orden.
+
+    Efectos secundarios:
+        Lee el índice del país una sola vez para todo el lote.
+    """
+    indice = INDICE_COMPONENTES.obtener()
+    resultados = []
+    for producto in productos:
+        nombre_producto, descripcion_pieza, *resto = producto
+        if resto and resto[0]:
+            resultados.append(obtener_componente_equipo_reacondicionado())
+        else:
+            resultados.append(_resolver_con_indice(nombre_producto, descripcion_pieza, indice))
+    return resultados
+
+
+def _resolver_con_indice(
+    nombre_producto: str,
+    descripcion_pieza: str,
+    indice: dict,
+) -> ComponenteEquipo | None:
+    """Emparejamiento de un producto (sin el caso reacondicionado) contra el índice."""
     texto = _normalizar_texto(_texto_busqueda(nombre_producto, descripcion_pieza))
     if not texto:
         return None
 
     # Paso 1 y 2: substring + keywords; gana la señal más específica (más larga)
-    por_nombre, len_nombre = _buscar_por_substring_componente(texto)
-    por_keyword, len_keyword = _buscar_por_keywords(texto)
+    mejores = _mejores_coincidencias(texto, indice)
+    por_nombre, len_nombre = mejores['nombre']
+    por_keyword, len_keyword = mejores['keyword']
 
     if len_keyword > len_nombre:
         return por_keyword
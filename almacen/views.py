@@ -75,6 +75,7 @@ from .views_compras import (  # noqa: F401
     crear_compra,
     detalle_compra,
     editar_compra,
+    etiquetas_compra,
     iniciar_devolucion,
     lista_compras,
     panel_cotizaciones,
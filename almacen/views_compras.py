@@ -20,11 +20,13 @@ Efectos secundarios:
 
 from collections import OrderedDict
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.paginator import Paginator
 from django.db.models import Count, Q
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
@@ -308,6 +310,7 @@ def panel_cotizaciones(request):
     # select_related trae de un jalón las FKs que la tabla va a mostrar
     # (orden, responsable de seguimiento, quien creó la solicitud).
     # Sin esto, cada fila haría queries extra (problema N+1).
+    # con_totales() anota número de líneas y total estimado por solicitud.
     relaciones = (
         'orden_servicio',
         'orden_servicio__responsable_seguimiento',
@@ -320,12 +323,12 @@ def panel_cotizaciones(request):
     cotizaciones_front = list(
         SolicitudCotizacion.objects.filter(
             estado='enviada_front'
-        ).select_related(*relaciones).prefetch_related('lineas').order_by('-fecha_creacion')
+        ).con_totales().select_related(*relaciones).order_by('-fecha_creacion')
     )
     cotizaciones_cliente = list(
         SolicitudCotizacion.objects.filter(
             estado='enviada_cliente'
-        ).select_related(*relaciones).prefetch_related('lineas').order_by('-fecha_creacion')
+        ).con_totales().select_related(*relaciones).order_by('-fecha_creacion')
     )
 
     total_front = len(cotizaciones_front)
@@ -626,6 +629,54 @@ def detalle_compra(request, pk):
     return render(request, 'almacen/compras/detalle_compra.html', context)
 
 
+@login_required
+@permission_required_with_message('almacen.view_compraproducto')
+def etiquetas_compra(request, pk):
+    """
+    PDF con las etiquetas QR de una compra, listo para pegar al recibir.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    --------------------------------
+    Cada pieza lleva una etiqueta con el QR del SKU del producto
+    (ProductoAlmacen.codigo_producto) y, si se conoce, la marca/modelo y el
+    número de serie de su UnidadCompra. Si la compra no tiene unidades
+    registradas se imprimen tantas etiquetas como compra.cantidad.
+    La hoja la arma inventario.qr_productos (QR cacheados en disco), con el
+    mismo tope ETIQUETAS_QR_MAX que las etiquetas de inventario.
+    """
+    from inventario.qr_productos import Etiqueta, generar_hoja_etiquetas
+
+    compra = get_object_or_404(CompraProducto.objects.select_related('producto'), pk=pk)
+    producto = compra.producto
+
+    unidades = list(compra.unidades_compra.order_by('numero_linea'))
+    total = sum(unidad.cantidad for unidad in unidades) or max(compra.cantidad, 1)
+    if total > settings.ETIQUETAS_QR_MAX:
+        messages.warning(
+            request,
+            f'Máximo {settings.ETIQUETAS_QR_MAX} etiquetas por hoja; esta compra necesita {total}.'
+        )
+        return redirect('almacen:detalle_compra', pk=compra.pk)
+
+    etiquetas = []
+    for unidad in unidades:
+        detalle = ' '.join(filter(None, [unidad.marca, unidad.modelo]))
+        if unidad.numero_serie:
+            detalle = f'{detalle} S/N {unidad.numero_serie}'.strip()
+        etiquetas.extend(
+            [Etiqueta(codigo=producto.codigo_producto, titulo=producto.nombre, detalle=detalle)]
+            * unidad.cantidad
+        )
+    if not etiquetas:
+        etiquetas = [
+            Etiqueta(codigo=producto.codigo_producto, titulo=producto.nombre, detalle=f'Compra #{compra.pk}')
+        ] * max(compra.cantidad, 1)
+
+    response = HttpResponse(generar_hoja_etiquetas(etiquetas), content_type='application/pdf')
+    response['Content-Disposition'] = f'inline; filename="Etiquetas_Compra_{compra.pk}.pdf"'
+    return response
+
+
 @login_required
 @permission_required_with_message('almacen.change_compraproducto')
 def editar_compra(request, pk):
@@ -418,6 +418,38 @@ def api_enviar_cotizacion_cliente(request, pk):
         return JsonResponse({'success': False, 'error': f'Error interno: {str(e)}'})
 
 
+def _respuesta_pdf_inline(request, resultado):
+    """
+    HttpResponse inline con el PDF y su ETag (la huella del caché de PDFs).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    La huella cambia solo si cambian los datos del PDF. Si el navegador ya
+    tiene esa versión (If-None-Match) se responde 304 sin volver a mandar
+    los bytes, algo común al reabrir la previsualización del modal.
+
+    Args:
+        request: HttpRequest original.
+        resultado: dict de generar_pdf() con 'buffer' y 'nombre_archivo'.
+
+    Returns:
+        HttpResponse con el PDF, o HttpResponseNotModified (304).
+    """
+    from django.http import HttpResponse
+    from django.utils.cache import get_conditional_response
+
+    etag = f'"{resultado["huella"]}"' if resultado.get('huella') else None
+    if etag:
+        no_modificado = get_conditional_response(request, etag=etag)
+        if no_modificado is not None:
+            return no_modificado
+
+    response = HttpResponse(resultado['buffer'].getvalue(), content_type='application/pdf')
+    response['Content-Disposition'] = f'inline; filename="{resultado["nombre_archivo"]}"'
+    if etag:
+        response['ETag'] = etag
+    return response
+
+
 @login_required
 @permission_required_with_message('almacen.view_solicitudcotizacion')
 @require_http_methods(["GET"])
@@ -499,12 +531,7 @@ def preview_pdf_cotizacion(request, pk):
                     content_type='text/plain',
                     status=500,
                 )
-            pdf_bytes = resultado_pdf['buffer'].getvalue()
-            response = HttpResponse(pdf_bytes, content_type='application/pdf')
-            response['Content-Disposition'] = (
-                f'inline; filename="{resultado_pdf["nombre_archivo"]}"'
-            )
-            return response
+            return _respuesta_pdf_inline(request, resultado_pdf)
 
         from .utils.cotizacion_items_cliente import (
             construir_grupos_cotizacion,
@@ -587,12 +614,7 @@ def preview_pdf_cotizacion(request, pk):
                 status=500
             )
 
-        pdf_bytes = resultado['buffer'].getvalue()
-        response = HttpResponse(pdf_bytes, content_type='application/pdf')
-        response['Content-Disposition'] = (
-            f'inline; filename="{resultado["nombre_archivo"]}"'
-        )
-        return response
+        return _respuesta_pdf_inline(request, resultado)
 
     except Exception as e:
         import traceback as _tb
@@ -670,12 +692,7 @@ def descargar_pdf_cotizacion_final(request, pk):
                     content_type='text/plain',
                     status=500,
                 )
-            pdf_bytes = resultado['buffer'].getvalue()
-            response = HttpResponse(pdf_bytes, content_type='application/pdf')
-            response['Content-Disposition'] = (
-                f'inline; filename="{resultado["nombre_archivo"]}"'
-            )
-            return response
+            return _respuesta_pdf_inline(request, resultado)
 
         items = construir_items_cotizacion_final(solicitud)
         if not items:
@@ -704,12 +721,7 @@ def descargar_pdf_cotizacion_final(request, pk):
                 status=500,
             )
 
-        pdf_bytes = resultado['buffer'].getvalue()
-        response = HttpResponse(pdf_bytes, content_type='application/pdf')
-        response['Content-Disposition'] = (
-            f'inline; filename="{resultado["nombre_archivo"]}"'
-        )
-        return response
+        return _respuesta_pdf_inline(request, resultado)
 
     except Exception as e:
         import traceback as _tb
@@ -79,10 +79,12 @@ def lista_solicitudes_cotizacion(request):
     visión rápida del flujo de trabajo.
     """
     # Obtener todas las solicitudes
-    solicitudes = SolicitudCotizacion.objects.select_related(
+    # con_totales(): conteos de líneas y costo total en la misma consulta
+    # (la tabla no necesita las líneas, solo sus totales)
+    solicitudes = SolicitudCotizacion.objects.con_totales().select_related(
         'orden_servicio',
         'creado_por'
-    ).prefetch_related('lineas').order_by('-fecha_creacion')
+    ).order_by('-fecha_creacion')
     
     # Aplicar filtros
     filtro_form = SolicitudCotizacionFiltroForm(request.GET)
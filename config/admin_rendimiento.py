@@ -0,0 +1,196 @@
+"""
+Listas del admin que no crecen en consultas con el tamaño de la tabla
+=====================================================================
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Cada columna de `list_display` que hace `obj.relacion.count()` cuesta una
+consulta POR FILA, y cada página del admin hace además un `COUNT(*)` de toda
+la tabla (dos, si `show_full_result_count` está activo). En tablas con
+millones de filas (historial, eventos de seguimiento, órdenes) eso es lo que
+más tarda.
+
+Este módulo ofrece:
+
+1. `AdminListaEficienteMixin`:
+   - `totales_lista`: conteos de relaciones (con `Total`, ver
+     config/agregados.py) que se anotan en `get_queryset` como subconsultas;
+     la columna los lee con `self.total_lista(obj, nombre)`.
+   - `PaginadorEstimado`: en PostgreSQL, si la lista no tiene filtros y la
+     tabla es grande, usa la estimación de filas de `pg_class.reltuples` en
+     lugar de `COUNT(*)`.
+   - `show_full_result_count = False`: no cuenta la tabla completa otra vez.
+   (Cada admin sigue declarando su `list_select_related`.)
+2. `AdminPaginacionCursorMixin`: para bitácoras (historial, eventos). En vez
+   de "página 1, 2, 3... de N", muestra "más recientes / más antiguos" y
+   pide las filas con `WHERE (fecha, id) < (último visto)`, que usa el
+   índice y no necesita contar nada.
+
+Uso:
+    @admin.register(Proveedor)
+    class ProveedorAdmin(AdminListaEficienteMixin, admin.ModelAdmin):
+        totales_lista = {'compras': Total('compras_realizadas')}
+
+        def total_compras(self, obj):
+            return self.total_lista(obj, 'compras')
+"""
+
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from config.agregados import anotar_totales, leer_total
+
+# Desde cuántas filas (estimadas) deja de valer la pena un COUNT(*) exacto
+ADMIN_CONTEO_ESTIMADO_DESDE = getattr(settings, 'ADMIN_CONTEO_ESTIMADO_DESDE', 100_000)
+
+# Parámetro GET con la última fila vista ("<fecha ISO>|<id>")
+CURSOR_VAR = 'antes_de'
+
+
+def estimar_filas(queryset):
+    """
+    Filas estimadas de la tabla según PostgreSQL, si aplica.
+
+    Returns:
+        int o None: la estimación si el QuerySet no tiene filtros, la BD es
+        PostgreSQL y la tabla supera ADMIN_CONTEO_ESTIMADO_DESDE; None si
+        hay que contar de verdad.
+    """
+    if queryset.query.where or queryset.query.distinct:
+        return None
+    conexion = connections[queryset.db]
+    if conexion.vendor != 'postgresql':
+        return None
+
+    with conexion.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [queryset.model._meta.db_table],
+        )
+        fila = cursor.fetchone()
+    # reltuples = -1 si la tabla nunca se ha analizado
+    if not fila or fila[0] < ADMIN_CONTEO_ESTIMADO_DESDE:
+        return None
+    return fila[0]
+
+
+class PaginadorEstimado(Paginator):
+    """Paginator cuyo total usa `estimar_filas()` cuando es posible."""
+
+    @cached_property
+    def count(self):
+        estimado = estimar_filas(self.object_list)
+        if estimado is not None:
+            return estimado
+        return super().count
+
+
+class AdminListaEficienteMixin:
+    """
+    Mixin de ModelAdmin: conteos anotados y total de páginas estimado.
+
+    Attributes:
+        totales_lista (dict[str, Total]): conteos/sumas de relaciones que se
+            anotan en la lista. Fuera de la lista (o sin anotación) se
+            calculan igual que antes, con una consulta.
+    """
+
+    paginator = PaginadorEstimado
+    show_full_result_count = False
+    totales_lista = {}
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.totales_lista:
+            queryset = anotar_totales(queryset, self.totales_lista)
+        return queryset
+
+    def total_lista(self, obj, nombre):
+        """Valor de `totales_lista[nombre]` para la fila (anotado si se puede)."""
+        return leer_total(obj, nombre, self.totales_lista[nombre])
+
+
+class ChangeListPorCursor(ChangeList):
+    """
+    ChangeList con paginación por cursor (keyset) sobre (campo_cursor, pk).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Con el orden por defecto, la página se pide como "las N filas anteriores
+    a la última que viste" en lugar de "salta N×página filas". Si el usuario
+    ordena por otra columna o pide "mostrar todo", se usa la paginación
+    normal del admin (con el total estimado).
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        super().__init__(request, *args, **kwargs)
+        # Los enlaces de orden/filtros empiezan de nuevo desde lo más reciente
+        self.params.pop(CURSOR_VAR, None)
+        self.filter_params.pop(CURSOR_VAR, None)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def _leer_cursor(self, texto):
+        """'<fecha ISO>|<id>' → (valor del campo, pk)."""
+        campo = self.model._meta.get_field(self.model_admin.campo_cursor)
+        try:
+            valor, pk = texto.rsplit('|', 1)
+            return campo.to_python(valor), int(pk)
+        except (ValueError, ValidationError):
+            raise IncorrectLookupParameters(f'Cursor inválido: {texto}')
+
+    def get_results(self, request):
+        self.usa_cursor = ORDER_VAR not in self.params and not self.show_all
+        if not self.usa_cursor:
+            return super().get_results(request)
+
+        campo = self.model_admin.campo_cursor
+        queryset = self.queryset.order_by(f'-{campo}', '-pk')
+        cursor = request.GET.get(CURSOR_VAR)
+        if cursor:
+            valor, pk = self._leer_cursor(cursor)
+            queryset = queryset.filter(Q(**{f'{campo}__lt': valor}) | Q(**{campo: valor, 'pk__lt': pk}))
+
+        # Una fila de más para saber si hay página siguiente, sin contar
+        filas = list(queryset[:self.list_per_page + 1])
+        hay_mas = len(filas) > self.list_per_page
+        filas = filas[:self.list_per_page]
+
+        self.result_list = filas
+        self.result_count = len(filas)
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = hay_mas or bool(cursor)
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        self.url_primera_pagina = self.get_query_string(remove=[CURSOR_VAR]) if cursor else None
+        self.url_siguiente = None
+        if hay_mas:
+            ultima = filas[-1]
+            valor = getattr(ultima, campo)
+            self.url_siguiente = self.get_query_string({CURSOR_VAR: f'{valor.isoformat()}|{ultima.pk}'})
+
+
+class AdminPaginacionCursorMixin(AdminListaEficienteMixin):
+    """
+    Mixin de ModelAdmin para bitácoras: paginación por cursor.
+
+    Attributes:
+        campo_cursor (str): campo de fecha (con índice) por el que se ordena
+            la bitácora de más reciente a más antigua.
+    """
+
+    campo_cursor = None
+    change_list_template = 'admin/change_list_cursor.html'
+
+    def get_changelist(self, request, **kwargs):
+        return ChangeListPorCursor
@@ -0,0 +1,167 @@
+"""
+Totales de líneas hijas: anotación → filas precargadas → consulta
+=================================================================
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Modelos como SolicitudCotizacion (almacen) y Cotizacion (servicio_tecnico)
+exponen propiedades tipo `lineas_aprobadas` o `costo_total` que suman o
+cuentan sus líneas hijas. Si cada propiedad hace su propio `.count()` o
+`.aggregate()`, una lista de 20 cotizaciones dispara cientos de consultas.
+
+Cada total se describe UNA vez con `Total` y se puede resolver de tres formas,
+en este orden:
+
+1. Anotación: el QuerySet `.con_totales()` del modelo calcula todos los
+   totales en la MISMA consulta (una subconsulta por total, así dos
+   relaciones distintas no se multiplican entre sí en un JOIN).
+2. Filas precargadas: si la vista hizo `prefetch_related('lineas')`, se
+   cuenta/suma en memoria sobre esas filas, sin volver a la BD.
+3. Consulta: último recurso, igual que antes (`.count()` / `.aggregate()`).
+
+Uso en un modelo:
+    TOTALES = {
+        'lineas_aprobadas': Total('lineas', filtro=('estado_cliente', ('aprobada',))),
+        'costo_total': Total('lineas', suma=(F('cantidad') * F('costo'), lambda l: ...)),
+    }
+
+    class MiQuerySet(models.QuerySet):
+        def con_totales(self):
+            return anotar_totales(self, TOTALES)
+
+    @property
+    def lineas_aprobadas(self):
+        return leer_total(self, 'lineas_aprobadas', TOTALES['lineas_aprobadas'])
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+# Precisión de los importes anotados (igual o mayor que los DecimalField de las líneas)
+_CAMPO_IMPORTE = DecimalField(max_digits=14, decimal_places=2)
+
+
+def nombre_anotacion(nombre):
+    """Alias del total anotado (distinto de la propiedad para no chocar con ella)."""
+    return f'anotado_{nombre}'
+
+
+@dataclass(frozen=True)
+class Total:
+    """
+    Un conteo o una suma sobre una relación inversa (ForeignKey hacia el padre).
+
+    Attributes:
+        relacion: related_name de las líneas (p. ej. 'lineas').
+        filtro: (campo, valores) — solo filas cuyo campo esté en valores.
+            También una tupla de varios pares (deben cumplirse todos).
+            None = todas las filas.
+        suma: (expresión SQL, función por fila) para sumar; None = contar.
+            La función recibe la fila y devuelve el importe (None se ignora,
+            como hace SUM en SQL).
+    """
+
+    relacion: str
+    filtro: tuple | None = None
+    suma: tuple | None = None
+
+    def _condiciones(self):
+        """Lista de pares (campo, valores) del filtro."""
+        if self.filtro is None:
+            return []
+        if isinstance(self.filtro[0], str):
+            return [self.filtro]
+        return list(self.filtro)
+
+    def _filtrar(self, filas):
+        return filas.filter(**{f'{campo}__in': valores for campo, valores in self._condiciones()})
+
+    def _pasa_filtro(self, fila):
+        return all(getattr(fila, campo) in valores for campo, valores in self._condiciones())
+
+    def en_memoria(self, filas):
+        """Total sobre filas ya cargadas (prefetch)."""
+        filas = [fila for fila in filas if self._pasa_filtro(fila)]
+        if self.suma is None:
+            return len(filas)
+        importes = [importe for importe in map(self.suma[1], filas) if importe is not None]
+        return sum(importes) if importes else 0
+
+    def en_bd(self, manager):
+        """Total consultando la BD (mismo resultado que antes de este módulo)."""
+        filas = self._filtrar(manager.all())
+        if self.suma is None:
+            return filas.count()
+        return filas.aggregate(total=Sum(self.suma[0], output_field=_CAMPO_IMPORTE))['total'] or 0
+
+    def subconsulta(self, modelo):
+        """Expresión para .annotate(): subconsulta correlacionada con el padre."""
+        relacion = modelo._meta.get_field(self.relacion)
+        campo_padre = relacion.field.name
+        filas = self._filtrar(relacion.related_model._default_manager.filter(**{campo_padre: OuterRef('pk')}))
+
+        if self.suma is None:
+            agregado, salida, cero = Count('pk'), IntegerField(), Value(0)
+        else:
+            agregado = Sum(self.suma[0], output_field=_CAMPO_IMPORTE)
+            salida, cero = _CAMPO_IMPORTE, Value(Decimal('0'))
+
+        subconsulta = (
+            filas.order_by()
+            .values(campo_padre)
+            .annotate(total=agregado)
+            .values('total')[:1]
+        )
+        return Coalesce(Subquery(subconsulta, output_field=salida), cero, output_field=salida)
+
+
+def anotar_totales(queryset, totales):
+    """
+    Agrega al QuerySet todos los totales descritos (una sola consulta).
+
+    Args:
+        queryset: QuerySet del modelo padre.
+        totales (dict[str, Total]): nombre → descripción.
+
+    Returns:
+        QuerySet anotado con `anotado_<nombre>` por cada total.
+    """
+    return queryset.annotate(**{
+        nombre_anotacion(nombre): total.subconsulta(queryset.model)
+        for nombre, total in totales.items()
+    })
+
+
+def leer_total(instancia, nombre, total):
+    """
+    Valor del total: anotación si existe, si no filas precargadas, si no BD.
+
+    Args:
+        instancia: objeto padre (SolicitudCotizacion, Cotizacion, ...).
+        nombre (str): clave del total en el diccionario del modelo.
+        total (Total): descripción del total.
+    """
+    anotacion = nombre_anotacion(nombre)
+    if anotacion in instancia.__dict__:
+        return instancia.__dict__[anotacion]
+    if total.relacion in getattr(instancia, '_prefetched_objects_cache', {}):
+        return total.en_memoria(getattr(instancia, total.relacion).all())
+    return total.en_bd(getattr(instancia, total.relacion))
+
+
+def olvidar_totales(instancia, totales):
+    """
+    Descarta anotaciones y filas precargadas para que el próximo total se lea de la BD.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Úsalo antes de decidir algo con los totales justo después de modificar
+    líneas (p. ej. al recalcular el estado de la solicitud): lo anotado o
+    precargado es una foto del momento en que se leyó el padre.
+    """
+    cache_prefetch = getattr(instancia, '_prefetched_objects_cache', {})
+    for nombre, total in totales.items():
+        instancia.__dict__.pop(nombre_anotacion(nombre), None)
+        cache_prefetch.pop(total.relacion, None)
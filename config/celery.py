@@ -16,8 +16,11 @@ Flujo:
                                               Resultado guardado en BD
 """
 import os
+import time
 from celery import Celery
-from celery.signals import task_prerun, task_postrun
+from celery.signals import before_task_publish, task_prerun, task_postrun
+
+from config.colas_celery import HEADER_ENCOLADA_EN, configuracion_colas
 
 # EXPLICACIÓN:
 # Esta línea le dice a Celery cuál es el archivo settings.py de Django.
@@ -36,6 +39,12 @@ app = Celery('inventario_calidad')
 # Esto evita conflictos con otras configuraciones de Django.
 app.config_from_object('django.conf:settings', namespace='CELERY')
 
+# EXPLICACIÓN:
+# Colas separadas para video (FFmpeg), IA, correo, Beat y lo demás, con sus
+# límites de tiempo y prioridades. Ver config/colas_celery.py (incluye los
+# comandos para levantar un worker por cola).
+app.conf.update(configuracion_colas())
+
 # EXPLICACIÓN:
 # Esta línea hace que Celery busque automáticamente archivos llamados 'tasks.py'
 # dentro de todas las apps instaladas en Django (INSTALLED_APPS).
@@ -75,16 +84,20 @@ def debug_task(self):
 #
 # ¿Cómo llega el db_alias a la tarea?
 # Cada .delay() en views.py pasa `db_alias=get_pais_actual()['db_alias']`.
-# Esta señal lo lee del kwargs y configura los thread-locals, exactamente como
+# Esta señal lo lee del kwargs y activa el contexto de país, exactamente como
 # lo haría el PaisMiddleware en un request normal.
 # ============================================================================
 
+# Token de restauración por tarea en ejecución (task_id → token de la ContextVar)
+_TOKENS_PAIS_TAREA = {}
+
+
 @task_prerun.connect
 def configurar_contexto_pais(task_id, task, args, kwargs, **extra):
     """
     Señal que se ejecuta antes de cada tarea Celery.
-    Lee el parámetro db_alias del kwargs de la tarea y establece el contexto
-    de país en los thread-locals del worker, para que el DB router y
+    Lee el parámetro db_alias del kwargs de la tarea y activa el contexto
+    de país (ContextVar de config.middleware_pais), para que el DB router y
     get_pais_actual() funcionen correctamente dentro de la tarea.
 
     Args:
@@ -92,45 +105,82 @@ def configurar_contexto_pais(task_id, task, args, kwargs, **extra):
         task    : Instancia de la tarea Celery
         kwargs  : Kwargs que recibió la tarea (aquí buscamos 'db_alias')
     """
-    from config.middleware_pais import _thread_locals
+    from config.middleware_pais import activar_pais, resolver_pais
     from config.paises_config import PAISES_CONFIG, PAIS_DEFAULT
 
     # Leer el db_alias que la vista pasó al encolar la tarea
     # Si no se pasó (tarea periódica, tarea legacy), usamos el país por defecto
-    db_alias = kwargs.get('db_alias', PAIS_DEFAULT)
-
-    # Buscar la configuración completa del país que corresponde a ese alias
-    pais_config = None
-    for subdominio, config in PAISES_CONFIG.items():
-        if config['db_alias'] == db_alias:
-            pais_config = config
-            break
+    db_alias = (kwargs or {}).get('db_alias') or PAIS_DEFAULT
 
     # Fallback al país por defecto si el alias no existe en la configuración
-    if pais_config is None:
-        pais_config = PAISES_CONFIG[PAIS_DEFAULT]
+    pais_config = resolver_pais(db_alias) or PAISES_CONFIG[PAIS_DEFAULT]
 
-    # Establecer los tres valores en el thread-local del worker de Celery
-    # Esto replica exactamente lo que hace PaisMiddleware._set_thread_locals()
-    _thread_locals.db_alias = pais_config['db_alias']
-    _thread_locals.pais_config = pais_config
-    _thread_locals.pais_codigo = pais_config['codigo']
+    # Lo mismo que hace PaisMiddleware en un request normal
+    _TOKENS_PAIS_TAREA[task_id] = activar_pais(pais_config)
 
 
 @task_postrun.connect
 def limpiar_contexto_pais(task_id, task, args, kwargs, retval, state, **extra):
     """
     Señal que se ejecuta después de cada tarea Celery (éxito o fallo).
-    Limpia los thread-locals del worker para evitar que el contexto de un país
-    contamine la siguiente tarea que ejecute el mismo proceso worker.
+    Restaura el contexto de país anterior para evitar que el de esta tarea
+    contamine la siguiente que ejecute el mismo proceso worker.
 
     Args:
         state  : Estado final ('SUCCESS', 'FAILURE', etc.)
         retval : Valor de retorno de la tarea
     """
-    from config.middleware_pais import _thread_locals
+    from config.middleware_pais import _pais_actual, restaurar_pais
+
+    token = _TOKENS_PAIS_TAREA.pop(task_id, None)
+    if token is None:
+        return
+    try:
+        restaurar_pais(token)
+    except ValueError:
+        # El token se creó en otro contexto (pool de greenlets/hilos):
+        # dejar el contexto sin país, como al arrancar el worker
+        _pais_actual.set(None)
+
+
+# ============================================================================
+# SEÑALES CELERY — Medición de rendimiento
+# ============================================================================
+#
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# Igual que MedicionRendimientoMiddleware con los requests: una muestra de
+# las tareas (RENDIMIENTO_MUESTREO) cuenta consultas, tiempo en plantillas,
+# HTTP externo y caché; las lentas quedan en logs/rendimiento.log.
+# Ver config/rendimiento.py.
+
+
+@task_prerun.connect
+def iniciar_medicion_rendimiento(task_id, task, **extra):
+    """Empieza a medir la tarea si cae en la muestra."""
+    from config.rendimiento import iniciar_medicion_tarea
+
+    iniciar_medicion_tarea(task_id, task.name)
+
+
+@task_postrun.connect
+def finalizar_medicion_rendimiento(task_id, task, state=None, **extra):
+    """Termina la medición de la tarea (éxito o fallo)."""
+    from config.rendimiento import finalizar_medicion_tarea
+
+    finalizar_medicion_tarea(task_id, state)
+
+
+# ============================================================================
+# SEÑAL CELERY — Hora de encolado
+# ============================================================================
+#
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# Cada mensaje lleva la hora en que se encoló; `manage.py estado_colas_celery`
+# la usa para decir cuánto lleva esperando el mensaje más viejo de cada cola.
+
 
-    # Eliminar los tres atributos que estableció configurar_contexto_pais
-    for atributo in ('db_alias', 'pais_config', 'pais_codigo'):
-        if hasattr(_thread_locals, atributo):
-            delattr(_thread_locals, atributo)
+@before_task_publish.connect
+def marcar_hora_encolado(headers=None, **extra):
+    """Agrega el header 'encolada_en' (time.time()) al mensaje de la tarea."""
+    if headers is not None:
+        headers.setdefault(HEADER_ENCOLADA_EN, time.time())
@@ -0,0 +1,283 @@
+"""
+Topología de colas de Celery: en qué cola corre cada tarea y con qué límites.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+Con una sola cola, un video resumen de 8 minutos (FFmpeg) o un análisis de
+imágenes con IA de 10 minutos ocupan los procesos del worker y los correos
+al cliente esperan detrás. Separando el trabajo en colas, cada una con su
+propio worker, lo lento nunca bloquea lo rápido:
+
+    media   → FFmpeg (videos resumen, compresión). Pocos procesos, 1 a la vez.
+    ai      → análisis de visión (Ollama/Gemini). Tantos procesos como el
+              modelo aguante en paralelo.
+    mail    → correos y notificaciones. Esperan red, no CPU: muchos hilos.
+    default → lo demás (exportes a Excel en segundo plano, pruebas).
+    beat    → barridos programados por Celery Beat.
+
+Workers (uno por cola; ajustar -c a la máquina):
+    celery -A config worker -Q media   -c 1  --prefetch-multiplier 1 -n media@%h
+    celery -A config worker -Q ai      -c 2  --prefetch-multiplier 1 -n ai@%h
+    celery -A config worker -Q mail    -P threads -c 20 -n mail@%h
+    celery -A config worker -Q default -c 4  -n default@%h
+    celery -A config worker -Q beat    -c 2  -n beat@%h
+    celery -A config beat
+
+En desarrollo basta un worker para todas:
+    celery -A config worker -Q media,ai,mail,default,beat
+
+¿Qué pasa con una tarea nueva? Si no se agrega a TAREAS_POR_COLA cae en
+'default' (el test test_colas_celery obliga a declararla).
+
+Estado de las colas (pendientes y antigüedad del más viejo):
+    python manage.py estado_colas_celery
+"""
+
+import json
+import time
+
+COLA_MEDIA = 'media'
+COLA_IA = 'ai'
+COLA_CORREO = 'mail'
+COLA_DEFAULT = 'default'
+COLA_BEAT = 'beat'
+
+# Límites por cola (segundos). Una tarea que declara soft_time_limit /
+# time_limit en su decorador conserva los suyos.
+COLAS = {
+    COLA_MEDIA: {
+        'descripcion': 'FFmpeg: videos resumen y compresión de video',
+        'soft_time_limit': 1500,
+        'time_limit': 1800,
+    },
+    COLA_IA: {
+        # OLLAMA_VISION_TIMEOUT (600 s) + compresión de imágenes + correo
+        'descripcion': 'Análisis de imágenes/video con IA',
+        'soft_time_limit': 900,
+        'time_limit': 1020,
+    },
+    COLA_CORREO: {
+        'descripcion': 'Correos y notificaciones',
+        'soft_time_limit': 240,
+        'time_limit': 300,
+    },
+    COLA_DEFAULT: {
+        'descripcion': 'Exportes en segundo plano y otras tareas',
+        'soft_time_limit': 300,
+        'time_limit': 600,
+    },
+    COLA_BEAT: {
+        'descripcion': 'Barridos programados (Celery Beat)',
+        'soft_time_limit': 300,
+        'time_limit': 600,
+    },
+}
+
+TAREAS_POR_COLA = {
+    COLA_MEDIA: (
+        'servicio_tecnico.generar_video_resumen',
+        'servicio_tecnico.comprimir_video_resumen_descarga',
+        'servicio_tecnico.comprimir_video_evidencia',
+    ),
+    COLA_IA: (
+        'servicio_tecnico.enviar_imagenes_cliente',
+        'servicio_tecnico.enviar_evidencia_video',
+    ),
+    COLA_CORREO: (
+        'notificaciones.procesar_bandeja_correo',
+        'servicio_tecnico.enviar_correo_rhitso',
+        'servicio_tecnico.enviar_diagnostico_cliente',
+        'servicio_tecnico.enviar_feedback_rechazo',
+        'servicio_tecnico.enviar_feedback_satisfaccion',
+        'servicio_tecnico.enviar_formato_garantia_email',
+        'servicio_tecnico.enviar_formato_oow_email',
+        'servicio_tecnico.enviar_imagenes_egreso_cliente',
+        'servicio_tecnico.enviar_notificacion_equipo_disponible',
+        'servicio_tecnico.enviar_recordatorio_encuesta',
+        'servicio_tecnico.enviar_recordatorio_imagen',
+        'servicio_tecnico.enviar_recordatorios_encuesta_lote',
+        'servicio_tecnico.enviar_recordatorios_imagen_lote',
+        'servicio_tecnico.enviar_rewind_egreso_email',
+        'servicio_tecnico.enviar_seguimiento_cliente',
+        'servicio_tecnico.enviar_vigencia_vencida',
+        'servicio_tecnico.notificar_validacion_pago',
+        'almacen.enviar_cotizacion_cliente',
+        'almacen.notificar_almacenista_solicitud_baja',
+        'almacen.notificar_cliente_pnc',
+        'almacen.notificar_compras_cotizacion_aceptada',
+        'almacen.notificar_compras_nueva_cotizacion',
+        'almacen.notificar_front_cotizacion',
+        'almacen.notificar_recotizacion_solicitada',
+        'almacen.notificar_respuesta_cotizacion_rechazada',
+        'almacen.notificar_solicitud_baja_procesada',
+    ),
+    COLA_DEFAULT: (
+        'servicio_tecnico.generar_exportacion_excel',
+        'servicio_tecnico.importar_ordenes_sicser_lote',
+        'config.celery.debug_task',
+    ),
+    COLA_BEAT: (
+        'notificaciones.limpiar_antiguas',
+        'servicio_tecnico.sincronizar_espejo_sicser',
+        'servicio_tecnico.verificar_encuestas_pendientes',
+        'servicio_tecnico.verificar_recordatorios_imagenes',
+        'servicio_tecnico.limpiar_subidas_temporales',
+        'almacen.verificar_vigencia_cotizaciones',
+        'almacen.procesar_vigencias_pais',
+    ),
+}
+
+# Tareas que se pueden repetir sin efectos dobles (marcan banderas, revisan
+# la bandeja o sobrescriben su resultado). Con acks_late el mensaje se
+# confirma al TERMINAR: si el worker muere a mitad, otro la vuelve a correr.
+# Las de la cola media NO llevan reject_on_worker_lost (ver annotate).
+TAREAS_IDEMPOTENTES = frozenset({
+    'notificaciones.limpiar_antiguas',
+    'notificaciones.procesar_bandeja_correo',
+    'servicio_tecnico.sincronizar_espejo_sicser',
+    'servicio_tecnico.importar_ordenes_sicser_lote',
+    'servicio_tecnico.verificar_encuestas_pendientes',
+    'servicio_tecnico.verificar_recordatorios_imagenes',
+    'servicio_tecnico.limpiar_subidas_temporales',
+    'servicio_tecnico.enviar_recordatorios_encuesta_lote',
+    'servicio_tecnico.enviar_recordatorios_imagen_lote',
+    'servicio_tecnico.comprimir_video_resumen_descarga',
+    'servicio_tecnico.comprimir_video_evidencia',
+    'almacen.verificar_vigencia_cotizaciones',
+    'almacen.procesar_vigencias_pais',
+})
+
+# Prioridades (broker Redis): número MENOR = se atiende ANTES dentro de la cola.
+# Redis las agrupa en escalones (PASOS_PRIORIDAD): 0, 3, 6 y 9.
+PRIORIDAD_INTERACTIVA = 0   # alguien acaba de hacer clic y espera el correo
+PRIORIDAD_NORMAL = 3        # default de todas las tareas
+PRIORIDAD_LOTE = 6          # recordatorios masivos de Beat: que no estorben
+PASOS_PRIORIDAD = (0, 3, 6, 9)
+# Separador de kombu entre nombre de cola y escalón ('mail' + sep + '6')
+SEPARADOR_PRIORIDAD = '\x06\x16'
+
+TAREAS_LOTE = frozenset({
+    'servicio_tecnico.enviar_recordatorio_encuesta',
+    'servicio_tecnico.enviar_recordatorios_encuesta_lote',
+    'servicio_tecnico.enviar_recordatorios_imagen_lote',
+})
+
+# Con acks_late y Redis, un mensaje sin confirmar se reentrega tras este
+# tiempo: debe ser mayor que el time_limit más largo (30 min).
+VISIBILIDAD_SEGUNDOS = 2 * 60 * 60
+
+# Header que marca cuándo se encoló cada mensaje (para medir la espera)
+HEADER_ENCOLADA_EN = 'encolada_en'
+
+
+def cola_de_tarea(nombre):
+    """Cola declarada para la tarea `nombre` (COLA_DEFAULT si no aparece)."""
+    for cola, tareas in TAREAS_POR_COLA.items():
+        if nombre in tareas:
+            return cola
+    return COLA_DEFAULT
+
+
+def prioridad_de_tarea(nombre):
+    """Prioridad con la que se encola la tarea `nombre`."""
+    if nombre in TAREAS_LOTE:
+        return PRIORIDAD_LOTE
+    if nombre in TAREAS_POR_COLA[COLA_CORREO]:
+        return PRIORIDAD_INTERACTIVA
+    return PRIORIDAD_NORMAL
+
+
+class AnotacionesPorCola:
+    """
+    task_annotations de Celery: ajusta cada tarea según su cola.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Celery llama annotate(tarea) una vez por tarea al registrarla; lo que
+    devuelve se asigna como atributo de la tarea. Así los límites de tiempo,
+    la prioridad y acks_late se declaran aquí y no en cada decorador.
+    """
+
+    def annotate(self, tarea):
+        cola = cola_de_tarea(tarea.name)
+        limites = COLAS[cola]
+        anotaciones = {'priority': prioridad_de_tarea(tarea.name)}
+        for atributo in ('soft_time_limit', 'time_limit'):
+            # Un límite puesto en el decorador manda sobre el de la cola
+            if getattr(tarea, atributo, None) is None:
+                anotaciones[atributo] = limites[atributo]
+        if tarea.name in TAREAS_IDEMPOTENTES:
+            # Si FFmpeg hace que el sistema mate al proceso por memoria, el
+            # mensaje reencolado tumbaría al siguiente worker una y otra vez:
+            # en media, un worker perdido da la tarea por fallida.
+            anotaciones.update(acks_late=True, reject_on_worker_lost=cola != COLA_MEDIA)
+        return anotaciones
+
+
+def configuracion_colas():
+    """
+    Ajustes de Celery para la topología de colas (se aplican en config/celery.py).
+
+    Returns:
+        dict: nombres de ajuste de Celery (minúsculas) → valor.
+    """
+    return {
+        'task_default_queue': COLA_DEFAULT,
+        'task_routes': {
+            nombre: {'queue': cola}
+            for cola, tareas in TAREAS_POR_COLA.items() for nombre in tareas
+        },
+        'task_annotations': (AnotacionesPorCola(),),
+        'task_default_priority': PRIORIDAD_NORMAL,
+        'broker_transport_options': {
+            'priority_steps': list(PASOS_PRIORIDAD),
+            'sep': SEPARADOR_PRIORIDAD,
+            'queue_order_strategy': 'priority',
+            'visibility_timeout': VISIBILIDAD_SEGUNDOS,
+        },
+    }
+
+
+def _lista_redis(cola, paso):
+    """Nombre de la lista de Redis de una cola en un escalón de prioridad."""
+    return f'{cola}{SEPARADOR_PRIORIDAD}{paso}' if paso else cola
+
+
+def estado_colas(cliente, ahora=None):
+    """
+    Pendientes y espera del mensaje más viejo de cada cola.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Con Redis cada cola es una lista (una por escalón de prioridad). Kombu
+    agrega por la izquierda y el worker toma por la derecha, así que el
+    elemento -1 es el más viejo. Su header 'encolada_en' dice desde cuándo
+    espera (los mensajes encolados antes de existir el header no lo traen).
+
+    Args:
+        cliente: cliente de Redis del broker (llen / lindex).
+        ahora (float|None): time.time() a usar (para pruebas).
+
+    Returns:
+        list[dict]: por cola: 'cola', 'pendientes', 'por_prioridad'
+        {escalón: n} y 'espera_s' (None si está vacía o sin header).
+    """
+    ahora = time.time() if ahora is None else ahora
+    filas = []
+    for cola in COLAS:
+        por_prioridad, mas_viejo = {}, None
+        for paso in PASOS_PRIORIDAD:
+            lista = _lista_redis(cola, paso)
+            por_prioridad[paso] = cliente.llen(lista)
+            if not por_prioridad[paso]:
+                continue
+            try:
+                headers = json.loads(cliente.lindex(lista, -1)).get('headers') or {}
+                encolada_en = float(headers[HEADER_ENCOLADA_EN])
+            except (TypeError, ValueError, KeyError):
+                continue
+            mas_viejo = encolada_en if mas_viejo is None else min(mas_viejo, encolada_en)
+        filas.append({
+            'cola': cola,
+            'pendientes': sum(por_prioridad.values()),
+            'por_prioridad': por_prioridad,
+            'espera_s': round(ahora - mas_viejo, 1) if mas_viejo is not None else None,
+        })
+    return filas
@@ -12,8 +12,8 @@ El Database Router es una clase que Django consulta ANTES de cada query:
 - "¿Aplico esta migración en esta BD?" → allow_migrate()
 
 CÓMO FUNCIONA:
-1. El PaisMiddleware guarda en thread-locals el país activo
-2. Este router consulta thread-locals para saber la BD
+1. El PaisMiddleware activa el país en el contexto (ContextVar)
+2. Este router consulta ese contexto para saber la BD
 3. Si hay un hint de instancia (ej: .using('argentina')), lo respeta
 
 APPS QUE SIEMPRE VAN A 'default' (no se enrutan por país):
@@ -29,7 +29,7 @@ BUGS CORREGIDOS (v2.0):
 - v1.0 ignoraba hints['instance'] — si hacías .using('argentina'),
   el router podía enviar la query a otra BD
 - v1.0 fallaba con manage.py porque no hay request HTTP activo
-  (thread-locals está vacío)
+  (no hay país activo en el contexto)
 
 BUG CORREGIDO (v2.1):
 - v2.0 enrutaba sessions/axes por país, causando SessionInterrupted
@@ -54,7 +54,7 @@ logger = logging.getLogger(__name__)
 # Ejemplo del bug:
 # 1. Visitas /admin/?pais=argentina (GET)
 # 2. SessionMiddleware carga sesión desde 'default' (aún no hay país)
-# 3. PaisMiddleware configura thread-locals → argentina
+# 3. PaisMiddleware activa el contexto → argentina
 # 4. Haces login (POST) → Django intenta guardar sesión en 'argentina'
 # 5. La sesión no existe en 'argentina' → SessionInterrupted!
 #
@@ -74,7 +74,7 @@ class PaisDBRouter:
     ORDEN DE PRIORIDAD para determinar la BD:
     0. Si la app está en APPS_SIEMPRE_DEFAULT → siempre 'default'
     1. hints['instance']._state.db — Si el objeto ya sabe su BD (ej: .using())
-    2. Thread-locals (del PaisMiddleware) — País del request actual
+    2. Contexto de país (PaisMiddleware, task_prerun o `with pais(...)`)
     3. 'default' — Fallback seguro (para manage.py, migrations, shell)
     """
 
@@ -113,10 +113,10 @@ class PaisDBRouter:
             if db is not None:
                 return db
 
-        # PRIORIDAD 2: Thread-locals del middleware (request activo)
+        # PRIORIDAD 2: Contexto de país (request, tarea o bloque `with pais`)
         #
         # EXPLICACIÓN: Si hay un request HTTP activo, el PaisMiddleware
-        # ya guardó el alias de BD en thread-locals.
+        # ya guardó el alias de BD en el contexto de país.
         db_alias = get_current_db_alias()
         if db_alias and db_alias != 'default':
             return db_alias
@@ -0,0 +1,186 @@
+"""
+Índices de texto compilados en memoria, uno por país
+=====================================================
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Algunas búsquedas se repiten en cada orden, importación SICSER o línea de
+cotización: "¿qué modelo base de la tabla de gamas aparece dentro de este
+modelo?" o "¿qué palabra clave de componente aparece dentro del nombre de
+este producto?". Hacerlo con un `for` sobre todas las filas de la BD (y una
+consulta por llamada) cuesta más conforme crecen los catálogos.
+
+Este módulo ofrece dos piezas:
+
+1. `AutomataSubcadenas` (algoritmo Aho–Corasick): se arma UNA vez con
+   todas las claves y después encuentra, en una sola pasada por el texto,
+   TODAS las claves que aparecen dentro de él, sin importar cuántas haya.
+2. `IndicePorPais`: guarda el índice ya armado en memoria del proceso, uno
+   por base de datos (país). Se arma la primera vez que se usa y se vuelve a
+   armar cuando:
+   - un signal llama a `invalidar()` (cambió la tabla de origen); la versión
+     vive en el caché compartido, así que los demás procesos/workers también
+     se enteran en su siguiente uso;
+   - pasan `CACHE_TTL_INDICES_TEXTO` segundos (respaldo para cambios que no
+     disparan signals, como `.update()` o `bulk_create()`).
+   Si el caché compartido no responde, el índice se arma en cada uso (igual
+   de correcto, solo más lento).
+
+Efectos secundarios:
+- Memoria del proceso (un índice por país) y un contador de versión en el
+  caché por defecto.
+"""
+
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.middleware_pais import get_current_db_alias
+
+# Respaldo: aunque nadie invalide, el índice se vuelve a armar solo.
+INDICES_TEXTO_TTL = getattr(settings, 'CACHE_TTL_INDICES_TEXTO', 60 * 10)
+
+
+class AutomataSubcadenas:
+    """
+    Autómata Aho–Corasick: qué claves aparecen dentro de un texto.
+
+    Args:
+        claves: iterable de (texto_clave, dato). Varias claves pueden llevar
+            el mismo texto; cada una devuelve su propio dato. Las claves
+            vacías aparecen en cualquier texto (igual que `'' in texto`).
+
+    Ejemplo:
+        automata = AutomataSubcadenas([('SSD', 1), ('SSD M.2', 2)])
+        automata.buscar('DISCO SSD M.2 1TB')  →  [1, 2]
+    """
+
+    def __init__(self, claves):
+        # Nodo i: transiciones por carácter, enlace de falla y claves (índices) que terminan ahí
+        self._siguiente = [{}]
+        self._falla = [0]
+        self._terminan = [[]]
+        self._datos = []
+        self._siempre = []
+
+        for texto, dato in claves:
+            indice = len(self._datos)
+            self._datos.append(dato)
+            if not texto:
+                self._siempre.append(indice)
+                continue
+            nodo = 0
+            for caracter in texto:
+                hijo = self._siguiente[nodo].get(caracter)
+                if hijo is None:
+                    hijo = len(self._siguiente)
+                    self._siguiente.append({})
+                    self._falla.append(0)
+                    self._terminan.append([])
+                    self._siguiente[nodo][caracter] = hijo
+                nodo = hijo
+            self._terminan[nodo].append(indice)
+
+        # Enlaces de falla por anchura: el sufijo más largo que también es prefijo
+        cola = deque(self._siguiente[0].values())
+        while cola:
+            nodo = cola.popleft()
+            for caracter, hijo in self._siguiente[nodo].items():
+                cola.append(hijo)
+                falla = self._falla[nodo]
+                while falla and caracter not in self._siguiente[falla]:
+                    falla = self._falla[falla]
+                destino = self._siguiente[falla].get(caracter, 0)
+                self._falla[hijo] = destino if destino != hijo else 0
+                # Lo que termina en el sufijo también termina aquí
+                self._terminan[hijo] = self._terminan[hijo] + self._terminan[self._falla[hijo]]
+
+    def buscar(self, texto):
+        """
+        Datos de todas las claves que aparecen en el texto.
+
+        Returns:
+            list: un dato por clave encontrada (sin repetir la misma clave
+            aunque aparezca varias veces), en orden de aparición.
+        """
+        encontradas = list(self._siempre)
+        vistas = set(encontradas)
+        nodo = 0
+        for caracter in texto or '':
+            while nodo and caracter not in self._siguiente[nodo]:
+                nodo = self._falla[nodo]
+            nodo = self._siguiente[nodo].get(caracter, 0)
+            for indice in self._terminan[nodo]:
+                if indice not in vistas:
+                    vistas.add(indice)
+                    encontradas.append(indice)
+        return [self._datos[indice] for indice in encontradas]
+
+
+class IndicePorPais:
+    """
+    Índice armado bajo demanda y guardado en memoria, uno por país.
+
+    Args:
+        nombre (str): identifica el índice en el caché de versiones.
+        construir (callable): recibe el db_alias y devuelve el índice
+            (leyendo la BD de ese país con `.using(db_alias)`).
+
+    Uso:
+        INDICE_GAMAS = IndicePorPais('gamas', _construir_indice_gamas)
+        indice = INDICE_GAMAS.obtener()          # país actual
+        INDICE_GAMAS.invalidar('mexico')         # desde un signal
+    """
+
+    def __init__(self, nombre, construir):
+        self.nombre = nombre
+        self._construir = construir
+        # db_alias → (versión compartida, momento en que se armó, índice)
+        self._por_pais = {}
+
+    def _clave_version(self, db_alias):
+        return f'indice_texto:{self.nombre}:version:{db_alias}'
+
+    def obtener(self, db_alias=None):
+        """
+        Índice del país (el actual si no se indica), armándolo si hace falta.
+
+        Efectos secundarios:
+            Lee la versión del caché compartido; consulta la BD solo si hay
+            que volver a armar el índice.
+        """
+        db_alias = db_alias or get_current_db_alias()
+        clave = self._clave_version(db_alias)
+        version = cache.get(clave)
+        if version is None:
+            cache.add(clave, int(time.time() * 1000), None)
+            version = cache.get(clave)
+
+        guardado = self._por_pais.get(db_alias)
+        if guardado is not None and version is not None:
+            version_guardada, armado_en, indice = guardado
+            if version_guardada == version and time.monotonic() - armado_en < INDICES_TEXTO_TTL:
+                return indice
+
+        indice = self._construir(db_alias)
+        # Sin versión compartida (caché caído) no sabríamos si otro proceso
+        # cambió la tabla: se usa el índice recién armado pero no se guarda.
+        if version is not None:
+            self._por_pais[db_alias] = (version, time.monotonic(), indice)
+        return indice
+
+    def invalidar(self, db_alias='default'):
+        """
+        Descarta el índice del país en este proceso y avisa a los demás.
+
+        Efectos secundarios:
+            Borra la copia local e incrementa (o crea) la versión compartida.
+        """
+        self._por_pais.pop(db_alias, None)
+        clave = self._clave_version(db_alias)
+        try:
+            cache.incr(clave)
+        except ValueError:
+            cache.set(clave, int(time.time() * 1000), None)
@@ -7,6 +7,7 @@ Windows usa codificación cp1252 que no soporta emojis, causando errores.
 SOLUCIÓN: Filtrar automáticamente emojis antes de escribir en consola/archivos.
 """
 
+import json
 import logging
 import re
 
@@ -110,3 +111,24 @@ class ConsoleFormatter(SafeFormatter):
     Evita el error UnicodeEncodeError en cmd.exe y PowerShell.
     """
     pass
+
+
+class RendimientoFormatter(logging.Formatter):
+    """
+    Formateador del log `rendimiento` (config/rendimiento.py).
+
+    ¿QUÉ HACE?
+    - Escribe cada registro como UNA línea JSON: fecha, nivel, mensaje y
+      las métricas que vienen en `extra={'rendimiento': {...}}`
+    - Así el archivo se puede filtrar con jq o abrir en una hoja de cálculo
+      para encontrar las vistas con más consultas o más lentas
+    """
+
+    def format(self, record):
+        datos = {
+            'fecha': self.formatTime(record, '%Y-%m-%d %H:%M:%S'),
+            'nivel': record.levelname,
+            'mensaje': record.getMessage(),
+        }
+        datos.update(getattr(record, 'rendimiento', None) or {})
+        return json.dumps(datos, ensure_ascii=False, default=str)
@@ -10,25 +10,42 @@ Este middleware hace lo siguiente:
 1. Mira la URL que visitó el usuario (ej: mexico.sigmasystem.work)
 2. Extrae la parte del subdominio (ej: "mexico")
 3. Busca la configuración de ese país
-4. Guarda esa info en un lugar especial (thread-locals) para que
+4. Guarda esa info en un lugar especial (una ContextVar) para que
    el Database Router sepa a qué base de datos enviar las queries
 
-CONCEPTO CLAVE - Thread-locals:
-Imagina que cada "hilo" (thread) de tu servidor es un trabajador.
-Thread-locals es como una nota adhesiva personal de cada trabajador.
-Si el trabajador A atiende a México, su nota dice "México".
-Si el trabajador B atiende a Argentina, su nota dice "Argentina".
-Así no se confunden entre sí.
+CONCEPTO CLAVE - ContextVar (contexto de país):
+Imagina que cada request es un expediente con una etiqueta "México" o
+"Argentina" pegada. La etiqueta viaja con el expediente sin importar quién
+lo atienda: un hilo de Gunicorn (WSGI), una corrutina de una vista async
+(ASGI) o una tarea de Celery. Por eso usamos contextvars y no thread-locals:
+con thread-locals la etiqueta era del TRABAJADOR (hilo), y en ASGI un mismo
+hilo atiende varios requests intercalados.
+
+API para código que no viene de un request:
+
+    from config.middleware_pais import pais, en_todos_los_paises
+
+    with pais('argentina'):          # subdominio, db_alias o dict del país
+        OrdenServicio.objects.count()  # → BD de Argentina
+
+    @pais('chile')                   # también como decorador (sync o async)
+    def reporte(): ...
+
+    resultados, errores = en_todos_los_paises(contar_pendientes)
 
 BUG CORREGIDO (v2.0):
-La v1.0 NO limpiaba las notas adhesivas si ocurría un error.
+La v1.0 NO limpiaba el contexto si ocurría un error.
 Ahora usamos try/finally para SIEMPRE limpiar, sin importar si hubo error.
 """
 
-import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from functools import wraps
 from zoneinfo import ZoneInfo
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.utils import timezone as dj_timezone
 
 from .paises_config import PAISES_CONFIG, PAIS_DEFAULT, get_pais_config
@@ -36,24 +53,22 @@ from .paises_config import PAISES_CONFIG, PAIS_DEFAULT, get_pais_config
 logger = logging.getLogger(__name__)
 
 # ============================================================================
-# THREAD-LOCALS — "Notas adhesivas" por hilo del servidor
+# CONTEXTO DE PAÍS — una ContextVar en lugar de thread-locals
 # ============================================================================
-# 
-# EXPLICACIÓN PARA PRINCIPIANTES:
-# _thread_locals es una variable global PERO cada thread (hilo) del servidor
-# tiene su propia copia. Es como si cada mesero de un restaurante tuviera
-# su propia libreta donde anota qué mesa está atendiendo.
 #
-# Gunicorn usa 5 workers (procesos), y cada uno puede tener múltiples threads.
-# Thread-locals garantiza que si un thread atiende a México y otro a Argentina,
-# no se mezclen los datos.
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# _pais_actual guarda el dict de configuración del país activo (o None).
+# Cada request, corrutina o tarea ve SU propio valor: asyncio copia el
+# contexto al crear cada Task y asgiref lo propaga entre sync y async.
+# Los hilos nuevos (ThreadPoolExecutor) arrancan SIN país: para eso están
+# pais() y en_todos_los_paises().
 
-_thread_locals = threading.local()
+_pais_actual: ContextVar[dict | None] = ContextVar('pais_actual', default=None)
 
 
 def get_current_db_alias() -> str:
     """
-    Retorna el alias de la base de datos del país activo en este thread.
+    Retorna el alias de la base de datos del país activo en este contexto.
 
     EXPLICACIÓN PARA PRINCIPIANTES:
     El Database Router llama a esta función para saber a qué BD enviar
@@ -63,7 +78,8 @@ def get_current_db_alias() -> str:
     Returns:
         str: Alias de BD ('mexico', 'argentina', o 'default')
     """
-    return getattr(_thread_locals, 'db_alias', 'default')
+    pais_config = _pais_actual.get()
+    return pais_config['db_alias'] if pais_config else 'default'
 
 
 def get_current_pais_config() -> dict | None:
@@ -75,19 +91,235 @@ def get_current_pais_config() -> dict | None:
     Returns:
         dict con configuración del país, o None
     """
-    return getattr(_thread_locals, 'pais_config', None)
+    return _pais_actual.get()
 
 
 def get_current_pais_codigo() -> str | None:
     """
     Retorna el código ISO del país activo (ej: 'MX', 'AR').
     """
-    return getattr(_thread_locals, 'pais_codigo', None)
+    pais_config = _pais_actual.get()
+    return pais_config['codigo'] if pais_config else None
+
+
+def resolver_pais(identificador) -> dict | None:
+    """
+    Configuración del país a partir de un subdominio, un db_alias o el dict.
+
+    Args:
+        identificador: 'argentina' (subdominio), 'argentina' / 'default'
+            (db_alias) o el dict de PAISES_CONFIG.
+
+    Returns:
+        dict con la configuración del país, o None si no existe.
+    """
+    if isinstance(identificador, dict):
+        return identificador
+    if identificador in PAISES_CONFIG:
+        return PAISES_CONFIG[identificador]
+    for pais_config in PAISES_CONFIG.values():
+        if pais_config['db_alias'] == identificador:
+            return pais_config
+    return None
+
+
+def alias_de_pais(db_alias: str | None) -> str:
+    """
+    db_alias del país dueño de la BD física a la que apunta `db_alias`.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    'default' y 'mexico' son dos alias de la MISMA base de datos (mismo
+    NAME en settings.DATABASES): lo que se escribe desde el shell, un
+    manage.py o una tarea sin país llega con using='default', y los
+    requests de México leen con 'mexico'. Las claves de caché por país
+    deben usar este valor para que ambos caminos compartan contador.
+
+    Args:
+        db_alias: alias de BD ('default', 'mexico', 'argentina'…) o None.
+
+    Returns:
+        str: alias del país ('default' → el de PAIS_DEFAULT).
+    """
+    pais_config = resolver_pais(db_alias or 'default') or PAISES_CONFIG[PAIS_DEFAULT]
+    return pais_config['db_alias']
+
+
+def activar_pais(pais_config: dict):
+    """
+    Fija el país activo y devuelve el token para restaurar el anterior.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Úsalo en pareja con restaurar_pais(token) dentro de un try/finally.
+    En código normal es más cómodo `with pais(...)`.
+    """
+    return _pais_actual.set(pais_config)
+
+
+def restaurar_pais(token) -> None:
+    """Vuelve al país que estaba activo antes de activar_pais()."""
+    _pais_actual.reset(token)
+
+
+class pais(ContextDecorator):
+    """
+    Context manager / decorador que activa un país para el bloque.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Dentro del bloque, el DB Router y get_pais_actual() apuntan al país
+    indicado; al salir (aunque haya error) vuelve el país anterior, así que
+    se pueden anidar. Funciona igual en vistas sync, vistas async, tareas
+    Celery y funciones que corren en un ThreadPoolExecutor.
+
+        with pais('argentina'):
+            ...
+
+        @pais('chile')
+        async def resumen(): ...
+
+    Args:
+        identificador: subdominio, db_alias o dict de configuración.
+
+    Raises:
+        ValueError: si el país no existe en PAISES_CONFIG.
+    """
+
+    def __init__(self, identificador):
+        self.pais_config = resolver_pais(identificador)
+        if self.pais_config is None:
+            raise ValueError(f'País no configurado: {identificador!r}')
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(activar_pais(self.pais_config))
+        return self.pais_config
+
+    def __exit__(self, *exc):
+        restaurar_pais(self._tokens.pop())
+        return False
+
+    def _recreate_cm(self):
+        # Cada llamada a la función decorada usa su propio context manager:
+        # dos hilos llamándola a la vez no comparten la pila de tokens.
+        return pais(self.pais_config)
+
+    def __call__(self, funcion):
+        if iscoroutinefunction(funcion):
+            @wraps(funcion)
+            async def envoltura(*args, **kwargs):
+                with self._recreate_cm():
+                    return await funcion(*args, **kwargs)
+            return envoltura
+        return super().__call__(funcion)
+
+
+# ============================================================================
+# FAN-OUT: la misma función en todos los países, en paralelo
+# ============================================================================
+
+def _ejecutar_en_pais(subdominio, funcion, args, kwargs, cerrar_conexiones):
+    """Corre funcion dentro de pais(subdominio); cierra las conexiones del hilo."""
+    from django.db import connections
+
+    try:
+        with pais(subdominio):
+            return funcion(*args, **kwargs)
+    finally:
+        if cerrar_conexiones:
+            # Cada hilo del pool abre sus propias conexiones: cerrarlas evita
+            # dejar sesiones colgadas en PostgreSQL al terminar el hilo.
+            connections.close_all()
+
+
+def en_todos_los_paises(funcion, *args, paises=None, max_hilos=None, tiempo_limite=None, **kwargs):
+    """
+    Ejecuta `funcion` una vez por país, cada una en su contexto y en paralelo.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Las tareas de Celery Beat revisaban los países uno tras otro; cada BD es
+    independiente, así que se pueden consultar al mismo tiempo. Dentro de
+    `funcion` el ORM ya apunta al país (get_current_db_alias() lo indica).
+    Un país que falla no detiene a los demás: su error se devuelve aparte.
+
+    Args:
+        funcion: callable a ejecutar por país.
+        *args, **kwargs: argumentos para `funcion`.
+        paises (iterable | None): subdominios (o db_alias) a recorrer;
+            None = todos los de PAISES_CONFIG.
+        max_hilos (int | None): hilos simultáneos; None = settings.PAISES_HILOS_MAX.
+            Con 1 se ejecuta en el hilo actual, uno tras otro (útil en tests).
+        tiempo_limite (float | None): segundos máximos de espera. Los países
+            que no terminan a tiempo se devuelven como TimeoutError en
+            `errores`; su hilo sigue corriendo en segundo plano (útil cuando
+            la función guarda su resultado en caché para la próxima vez).
+
+    Returns:
+        tuple[dict, dict]: ({subdominio: resultado}, {subdominio: excepción}).
+    """
+    from django.conf import settings
+
+    paises = list(PAISES_CONFIG if paises is None else paises)
+    if max_hilos is None:
+        max_hilos = getattr(settings, 'PAISES_HILOS_MAX', len(paises))
+    max_hilos = max(1, min(max_hilos, len(paises) or 1))
+
+    resultados, errores = {}, {}
+
+    def _registrar(subdominio, obtener):
+        try:
+            resultados[subdominio] = obtener()
+        except Exception as exc:
+            logger.error('[MULTIPAIS] [%s] %s falló: %s', subdominio,
+                         getattr(funcion, '__name__', funcion), exc, exc_info=True)
+            errores[subdominio] = exc
+
+    if max_hilos == 1:
+        for subdominio in paises:
+            _registrar(subdominio, lambda s=subdominio: _ejecutar_en_pais(s, funcion, args, kwargs, False))
+        return resultados, errores
+
+    pool = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix='pais')
+    futuros = {
+        subdominio: pool.submit(_ejecutar_en_pais, subdominio, funcion, args, kwargs, True)
+        for subdominio in paises
+    }
+    terminados, _pendientes = wait(futuros.values(), timeout=tiempo_limite)
+    # Sin esperar a los que siguen corriendo: terminan solos en su hilo
+    pool.shutdown(wait=False)
+
+    for subdominio, futuro in futuros.items():
+        if futuro in terminados:
+            _registrar(subdominio, futuro.result)
+        else:
+            logger.warning('[MULTIPAIS] [%s] %s sin terminar tras %ss', subdominio,
+                           getattr(funcion, '__name__', funcion), tiempo_limite)
+            errores[subdominio] = TimeoutError(f'{subdominio}: sin respuesta en {tiempo_limite}s')
+    return resultados, errores
+
+
+def sumar_resultados(resultados) -> dict:
+    """
+    Suma por llave los conteos numéricos de varios países.
+
+    Args:
+        resultados: dict {subdominio: dict} (lo que devuelve en_todos_los_paises)
+            o un iterable de dicts.
+
+    Returns:
+        dict: {llave: suma} solo con los valores numéricos.
+    """
+    if isinstance(resultados, dict):
+        resultados = resultados.values()
+    total = {}
+    for resultado in resultados:
+        for llave, valor in (resultado or {}).items():
+            if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+                total[llave] = total.get(llave, 0) + valor
+    return total
 
 
 class PaisMiddleware:
     """
-    Middleware que detecta el país del request y configura thread-locals.
+    Middleware que detecta el país del request y activa el contexto de país.
 
     EXPLICACIÓN PARA PRINCIPIANTES:
     Este middleware se ejecuta en CADA request, antes que cualquier vista.
@@ -95,7 +327,10 @@ class PaisMiddleware:
     1. Leer el subdominio de la URL
     2. Buscar la configuración del país
     3. Guardar esa info para que el resto del sistema la use
-    4. SIEMPRE limpiar la info al terminar (incluso si hay error)
+    4. SIEMPRE restaurar el contexto al terminar (incluso si hay error)
+
+    Sirve tanto en WSGI (Gunicorn con hilos) como en ASGI (vistas async):
+    si la cadena de middlewares es async, Django llama a __acall__.
 
     POSICIÓN EN MIDDLEWARE (settings.py):
     Debe ir DESPUÉS de SessionMiddleware y AuthenticationMiddleware,
@@ -109,6 +344,9 @@ class PaisMiddleware:
     y necesita que el DB Router ya sepa a qué BD ir.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         """
         EXPLICACIÓN PARA PRINCIPIANTES:
@@ -116,6 +354,8 @@ class PaisMiddleware:
         get_response es la función que llama al siguiente middleware o vista.
         """
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
         """
@@ -123,9 +363,9 @@ class PaisMiddleware:
 
         FLUJO:
         1. Detectar país del subdominio
-        2. Configurar thread-locals
+        2. Activar el contexto de país
         3. Procesar request (try)
-        4. SIEMPRE limpiar thread-locals (finally)
+        4. SIEMPRE restaurar el contexto (finally)
 
         BUG CORREGIDO (v2.0):
         La v1.0 hacía esto:
@@ -133,12 +373,52 @@ class PaisMiddleware:
             response = self.get_response(request)  # Si esto explota...
             self._clear_thread_locals()             # ...esto NUNCA se ejecuta
 
-        La v2.0 usa try/finally:
-            self._set_thread_locals(...)
+        Desde la v2.0 se usa try/finally:
+            token = activar_pais(...)
             try:
                 response = self.get_response(request)
             finally:
-                self._clear_thread_locals()  # SIEMPRE se ejecuta
+                restaurar_pais(token)  # SIEMPRE se ejecuta
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        pais_config = self._preparar_request(request)
+        token = activar_pais(pais_config)
+        try:
+            response = self.get_response(request)
+        finally:
+            # SIEMPRE restaurar contexto y zona horaria: sin esto, el
+            # siguiente request atendido por este hilo podría heredar el
+            # país equivocado
+            dj_timezone.deactivate()
+            restaurar_pais(token)
+
+        return response
+
+    async def __acall__(self, request):
+        """
+        Versión async de __call__ (ASGI con vistas async).
+
+        La detección puede leer la sesión (consulta a BD), por eso corre
+        con sync_to_async; el contexto se activa ya en la corrutina.
+        """
+        pais_config = await sync_to_async(self._preparar_request)(request)
+        token = activar_pais(pais_config)
+        try:
+            response = await self.get_response(request)
+        finally:
+            dj_timezone.deactivate()
+            restaurar_pais(token)
+
+        return response
+
+    def _preparar_request(self, request) -> dict:
+        """
+        Detecta el país, lo anota en el request y activa su zona horaria.
+
+        Returns:
+            dict: configuración del país del request.
         """
         # Paso 1: Detectar el país
         pais_subdominio = self._detectar_pais(request)
@@ -153,8 +433,7 @@ class PaisMiddleware:
             pais_subdominio = PAIS_DEFAULT
             pais_config = get_pais_config(PAIS_DEFAULT)
 
-        # Paso 2: Configurar thread-locals y request
-        self._set_thread_locals(pais_config)
+        # Paso 2: Datos del país disponibles en el request
         request.pais_config = pais_config
         request.pais_codigo = pais_config['codigo']
         request.pais_subdominio = pais_subdominio
@@ -168,17 +447,7 @@ class PaisMiddleware:
         tz_nombre = pais_config.get('timezone', 'America/Mexico_City')
         dj_timezone.activate(ZoneInfo(tz_nombre))
 
-        # Paso 3: Procesar request con limpieza garantizada
-        try:
-            response = self.get_response(request)
-        finally:
-            # Paso 4: SIEMPRE limpiar thread-locals y zona horaria activa
-            # Esto es CRÍTICO — sin esto, el siguiente request en este
-            # thread podría heredar datos del país equivocado
-            dj_timezone.deactivate()
-            self._clear_thread_locals()
-
-        return response
+        return pais_config
 
     def _detectar_pais(self, request) -> str:
         """
@@ -245,28 +514,3 @@ class PaisMiddleware:
 
         # No se detectó país → usar default
         return PAIS_DEFAULT
-
-    def _set_thread_locals(self, pais_config: dict):
-        """Guarda la configuración del país en thread-locals."""
-        _thread_locals.pais_codigo = pais_config['codigo']
-        _thread_locals.db_alias = pais_config['db_alias']
-        _thread_locals.pais_config = pais_config
-
-    def _clear_thread_locals(self):
-        """
-        Limpia thread-locals al terminar el request.
-
-        EXPLICACIÓN PARA PRINCIPIANTES:
-        Esto es como borrar la pizarra después de cada clase.
-        Si no lo haces, el siguiente "estudiante" (request) podría
-        ver datos que no le corresponden.
-
-        Usamos hasattr() porque en algunos edge cases el atributo
-        podría no existir (ej: si _set_thread_locals falló a medias).
-        """
-        if hasattr(_thread_locals, 'pais_codigo'):
-            del _thread_locals.pais_codigo
-        if hasattr(_thread_locals, 'db_alias'):
-            del _thread_locals.db_alias
-        if hasattr(_thread_locals, 'pais_config'):
-            del _thread_locals.pais_config
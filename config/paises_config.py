@@ -54,6 +54,7 @@ PAISES_CONFIG = {
         'moneda_simbolo': '$',             # Símbolo para mostrar
         'moneda_nombre': 'Peso Mexicano',
         'moneda_locale': 'es_MX',          # Para formateo con locale
+        'moneda_tipo_cambio_base': 1.0,   # Moneda base de los reportes consolidados (MXN)
 
         # --- Empresa ---
         'empresa_nombre': 'SIC Comercialización y Servicios México SC',
@@ -111,6 +112,7 @@ PAISES_CONFIG = {
         'moneda_simbolo': '$',
         'moneda_nombre': 'Peso Argentino',
         'moneda_locale': 'es_AR',
+        'moneda_tipo_cambio_base': config('TIPO_CAMBIO_ARS_MXN', default=0.0, cast=float),  # MXN por 1 ARS (0 = sin configurar)
 
         # --- Empresa ---
         'empresa_nombre': config('EMPRESA_NOMBRE_AR', default='SIC Argentina (Pendiente Razón Social)'),
@@ -155,6 +157,7 @@ PAISES_CONFIG = {
         'moneda_simbolo': '$',             # Símbolo para mostrar
         'moneda_nombre': 'Peso Chileno',
         'moneda_locale': 'es_CL',          # Para formateo con locale
+        'moneda_tipo_cambio_base': config('TIPO_CAMBIO_CLP_MXN', default=0.0, cast=float),  # MXN por 1 CLP (0 = sin configurar)
 
         # --- Empresa ---
         'empresa_nombre': config('EMPRESA_NOMBRE_CL', default='SIC Chile'),
@@ -199,6 +202,7 @@ PAISES_CONFIG = {
         'moneda_simbolo': '$',             # Símbolo para mostrar
         'moneda_nombre': 'Peso Colombiano',
         'moneda_locale': 'es_CO',          # Para formateo con locale
+        'moneda_tipo_cambio_base': config('TIPO_CAMBIO_COP_MXN', default=0.0, cast=float),  # MXN por 1 COP (0 = sin configurar)
 
         # --- Empresa ---
         'empresa_nombre': config('EMPRESA_NOMBRE_CO', default='SIC Colombia'),
@@ -327,13 +331,36 @@ def formato_moneda(valor: float, pais_config: dict) -> str:
     return f"{simbolo}{valor_formateado} {codigo}".strip()
 
 
+def convertir_a_moneda_base(valor: float, pais_config: dict) -> float | None:
+    """
+    Convierte un importe del país a la moneda base (la del país default, MXN).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Los reportes consolidados suman importes de varios países; sumar pesos
+    argentinos con pesos mexicanos daría un número sin sentido. Cada país
+    trae 'moneda_tipo_cambio_base' (cuántos MXN vale 1 unidad de su moneda).
+
+    Args:
+        valor: Importe en la moneda del país.
+        pais_config: Diccionario de configuración del país.
+
+    Returns:
+        float con el importe en moneda base, o None si el país no tiene
+        tipo de cambio configurado (no se debe sumar a los totales).
+    """
+    tipo_cambio = pais_config.get('moneda_tipo_cambio_base') or 0
+    if tipo_cambio <= 0:
+        return None
+    return round(float(valor) * tipo_cambio, 2)
+
+
 def get_pais_actual() -> dict:
     """
     Obtiene la configuración del país activo en el request actual.
 
     EXPLICACIÓN PARA PRINCIPIANTES:
     Esta función es un ATAJO que se usa mucho en el código.
-    Intenta obtener el país del thread-local (configurado por el middleware),
+    Intenta obtener el país del contexto de país (middleware, tarea o `with pais(...)`),
     y si no lo encuentra (ej: manage.py shell, cron jobs, migrations),
     usa el país por defecto (México).
 
@@ -0,0 +1,386 @@
+"""
+Caché de PDFs generados, direccionado por contenido
+====================================================
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Los generadores de PDF (RHITSO, diagnóstico, formatos OOW/garantía,
+cotizaciones) arman el documento completo con ReportLab en cada llamada.
+La previsualización de una cotización se abre varias veces antes de enviarla
+y luego la tarea de correo vuelve a generar exactamente el mismo PDF.
+
+Este módulo guarda los bytes del PDF en disco bajo una "huella" (hash SHA-256)
+de TODO lo que el generador usa para dibujarlo: columnas de los modelos,
+líneas de la propuesta, configuración vigente, fecha impresa y la versión
+del código del generador. Mientras la huella no cambie, se devuelve el PDF
+guardado sin tocar ReportLab. Si cualquier dato cambia, la huella es otra y
+se genera un PDF nuevo (los viejos se quedan huérfanos y el recorte LRU por
+tamaño total los borra con el tiempo).
+
+Además incluye recursos de imagen que se preparan UNA vez por proceso:
+- PNG → JPG con fondo blanco (logos y diagramas de RHITSO/diagnóstico).
+- PNG de códigos QR.
+
+Uso en un generador:
+    class MiGenerador:
+        VERSION_PLANTILLA_PDF = 1          # subir si cambia el diseño a mano
+
+        def huella_artefacto(self):
+            return calcular_huella('mi_pdf', self, [version_modelo(self.orden), ...])
+
+        @cachear_pdf
+        def generar_pdf(self):
+            ...
+"""
+
+import hashlib
+import inspect
+import io
+import json
+import logging
+import os
+import tempfile
+from functools import lru_cache, wraps
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Subir este número invalida TODOS los PDFs cacheados (cambio transversal).
+VERSION_CACHE_PDF = 1
+
+# Campos del resultado de generar_pdf() que se guardan junto al PDF.
+CAMPOS_META = ('nombre_archivo', 'archivo', 'ruta')
+
+
+# ============================================================================
+# HUELLA DE ENTRADAS
+# ============================================================================
+
+def version_modelo(obj):
+    """
+    Valores de todas las columnas de una instancia (su "versión" real).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    No todos los modelos tienen fecha_actualizacion y un .update() no la
+    cambia; los valores de las columnas sí reflejan exactamente lo que el
+    PDF va a imprimir.
+
+    Args:
+        obj: instancia de modelo o None.
+
+    Returns:
+        list | None: [modelo, BD, pk, valores...] serializable a JSON.
+    """
+    if obj is None:
+        return None
+    return [obj._meta.label, obj._state.db, obj.pk] + [
+        getattr(obj, campo.attname) for campo in obj._meta.concrete_fields
+    ]
+
+
+@lru_cache(maxsize=None)
+def _version_codigo(modulo_archivo):
+    """mtime + tamaño del archivo del generador: un deploy nuevo invalida."""
+    try:
+        info = os.stat(modulo_archivo)
+    except OSError:
+        return None
+    return [info.st_mtime_ns, info.st_size]
+
+
+def calcular_huella(tipo, generador, partes):
+    """
+    SHA-256 de las entradas de un PDF.
+
+    Args:
+        tipo (str): nombre corto del documento (ej. 'cotizacion_cliente').
+        generador: instancia del generador (aporta VERSION_PLANTILLA_PDF y
+            la versión de su código fuente).
+        partes (list): datos serializables que determinan el contenido.
+
+    Returns:
+        str: huella hexadecimal de 64 caracteres.
+    """
+    clase = type(generador)
+    contenido = json.dumps(
+        [
+            VERSION_CACHE_PDF,
+            tipo,
+            getattr(clase, 'VERSION_PLANTILLA_PDF', 1),
+            _version_codigo(inspect.getsourcefile(clase)),
+            partes,
+        ],
+        default=str,
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+
+# ============================================================================
+# ALMACÉN EN DISCO (LRU POR TAMAÑO TOTAL)
+# ============================================================================
+
+def _directorio_cache():
+    """Carpeta del caché: PDF_CACHE_DIR o MEDIA_ROOT/cache/pdf."""
+    return Path(
+        getattr(settings, 'PDF_CACHE_DIR', '')
+        or os.path.join(settings.MEDIA_ROOT, 'cache', 'pdf')
+    )
+
+
+def _rutas(huella):
+    """Rutas del PDF y de sus metadatos (subcarpeta por los 2 primeros caracteres)."""
+    carpeta = _directorio_cache() / huella[:2]
+    return carpeta / f'{huella}.pdf', carpeta / f'{huella}.json'
+
+
+def obtener_artefacto(huella):
+    """
+    PDF guardado para una huella.
+
+    Returns:
+        tuple[bytes, dict] | None: contenido y metadatos, o None si no hay.
+
+    Efectos secundarios:
+        Actualiza el mtime del archivo (marca de "usado hace poco" para el LRU).
+    """
+    ruta_pdf, ruta_meta = _rutas(huella)
+    try:
+        contenido = ruta_pdf.read_bytes()
+        meta = json.loads(ruta_meta.read_text(encoding='utf-8'))
+        os.utime(ruta_pdf)
+    except (OSError, ValueError):
+        return None
+    return contenido, meta
+
+
+def _escribir_atomico(ruta, datos):
+    """Escribe en un temporal de la misma carpeta y lo renombra (sin lecturas a medias)."""
+    fd, temporal = tempfile.mkstemp(dir=ruta.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as archivo:
+            archivo.write(datos)
+        os.replace(temporal, ruta)
+    except Exception:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+
+
+def guardar_artefacto(huella, contenido, meta):
+    """
+    Guarda un PDF bajo su huella y recorta el caché si excede el tamaño.
+
+    Args:
+        huella (str): de calcular_huella().
+        contenido (bytes): PDF completo.
+        meta (dict): nombre de archivo / ruta a devolver en un acierto.
+    """
+    ruta_pdf, ruta_meta = _rutas(huella)
+    try:
+        ruta_pdf.parent.mkdir(parents=True, exist_ok=True)
+        _escribir_atomico(ruta_meta, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        _escribir_atomico(ruta_pdf, contenido)
+    except OSError as exc:
+        logger.warning('[PDF_CACHE] No se pudo guardar %s: %s', huella[:12], exc)
+        return
+    recortar_cache()
+
+
+def recortar_cache(max_bytes=None):
+    """
+    Borra los PDFs usados hace más tiempo hasta quedar bajo el límite.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El mtime de cada PDF se actualiza cuando se sirve desde el caché, así que
+    "más viejo" = "menos usado recientemente" (LRU). Se recorta hasta el 90%
+    del límite para no volver a recortar en la siguiente escritura.
+
+    Args:
+        max_bytes (int | None): límite; None = settings.PDF_CACHE_MAX_MB.
+
+    Returns:
+        int: archivos PDF borrados.
+    """
+    if max_bytes is None:
+        max_bytes = getattr(settings, 'PDF_CACHE_MAX_MB', 512) * 1024 * 1024
+
+    archivos = []
+    total = 0
+    for ruta in _directorio_cache().glob('*/*.pdf'):
+        try:
+            info = ruta.stat()
+        except OSError:
+            continue
+        archivos.append((info.st_mtime_ns, info.st_size, ruta))
+        total += info.st_size
+    if total <= max_bytes:
+        return 0
+
+    objetivo = int(max_bytes * 0.9)
+    borrados = 0
+    for _mtime, tamano, ruta in sorted(archivos):
+        if total <= objetivo:
+            break
+        for archivo in (ruta, ruta.with_suffix('.json')):
+            try:
+                archivo.unlink()
+            except OSError:
+                pass
+        total -= tamano
+        borrados += 1
+    logger.info('[PDF_CACHE] Recorte LRU: %s PDF(s) borrados', borrados)
+    return borrados
+
+
+# ============================================================================
+# DECORADOR PARA generar_pdf()
+# ============================================================================
+
+def _resultado_desde_cache(contenido, meta, huella):
+    """
+    Rehace el dict de generar_pdf() a partir del PDF guardado.
+
+    Los generadores en memoria devuelven 'buffer'; los que escriben a disco
+    devuelven 'ruta' (se vuelve a escribir ahí, las tareas la borran al terminar).
+    """
+    resultado = {'success': True, **meta, 'huella': huella, 'desde_cache': True}
+    if 'ruta' in meta:
+        os.makedirs(os.path.dirname(meta['ruta']), exist_ok=True)
+        with open(meta['ruta'], 'wb') as archivo:
+            archivo.write(contenido)
+        resultado['size'] = len(contenido)
+    else:
+        resultado['buffer'] = io.BytesIO(contenido)
+    return resultado
+
+
+def cachear_pdf(generar_pdf):
+    """
+    Decora generar_pdf() para servir el PDF guardado si la huella no cambió.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El generador debe tener huella_artefacto() (None = no cachear esta vez).
+    Si el caché falla por cualquier motivo, se genera normal: el caché nunca
+    debe impedir obtener el PDF.
+
+    Efectos secundarios:
+        Lee/escribe archivos en el directorio del caché.
+    """
+
+    @wraps(generar_pdf)
+    def envoltura(self):
+        huella = None
+        if getattr(settings, 'PDF_CACHE_ACTIVO', True):
+            try:
+                huella = self.huella_artefacto()
+            except Exception as exc:
+                logger.warning('[PDF_CACHE] Huella no disponible (%s): %s', type(self).__name__, exc)
+
+        if huella:
+            guardado = obtener_artefacto(huella)
+            if guardado is not None:
+                try:
+                    return _resultado_desde_cache(*guardado, huella)
+                except OSError as exc:
+                    logger.warning('[PDF_CACHE] No se pudo servir %s: %s', huella[:12], exc)
+
+        resultado = generar_pdf(self)
+        if not huella or not resultado.get('success'):
+            return resultado
+
+        try:
+            if resultado.get('buffer') is not None:
+                contenido = resultado['buffer'].getvalue()
+            else:
+                with open(resultado['ruta'], 'rb') as archivo:
+                    contenido = archivo.read()
+        except (KeyError, OSError) as exc:
+            logger.warning('[PDF_CACHE] Resultado sin bytes legibles: %s', exc)
+            return resultado
+
+        meta = {campo: resultado[campo] for campo in CAMPOS_META if campo in resultado}
+        guardar_artefacto(huella, contenido, meta)
+        resultado['huella'] = huella
+        return resultado
+
+    return envoltura
+
+
+# ============================================================================
+# RECURSOS DE IMAGEN PREPARADOS UNA VEZ POR PROCESO
+# ============================================================================
+
+@lru_cache(maxsize=64)
+def _jpg_fondo_blanco(ruta, _mtime_ns, _tamano):
+    """
+    Bytes JPG (fondo blanco) de un PNG, o None si el archivo no es PNG.
+
+    mtime y tamaño forman parte de la llave: si el archivo cambia en disco,
+    se vuelve a convertir.
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(ruta) as original:
+        if original.format != 'PNG':
+            return None
+        nueva = PILImage.new('RGB', original.size, (255, 255, 255))
+        if original.mode == 'RGBA':
+            nueva.paste(original, (0, 0), original)
+        else:
+            nueva.paste(original.convert('RGB'), (0, 0))
+    salida = io.BytesIO()
+    nueva.save(salida, 'JPEG', quality=90)
+    nueva.close()
+    return salida.getvalue()
+
+
+def imagen_sin_transparencia(ruta):
+    """
+    Imagen lista para canvas.drawImage: PNG → JPG con fondo blanco, cacheado.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    ReportLab a veces dibuja mal los PNG transparentes. Antes cada PDF volvía
+    a convertir el logo y el diagrama a un JPG temporal; ahora la conversión
+    se hace una vez por proceso y se dibuja desde memoria.
+
+    Args:
+        ruta (str): ruta de la imagen en disco.
+
+    Returns:
+        ImageReader: lector de ReportLab (JPG convertido o el archivo original).
+    """
+    from reportlab.lib.utils import ImageReader
+
+    info = os.stat(ruta)
+    jpg = _jpg_fondo_blanco(ruta, info.st_mtime_ns, info.st_size)
+    return ImageReader(io.BytesIO(jpg) if jpg is not None else ruta)
+
+
+@lru_cache(maxsize=32)
+def qr_png(datos, box_size=4, border=1):
+    """
+    PNG de un código QR, generado una vez por proceso para los mismos datos.
+
+    Args:
+        datos (str): texto/URL a codificar.
+        box_size (int): píxeles por módulo.
+        border (int): módulos de margen.
+
+    Returns:
+        bytes: imagen PNG.
+
+    Raises:
+        ImportError: si la librería qrcode no está instalada.
+    """
+    import qrcode
+
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=border)
+    qr.add_data(datos)
+    qr.make(fit=True)
+    salida = io.BytesIO()
+    qr.make_image(fill_color='black', back_color='white').save(salida, format='PNG')
+    return salida.getvalue()
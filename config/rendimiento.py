@@ -0,0 +1,454 @@
+"""
+Medición de rendimiento por request y por tarea Celery
+======================================================
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Los caminos N+1 (una consulta por fila en un dashboard o en el detalle de
+una orden) no se ven en el código: se notan cuando el usuario se queja de
+que "tarda". Este módulo mide, para una muestra de requests y tareas:
+
+- Consultas SQL: cuántas, cuánto tiempo, cuántas idénticas repetidas y cuál
+  es la consulta que más veces se repite (la firma típica de un N+1).
+- Tiempo de plantillas (render de Django templates).
+- Tiempo en HTTP externo (urllib: SICSER, Ollama, Gemini).
+- Aciertos y fallos de caché.
+
+Con eso:
+1. `MedicionRendimientoMiddleware` agrega el header `Server-Timing` (se ve en
+   la pestaña Network del navegador; solo para staff o con DEBUG) y escribe en el log `rendimiento` los
+   requests lentos o con demasiadas consultas, en JSON de una línea.
+2. Las señales de Celery (config/celery.py) hacen lo mismo con las tareas.
+   El formato JSON está en config/logging_formatters.py (RendimientoFormatter).
+3. `presupuesto_consultas(n)` fija cuántas consultas puede hacer una vista
+   o un bloque de código (decorador o `with`); en tests se usa estricto.
+
+¿POR QUÉ ES BARATO?
+- Solo se mide una fracción de los requests (RENDIMIENTO_MUESTREO).
+- Fuera de la muestra, los ganchos de plantillas/HTTP/caché solo leen una
+  ContextVar vacía y siguen de largo; las consultas no se envuelven.
+- No se guarda el SQL de cada consulta: solo un contador por texto SQL.
+
+Uso:
+    @presupuesto_consultas(8)
+    def api_encuestas_paneles(request): ...
+
+    with presupuesto_consultas(3, estricto=True):
+        self.client.get(url)
+"""
+
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ContextDecorator, ExitStack
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('rendimiento')
+
+# Medición activa del request/tarea actual (None = no se está midiendo)
+_medicion_actual: ContextVar['Medicion | None'] = ContextVar('medicion_rendimiento', default=None)
+
+# Mediciones de tareas Celery en curso (task_id → (medicion, pila, token))
+_MEDICIONES_TAREA = {}
+
+_ganchos_instalados = False
+
+
+def _config(nombre, default):
+    return getattr(settings, nombre, default)
+
+
+# ============================================================================
+# CONTADOR DE CONSULTAS (execute_wrapper de Django)
+# ============================================================================
+
+class ContadorConsultas:
+    """
+    Envoltura de `connection.execute_wrapper` que cuenta y cronometra.
+
+    EXPLICACIÓN: Django llama a esta función en lugar de ejecutar el SQL
+    directamente; nosotros medimos y llamamos a `execute` para seguir.
+    """
+
+    __slots__ = ('total', 'ms', 'por_sql', 'exactas')
+
+    def __init__(self):
+        self.total = 0
+        self.ms = 0.0
+        self.por_sql = Counter()
+        self.exactas = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.ms += (time.perf_counter() - inicio) * 1000
+            self.total += 1
+            self.por_sql[sql] += 1
+            self.exactas[hash((sql, repr(params)))] += 1
+
+    @property
+    def duplicadas(self):
+        """Consultas idénticas (mismo SQL y parámetros) repetidas."""
+        return sum(veces - 1 for veces in self.exactas.values())
+
+    def mas_repetida(self):
+        """(sql, veces) de la consulta con más ejecuciones, o (None, 0)."""
+        if not self.por_sql:
+            return None, 0
+        return self.por_sql.most_common(1)[0]
+
+    def envolver_conexiones(self, pila):
+        """Instala el contador en todas las BD (un país puede usar otra)."""
+        for alias in connections:
+            pila.enter_context(connections[alias].execute_wrapper(self))
+
+
+# ============================================================================
+# MEDICIÓN DE UN REQUEST / TAREA
+# ============================================================================
+
+class Medicion:
+    """Acumula consultas, tiempos y caché de un request o tarea."""
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.inicio = time.perf_counter()
+        self.consultas = ContadorConsultas()
+        self.plantillas_ms = 0.0
+        self.http_ms = 0.0
+        self.http_llamadas = 0
+        self.cache_aciertos = 0
+        self.cache_fallos = 0
+        self.total_ms = None
+        self._profundidad_plantilla = 0
+
+    def terminar(self):
+        self.total_ms = (time.perf_counter() - self.inicio) * 1000
+        return self
+
+    def server_timing(self):
+        """Valor del header Server-Timing (ms con un decimal)."""
+        c = self.consultas
+        return ', '.join([
+            f'db;dur={c.ms:.1f};desc="{c.total} consultas, {c.duplicadas} duplicadas"',
+            f'tpl;dur={self.plantillas_ms:.1f}',
+            f'http;dur={self.http_ms:.1f};desc="{self.http_llamadas} llamadas"',
+            f'cache;desc="{self.cache_aciertos} aciertos, {self.cache_fallos} fallos"',
+            f'total;dur={self.total_ms:.1f}',
+        ])
+
+    def como_dict(self):
+        sql, veces = self.consultas.mas_repetida()
+        return {
+            'nombre': self.nombre,
+            'total_ms': round(self.total_ms or 0, 1),
+            'consultas': self.consultas.total,
+            'consultas_ms': round(self.consultas.ms, 1),
+            'duplicadas': self.consultas.duplicadas,
+            'sql_mas_repetido': (sql or '')[:300],
+            'sql_mas_repetido_veces': veces,
+            'plantillas_ms': round(self.plantillas_ms, 1),
+            'http_ms': round(self.http_ms, 1),
+            'http_llamadas': self.http_llamadas,
+            'cache_aciertos': self.cache_aciertos,
+            'cache_fallos': self.cache_fallos,
+        }
+
+    def es_lenta(self):
+        """¿Supera el umbral de tiempo o de consultas?"""
+        return (
+            self.total_ms >= _config('RENDIMIENTO_UMBRAL_LENTO_MS', 1000)
+            or self.consultas.total >= _config('RENDIMIENTO_UMBRAL_CONSULTAS', 100)
+        )
+
+
+def medicion_actual():
+    """Medición activa en este contexto (None si no se está midiendo)."""
+    return _medicion_actual.get()
+
+
+def iniciar_medicion(nombre):
+    """
+    Empieza a medir en el contexto actual.
+
+    Returns:
+        (medicion, pila, token): pasar a finalizar_medicion al terminar.
+    """
+    instalar_ganchos()
+    medicion = Medicion(nombre)
+    pila = ExitStack()
+    medicion.consultas.envolver_conexiones(pila)
+    token = _medicion_actual.set(medicion)
+    return medicion, pila, token
+
+
+def finalizar_medicion(medicion, pila, token, **extra):
+    """
+    Deja de medir y, si fue lenta, la escribe en el log `rendimiento`.
+
+    Args:
+        extra: datos para el log (método, ruta, status, etc.).
+    """
+    pila.close()
+    try:
+        _medicion_actual.reset(token)
+    except ValueError:
+        # Token de otro contexto (tareas en pool de hilos/greenlets)
+        _medicion_actual.set(None)
+    medicion.terminar()
+    if medicion.es_lenta():
+        datos = {**medicion.como_dict(), **extra}
+        logger.warning('Lento: %s', medicion.nombre, extra={'rendimiento': datos})
+    return medicion
+
+
+def debe_medir():
+    """Sorteo de la muestra (RENDIMIENTO_MUESTREO entre 0 y 1)."""
+    muestreo = _config('RENDIMIENTO_MUESTREO', 0)
+    return muestreo >= 1 or (muestreo > 0 and random.random() < muestreo)
+
+
+# ============================================================================
+# GANCHOS: plantillas, HTTP externo y caché
+# ============================================================================
+#
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# Django no avisa cuánto tarda una plantilla ni si la caché acertó, así que
+# se envuelven (una sola vez, al arrancar) los métodos que hacen ese trabajo.
+# Cada envoltura mira la ContextVar: si no hay medición, llama al original
+# sin hacer nada más.
+
+def _envolver_render(render):
+    @wraps(render)
+    def render_medido(self, *args, **kwargs):
+        medicion = _medicion_actual.get()
+        if medicion is None:
+            return render(self, *args, **kwargs)
+        # Solo la plantilla más externa: una render_to_string dentro de otra
+        # no se cuenta dos veces
+        medicion._profundidad_plantilla += 1
+        inicio = time.perf_counter()
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            medicion._profundidad_plantilla -= 1
+            if medicion._profundidad_plantilla == 0:
+                medicion.plantillas_ms += (time.perf_counter() - inicio) * 1000
+    return render_medido
+
+
+def _envolver_http(abrir):
+    @wraps(abrir)
+    def abrir_medido(self, *args, **kwargs):
+        medicion = _medicion_actual.get()
+        if medicion is None:
+            return abrir(self, *args, **kwargs)
+        inicio = time.perf_counter()
+        try:
+            return abrir(self, *args, **kwargs)
+        finally:
+            medicion.http_ms += (time.perf_counter() - inicio) * 1000
+            medicion.http_llamadas += 1
+    return abrir_medido
+
+
+def _envolver_cache_get(get):
+    @wraps(get)
+    def get_medido(self, key, default=None, *args, **kwargs):
+        valor = get(self, key, default, *args, **kwargs)
+        medicion = _medicion_actual.get()
+        if medicion is not None:
+            if valor is default:
+                medicion.cache_fallos += 1
+            else:
+                medicion.cache_aciertos += 1
+        return valor
+    return get_medido
+
+
+def _envolver_cache_get_many(get_many):
+    @wraps(get_many)
+    def get_many_medido(self, keys, *args, **kwargs):
+        keys = list(keys)
+        valores = get_many(self, keys, *args, **kwargs)
+        medicion = _medicion_actual.get()
+        if medicion is not None:
+            medicion.cache_aciertos += len(valores)
+            medicion.cache_fallos += len(keys) - len(valores)
+        return valores
+    return get_many_medido
+
+
+def _clases_cache():
+    """Clases de backend de caché configuradas (más LocMem, usada en tests)."""
+    from django.core.cache.backends.locmem import LocMemCache
+    from django.utils.module_loading import import_string
+
+    clases = {LocMemCache}
+    for opciones in settings.CACHES.values():
+        try:
+            clases.add(import_string(opciones['BACKEND']))
+        except ImportError:
+            pass
+    return clases
+
+
+def instalar_ganchos():
+    """Envuelve render/urlopen/caché una sola vez por proceso."""
+    global _ganchos_instalados
+    if _ganchos_instalados:
+        return
+    _ganchos_instalados = True
+
+    import urllib.request
+
+    from django.template.backends.django import Template
+
+    Template.render = _envolver_render(Template.render)
+    urllib.request.OpenerDirector.open = _envolver_http(urllib.request.OpenerDirector.open)
+    for clase in _clases_cache():
+        if 'get' in vars(clase):
+            clase.get = _envolver_cache_get(clase.get)
+        if 'get_many' in vars(clase):
+            clase.get_many = _envolver_cache_get_many(clase.get_many)
+
+
+# ============================================================================
+# MIDDLEWARE
+# ============================================================================
+
+class MedicionRendimientoMiddleware:
+    """
+    Mide una muestra de requests: Server-Timing + log de los lentos.
+
+    POSICIÓN EN MIDDLEWARE (settings.py): la PRIMERA, para que el tiempo
+    total incluya a los demás middlewares (sesión, usuario, país).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        instalar_ganchos()
+
+    def __call__(self, request):
+        if not debe_medir():
+            return self.get_response(request)
+
+        medicion, pila, token = iniciar_medicion(request.path)
+        status = None
+        try:
+            response = self.get_response(request)
+            status = response.status_code
+        finally:
+            match = getattr(request, 'resolver_match', None)
+            finalizar_medicion(
+                medicion, pila, token,
+                metodo=request.method,
+                ruta=request.path,
+                vista=match.view_name if match else '',
+                status=status,
+            )
+
+        if _config('RENDIMIENTO_SERVER_TIMING', True) and _puede_ver_server_timing(request):
+            response['Server-Timing'] = medicion.server_timing()
+        return response
+
+
+def _puede_ver_server_timing(request):
+    """
+    ¿Se le manda el header Server-Timing a quien hizo el request?
+
+    Cuenta consultas y tiempos internos: solo lo ven usuarios staff (o
+    cualquiera con DEBUG encendido), nunca anónimos ni páginas públicas
+    como la encuesta de feedback. El log de lentos no depende de esto.
+    """
+    if settings.DEBUG:
+        return True
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+# ============================================================================
+# CELERY (conectado desde config/celery.py)
+# ============================================================================
+
+def iniciar_medicion_tarea(task_id, nombre_tarea):
+    """task_prerun: empieza a medir la tarea si cae en la muestra."""
+    if debe_medir():
+        _MEDICIONES_TAREA[task_id] = iniciar_medicion(nombre_tarea)
+
+
+def finalizar_medicion_tarea(task_id, estado):
+    """task_postrun: termina la medición (si la hubo) y la registra si fue lenta."""
+    datos = _MEDICIONES_TAREA.pop(task_id, None)
+    if datos is None:
+        return None
+    return finalizar_medicion(*datos, tarea_id=task_id, estado=estado)
+
+
+# ============================================================================
+# PRESUPUESTO DE CONSULTAS
+# ============================================================================
+
+class PresupuestoConsultasExcedido(AssertionError):
+    """Una vista o bloque hizo más consultas que su presupuesto."""
+
+
+class presupuesto_consultas(ContextDecorator):
+    """
+    Límite de consultas SQL para una vista o bloque de código.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Si el código hace más de `maximo` consultas:
+    - estricto=True (o RENDIMIENTO_PRESUPUESTO_ESTRICTO): lanza
+      PresupuestoConsultasExcedido con la consulta más repetida. Para tests.
+    - si no: escribe una advertencia en el log `rendimiento` y sigue.
+
+    A diferencia de assertNumQueries (número exacto), es un techo: la vista
+    puede mejorar sin romper el test.
+
+    Args:
+        maximo (int): consultas permitidas.
+        estricto (bool|None): None = usar el setting.
+    """
+
+    def __init__(self, maximo, estricto=None):
+        self.maximo = maximo
+        self.estricto = estricto
+        self.consultas = None
+
+    def _recreate_cm(self):
+        # Como decorador, cada llamada usa su propio contador (requests
+        # concurrentes no comparten la instancia)
+        return type(self)(self.maximo, self.estricto)
+
+    def __enter__(self):
+        self.consultas = ContadorConsultas()
+        self._pila = ExitStack()
+        self.consultas.envolver_conexiones(self._pila)
+        return self
+
+    def __exit__(self, tipo_error, error, traza):
+        self._pila.close()
+        if tipo_error is not None or self.consultas.total <= self.maximo:
+            return False
+
+        sql, veces = self.consultas.mas_repetida()
+        mensaje = (
+            f'{self.consultas.total} consultas (presupuesto {self.maximo}); '
+            f'la más repetida ({veces} veces): {(sql or "")[:300]}'
+        )
+        estricto = self.estricto
+        if estricto is None:
+            estricto = _config('RENDIMIENTO_PRESUPUESTO_ESTRICTO', False)
+        if estricto:
+            raise PresupuestoConsultasExcedido(mensaje)
+        logger.warning('Presupuesto de consultas excedido: %s', mensaje)
+        return False
+
@@ -126,6 +126,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Medición de rendimiento por muestreo (Server-Timing + log de lentos).
+    # Va PRIMERO para que el tiempo total incluya a todos los demás.
+    'config.rendimiento.MedicionRendimientoMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -289,6 +292,14 @@ else:
 
 DATABASE_ROUTERS = ['config.db_router.PaisDBRouter']
 
+# Hilos con los que en_todos_los_paises() (config/middleware_pais.py) consulta
+# las BDs de los países a la vez. 1 = uno tras otro en el hilo actual.
+PAISES_HILOS_MAX = config('PAISES_HILOS_MAX', default=4, cast=int)
+
+# Segundos que el dashboard consolidado espera a cada país antes de mostrarlo
+# como "sin datos" (el país lento termina en segundo plano y queda en caché).
+DASHBOARD_CONSOLIDADO_TIEMPO_LIMITE = config('DASHBOARD_CONSOLIDADO_TIEMPO_LIMITE', default=20, cast=float)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -408,6 +419,14 @@ else:
     # Desarrollo: Usa el directorio temporal del sistema (/tmp en Linux, %TEMP% en Windows)
     FILE_UPLOAD_TEMP_DIR = None  # Django usará tempfile.gettempdir() automáticamente
 
+# Subidas reanudables de video (servicio_tecnico/services/subidas_reanudables.py)
+# El navegador manda el video en bloques que se agregan directo a un .part en
+# disco: la memoria no depende del tamaño y un corte de Wi-Fi no obliga a
+# empezar de cero. Deben estar en el mismo disco que MEDIA_ROOT (se mueven, no se copian).
+SUBIDAS_REANUDABLES_DIR = config('SUBIDAS_REANUDABLES_DIR', default='')  # vacío = MEDIA_ROOT/video_tmp/subidas
+SUBIDA_BLOQUE_MAX_MB = config('SUBIDA_BLOQUE_MAX_MB', default=8, cast=int)  # por PATCH (< límite de Cloudflare)
+SUBIDAS_EXPIRACION_HORAS = config('SUBIDAS_EXPIRACION_HORAS', default=24, cast=int)  # luego se borran
+
 # Límite de campos por request (incluye archivos múltiples)
 # Configurado para soportar hasta 50 archivos simultáneos + campos del formulario
 # Valor por defecto de Django: 1000
@@ -425,6 +444,26 @@ EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')  # Leer desde .e
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='Score Card System <noreply@example.com>')
 SERVER_EMAIL = DEFAULT_FROM_EMAIL
 
+# ── Bandeja de salida y pool SMTP (notificaciones/correo_service.py) ──
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# Cada proceso de Celery guarda hasta CORREO_POOL_CONEXIONES sesiones SMTP
+# abiertas y las reutiliza mientras no pasen CORREO_CONEXION_MAX_SEGUNDOS
+# (los relays cierran sesiones ociosas). El worker de la bandeja manda lotes
+# de CORREO_LOTE correos por sesión, respeta un máximo por minuto y dominio
+# destino, y reintenta con espera creciente (base × 2^intento).
+CORREO_POOL_CONEXIONES = config('CORREO_POOL_CONEXIONES', default=2, cast=int)
+CORREO_CONEXION_MAX_SEGUNDOS = config('CORREO_CONEXION_MAX_SEGUNDOS', default=240, cast=int)
+CORREO_LOTE = config('CORREO_LOTE', default=25, cast=int)
+CORREO_LIMITE_POR_MINUTO_DOMINIO = config('CORREO_LIMITE_POR_MINUTO_DOMINIO', default=60, cast=int)
+CORREO_LIMITES_DOMINIO = {
+    # Dominios con cupo propio (correos por minuto); el resto usa el default
+    'gmail.com': 30,
+    'hotmail.com': 20,
+    'outlook.com': 20,
+}
+CORREO_MAX_INTENTOS = config('CORREO_MAX_INTENTOS', default=5, cast=int)
+CORREO_REINTENTO_BASE_SEGUNDOS = config('CORREO_REINTENTO_BASE_SEGUNDOS', default=60, cast=int)
+
 # Email del Jefe de Calidad (usado en notificaciones de Score Card)
 JEFE_CALIDAD_EMAIL = config('JEFE_CALIDAD_EMAIL', default='calidad@example.com')
 JEFE_CALIDAD_NOMBRE = config('JEFE_CALIDAD_NOMBRE', default='Jefe de Calidad')
@@ -522,7 +561,9 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=False, cast=bool)
 
 # Tiempo máximo que una tarea puede tardar antes de ser cancelada (segundos)
-# Evita tareas colgadas que bloqueen el Worker indefinidamente
+# Evita tareas colgadas que bloqueen el Worker indefinidamente.
+# Es solo el respaldo: cada cola (media, ai, mail, default, beat) fija sus
+# propios límites en config/colas_celery.py.
 CELERY_TASK_SOFT_TIME_LIMIT = 300   # 5 minutos: aviso de timeout
 CELERY_TASK_TIME_LIMIT = 600        # 10 minutos: cancelación forzada
 
@@ -569,6 +610,30 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'almacen.verificar_vigencia_cotizaciones',
         'schedule': crontab(hour=8, minute=0),  # Diario a las 8:00 AM
     },
+    # ── Espejo local de SICSER ──────────────────────────────────────────────
+    # Cada 5 minutos descarga los listados OOW y garantía de SICSER y
+    # actualiza OrdenSicserEspejo en todas las BDs de país (solo filas que
+    # cambiaron). La pantalla «Consultar SICSER» lee de este espejo.
+    'sincronizar-espejo-sicser': {
+        'task': 'servicio_tecnico.sincronizar_espejo_sicser',
+        'schedule': crontab(minute='*/5'),
+    },
+    # ── Bandeja de salida de correos ────────────────────────────────────────
+    # Red de seguridad: encolar un correo ya despierta al worker; este barrido
+    # cada minuto recoge reintentos con backoff y cupos por dominio vencidos.
+    'procesar-bandeja-correo': {
+        'task': 'notificaciones.procesar_bandeja_correo',
+        'schedule': 60,
+    },
+    # ── Subidas interrumpidas ───────────────────────────────────────────────
+    # Diario 3:00 AM. Borra subidas reanudables abandonadas, videos crudos sin
+    # comprimir y temporales de Django con más de SUBIDAS_EXPIRACION_HORAS
+    # (antes lo hacía scripts/mantenimiento/limpiar_uploads_temp.sh por cron),
+    # y las exportaciones Excel de cada país con el enlace ya vencido.
+    'limpiar-subidas-temporales': {
+        'task': 'servicio_tecnico.limpiar_subidas_temporales',
+        'schedule': crontab(hour=3, minute=0),
+    },
 }
 
 # ============================================================================
@@ -606,6 +671,41 @@ CACHES = {
 CACHE_TTL_DASHBOARD = 60 * 10   # 10 minutos — dashboards Plotly pesados
 CACHE_TTL_LISTA = 60 * 5        # 5 minutos — listados de órdenes
 CACHE_TTL_ML = 60 * 30          # 30 minutos — predicciones ML (cambian poco)
+CACHE_TTL_FRAGMENTOS_ORDEN = 60 * 60 * 24  # 24 h — fragmentos del detalle de orden (se invalidan por versión)
+CACHE_TTL_AUTORIZACION = 60 * 30  # 30 min — grupos/permisos por usuario (se invalidan por versión)
+CACHE_TTL_PROYECCION_RHITSO = 60 * 10  # 10 min — filas del dashboard/Excel RHITSO (se invalidan por versión)
+CACHE_TTL_INDICES_TEXTO = 60 * 10  # 10 min — índices en memoria de gamas/componentes (se invalidan por versión)
+CACHE_TTL_PANELES_FEEDBACK = 60 * 10  # 10 min — paneles de encuestas/feedback de rechazo (se invalidan por versión)
+CACHE_TTL_RESUMEN_COBRO = 60 * 10  # 10 min — saldos de cobro por orden en listas y bandeja de pagos (se invalidan por versión)
+
+# Medición de rendimiento (config/rendimiento.py)
+# Fracción de requests/tareas Celery que se miden (0 = apagado, 1 = todos)
+RENDIMIENTO_MUESTREO = config('RENDIMIENTO_MUESTREO', default=0.05, cast=float)
+# A partir de cuánto se escribe en logs/rendimiento.log
+RENDIMIENTO_UMBRAL_LENTO_MS = config('RENDIMIENTO_UMBRAL_LENTO_MS', default=1000, cast=int)
+RENDIMIENTO_UMBRAL_CONSULTAS = config('RENDIMIENTO_UMBRAL_CONSULTAS', default=100, cast=int)
+# Header Server-Timing en los requests medidos de usuarios staff (pestaña Network del navegador)
+RENDIMIENTO_SERVER_TIMING = config('RENDIMIENTO_SERVER_TIMING', default=True, cast=bool)
+# @presupuesto_consultas: True = error al excederlo (útil en desarrollo); False = solo log
+RENDIMIENTO_PRESUPUESTO_ESTRICTO = config('RENDIMIENTO_PRESUPUESTO_ESTRICTO', default=False, cast=bool)
+
+# Admin: desde cuántas filas la paginación usa la estimación de PostgreSQL
+# (pg_class.reltuples) en vez de COUNT(*) — ver config/admin_rendimiento.py
+ADMIN_CONTEO_ESTIMADO_DESDE = 100_000
+
+# Caché de PDFs generados (config/pdf_cache.py). La llave es la huella de las
+# entradas del PDF, así que no caduca por tiempo: solo se recorta por tamaño
+# (se borran los menos usados cuando la carpeta pasa de PDF_CACHE_MAX_MB).
+PDF_CACHE_ACTIVO = config('PDF_CACHE_ACTIVO', default=True, cast=bool)
+PDF_CACHE_DIR = config('PDF_CACHE_DIR', default='')  # vacío = MEDIA_ROOT/cache/pdf
+PDF_CACHE_MAX_MB = config('PDF_CACHE_MAX_MB', default=512, cast=int)
+
+# Imágenes QR de productos de inventario (inventario/qr_productos.py): caché en
+# disco por contenido del código (no caduca: el código de un producto no cambia).
+QR_CACHE_DIR = config('QR_CACHE_DIR', default='')  # vacío = MEDIA_ROOT/cache/qr
+QR_CACHE_MAX_AGE = 60 * 60 * 24  # 1 día — Cache-Control del navegador para /productos/<id>/qr/
+QR_HILOS_MAX = config('QR_HILOS_MAX', default=4, cast=int)  # hilos al generar QR de una hoja de etiquetas
+ETIQUETAS_QR_MAX = 500  # etiquetas máximas por PDF (~21 hojas carta)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -651,6 +751,10 @@ LOGGING = {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        'rendimiento_json': {
+            # Una línea JSON por request/tarea lenta (config/rendimiento.py)
+            '()': 'config.logging_formatters.RendimientoFormatter',
+        },
     },
     'filters': {
         'require_debug_false': {
@@ -696,6 +800,15 @@ LOGGING = {
             'formatter': 'verbose',
             'encoding': 'utf-8',  # UTF-8 para soportar emojis y caracteres especiales
         },
+        'file_rendimiento': {
+            'level': 'WARNING',
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': LOGS_DIR / 'rendimiento.log',
+            'maxBytes': 10 * 1024 * 1024,  # 10 MB
+            'backupCount': 3,
+            'formatter': 'rendimiento_json',
+            'encoding': 'utf-8',
+        },
     },
     'loggers': {
         # Logger principal de Django - captura todos los errores
@@ -732,6 +845,12 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        # Requests/tareas lentas o con demasiadas consultas (JSON por línea)
+        'rendimiento': {
+            'handlers': ['file_rendimiento'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
     'root': {
         'handlers': ['console', 'file_errors'],
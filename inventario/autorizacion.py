@@ -0,0 +1,229 @@
+"""
+Foto de autorización por usuario (grupos, permisos y datos del empleado).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+En cada petición varios lugares preguntan lo mismo sobre el usuario:
+- ForcePasswordChangeMiddleware: ¿su empleado ya configuró la contraseña?
+- permission_tags (navbar de base.html): ¿en qué grupos está?
+- Los decoradores permission_required_with_message: ¿tiene este permiso?
+
+Antes cada uno hacía su propia consulta. Ahora se arma UNA foto
+(SnapshotAutorizacion) con todo eso, se guarda en la caché (Redis) y se
+comparte: dentro de la petición se memoriza en el objeto user, y entre
+peticiones se lee de la caché.
+
+¿Cómo se entera la caché de que algo cambió?
+La clave incluye dos versiones: una por usuario y una global. Los signals de
+inventario/signals.py las incrementan cuando cambian los grupos o permisos
+del usuario, su Empleado, o los permisos de un grupo (versión global, porque
+afecta a todos sus miembros). No hay que borrar claves una por una.
+
+Efectos secundarios:
+- Lee/escribe la caché por defecto (Redis en producción).
+"""
+
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.middleware_pais import alias_de_pais
+
+# Respaldo: aunque nadie incremente la versión, la foto caduca sola.
+AUTORIZACION_TTL = getattr(settings, 'CACHE_TTL_AUTORIZACION', 60 * 30)
+
+# Atributo del objeto user donde se memoriza la foto durante la petición
+_ATRIBUTO_MEMO = '_snapshot_autorizacion'
+
+_CLAVE_VERSION_GLOBAL = 'autorizacion:version:global'
+
+
+@dataclass(frozen=True)
+class SnapshotAutorizacion:
+    """
+    Lo que los permisos y el navbar necesitan saber del usuario.
+
+    Attributes:
+        autenticado: False solo para la foto de AnonymousUser.
+        activo / es_staff / es_superusuario: flags del User.
+        grupos: nombres de grupo ordenados alfabéticamente.
+        permisos: 'app_label.codename' efectivos (propios + de sus grupos).
+        empleado_id / sucursal_id / rol: del Empleado (None si no tiene).
+        contrasena_configurada: Empleado.contraseña_configurada
+            (True si no tiene Empleado: no hay nada que forzar).
+    """
+
+    autenticado: bool
+    activo: bool = False
+    es_staff: bool = False
+    es_superusuario: bool = False
+    grupos: tuple = ()
+    permisos: frozenset = frozenset()
+    empleado_id: int | None = None
+    sucursal_id: int | None = None
+    rol: str | None = None
+    contrasena_configurada: bool = True
+
+    @property
+    def tiene_empleado(self):
+        return self.empleado_id is not None
+
+    def tiene_permiso(self, perm):
+        """Mismo resultado que user.has_perm(perm) con ModelBackend."""
+        if not self.activo:
+            return False
+        return self.es_superusuario or perm in self.permisos
+
+    def tiene_algun_grupo(self, *nombres):
+        return bool(set(self.grupos).intersection(nombres))
+
+
+SNAPSHOT_ANONIMO = SnapshotAutorizacion(autenticado=False)
+
+
+def _version_inicial():
+    """Versión basada en el reloj (ver detalle_orden_cache._version_inicial)."""
+    return int(time.time() * 1000)
+
+
+def _clave_version_usuario(db_alias, user_id):
+    # 'default' y 'mexico' son la misma BD: un solo contador para ambos
+    return f'autorizacion:version:{alias_de_pais(db_alias)}:{user_id}'
+
+
+def _leer_versiones(*claves):
+    """Versiones actuales de los contadores (un solo viaje a Redis); crea las que falten."""
+    versiones = cache.get_many(claves)
+    for clave in claves:
+        if versiones.get(clave) is None:
+            version = _version_inicial()
+            if not cache.add(clave, version, None):
+                # Otra petición lo creó al mismo tiempo: usamos el suyo.
+                version = cache.get(clave, version)
+            versiones[clave] = version
+    return [versiones[clave] for clave in claves]
+
+
+def _incrementar(clave):
+    try:
+        cache.incr(clave)
+    except ValueError:
+        # No existía: cualquier valor nuevo invalida lo que hubiera.
+        cache.set(clave, _version_inicial(), None)
+
+
+def _clave_snapshot(user):
+    db_alias = alias_de_pais(user._state.db)
+    version_usuario, version_global = _leer_versiones(
+        _clave_version_usuario(db_alias, user.pk), _CLAVE_VERSION_GLOBAL,
+    )
+    return f'autorizacion:snapshot:{db_alias}:{user.pk}:{version_usuario}:{version_global}'
+
+
+def construir_snapshot(user):
+    """
+    Arma la foto consultando la BD (sin caché).
+
+    Args:
+        user: User autenticado.
+
+    Returns:
+        SnapshotAutorizacion
+    """
+    from .models import Empleado
+
+    empleado = (
+        Empleado.objects.using(user._state.db or 'default')
+        .filter(user_id=user.pk)
+        .values('pk', 'sucursal_id', 'rol', 'contraseña_configurada')
+        .first()
+    )
+    return SnapshotAutorizacion(
+        autenticado=True,
+        activo=user.is_active,
+        es_staff=user.is_staff,
+        es_superusuario=user.is_superuser,
+        grupos=tuple(sorted(user.groups.values_list('name', flat=True))),
+        permisos=frozenset(user.get_all_permissions()) if user.is_active else frozenset(),
+        empleado_id=empleado['pk'] if empleado else None,
+        sucursal_id=empleado['sucursal_id'] if empleado else None,
+        rol=empleado['rol'] if empleado else None,
+        contrasena_configurada=empleado['contraseña_configurada'] if empleado else True,
+    )
+
+
+def obtener_snapshot(user):
+    """
+    Foto de autorización del usuario: memoria de la petición → caché → BD.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El middleware, los template tags y los decoradores reciben el mismo
+    objeto request.user, así que la primera llamada deja la foto pegada a
+    ese objeto y las demás la reutilizan sin tocar Redis.
+
+    Args:
+        user: request.user (User o AnonymousUser).
+
+    Returns:
+        SnapshotAutorizacion (SNAPSHOT_ANONIMO si no hay sesión).
+    """
+    if user is None or not user.is_authenticated:
+        return SNAPSHOT_ANONIMO
+
+    snapshot = getattr(user, _ATRIBUTO_MEMO, None)
+    if snapshot is not None:
+        return snapshot
+
+    clave = _clave_snapshot(user)
+    snapshot = cache.get(clave)
+    if snapshot is None:
+        snapshot = construir_snapshot(user)
+        cache.set(clave, snapshot, AUTORIZACION_TTL)
+
+    setattr(user, _ATRIBUTO_MEMO, snapshot)
+    return snapshot
+
+
+def snapshot_de(request):
+    """
+    Foto del usuario de la petición.
+
+    Usa request.autorizacion (lo pone ForcePasswordChangeMiddleware de forma
+    perezosa) y, si la petición no pasó por el middleware (RequestFactory en
+    tests), la calcula directo.
+    """
+    snapshot = getattr(request, 'autorizacion', None)
+    if snapshot is None:
+        return obtener_snapshot(request.user)
+    return snapshot
+
+
+def invalidar_autorizacion_usuario(user_id, db_alias='default', user=None):
+    """
+    Incrementa la versión del usuario; su foto vieja queda huérfana.
+
+    Args:
+        user_id (int): PK del User.
+        db_alias (str): alias de BD del país donde se escribió.
+        user: instancia en memoria (opcional) para borrar también su memo.
+
+    Efectos secundarios:
+        incr (o set si el contador no existía) en la caché por defecto.
+    """
+    if user is not None:
+        user.__dict__.pop(_ATRIBUTO_MEMO, None)
+    if not user_id:
+        return
+    _incrementar(_clave_version_usuario(db_alias, user_id))
+
+
+def invalidar_autorizacion_global():
+    """
+    Invalida las fotos de TODOS los usuarios (p. ej. cambió un grupo).
+
+    Efectos secundarios:
+        incr de la versión global en la caché por defecto.
+    """
+    _incrementar(_CLAVE_VERSION_GLOBAL)
@@ -1,8 +1,25 @@
-from django.core.management.base import BaseCommand
+from datetime import datetime, time
+from itertools import groupby
+
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
 from inventario.models import Producto, Movimiento
 
 
+# Movimientos por UPDATE masivo (bulk_update arma un CASE por lote)
+TAMANO_LOTE = 500
+
+# Columnas que necesita el recálculo (no se cargan modelos completos)
+_CAMPOS_MOVIMIENTO = (
+    'id', 'producto_id', 'tipo', 'cantidad', 'es_movimiento_fraccionario', 'cantidad_fraccionaria',
+    'cantidad_fraccionaria_resultante', 'porcentaje_resultante',
+)
+_CAMPOS_PRODUCTO = ('id', 'nombre', 'cantidad', 'cantidad_actual', 'cantidad_unitaria', 'es_fraccionable')
+
+
 def total_from_state(units, actual, unit_size):
     """Calcula el total disponible en la misma forma que Producto.cantidad_total_disponible"""
     try:
@@ -38,66 +55,202 @@ def unpack_total(total, unit_size):
             return 0, 0.0
 
 
+def calcular_resultantes(producto, movimientos):
+    """
+    Recorre los movimientos de un producto del más nuevo al más viejo y
+    calcula el estado fraccionario POSTERIOR a cada uno.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Solo conocemos el estado final del producto (cantidad / cantidad_actual).
+    Para saber cómo quedó después de cada movimiento se "deshace" uno a uno
+    desde el final. No es una suma acumulada pura: unpack_total recorta a
+    cero y los movimientos por unidades no tocan la fracción, por eso cada
+    paso depende del anterior y se hace en Python (sobre filas ya leídas).
+
+    Args:
+        producto (dict): fila con _CAMPOS_PRODUCTO.
+        movimientos (iterable[dict]): filas con _CAMPOS_MOVIMIENTO ordenadas
+            de la más reciente a la más antigua.
+
+    Yields:
+        (movimiento, cantidad_fraccionaria_resultante, porcentaje_resultante)
+        solo para los movimientos fraccionarios de productos fraccionables.
+    """
+    unit_size = producto['cantidad_unitaria']
+    # iniciar desde el estado final del producto
+    post_units = producto['cantidad']
+    post_actual = producto['cantidad_actual']
+
+    for mov in movimientos:
+        # Guardar los valores resultantes (son el estado POSTERIOR al movimiento)
+        if mov['es_movimiento_fraccionario'] and producto['es_fraccionable']:
+            pct = None
+            try:
+                if unit_size and unit_size > 0:
+                    pct = (float(post_actual) / float(unit_size)) * 100
+                    pct = max(0.0, min(100.0, pct))
+            except Exception:
+                pct = None
+
+            yield mov, float(post_actual or 0), pct
+
+            # Reverse apply the movement to get the PRE state
+            q = float(mov['cantidad_fraccionaria'] or 0)
+            post_total = total_from_state(post_units, post_actual, unit_size)
+            if mov['tipo'] == 'salida':
+                pre_total = post_total + q
+            elif mov['tipo'] in ['entrada', 'devolucion']:
+                pre_total = post_total - q
+            else:
+                pre_total = post_total
+
+            post_units, post_actual = unpack_total(pre_total, unit_size)
+
+        else:
+            # No fraccionario: ajustar unidades al revertir
+            if mov['tipo'] in ['entrada', 'devolucion']:
+                pre_units = max(0, post_units - (mov['cantidad'] or 0))
+            elif mov['tipo'] == 'salida':
+                pre_units = post_units + (mov['cantidad'] or 0)
+            else:
+                pre_units = post_units
+
+            # Si no quedan unidades, el actual debe ser 0
+            if pre_units == 0:
+                pre_actual = 0.0
+            else:
+                # Mantener post_actual como aproximación
+                pre_actual = post_actual
+
+            post_units, post_actual = pre_units, pre_actual
+
+
+def parsear_desde(valor):
+    """
+    Convierte '2026-01-31' o '2026-01-31T08:00' en datetime aware.
+
+    Raises:
+        CommandError: si el texto no es una fecha válida.
+    """
+    fecha = parse_datetime(valor)
+    if fecha is None:
+        dia = parse_date(valor)
+        if dia is None:
+            raise CommandError(f'Fecha inválida para --desde: {valor!r} (use AAAA-MM-DD o AAAA-MM-DDTHH:MM)')
+        fecha = datetime.combine(dia, time.min)
+    if timezone.is_naive(fecha):
+        fecha = timezone.make_aware(fecha)
+    return fecha
+
+
+def recalcular_movimientos(desde=None, dry_run=False, tamano_lote=TAMANO_LOTE):
+    """
+    Recalcula los campos fraccionarios resultantes de los movimientos.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Antes se hacía un SELECT por producto y un UPDATE por movimiento. Ahora:
+    1. Un SELECT de productos y UN SELECT de movimientos ordenado por
+       producto y fecha (solo las columnas necesarias, leído por bloques).
+    2. El cálculo se hace en memoria con calcular_resultantes.
+    3. Solo los movimientos cuyo valor cambió se escriben con bulk_update en
+       lotes, todo dentro de una transacción (o nada se guarda).
+
+    Args:
+        desde (datetime|None): si se indica, solo se recalculan los productos
+            con algún movimiento en o después de esa fecha (se recorre toda su
+            historia, porque se parte del estado actual).
+        dry_run (bool): calcula y reporta diferencias sin escribir nada.
+        tamano_lote (int): movimientos por UPDATE masivo.
+
+    Returns:
+        dict con 'productos', 'recalculados' (movimientos fraccionarios
+        revisados) y 'cambios': lista de (movimiento_id, producto_nombre,
+        (fraccion_anterior, pct_anterior), (fraccion_nueva, pct_nueva)).
+    """
+    productos_qs = Producto.objects.all()
+    if desde is not None:
+        productos_qs = productos_qs.filter(
+            id__in=Movimiento.objects.filter(fecha_movimiento__gte=desde).values('producto_id'),
+        )
+    productos = {p['id']: p for p in productos_qs.values(*_CAMPOS_PRODUCTO)}
+
+    movimientos = (
+        Movimiento.objects.filter(producto_id__in=productos_qs.values('id'))
+        .order_by('producto_id', '-fecha_movimiento', '-id')
+        .values(*_CAMPOS_MOVIMIENTO)
+        .iterator(chunk_size=2000)
+    )
+
+    recalculados = 0
+    cambios = []
+    por_guardar = []
+    for producto_id, filas in groupby(movimientos, key=lambda m: m['producto_id']):
+        producto = productos[producto_id]
+        for mov, fraccion, pct in calcular_resultantes(producto, filas):
+            recalculados += 1
+            anterior = (mov['cantidad_fraccionaria_resultante'], mov['porcentaje_resultante'])
+            if anterior == (fraccion, pct):
+                continue
+            cambios.append((mov['id'], producto['nombre'], anterior, (fraccion, pct)))
+            por_guardar.append(Movimiento(
+                id=mov['id'], cantidad_fraccionaria_resultante=fraccion, porcentaje_resultante=pct,
+            ))
+
+    if not dry_run and por_guardar:
+        with transaction.atomic():
+            Movimiento.objects.bulk_update(
+                por_guardar,
+                ['cantidad_fraccionaria_resultante', 'porcentaje_resultante'],
+                batch_size=tamano_lote,
+            )
+
+    return {'productos': len(productos), 'recalculados': recalculados, 'cambios': cambios}
+
+
 class Command(BaseCommand):
     help = 'Recalcula y guarda los campos fraccionarios resultantes en movimientos históricos'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--desde',
+            help='Solo productos con movimientos desde esta fecha (AAAA-MM-DD o AAAA-MM-DDTHH:MM)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Muestra los movimientos que cambiarían sin guardar nada',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=TAMANO_LOTE,
+            help=f'Movimientos por UPDATE masivo (default {TAMANO_LOTE})',
+        )
+
     def handle(self, *args, **options):
+        desde = parsear_desde(options['desde']) if options['desde'] else None
+        dry_run = options['dry_run']
+        if options['lote'] < 1:
+            raise CommandError('--lote debe ser mayor que cero')
+
         self.stdout.write('Iniciando recalculo de movimientos fraccionarios...')
-        productos = Producto.objects.all()
-        total_movimientos_actualizados = 0
-        for producto in productos:
-            unit_size = producto.cantidad_unitaria
-            # iniciar desde el estado final del producto
-            post_units = producto.cantidad
-            post_actual = producto.cantidad_actual
-
-            movimientos = Movimiento.objects.filter(producto=producto).order_by('-fecha_movimiento')
-            for mov in movimientos:
-                # Guardar los valores resultantes (son el estado POSTERIOR al movimiento)
-                if mov.es_movimiento_fraccionario and producto.es_fraccionable:
-                    pct = None
-                    try:
-                        if unit_size and unit_size > 0:
-                            pct = (float(post_actual) / float(unit_size)) * 100
-                            pct = max(0.0, min(100.0, pct))
-                    except Exception:
-                        pct = None
-
-                    # Update movimiento fields
-                    mov.cantidad_fraccionaria_resultante = float(post_actual or 0)
-                    mov.porcentaje_resultante = pct
-                    mov.save(update_fields=['cantidad_fraccionaria_resultante', 'porcentaje_resultante'])
-                    total_movimientos_actualizados += 1
-
-                    # Reverse apply the movement to get the PRE state
-                    q = float(mov.cantidad_fraccionaria or 0)
-                    post_total = total_from_state(post_units, post_actual, unit_size)
-                    if mov.tipo == 'salida':
-                        pre_total = post_total + q
-                    elif mov.tipo in ['entrada', 'devolucion']:
-                        pre_total = post_total - q
-                    else:
-                        pre_total = post_total
-
-                    pre_units, pre_actual = unpack_total(pre_total, unit_size)
-                    post_units, post_actual = pre_units, pre_actual
-
-                else:
-                    # No fraccionario: ajustar unidades al revertir
-                    if mov.tipo in ['entrada', 'devolucion']:
-                        pre_units = max(0, post_units - (mov.cantidad or 0))
-                    elif mov.tipo == 'salida':
-                        pre_units = post_units + (mov.cantidad or 0)
-                    else:
-                        pre_units = post_units
-
-                    # Si no quedan unidades, el actual debe ser 0
-                    if pre_units == 0:
-                        pre_actual = 0.0
-                    else:
-                        # Mantener post_actual como aproximación
-                        pre_actual = post_actual
-
-                    post_units, post_actual = pre_units, pre_actual
-
-        self.stdout.write(self.style.SUCCESS(f'Recalculo completo. Movimientos actualizados: {total_movimientos_actualizados}'))
+        resultado = recalcular_movimientos(desde=desde, dry_run=dry_run, tamano_lote=options['lote'])
+
+        if dry_run:
+            for mov_id, nombre, (fraccion_ant, pct_ant), (fraccion, pct) in resultado['cambios']:
+                self.stdout.write(
+                    f'  Movimiento #{mov_id} ({nombre}): '
+                    f'resultante {fraccion_ant} → {fraccion}, porcentaje {pct_ant} → {pct}'
+                )
+            self.stdout.write(self.style.WARNING(
+                f'DRY RUN: no se guardó nada. Productos: {resultado["productos"]}, '
+                f'movimientos recalculados: {resultado["recalculados"]}, '
+                f'con cambios: {len(resultado["cambios"])}'
+            ))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Recalculo completo. Productos: {resultado["productos"]}, '
+            f'movimientos recalculados: {resultado["recalculados"]}, '
+            f'movimientos actualizados: {len(resultado["cambios"])}'
+        ))
@@ -25,6 +25,9 @@ Request → [Middlewares] → View → Template → Response
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.contrib import messages
+from django.utils.functional import SimpleLazyObject
+
+from .autorizacion import obtener_snapshot
 
 
 class ForcePasswordChangeMiddleware:
@@ -77,6 +80,12 @@ class ForcePasswordChangeMiddleware:
             HttpResponse: La respuesta HTTP (puede ser redirección o la respuesta normal)
         """
         
+        # ===== PASO 0: Foto de autorización compartida (perezosa) =====
+        # Igual que request.user en AuthenticationMiddleware: no se calcula
+        # hasta que alguien la usa. Los decoradores de permisos y los
+        # template tags leen esta misma foto (ver inventario/autorizacion.py).
+        request.autorizacion = SimpleLazyObject(lambda: obtener_snapshot(request.user))
+
         # ===== PASO 1: Verificar si el usuario está autenticado =====
         if not request.user.is_authenticated:
             # Usuario anónimo (no ha iniciado sesión)
@@ -89,16 +98,15 @@ class ForcePasswordChangeMiddleware:
             return self.get_response(request)
         
         # ===== PASO 3: Verificar si el usuario tiene perfil de Empleado =====
-        try:
-            empleado = request.user.empleado
-        except (AttributeError, Exception):
-            # El usuario no tiene el atributo 'empleado' o no existe el perfil
-            # (puede ser un usuario creado manualmente sin perfil de empleado)
-            # Permitir acceso normal
+        # Se lee de la foto en caché en vez de consultar request.user.empleado
+        autorizacion = request.autorizacion
+        if not autorizacion.tiene_empleado:
+            # No existe el perfil (puede ser un usuario creado manualmente
+            # sin perfil de empleado). Permitir acceso normal
             return self.get_response(request)
         
         # ===== PASO 4: Verificar si ya configuró su contraseña =====
-        if empleado.contraseña_configurada:
+        if autorizacion.contrasena_configurada:
             # Ya cambió su contraseña, puede acceder normalmente
             return self.get_response(request)
         
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.14 on 2026-10-19 07:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventario', '0020_empleado_rol_facturacion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='producto',
+            index=models.Index(django.db.models.functions.text.Upper('codigo_qr'), name='producto_codigo_qr_upper'),
+        ),
+    ]
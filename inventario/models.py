@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.core.validators import FileExtensionValidator
@@ -279,6 +280,10 @@ class Producto(models.Model):
     class Meta:
         ordering = ['-fecha_ingreso']
         verbose_name_plural = "Productos"
+        indexes = [
+            # Búsqueda del scanner sin distinguir mayúsculas (qr_productos.buscar_producto_por_codigo)
+            models.Index(Upper('codigo_qr'), name='producto_codigo_qr_upper'),
+        ]
 
 class Movimiento(models.Model):
     """
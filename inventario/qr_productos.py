@@ -0,0 +1,327 @@
+"""
+Códigos QR de productos de inventario: imagen cacheada, búsqueda indexada
+y hoja de etiquetas en PDF.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+El código QR de un producto (Producto.codigo_qr) se genera una sola vez y
+nunca cambia (editable=False). Aun así, cada visita a /productos/<id>/qr/
+volvía a armar la imagen con la librería qrcode. Ahora:
+
+1. IMAGEN CACHEADA: el PNG (o SVG) se guarda en disco bajo una huella del
+   contenido del código. La segunda vez se lee el archivo, y el navegador
+   recibe ETag + Cache-Control para ni siquiera volver a pedirlo.
+2. BÚSQUEDA INDEXADA: el scanner puede mandar el código en minúsculas. La
+   búsqueda compara UPPER(codigo_qr) contra un índice funcional
+   (Meta.indexes de Producto) en lugar de recorrer toda la tabla con iexact.
+3. HOJA DE ETIQUETAS: para una compra nueva se imprime un PDF con N
+   etiquetas (QR + nombre + código) en lugar de abrir un QR por producto.
+   Los QR que no están en caché se generan en paralelo con varios hilos.
+
+Los archivos del caché miden 1-2 KB y hay uno por código/formato, así que
+no se recortan por tamaño (a diferencia de config/pdf_cache.py).
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models.functions import Upper
+
+from .models import Producto
+
+logger = logging.getLogger(__name__)
+
+# Subir este número regenera todas las imágenes (cambio de tamaño/borde).
+VERSION_QR = 1
+
+FORMATOS_QR = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+# Mismos parámetros que usaba generar_qr_producto (los scanners ya los leen).
+QR_BOX_SIZE = 10
+QR_BORDE = 5
+
+
+# ============================================================================
+# BÚSQUEDA POR CÓDIGO (SCANNER)
+# ============================================================================
+
+def normalizar_codigo_qr(codigo_raw):
+    """
+    Limpia lo que manda el scanner y lo deja en mayúsculas.
+
+    Quita caracteres de control (\\r, \\n, \\t...) y cualquier espacio; los
+    scanners físicos suelen agregar un Enter al final.
+
+    Args:
+        codigo_raw (str): texto tal como llegó en ?codigo_qr=.
+
+    Returns:
+        str: código limpio (vacío si no quedó nada).
+    """
+    codigo = re.sub(r'[\r\n\t\x00-\x1f\x7f-\x9f]', '', codigo_raw or '')
+    return re.sub(r'\s+', '', codigo).upper()
+
+
+def buscar_producto_por_codigo(codigo):
+    """
+    Producto cuyo codigo_qr coincide sin distinguir mayúsculas.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    codigo_qr__iexact no puede usar el índice único de la columna (compara
+    UPPER(columna) LIKE ...). Aquí filtramos por Upper('codigo_qr'), que es
+    exactamente la expresión del índice funcional producto_codigo_qr_upper.
+
+    Args:
+        codigo (str): código ya normalizado (normalizar_codigo_qr).
+
+    Returns:
+        Producto
+
+    Raises:
+        Producto.DoesNotExist: si no hay producto con ese código.
+    """
+    return (
+        Producto.objects
+        .annotate(codigo_qr_mayus=Upper('codigo_qr'))
+        .get(codigo_qr_mayus=codigo.upper())
+    )
+
+
+# ============================================================================
+# IMAGEN QR CACHEADA EN DISCO
+# ============================================================================
+
+def huella_qr(codigo, formato='png'):
+    """
+    Huella (SHA-256) de una imagen QR: sirve de nombre de archivo y de ETag.
+
+    Args:
+        codigo (str): contenido del QR.
+        formato (str): 'png' o 'svg'.
+
+    Returns:
+        str: 64 caracteres hexadecimales.
+    """
+    contenido = f'{VERSION_QR}|{formato}|{QR_BOX_SIZE}|{QR_BORDE}|{codigo}'
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+
+def _directorio_cache():
+    """Carpeta del caché: QR_CACHE_DIR o MEDIA_ROOT/cache/qr."""
+    return Path(
+        getattr(settings, 'QR_CACHE_DIR', '')
+        or os.path.join(settings.MEDIA_ROOT, 'cache', 'qr')
+    )
+
+
+def _ruta(huella, formato):
+    """Ruta del archivo (subcarpeta por los 2 primeros caracteres de la huella)."""
+    return _directorio_cache() / huella[:2] / f'{huella}.{formato}'
+
+
+def _generar_qr(codigo, formato):
+    """Bytes de la imagen QR (sin caché)."""
+    import qrcode
+
+    fabrica = None
+    if formato == 'svg':
+        import qrcode.image.svg
+        fabrica = qrcode.image.svg.SvgPathImage
+
+    qr = qrcode.QRCode(version=1, box_size=QR_BOX_SIZE, border=QR_BORDE, image_factory=fabrica)
+    qr.add_data(codigo)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color='black', back_color='white') if fabrica is None else qr.make_image()
+    if formato == 'svg':
+        return img.to_string()
+    salida = io.BytesIO()
+    img.save(salida, format='PNG')
+    return salida.getvalue()
+
+
+def _guardar(ruta, datos):
+    """Escribe en un temporal de la misma carpeta y lo renombra (sin lecturas a medias)."""
+    try:
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporal = tempfile.mkstemp(dir=ruta.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as archivo:
+            archivo.write(datos)
+        os.replace(temporal, ruta)
+    except OSError as exc:
+        # Sin disco no hay caché, pero la imagen se entrega igual
+        logger.warning('[QR_CACHE] No se pudo guardar %s: %s', ruta.name, exc)
+
+
+def imagen_qr(codigo, formato='png'):
+    """
+    Imagen QR de un código, leída del caché o generada y guardada.
+
+    Args:
+        codigo (str): contenido del QR (Producto.codigo_qr).
+        formato (str): 'png' o 'svg'.
+
+    Returns:
+        bytes: imagen lista para la respuesta HTTP o para el PDF.
+
+    Raises:
+        ValueError: si el formato no está en FORMATOS_QR.
+    """
+    return imagenes_qr([codigo], formato)[codigo]
+
+
+def imagenes_qr(codigos, formato='png'):
+    """
+    Imágenes QR de varios códigos; las que faltan se generan en paralelo.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Primero se leen del disco las que ya existen. Las que no, se reparten
+    entre QR_HILOS_MAX hilos (la compresión PNG de Pillow libera el GIL, así
+    que los hilos sí avanzan a la vez) y se guardan para la próxima.
+
+    Args:
+        codigos (iterable[str]): códigos (se ignoran repetidos).
+        formato (str): 'png' o 'svg'.
+
+    Returns:
+        dict[str, bytes]: {codigo: imagen}.
+
+    Raises:
+        ValueError: si el formato no está en FORMATOS_QR.
+    """
+    if formato not in FORMATOS_QR:
+        raise ValueError(f'Formato QR no soportado: {formato}')
+
+    imagenes = {}
+    faltantes = []
+    for codigo in dict.fromkeys(codigos):
+        try:
+            imagenes[codigo] = _ruta(huella_qr(codigo, formato), formato).read_bytes()
+        except OSError:
+            faltantes.append(codigo)
+
+    def _generar_y_guardar(codigo):
+        datos = _generar_qr(codigo, formato)
+        _guardar(_ruta(huella_qr(codigo, formato), formato), datos)
+        return datos
+
+    hilos = min(getattr(settings, 'QR_HILOS_MAX', 4), len(faltantes))
+    if hilos > 1:
+        with ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='qr') as pool:
+            imagenes.update(zip(faltantes, pool.map(_generar_y_guardar, faltantes)))
+    else:
+        imagenes.update((codigo, _generar_y_guardar(codigo)) for codigo in faltantes)
+    return imagenes
+
+
+# ============================================================================
+# HOJA DE ETIQUETAS (PDF)
+# ============================================================================
+
+@dataclass(frozen=True)
+class Etiqueta:
+    """Una etiqueta de la hoja: QR de `codigo` + dos líneas de texto."""
+
+    codigo: str
+    titulo: str
+    detalle: str = ''
+
+
+# Hoja carta, 3 columnas x 8 filas (24 etiquetas de ~6.7 x 3.2 cm).
+ETIQUETAS_COLUMNAS = 3
+ETIQUETAS_FILAS = 8
+
+
+def etiquetas_de_productos(productos, copias=1):
+    """
+    Etiquetas para una selección de productos de inventario.
+
+    Args:
+        productos (iterable[Producto]): en el orden en que se imprimirán.
+        copias (int): etiquetas por producto.
+
+    Returns:
+        list[Etiqueta]
+    """
+    etiquetas = []
+    for producto in productos:
+        etiqueta = Etiqueta(
+            codigo=producto.codigo_qr,
+            titulo=producto.nombre,
+            detalle=producto.ubicacion or producto.get_categoria_display(),
+        )
+        etiquetas.extend([etiqueta] * copias)
+    return etiquetas
+
+
+def generar_hoja_etiquetas(etiquetas):
+    """
+    PDF carta con las etiquetas en cuadrícula (varias páginas si hace falta).
+
+    Args:
+        etiquetas (list[Etiqueta]): una por etiqueta impresa (las copias ya
+            vienen repetidas).
+
+    Returns:
+        bytes: PDF completo.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import cm
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas as rl_canvas
+
+    imagenes = imagenes_qr(etiqueta.codigo for etiqueta in etiquetas)
+    # Un ImageReader por código: ReportLab incrusta cada imagen una sola vez
+    lectores = {codigo: ImageReader(io.BytesIO(datos)) for codigo, datos in imagenes.items()}
+
+    ancho_pagina, alto_pagina = letter
+    margen_x, margen_y = 0.6 * cm, 1.2 * cm
+    ancho = (ancho_pagina - 2 * margen_x) / ETIQUETAS_COLUMNAS
+    alto = (alto_pagina - 2 * margen_y) / ETIQUETAS_FILAS
+    lado_qr = alto - 0.3 * cm
+    por_pagina = ETIQUETAS_COLUMNAS * ETIQUETAS_FILAS
+
+    salida = io.BytesIO()
+    pdf = rl_canvas.Canvas(salida, pagesize=letter)
+    pdf.setTitle('Etiquetas QR')
+    for indice, etiqueta in enumerate(etiquetas):
+        if indice and indice % por_pagina == 0:
+            pdf.showPage()
+        posicion = indice % por_pagina
+        x = margen_x + (posicion % ETIQUETAS_COLUMNAS) * ancho
+        y = alto_pagina - margen_y - (posicion // ETIQUETAS_COLUMNAS + 1) * alto
+
+        pdf.drawImage(lectores[etiqueta.codigo], x + 0.15 * cm, y + 0.15 * cm, lado_qr, lado_qr)
+        texto_x = x + lado_qr + 0.3 * cm
+        ancho_texto = ancho - lado_qr - 0.5 * cm
+        pdf.setFont('Helvetica-Bold', 8)
+        pdf.drawString(texto_x, y + alto - 0.8 * cm, _recortar(etiqueta.titulo, 'Helvetica-Bold', 8, ancho_texto))
+        pdf.setFont('Courier', 7)
+        pdf.drawString(texto_x, y + alto / 2 - 0.1 * cm, _recortar(etiqueta.codigo, 'Courier', 7, ancho_texto))
+        if etiqueta.detalle:
+            pdf.setFont('Helvetica', 7)
+            pdf.drawString(texto_x, y + 0.5 * cm, _recortar(etiqueta.detalle, 'Helvetica', 7, ancho_texto))
+    pdf.save()
+    return salida.getvalue()
+
+
+def _recortar(texto, fuente, tamano, ancho_max):
+    """Recorta `texto` con '…' para que quepa en `ancho_max` puntos."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    texto = str(texto or '')
+    if stringWidth(texto, fuente, tamano) <= ancho_max:
+        return texto
+    while texto and stringWidth(texto + '…', fuente, tamano) > ancho_max:
+        texto = texto[:-1]
+    return texto + '…'
@@ -1,16 +1,77 @@
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
+from .autorizacion import invalidar_autorizacion_global, invalidar_autorizacion_usuario
 from .models import Empleado
 from .utils import sincronizar_grupo_empleado
 
+User = get_user_model()
+
 
 @receiver(post_save, sender=Empleado)
 def actualizar_grupo_al_cambiar_rol(sender, instance, created, **kwargs):
     """
     Signal que sincroniza el grupo del usuario cuando cambia el rol del empleado
-    
+
     Se ejecuta automáticamente DESPUÉS de guardar un Empleado.
     Solo procesa empleados que YA tienen usuario asignado.
     """
     if instance.user:
         sincronizar_grupo_empleado(instance)
+
+
+# ============================================================================
+# INVALIDACIÓN DE LA FOTO DE AUTORIZACIÓN (inventario/autorizacion.py)
+# ============================================================================
+
+@receiver(post_save, sender=Empleado)
+@receiver(post_delete, sender=Empleado)
+def invalidar_autorizacion_por_empleado(sender, instance, **kwargs):
+    """
+    Rol, sucursal o contraseña_configurada del empleado forman parte de la foto.
+    """
+    invalidar_autorizacion_usuario(instance.user_id, kwargs.get('using'))
+
+
+@receiver(post_save, sender=User)
+def invalidar_autorizacion_por_usuario(sender, instance, **kwargs):
+    """
+    is_active / is_staff / is_superuser cambian lo que el usuario puede hacer.
+
+    El login guarda solo last_login (update_fields={'last_login'}): eso no
+    cambia permisos, así que la foto se conserva.
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    invalidar_autorizacion_usuario(instance.pk, kwargs.get('using'), user=instance)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidar_autorizacion_por_grupos_o_permisos(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    user.groups / user.user_permissions cambiaron (desde el usuario o desde el grupo).
+    """
+    if not action.startswith('post_'):
+        return
+    using = kwargs.get('using')
+    if not reverse:
+        invalidar_autorizacion_usuario(instance.pk, using, user=instance)
+    elif pk_set is None:
+        # group.user_set.clear(): no sabemos qué usuarios eran
+        invalidar_autorizacion_global()
+    else:
+        for user_id in pk_set:
+            invalidar_autorizacion_usuario(user_id, using)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+@receiver(post_delete, sender=Group)
+def invalidar_autorizacion_por_grupo(sender, **kwargs):
+    """
+    Cambiar los permisos de un grupo afecta a todos sus miembros.
+    """
+    if kwargs.get('action', 'post_').startswith('post_'):
+        invalidar_autorizacion_global()
@@ -9,14 +9,28 @@ Son útiles para obtener información compleja que no viene directamente en el c
 Este módulo proporciona:
 - user_groups: Obtiene los roles/grupos de un usuario
 - user_primary_role: Obtiene el rol principal del usuario
+
+Todos leen los grupos de la foto de autorización (inventario/autorizacion.py),
+que se calcula una vez por petición y se guarda en caché entre peticiones;
+así el navbar no consulta user.groups en cada render.
 """
 
 from django import template
-from django.contrib.auth.models import Group
+
+from inventario.autorizacion import obtener_snapshot
 
 register = template.Library()
 
 
+def _rol_sin_grupos(snapshot):
+    """Texto para usuarios sin grupos (superusuario, staff o ninguno)."""
+    if snapshot.es_superusuario:
+        return 'Superusuario'
+    if snapshot.es_staff:
+        return 'Staff'
+    return 'Sin rol asignado'
+
+
 @register.filter(name='user_groups')
 def user_groups(user):
     """
@@ -34,7 +48,7 @@ def user_groups(user):
     """
     if not user or not user.is_authenticated:
         return []
-    return [group.name for group in user.groups.all()]
+    return list(obtener_snapshot(user).grupos)
 
 
 @register.filter(name='user_primary_role')
@@ -57,17 +71,11 @@ def user_primary_role(user):
     if not user or not user.is_authenticated:
         return 'Usuario no autenticado'
     
-    groups = user.groups.order_by('name')
-    if groups.exists():
-        return groups.first().name
-    else:
-        # Si es superusuario pero no tiene grupos
-        if user.is_superuser:
-            return 'Superusuario'
-        elif user.is_staff:
-            return 'Staff'
-        else:
-            return 'Sin rol asignado'
+    snapshot = obtener_snapshot(user)
+    if snapshot.grupos:
+        # La foto ya guarda los grupos ordenados alfabéticamente
+        return snapshot.grupos[0]
+    return _rol_sin_grupos(snapshot)
 
 
 @register.filter(name='user_roles_display')
@@ -92,19 +100,12 @@ def user_roles_display(user):
     if not user or not user.is_authenticated:
         return 'Usuario no autenticado'
     
-    groups = user.groups.order_by('name')
-    
-    if groups.exists():
+    snapshot = obtener_snapshot(user)
+    if snapshot.grupos:
         # Si tiene grupos, unirlos con •
-        return ' • '.join([group.name for group in groups])
-    else:
-        # Si no tiene grupos pero es superusuario/staff
-        if user.is_superuser:
-            return 'Superusuario'
-        elif user.is_staff:
-            return 'Staff'
-        else:
-            return 'Sin rol asignado'
+        return ' • '.join(snapshot.grupos)
+    # Si no tiene grupos pero es superusuario/staff
+    return _rol_sin_grupos(snapshot)
 
 
 @register.simple_tag
@@ -133,9 +134,9 @@ def user_has_any_role(user, *role_names):
     if not user or not user.is_authenticated:
         return False
     
+    snapshot = obtener_snapshot(user)
     # Superusuarios tienen acceso a todo
-    if user.is_superuser:
+    if snapshot.es_superusuario:
         return True
     
-    user_groups = set(user.groups.values_list('name', flat=True))
-    return bool(user_groups.intersection(set(role_names)))
+    return snapshot.tiene_algun_grupo(*role_names)
@@ -0,0 +1,181 @@
+"""
+Tests de la foto de autorización por usuario (inventario/autorizacion.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+1) La foto se arma una vez y la siguiente petición la lee de la caché
+   sin consultas a la BD.
+2) Los signals la invalidan cuando cambian grupos, permisos de un grupo o
+   el Empleado (contraseña_configurada).
+3) Middleware, template tags y decoradores comparten la misma foto.
+"""
+
+from django.contrib.auth.models import AnonymousUser, Group, Permission, User, update_last_login
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from inventario.autorizacion import SNAPSHOT_ANONIMO, obtener_snapshot
+from inventario.middleware import ForcePasswordChangeMiddleware
+from inventario.models import Empleado, Sucursal
+from inventario.templatetags.permission_tags import (
+    user_groups,
+    user_has_any_role,
+    user_primary_role,
+    user_roles_display,
+)
+from servicio_tecnico.decorators import permission_required_with_message
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class SnapshotAutorizacionTest(TestCase):
+    """Caché entre peticiones e invalidación por signals."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='foto_auth', password='x')
+        self.grupo = Group.objects.create(name='Zeta Pruebas')
+        self.user.groups.add(self.grupo, Group.objects.create(name='Alfa Pruebas'))
+
+    def _usuario_fresco(self):
+        """User recién leído de BD, como en una petición nueva."""
+        return User.objects.get(pk=self.user.pk)
+
+    def test_segunda_peticion_sale_de_la_cache(self):
+        primera = obtener_snapshot(self._usuario_fresco())
+        usuario = self._usuario_fresco()
+
+        with self.assertNumQueries(0):
+            segunda = obtener_snapshot(usuario)
+            # Tags del navbar: misma foto memorizada en el objeto user
+            self.assertEqual(user_roles_display(usuario), 'Alfa Pruebas • Zeta Pruebas')
+            self.assertEqual(user_primary_role(usuario), 'Alfa Pruebas')
+            self.assertEqual(user_groups(usuario), ['Alfa Pruebas', 'Zeta Pruebas'])
+            self.assertTrue(user_has_any_role(usuario, 'Zeta Pruebas', 'Otro'))
+
+        self.assertEqual(primera, segunda)
+        self.assertFalse(segunda.tiene_empleado)
+
+    def test_permiso_de_grupo_invalida_la_foto(self):
+        permiso = Permission.objects.get(codename='view_sucursal')
+        self.assertFalse(obtener_snapshot(self._usuario_fresco()).tiene_permiso('inventario.view_sucursal'))
+
+        self.grupo.permissions.add(permiso)
+
+        self.assertTrue(obtener_snapshot(self._usuario_fresco()).tiene_permiso('inventario.view_sucursal'))
+
+    def test_quitar_grupo_invalida_la_foto(self):
+        obtener_snapshot(self._usuario_fresco())
+
+        self.user.groups.remove(self.grupo)
+
+        self.assertEqual(obtener_snapshot(self._usuario_fresco()).grupos, ('Alfa Pruebas',))
+
+    def test_login_conserva_la_foto(self):
+        obtener_snapshot(self._usuario_fresco())
+        update_last_login(None, self._usuario_fresco())
+        usuario = self._usuario_fresco()
+
+        with self.assertNumQueries(0):
+            obtener_snapshot(usuario)
+
+        # Cualquier otro guardado del usuario sí la invalida
+        usuario.is_staff = True
+        usuario.save(update_fields=['is_staff'])
+        self.assertTrue(obtener_snapshot(self._usuario_fresco()).es_staff)
+
+    def test_anonimo(self):
+        self.assertIs(obtener_snapshot(AnonymousUser()), SNAPSHOT_ANONIMO)
+        self.assertFalse(SNAPSHOT_ANONIMO.tiene_permiso('inventario.view_sucursal'))
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class AliasDefaultMexicoTest(TestCase):
+    """'default' y 'mexico' son la misma BD: escribir por uno invalida la foto del otro."""
+
+    databases = {'default', 'mexico'}
+
+    def test_quitar_permiso_via_default_invalida_la_foto_de_mexico(self):
+        cache.clear()
+        # En tests son dos BD separadas; se replica el usuario con el mismo PK
+        # para imitar la BD física compartida de producción.
+        user_default = User.objects.create_user(username='alias_auth', password='x')
+        user_mexico = User.objects.db_manager('mexico').create_user(
+            username='alias_auth', password='x', id=user_default.pk,
+        )
+        for usuario in (user_default, user_mexico):
+            usuario.user_permissions.add(
+                Permission.objects.using(usuario._state.db).get(codename='view_sucursal')
+            )
+        self.assertTrue(
+            obtener_snapshot(User.objects.using('mexico').get(pk=user_default.pk))
+            .tiene_permiso('inventario.view_sucursal')
+        )
+
+        # Shell / manage.py: la escritura llega con using='default'
+        User.user_permissions.through.objects.using('mexico').filter(user_id=user_default.pk).delete()
+        user_default.user_permissions.clear()
+
+        self.assertFalse(
+            obtener_snapshot(User.objects.using('mexico').get(pk=user_default.pk))
+            .tiene_permiso('inventario.view_sucursal')
+        )
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class MiddlewareYDecoradorTest(TestCase):
+    """ForcePasswordChangeMiddleware y permission_required_with_message usan la foto."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='tec_foto', password='x')
+        self.empleado = Empleado.objects.create(
+            nombre_completo='Técnico Foto',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='tec.foto@test.local',
+            sucursal=Sucursal.objects.create(nombre='Sucursal Foto', ciudad='CDMX'),
+            user=self.user,
+            rol='tecnico',
+            contraseña_configurada=False,
+        )
+
+    def test_middleware_sigue_al_empleado(self):
+        request = self.factory.get('/inventario/')
+        request.user = User.objects.get(pk=self.user.pk)
+        middleware = ForcePasswordChangeMiddleware(lambda r: HttpResponse('ok'))
+
+        request.session = {}
+        request._messages = FallbackStorage(request)
+
+        response = middleware(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(request.autorizacion.empleado_id, self.empleado.pk)
+
+        self.empleado.contraseña_configurada = True
+        self.empleado.save()
+
+        request = self.factory.get('/inventario/')
+        request.user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(middleware(request).content, b'ok')
+
+    def test_decorador_lee_la_foto_del_request(self):
+        @permission_required_with_message('inventario.view_sucursal')
+        def vista(request):
+            return HttpResponse('ok')
+
+        request = self.factory.get('/')
+        request.user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(vista(request).status_code, 302)
+
+        self.user.user_permissions.add(Permission.objects.get(codename='view_sucursal'))
+
+        request = self.factory.get('/')
+        request.user = User.objects.get(pk=self.user.pk)
+        obtener_snapshot(request.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(vista(request).content, b'ok')
@@ -0,0 +1,147 @@
+"""
+Tests de los códigos QR de productos (inventario/qr_productos.py) y de sus
+vistas: imagen con ETag, búsqueda del scanner y hoja de etiquetas en PDF.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+El caché en disco se apunta a una carpeta temporal (override_settings de
+QR_CACHE_DIR) para no dejar archivos en media/. Usamos RequestFactory (no
+Client) para no pasar por PaisMiddleware, igual que test_lista_empleados.
+"""
+
+import json
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from inventario import qr_productos
+from inventario.models import Producto
+from inventario.views import buscar_producto_qr, etiquetas_qr_productos, generar_qr_producto
+
+
+class _CacheTemporal:
+    """Mezcla: QR_CACHE_DIR en un tmp que se borra al final."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        ajustes = override_settings(QR_CACHE_DIR=self.tmp)
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+
+
+class NormalizarYBuscarTests(TestCase):
+    def test_normalizar_quita_control_y_espacios(self):
+        self.assertEqual(qr_productos.normalizar_codigo_qr(' inv2024 01\r\n\t'), 'INV202401')
+        self.assertEqual(qr_productos.normalizar_codigo_qr(None), '')
+
+    def test_busqueda_insensible_usa_la_expresion_del_indice(self):
+        producto = Producto.objects.create(nombre='Pasta térmica', codigo_qr='INVabc123')
+
+        with CaptureQueriesContext(connection) as consultas:
+            encontrado = qr_productos.buscar_producto_por_codigo('invABC123')
+
+        self.assertEqual(encontrado, producto)
+        self.assertEqual(len(consultas), 1)
+        self.assertIn('UPPER("inventario_producto"."codigo_qr")', consultas[0]['sql'])
+        with self.assertRaises(Producto.DoesNotExist):
+            qr_productos.buscar_producto_por_codigo('NOEXISTE')
+
+    def test_vista_scanner_acepta_minusculas(self):
+        producto = Producto.objects.create(nombre='Alcohol', codigo_qr='INV999')
+        request = RequestFactory().get('/x/', {'codigo_qr': 'inv999\r\n'})
+        request.user = User.objects.create_user('scanner_qr', password='x')
+
+        datos = json.loads(buscar_producto_qr(request).content)
+
+        self.assertEqual(datos['id'], producto.pk)
+        self.assertEqual(datos['codigo_qr'], 'INV999')
+
+
+class CacheImagenQRTests(_CacheTemporal, TestCase):
+    def test_segunda_lectura_sale_del_disco(self):
+        primera = qr_productos.imagen_qr('INV001')
+        self.assertTrue(primera.startswith(b'\x89PNG'))
+
+        with patch.object(qr_productos, '_generar_qr') as generar:
+            segunda = qr_productos.imagen_qr('INV001')
+
+        generar.assert_not_called()
+        self.assertEqual(segunda, primera)
+
+    def test_svg_y_formato_invalido(self):
+        self.assertIn(b'<svg', qr_productos.imagen_qr('INV001', 'svg'))
+        with self.assertRaises(ValueError):
+            qr_productos.imagen_qr('INV001', 'gif')
+
+    @override_settings(QR_HILOS_MAX=3)
+    def test_faltantes_se_generan_en_paralelo(self):
+        qr_productos.imagen_qr('INV-A')
+        hilos = set()
+        original = qr_productos._generar_qr
+
+        def _generar(codigo, formato):
+            import threading
+            hilos.add(threading.current_thread().name)
+            return original(codigo, formato)
+
+        with patch.object(qr_productos, '_generar_qr', side_effect=_generar) as generar:
+            imagenes = qr_productos.imagenes_qr(['INV-A', 'INV-B', 'INV-C', 'INV-D', 'INV-B'])
+
+        self.assertEqual(list(imagenes), ['INV-A', 'INV-B', 'INV-C', 'INV-D'])
+        self.assertEqual(generar.call_count, 3)  # INV-A ya estaba en disco
+        self.assertTrue(all(nombre.startswith('qr') for nombre in hilos))
+
+
+class VistasQRTests(_CacheTemporal, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_superuser('admin_qr', password='x', email='a@x.com')
+        self.producto = Producto.objects.create(nombre='Cinta Kapton', codigo_qr='INV777', ubicacion='Rack A')
+
+    def _get(self, data=None, **extra):
+        request = self.factory.get('/x/', data or {}, **extra)
+        request.user = self.user
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+        return request
+
+    def test_imagen_con_etag_y_304(self):
+        respuesta = generar_qr_producto(self._get(), producto_id=self.producto.pk)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta['Content-Type'], 'image/png')
+        self.assertIn('max-age=86400', respuesta['Cache-Control'])
+
+        etag = respuesta['ETag']
+        repetida = generar_qr_producto(self._get(HTTP_IF_NONE_MATCH=etag), producto_id=self.producto.pk)
+        self.assertEqual(repetida.status_code, 304)
+        self.assertEqual(repetida.content, b'')
+
+    def test_imagen_svg(self):
+        respuesta = generar_qr_producto(self._get({'formato': 'svg'}), producto_id=self.producto.pk)
+        self.assertEqual(respuesta['Content-Type'], 'image/svg+xml')
+        self.assertNotEqual(respuesta['ETag'], f'"{qr_productos.huella_qr("INV777", "png")}"')
+
+    def test_hoja_de_etiquetas_pagina_por_24(self):
+        otro = Producto.objects.create(nombre='Flux', codigo_qr='INV778')
+        request = self._get({'ids': [self.producto.pk, otro.pk, 'x'], 'copias': '13'})
+
+        with patch.object(qr_productos, '_generar_qr', wraps=qr_productos._generar_qr) as generar:
+            respuesta = etiquetas_qr_productos(request)
+
+        self.assertEqual(respuesta['Content-Type'], 'application/pdf')
+        self.assertTrue(respuesta.content.startswith(b'%PDF'))
+        self.assertEqual(respuesta.content.count(b'/Type /Page\n'), 2)  # 26 etiquetas
+        self.assertEqual(generar.call_count, 2)  # un QR por producto, no por copia
+
+    def test_hoja_sin_seleccion_redirige(self):
+        respuesta = etiquetas_qr_productos(self._get())
+        self.assertEqual(respuesta.status_code, 302)
@@ -0,0 +1,118 @@
+"""
+Tests del comando recalcular_movimientos_fraccionarios.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+El comando parte del estado actual de cada producto y "deshace" sus
+movimientos hacia atrás para guardar cuánto quedó después de cada uno.
+Aquí se comprueba que los valores son los esperados, que el número de
+consultas no crece con los productos, que --dry-run no escribe y que
+--desde limita los productos recalculados.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventario.management.commands.recalcular_movimientos_fraccionarios import recalcular_movimientos
+from inventario.models import Movimiento, Producto
+
+
+class RecalcularMovimientosFraccionariosTest(TestCase):
+    """Botella de 1000 ml: quedan 1 llena + 300 ml tras dos consumos."""
+
+    def setUp(self):
+        self.ahora = timezone.now()
+        self.producto = self._producto('Alcohol isopropílico')
+        self.entrada, self.salida_500, self.salida_200 = self._historia(self.producto)
+
+    def _producto(self, nombre):
+        return Producto.objects.create(
+            nombre=nombre,
+            es_fraccionable=True,
+            unidad_base='ml',
+            cantidad_unitaria=1000,
+            cantidad=2,
+            cantidad_actual=300,
+        )
+
+    def _movimiento(self, producto, tipo, dias, cantidad=1, fraccion=None):
+        # bulk_create no llama a save(): no toca el stock del producto
+        return Movimiento(
+            producto=producto,
+            tipo=tipo,
+            cantidad=cantidad,
+            motivo='uso_interno',
+            es_movimiento_fraccionario=fraccion is not None,
+            cantidad_fraccionaria=fraccion,
+            fecha_movimiento=self.ahora - timedelta(days=dias),
+            usuario_registro='test',
+            stock_anterior=0,
+            stock_posterior=0,
+        )
+
+    def _historia(self, producto, dias_base=0):
+        return Movimiento.objects.bulk_create([
+            self._movimiento(producto, 'entrada', dias_base + 3, cantidad=2),
+            self._movimiento(producto, 'salida', dias_base + 2, fraccion=500),
+            self._movimiento(producto, 'salida', dias_base + 1, fraccion=200),
+        ])
+
+    def _resultantes(self, movimiento):
+        movimiento.refresh_from_db()
+        return movimiento.cantidad_fraccionaria_resultante, movimiento.porcentaje_resultante
+
+    def test_guarda_el_estado_posterior_de_cada_movimiento(self):
+        call_command('recalcular_movimientos_fraccionarios', stdout=StringIO())
+
+        self.assertEqual(self._resultantes(self.salida_200), (300.0, 30.0))
+        self.assertEqual(self._resultantes(self.salida_500), (500.0, 50.0))
+        self.assertEqual(self._resultantes(self.entrada), (None, None))
+
+    def test_segunda_corrida_no_cambia_nada(self):
+        recalcular_movimientos()
+        resultado = recalcular_movimientos()
+        self.assertEqual(resultado['recalculados'], 2)
+        self.assertEqual(resultado['cambios'], [])
+
+    def test_consultas_no_crecen_con_los_productos(self):
+        with CaptureQueriesContext(connection) as uno:
+            recalcular_movimientos()
+        Movimiento.objects.update(cantidad_fraccionaria_resultante=None, porcentaje_resultante=None)
+        for i in range(5):
+            self._historia(self._producto(f'Solvente {i}'))
+        with CaptureQueriesContext(connection) as seis:
+            resultado = recalcular_movimientos()
+        self.assertEqual(len(resultado['cambios']), 12)
+        self.assertEqual(len(seis), len(uno))
+
+    def test_dry_run_reporta_sin_escribir(self):
+        salida = StringIO()
+        call_command('recalcular_movimientos_fraccionarios', '--dry-run', stdout=salida)
+
+        self.assertEqual(self._resultantes(self.salida_200), (None, None))
+        texto = salida.getvalue()
+        self.assertIn(f'Movimiento #{self.salida_200.pk} (Alcohol isopropílico)', texto)
+        self.assertIn('resultante None → 300.0, porcentaje None → 30.0', texto)
+        self.assertIn('con cambios: 2', texto)
+
+    def test_desde_solo_recalcula_productos_con_movimientos_recientes(self):
+        viejo = self._producto('Grasa térmica')
+        _, _, salida_vieja = self._historia(viejo, dias_base=30)
+        desde = (self.ahora - timedelta(days=10)).date().isoformat()
+
+        call_command('recalcular_movimientos_fraccionarios', '--desde', desde, stdout=StringIO())
+
+        self.assertEqual(self._resultantes(self.salida_200), (300.0, 30.0))
+        # Se recorre toda la historia del producto tocado, no solo lo reciente
+        self.assertEqual(self._resultantes(self.salida_500), (500.0, 50.0))
+        self.assertEqual(self._resultantes(salida_vieja), (None, None))
+
+    def test_desde_invalido(self):
+        with self.assertRaises(CommandError):
+            call_command('recalcular_movimientos_fraccionarios', '--desde', 'ayer', stdout=StringIO())
@@ -16,6 +16,7 @@ urlpatterns = [
     path('productos/<int:producto_id>/editar/', views.editar_producto, name='editar_producto'),
     path('productos/<int:producto_id>/eliminar/', views.eliminar_producto, name='eliminar_producto'),
     path('productos/<int:producto_id>/qr/', views.generar_qr_producto, name='generar_qr_producto'),
+    path('productos/etiquetas/', views.etiquetas_qr_productos, name='etiquetas_qr_productos'),
     
     # Gestión de movimientos
     path('movimientos/', views.lista_movimientos, name='lista_movimientos'),
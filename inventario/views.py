@@ -1,7 +1,7 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, Http404
 from django.urls import reverse
 from django.db.models import Q, Sum, Count, F
 from django.db import models
@@ -9,6 +9,7 @@ from django.utils import timezone
 from datetime import datetime, timedelta, date
 from functools import wraps
 from .models import Producto, Movimiento, Sucursal, Empleado
+from .autorizacion import snapshot_de
 from .forms import ProductoForm, MovimientoForm, SucursalForm, MovimientoRapidoForm, EmpleadoForm, MovimientoFraccionarioForm
 import openpyxl
 import json
@@ -41,7 +42,7 @@ def permission_required_with_message(perm, message=None):
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
-            if not request.user.has_perm(perm):
+            if not snapshot_de(request).tiene_permiso(perm):
                 error_msg = message or f'No tienes permisos para realizar esta acción.'
                 # Redirigir a página de acceso denegado con el mensaje
                 return redirect(f"{reverse('acceso_denegado')}?mensaje={error_msg}&permiso={perm}")
@@ -802,16 +803,15 @@ def buscar_producto_qr(request):
     API endpoint para buscar producto por código QR (AJAX)
     Con limpieza de caracteres invisibles del scanner
     """
+    from .qr_productos import buscar_producto_por_codigo, normalizar_codigo_qr
+
     codigo_qr_raw = request.GET.get('codigo_qr')
     
     if not codigo_qr_raw:
         return JsonResponse({'error': 'Código QR requerido'}, status=400)
     
-    # Limpiar código de caracteres invisibles y problemáticos
-    import re
-    codigo_qr = re.sub(r'[\r\n\t\x00-\x1f\x7f-\x9f]', '', codigo_qr_raw)  # Remover caracteres de control
-    codigo_qr = codigo_qr.strip()  # Remover espacios al inicio y final
-    codigo_qr = re.sub(r'\s+', '', codigo_qr)  # Remover espacios internos
+    # Limpiar caracteres invisibles del scanner (control, espacios) y pasar a mayúsculas
+    codigo_qr = normalizar_codigo_qr(codigo_qr_raw)
     
     if not codigo_qr:
         return JsonResponse({
@@ -821,8 +821,8 @@ def buscar_producto_qr(request):
         }, status=400)
     
     try:
-        # Búsqueda insensible a mayúsculas/minúsculas
-        producto = Producto.objects.get(codigo_qr__iexact=codigo_qr)
+        # Búsqueda insensible a mayúsculas/minúsculas (índice sobre UPPER(codigo_qr))
+        producto = buscar_producto_por_codigo(codigo_qr)
     except Producto.DoesNotExist:
         return JsonResponse({
             'error': 'Producto no encontrado',
@@ -861,16 +861,15 @@ def buscar_producto_fraccionable_qr(request):
     API endpoint para buscar producto fraccionable por código QR
     Proporciona información detallada sobre el estado fraccionario
     """
+    from .qr_productos import buscar_producto_por_codigo, normalizar_codigo_qr
+
     codigo_qr_raw = request.GET.get('codigo_qr')
     
     if not codigo_qr_raw:
         return JsonResponse({'error': 'Código QR requerido'}, status=400)
     
-    # Limpiar código de caracteres invisibles y problemáticos
-    import re
-    codigo_qr = re.sub(r'[\r\n\t\x00-\x1f\x7f-\x9f]', '', codigo_qr_raw)
-    codigo_qr = codigo_qr.strip()
-    codigo_qr = re.sub(r'\s+', '', codigo_qr)
+    # Limpiar caracteres invisibles del scanner (control, espacios) y pasar a mayúsculas
+    codigo_qr = normalizar_codigo_qr(codigo_qr_raw)
     
     if not codigo_qr:
         return JsonResponse({
@@ -879,7 +878,7 @@ def buscar_producto_fraccionable_qr(request):
         }, status=400)
     
     try:
-        producto = Producto.objects.get(codigo_qr__iexact=codigo_qr)
+        producto = buscar_producto_por_codigo(codigo_qr)
     except Producto.DoesNotExist:
         return JsonResponse({
             'error': 'Producto no encontrado',
@@ -953,24 +952,72 @@ def buscar_producto_fraccionable_qr(request):
 @login_required
 def generar_qr_producto(request, producto_id):
     """
-    Generar y mostrar código QR de un producto
+    Imagen del código QR de un producto (PNG, o SVG con ?formato=svg).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    La imagen sale del caché en disco (qr_productos.imagen_qr) y se responde
+    con ETag: si el navegador ya la tiene (If-None-Match) contestamos 304 sin
+    cuerpo. El código de un producto no cambia, así que puede guardarla un día.
     """
-    producto = get_object_or_404(Producto, id=producto_id)
-    
-    # Generar QR como imagen
-    import qrcode
-    from io import BytesIO
-    
-    qr = qrcode.QRCode(version=1, box_size=10, border=5)
-    qr.add_data(producto.codigo_qr)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
-    
-    # Crear respuesta HTTP con la imagen
-    response = HttpResponse(content_type="image/png")
-    img.save(response, "PNG")
-    
+    from django.utils.cache import get_conditional_response, patch_cache_control
+
+    from .qr_productos import FORMATOS_QR, huella_qr, imagen_qr
+
+    formato = request.GET.get('formato', 'png').lower()
+    if formato not in FORMATOS_QR:
+        formato = 'png'
+
+    codigo_qr = Producto.objects.filter(pk=producto_id).values_list('codigo_qr', flat=True).first()
+    if codigo_qr is None:
+        raise Http404('Producto no encontrado')
+
+    etag = f'"{huella_qr(codigo_qr, formato)}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(imagen_qr(codigo_qr, formato), content_type=FORMATOS_QR[formato])
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, max_age=settings.QR_CACHE_MAX_AGE)
+    return response
+
+
+@login_required
+@permission_required_with_message('inventario.view_producto')
+def etiquetas_qr_productos(request):
+    """
+    PDF con una hoja de etiquetas QR para los productos seleccionados.
+
+    Parámetros GET:
+        ids (list[int]): productos marcados en la lista (se repite ?ids=).
+        copias (int): etiquetas por producto (1 a 50, por defecto 1).
+
+    Returns:
+        HttpResponse application/pdf (inline, para imprimir desde el navegador).
+    """
+    from .qr_productos import etiquetas_de_productos, generar_hoja_etiquetas
+
+    ids = [int(valor) for valor in request.GET.getlist('ids') if valor.isdigit()]
+    try:
+        copias = min(max(int(request.GET.get('copias', 1)), 1), 50)
+    except ValueError:
+        copias = 1
+
+    productos = Producto.objects.in_bulk(ids)
+    seleccion = [productos[pk] for pk in dict.fromkeys(ids) if pk in productos]
+    if not seleccion:
+        messages.warning(request, 'Seleccione al menos un producto para imprimir etiquetas.')
+        return redirect('lista_productos')
+    if len(seleccion) * copias > settings.ETIQUETAS_QR_MAX:
+        messages.warning(
+            request,
+            f'Máximo {settings.ETIQUETAS_QR_MAX} etiquetas por hoja; reduzca la selección o las copias.'
+        )
+        return redirect('lista_productos')
+
+    pdf = generar_hoja_etiquetas(etiquetas_de_productos(seleccion, copias))
+    response = HttpResponse(pdf, content_type='application/pdf')
+    response['Content-Disposition'] = (
+        f'inline; filename="Etiquetas_QR_{timezone.now():%Y%m%d_%H%M}.pdf"'
+    )
     return response
 
 
@@ -11,7 +11,7 @@ administración de Django (/sic-gestion-sistema/).
 """
 
 from django.contrib import admin
-from .models import Notificacion, PushSubscription, PushSubscriptionCliente
+from .models import CorreoSaliente, Notificacion, PushSubscription, PushSubscriptionCliente
 
 
 @admin.register(Notificacion)
@@ -116,3 +116,32 @@ class PushSubscriptionClienteAdmin(admin.ModelAdmin):
         """Marca las suscripciones seleccionadas como activas."""
         actualizadas = queryset.update(activa=True)
         self.message_user(request, f"{actualizadas} suscripción(es) activada(s).")
+
+
+@admin.register(CorreoSaliente)
+class CorreoSalienteAdmin(admin.ModelAdmin):
+    """
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Bandeja de salida de correos. Sirve para ver qué quedó pendiente o
+    fallido y por qué (ultimo_error). La acción "Reintentar" los regresa a
+    pendiente para que el worker los mande en su siguiente pasada.
+    """
+
+    list_display = ('asunto', 'dominio', 'estado', 'intentos', 'referencia', 'fecha_creacion', 'fecha_envio')
+    list_filter = ('estado', 'dominio', 'fecha_creacion')
+    search_fields = ('asunto', 'referencia', 'para')
+    ordering = ['-fecha_creacion']
+    list_per_page = 30
+    readonly_fields = ('fecha_creacion', 'fecha_envio', 'bloqueado_desde', 'ultimo_error')
+
+    actions = ['reintentar']
+
+    @admin.action(description="Reintentar correos seleccionados")
+    def reintentar(self, request, queryset):
+        """Regresa a pendiente (sin esperar backoff) los correos no enviados."""
+        from django.utils import timezone
+
+        actualizados = queryset.exclude(estado='enviado').update(
+            estado='pendiente', proximo_intento=timezone.now(), bloqueado_desde=None,
+        )
+        self.message_user(request, f"{actualizados} correo(s) regresado(s) a pendiente.")
@@ -0,0 +1,516 @@
+"""
+Servicio de correo saliente para SIGMA: pool SMTP, recursos inline y bandeja.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+Antes cada tarea Celery armaba su EmailMessage, volvía a leer del disco el
+logo y los iconos sociales y llamaba a .send(), que abre una sesión SMTP +
+TLS nueva por correo. En la ráfaga de las 8:00 AM eso son cientos de
+handshakes contra el relay.
+
+Este módulo reúne tres piezas:
+  1. Recursos inline (logo_sic, icon_link, ...): la parte MIME se arma UNA vez
+     por proceso y se reutiliza en todos los correos (`adjuntar_recursos_inline`).
+  2. Pool de conexiones SMTP por proceso: `enviar_correo(email_msg)` toma una
+     sesión ya autenticada, envía y la devuelve para el siguiente correo.
+  3. Bandeja de salida (modelo CorreoSaliente): `encolar_correo(...)` guarda el
+     correo y `procesar_bandeja(db_alias)` lo manda por lotes, con límite por
+     minuto y dominio destino y reintentos con espera creciente.
+
+Flujo típico de un correo masivo:
+  1. La tarea llama `encolar_correo(...)` (no toca SMTP).
+  2. Al confirmar la transacción se despierta `notificaciones.procesar_bandeja_correo`
+     con unos segundos de espera, para juntar la ráfaga en un solo lote.
+  3. El worker aparta los pendientes, los envía por una sesión del pool y
+     ejecuta la `accion_enviado` de cada uno (ej. marcar flag + historial).
+"""
+
+import logging
+import queue
+import smtplib
+import threading
+import time
+from datetime import timedelta
+from email.mime.image import MIMEImage
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger('notificaciones')
+
+# ============================================================================
+# RECURSOS INLINE COMPARTIDOS (logo + redes sociales)
+# ============================================================================
+
+# Content-ID → archivo estático. Los templates de correo usan src="cid:<id>".
+RECURSOS_INLINE = {
+    'logo_sic': 'images/logos/logo_sic.png',
+    'icon_link': 'images/utilitys/link.png',
+    'icon_instagram': 'images/utilitys/instagram.png',
+    'icon_facebook': 'images/utilitys/facebook.png',
+    'icon_whatsapp': 'images/utilitys/whatsapp.png',
+}
+
+# Lo que llevan casi todos los correos de marca: logo + 4 iconos sociales
+RECURSOS_CORREO_MARCA = tuple(RECURSOS_INLINE)
+
+# Segundos que se espera antes de procesar la bandeja tras encolar: los
+# correos que llegan en esa ventana salen en el mismo lote.
+ESPERA_DESPERTAR_BANDEJA = 5
+
+# Un correo "enviando" más viejo que esto se considera de un worker caído.
+BLOQUEO_MAXIMO = timedelta(minutes=15)
+
+
+@lru_cache(maxsize=None)
+def parte_inline(cid, ruta_static=None):
+    """
+    Parte MIME de una imagen estática, construida una sola vez por proceso.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El archivo se busca y codifica en base64 la primera vez; las siguientes
+    llamadas devuelven el mismo objeto. Adjuntarlo a varios correos es seguro:
+    al serializar cada correo solo se lee.
+
+    Args:
+        cid (str): Content-ID (sin <>), ej. 'logo_sic'.
+        ruta_static (str | None): ruta dentro de static/. Si es None se toma
+            de RECURSOS_INLINE.
+
+    Returns:
+        MIMEImage | None: None si el archivo no existe.
+    """
+    ruta_static = ruta_static or RECURSOS_INLINE[cid]
+    ruta = finders.find(ruta_static)
+    if not ruta:
+        logger.warning('[CORREO] Recurso inline no encontrado: %s', ruta_static)
+        return None
+
+    subtipo = ruta_static.rsplit('.', 1)[-1].lower().replace('jpg', 'jpeg')
+    with open(ruta, 'rb') as archivo:
+        parte = MIMEImage(archivo.read(), _subtype=subtipo)
+    parte.add_header('Content-ID', f'<{cid}>')
+    parte.add_header('Content-Disposition', 'inline', filename=f'{cid}.{subtipo}')
+    return parte
+
+
+def adjuntar_recursos_inline(email_msg, cids=RECURSOS_CORREO_MARCA, log_prefix='[CORREO]'):
+    """
+    Adjunta logo/iconos (CID inline) desde el caché del proceso.
+
+    Args:
+        email_msg: EmailMessage ya creado.
+        cids: Content-IDs a adjuntar (claves de RECURSOS_INLINE).
+        log_prefix (str): prefijo para el log si un recurso falla.
+
+    Efectos secundarios:
+        La primera vez en el proceso lee los archivos de static/.
+    """
+    for cid in cids:
+        try:
+            parte = parte_inline(cid)
+        except Exception as exc:
+            logger.warning('%s Error al adjuntar %s: %s', log_prefix, cid, exc)
+            continue
+        if parte is not None:
+            email_msg.attach(parte)
+
+
+# ============================================================================
+# POOL DE CONEXIONES SMTP
+# ============================================================================
+
+class PoolConexionesSMTP:
+    """
+    Sesiones SMTP abiertas y reutilizables dentro de un proceso.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    `tomar()` devuelve una conexión ya abierta (TLS + login hechos) o abre una
+    nueva; `devolver()` la guarda para el siguiente envío; `descartar()` la
+    cierra si falló. Las conexiones viejas se cierran solas porque los relays
+    cortan las sesiones ociosas. Si cambian los settings de correo (tests con
+    override_settings) se vacía el pool.
+    """
+
+    def __init__(self):
+        self._libres = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._firma = None
+
+    @staticmethod
+    def _firma_actual():
+        """Settings que identifican a qué servidor apunta una conexión."""
+        return (
+            settings.EMAIL_BACKEND,
+            getattr(settings, 'EMAIL_HOST', ''),
+            getattr(settings, 'EMAIL_PORT', None),
+            getattr(settings, 'EMAIL_HOST_USER', ''),
+        )
+
+    def tomar(self):
+        """
+        Conexión abierta lista para send_messages.
+
+        Returns:
+            Backend de correo de Django con la sesión ya abierta.
+        """
+        firma = self._firma_actual()
+        with self._lock:
+            if firma != self._firma:
+                self._vaciar()
+                self._firma = firma
+
+        edad_maxima = getattr(settings, 'CORREO_CONEXION_MAX_SEGUNDOS', 240)
+        while True:
+            try:
+                conexion = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - conexion._sigma_abierta_en < edad_maxima:
+                return conexion
+            self.descartar(conexion)
+
+        conexion = get_connection(fail_silently=False)
+        conexion.open()
+        conexion._sigma_abierta_en = time.monotonic()
+        conexion._sigma_firma = firma
+        return conexion
+
+    def devolver(self, conexion):
+        """Regresa la conexión al pool (o la cierra si ya está lleno)."""
+        maximo = getattr(settings, 'CORREO_POOL_CONEXIONES', 2)
+        if conexion._sigma_firma == self._firma and self._libres.qsize() < maximo:
+            self._libres.put(conexion)
+        else:
+            self.descartar(conexion)
+
+    @staticmethod
+    def descartar(conexion):
+        """Cierra la conexión sin propagar errores de red."""
+        try:
+            conexion.close()
+        except Exception:
+            pass
+
+    def _vaciar(self):
+        """Cierra todas las conexiones libres."""
+        while True:
+            try:
+                self.descartar(self._libres.get_nowait())
+            except queue.Empty:
+                return
+
+
+_POOL = PoolConexionesSMTP()
+
+
+def enviar_correo(email_msg):
+    """
+    Envía un EmailMessage por una sesión SMTP del pool.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Reemplaza a `email_msg.send(fail_silently=False)`: mismo resultado y mismas
+    excepciones, pero sin abrir una sesión nueva por correo. Si la sesión
+    reutilizada ya la cerró el servidor, se reintenta una vez con otra.
+
+    Args:
+        email_msg: EmailMessage / EmailMultiAlternatives listo.
+
+    Returns:
+        int: correos enviados (1).
+
+    Raises:
+        Las mismas que EmailMessage.send(fail_silently=False).
+    """
+    for intento in (1, 2):
+        conexion = _POOL.tomar()
+        email_msg.connection = conexion
+        try:
+            enviados = email_msg.send()
+        except smtplib.SMTPServerDisconnected:
+            _POOL.descartar(conexion)
+            if intento == 2:
+                raise
+            continue
+        except Exception:
+            _POOL.descartar(conexion)
+            raise
+        finally:
+            email_msg.connection = None
+        _POOL.devolver(conexion)
+        return enviados
+
+
+# ============================================================================
+# BANDEJA DE SALIDA (CorreoSaliente)
+# ============================================================================
+
+def _dominio(direccion):
+    """Dominio en minúsculas de 'Nombre <a@b.com>' o 'a@b.com'."""
+    direccion = (direccion or '').strip().rstrip('>')
+    return direccion.rsplit('@', 1)[-1].lower() if '@' in direccion else ''
+
+
+def encolar_correo(
+    *,
+    asunto,
+    cuerpo_html,
+    para,
+    cc=None,
+    remitente='',
+    recursos_inline=RECURSOS_CORREO_MARCA,
+    referencia='',
+    accion_enviado='',
+    datos_accion=None,
+    using=None,
+):
+    """
+    Guarda un correo HTML en la bandeja de salida del país.
+
+    Args:
+        asunto (str): Asunto del correo.
+        cuerpo_html (str): HTML ya renderizado.
+        para (list[str]): Destinatarios.
+        cc (list[str] | None): Copias.
+        remitente (str): Vacío = DEFAULT_FROM_EMAIL.
+        recursos_inline: Content-IDs de RECURSOS_INLINE a adjuntar al enviar.
+        referencia (str): Texto libre para rastrear el origen.
+        accion_enviado (str): Ruta importable `fn(correo, **datos_accion)` que
+            el worker llama tras enviar (ej. marcar flag + historial).
+        datos_accion (dict | None): kwargs JSON para esa función.
+        using (str | None): alias de BD; None = país activo.
+
+    Returns:
+        CorreoSaliente: fila creada.
+
+    Efectos secundarios:
+        INSERT en CorreoSaliente y, al confirmar la transacción, encola la
+        tarea que procesa la bandeja.
+    """
+    from config.middleware_pais import get_current_db_alias
+    from notificaciones.models import CorreoSaliente
+
+    db_alias = using or get_current_db_alias()
+    para = list(para)
+    correo = CorreoSaliente.objects.using(db_alias).create(
+        asunto=asunto[:255],
+        cuerpo_html=cuerpo_html,
+        remitente=remitente,
+        para=para,
+        cc=list(cc or []),
+        recursos_inline=list(recursos_inline),
+        dominio=_dominio(para[0]) if para else '',
+        referencia=referencia,
+        accion_enviado=accion_enviado,
+        datos_accion=datos_accion or {},
+    )
+    transaction.on_commit(lambda: despertar_bandeja(db_alias), using=db_alias)
+    return correo
+
+
+def despertar_bandeja(db_alias):
+    """
+    Encola el procesamiento de la bandeja, como mucho una vez por ventana.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    cache.add solo gana el primero; el resto de la ráfaga ve la llave y no
+    encola nada: sus correos saldrán en el mismo lote unos segundos después.
+    """
+    if not cache.add(f'correo:despertar:{db_alias}', 1, ESPERA_DESPERTAR_BANDEJA):
+        return
+    try:
+        from notificaciones.tasks import procesar_bandeja_correo_task
+
+        procesar_bandeja_correo_task.apply_async(
+            kwargs={'db_alias': db_alias},
+            countdown=ESPERA_DESPERTAR_BANDEJA,
+        )
+    except Exception as exc:
+        # Sin broker el barrido de cada minuto lo recoge
+        logger.warning('[CORREO] No se pudo encolar la bandeja (%s): %s', db_alias, exc)
+
+
+def _reservar_cupo_dominio(dominio):
+    """
+    ¿Queda cupo este minuto para el dominio? Cuenta el envío si lo hay.
+
+    Returns:
+        bool: False si ya se llegó al límite de CORREO_LIMITES_DOMINIO /
+        CORREO_LIMITE_POR_MINUTO_DOMINIO (0 = sin límite).
+    """
+    limites = getattr(settings, 'CORREO_LIMITES_DOMINIO', {})
+    limite = limites.get(dominio, getattr(settings, 'CORREO_LIMITE_POR_MINUTO_DOMINIO', 60))
+    if not limite:
+        return True
+    clave = f'correo:cupo:{dominio}:{int(time.time() // 60)}'
+    cache.add(clave, 0, 120)
+    try:
+        usados = cache.incr(clave)
+    except ValueError:
+        return True
+    # Con Redis caído (IGNORE_EXCEPTIONS) incr devuelve None: no frenamos.
+    return usados is None or usados <= limite
+
+
+def _es_error_permanente(exc):
+    """Rechazos 5xx o destinatarios inválidos: reintentar no sirve."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    codigo = getattr(exc, 'smtp_code', None)
+    return isinstance(codigo, int) and codigo >= 500
+
+
+def _mensaje_de(correo):
+    """EmailMessage listo para enviar a partir de una fila de la bandeja."""
+    email_msg = EmailMessage(
+        subject=correo.asunto,
+        body=correo.cuerpo_html,
+        from_email=correo.remitente or None,
+        to=correo.para,
+        cc=correo.cc,
+    )
+    email_msg.content_subtype = 'html'
+    adjuntar_recursos_inline(email_msg, correo.recursos_inline)
+    return email_msg
+
+
+def _apartar_pendientes(db_alias, limite):
+    """
+    Marca como 'enviando' los pendientes cuyo turno ya llegó.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    select_for_update(skip_locked=True) hace que dos workers a la vez no tomen
+    el mismo correo. Antes se liberan los 'enviando' de workers caídos.
+
+    Returns:
+        list[CorreoSaliente]: filas apartadas (ya con estado 'enviando').
+    """
+    from notificaciones.models import CorreoSaliente
+
+    ahora = timezone.now()
+    manager = CorreoSaliente.objects.using(db_alias)
+    manager.filter(estado='enviando', bloqueado_desde__lt=ahora - BLOQUEO_MAXIMO).update(
+        estado='pendiente', bloqueado_desde=None,
+    )
+    with transaction.atomic(using=db_alias):
+        ids = list(
+            manager.select_for_update(skip_locked=True)
+            .filter(estado='pendiente', proximo_intento__lte=ahora)
+            .order_by('proximo_intento', 'pk')
+            .values_list('pk', flat=True)[:limite]
+        )
+        manager.filter(pk__in=ids).update(estado='enviando', bloqueado_desde=ahora)
+    return list(manager.filter(pk__in=ids).order_by('proximo_intento', 'pk'))
+
+
+def _registrar_fallo(correo, exc):
+    """Backoff exponencial o 'fallido' si ya no tiene caso reintentar."""
+    intentos = correo.intentos + 1
+    maximo = getattr(settings, 'CORREO_MAX_INTENTOS', 5)
+    base = getattr(settings, 'CORREO_REINTENTO_BASE_SEGUNDOS', 60)
+    cambios = {'intentos': intentos, 'ultimo_error': str(exc)[:2000], 'bloqueado_desde': None}
+    if _es_error_permanente(exc) or intentos >= maximo:
+        cambios['estado'] = 'fallido'
+    else:
+        cambios['estado'] = 'pendiente'
+        cambios['proximo_intento'] = timezone.now() + timedelta(seconds=base * 2 ** (intentos - 1))
+    type(correo).objects.using(correo._state.db).filter(pk=correo.pk).update(**cambios)
+    logger.warning(
+        '[CORREO] Correo %s (%s) %s tras el intento %s: %s',
+        correo.pk, correo.referencia,
+        'descartado' if cambios['estado'] == 'fallido' else 'reprogramado',
+        intentos, exc,
+    )
+    return cambios['estado']
+
+
+def _ejecutar_accion_enviado(correo):
+    """Llama a la acción post-envío; sus errores no deshacen el envío."""
+    if not correo.accion_enviado:
+        return
+    try:
+        import_string(correo.accion_enviado)(correo, **correo.datos_accion)
+    except Exception as exc:
+        logger.error(
+            '[CORREO] Acción %s falló para correo %s: %s',
+            correo.accion_enviado, correo.pk, exc,
+        )
+
+
+def procesar_bandeja(db_alias='default', limite=200):
+    """
+    Envía los pendientes de la bandeja de un país.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    1) Aparta hasta `limite` correos pendientes.
+    2) Los que superan el cupo por minuto de su dominio vuelven a pendiente
+       para el minuto siguiente (sin contar como intento).
+    3) El resto se manda en lotes de CORREO_LOTE: cada lote usa UNA sesión del
+       pool y llama send_messages por correo, para que un destinatario
+       rechazado solo afecte a su propio correo.
+    4) Enviados → estado 'enviado' + acción post-envío; fallidos → backoff.
+
+    Args:
+        db_alias (str): BD del país.
+        limite (int): máximo de correos por corrida.
+
+    Returns:
+        dict: conteos de enviados, reprogramados (cupo) y fallidos/reintentos.
+    """
+    from notificaciones.models import CorreoSaliente
+
+    resultado = {'enviados': 0, 'sin_cupo': 0, 'reintentos': 0, 'fallidos': 0}
+    apartados = _apartar_pendientes(db_alias, limite)
+    if not apartados:
+        return resultado
+
+    manager = CorreoSaliente.objects.using(db_alias)
+    con_cupo, sin_cupo = [], []
+    for correo in apartados:
+        (con_cupo if _reservar_cupo_dominio(correo.dominio) else sin_cupo).append(correo)
+    if sin_cupo:
+        siguiente_minuto = timezone.now().replace(second=0, microsecond=0) + timedelta(minutes=1)
+        manager.filter(pk__in=[c.pk for c in sin_cupo]).update(
+            estado='pendiente', proximo_intento=siguiente_minuto, bloqueado_desde=None,
+        )
+        resultado['sin_cupo'] = len(sin_cupo)
+
+    tamano_lote = max(getattr(settings, 'CORREO_LOTE', 25), 1)
+    for inicio in range(0, len(con_cupo), tamano_lote):
+        lote = con_cupo[inicio:inicio + tamano_lote]
+        conexion = _POOL.tomar()
+        try:
+            for correo in lote:
+                try:
+                    try:
+                        conexion.send_messages([_mensaje_de(correo)])
+                    except smtplib.SMTPServerDisconnected:
+                        # El relay cerró la sesión: una nueva y se reintenta este correo
+                        _POOL.descartar(conexion)
+                        conexion = _POOL.tomar()
+                        conexion.send_messages([_mensaje_de(correo)])
+                except Exception as exc:
+                    estado = _registrar_fallo(correo, exc)
+                    resultado['fallidos' if estado == 'fallido' else 'reintentos'] += 1
+                    continue
+
+                manager.filter(pk=correo.pk).update(
+                    estado='enviado',
+                    fecha_envio=timezone.now(),
+                    intentos=correo.intentos + 1,
+                    ultimo_error='',
+                    bloqueado_desde=None,
+                )
+                resultado['enviados'] += 1
+                _ejecutar_accion_enviado(correo)
+        except Exception:
+            _POOL.descartar(conexion)
+            raise
+        _POOL.devolver(conexion)
+
+    return resultado
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.14 on 2026-10-19 03:50
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notificaciones', '0006_notificacion_categoria'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CorreoSaliente',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('enviando', 'Enviando'), ('enviado', 'Enviado'), ('fallido', 'Fallido')], default='pendiente', max_length=10, verbose_name='Estado')),
+                ('asunto', models.CharField(max_length=255, verbose_name='Asunto')),
+                ('cuerpo_html', models.TextField(verbose_name='Cuerpo HTML')),
+                ('remitente', models.CharField(blank=True, help_text='Vacío = DEFAULT_FROM_EMAIL', max_length=254, verbose_name='Remitente')),
+                ('para', models.JSONField(default=list, verbose_name='Para')),
+                ('cc', models.JSONField(blank=True, default=list, verbose_name='CC')),
+                ('recursos_inline', models.JSONField(blank=True, default=list, help_text='Content-ID de logos/iconos compartidos (ej. logo_sic)', verbose_name='Recursos inline')),
+                ('dominio', models.CharField(blank=True, help_text='Dominio del primer destinatario (límite de envío por dominio)', max_length=253, verbose_name='Dominio destino')),
+                ('referencia', models.CharField(blank=True, help_text='Qué originó el correo (ej. recordatorio_encuesta:15)', max_length=120, verbose_name='Referencia')),
+                ('accion_enviado', models.CharField(blank=True, help_text='Ruta de la función a llamar tras el envío (ej. marcar flag + historial)', max_length=200, verbose_name='Acción al enviar')),
+                ('datos_accion', models.JSONField(blank=True, default=dict, verbose_name='Datos de la acción')),
+                ('intentos', models.PositiveSmallIntegerField(default=0, verbose_name='Intentos')),
+                ('proximo_intento', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Próximo intento')),
+                ('bloqueado_desde', models.DateTimeField(blank=True, help_text='Cuándo lo tomó un worker (para recuperar envíos colgados)', null=True, verbose_name='Apartado desde')),
+                ('ultimo_error', models.TextField(blank=True, verbose_name='Último error')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('fecha_envio', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de envío')),
+            ],
+            options={
+                'verbose_name': 'Correo saliente',
+                'verbose_name_plural': 'Bandeja de salida de correos',
+                'ordering': ['-fecha_creacion'],
+                'indexes': [models.Index(fields=['estado', 'proximo_intento'], name='idx_correo_estado_intento')],
+            },
+        ),
+    ]
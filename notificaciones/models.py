@@ -18,10 +18,14 @@ Campos principales:
 - usuario  : Quién debe ver esta notificación (el que disparó la tarea)
 - task_id  : ID de la tarea Celery (para rastreo técnico)
 - app_origen: De qué módulo viene (ej: "servicio_tecnico")
+
+También vive aquí CorreoSaliente: la bandeja de salida de correos que
+procesa el worker de correo (ver correo_service.py).
 """
 
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class Notificacion(models.Model):
@@ -278,3 +282,97 @@ class PushSubscriptionCliente(models.Model):
 
     def __str__(self):
         return f"Push cliente [{self.enlace.token[:8]}...] — {'activa' if self.activa else 'inactiva'}"
+
+
+class CorreoSaliente(models.Model):
+    """
+    Bandeja de salida de correos (outbox) enviada por un worker con SMTP reutilizado.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    En vez de que cada tarea abra su propia sesión SMTP + TLS, la tarea guarda
+    aquí el correo ya armado y el worker `notificaciones.procesar_bandeja_correo`
+    los manda por lotes usando conexiones que se quedan abiertas.
+
+    Ciclo de vida:
+    - pendiente → enviando (el worker lo apartó) → enviado
+    - Si falla: vuelve a pendiente con `proximo_intento` más lejano (backoff)
+      hasta agotar los intentos; entonces queda en fallido.
+
+    Los logos/iconos no se guardan: `recursos_inline` lista los Content-ID
+    que el worker adjunta desde el caché de partes MIME del proceso.
+    """
+
+    ESTADO_CHOICES = [
+        ('pendiente', 'Pendiente'),
+        ('enviando', 'Enviando'),
+        ('enviado', 'Enviado'),
+        ('fallido', 'Fallido'),
+    ]
+
+    estado = models.CharField(
+        max_length=10,
+        choices=ESTADO_CHOICES,
+        default='pendiente',
+        verbose_name="Estado",
+    )
+    asunto = models.CharField(max_length=255, verbose_name="Asunto")
+    cuerpo_html = models.TextField(verbose_name="Cuerpo HTML")
+    remitente = models.CharField(
+        max_length=254,
+        blank=True,
+        verbose_name="Remitente",
+        help_text="Vacío = DEFAULT_FROM_EMAIL",
+    )
+    para = models.JSONField(default=list, verbose_name="Para")
+    cc = models.JSONField(default=list, blank=True, verbose_name="CC")
+    recursos_inline = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Recursos inline",
+        help_text="Content-ID de logos/iconos compartidos (ej. logo_sic)",
+    )
+    dominio = models.CharField(
+        max_length=253,
+        blank=True,
+        verbose_name="Dominio destino",
+        help_text="Dominio del primer destinatario (límite de envío por dominio)",
+    )
+    referencia = models.CharField(
+        max_length=120,
+        blank=True,
+        verbose_name="Referencia",
+        help_text="Qué originó el correo (ej. recordatorio_encuesta:15)",
+    )
+    accion_enviado = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name="Acción al enviar",
+        help_text="Ruta de la función a llamar tras el envío (ej. marcar flag + historial)",
+    )
+    datos_accion = models.JSONField(default=dict, blank=True, verbose_name="Datos de la acción")
+    intentos = models.PositiveSmallIntegerField(default=0, verbose_name="Intentos")
+    proximo_intento = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Próximo intento",
+    )
+    bloqueado_desde = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Apartado desde",
+        help_text="Cuándo lo tomó un worker (para recuperar envíos colgados)",
+    )
+    ultimo_error = models.TextField(blank=True, verbose_name="Último error")
+    fecha_creacion = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de creación")
+    fecha_envio = models.DateTimeField(null=True, blank=True, verbose_name="Fecha de envío")
+
+    class Meta:
+        verbose_name = "Correo saliente"
+        verbose_name_plural = "Bandeja de salida de correos"
+        ordering = ['-fecha_creacion']
+        indexes = [
+            # El worker busca pendientes cuyo próximo intento ya llegó
+            models.Index(fields=['estado', 'proximo_intento'], name='idx_correo_estado_intento'),
+        ]
+
+    def __str__(self):
+        return f"[{self.get_estado_display()}] {self.asunto} → {', '.join(self.para)}"
@@ -89,3 +89,40 @@ def limpiar_notificaciones_antiguas(dias=7):
         'fecha_limite': fecha_limite.isoformat(),
         'paises_procesados': list(PAISES_CONFIG.keys()),
     }
+
+
+@shared_task(
+    name='notificaciones.procesar_bandeja_correo',
+    ignore_result=True,
+)
+def procesar_bandeja_correo_task(db_alias=None):
+    """
+    Envía los correos pendientes de la bandeja de salida (CorreoSaliente).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    - Con db_alias: la encola encolar_correo() al confirmar la transacción,
+      unos segundos después, para mandar la ráfaga en un solo lote.
+    - Sin db_alias: la corre Celery Beat cada minuto y barre TODOS los países
+      en paralelo (reintentos con espera, correos que se quedaron sin cupo...).
+
+    Args:
+        db_alias (str | None): BD del país; None = todos los países.
+
+    Returns:
+        dict: conteos por país (enviados, sin_cupo, reintentos, fallidos).
+    """
+    from config.middleware_pais import en_todos_los_paises, get_current_db_alias
+    from .correo_service import procesar_bandeja
+
+    # Todos los países a la vez; un país con problemas no detiene a los
+    # demás (en_todos_los_paises registra su error y sigue)
+    resultados, _errores = en_todos_los_paises(
+        lambda: procesar_bandeja(get_current_db_alias()),
+        paises=[db_alias] if db_alias else None,
+    )
+
+    for nombre, resultado in resultados.items():
+        if any(resultado.values()):
+            logger.info(f"[CORREO] [{nombre}] Bandeja procesada: {resultado}")
+
+    return resultados
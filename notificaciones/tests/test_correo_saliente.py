@@ -0,0 +1,251 @@
+"""
+Tests de la bandeja de salida de correo (CorreoSaliente) y su pool SMTP.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) Logo e iconos se leen de static/ una vez por proceso, no por correo.
+2) Varios envíos reutilizan la misma conexión SMTP del pool.
+3) La bandeja manda los pendientes, adjunta los recursos inline y ejecuta
+   la acción post-envío (ej. marcar el recordatorio de encuesta).
+4) El cupo por dominio deja para el minuto siguiente lo que se pasa.
+5) Error temporal → reintento con espera; rechazo permanente → fallido.
+"""
+
+import smtplib
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles import finders
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from notificaciones import correo_service
+from notificaciones.correo_service import (
+    RECURSOS_CORREO_MARCA,
+    adjuntar_recursos_inline,
+    encolar_correo,
+    enviar_correo,
+    parte_inline,
+    procesar_bandeja,
+)
+from notificaciones.models import CorreoSaliente
+from servicio_tecnico.models import DetalleEquipo, FeedbackCliente, HistorialOrden, OrdenServicio
+from servicio_tecnico.tasks import enviar_recordatorio_encuesta_task
+
+User = get_user_model()
+
+CACHE_LOCAL = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+STORAGES_TEST = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# Llamadas a la acción post-envío de prueba (ver registrar_envio_prueba)
+ENVIOS_REGISTRADOS = []
+
+
+def registrar_envio_prueba(correo, etiqueta):
+    """Acción post-envío usada por los tests: solo anota qué se envió."""
+    ENVIOS_REGISTRADOS.append((correo.pk, etiqueta))
+
+
+def _content_ids(mensaje):
+    """Content-ID de las partes inline de un EmailMessage ya enviado."""
+    return {
+        parte['Content-ID'].strip('<>')
+        for parte in mensaje.message().walk()
+        if parte['Content-ID']
+    }
+
+
+@override_settings(CACHES=CACHE_LOCAL, STORAGES=STORAGES_TEST)
+class CorreoSalienteTestBase(TestCase):
+    """Limpia caché, pool y recursos inline entre tests."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        cache.clear()
+        parte_inline.cache_clear()
+        correo_service._POOL._vaciar()
+        ENVIOS_REGISTRADOS.clear()
+
+    def _encolar(self, para='cliente@test.local', **extra):
+        """Correo pendiente mínimo en la BD default."""
+        return encolar_correo(
+            asunto='Prueba bandeja',
+            cuerpo_html='<p>Hola <img src="cid:logo_sic"></p>',
+            para=[para],
+            using='default',
+            **extra,
+        )
+
+
+class RecursosInlineYPoolTest(CorreoSalienteTestBase):
+    """Partes MIME compartidas y reutilización de la conexión."""
+
+    def test_recursos_inline_se_leen_una_vez_por_proceso(self):
+        with patch.object(correo_service.finders, 'find', wraps=finders.find) as find:
+            for destino in ('a@test.local', 'b@test.local'):
+                email_msg = EmailMessage('Asunto', '<p>x</p>', to=[destino])
+                email_msg.content_subtype = 'html'
+                adjuntar_recursos_inline(email_msg)
+                enviar_correo(email_msg)
+
+        self.assertEqual(find.call_count, len(RECURSOS_CORREO_MARCA))
+        self.assertEqual(len(mail.outbox), 2)
+        for enviado in mail.outbox:
+            self.assertEqual(_content_ids(enviado), set(RECURSOS_CORREO_MARCA))
+
+    def test_envios_seguidos_reutilizan_la_conexion(self):
+        with patch.object(correo_service, 'get_connection', wraps=get_connection) as conexiones:
+            for n in range(3):
+                enviar_correo(EmailMessage(f'Asunto {n}', 'x', to=['a@test.local']))
+
+        self.assertEqual(conexiones.call_count, 1)
+        self.assertEqual(len(mail.outbox), 3)
+
+
+class ProcesarBandejaTest(CorreoSalienteTestBase):
+    """Envío por lotes, cupo por dominio y reintentos."""
+
+    def test_bandeja_envia_pendientes_y_ejecuta_accion(self):
+        correos = [
+            self._encolar(
+                para=f'cliente{n}@test.local',
+                accion_enviado='notificaciones.tests.test_correo_saliente.registrar_envio_prueba',
+                datos_accion={'etiqueta': f'c{n}'},
+            )
+            for n in range(2)
+        ]
+
+        resultado = procesar_bandeja('default')
+
+        self.assertEqual(resultado['enviados'], 2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(_content_ids(mail.outbox[0]), set(RECURSOS_CORREO_MARCA))
+        self.assertEqual(
+            sorted(ENVIOS_REGISTRADOS),
+            sorted((c.pk, f'c{n}') for n, c in enumerate(correos)),
+        )
+        estados = set(CorreoSaliente.objects.values_list('estado', flat=True))
+        self.assertEqual(estados, {'enviado'})
+        # Ya enviados: una segunda pasada no repite nada
+        self.assertEqual(procesar_bandeja('default')['enviados'], 0)
+
+    @override_settings(CORREO_LIMITES_DOMINIO={'test.local': 1})
+    def test_cupo_por_dominio_reprograma_sin_contar_intento(self):
+        self._encolar(para='uno@test.local')
+        segundo = self._encolar(para='dos@test.local')
+
+        resultado = procesar_bandeja('default')
+
+        self.assertEqual(resultado['enviados'], 1)
+        self.assertEqual(resultado['sin_cupo'], 1)
+        segundo.refresh_from_db()
+        self.assertEqual(segundo.estado, 'pendiente')
+        self.assertEqual(segundo.intentos, 0)
+        self.assertGreater(segundo.proximo_intento, timezone.now())
+
+    @override_settings(CORREO_REINTENTO_BASE_SEGUNDOS=60)
+    def test_error_temporal_reprograma_con_backoff(self):
+        correo = self._encolar()
+        error = smtplib.SMTPDataError(451, b'Try again later')
+
+        with patch.object(EmailBackend, 'send_messages', side_effect=error):
+            resultado = procesar_bandeja('default')
+
+        self.assertEqual(resultado['reintentos'], 1)
+        correo.refresh_from_db()
+        self.assertEqual(correo.estado, 'pendiente')
+        self.assertEqual(correo.intentos, 1)
+        self.assertGreater(correo.proximo_intento, timezone.now() + timedelta(seconds=50))
+        self.assertIn('Try again later', correo.ultimo_error)
+
+    def test_rechazo_permanente_queda_fallido(self):
+        correo = self._encolar()
+        error = smtplib.SMTPRecipientsRefused({'cliente@test.local': (550, b'No such user')})
+
+        with patch.object(EmailBackend, 'send_messages', side_effect=error):
+            resultado = procesar_bandeja('default')
+
+        self.assertEqual(resultado['fallidos'], 1)
+        correo.refresh_from_db()
+        self.assertEqual(correo.estado, 'fallido')
+
+
+class RecordatorioEncuestaBandejaTest(CorreoSalienteTestBase):
+    """El recordatorio de las 8:00 AM pasa por la bandeja."""
+
+    def setUp(self):
+        super().setUp()
+        sucursal = Sucursal.objects.create(nombre='Sucursal Bandeja', ciudad='CDMX')
+        user = User.objects.create_user(username='tec_bandeja', password='x')
+        tecnico = Empleado.objects.create(
+            nombre_completo='Técnico Bandeja',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='tec.bandeja@test.local',
+            sucursal=sucursal,
+            user=user,
+            rol='tecnico',
+        )
+        self.orden = OrdenServicio.objects.create(
+            sucursal=sucursal,
+            tipo_servicio='diagnostico',
+            estado='entregado',
+            tecnico_asignado_actual=tecnico,
+        )
+        DetalleEquipo.objects.create(
+            orden=self.orden,
+            orden_cliente='OOW-BANDEJA-01',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie='SN-BANDEJA-01',
+            email_cliente='cliente.bandeja@test.local',
+            falla_principal='No enciende',
+        )
+        self.feedback = FeedbackCliente.objects.create(
+            orden=self.orden,
+            token='token-bandeja-recordatorio',
+            tipo='satisfaccion',
+            correo_enviado=True,
+            enviado_por=tecnico,
+        )
+
+    def test_recordatorio_se_encola_y_se_marca_al_enviar(self):
+        resultado = enviar_recordatorio_encuesta_task(self.feedback.pk)
+
+        self.assertTrue(resultado['success'])
+        self.assertEqual(len(mail.outbox), 0)
+        self.feedback.refresh_from_db()
+        self.assertFalse(self.feedback.recordatorio_enviado)
+        # Mientras siga en la bandeja no se encola otra vez
+        self.assertFalse(enviar_recordatorio_encuesta_task(self.feedback.pk)['success'])
+        self.assertEqual(CorreoSaliente.objects.count(), 1)
+
+        procesar_bandeja('default')
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['cliente.bandeja@test.local'])
+        self.feedback.refresh_from_db()
+        self.assertTrue(self.feedback.recordatorio_enviado)
+        self.assertTrue(
+            HistorialOrden.objects.filter(
+                orden=self.orden,
+                tipo_evento='email',
+                comentario__contains='Recordatorio de encuesta',
+            ).exists()
+        )
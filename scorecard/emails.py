@@ -6,6 +6,7 @@ from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
+from notificaciones.correo_service import enviar_correo
 from .models import NotificacionIncidencia
 from PIL import Image
 from io import BytesIO
@@ -247,7 +248,7 @@ def enviar_notificacion_incidencia(incidencia, destinatarios_seleccionados, mens
                 continue
         
         # Enviar el email
-        email.send(fail_silently=False)
+        enviar_correo(email)
         
         # Mensaje de éxito con información de imágenes
         mensaje_exito = f'Notificación enviada exitosamente a {len(emails_destinatarios)} destinatario(s)'
@@ -510,7 +511,7 @@ def enviar_notificacion_no_atribuible(incidencia, justificacion, marcado_por='Si
         email.attach_alternative(html_content, "text/html")
         
         # Enviar
-        email.send(fail_silently=False)
+        enviar_correo(email)
         
         # Mensaje de éxito
         mensaje_exito = f'Notificación enviada a {len(emails_destinatarios)} destinatario(s)'
@@ -637,7 +638,7 @@ def enviar_notificacion_cierre_incidencia(incidencia, mensaje_adicional='', envi
         email.attach_alternative(html_content, "text/html")
         
         # Enviar
-        email.send(fail_silently=False)
+        enviar_correo(email)
         
         # Mensaje de éxito
         mensaje_exito = f'Notificación enviada a {len(emails_destinatarios)} destinatario(s)'
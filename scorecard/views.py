@@ -14,6 +14,7 @@ from .models import Incidencia, CategoriaIncidencia, ComponenteEquipo, Evidencia
 from .forms import IncidenciaForm, EvidenciaIncidenciaForm
 from .emails import enviar_notificacion_incidencia, obtener_destinatarios_disponibles
 from inventario.models import Empleado, Sucursal
+from inventario.autorizacion import snapshot_de
 from datetime import datetime, timedelta
 from collections import defaultdict
 import json
@@ -37,7 +38,7 @@ def permission_required_with_message(perm, message=None):
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
-            if not request.user.has_perm(perm):
+            if not snapshot_de(request).tiene_permiso(perm):
                 error_msg = message or f'No tienes permisos para realizar esta acción.'
                 # Redirigir a página de acceso denegado con el mensaje
                 return redirect(f"{reverse('scorecard:acceso_denegado_scorecard')}?mensaje={error_msg}&permiso={perm}")
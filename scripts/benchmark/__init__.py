@@ -0,0 +1,31 @@
+"""
+Benchmarks de rendimiento con datos sintéticos por país
+=======================================================
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Los scripts de scripts/testing prueban que algo FUNCIONA; no dicen cuánto
+TARDA con el volumen de producción. Este paquete sirve para eso:
+
+1. `datos.py`     → genera órdenes, cotizaciones con piezas, historial,
+                    metadatos de imágenes, eventos de seguimiento,
+                    encuestas, incidencias y unidades de almacén. Con la
+                    misma semilla y escala produce SIEMPRE los mismos datos.
+2. `casos.py`     → los caminos calientes a medir: dashboards, exportes,
+                    búsquedas, PDF y la selección de las tareas de Celery Beat.
+3. `medicion.py`  → mide tiempo, consultas SQL y pico de memoria (RSS) de
+                    cada caso, guarda el resultado en JSON y compara dos
+                    corridas marcando las regresiones.
+
+Uso (desde la raíz del proyecto):
+    python -m scripts.benchmark generar --pais mexico --escala mediana
+    python -m scripts.benchmark correr --pais mexico --salida antes.json
+    ... (cambios en el código) ...
+    python -m scripts.benchmark correr --pais mexico --salida despues.json
+    python -m scripts.benchmark comparar antes.json despues.json
+    python -m scripts.benchmark limpiar --pais mexico
+
+Todos los datos generados llevan el prefijo PREFIJO ('BN-') en su número de
+orden / folio / código para poder borrarlos sin tocar datos reales.
+NUNCA correr `generar` contra una base de producción.
+"""
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Línea de comandos del benchmark (ver scripts/benchmark/__init__.py).
+
+    python -m scripts.benchmark generar  --pais mexico --escala mediana [--semilla 0] [--hasta 2026-06-30]
+    python -m scripts.benchmark correr   --pais mexico --salida resultados.json [--grupo dashboards] [--caso X]
+    python -m scripts.benchmark comparar antes.json despues.json [--tolerancia 0.2]
+    python -m scripts.benchmark listar
+    python -m scripts.benchmark limpiar  --pais mexico
+
+`comparar` termina con código 1 si hay regresiones (sirve en CI).
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date
+
+
+def _configurar_django():
+    import django
+
+    sys.path.insert(0, os.getcwd())
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+
+
+def _parser():
+    from .datos import ESCALAS
+    from .medicion import TOLERANCIA_RSS, TOLERANCIA_TIEMPO
+
+    parser = argparse.ArgumentParser(prog='python -m scripts.benchmark', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    generar = sub.add_parser('generar', help='Llena la BD de un país con datos sintéticos')
+    generar.add_argument('--pais', action='append', required=True, help='Repetible: --pais mexico --pais chile')
+    generar.add_argument('--escala', default='chica', help=f'{", ".join(ESCALAS)} o un número de órdenes')
+    generar.add_argument('--semilla', type=int, default=0)
+    generar.add_argument('--hasta', type=date.fromisoformat, help='Fecha más reciente de los datos (AAAA-MM-DD)')
+
+    limpiar = sub.add_parser('limpiar', help='Borra los datos sintéticos de un país')
+    limpiar.add_argument('--pais', action='append', required=True)
+
+    correr = sub.add_parser('correr', help='Mide los casos y guarda el resultado en JSON')
+    correr.add_argument('--pais', default='mexico')
+    correr.add_argument('--salida', required=True, help='Archivo JSON de resultados')
+    correr.add_argument('--caso', action='append', help='Solo estos casos (repetible)')
+    correr.add_argument('--grupo', action='append', help='Solo estos grupos (repetible)')
+    correr.add_argument('--repeticiones', type=int, default=3)
+    correr.add_argument('--calentamiento', type=int, default=1)
+    correr.add_argument('--mismo-proceso', action='store_true',
+                        help='Más rápido, pero el pico de RSS acumula los casos anteriores')
+
+    caso = sub.add_parser('caso', help='(interno) Mide un caso y escribe su JSON en stdout')
+    caso.add_argument('nombre')
+    caso.add_argument('--pais', default='mexico')
+    caso.add_argument('--repeticiones', type=int, default=3)
+    caso.add_argument('--calentamiento', type=int, default=1)
+
+    comparar = sub.add_parser('comparar', help='Compara dos resultados y marca regresiones')
+    comparar.add_argument('antes')
+    comparar.add_argument('despues')
+    comparar.add_argument('--tolerancia', type=float, default=TOLERANCIA_TIEMPO, help='Tiempo: fracción (0.2 = +20%%)')
+    comparar.add_argument('--tolerancia-consultas', type=int, default=0)
+    comparar.add_argument('--tolerancia-rss', type=float, default=TOLERANCIA_RSS)
+
+    sub.add_parser('listar', help='Muestra los casos disponibles')
+    return parser
+
+
+def _imprimir_comparacion(filas):
+    marcas = {'regresion': '✗ REGRESIÓN', 'mejora': '✓ mejora', 'igual': ''}
+    for fila in filas:
+        cambio = f'{fila["cambio"]:+.1%}' if fila['cambio'] is not None else ''
+        print(f'  {fila["caso"]:<38} {fila["metrica"]:<18} {fila["antes"]!s:>10} → {fila["despues"]!s:<10} '
+              f'{cambio:>8} {marcas[fila["estado"]]}')
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+
+    if args.comando == 'comparar':
+        from .medicion import cargar, comparar
+
+        filas = comparar(
+            cargar(args.antes), cargar(args.despues),
+            tolerancia_tiempo=args.tolerancia,
+            tolerancia_consultas=args.tolerancia_consultas,
+            tolerancia_rss=args.tolerancia_rss,
+        )
+        _imprimir_comparacion(filas)
+        regresiones = [fila for fila in filas if fila['estado'] == 'regresion']
+        print(f'\n{len(regresiones)} regresión(es) en {len({fila["caso"] for fila in filas})} caso(s)')
+        return 1 if regresiones else 0
+
+    _configurar_django()
+
+    if args.comando == 'generar':
+        from .datos import generar
+
+        escala = int(args.escala) if args.escala.isdigit() else args.escala
+        for subdominio in args.pais:
+            print(f'Generando escala {args.escala} en {subdominio} (semilla {args.semilla})...')
+            totales = generar(subdominio, escala, semilla=args.semilla, hasta=args.hasta)
+            print(json.dumps(totales, indent=2))
+    elif args.comando == 'limpiar':
+        from .datos import limpiar
+
+        for subdominio in args.pais:
+            limpiar(subdominio)
+    elif args.comando == 'listar':
+        from .casos import CASOS
+
+        for nombre, (grupo, _) in CASOS.items():
+            print(f'  {grupo:<12} {nombre}')
+    elif args.comando == 'caso':
+        from .medicion import medir_caso
+
+        print(json.dumps(medir_caso(args.nombre, args.pais, args.repeticiones, args.calentamiento)))
+    elif args.comando == 'correr':
+        from .medicion import correr, guardar
+
+        print(f'Midiendo en {args.pais}...')
+        resultado = correr(
+            args.pais, nombres=args.caso, grupos=args.grupo,
+            repeticiones=args.repeticiones, calentamiento=args.calentamiento,
+            aislado=not args.mismo_proceso,
+        )
+        guardar(resultado, args.salida)
+        print(f'Resultados en {args.salida}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Caminos calientes que mide el benchmark.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Cada caso es una función que recibe el Contexto (cliente HTTP con sesión
+de administrador, país activo) y hace UNA vez el trabajo a medir. Los casos
+de pantallas pasan por el Client de Django con el Host del país, así se mide
+lo mismo que ve el usuario: middlewares, vista, consultas y plantilla.
+
+Todos los casos son de SOLO LECTURA: se pueden repetir sin cambiar los datos.
+Las tareas de Celery Beat se miden en su parte de selección (qué hay que
+avisar); el envío a la cola se reemplaza por un contador.
+
+Para agregar un caso:
+    @caso('dashboard_nuevo', 'dashboards')
+    def _dashboard_nuevo(ctx):
+        ctx.get('servicio_tecnico:dashboard_nuevo')
+"""
+
+from unittest.mock import patch
+
+from django.test import Client
+from django.urls import reverse
+
+# nombre → (grupo, función)
+CASOS = {}
+
+GRUPOS = ('dashboards', 'exportes', 'busqueda', 'pdf', 'beat')
+
+
+def caso(nombre, grupo):
+    """Registra una función como caso de benchmark."""
+    def registrar(funcion):
+        CASOS[nombre] = (grupo, funcion)
+        return funcion
+    return registrar
+
+
+class Contexto:
+    """
+    Cliente autenticado en el país del benchmark.
+
+    Args:
+        subdominio (str): país ('mexico', 'argentina', ...).
+        usuario: superusuario con el que se navega (ver datos.USUARIO_ADMIN).
+    """
+
+    def __init__(self, subdominio, usuario):
+        self.subdominio = subdominio
+        self.client = Client(HTTP_HOST=f'{subdominio}.benchmark.local')
+        self.client.force_login(usuario)
+
+    def get(self, nombre_url, **params):
+        """
+        GET a una URL con nombre; consume la respuesta completa.
+
+        Raises:
+            RuntimeError: si la respuesta no es 2xx (el caso queda con error).
+        """
+        url = reverse(nombre_url)
+        respuesta = self.client.get(url, params, secure=True)
+        if respuesta.status_code >= 300:
+            raise RuntimeError(f'{url} respondió {respuesta.status_code}')
+        if respuesta.streaming:
+            return sum(len(parte) for parte in respuesta.streaming_content)
+        return len(respuesta.content)
+
+
+def casos_seleccionados(nombres=None, grupos=None):
+    """Nombres de casos a correr (todos si no se filtra), en orden de registro."""
+    return [
+        nombre for nombre, (grupo, _) in CASOS.items()
+        if (not nombres or nombre in nombres) and (not grupos or grupo in grupos)
+    ]
+
+
+# ── Dashboards ──────────────────────────────────────────────────────────────
+
+@caso('dashboard_encuestas_paneles', 'dashboards')
+def _dashboard_encuestas_paneles(ctx):
+    ctx.get('servicio_tecnico:api_encuestas_paneles')
+
+
+@caso('dashboard_feedback_rechazo_paneles', 'dashboards')
+def _dashboard_feedback_rechazo_paneles(ctx):
+    ctx.get('servicio_tecnico:api_feedback_rechazo_paneles')
+
+
+@caso('dashboard_rhitso', 'dashboards')
+def _dashboard_rhitso(ctx):
+    ctx.get('servicio_tecnico:dashboard_rhitso')
+
+
+@caso('dashboard_oow_fl', 'dashboards')
+def _dashboard_oow_fl(ctx):
+    ctx.get('servicio_tecnico:dashboard_seguimiento_oow_fl')
+
+
+@caso('dashboard_cotizaciones', 'dashboards')
+def _dashboard_cotizaciones(ctx):
+    ctx.get('servicio_tecnico:dashboard_cotizaciones')
+
+
+@caso('dashboard_consolidado', 'dashboards')
+def _dashboard_consolidado(ctx):
+    ctx.get('servicio_tecnico:dashboard_consolidado')
+
+
+@caso('lista_ordenes_activas', 'dashboards')
+def _lista_ordenes_activas(ctx):
+    ctx.get('servicio_tecnico:lista_activas')
+
+
+@caso('scorecard_datos_dashboard', 'dashboards')
+def _scorecard_datos_dashboard(ctx):
+    ctx.get('scorecard:api_datos_dashboard')
+
+
+@caso('almacen_dashboard', 'dashboards')
+def _almacen_dashboard(ctx):
+    ctx.get('almacen:dashboard_almacen')
+
+
+# ── Exportes ────────────────────────────────────────────────────────────────
+
+@caso('excel_encuestas', 'exportes')
+def _excel_encuestas(ctx):
+    ctx.get('servicio_tecnico:exportar_encuestas_excel')
+
+
+@caso('excel_rhitso', 'exportes')
+def _excel_rhitso(ctx):
+    ctx.get('servicio_tecnico:exportar_excel_rhitso')
+
+
+@caso('excel_oow_fl', 'exportes')
+def _excel_oow_fl(ctx):
+    ctx.get('servicio_tecnico:exportar_excel_dashboard_oow_fl')
+
+
+@caso('excel_cotizaciones', 'exportes')
+def _excel_cotizaciones(ctx):
+    ctx.get('servicio_tecnico:exportar_dashboard_cotizaciones')
+
+
+# ── Búsqueda ────────────────────────────────────────────────────────────────
+
+@caso('buscar_ordenes_autocomplete', 'busqueda')
+def _buscar_ordenes_autocomplete(ctx):
+    for texto in ('OOW-00000', 'SN000001', 'BN-0000012'):
+        ctx.get('servicio_tecnico:api_buscar_ordenes_autocomplete', q=texto, tipo='activas')
+
+
+@caso('buscar_orden_por_serie', 'busqueda')
+def _buscar_orden_por_serie(ctx):
+    ctx.get('servicio_tecnico:api_buscar_orden_por_serie', numero_serie='SN0000000150')
+
+
+# ── PDF ─────────────────────────────────────────────────────────────────────
+
+@caso('pdf_encuestas', 'pdf')
+def _pdf_encuestas(ctx):
+    ctx.get('servicio_tecnico:exportar_encuestas_pdf')
+
+
+@caso('pdf_feedback_rechazo', 'pdf')
+def _pdf_feedback_rechazo(ctx):
+    ctx.get('servicio_tecnico:exportar_feedback_rechazo_pdf')
+
+
+# ── Celery Beat (selección, sin encolar) ────────────────────────────────────
+
+@caso('beat_recordatorios_imagenes', 'beat')
+def _beat_recordatorios_imagenes(ctx):
+    from config.middleware_pais import get_current_db_alias, pais
+    from servicio_tecnico.utils_recordatorio_imagenes import recordatorios_pendientes_pais
+
+    with pais(ctx.subdominio):
+        recordatorios_pendientes_pais(get_current_db_alias())
+
+
+@caso('beat_recordatorios_encuestas', 'beat')
+def _beat_recordatorios_encuestas(ctx):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from config.middleware_pais import pais
+    from servicio_tecnico import tasks
+
+    ahora = timezone.now()
+    with pais(ctx.subdominio), patch.object(tasks, 'despachar_en_lotes', return_value=0):
+        tasks._encolar_recordatorios_encuesta_pais(ahora - timedelta(days=12), ahora - timedelta(days=10))
@@ -0,0 +1,479 @@
+"""
+Generador determinista de datos sintéticos para benchmarks.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+- Determinista: cada bloque de órdenes usa su propio random.Random con una
+  semilla derivada de (semilla, país, número de bloque). Con los mismos
+  parámetros, dos corridas generan exactamente los mismos datos, aunque se
+  generen en otro orden o se interrumpa y se vuelva a empezar.
+- Escalable: se inserta con bulk_create en bloques de TAMANO_BLOQUE órdenes
+  (y todas sus filas hijas), una transacción por bloque. La memoria no
+  crece con la escala.
+- Por país: todo corre dentro de pais(subdominio), así que cada país llena
+  su propia base de datos.
+
+Filas por orden (promedio): ver POR_ORDEN y PROPORCIONES. Con la escala
+'produccion' (1.000.000 de órdenes) son ~15 millones de filas por país.
+"""
+
+import random
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+# Órdenes por país según la escala
+ESCALAS = {
+    'mini': 200,
+    'chica': 5_000,
+    'mediana': 50_000,
+    'grande': 250_000,
+    'produccion': 1_000_000,
+}
+
+# Filas hijas promedio por orden
+POR_ORDEN = {
+    'historial': 6,
+    'imagenes': 4,
+    'eventos_seguimiento': 3,
+    'piezas_por_cotizacion': 2,
+}
+
+# Fracción de órdenes que tienen cada cosa
+PROPORCIONES = {
+    'cotizacion': 0.6,
+    'enlace_seguimiento': 0.7,
+    'encuesta': 0.5,
+    'feedback_rechazo': 0.15,
+    'rhitso': 0.1,
+    'incidencia': 0.05,
+    'unidad_almacen': 0.2,
+}
+
+# Prefijo de todo lo generado (número de orden, folios, códigos, usuarios)
+PREFIJO = 'BN-'
+
+TAMANO_BLOQUE = 2_000
+
+# Días hacia atrás que cubren los datos
+DIAS_HISTORIA = 730
+
+SUCURSALES = 3
+TECNICOS = 12
+PRODUCTOS_ALMACEN = 40
+COMPONENTES = ('Pantalla', 'Teclado', 'Batería', 'Disco SSD', 'Memoria RAM', 'Tarjeta madre', 'Ventilador')
+FALLAS = ('No enciende', 'Pantalla rota', 'Se calienta', 'Teclado falla', 'Lento', 'No carga')
+COMENTARIOS = ('Excelente servicio', 'Tardaron mucho', 'Muy caro', 'Buena atención', 'Todo bien')
+
+USUARIO_ADMIN = f'{PREFIJO.lower()}admin'
+
+
+def _opciones(modelo, campo):
+    """Valores válidos de un campo con choices (siguen al modelo si cambia)."""
+    return [valor for valor, _ in modelo._meta.get_field(campo).choices if valor != '']
+
+
+@contextmanager
+def _fechas_manuales(*modelos):
+    """
+    Hace que auto_now/auto_now_add respeten la fecha puesta a mano.
+
+    EXPLICACIÓN: bulk_create pisa los campos auto_now_add con "ahora"; para
+    tener una historia de dos años hay que poner las fechas a mano. Mientras
+    dura el bloque, esos campos solo se llenan con "ahora" si quedaron vacíos.
+    """
+    campos = [
+        campo for modelo in modelos for campo in modelo._meta.concrete_fields
+        if getattr(campo, 'auto_now', False) or getattr(campo, 'auto_now_add', False)
+    ]
+
+    def respetar_valor(campo):
+        pre_save_original = campo.pre_save
+
+        def pre_save(instancia, add):
+            valor = getattr(instancia, campo.attname)
+            return valor if valor is not None else pre_save_original(instancia, add)
+        return pre_save
+
+    for campo in campos:
+        campo.pre_save = respetar_valor(campo)
+    try:
+        yield
+    finally:
+        for campo in campos:
+            del campo.pre_save
+
+
+def _rng(semilla, subdominio, bloque):
+    # random.seed con str usa SHA-512: no depende de PYTHONHASHSEED
+    return random.Random(f'{semilla}:{subdominio}:{bloque}')
+
+
+def _catalogos(subdominio, semilla):
+    """
+    Sucursales, técnicos, componentes, categorías y productos de almacén.
+
+    Se crean con get_or_create: volver a generar no los duplica.
+    """
+    from almacen.models import ProductoAlmacen
+    from inventario.models import Empleado, Sucursal
+    from scorecard.models import CategoriaIncidencia, ComponenteEquipo
+
+    User = get_user_model()
+    rng = _rng(semilla, subdominio, 'catalogos')
+
+    admin, creado = User.objects.get_or_create(
+        username=USUARIO_ADMIN, defaults={'is_staff': True, 'is_superuser': True},
+    )
+    if creado:
+        admin.set_unusable_password()
+        admin.save(update_fields=['password'])
+
+    sucursales = [
+        Sucursal.objects.get_or_create(nombre=f'{PREFIJO}Sucursal {n}', defaults={'ciudad': 'Benchmark'})[0]
+        for n in range(1, SUCURSALES + 1)
+    ]
+    tecnicos = []
+    for n in range(1, TECNICOS + 1):
+        usuario = User.objects.get_or_create(username=f'{PREFIJO.lower()}tecnico{n}')[0]
+        tecnicos.append(Empleado.objects.get_or_create(
+            user=usuario,
+            defaults={
+                'nombre_completo': f'{PREFIJO}Técnico {n}',
+                'cargo': 'Técnico',
+                'area': 'Laboratorio',
+                'email': f'tecnico{n}@benchmark.local',
+                'sucursal': sucursales[n % SUCURSALES],
+                'rol': 'tecnico',
+            },
+        )[0])
+    componentes = [
+        ComponenteEquipo.objects.get_or_create(nombre=nombre, tipo_equipo='todos')[0]
+        for nombre in COMPONENTES
+    ]
+    categoria = CategoriaIncidencia.objects.get_or_create(nombre=f'{PREFIJO}Falla de reparación')[0]
+    productos = [
+        ProductoAlmacen.objects.get_or_create(
+            codigo_producto=f'{PREFIJO}P{n:04d}',
+            defaults={
+                'nombre': f'{PREFIJO}Producto {n}',
+                'costo_unitario': rng.randint(100, 5000),
+                'sucursal': sucursales[n % SUCURSALES],
+            },
+        )[0]
+        for n in range(1, PRODUCTOS_ALMACEN + 1)
+    ]
+    return {
+        'sucursales': sucursales,
+        'tecnicos': tecnicos,
+        'componentes': componentes,
+        'categoria_incidencia': categoria,
+        'productos': productos,
+    }
+
+
+def _bloque(subdominio, semilla, numero, inicio, cantidad, catalogos, hasta):
+    """
+    Genera e inserta `cantidad` órdenes (desde el número `inicio`) con todas
+    sus filas hijas. Devuelve un dict modelo → filas insertadas.
+    """
+    from almacen.models import UnidadInventario
+    from scorecard.models import Incidencia
+    from servicio_tecnico.models import (
+        Cotizacion,
+        DetalleEquipo,
+        EnlaceSeguimientoCliente,
+        EventoSeguimientoCliente,
+        FeedbackCliente,
+        HistorialOrden,
+        ImagenOrden,
+        OrdenServicio,
+        PiezaCotizada,
+    )
+
+    rng = _rng(semilla, subdominio, numero)
+    estados = _opciones(OrdenServicio, 'estado')
+    tipos_imagen = _opciones(ImagenOrden, 'tipo')
+    tipos_evento = _opciones(EventoSeguimientoCliente, 'tipo')
+    motivos = _opciones(Cotizacion, 'motivo_rechazo')
+    gamas = _opciones(DetalleEquipo, 'gama')
+    tipos_equipo = _opciones(DetalleEquipo, 'tipo_equipo')
+    marcas = _opciones(DetalleEquipo, 'marca')
+    sucursales, tecnicos = catalogos['sucursales'], catalogos['tecnicos']
+
+    ordenes = []
+    for n in range(inicio, inicio + cantidad):
+        ingreso = hasta - timedelta(days=rng.random() * DIAS_HISTORIA)
+        calendario = ingreso.isocalendar()
+        estado = rng.choice(estados)
+        ordenes.append(OrdenServicio(
+            numero_orden_interno=f'{PREFIJO}{n:010d}',
+            fecha_ingreso=ingreso,
+            fecha_entrega=ingreso + timedelta(days=rng.randint(2, 30)) if estado == 'entregado' else None,
+            sucursal=rng.choice(sucursales),
+            tecnico_asignado_actual=rng.choice(tecnicos),
+            responsable_seguimiento=rng.choice(tecnicos),
+            estado=estado,
+            tipo_servicio='diagnostico',
+            es_fuera_garantia=rng.random() < 0.7,
+            es_candidato_rhitso=rng.random() < PROPORCIONES['rhitso'],
+            año=calendario[0],
+            mes=ingreso.month,
+            semana=calendario[1],
+        ))
+    OrdenServicio.objects.bulk_create(ordenes)
+
+    detalles, historial, imagenes, cotizaciones, enlaces, feedbacks = [], [], [], [], [], []
+    incidencias, unidades = [], []
+    for orden in ordenes:
+        ingreso = orden.fecha_ingreso
+        marca = rng.choice(marcas)
+        serie = f'SN{orden.numero_orden_interno[len(PREFIJO):]}'
+        detalles.append(DetalleEquipo(
+            orden=orden,
+            tipo_equipo=rng.choice(tipos_equipo),
+            marca=marca,
+            modelo=f'{marca} {rng.randint(100, 999)}',
+            numero_serie=serie,
+            orden_cliente=f'OOW-{orden.numero_orden_interno[len(PREFIJO):]}',
+            gama=rng.choice(gamas),
+            email_cliente=f'cliente{orden.numero_orden_interno[-6:]}@benchmark.local',
+            nombre_cliente='Cliente Benchmark',
+            falla_principal=rng.choice(FALLAS),
+        ))
+        for k in range(rng.randint(1, 2 * POR_ORDEN['historial'] - 1)):
+            historial.append(HistorialOrden(
+                orden=orden,
+                fecha_evento=ingreso + timedelta(hours=k * rng.randint(1, 48)),
+                tipo_evento='cambio_estado' if k else 'creacion',
+                estado_nuevo=rng.choice(estados),
+                comentario=f'Evento {k} de la orden',
+                es_sistema=k % 2 == 0,
+            ))
+        for k in range(rng.randint(0, 2 * POR_ORDEN['imagenes'])):
+            tipo = rng.choice(tipos_imagen)
+            imagenes.append(ImagenOrden(
+                orden=orden,
+                tipo=tipo,
+                imagen=f'benchmark/{tipo}/{orden.numero_orden_interno}_{k}.jpg',
+                fecha_subida=ingreso + timedelta(hours=k),
+                subido_por=orden.tecnico_asignado_actual,
+            ))
+        if rng.random() < PROPORCIONES['cotizacion']:
+            aceptada = rng.choice([True, False, None])
+            cotizaciones.append(Cotizacion(
+                orden=orden,
+                fecha_envio=ingreso + timedelta(days=rng.randint(1, 5)),
+                fecha_respuesta=ingreso + timedelta(days=rng.randint(5, 10)) if aceptada is not None else None,
+                usuario_acepto=aceptada,
+                motivo_rechazo=rng.choice(motivos) if aceptada is False else '',
+                costo_mano_obra=rng.randint(200, 1500),
+            ))
+        if rng.random() < PROPORCIONES['enlace_seguimiento']:
+            enlaces.append(EnlaceSeguimientoCliente(
+                orden=orden,
+                token=f'{PREFIJO}{subdominio}-{orden.numero_orden_interno}',
+                fecha_creacion=ingreso,
+                accesos_count=rng.randint(0, 20),
+                correo_enviado=True,
+            ))
+        for tipo, proporcion in (('satisfaccion', 'encuesta'), ('rechazo', 'feedback_rechazo')):
+            if rng.random() >= PROPORCIONES[proporcion]:
+                continue
+            respondida = rng.random() < 0.4
+            nps = rng.randint(0, 10) if respondida and tipo == 'satisfaccion' else None
+            feedbacks.append(FeedbackCliente(
+                orden=orden,
+                tipo=tipo,
+                token=f'{PREFIJO}{tipo}-{subdominio}-{orden.numero_orden_interno}',
+                fecha_creacion=ingreso + timedelta(days=rng.randint(5, 30)),
+                correo_enviado=rng.random() < 0.95,
+                utilizado=respondida,
+                fecha_respuesta=ingreso + timedelta(days=rng.randint(31, 40)) if respondida else None,
+                nps=nps,
+                recomienda=nps >= 7 if nps is not None else None,
+                calificacion_general=rng.randint(1, 5) if nps is not None else None,
+                comentario_cliente=rng.choice(COMENTARIOS) if respondida and rng.random() < 0.5 else '',
+                motivo_rechazo_snapshot=rng.choice(motivos) if tipo == 'rechazo' else '',
+            ))
+        if rng.random() < PROPORCIONES['incidencia']:
+            incidencias.append(Incidencia(
+                folio=f'{PREFIJO}I{orden.numero_orden_interno[len(PREFIJO):]}',
+                fecha_registro=ingreso,
+                fecha_deteccion=ingreso.date(),
+                tipo_equipo=rng.choice(_opciones(Incidencia, 'tipo_equipo')),
+                marca=marca,
+                modelo=f'{marca} {rng.randint(100, 999)}',
+                numero_serie=serie,
+                orden_servicio=orden,
+                sucursal=orden.sucursal,
+                area_detectora=rng.choice(_opciones(Incidencia, 'area_detectora')),
+                tecnico_responsable=orden.tecnico_asignado_actual,
+                inspector_calidad=rng.choice(tecnicos),
+                tipo_incidencia=catalogos['categoria_incidencia'],
+                categoria_fallo=rng.choice(_opciones(Incidencia, 'categoria_fallo')),
+                grado_severidad=rng.choice(_opciones(Incidencia, 'grado_severidad')),
+                descripcion_incidencia='Incidencia sintética',
+                año=orden.año,
+                mes=orden.mes,
+                semana=orden.semana,
+                trimestre=(orden.mes - 1) // 3 + 1,
+            ))
+        if rng.random() < PROPORCIONES['unidad_almacen']:
+            producto = rng.choice(catalogos['productos'])
+            unidades.append(UnidadInventario(
+                producto=producto,
+                codigo_interno=f'{PREFIJO}U{orden.numero_orden_interno[len(PREFIJO):]}',
+                numero_serie=f'U{serie}',
+                marca=marca,
+                estado=rng.choice(_opciones(UnidadInventario, 'estado')),
+                disponibilidad=rng.choice(_opciones(UnidadInventario, 'disponibilidad')),
+                origen='orden_servicio',
+                orden_servicio_origen=orden,
+                costo_unitario=producto.costo_unitario,
+                sucursal_actual=orden.sucursal,
+                fecha_registro=ingreso,
+            ))
+
+    DetalleEquipo.objects.bulk_create(detalles)
+    HistorialOrden.objects.bulk_create(historial)
+    ImagenOrden.objects.bulk_create(imagenes)
+    Cotizacion.objects.bulk_create(cotizaciones)
+    EnlaceSeguimientoCliente.objects.bulk_create(enlaces)
+    FeedbackCliente.objects.bulk_create(feedbacks)
+    Incidencia.objects.bulk_create(incidencias)
+    UnidadInventario.objects.bulk_create(unidades)
+
+    piezas = [
+        PiezaCotizada(
+            cotizacion=cotizacion,
+            componente=rng.choice(catalogos['componentes']),
+            cantidad=1,
+            costo_unitario=rng.randint(300, 6000),
+            proveedor=rng.choice(('Proveedor A', 'Proveedor B', 'Proveedor C')),
+            aceptada_por_cliente=cotizacion.usuario_acepto,
+            orden_prioridad=k,
+            fecha_creacion=cotizacion.fecha_envio,
+            fecha_actualizacion=cotizacion.fecha_envio,
+        )
+        for cotizacion in cotizaciones
+        for k in range(1, rng.randint(1, 2 * POR_ORDEN['piezas_por_cotizacion']) + 1)
+    ]
+    PiezaCotizada.objects.bulk_create(piezas)
+
+    eventos = [
+        EventoSeguimientoCliente(
+            enlace=enlace,
+            tipo=rng.choice(tipos_evento),
+            fecha=enlace.fecha_creacion + timedelta(hours=k * 6),
+            session_id=f'{enlace.pk:012d}-{k:04d}',
+        )
+        for enlace in enlaces
+        for k in range(rng.randint(0, 2 * POR_ORDEN['eventos_seguimiento']))
+    ]
+    EventoSeguimientoCliente.objects.bulk_create(eventos)
+
+    return {
+        'ordenes': len(ordenes),
+        'detalles': len(detalles),
+        'historial': len(historial),
+        'imagenes': len(imagenes),
+        'cotizaciones': len(cotizaciones),
+        'piezas': len(piezas),
+        'enlaces': len(enlaces),
+        'eventos_seguimiento': len(eventos),
+        'feedback': len(feedbacks),
+        'incidencias': len(incidencias),
+        'unidades_almacen': len(unidades),
+    }
+
+
+def generar(subdominio, escala='chica', semilla=0, hasta=None, tamano_bloque=TAMANO_BLOQUE, salida=print):
+    """
+    Llena la BD de un país con la escala indicada.
+
+    Args:
+        subdominio (str): país ('mexico', 'argentina', ...).
+        escala (str|int): nombre en ESCALAS o número de órdenes.
+        semilla (int): cambia los datos; misma semilla = mismos datos.
+        hasta (date|None): fecha más reciente de los datos (default: hoy).
+            Se fija para que dos corridas en días distintos coincidan.
+        tamano_bloque (int): órdenes por transacción.
+        salida (callable): dónde escribir el avance.
+
+    Returns:
+        dict con el total de filas insertadas por tipo.
+    """
+    from almacen.models import UnidadInventario
+    from config.middleware_pais import get_current_db_alias, pais
+    from scorecard.models import Incidencia
+    from servicio_tecnico.models import (
+        EnlaceSeguimientoCliente,
+        EventoSeguimientoCliente,
+        FeedbackCliente,
+        ImagenOrden,
+        OrdenServicio,
+        PiezaCotizada,
+    )
+
+    total_ordenes = ESCALAS[escala] if isinstance(escala, str) else int(escala)
+    hasta = timezone.make_aware(datetime.combine(hasta or timezone.localdate(), time(23, 59)))
+    totales = {}
+
+    with pais(subdominio), _fechas_manuales(
+        OrdenServicio, ImagenOrden, PiezaCotizada, EnlaceSeguimientoCliente,
+        EventoSeguimientoCliente, FeedbackCliente, Incidencia, UnidadInventario,
+    ):
+        catalogos = _catalogos(subdominio, semilla)
+
+        for numero, inicio in enumerate(range(1, total_ordenes + 1, tamano_bloque)):
+            cantidad = min(tamano_bloque, total_ordenes - inicio + 1)
+            # Reanudar: un bloque ya insertado se salta (cada bloque es una
+            # transacción, así que si está su última orden está completo)
+            ultimo = f'{PREFIJO}{inicio + cantidad - 1:010d}'
+            if OrdenServicio.objects.filter(numero_orden_interno=ultimo).exists():
+                continue
+            # La transacción va en la BD del país: sin using= se abriría en
+            # 'default' y en argentina/chile/colombia cada INSERT quedaría
+            # confirmado por su cuenta (un bloque a medias al interrumpir)
+            with transaction.atomic(using=get_current_db_alias()):
+                conteo = _bloque(subdominio, semilla, numero, inicio, cantidad, catalogos, hasta)
+            for clave, valor in conteo.items():
+                totales[clave] = totales.get(clave, 0) + valor
+            salida(f'  [{subdominio}] {inicio + cantidad - 1:,}/{total_ordenes:,} órdenes')
+
+    return totales
+
+
+def limpiar(subdominio, salida=print):
+    """
+    Borra todo lo generado (prefijo PREFIJO) en la BD de un país.
+
+    Returns:
+        int: filas borradas (incluye las borradas en cascada).
+    """
+    from almacen.models import ProductoAlmacen, UnidadInventario
+    from config.middleware_pais import get_current_db_alias, pais
+    from inventario.models import Empleado, Sucursal
+    from scorecard.models import CategoriaIncidencia, Incidencia
+    from servicio_tecnico.models import OrdenServicio
+
+    User = get_user_model()
+    borradas = 0
+    with pais(subdominio), transaction.atomic(using=get_current_db_alias()):
+        for queryset in (
+            Incidencia.objects.filter(folio__startswith=PREFIJO),
+            UnidadInventario.objects.filter(codigo_interno__startswith=PREFIJO),
+            OrdenServicio.objects.filter(numero_orden_interno__startswith=PREFIJO),
+            ProductoAlmacen.objects.filter(codigo_producto__startswith=PREFIJO),
+            CategoriaIncidencia.objects.filter(nombre__startswith=PREFIJO),
+            Empleado.objects.filter(nombre_completo__startswith=PREFIJO),
+            Sucursal.objects.filter(nombre__startswith=PREFIJO),
+            User.objects.filter(username__startswith=PREFIJO.lower()),
+        ):
+            borradas += queryset.delete()[0]
+    salida(f'  [{subdominio}] {borradas:,} filas borradas')
+    return borradas
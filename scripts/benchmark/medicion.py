@@ -0,0 +1,254 @@
+"""
+Medición de casos, resultados en JSON y comparación entre corridas.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+-------------------------------
+Por cada caso se guarda:
+- tiempo (ms): mediana, mínimo y máximo de N repeticiones (después de una
+  de calentamiento, que llena cachés de Python e imports).
+- consultas SQL: de la última repetición (con la caché apagada deberían
+  ser iguales en todas; si no, también se guarda el máximo).
+- rss_pico_mb: pico de memoria del proceso. Para que sea del CASO y no de
+  los anteriores, `correr(aislado=True)` mide cada caso en un proceso nuevo.
+
+Durante la medición la caché de Django es DummyCache y la de PDFs está
+apagada: se mide siempre el camino "en frío", que es el que se quiere
+vigilar. El muestreo de config/rendimiento.py se apaga para no sumar ruido.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone as dt_timezone
+from unittest.mock import patch
+
+from config.rendimiento import ContadorConsultas
+
+try:
+    import resource
+except ImportError:  # Windows: sin ru_maxrss
+    resource = None
+
+# Cuánto puede empeorar un caso antes de contarlo como regresión
+TOLERANCIA_TIEMPO = 0.20        # +20 % de la mediana
+TOLERANCIA_MINIMA_MS = 5.0      # ignorar diferencias de pocos ms (ruido)
+TOLERANCIA_CONSULTAS = 0        # cualquier consulta extra es regresión
+TOLERANCIA_RSS = 0.20           # +20 % del pico de memoria
+
+AJUSTES_BENCHMARK = {
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    'PDF_CACHE_ACTIVO': False,
+    'ALLOWED_HOSTS': ['*'],
+    'RENDIMIENTO_MUESTREO': 0,
+    'EMAIL_BACKEND': 'django.core.mail.backends.locmem.EmailBackend',
+}
+
+
+def rss_pico_mb():
+    """Pico de memoria residente del proceso (ru_maxrss) en MB; None en Windows."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KB, macOS en bytes
+    return round(pico / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def medir(funcion, repeticiones=3, calentamiento=1):
+    """
+    Corre `funcion` calentamiento + repeticiones veces y mide.
+
+    Returns:
+        dict con tiempo_ms_mediana/min/max, consultas, consultas_max,
+        rss_pico_mb y repeticiones.
+    """
+    tiempos, consultas = [], []
+    for vuelta in range(calentamiento + repeticiones):
+        contador = ContadorConsultas()
+        with ExitStack() as pila:
+            contador.envolver_conexiones(pila)
+            inicio = time.perf_counter()
+            funcion()
+            duracion = (time.perf_counter() - inicio) * 1000
+        if vuelta >= calentamiento:
+            tiempos.append(duracion)
+            consultas.append(contador.total)
+    return {
+        'tiempo_ms_mediana': round(statistics.median(tiempos), 2),
+        'tiempo_ms_min': round(min(tiempos), 2),
+        'tiempo_ms_max': round(max(tiempos), 2),
+        'consultas': consultas[-1],
+        'consultas_max': max(consultas),
+        'rss_pico_mb': rss_pico_mb(),
+        'repeticiones': repeticiones,
+    }
+
+
+def _exportes_sincronos(pila):
+    """
+    Los exportes grandes se miden completos, no como tarea en segundo plano.
+
+    EXPORT_MAX_FILAS_SINCRONO es una constante que cada vista importa, así
+    que se reemplaza en todos los módulos que la tienen.
+    """
+    import servicio_tecnico.views  # noqa: F401 - carga todos los módulos de vistas
+
+    for modulo in list(sys.modules.values()):
+        if getattr(modulo, '__name__', '').startswith('servicio_tecnico.') \
+                and hasattr(modulo, 'EXPORT_MAX_FILAS_SINCRONO'):
+            pila.enter_context(patch.object(modulo, 'EXPORT_MAX_FILAS_SINCRONO', sys.maxsize))
+
+
+def medir_caso(nombre, subdominio, repeticiones=3, calentamiento=1):
+    """
+    Mide un caso registrado en casos.CASOS dentro del país indicado.
+
+    Un caso que falla no detiene la corrida: queda con {'error': '...'}.
+    """
+    from django.contrib.auth import get_user_model
+    from django.test.utils import override_settings
+
+    from config.middleware_pais import pais
+
+    from .casos import CASOS, Contexto
+    from .datos import USUARIO_ADMIN
+
+    _grupo, funcion = CASOS[nombre]
+    try:
+        with ExitStack() as pila:
+            pila.enter_context(override_settings(**AJUSTES_BENCHMARK))
+            pila.enter_context(pais(subdominio))
+            _exportes_sincronos(pila)
+            usuario = get_user_model().objects.get(username=USUARIO_ADMIN)
+            contexto = Contexto(subdominio, usuario)
+            return medir(lambda: funcion(contexto), repeticiones, calentamiento)
+    except Exception as error:  # noqa: BLE001 - el error queda en el JSON
+        return {'error': f'{type(error).__name__}: {error}'}
+
+
+def _medir_en_proceso_nuevo(nombre, subdominio, repeticiones, calentamiento):
+    """Mide un caso en un subproceso (pico de RSS propio del caso)."""
+    comando = [
+        sys.executable, '-m', 'scripts.benchmark', 'caso', nombre,
+        '--pais', subdominio, '--repeticiones', str(repeticiones), '--calentamiento', str(calentamiento),
+    ]
+    proceso = subprocess.run(comando, capture_output=True, text=True, cwd=os.getcwd())
+    ultima = (proceso.stdout.strip().splitlines() or [''])[-1]
+    try:
+        return json.loads(ultima)
+    except json.JSONDecodeError:
+        return {'error': (proceso.stderr.strip().splitlines() or ['sin salida'])[-1]}
+
+
+def _metadatos(subdominio, repeticiones):
+    from django.db import connections
+
+    from config.paises_config import get_pais_config
+
+    alias = get_pais_config(subdominio)['db_alias']
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ''
+    return {
+        'fecha': datetime.now(dt_timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'pais': subdominio,
+        'bd': connections[alias].vendor,
+        'python': platform.python_version(),
+        'maquina': platform.node(),
+        'repeticiones': repeticiones,
+    }
+
+
+def correr(subdominio, nombres=None, grupos=None, repeticiones=3, calentamiento=1, aislado=True, salida=print):
+    """
+    Mide los casos seleccionados y devuelve el resultado listo para JSON.
+
+    Args:
+        aislado (bool): un proceso por caso (RSS exacto, ~2 s extra por caso).
+
+    Returns:
+        dict {'meta': {...}, 'casos': {nombre: {grupo, métricas | error}}}
+    """
+    from .casos import CASOS, casos_seleccionados
+
+    resultado = {'meta': _metadatos(subdominio, repeticiones), 'casos': {}}
+    for nombre in casos_seleccionados(nombres, grupos):
+        if aislado:
+            medida = _medir_en_proceso_nuevo(nombre, subdominio, repeticiones, calentamiento)
+        else:
+            medida = medir_caso(nombre, subdominio, repeticiones, calentamiento)
+        resultado['casos'][nombre] = {'grupo': CASOS[nombre][0], **medida}
+        if 'error' in medida:
+            salida(f'  {nombre:<38} ERROR {medida["error"]}')
+        else:
+            salida(
+                f'  {nombre:<38} {medida["tiempo_ms_mediana"]:>10.1f} ms '
+                f'{medida["consultas"]:>6} consultas {medida["rss_pico_mb"] or 0:>8.1f} MB'
+            )
+    return resultado
+
+
+def comparar(base, nuevo, tolerancia_tiempo=TOLERANCIA_TIEMPO, tolerancia_consultas=TOLERANCIA_CONSULTAS,
+             tolerancia_rss=TOLERANCIA_RSS, tolerancia_minima_ms=TOLERANCIA_MINIMA_MS):
+    """
+    Compara dos resultados de correr() caso por caso.
+
+    Returns:
+        list[dict]: una fila por caso presente en ambas corridas con
+        'caso', 'metrica', 'antes', 'despues', 'cambio' (relativo) y
+        'estado' ('regresion', 'mejora' o 'igual'). Los casos que pasan a
+        fallar se reportan como regresión con métrica 'error'.
+    """
+    filas = []
+    for caso, antes in base.get('casos', {}).items():
+        despues = nuevo.get('casos', {}).get(caso)
+        if despues is None or 'error' in antes:
+            continue
+        if 'error' in despues:
+            filas.append({'caso': caso, 'metrica': 'error', 'antes': None, 'despues': despues['error'],
+                          'cambio': None, 'estado': 'regresion'})
+            continue
+
+        for metrica, tolerancia, minimo in (
+            ('tiempo_ms_mediana', tolerancia_tiempo, tolerancia_minima_ms),
+            ('consultas', None, tolerancia_consultas),
+            ('rss_pico_mb', tolerancia_rss, 0),
+        ):
+            valor_antes, valor_despues = antes.get(metrica), despues.get(metrica)
+            if valor_antes is None or valor_despues is None:
+                continue
+            diferencia = valor_despues - valor_antes
+            cambio = diferencia / valor_antes if valor_antes else None
+            if tolerancia is None:
+                # Conteos: diferencia absoluta
+                empeora, mejora = diferencia > minimo, diferencia < -minimo
+            else:
+                limite = max(valor_antes * tolerancia, minimo)
+                empeora, mejora = diferencia > limite, diferencia < -limite
+            filas.append({
+                'caso': caso,
+                'metrica': metrica,
+                'antes': valor_antes,
+                'despues': valor_despues,
+                'cambio': round(cambio, 3) if cambio is not None else None,
+                'estado': 'regresion' if empeora else 'mejora' if mejora else 'igual',
+            })
+    return filas
+
+
+def guardar(resultado, ruta):
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(resultado, archivo, ensure_ascii=False, indent=2)
+
+
+def cargar(ruta):
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)
@@ -9,6 +9,11 @@
 #      Ejemplo crontab (diario a las 3:00 AM):
 #      0 3 * * * /var/www/inventario-django/inventario-calidad-django/scripts/mantenimiento/limpiar_uploads_temp.sh >> /var/www/inventario-django/inventario-calidad-django/logs/limpieza_temp.log 2>&1
 #
+# NOTA: la tarea de Celery Beat servicio_tecnico.limpiar_subidas_temporales
+#       (config/settings.py → CELERY_BEAT_SCHEDULE) hace esta misma limpieza y
+#       además borra subidas reanudables abandonadas y videos sin comprimir.
+#       Este script queda para correrlo a mano o en servidores sin Beat.
+#
 # Fecha: 6 de Febrero 2026
 # Autor: OpenCode AI Assistant
 #
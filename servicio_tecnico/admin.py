@@ -6,6 +6,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from config.admin_rendimiento import AdminListaEficienteMixin, AdminPaginacionCursorMixin
 from .models import (
     OrdenServicio,
     DetalleEquipo,
@@ -42,6 +43,7 @@ from .models import (
     FormatoServicioGarantia,
     DanoEsteticoVistaGarantia,
     PagoOrden,
+    OrdenSicserEspejo,
 )
 
 
@@ -216,7 +218,15 @@ class PiezaVentaMostradorInline(admin.TabularInline):
 # ============================================================================
 
 @admin.register(OrdenServicio)
-class OrdenServicioAdmin(admin.ModelAdmin):
+class OrdenServicioAdmin(AdminListaEficienteMixin, admin.ModelAdmin):
+    # Total de páginas estimado en tablas grandes (ver config/admin_rendimiento.py);
+    # cotización y venta mostrador para los indicadores de tipo_servicio_badge
+    list_select_related = (
+        'sucursal',
+        'tecnico_asignado_actual',
+        'cotizacion',
+        'venta_mostrador',
+    )
     list_display = (
         'numero_orden_interno',
         'sucursal',
@@ -1105,7 +1115,10 @@ class VideoOrdenAdmin(admin.ModelAdmin):
 # ============================================================================
 
 @admin.register(HistorialOrden)
-class HistorialOrdenAdmin(admin.ModelAdmin):
+class HistorialOrdenAdmin(AdminPaginacionCursorMixin, admin.ModelAdmin):
+    # Bitácora grande: paginación por cursor sobre el índice de fecha_evento
+    campo_cursor = 'fecha_evento'
+    list_select_related = ('orden__sucursal', 'usuario')
     list_display = (
         'orden',
         'fecha_evento',
@@ -2012,12 +2025,15 @@ class EnlaceSeguimientoClienteAdmin(admin.ModelAdmin):
 
 
 @admin.register(EventoSeguimientoCliente)
-class EventoSeguimientoClienteAdmin(admin.ModelAdmin):
+class EventoSeguimientoClienteAdmin(AdminPaginacionCursorMixin, admin.ModelAdmin):
     """
     Administración de eventos de producto del seguimiento público del cliente.
     Útil para depurar que PWA, push y chat registran acciones correctamente.
+    Paginación por cursor: la tabla crece con cada visita al enlace público.
     """
 
+    campo_cursor = 'fecha'
+
     list_display = ('id', 'enlace_id', 'tipo', 'fecha', 'session_id', 'ip')
     list_filter = ('tipo', 'fecha')
     search_fields = (
@@ -2452,3 +2468,30 @@ class PagoOrdenAdmin(admin.ModelAdmin):
     tiene_comprobante.boolean = True
     tiene_comprobante.short_description = 'Comprobante'
 
+
+
+@admin.register(OrdenSicserEspejo)
+class OrdenSicserEspejoAdmin(admin.ModelAdmin):
+    """
+    Espejo local de SICSER (solo lectura).
+
+    Útil para revisar qué trajo la última sincronización de Celery Beat.
+    """
+
+    list_display = (
+        'folio',
+        'origen',
+        'codigo_pais',
+        'service_tag',
+        'fecha_sicser',
+        'vigente',
+        'ya_importada',
+        'fecha_sincronizacion',
+    )
+    list_filter = ('origen', 'codigo_pais', 'vigente', 'ya_importada')
+    search_fields = ('folio', 'id_externo', 'service_tag', 'nombre_cliente')
+    raw_id_fields = ('orden',)
+    readonly_fields = ('datos', 'huella', 'fecha_alta', 'fecha_sincronizacion')
+
+    def has_add_permission(self, request):
+        return False
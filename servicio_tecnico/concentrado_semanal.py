@@ -24,12 +24,29 @@ CLASIFICACIÓN DE EQUIPOS:
 CLASIFICACIÓN DE SITIOS:
   - DROP OFF      → sucursal.nombre contiene 'Drop' (case insensitive)
   - SATELITE      → sucursal.nombre contiene 'Satelit' (cubre Satélite / Satelite)
+
+RENDIMIENTO:
+  La clasificación se expresa en SQL (Case/When en anotar_clasificacion) y
+  cada reporte es UNA consulta agrupada por periodo + sitio + tipo. Los
+  periodos ya cerrados (semanas/meses anteriores al actual) se guardan en
+  caché: sus números ya no cambian, así que no se vuelven a contar.
 """
 
 from datetime import date, timedelta
 from collections import defaultdict
 
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Q, Value, When
+from django.db.models.functions import (
+    Coalesce,
+    TruncDate,
+    TruncMonth,
+    TruncWeek,
+    Trim,
+    Upper,
+)
+from django.db.models.lookups import Exact, StartsWith
+from django.utils import timezone
 
 from .models import OrdenServicio
 
@@ -47,6 +64,14 @@ TIPOS_EQUIPO = ['LENOVO', 'DELL', 'OOW', 'MIS DELL', 'MIS LENOVO']
 # Sitios (sucursales) del concentrado
 SITIOS = ['DROP OFF', 'SATELITE']
 
+# Días hábiles en el lookup __week_day de Django (1=Dom, 2=Lun, ..., 6=Vie)
+DIAS_HABILES_DJANGO = [2, 3, 4, 5, 6]
+
+# Segundos que vive en caché el conteo de un periodo cerrado. Un día basta
+# para no recalcular al navegar y deja pasar correcciones tardías
+# (p. ej. una orden vieja que se cancela).
+CONCENTRADO_CACHE_TTL = 60 * 60 * 24
+
 # Quarters del año
 QUARTERS = {
     'Q1': {'nombre': 'Q1 (Ene - Mar)', 'meses': [1, 2, 3]},
@@ -192,6 +217,177 @@ def clasificar_sitio(nombre_sucursal):
     return None
 
 
+def anotar_clasificacion(queryset):
+    """
+    Añade sitio_concentrado y tipo_concentrado calculados por la BD.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Es la traducción a SQL (Case/When) de clasificar_sitio y
+    clasificar_tipo_equipo, con las mismas reglas y el mismo orden de
+    prioridad. Así la BD puede agrupar y contar sin que Python cargue
+    cada orden. Si la orden no tiene DetalleEquipo, tipo_concentrado es
+    None; si la sucursal no es Drop Off ni Satélite, sitio_concentrado es None.
+
+    Args:
+        queryset: QuerySet de OrdenServicio
+
+    Returns:
+        QuerySet: el mismo queryset con las dos anotaciones
+    """
+    orden_cliente = Upper(Trim(Coalesce('detalle_equipo__orden_cliente', Value(''))))
+    marca = Trim(Coalesce('detalle_equipo__marca', Value('')))
+
+    return queryset.annotate(
+        sitio_concentrado=Case(
+            When(sucursal__nombre__icontains='drop', then=Value('DROP OFF')),
+            When(sucursal__nombre__icontains='satelit', then=Value('SATELITE')),
+            default=Value(None),
+            output_field=CharField(),
+        ),
+        tipo_concentrado=Case(
+            When(detalle_equipo__isnull=True, then=Value(None)),
+            When(
+                StartsWith(orden_cliente, Value('OOW-')) | StartsWith(orden_cliente, Value('FL-')),
+                then=Value('OOW'),
+            ),
+            When(Q(detalle_equipo__es_mis=True) & Exact(marca, Value('Dell')), then=Value('MIS DELL')),
+            When(Q(detalle_equipo__es_mis=True) & Exact(marca, Value('Lenovo')), then=Value('MIS LENOVO')),
+            When(Exact(marca, Value('Lenovo')), then=Value('LENOVO')),
+            When(Exact(marca, Value('Dell')), then=Value('DELL')),
+            default=Value('OOW'),
+            output_field=CharField(),
+        ),
+    )
+
+
+# ===========================================================================
+# MOTOR DE CONSULTAS AGRUPADAS + CACHÉ DE PERIODOS CERRADOS
+# ===========================================================================
+
+def _filtrar_sucursal(queryset, sucursal_id=None, sucursal_ids=None):
+    """Aplica el filtro de grupo de sucursales o de sucursal individual."""
+    if sucursal_ids:
+        return queryset.filter(sucursal_id__in=sucursal_ids)
+    if sucursal_id:
+        return queryset.filter(sucursal_id=sucursal_id)
+    return queryset
+
+
+def _clave_cache(reporte, periodo, sucursal_id=None, sucursal_ids=None):
+    """
+    Clave de caché de un periodo: país + reporte + inicio del periodo + filtro.
+
+    EXPLICACIÓN: cada país tiene su propia BD, así que el alias entra en la
+    clave para que México y Chile no compartan números.
+    """
+    from config.middleware_pais import get_current_db_alias
+
+    if sucursal_ids:
+        filtro = 'g' + '-'.join(str(pk) for pk in sorted(sucursal_ids))
+    elif sucursal_id:
+        filtro = f's{sucursal_id}'
+    else:
+        filtro = 'todas'
+    return f'concentrado:{get_current_db_alias()}:{reporte}:{periodo.isoformat()}:{filtro}'
+
+
+def _fin_de_periodo(inicio, unidad):
+    """Último día del periodo (semana lunes-domingo o mes calendario)."""
+    if unidad == 'semana':
+        return inicio + timedelta(days=6)
+    siguiente = date(inicio.year + inicio.month // 12, inicio.month % 12 + 1, 1)
+    return siguiente - timedelta(days=1)
+
+
+def _conteos_por_periodo(campo_fecha, periodos, unidad, sucursal_id=None,
+                         sucursal_ids=None, solo_dias_habiles=False):
+    """
+    Cuenta órdenes por periodo, sitio y tipo con UNA consulta agrupada.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    1. Los periodos cerrados se buscan primero en caché (cache.get_many).
+    2. Lo que falta (siempre incluye el periodo en curso) se cuenta con un
+       solo values(periodo, sitio, tipo).annotate(Count) sobre el rango
+       que cubren los periodos faltantes.
+    3. Los periodos cerrados recién contados se guardan en caché.
+
+    Args:
+        campo_fecha (str): 'fecha_ingreso' o 'fecha_finalizacion'
+        periodos (list[date]): lunes de cada semana o día 1 de cada mes
+        unidad (str): 'semana' o 'mes'
+        sucursal_id (int, optional): Filtrar por sucursal individual
+        sucursal_ids (list, optional): Filtrar por grupo de sucursales
+        solo_dias_habiles (bool): Contar solo órdenes de lunes a viernes
+
+    Returns:
+        dict: {periodo: {(sitio, tipo): total}}. sitio/tipo pueden ser None
+        (sucursal fuera del concentrado u orden sin DetalleEquipo).
+    """
+    reporte = f'{campo_fecha}:{unidad}:{"habiles" if solo_dias_habiles else "todos"}'
+    hoy = timezone.localdate()
+    claves = {
+        periodo: _clave_cache(reporte, periodo, sucursal_id, sucursal_ids)
+        for periodo in periodos
+    }
+    cerrados = {p for p in periodos if _fin_de_periodo(p, unidad) < hoy}
+
+    en_cache = cache.get_many([claves[p] for p in cerrados])
+    resultado = {p: en_cache[claves[p]] for p in cerrados if claves[p] in en_cache}
+    faltantes = [p for p in periodos if p not in resultado]
+    if not faltantes:
+        return resultado
+
+    queryset = OrdenServicio.objects.filter(**{
+        f'{campo_fecha}__date__range': (min(faltantes), _fin_de_periodo(max(faltantes), unidad)),
+    }).exclude(estado='cancelado')
+    if solo_dias_habiles:
+        queryset = queryset.filter(**{f'{campo_fecha}__week_day__in': DIAS_HABILES_DJANGO})
+    queryset = _filtrar_sucursal(queryset, sucursal_id, sucursal_ids)
+
+    truncar = TruncWeek if unidad == 'semana' else TruncMonth
+    filas = (
+        anotar_clasificacion(queryset)
+        .annotate(periodo=truncar(TruncDate(campo_fecha)))
+        .values('periodo', 'sitio_concentrado', 'tipo_concentrado')
+        .annotate(total=Count('id'))
+    )
+
+    # El rango puede incluir periodos que ya venían de caché: se ignoran.
+    nuevos = {periodo: {} for periodo in faltantes}
+    for fila in filas:
+        conteos = nuevos.get(fila['periodo'])
+        if conteos is None:
+            continue
+        clave = (fila['sitio_concentrado'], fila['tipo_concentrado'])
+        conteos[clave] = conteos.get(clave, 0) + fila['total']
+
+    cache.set_many(
+        {claves[p]: conteos for p, conteos in nuevos.items() if p in cerrados},
+        CONCENTRADO_CACHE_TTL,
+    )
+    resultado.update(nuevos)
+    return resultado
+
+
+def _total(conteos):
+    """Suma todas las órdenes de un periodo (clasificadas o no)."""
+    return sum(conteos.values())
+
+
+def _conteos_sitio_tipo(conteos_periodos):
+    """
+    Acumula varios periodos en la estructura {sitio: {tipo: total}}.
+
+    Solo cuenta las órdenes que caen en un sitio y tipo del concentrado.
+    """
+    acumulado = {sitio: {tipo: 0 for tipo in TIPOS_EQUIPO} for sitio in SITIOS}
+    for conteos in conteos_periodos:
+        for (sitio, tipo), total in conteos.items():
+            if sitio in acumulado and tipo in acumulado[sitio]:
+                acumulado[sitio][tipo] += total
+    return acumulado
+
+
 # ===========================================================================
 # ESTRUCTURA DE DATOS VACÍA (PLANTILLA)
 # ===========================================================================
@@ -266,11 +462,10 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
 
     El proceso:
       1. Calcula el rango de fechas (lunes a viernes)
-      2. Consulta la BD filtrando órdenes en ese rango
-      3. Clasifica cada orden por sitio y tipo de equipo
-      4. Cuenta por día de la semana
-      5. Calcula totales y promedios
-      6. Repite el proceso para ingresos, asignaciones y egresos
+      2. Si la semana ya cerró y está en caché, la devuelve tal cual
+      3. Cuenta en la BD por día, sitio y tipo (consultas agrupadas)
+      4. Calcula totales y promedios
+      5. Repite el proceso para ingresos, asignaciones y egresos
 
     Args:
         lunes (date): Fecha del lunes de la semana a analizar
@@ -293,36 +488,32 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
     numero_semana = obtener_numero_semana(lunes)
     año = lunes.year
 
+    # Una semana que ya terminó no cambia: se sirve completa desde caché.
+    semana_cerrada = lunes + timedelta(days=6) < timezone.localdate()
+    clave = _clave_cache('semanal', lunes, sucursal_id, sucursal_ids)
+    if semana_cerrada:
+        datos = cache.get(clave)
+        if datos is not None:
+            return datos
+
     # -----------------------------------------------------------------------
     # BASE QUERIES: Órdenes en el rango de la semana
     # -----------------------------------------------------------------------
-    base_qs = OrdenServicio.objects.select_related(
-        'detalle_equipo',
-        'sucursal',
-        'tecnico_asignado_actual',
-    ).filter(
+    base_qs = OrdenServicio.objects.filter(
         # Solo ordenes de días hábiles (Lun-Vie)
         # date__range incluye ambos extremos
         fecha_ingreso__date__range=(lunes, viernes),
-        fecha_ingreso__week_day__in=[2, 3, 4, 5, 6],  # Django: 1=Dom, 2=Lun, ..., 6=Vie
+        fecha_ingreso__week_day__in=DIAS_HABILES_DJANGO,
     )
 
-    qs_egreso = OrdenServicio.objects.select_related(
-        'detalle_equipo',
-        'sucursal',
-        'tecnico_asignado_actual',
-    ).filter(
+    qs_egreso = OrdenServicio.objects.filter(
         fecha_finalizacion__date__range=(lunes, viernes),
-        fecha_finalizacion__week_day__in=[2, 3, 4, 5, 6],
+        fecha_finalizacion__week_day__in=DIAS_HABILES_DJANGO,
     )
 
     # Filtro adicional por sucursal (individual o grupo)
-    if sucursal_ids:
-        base_qs = base_qs.filter(sucursal_id__in=sucursal_ids)
-        qs_egreso = qs_egreso.filter(sucursal_id__in=sucursal_ids)
-    elif sucursal_id:
-        base_qs = base_qs.filter(sucursal_id=sucursal_id)
-        qs_egreso = qs_egreso.filter(sucursal_id=sucursal_id)
+    base_qs = _filtrar_sucursal(base_qs, sucursal_id, sucursal_ids)
+    qs_egreso = _filtrar_sucursal(qs_egreso, sucursal_id, sucursal_ids)
 
     # Excluir órdenes canceladas del conteo
     base_qs = base_qs.exclude(estado='cancelado')
@@ -331,6 +522,8 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
     # -----------------------------------------------------------------------
     # SECCIÓN 1: INGRESO DE EQUIPOS
     # -----------------------------------------------------------------------
+    # EXPLICACIÓN: una sola consulta agrupada por día + sitio + tipo (+ MIS
+    # para el resumen); la BD cuenta y Python solo reparte en la tabla.
     datos_ingreso = crear_estructura_vacia()
 
     # Contadores para la fila de resumen inferior
@@ -338,45 +531,37 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
     carry_in_sic = 0
     mail_in_service = 0
 
-    for orden in base_qs:
-        if not hasattr(orden, 'detalle_equipo') or orden.detalle_equipo is None:
-            continue
-
-        detalle = orden.detalle_equipo
-        sitio = clasificar_sitio(orden.sucursal.nombre)
-        if sitio is None:
-            continue
-
-        tipo = clasificar_tipo_equipo(detalle)
-        if tipo is None:
-            continue
-
+    filas_ingreso = (
+        anotar_clasificacion(base_qs)
+        .filter(sitio_concentrado__isnull=False, tipo_concentrado__isnull=False)
+        .annotate(dia=TruncDate('fecha_ingreso'))
+        .values('dia', 'sitio_concentrado', 'tipo_concentrado', 'detalle_equipo__es_mis')
+        .annotate(total=Count('id'))
+    )
+    for fila in filas_ingreso:
         # Día de la semana (weekday() retorna 0=Lunes, ..., 4=Viernes)
-        dia_idx = orden.fecha_ingreso.weekday()
+        dia_idx = fila['dia'].weekday()
         if dia_idx > 4:  # Ignorar sábado y domingo
             continue
         dia_nombre = DIAS_SEMANA[dia_idx]
+        sitio = fila['sitio_concentrado']
+        total = fila['total']
 
         # Incrementar contador
-        datos_ingreso[sitio][tipo][dia_nombre] += 1
-        datos_ingreso[sitio][tipo]['total'] += 1
+        datos_ingreso[sitio][fila['tipo_concentrado']][dia_nombre] += total
+        datos_ingreso[sitio][fila['tipo_concentrado']]['total'] += total
 
         # Clasificar para resumen carry-in / mail-in
-        es_mis = getattr(detalle, 'es_mis', False)
-        if es_mis:
-            mail_in_service += 1
+        if fila['detalle_equipo__es_mis']:
+            mail_in_service += total
         elif sitio == 'DROP OFF':
-            carry_in_dropoff += 1
+            carry_in_dropoff += total
         elif sitio == 'SATELITE':
-            carry_in_sic += 1
+            carry_in_sic += total
 
     # Calcular promedios de ingreso
     for sitio in SITIOS:
         for tipo in TIPOS_EQUIPO:
-            dias_con_datos = sum(
-                1 for dia in DIAS_SEMANA
-                if datos_ingreso[sitio][tipo][dia] > 0
-            )
             total = datos_ingreso[sitio][tipo]['total']
             datos_ingreso[sitio][tipo]['promedio'] = (
                 round(total / 5, 1)  # Siempre sobre 5 días hábiles
@@ -395,41 +580,50 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
     # -----------------------------------------------------------------------
     # SECCIÓN 2: ASIGNACIÓN DE EQUIPOS A INGENIERÍA
     # -----------------------------------------------------------------------
-    # Obtenemos todos los técnicos que tienen órdenes en esa semana
+    # Conteo por técnico y día en una consulta; luego los nombres.
     from inventario.models import Empleado
 
-    tecnicos_ids = base_qs.values_list(
-        'tecnico_asignado_actual_id', flat=True
-    ).distinct()
+    filas_asignacion = list(
+        base_qs.filter(tecnico_asignado_actual__isnull=False)
+        .annotate(dia=TruncDate('fecha_ingreso'))
+        .values('tecnico_asignado_actual_id', 'dia')
+        .annotate(total=Count('id'))
+    )
+    tecnicos_ids = {fila['tecnico_asignado_actual_id'] for fila in filas_asignacion}
     tecnicos = Empleado.objects.filter(id__in=tecnicos_ids).order_by('nombre_completo')
 
     datos_asignacion = crear_estructura_ingenieros_vacia(tecnicos)
 
-    for orden in base_qs:
-        tec = orden.tecnico_asignado_actual
-        if tec is None or tec.id not in datos_asignacion:
+    for fila in filas_asignacion:
+        fila_tecnico = datos_asignacion.get(fila['tecnico_asignado_actual_id'])
+        if fila_tecnico is None:
             continue
 
-        dia_idx = orden.fecha_ingreso.weekday()
+        dia_idx = fila['dia'].weekday()
         if dia_idx > 4:
             continue
         dia_nombre = DIAS_SEMANA[dia_idx]
 
-        datos_asignacion[tec.id][dia_nombre] += 1
-        datos_asignacion[tec.id]['total'] += 1
+        fila_tecnico[dia_nombre] += fila['total']
+        fila_tecnico['total'] += fila['total']
 
     # Agregar fila de "Candidatos RHITSO" (órdenes marcadas como candidatas a laboratorio externo)
     rhitso_fila = {dia: 0 for dia in DIAS_SEMANA}
     rhitso_fila['nombre'] = 'Candidatos RHITSO'
     rhitso_fila['total'] = 0
-    candidatos_rhitso = base_qs.filter(es_candidato_rhitso=True)
-    for orden in candidatos_rhitso:
-        dia_idx = orden.fecha_ingreso.weekday()
+    candidatos_rhitso = (
+        base_qs.filter(es_candidato_rhitso=True)
+        .annotate(dia=TruncDate('fecha_ingreso'))
+        .values('dia')
+        .annotate(total=Count('id'))
+    )
+    for fila in candidatos_rhitso:
+        dia_idx = fila['dia'].weekday()
         if dia_idx > 4:
             continue
         dia_nombre = DIAS_SEMANA[dia_idx]
-        rhitso_fila[dia_nombre] += 1
-        rhitso_fila['total'] += 1
+        rhitso_fila[dia_nombre] += fila['total']
+        rhitso_fila['total'] += fila['total']
 
     # Convertir diccionario a lista ordenada por total (desc)
     lista_asignacion = sorted(
@@ -449,26 +643,21 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
     # -----------------------------------------------------------------------
     datos_egreso = crear_estructura_vacia()
 
-    for orden in qs_egreso:
-        if not hasattr(orden, 'detalle_equipo') or orden.detalle_equipo is None:
-            continue
-
-        detalle = orden.detalle_equipo
-        sitio = clasificar_sitio(orden.sucursal.nombre)
-        if sitio is None:
-            continue
-
-        tipo = clasificar_tipo_equipo(detalle)
-        if tipo is None:
-            continue
-
-        dia_idx = orden.fecha_finalizacion.weekday()
+    filas_egreso = (
+        anotar_clasificacion(qs_egreso)
+        .filter(sitio_concentrado__isnull=False, tipo_concentrado__isnull=False)
+        .annotate(dia=TruncDate('fecha_finalizacion'))
+        .values('dia', 'sitio_concentrado', 'tipo_concentrado')
+        .annotate(total=Count('id'))
+    )
+    for fila in filas_egreso:
+        dia_idx = fila['dia'].weekday()
         if dia_idx > 4:
             continue
         dia_nombre = DIAS_SEMANA[dia_idx]
 
-        datos_egreso[sitio][tipo][dia_nombre] += 1
-        datos_egreso[sitio][tipo]['total'] += 1
+        datos_egreso[fila['sitio_concentrado']][fila['tipo_concentrado']][dia_nombre] += fila['total']
+        datos_egreso[fila['sitio_concentrado']][fila['tipo_concentrado']]['total'] += fila['total']
 
     # Promedios de egreso
     for sitio in SITIOS:
@@ -500,7 +689,7 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
         else:
             tipos_visibles_por_sitio[sitio] = list(TIPOS_EQUIPO)
 
-    return {
+    datos = {
         'ingreso': datos_ingreso,
         'asignacion': lista_asignacion,
         'egreso': datos_egreso,
@@ -520,6 +709,9 @@ def obtener_concentrado_semanal(lunes, sucursal_id=None, sucursal_ids=None):
         'tipos_equipo': TIPOS_EQUIPO,
         'tipos_visibles_por_sitio': tipos_visibles_por_sitio,
     }
+    if semana_cerrada:
+        cache.set(clave, datos, CONCENTRADO_CACHE_TTL)
+    return datos
 
 
 # ===========================================================================
@@ -533,7 +725,10 @@ def obtener_tendencia_semanal(año, sucursal_id=None, sucursal_ids=None):
     EXPLICACIÓN PARA PRINCIPIANTES:
     Esta función genera los datos para los dos gráficos de línea:
     "Ingresos por semana" y "Egresos por semana".
-    Recorre todas las semanas del año y cuenta cuántos equipos entraron/salieron.
+    Las semanas son las ISO del año (S1 empieza el lunes de la semana que
+    contiene el 4 de enero), igual que el selector de semana del concentrado.
+    Cada serie sale de una consulta agrupada por semana; las semanas
+    cerradas se leen de caché.
 
     Args:
         año (int): Año a analizar (ej: 2025)
@@ -548,74 +743,28 @@ def obtener_tendencia_semanal(año, sucursal_id=None, sucursal_ids=None):
             'egresos': [10, 9, 14, ...],
         }
     """
-    # Rango del año completo
-    inicio_año = date(año, 1, 1)
-    fin_año = date(año, 12, 31)
-
-    # Query base de ingresos
-    qs_ingresos = OrdenServicio.objects.filter(
-        fecha_ingreso__year=año,
-        fecha_ingreso__week_day__in=[2, 3, 4, 5, 6],
-    ).exclude(estado='cancelado')
-
-    # Query base de egresos
-    qs_egresos = OrdenServicio.objects.filter(
-        fecha_finalizacion__year=año,
-        fecha_finalizacion__week_day__in=[2, 3, 4, 5, 6],
-    ).exclude(estado='cancelado')
-
-    if sucursal_ids:
-        qs_ingresos = qs_ingresos.filter(sucursal_id__in=sucursal_ids)
-        qs_egresos = qs_egresos.filter(sucursal_id__in=sucursal_ids)
-    elif sucursal_id:
-        qs_ingresos = qs_ingresos.filter(sucursal_id=sucursal_id)
-        qs_egresos = qs_egresos.filter(sucursal_id=sucursal_id)
-
-    # Contar por semana usando anotación
-    from django.db.models.functions import ExtractWeek
-    from django.db.models import Count
-
-    ingresos_por_semana = dict(
-        qs_ingresos.annotate(semana_num=ExtractWeek('fecha_ingreso'))
-        .values('semana_num')
-        .annotate(total=Count('id'))
-        .values_list('semana_num', 'total')
+    # El 28 de diciembre siempre cae en la última semana ISO del año (52 o 53)
+    total_semanas = date(año, 12, 28).isocalendar()[1]
+    lunes_semanas = [
+        date.fromisocalendar(año, numero, 1)
+        for numero in range(1, total_semanas + 1)
+    ]
+
+    ingresos_por_semana = _conteos_por_periodo(
+        'fecha_ingreso', lunes_semanas, 'semana',
+        sucursal_id, sucursal_ids, solo_dias_habiles=True,
     )
-
-    egresos_por_semana = dict(
-        qs_egresos.annotate(semana_num=ExtractWeek('fecha_finalizacion'))
-        .values('semana_num')
-        .annotate(total=Count('id'))
-        .values_list('semana_num', 'total')
+    egresos_por_semana = _conteos_por_periodo(
+        'fecha_finalizacion', lunes_semanas, 'semana',
+        sucursal_id, sucursal_ids, solo_dias_habiles=True,
     )
 
-    # Generar lista de semanas del año
-    semanas = []
-    etiquetas = []
-    ingresos = []
-    egresos = []
-
-    semana_actual = inicio_año
-    while semana_actual <= fin_año:
-        num_semana = semana_actual.isocalendar()[1]
-        # Evitar duplicar la semana 1 del año siguiente
-        if semana_actual.month == 1 and num_semana > 50:
-            semana_actual += timedelta(days=7)
-            continue
-
-        semanas.append(num_semana)
-        etiquetas.append(f'S{num_semana}')
-        ingresos.append(ingresos_por_semana.get(num_semana, 0))
-        egresos.append(egresos_por_semana.get(num_semana, 0))
-
-        # Avanzar a la siguiente semana (cada 7 días)
-        semana_actual += timedelta(days=7)
-
+    semanas = list(range(1, total_semanas + 1))
     return {
         'semanas': semanas,
-        'etiquetas': etiquetas,
-        'ingresos': ingresos,
-        'egresos': egresos,
+        'etiquetas': [f'S{num_semana}' for num_semana in semanas],
+        'ingresos': [_total(ingresos_por_semana[lunes]) for lunes in lunes_semanas],
+        'egresos': [_total(egresos_por_semana[lunes]) for lunes in lunes_semanas],
     }
 
 
@@ -623,7 +772,27 @@ def obtener_tendencia_semanal(año, sucursal_id=None, sucursal_ids=None):
 # DATOS PARA REPORTE TRIMESTRAL
 # ===========================================================================
 
-def obtener_reporte_trimestral(año, sucursal_id=None):
+def _conteos_mensuales(año, sucursal_id=None, sucursal_ids=None):
+    """
+    Conteos de ingreso y egreso por mes, sitio y tipo para todo el año.
+
+    EXPLICACIÓN: el reporte trimestral y el mensual comparten estos números
+    (y su caché): el trimestral suma los meses del quarter por sitio/tipo y
+    el mensual suma todas las órdenes del mes.
+
+    Returns:
+        tuple: ({mes: conteos_ingreso}, {mes: conteos_egreso}) con mes 1-12
+    """
+    inicios = [date(año, mes, 1) for mes in range(1, 13)]
+    ingreso = _conteos_por_periodo('fecha_ingreso', inicios, 'mes', sucursal_id, sucursal_ids)
+    egreso = _conteos_por_periodo('fecha_finalizacion', inicios, 'mes', sucursal_id, sucursal_ids)
+    return (
+        {inicio.month: ingreso[inicio] for inicio in inicios},
+        {inicio.month: egreso[inicio] for inicio in inicios},
+    )
+
+
+def obtener_reporte_trimestral(año, sucursal_id=None, sucursal_ids=None):
     """
     Calcula el concentrado acumulado por quarter (Q1, Q2, Q3, Q4).
 
@@ -635,6 +804,7 @@ def obtener_reporte_trimestral(año, sucursal_id=None):
     Args:
         año (int): Año a analizar (ej: 2025)
         sucursal_id (int, optional): Filtrar por sucursal
+        sucursal_ids (list, optional): Filtrar por lista de sucursales (grupos)
 
     Returns:
         dict: {
@@ -644,34 +814,15 @@ def obtener_reporte_trimestral(año, sucursal_id=None):
             'Q4': {...},
         }
     """
+    ingreso_mes, egreso_mes = _conteos_mensuales(año, sucursal_id, sucursal_ids)
     resultado = {}
 
     for q_key, q_info in QUARTERS.items():
         meses = q_info['meses']
 
-        # Órdenes ingresadas en los meses del quarter
-        qs_ingreso = OrdenServicio.objects.select_related(
-            'detalle_equipo', 'sucursal'
-        ).filter(
-            fecha_ingreso__year=año,
-            fecha_ingreso__month__in=meses,
-        ).exclude(estado='cancelado')
-
-        # Órdenes egresadas en los meses del quarter
-        qs_egreso = OrdenServicio.objects.select_related(
-            'detalle_equipo', 'sucursal'
-        ).filter(
-            fecha_finalizacion__year=año,
-            fecha_finalizacion__month__in=meses,
-        ).exclude(estado='cancelado')
-
-        if sucursal_id:
-            qs_ingreso = qs_ingreso.filter(sucursal_id=sucursal_id)
-            qs_egreso = qs_egreso.filter(sucursal_id=sucursal_id)
-
-        # Conteos de ingreso por sitio y tipo
-        ingreso_q = _contar_por_sitio_tipo(qs_ingreso)
-        egreso_q = _contar_por_sitio_tipo(qs_egreso)
+        # Conteos de ingreso y egreso por sitio y tipo
+        ingreso_q = _conteos_sitio_tipo(ingreso_mes[mes] for mes in meses)
+        egreso_q = _conteos_sitio_tipo(egreso_mes[mes] for mes in meses)
 
         # Total general del quarter
         total_ingreso = sum(
@@ -716,6 +867,7 @@ def obtener_reporte_mensual(año, sucursal_id=None, sucursal_ids=None):
     Mientras que el reporte trimestral agrupa todo un quarter (3 meses) en un solo número,
     este reporte desglosa mes a mes para que se pueda ver la tendencia dentro del quarter.
     Sirve para construir la hoja 'Reporte Mensual' del Excel con tabla + gráficas.
+    Los 12 meses salen de una consulta agrupada por campo de fecha (no 2 por mes).
 
     Args:
         año (int): Año a analizar (ej: 2025)
@@ -754,6 +906,7 @@ def obtener_reporte_mensual(año, sucursal_id=None, sucursal_ids=None):
         'Q4': 'fd7e14',   # Naranja
     }
 
+    ingreso_mes, egreso_mes = _conteos_mensuales(año, sucursal_id, sucursal_ids)
     resultado = {'año': año}
     meses_lista = []
 
@@ -763,28 +916,9 @@ def obtener_reporte_mensual(año, sucursal_id=None, sucursal_ids=None):
         total_egreso_q = 0
 
         for mes in q_info['meses']:
-            # ----- Ingreso del mes -----
-            qs_ingreso = OrdenServicio.objects.filter(
-                fecha_ingreso__year=año,
-                fecha_ingreso__month=mes,
-            ).exclude(estado='cancelado')
-
-            # ----- Egreso del mes -----
-            qs_egreso = OrdenServicio.objects.filter(
-                fecha_finalizacion__year=año,
-                fecha_finalizacion__month=mes,
-            ).exclude(estado='cancelado')
-
-            # ----- Aplicar filtros de sucursal -----
-            if sucursal_ids:
-                qs_ingreso = qs_ingreso.filter(sucursal_id__in=sucursal_ids)
-                qs_egreso = qs_egreso.filter(sucursal_id__in=sucursal_ids)
-            elif sucursal_id:
-                qs_ingreso = qs_ingreso.filter(sucursal_id=sucursal_id)
-                qs_egreso = qs_egreso.filter(sucursal_id=sucursal_id)
-
-            conteo_ingreso = qs_ingreso.count()
-            conteo_egreso = qs_egreso.count()
+            # El mensual cuenta todas las órdenes, no solo las de Drop Off / Satélite
+            conteo_ingreso = _total(ingreso_mes[mes])
+            conteo_egreso = _total(egreso_mes[mes])
 
             total_ingreso_q += conteo_ingreso
             total_egreso_q += conteo_egreso
@@ -808,37 +942,3 @@ def obtener_reporte_mensual(año, sucursal_id=None, sucursal_ids=None):
 
     resultado['meses_lista'] = meses_lista
     return resultado
-
-
-def _contar_por_sitio_tipo(queryset):
-    """
-    Función auxiliar: cuenta órdenes agrupadas por sitio y tipo de equipo.
-
-    EXPLICACIÓN: Itera el queryset y acumula contadores en una estructura
-    {sitio: {tipo: conteo}}. Se usa tanto para el reporte trimestral como
-    para otras funciones que necesiten este agrupamiento sin desglose diario.
-
-    Args:
-        queryset: QuerySet de OrdenServicio con select_related a detalle_equipo y sucursal
-
-    Returns:
-        dict: {sitio: {tipo: total}}
-    """
-    conteos = {sitio: {tipo: 0 for tipo in TIPOS_EQUIPO} for sitio in SITIOS}
-
-    for orden in queryset:
-        if not hasattr(orden, 'detalle_equipo') or orden.detalle_equipo is None:
-            continue
-
-        detalle = orden.detalle_equipo
-        sitio = clasificar_sitio(orden.sucursal.nombre)
-        if sitio is None:
-            continue
-
-        tipo = clasificar_tipo_equipo(detalle)
-        if tipo is None:
-            continue
-
-        conteos[sitio][tipo] += 1
-
-    return conteos
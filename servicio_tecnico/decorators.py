@@ -17,6 +17,8 @@ from django.shortcuts import redirect
 from django.urls import reverse
 from django.views.decorators.cache import cache_page
 
+from inventario.autorizacion import snapshot_de
+
 
 # ===== CACHE DE DASHBOARDS (Redis) =====
 # EXPLICACIÓN PARA PRINCIPIANTES:
@@ -60,8 +62,8 @@ def permission_required_with_message(perm, message=None):
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
-            # Paso 1: comprobar permiso del usuario autenticado
-            if not request.user.has_perm(perm):
+            # Paso 1: comprobar permiso (foto en caché, ver inventario/autorizacion.py)
+            if not snapshot_de(request).tiene_permiso(perm):
                 error_msg = message or 'No tienes permisos para realizar esta acción.'
                 # Paso 2: redirigir con mensaje y permiso en query string
                 return redirect(
@@ -532,3 +532,186 @@ def calcular_estadisticas_por_sucursal(ordenes):
     )
     
     return sucursales_lista
+
+
+def calcular_resumen_una_pasada(ordenes, al_procesar=None):
+    """
+    Calcula métricas, distribución, responsables y sucursales en UN recorrido.
+
+    EXPLICACIÓN: Las funciones de arriba recorren el QuerySet una vez cada una
+    (y calcular_metricas_generales además lanza ~8 COUNT). Para exports grandes
+    eso multiplica el tiempo. Aquí acumulamos todo mientras iteramos una sola
+    vez, por ejemplo con ``ordenes.iterator(chunk_size=500)``. Los diccionarios
+    devueltos tienen exactamente la misma forma que los de las funciones
+    individuales, así que las hojas del Excel no cambian.
+
+    Args:
+        ordenes: iterable de OrdenServicio (idealmente un iterator por bloques
+                 con select_related de sucursal, responsable, VM y cotización)
+        al_procesar: callback opcional ``al_procesar(n)`` llamado tras cada orden
+                     (para reportar progreso desde Celery)
+
+    Returns:
+        tuple: (metricas, distribucion, responsables_lista, sucursales_lista)
+    """
+    cero = Decimal('0.00')
+    metricas = {
+        'total_ordenes': 0,
+        'ordenes_activas': 0,
+        'ordenes_finalizadas': 0,
+        'ordenes_entregadas': 0,
+        'total_ventas_mostrador': 0,
+        'total_con_cotizacion': 0,
+        'cotizaciones_aceptadas': 0,
+        'cotizaciones_pendientes': 0,
+        'cotizaciones_rechazadas': 0,
+    }
+    monto_vm = cero
+    monto_cotizaciones = cero
+    total_dias = 0
+    ordenes_con_tiempo = 0
+    ordenes_en_tiempo = 0
+    distribucion = {}
+    responsables_data = {}
+    sucursales_data = {}
+
+    for n, orden in enumerate(ordenes, 1):
+        dias = orden.dias_habiles_en_servicio
+        venta = orden.venta_mostrador if hasattr(orden, 'venta_mostrador') else None
+        cotizacion = orden.cotizacion if hasattr(orden, 'cotizacion') else None
+
+        # ----- Métricas generales -----
+        metricas['total_ordenes'] += 1
+        if orden.estado not in ['entregado', 'cancelado']:
+            metricas['ordenes_activas'] += 1
+        if orden.estado == 'finalizado':
+            metricas['ordenes_finalizadas'] += 1
+        if orden.estado == 'entregado':
+            metricas['ordenes_entregadas'] += 1
+        if venta:
+            metricas['total_ventas_mostrador'] += 1
+            monto_vm += venta.total_venta
+        if cotizacion:
+            metricas['total_con_cotizacion'] += 1
+            if cotizacion.usuario_acepto is True:
+                metricas['cotizaciones_aceptadas'] += 1
+                monto_cotizaciones += cotizacion.costo_total_final
+            elif cotizacion.usuario_acepto is False:
+                metricas['cotizaciones_rechazadas'] += 1
+            else:
+                metricas['cotizaciones_pendientes'] += 1
+        if dias >= 0:
+            total_dias += dias
+            ordenes_con_tiempo += 1
+        if dias <= 15:
+            ordenes_en_tiempo += 1
+
+        # ----- Distribución por estado -----
+        estado_display = orden.get_estado_display()
+        distribucion[estado_display] = distribucion.get(estado_display, 0) + 1
+
+        # ----- Por responsable (id=0 = "Sin asignar") -----
+        if orden.responsable_seguimiento:
+            resp_id = orden.responsable_seguimiento.id
+            resp_nombre = orden.responsable_seguimiento.nombre_completo
+        else:
+            resp_id = 0
+            resp_nombre = "Sin asignar"
+        resp = responsables_data.get(resp_id)
+        if resp is None:
+            resp = responsables_data[resp_id] = {
+                'id': resp_id,
+                'nombre': resp_nombre,
+                'total_ordenes': 0,
+                'ordenes_activas': 0,
+                'ordenes_finalizadas': 0,
+                'ordenes_entregadas': 0,
+                'ventas_mostrador': 0,
+                'con_cotizacion': 0,
+                'cotizaciones_aceptadas': 0,
+                'cotizaciones_pendientes': 0,
+                'cotizaciones_rechazadas': 0,
+                'monto_ventas_mostrador': cero,
+                'monto_cotizaciones': cero,
+                'dias_acumulados': 0,
+            }
+        resp['total_ordenes'] += 1
+        if orden.estado not in ['entregado', 'cancelado']:
+            resp['ordenes_activas'] += 1
+        if orden.estado == 'finalizado':
+            resp['ordenes_finalizadas'] += 1
+        if orden.estado == 'entregado':
+            resp['ordenes_entregadas'] += 1
+        if venta:
+            resp['ventas_mostrador'] += 1
+            resp['monto_ventas_mostrador'] += venta.total_venta
+        if cotizacion:
+            resp['con_cotizacion'] += 1
+            if cotizacion.usuario_acepto is True:
+                resp['cotizaciones_aceptadas'] += 1
+                resp['monto_cotizaciones'] += cotizacion.costo_total_final
+            elif cotizacion.usuario_acepto is False:
+                resp['cotizaciones_rechazadas'] += 1
+            else:
+                resp['cotizaciones_pendientes'] += 1
+        resp['dias_acumulados'] += dias
+
+        # ----- Por sucursal -----
+        suc = sucursales_data.get(orden.sucursal_id)
+        if suc is None:
+            suc = sucursales_data[orden.sucursal_id] = {
+                'nombre': orden.sucursal.nombre,
+                'total_ordenes': 0,
+                'ventas_mostrador': 0,
+                'cotizaciones': 0,
+                'monto_total': cero,
+            }
+        suc['total_ordenes'] += 1
+        if venta:
+            suc['ventas_mostrador'] += 1
+            suc['monto_total'] += venta.total_venta
+        if cotizacion:
+            suc['cotizaciones'] += 1
+            if cotizacion.usuario_acepto:
+                suc['monto_total'] += cotizacion.costo_total_final
+
+        if al_procesar:
+            al_procesar(n)
+
+    total = metricas['total_ordenes']
+    metricas.update({
+        'monto_ventas_mostrador': float(monto_vm),
+        'monto_cotizaciones': float(monto_cotizaciones),
+        'monto_total': float(monto_vm + monto_cotizaciones),
+        'tiempo_promedio': (
+            round(total_dias / ordenes_con_tiempo, 1) if ordenes_con_tiempo > 0 else 0
+        ),
+        'porcentaje_en_tiempo': (
+            round((ordenes_en_tiempo / total) * 100, 1) if total > 0 else 0
+        ),
+    })
+
+    for data in responsables_data.values():
+        data['tiempo_promedio'] = round(data['dias_acumulados'] / data['total_ordenes'], 1)
+        data['tasa_entrega'] = round(
+            (data['ordenes_entregadas'] / data['total_ordenes']) * 100,
+            1
+        )
+        data['monto_total'] = float(data['monto_ventas_mostrador'] + data['monto_cotizaciones'])
+        data['monto_ventas_mostrador'] = float(data['monto_ventas_mostrador'])
+        data['monto_cotizaciones'] = float(data['monto_cotizaciones'])
+
+    for data in sucursales_data.values():
+        data['monto_total'] = float(data['monto_total'])
+
+    responsables_lista = sorted(
+        responsables_data.values(),
+        key=lambda x: x['total_ordenes'],
+        reverse=True
+    )
+    sucursales_lista = sorted(
+        sucursales_data.values(),
+        key=lambda x: x['total_ordenes'],
+        reverse=True
+    )
+    return metricas, distribucion, responsables_lista, sucursales_lista
@@ -1276,16 +1276,72 @@ class SubirVideoForm(forms.Form):
     }
     EXTENSIONES_PERMITIDAS = {'.mp4', '.mov', '.avi', '.webm', '.mkv', '.mpeg', '.mpg', '.3gp', '.wmv'}
 
+    # Tamaño máximo en servidor (95 MB)
+    # El cliente (MediaRecorder) para automáticamente al llegar a 90 MB.
+    # Los 5 MB de margen absorben el último chunk en vuelo que puede
+    # llegar justo después de llamar recorder.stop().
+    LIMITE_BYTES = 95 * 1024 * 1024
+
     def clean_video(self):
         video = self.cleaned_data.get('video')
         if not video:
             return video
 
-        # Validar tamaño (95 MB máximo en servidor)
-        # El cliente (MediaRecorder) para automáticamente al llegar a 90 MB.
-        # Los 5 MB de margen absorben el último chunk en vuelo que puede
-        # llegar justo después de llamar recorder.stop().
-        limite_bytes = 95 * 1024 * 1024
+
+class IniciarSubidaVideoForm(forms.Form):
+    """
+    Datos para iniciar una subida reanudable de video (sin el archivo).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    En la subida por bloques el archivo llega después, en varios PATCH.
+    Aquí se valida lo mismo que SubirVideoForm.clean_video() pero con los
+    datos que el navegador declara al empezar (nombre, tamaño y tipo MIME),
+    más el SHA-256 con el que se verifica el archivo al terminar.
+    """
+
+    tipo = forms.ChoiceField(choices=TIPO_VIDEO_CHOICES)
+    descripcion = forms.CharField(max_length=200, required=False)
+    orientacion_video = forms.TypedChoiceField(
+        choices=[(g, g) for g in ('0', '90', '180', '270')],
+        coerce=int, required=False, empty_value=0,
+    )
+    nombre = forms.CharField(max_length=255)
+    tamano = forms.IntegerField(min_value=1)
+    content_type = forms.CharField(max_length=100, required=False)
+    sha256 = forms.RegexField(regex=r'^[0-9a-fA-F]{64}$')
+
+    def clean_tamano(self):
+        tamano = self.cleaned_data['tamano']
+        if tamano > SubirVideoForm.LIMITE_BYTES:
+            raise forms.ValidationError(
+                f'El video pesa {tamano / (1024 * 1024):.1f} MB y supera el límite de '
+                f'{SubirVideoForm.LIMITE_BYTES // (1024 * 1024)} MB. Recorta el video antes de subirlo.'
+            )
+        return tamano
+
+    def clean_nombre(self):
+        import os
+        nombre = os.path.basename(self.cleaned_data['nombre'])
+        extension = os.path.splitext(nombre)[1].lower()
+        if extension not in SubirVideoForm.EXTENSIONES_PERMITIDAS:
+            raise forms.ValidationError(
+                f'Extensión "{extension}" no permitida. '
+                f'Formatos válidos: MP4, MOV, AVI, WebM, MKV.'
+            )
+        return nombre
+
+    def clean_content_type(self):
+        content_type = self.cleaned_data.get('content_type', '')
+        content_type_base = content_type.split(';')[0].strip()
+        if content_type and content_type_base not in SubirVideoForm.TIPOS_MIME_PERMITIDOS:
+            raise forms.ValidationError(
+                f'Tipo de archivo no permitido ({content_type}). '
+                'Solo se aceptan archivos de video.'
+            )
+        return content_type
+
+        # Validar tamaño
+        limite_bytes = self.LIMITE_BYTES
         if video.size > limite_bytes:
             raise forms.ValidationError(
                 f'El video pesa {video.size / (1024 * 1024):.1f} MB y supera el límite de 95 MB. '
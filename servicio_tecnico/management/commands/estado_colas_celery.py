@@ -0,0 +1,87 @@
+"""
+Muestra cuántos mensajes esperan en cada cola de Celery y desde cuándo.
+
+Uso:
+    python manage.py estado_colas_celery            # tabla
+    python manage.py estado_colas_celery --json     # para monitoreo
+    python manage.py estado_colas_celery --sin-workers
+
+Ver config/colas_celery.py para la topología de colas.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config.colas_celery import COLAS, PASOS_PRIORIDAD, estado_colas
+
+
+def _duracion(segundos):
+    if segundos is None:
+        return '—'
+    if segundos < 120:
+        return f'{segundos:.0f} s'
+    return f'{segundos / 60:.1f} min'
+
+
+def workers_por_cola(app, timeout=1.0):
+    """
+    Workers que consumen cada cola y tareas que están corriendo en ella.
+
+    Returns:
+        dict: cola → {'workers': int, 'en_proceso': int}. Vacío si ningún
+        worker respondió a tiempo.
+    """
+    inspeccion = app.control.inspect(timeout=timeout)
+    consumo = {cola: {'workers': 0, 'en_proceso': 0} for cola in COLAS}
+    for colas in (inspeccion.active_queues() or {}).values():
+        for cola in colas:
+            consumo.setdefault(cola['name'], {'workers': 0, 'en_proceso': 0})['workers'] += 1
+    for tareas in (inspeccion.active() or {}).values():
+        for tarea in tareas:
+            cola = (tarea.get('delivery_info') or {}).get('routing_key')
+            if cola in consumo:
+                consumo[cola]['en_proceso'] += 1
+    return consumo
+
+
+class Command(BaseCommand):
+    help = 'Mensajes pendientes, espera del más viejo y workers por cola de Celery'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='Salida en JSON')
+        parser.add_argument('--sin-workers', action='store_true',
+                            help='No preguntar a los workers (más rápido)')
+
+    def handle(self, *args, **options):
+        from config.celery import app
+
+        try:
+            with app.connection_for_read() as conexion:
+                cliente = getattr(conexion.default_channel, 'client', None)
+                if cliente is None:
+                    raise CommandError(f'Solo se soporta broker Redis ({conexion.transport_cls})')
+                filas = estado_colas(cliente)
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise CommandError(f'No se pudo leer el broker: {exc}') from exc
+
+        consumo = {} if options['sin_workers'] else workers_por_cola(app)
+        for fila in filas:
+            fila.update(consumo.get(fila['cola'], {}))
+
+        if options['json']:
+            self.stdout.write(json.dumps(filas))
+            return
+
+        pasos = ' '.join(f'p{paso:<4}' for paso in PASOS_PRIORIDAD)
+        self.stdout.write(f'{"cola":<8} {"pendientes":>10}  {pasos}  {"espera":>9}  {"workers":>7} {"en proceso":>10}')
+        for fila in filas:
+            por_paso = ' '.join(f'{fila["por_prioridad"][paso]:<5}' for paso in PASOS_PRIORIDAD)
+            self.stdout.write(
+                f'{fila["cola"]:<8} {fila["pendientes"]:>10}  {por_paso}  {_duracion(fila["espera_s"]):>9}  '
+                f'{fila.get("workers", "—")!s:>7} {fila.get("en_proceso", "—")!s:>10}'
+            )
+            if not options['sin_workers'] and fila['pendientes'] and not fila.get('workers'):
+                self.stdout.write(self.style.WARNING(f'  ⚠ Ningún worker consume la cola "{fila["cola"]}"'))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.14 on 2026-10-19 02:57
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Espejo local de SICSER: la pantalla de consulta lee esta tabla
+    (paginada e indexada) y Celery Beat la sincroniza de forma incremental.
+    """
+
+    dependencies = [
+        ('servicio_tecnico', '0066_formato_oow_numero_cargador'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrdenSicserEspejo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('origen', models.CharField(choices=[('oow', 'SICSER OOW'), ('garantia', 'SICSER Garantía Dell')], help_text='API de SICSER de la que proviene el registro', max_length=20)),
+                ('id_externo', models.CharField(help_text='id_orden (OOW) o numero_dps (garantía) en SICSER', max_length=50)),
+                ('codigo_pais', models.CharField(help_text='Código ISO del país del registro (MX, AR, CL, CO)', max_length=2)),
+                ('folio', models.CharField(blank=True, help_text='Folio SICSER (OOW) o número DPS (garantía)', max_length=80)),
+                ('service_tag', models.CharField(blank=True, help_text='Service Tag / número de serie del equipo', max_length=50)),
+                ('nombre_cliente', models.CharField(blank=True, help_text='Cliente (OOW) o contacto/empresa (garantía)', max_length=200)),
+                ('codigo_cis_url', models.CharField(blank=True, help_text='Código CIS corto (DROP, SAT, GDL…) usado al importar', max_length=10)),
+                ('fecha_sicser', models.DateTimeField(blank=True, help_text='Fecha de ingreso/recepción reportada por SICSER', null=True)),
+                ('texto_busqueda', models.TextField(blank=True, help_text='Campos buscables concatenados en minúsculas (filtro «Buscar»)')),
+                ('datos', models.JSONField(default=dict, help_text='Registro crudo tal como lo devolvió la API de SICSER')),
+                ('huella', models.CharField(help_text='SHA-1 del registro crudo; si no cambia, la sincronización no escribe', max_length=40)),
+                ('vigente', models.BooleanField(default=True, help_text='¿Aparece todavía en el último listado de SICSER?')),
+                ('ya_importada', models.BooleanField(default=False, help_text='¿Ya existe como orden en SIGMA?')),
+                ('fecha_alta', models.DateTimeField(auto_now_add=True, help_text='Primera vez que la sincronización vio este registro')),
+                ('fecha_sincronizacion', models.DateTimeField(default=django.utils.timezone.now, help_text='Última sincronización que confirmó o actualizó el registro')),
+                ('orden', models.ForeignKey(blank=True, help_text='Orden SIGMA creada a partir de este registro (si ya se importó)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='espejos_sicser', to='servicio_tecnico.ordenservicio')),
+            ],
+            options={
+                'verbose_name': 'Registro espejo SICSER',
+                'verbose_name_plural': 'Espejo SICSER',
+                'indexes': [models.Index(fields=['codigo_pais', 'origen', 'vigente', '-fecha_sicser'], name='espejo_sicser_listado_idx'), models.Index(fields=['origen', 'ya_importada'], name='espejo_sicser_importada_idx')],
+                'constraints': [models.UniqueConstraint(fields=('origen', 'id_externo'), name='unico_espejo_sicser_origen_id')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.14 on 2026-10-19 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Contador atómico de folios por año: reemplaza la búsqueda del último
+    ORD-<año>-NNNN al crear una orden (y evita folios duplicados).
+    """
+
+    dependencies = [
+        ('servicio_tecnico', '0067_ordensicserespejo'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorFolio',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(help_text="Tipo de folio (p. ej. 'orden_servicio')", max_length=50)),
+                ('año', models.IntegerField(help_text='Año al que pertenece el consecutivo (se reinicia cada año)')),
+                ('ultimo_numero', models.PositiveIntegerField(default=0, help_text='Último consecutivo entregado')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Última vez que se entregó un folio')),
+            ],
+            options={
+                'verbose_name': 'Contador de folios',
+                'verbose_name_plural': 'Contadores de folios',
+                'constraints': [models.UniqueConstraint(fields=('clave', 'año'), name='unico_contador_folio_clave_anio')],
+            },
+        ),
+    ]
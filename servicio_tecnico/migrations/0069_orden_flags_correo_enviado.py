@@ -0,0 +1,64 @@
+# Generated by Django 5.2.14 on 2026-10-19 03:35
+#
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# 1) Agrega a OrdenServicio los flags de correos de evidencia ya enviados
+#    (imágenes de ingreso, imágenes de egreso y video rewind).
+# 2) Backfill: los marca en las órdenes que ya tienen el evento 'email'
+#    en su historial, con las mismas frases que buscaba el detalle.
+
+from django.db import migrations, models
+
+
+# Copia de HistorialOrden.MARCAS_CORREO_ENVIADO (las migraciones no importan
+# constantes del modelo vivo).
+MARCAS_CORREO_ENVIADO = (
+    ('imágenes de ingreso', 'correo_imagenes_ingreso_enviado'),
+    ('imágenes de egreso', 'correo_imagenes_egreso_enviado'),
+    ('video rewind', 'correo_rewind_enviado'),
+)
+
+
+def marcar_correos_ya_enviados(apps, schema_editor):
+    """
+    Pone en True cada flag en las órdenes con un evento de email que lo menciona.
+
+    Una sola UPDATE por flag (subconsulta sobre el historial).
+    """
+    db_alias = schema_editor.connection.alias
+    OrdenServicio = apps.get_model('servicio_tecnico', 'OrdenServicio')
+    HistorialOrden = apps.get_model('servicio_tecnico', 'HistorialOrden')
+
+    for marca, flag in MARCAS_CORREO_ENVIADO:
+        ordenes_con_correo = HistorialOrden.objects.using(db_alias).filter(
+            tipo_evento='email',
+            comentario__icontains=marca,
+        ).values('orden_id')
+        OrdenServicio.objects.using(db_alias).filter(
+            pk__in=ordenes_con_correo,
+        ).update(**{flag: True})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('servicio_tecnico', '0068_contadorfolio'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ordenservicio',
+            name='correo_imagenes_egreso_enviado',
+            field=models.BooleanField(default=False, help_text='¿Ya se envió al cliente el correo con imágenes de egreso?'),
+        ),
+        migrations.AddField(
+            model_name='ordenservicio',
+            name='correo_imagenes_ingreso_enviado',
+            field=models.BooleanField(default=False, help_text='¿Ya se envió al cliente el correo con imágenes de ingreso?'),
+        ),
+        migrations.AddField(
+            model_name='ordenservicio',
+            name='correo_rewind_enviado',
+            field=models.BooleanField(default=False, help_text='¿Ya se envió al cliente el correo con el video rewind?'),
+        ),
+        migrations.RunPython(marcar_correos_ya_enviados, migrations.RunPython.noop),
+    ]
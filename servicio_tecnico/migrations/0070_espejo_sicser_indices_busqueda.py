@@ -0,0 +1,58 @@
+# Generated by Django 5.2.14 on 2026-10-19 07:48
+
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+INDICE_TRIGRAM = 'espejo_sicser_texto_trgm'
+
+
+def folios_a_mayusculas(apps, schema_editor):
+    """Las filas existentes quedan igual que las que escribe la sincronización."""
+    OrdenSicserEspejo = apps.get_model('servicio_tecnico', 'OrdenSicserEspejo')
+    OrdenSicserEspejo.objects.using(schema_editor.connection.alias).update(
+        folio=Upper('folio'),
+        service_tag=Upper('service_tag'),
+    )
+
+
+def crear_indice_trigram(apps, schema_editor):
+    """Índice GIN trigram para LIKE '%texto%' (solo PostgreSQL)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDICE_TRIGRAM} '
+        'ON servicio_tecnico_ordensicserespejo USING gin (texto_busqueda gin_trgm_ops)'
+    )
+
+
+def borrar_indice_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDICE_TRIGRAM}')
+
+
+class Migration(migrations.Migration):
+    """
+    Búsqueda indexada del espejo SICSER: folio y service tag en mayúsculas
+    con índice (prefijo), y trigram sobre texto_busqueda para texto libre.
+    """
+
+    dependencies = [
+        ('servicio_tecnico', '0069_orden_flags_correo_enviado'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ordensicserespejo',
+            name='folio',
+            field=models.CharField(blank=True, db_index=True, help_text='Folio SICSER (OOW) o número DPS (garantía), en mayúsculas', max_length=80),
+        ),
+        migrations.AlterField(
+            model_name='ordensicserespejo',
+            name='service_tag',
+            field=models.CharField(blank=True, db_index=True, help_text='Service Tag / número de serie del equipo, en mayúsculas', max_length=50),
+        ),
+        migrations.RunPython(folios_a_mayusculas, migrations.RunPython.noop),
+        migrations.RunPython(crear_indice_trigram, borrar_indice_trigram),
+    ]
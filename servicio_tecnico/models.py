@@ -2,9 +2,14 @@
 Modelos para el Sistema de Gestión de Órdenes de Servicio Técnico
 Gestiona el ciclo completo de reparación de equipos de cómputo
 """
+import copy
+
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.validators import FileExtensionValidator, MinValueValidator
+from config.agregados import Total, anotar_totales, leer_total
+from config.indice_texto import AutomataSubcadenas, IndicePorPais
 from config.validators import FileSizeValidator
 from decimal import Decimal
 from io import BytesIO
@@ -133,7 +138,28 @@ class OrdenServicio(models.Model):
         related_name='ordenes_notificacion_equipo_disponible',
         help_text="Empleado que envió el correo de equipo disponible al cliente",
     )
-    
+
+    # ------------------------------------------------------------------
+    # CORREOS DE EVIDENCIA YA ENVIADOS AL CLIENTE
+    # EXPLICACIÓN PARA PRINCIPIANTES:
+    # Antes el detalle de la orden buscaba frases en el historial
+    # ("imágenes de ingreso", "video rewind"...) en cada carga. Ahora el
+    # signal de HistorialOrden marca estos flags una sola vez al registrar
+    # el evento de email, y la página solo lee la orden.
+    # ------------------------------------------------------------------
+    correo_imagenes_ingreso_enviado = models.BooleanField(
+        default=False,
+        help_text="¿Ya se envió al cliente el correo con imágenes de ingreso?",
+    )
+    correo_imagenes_egreso_enviado = models.BooleanField(
+        default=False,
+        help_text="¿Ya se envió al cliente el correo con imágenes de egreso?",
+    )
+    correo_rewind_enviado = models.BooleanField(
+        default=False,
+        help_text="¿Ya se envió al cliente el correo con el video rewind?",
+    )
+
     # UBICACIÓN Y RESPONSABLES
     sucursal = models.ForeignKey(
         Sucursal,
@@ -315,47 +341,154 @@ class OrdenServicio(models.Model):
         help_text="Semana del año (1-53)"
     )
     
+    # Campos cuyo valor "al cargar" se recuerda para detectar cambios sin
+    # volver a leer la fila en save() ni en los signals de signals.py.
+    CAMPOS_RASTREADOS = ('estado', 'estado_rhitso', 'tecnico_asignado_actual_id', 'es_candidato_rhitso')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Construye la instancia leída de la BD y toma la foto de CAMPOS_RASTREADOS.
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Django llama a from_db cada vez que una consulta devuelve una orden.
+        Guardar ahí los valores originales nos dice "qué cambió" al guardar
+        sin hacer un SELECT extra.
+        """
+        instancia = super().from_db(db, field_names, values)
+        instancia._guardar_valores_originales()
+        return instancia
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """Recarga desde la BD y actualiza la foto de los campos recargados."""
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self._guardar_valores_originales(fields)
+
+    def _guardar_valores_originales(self, campos=None):
+        """
+        Guarda el valor actual de los campos rastreados como "original".
+
+        Args:
+            campos: nombres a actualizar (None = todos). Los campos diferidos
+                (.only()/.defer()) se omiten y valor_original los consulta.
+        """
+        diferidos = self.get_deferred_fields()
+        originales = getattr(self, '_valores_originales', None) or {}
+        for campo in self.CAMPOS_RASTREADOS:
+            nombre_campo = campo[:-3] if campo.endswith('_id') else campo
+            if campos is not None and campo not in campos and nombre_campo not in campos:
+                continue
+            if campo in diferidos:
+                originales.pop(campo, None)
+            else:
+                originales[campo] = getattr(self, campo)
+        self._valores_originales = originales
+
+    def valor_original(self, campo):
+        """
+        Valor que tenía `campo` en la BD al cargar la orden (o tras el último save).
+
+        Solo consulta la BD si la instancia no salió de una consulta
+        (p. ej. OrdenServicio(pk=...) armada a mano) o el campo estaba diferido.
+
+        Args:
+            campo (str): uno de CAMPOS_RASTREADOS
+
+        Returns:
+            Valor original, o None si la orden es nueva o ya no existe.
+        """
+        if self.pk is None:
+            return None
+        originales = getattr(self, '_valores_originales', None) or {}
+        if campo not in originales:
+            manager = OrdenServicio.objects
+            if self._state.db:
+                manager = manager.db_manager(self._state.db)
+            en_bd = manager.filter(pk=self.pk).values(*self.CAMPOS_RASTREADOS).first()
+            originales.update(en_bd or dict.fromkeys(self.CAMPOS_RASTREADOS))
+            self._valores_originales = originales
+        return originales[campo]
+
+    @staticmethod
+    def _ultimo_folio_del_año(año, using):
+        """
+        Mayor consecutivo ORD-<año>-NNNN ya usado (siembra ContadorFolio).
+
+        EXPLICACIÓN: solo corre la primera vez que se crea el contador de un
+        año en un país. Se compara como número, no como texto, para que
+        ORD-2025-10000 cuente como mayor que ORD-2025-9999.
+        """
+        prefijo = f'ORD-{año}-'
+        ultimo = 0
+        folios = OrdenServicio.objects.using(using).filter(
+            numero_orden_interno__startswith=prefijo,
+        ).values_list('numero_orden_interno', flat=True)
+        for folio in folios.iterator():
+            consecutivo = folio[len(prefijo):]
+            if consecutivo.isdigit():
+                ultimo = max(ultimo, int(consecutivo))
+        return ultimo
+
+    @staticmethod
+    def reservar_folios(cantidad, using):
+        """
+        Reserva `cantidad` folios ORD-<año>-NNNN consecutivos de una vez.
+
+        EXPLICACIÓN: save() pide uno por orden; las importaciones por lote
+        (sicser_import) piden todo el bloque con un solo UPDATE del contador
+        y asignan numero_orden_interno antes de guardar cada orden.
+
+        Args:
+            cantidad (int): folios a reservar (1 o más).
+            using (str): alias de la BD del país.
+
+        Returns:
+            list[str]: folios en orden ascendente.
+        """
+        año_actual = timezone.now().year
+        ultimo = ContadorFolio.siguiente(
+            ContadorFolio.CLAVE_ORDEN_SERVICIO,
+            año_actual,
+            using=using,
+            ultimo_usado=lambda: OrdenServicio._ultimo_folio_del_año(año_actual, using),
+            cantidad=cantidad,
+        )
+        return [
+            f"ORD-{año_actual}-{numero:04d}"
+            for numero in range(ultimo - cantidad + 1, ultimo + 1)
+        ]
+
     def save(self, *args, **kwargs):
         """
         Sobrescribir save para:
         1. Generar número de orden automático
         2. Calcular campos de fecha
         3. Registrar eventos en el historial
+
+        El estado y técnico anteriores salen de la foto tomada al cargar
+        (from_db); el folio sale de ContadorFolio, que lo reparte de forma
+        atómica aunque dos recepciones creen órdenes al mismo tiempo.
         """
+        from django.db import router
+
         es_nueva = self.pk is None
         estado_anterior = None
-        tecnico_anterior = None
+        tecnico_anterior_id = None
+        # save(update_fields=[...]) solo escribe esos campos: lo demás que se
+        # haya cambiado en memoria no cuenta como guardado (ni para el historial)
+        update_fields = kwargs.get('update_fields')
         
-        # Si es actualización, guardar estado anterior
+        # Si es actualización, tomar el estado anterior de la foto (sin SELECT)
         if not es_nueva:
-            try:
-                orden_anterior = OrdenServicio.objects.get(pk=self.pk)
-                estado_anterior = orden_anterior.estado
-                tecnico_anterior = orden_anterior.tecnico_asignado_actual
-            except OrdenServicio.DoesNotExist:
-                pass
+            if update_fields is None or 'estado' in update_fields:
+                estado_anterior = self.valor_original('estado')
+            if update_fields is None or {'tecnico_asignado_actual', 'tecnico_asignado_actual_id'} & set(update_fields):
+                tecnico_anterior_id = self.valor_original('tecnico_asignado_actual_id')
         
         # Generar número de orden si es nuevo
         if not self.numero_orden_interno:
-            año_actual = timezone.now().year
-            
-            # Obtener el último número del año
-            ultima_orden = OrdenServicio.objects.filter(
-                numero_orden_interno__startswith=f'ORD-{año_actual}'
-            ).order_by('-numero_orden_interno').first()
-            
-            if ultima_orden:
-                try:
-                    ultimo_numero = int(ultima_orden.numero_orden_interno.split('-')[-1])
-                    siguiente_numero = ultimo_numero + 1
-                except (ValueError, IndexError):
-                    siguiente_numero = OrdenServicio.objects.filter(
-                        numero_orden_interno__startswith=f'ORD-{año_actual}'
-                    ).count() + 1
-            else:
-                siguiente_numero = 1
-            
-            self.numero_orden_interno = f"ORD-{año_actual}-{siguiente_numero:04d}"
+            using = kwargs.get('using') or router.db_for_write(OrdenServicio, instance=self)
+            self.numero_orden_interno = OrdenServicio.reservar_folios(1, using)[0]
         
         # Calcular campos de fecha
         fecha = self.fecha_ingreso
@@ -365,6 +498,8 @@ class OrdenServicio(models.Model):
         
         # Guardar el objeto
         super().save(*args, **kwargs)
+        # Lo recién guardado es el nuevo "original" para el próximo save
+        self._guardar_valores_originales(update_fields)
         
         # Registrar eventos en historial
         if es_nueva:
@@ -386,8 +521,13 @@ class OrdenServicio(models.Model):
                     es_sistema=True
                 )
             
-            # Registrar cambio de técnico
-            if tecnico_anterior and tecnico_anterior != self.tecnico_asignado_actual:
+            # Registrar cambio de técnico (el Empleado anterior solo se lee si cambió)
+            tecnico_anterior = None
+            if tecnico_anterior_id and tecnico_anterior_id != self.tecnico_asignado_actual_id:
+                tecnico_anterior = Empleado.objects.db_manager(self._state.db).filter(
+                    pk=tecnico_anterior_id,
+                ).first()
+            if tecnico_anterior:
                 HistorialOrden.objects.create(
                     orden=self,
                     tipo_evento='cambio_tecnico',
@@ -1224,6 +1364,13 @@ class ReferenciaGamaEquipo(models.Model):
         """
         Busca la gama de un equipo según su marca y modelo.
         
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Primero busca el modelo exacto; si no, la primera referencia (en el
+        orden marca, modelo_base) cuyo modelo_base aparece dentro del modelo.
+        Ya no consulta la BD en cada llamada: usa un índice en memoria por
+        país (ver `_construir_indice_gamas`) que se rearma cuando cambia la
+        tabla.
+        
         Args:
             marca (str): Marca del equipo
             modelo (str): Modelo del equipo
@@ -1231,27 +1378,35 @@ class ReferenciaGamaEquipo(models.Model):
         Returns:
             ReferenciaGamaEquipo o None: Referencia encontrada o None
         """
-        # Buscar coincidencia exacta primero
-        referencia = cls.objects.filter(
-            marca__iexact=marca,
-            modelo_base__iexact=modelo,
-            activo=True
-        ).first()
-        
-        if referencia:
-            return referencia
-        
-        # Buscar coincidencia parcial (el modelo contiene el modelo_base)
-        referencias = cls.objects.filter(
-            marca__iexact=marca,
-            activo=True
-        )
+        return cls.obtener_gamas([(marca, modelo)])[0]
+    
+    @classmethod
+    def obtener_gamas(cls, pares):
+        """
+        Versión por lote de obtener_gama() para importaciones masivas.
         
-        for ref in referencias:
-            if ref.modelo_base.lower() in modelo.lower():
-                return ref
+        Args:
+            pares: iterable de (marca, modelo)
         
-        return None
+        Returns:
+            list: ReferenciaGamaEquipo o None por cada par, en el mismo orden.
+        """
+        indice = INDICE_GAMAS.obtener()
+        resultados = []
+        for marca, modelo in pares:
+            modelo = (modelo or '').lower()
+            exactos, automata = indice.get((marca or '').lower(), ({}, None))
+
+            referencia = exactos.get(modelo)
+            if referencia is None and automata is not None:
+                # Coincidencia parcial: gana la primera en el orden del catálogo
+                coincidencias = automata.buscar(modelo)
+                if coincidencias:
+                    referencia = min(coincidencias, key=lambda par: par[0])[1]
+
+            # Copia: el índice es compartido y nadie debe modificarlo por accidente
+            resultados.append(copy.copy(referencia) if referencia is not None else None)
+        return resultados
     
     def __str__(self):
         return f"{self.marca} {self.modelo_base} - {self.get_gama_display()}"
@@ -1263,12 +1418,87 @@ class ReferenciaGamaEquipo(models.Model):
         unique_together = ['marca', 'modelo_base']
 
 
+def _construir_indice_gamas(db_alias):
+    """
+    Índice de ReferenciaGamaEquipo activas de un país, agrupado por marca.
+    
+    Returns:
+        dict: marca en minúsculas → (modelo_base exacto → referencia,
+        autómata de modelo_base → (posición en el catálogo, referencia)).
+    """
+    por_marca = {}
+    referencias = ReferenciaGamaEquipo.objects.using(db_alias).filter(activo=True)
+    for posicion, referencia in enumerate(referencias):
+        claves = por_marca.setdefault(referencia.marca.lower(), [])
+        claves.append((referencia.modelo_base.lower(), (posicion, referencia)))
+
+    indice = {}
+    for marca, claves in por_marca.items():
+        exactos = {}
+        for modelo_base, (_, referencia) in claves:
+            exactos.setdefault(modelo_base, referencia)
+        indice[marca] = (exactos, AutomataSubcadenas(claves))
+    return indice
+
+
+INDICE_GAMAS = IndicePorPais('gamas', _construir_indice_gamas)
+
+
 
 
 # ============================================================================
 # MODELO 4: COTIZACIÓN
 # ============================================================================
 
+_COSTO_PIEZA = (models.F('cantidad') * models.F('costo_unitario'), lambda pieza: pieza.costo_total)
+
+# Totales de piezas cotizadas (ver config/agregados.py): se anotan con
+# Cotizacion.objects.con_totales(), se leen del prefetch o se consultan.
+TOTALES_COTIZACION = {
+    'costo_total_piezas': Total('piezas_cotizadas', suma=_COSTO_PIEZA),
+    'costo_piezas_aceptadas': Total(
+        'piezas_cotizadas', filtro=('aceptada_por_cliente', (True,)), suma=_COSTO_PIEZA,
+    ),
+    'costo_piezas_rechazadas': Total(
+        'piezas_cotizadas', filtro=('aceptada_por_cliente', (False,)), suma=_COSTO_PIEZA,
+    ),
+    # Precio cliente si existe (sincronizado desde Almacén); si no, costo de proveedor
+    'monto_piezas_aceptadas_cobro': Total(
+        'piezas_cotizadas',
+        filtro=('aceptada_por_cliente', (True,)),
+        suma=(
+            models.F('cantidad') * Coalesce('precio_unitario_cliente', 'costo_unitario'),
+            lambda pieza: (
+                pieza.costo_total if pieza.precio_unitario_cliente is None
+                else pieza.cantidad * pieza.precio_unitario_cliente
+            ),
+        ),
+    ),
+    # Solo piezas con precio cliente persistido (SUM ignora los NULL)
+    'precio_piezas_aceptadas_cliente': Total(
+        'piezas_cotizadas',
+        filtro=('aceptada_por_cliente', (True,)),
+        suma=(
+            models.F('cantidad') * models.F('precio_unitario_cliente'),
+            lambda pieza: pieza.precio_total_cliente,
+        ),
+    ),
+}
+
+
+class CotizacionQuerySet(models.QuerySet):
+    """QuerySet de Cotizacion (Cotizacion.objects)."""
+
+    def con_totales(self):
+        """
+        Anota los costos de piezas (totales, aceptadas, rechazadas, cobro) en la misma consulta.
+
+        Returns:
+            QuerySet: el mismo QuerySet con las anotaciones de TOTALES_COTIZACION.
+        """
+        return anotar_totales(self, TOTALES_COTIZACION)
+
+
 class Cotizacion(models.Model):
     """
     Cotización enviada al cliente con las piezas y servicios necesarios.
@@ -1326,30 +1556,27 @@ class Cotizacion(models.Model):
         default=False,
         help_text="¿Se descuenta la mano de obra como beneficio por aceptar la cotización?"
     )
+
+    objects = CotizacionQuerySet.as_manager()
+
+    def _total(self, nombre):
+        """Anotación de con_totales() → piezas precargadas → consulta."""
+        return leer_total(self, nombre, TOTALES_COTIZACION[nombre])
     
     @property
     def costo_total_piezas(self):
         """Calcula el costo total de todas las piezas cotizadas"""
-        return sum(
-            pieza.costo_total 
-            for pieza in self.piezas_cotizadas.all()
-        )
+        return self._total('costo_total_piezas')
     
     @property
     def costo_piezas_aceptadas(self):
         """Calcula el costo total de las piezas aceptadas por el cliente"""
-        return sum(
-            pieza.costo_total 
-            for pieza in self.piezas_cotizadas.filter(aceptada_por_cliente=True)
-        )
+        return self._total('costo_piezas_aceptadas')
     
     @property
     def costo_piezas_rechazadas(self):
         """Calcula el costo total de las piezas rechazadas por el cliente"""
-        return sum(
-            pieza.costo_total 
-            for pieza in self.piezas_cotizadas.filter(aceptada_por_cliente=False)
-        )
+        return self._total('costo_piezas_rechazadas')
     
     @property
     def costo_total(self):
@@ -1397,13 +1624,7 @@ class Cotizacion(models.Model):
         - Si no tiene precio al cliente (cotización legacy solo en ST),
           usa el costo de proveedor como fallback.
         """
-        total = Decimal('0.00')
-        for pieza in self.piezas_cotizadas.filter(aceptada_por_cliente=True):
-            if pieza.precio_unitario_cliente is not None:
-                total += pieza.cantidad * pieza.precio_unitario_cliente
-            else:
-                total += pieza.costo_total
-        return total
+        return Decimal('0.00') + self._total('monto_piezas_aceptadas_cobro')
 
     @property
     def costo_total_final(self):
@@ -1430,12 +1651,7 @@ class Cotizacion(models.Model):
         Returns:
             Decimal: Total precio cliente de piezas aceptadas
         """
-        from decimal import Decimal
-        total = Decimal('0.00')
-        for pieza in self.piezas_cotizadas.filter(aceptada_por_cliente=True):
-            if pieza.precio_unitario_cliente is not None:
-                total += pieza.cantidad * pieza.precio_unitario_cliente
-        return total
+        return Decimal('0.00') + self._total('precio_piezas_aceptadas_cliente')
 
     @property
     def margen_estimado(self):
@@ -2334,10 +2550,34 @@ class HistorialOrden(models.Model):
         default=False,
         help_text="¿Es un evento generado automáticamente por el sistema?"
     )
-    
+
+    # Frase del comentario de un evento 'email' → flag de OrdenServicio que marca.
+    # El rewind registra "video rewind — imágenes de egreso", así que marca ambos.
+    MARCAS_CORREO_ENVIADO = (
+        ('imágenes de ingreso', 'correo_imagenes_ingreso_enviado'),
+        ('imágenes de egreso', 'correo_imagenes_egreso_enviado'),
+        ('video rewind', 'correo_rewind_enviado'),
+    )
+
     def __str__(self):
         return f"{self.orden.numero_orden_interno} - {self.get_tipo_evento_display()} - {self.fecha_evento.strftime('%d/%m/%Y %H:%M')}"
-    
+
+    def flags_correo_enviado(self):
+        """
+        Flags de OrdenServicio que este evento deja en True.
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Solo los eventos de tipo 'email' cuentan; se comparan en minúsculas
+        contra MARCAS_CORREO_ENVIADO (igual que el icontains de antes).
+
+        Returns:
+            list[str]: nombres de campo (vacía si no es un correo de evidencia).
+        """
+        if self.tipo_evento != 'email' or not self.comentario:
+            return []
+        texto = self.comentario.lower()
+        return [flag for marca, flag in self.MARCAS_CORREO_ENVIADO if marca in texto]
+
     class Meta:
         ordering = ['-fecha_evento']
         verbose_name = "Evento de Historial"
@@ -4708,3 +4948,239 @@ class PagoOrden(models.Model):
             models.Index(fields=['orden', 'fecha_pago']),
         ]
 
+
+
+# ============================================================================
+# MODELO: ESPEJO LOCAL DE SICSER (consulta indexada)
+# ============================================================================
+
+class OrdenSicserEspejo(models.Model):
+    """
+    Copia local y normalizada de un registro de las APIs de SICSER.
+
+    Objetivo de negocio:
+        Que «Consultar SICSER» sea una consulta paginada e indexada a la BD
+        del país, en lugar de descargar y re-normalizar el listado completo
+        (multi-país) en cada request.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Celery Beat refresca esta tabla cada pocos minutos (sicser_espejo.py).
+    Solo se escriben filas nuevas o cuyo contenido cambió (campo `huella`).
+    `datos` guarda el registro crudo para reconstruir el dataclass de
+    sicser_client al importar, sin volver a llamar a SICSER.
+
+    Campos clave:
+        origen / id_externo: Identidad del registro en SICSER (id_orden o DPS).
+        vigente: False si el registro ya no aparece en el listado de SICSER.
+        ya_importada / orden: Si ya existe como OrdenServicio en SIGMA.
+    """
+
+    ORIGEN_CHOICES = [
+        ('oow', 'SICSER OOW'),
+        ('garantia', 'SICSER Garantía Dell'),
+    ]
+
+    origen = models.CharField(
+        max_length=20,
+        choices=ORIGEN_CHOICES,
+        help_text="API de SICSER de la que proviene el registro",
+    )
+    id_externo = models.CharField(
+        max_length=50,
+        help_text="id_orden (OOW) o numero_dps (garantía) en SICSER",
+    )
+    codigo_pais = models.CharField(
+        max_length=2,
+        help_text="Código ISO del país del registro (MX, AR, CL, CO)",
+    )
+    folio = models.CharField(
+        max_length=80,
+        blank=True,
+        db_index=True,
+        help_text="Folio SICSER (OOW) o número DPS (garantía), en mayúsculas",
+    )
+    service_tag = models.CharField(
+        max_length=50,
+        blank=True,
+        db_index=True,
+        help_text="Service Tag / número de serie del equipo, en mayúsculas",
+    )
+    nombre_cliente = models.CharField(
+        max_length=200,
+        blank=True,
+        help_text="Cliente (OOW) o contacto/empresa (garantía)",
+    )
+    codigo_cis_url = models.CharField(
+        max_length=10,
+        blank=True,
+        help_text="Código CIS corto (DROP, SAT, GDL…) usado al importar",
+    )
+    fecha_sicser = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Fecha de ingreso/recepción reportada por SICSER",
+    )
+    texto_busqueda = models.TextField(
+        blank=True,
+        help_text="Campos buscables concatenados en minúsculas (filtro «Buscar»)",
+    )
+    datos = models.JSONField(
+        default=dict,
+        help_text="Registro crudo tal como lo devolvió la API de SICSER",
+    )
+    huella = models.CharField(
+        max_length=40,
+        help_text="SHA-1 del registro crudo; si no cambia, la sincronización no escribe",
+    )
+    vigente = models.BooleanField(
+        default=True,
+        help_text="¿Aparece todavía en el último listado de SICSER?",
+    )
+    ya_importada = models.BooleanField(
+        default=False,
+        help_text="¿Ya existe como orden en SIGMA?",
+    )
+    orden = models.ForeignKey(
+        OrdenServicio,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='espejos_sicser',
+        help_text="Orden SIGMA creada a partir de este registro (si ya se importó)",
+    )
+    fecha_alta = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Primera vez que la sincronización vio este registro",
+    )
+    fecha_sincronizacion = models.DateTimeField(
+        default=timezone.now,
+        help_text="Última sincronización que confirmó o actualizó el registro",
+    )
+
+    def a_registro(self):
+        """
+        Reconstruye el dataclass de sicser_client a partir de `datos`.
+
+        Returns:
+            OrdenOOWSicser | OrdenGarantiaSicser: Mismo objeto que devolvía
+            el listado en vivo (lo consumen template e importación).
+        """
+        from .sicser_client import _normalizar_registro_garantia, _normalizar_registro_oow
+
+        if self.origen == 'oow':
+            return _normalizar_registro_oow(self.datos)
+        return _normalizar_registro_garantia(self.datos)
+
+    def __str__(self):
+        return f"SICSER {self.get_origen_display()} {self.folio or self.id_externo}"
+
+    class Meta:
+        verbose_name = "Registro espejo SICSER"
+        verbose_name_plural = "Espejo SICSER"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['origen', 'id_externo'],
+                name='unico_espejo_sicser_origen_id',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['codigo_pais', 'origen', 'vigente', '-fecha_sicser'],
+                name='espejo_sicser_listado_idx',
+            ),
+            models.Index(
+                fields=['origen', 'ya_importada'],
+                name='espejo_sicser_importada_idx',
+            ),
+        ]
+
+
+class ContadorFolio(models.Model):
+    """
+    Último consecutivo entregado por clave y año (folios sin duplicados).
+
+    Objetivo de negocio:
+        Que dos recepciones que crean órdenes en el mismo segundo nunca
+        reciban el mismo ORD-<año>-NNNN, y que crear una orden no tenga que
+        buscar el último folio ordenando toda la tabla.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Cada país tiene su propia BD, así que hay una fila por (clave, año) en
+    cada país. `siguiente()` incrementa la fila con un UPDATE atómico
+    (ultimo_numero = ultimo_numero + 1) dentro de una transacción: la BD
+    bloquea la fila y la segunda petición espera a que termine la primera.
+    Si una orden falla después de pedir su número, ese número se salta
+    (igual que una secuencia de la BD); nunca se repite.
+    """
+
+    CLAVE_ORDEN_SERVICIO = 'orden_servicio'
+
+    clave = models.CharField(
+        max_length=50,
+        help_text="Tipo de folio (p. ej. 'orden_servicio')",
+    )
+    año = models.IntegerField(
+        help_text="Año al que pertenece el consecutivo (se reinicia cada año)",
+    )
+    ultimo_numero = models.PositiveIntegerField(
+        default=0,
+        help_text="Último consecutivo entregado",
+    )
+    fecha_actualizacion = models.DateTimeField(
+        auto_now=True,
+        help_text="Última vez que se entregó un folio",
+    )
+
+    @classmethod
+    def siguiente(cls, clave, año, using='default', ultimo_usado=None, cantidad=1):
+        """
+        Reserva y devuelve el siguiente consecutivo de (clave, año).
+
+        Args:
+            clave (str): tipo de folio.
+            año (int): año del consecutivo.
+            using (str): alias de la BD del país donde se guardará el registro.
+            ultimo_usado (callable, optional): devuelve el último número ya
+                usado; solo se llama la primera vez (cuando aún no existe la
+                fila) para continuar la numeración existente.
+            cantidad (int): consecutivos a reservar de una vez (lotes).
+
+        Returns:
+            int: consecutivo reservado (1, 2, 3, …); con cantidad > 1, el
+            ÚLTIMO del bloque (el bloque es ultimo - cantidad + 1 … ultimo).
+
+        Efectos secundarios:
+            Crea o actualiza la fila del contador en `using`.
+        """
+        from django.db import IntegrityError, transaction
+        from django.db.models import F
+
+        contadores = cls.objects.using(using).filter(clave=clave, año=año)
+        with transaction.atomic(using=using):
+            actualizadas = contadores.update(ultimo_numero=F('ultimo_numero') + cantidad)
+            if not actualizadas:
+                inicial = ultimo_usado() if ultimo_usado else 0
+                try:
+                    with transaction.atomic(using=using):
+                        cls.objects.using(using).create(
+                            clave=clave,
+                            año=año,
+                            ultimo_numero=inicial + cantidad,
+                        )
+                except IntegrityError:
+                    # Otra petición creó la fila primero: incrementamos la suya
+                    contadores.update(ultimo_numero=F('ultimo_numero') + cantidad)
+            return contadores.values_list('ultimo_numero', flat=True).get()
+
+    def __str__(self):
+        return f"{self.clave} {self.año}: {self.ultimo_numero}"
+
+    class Meta:
+        verbose_name = "Contador de folios"
+        verbose_name_plural = "Contadores de folios"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['clave', 'año'],
+                name='unico_contador_folio_clave_anio',
+            ),
+        ]
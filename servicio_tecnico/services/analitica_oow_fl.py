@@ -0,0 +1,781 @@
+"""
+Marco columnar (pandas) del dashboard OOW/FL y de su export a Excel.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+El dashboard de seguimiento OOW/FL lanzaba ~10 `.count()` y después
+recorría el QuerySet de órdenes al menos ocho veces en Python: montos,
+tiempo promedio, % en tiempo, tabla por responsable, desglose de ventas
+mostrador (que además volvía a filtrar TODAS las órdenes por cada
+responsable), top de productos, días por estatus (una consulta de
+historial por orden), evolución mensual y alertas. El Excel repetía casi
+todo con sus propias funciones.
+
+Aquí se cargan los datos UNA vez:
+
+1. Una consulta `.values()` con las columnas de la orden, su equipo, su
+   venta mostrador y su cotización (el cobro de piezas aceptadas y la
+   última actualización del historial van como subconsultas).
+2. Una consulta con las piezas vendidas en mostrador.
+3. Una consulta con los cambios de estado del historial.
+
+Con eso se arman DataFrames de pandas; los días hábiles de todas las
+órdenes se cuentan de una vez con numpy (calcular_dias_habiles_lote) y
+cada KPI, tabla por responsable, serie mensual, ranking y lista de
+alertas sale de un `groupby` o de una máscara sobre las columnas.
+
+Los montos se manejan en centavos (int64) para que las sumas sean exactas
+y se devuelven como Decimal (o float, donde antes era float), igual que
+en las funciones anteriores. Las listas conservan el orden que tenían
+antes (orden de aparición y `sorted` estable).
+
+Uso:
+    marco = MarcoOOWFL(ordenes)            # ordenes = QuerySet ya filtrado
+    marco.metricas()['total_ordenes']
+    marco.responsables()
+
+Efectos secundarios:
+- Solo lecturas ORM (3 consultas, +1 si hay alertas).
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from django.utils.encoding import force_str
+from django.utils.functional import cached_property
+
+from ..models import (
+    TOTALES_COTIZACION,
+    Cotizacion,
+    DetalleEquipo,
+    HistorialOrden,
+    OrdenServicio,
+    PiezaVentaMostrador,
+)
+from ..utils_rhitso import ESTADOS_FINALES, calcular_dias_habiles_lote, formatear_nombre_estado
+from .ventas_mostrador_analytics import categoria_venta_desde_valores
+
+# Umbrales de las alertas y del KPI "% en tiempo" (días)
+DIAS_EN_TIEMPO = 15
+DIAS_SIN_ACTUALIZAR = 5
+DIAS_COTIZACION_SIN_RESPUESTA = 7
+DIAS_REPARACION_LARGA = 10
+
+# Servicios de venta mostrador: (bandera, costo, nombre en desglose/top)
+SERVICIOS_VENTA_MOSTRADOR = (
+    ('incluye_cambio_pieza', 'costo_cambio_pieza', 'Cambio de Pieza'),
+    ('incluye_limpieza', 'costo_limpieza', 'Limpieza y Mantenimiento'),
+    ('incluye_kit_limpieza', 'costo_kit', 'Kit de Limpieza'),
+    ('incluye_reinstalacion_so', 'costo_reinstalacion', 'Reinstalación SO'),
+)
+
+MESES = [
+    'Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio',
+    'Julio', 'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre'
+]
+
+# Columna del marco → lookup de .values()
+_CAMPOS_ORDEN = {
+    'id': 'id',
+    'numero_orden_interno': 'numero_orden_interno',
+    'estado': 'estado',
+    'fecha_ingreso': 'fecha_ingreso',
+    'fecha_entrega': 'fecha_entrega',
+    'es_candidato_rhitso': 'es_candidato_rhitso',
+    'sucursal_id': 'sucursal_id',
+    'sucursal': 'sucursal__nombre',
+    'responsable_id': 'responsable_seguimiento_id',
+    'responsable': 'responsable_seguimiento__nombre_completo',
+    'tecnico': 'tecnico_asignado_actual__nombre_completo',
+    'detalle_pk': 'detalle_equipo__pk',
+    'orden_cliente': 'detalle_equipo__orden_cliente',
+    'numero_serie': 'detalle_equipo__numero_serie',
+    'tipo_equipo': 'detalle_equipo__tipo_equipo',
+    'marca': 'detalle_equipo__marca',
+    'modelo': 'detalle_equipo__modelo',
+    'gama': 'detalle_equipo__gama',
+    'vm_pk': 'venta_mostrador__pk',
+    'paquete': 'venta_mostrador__paquete',
+    'costo_paquete': 'venta_mostrador__costo_paquete',
+    'incluye_cambio_pieza': 'venta_mostrador__incluye_cambio_pieza',
+    'costo_cambio_pieza': 'venta_mostrador__costo_cambio_pieza',
+    'incluye_limpieza': 'venta_mostrador__incluye_limpieza',
+    'costo_limpieza': 'venta_mostrador__costo_limpieza',
+    'incluye_kit_limpieza': 'venta_mostrador__incluye_kit_limpieza',
+    'costo_kit': 'venta_mostrador__costo_kit',
+    'incluye_reinstalacion_so': 'venta_mostrador__incluye_reinstalacion_so',
+    'costo_reinstalacion': 'venta_mostrador__costo_reinstalacion',
+    'costo_respaldo': 'venta_mostrador__costo_respaldo',
+    'cot_pk': 'cotizacion__pk',
+    'usuario_acepto': 'cotizacion__usuario_acepto',
+    'cot_fecha_envio': 'cotizacion__fecha_envio',
+    'cot_fecha_respuesta': 'cotizacion__fecha_respuesta',
+    'costo_mano_obra': 'cotizacion__costo_mano_obra',
+    'descontar_mano_obra': 'cotizacion__descontar_mano_obra',
+    'cobro_piezas': 'cobro_piezas',
+    'ultima_actualizacion': 'ultima_actualizacion',
+}
+
+# Costos que suma VentaMostrador.total_venta (además de las piezas)
+_COSTOS_VENTA = (
+    'costo_paquete', 'costo_cambio_pieza', 'costo_limpieza',
+    'costo_kit', 'costo_reinstalacion', 'costo_respaldo',
+)
+
+
+def _centavos(serie):
+    """Serie de Decimal/None → int64 en centavos (None = 0)."""
+    return np.rint(pd.to_numeric(serie, errors='coerce').astype(float).fillna(0) * 100).astype('int64')
+
+
+def _pesos(centavos):
+    """Centavos → Decimal con 2 decimales (Decimal('0.00') para 0)."""
+    return Decimal(int(centavos)).scaleb(-2)
+
+
+def _fechas(serie):
+    """Serie de fechas → lista para calcular_dias_habiles_lote (NaT → None)."""
+    return [None if pd.isna(valor) else valor for valor in serie]
+
+
+def _utc(serie):
+    """Serie de datetimes (o vacía / con None) como datetime64 en UTC."""
+    return pd.to_datetime(serie, utc=True)
+
+
+def _display(campo):
+    """Diccionario código → etiqueta de los choices de un campo."""
+    return {codigo: force_str(etiqueta) for codigo, etiqueta in campo.flatchoices}
+
+
+class MarcoOOWFL:
+    """
+    Órdenes OOW/FL cargadas en columnas, con todos los cálculos del dashboard.
+
+    Args:
+        ordenes (QuerySet): órdenes ya filtradas. Su orden (order_by) se
+            respeta en todas las listas, igual que cuando se recorría.
+
+    Attributes:
+        ordenes (DataFrame): una fila por orden con columnas derivadas
+            (días hábiles, montos en centavos, banderas de cotización...).
+        piezas (DataFrame): piezas vendidas en mostrador, en el orden de las
+            órdenes.
+        tramos (DataFrame): días de cada orden en cada estado.
+    """
+
+    def __init__(self, ordenes):
+        ids = ordenes.order_by().values('pk')
+        self.ordenes = self._cargar_ordenes(ordenes)
+        self.piezas = self._cargar_piezas(ids)
+        self._completar_ordenes(self._cargar_cambios_estado(ids))
+
+    # ------------------------------------------------------------------
+    # CARGA (3 consultas)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cargar_ordenes(ordenes):
+        """Una fila por orden (consulta 1)."""
+        ultimo_evento = HistorialOrden.objects.filter(
+            orden=OuterRef('pk'),
+        ).order_by('-fecha_evento')
+        registros = ordenes.prefetch_related(None).annotate(
+            # La PK de Cotizacion ES el id de la orden: la subconsulta de
+            # TOTALES_COTIZACION se correlaciona directo con la orden.
+            cobro_piezas=TOTALES_COTIZACION['monto_piezas_aceptadas_cobro'].subconsulta(Cotizacion),
+            ultima_actualizacion=Subquery(ultimo_evento.values('fecha_evento')[:1]),
+        ).values(*_CAMPOS_ORDEN.values())
+
+        marco = pd.DataFrame.from_records(list(registros), columns=list(_CAMPOS_ORDEN.values()))
+        marco.columns = list(_CAMPOS_ORDEN)
+        marco['posicion'] = np.arange(len(marco))
+        return marco
+
+    def _cargar_piezas(self, ids):
+        """Piezas vendidas en mostrador de las órdenes (consulta 2)."""
+        # Orden por defecto del modelo (el mismo de venta.piezas_vendidas.all())
+        registros = PiezaVentaMostrador.objects.filter(
+            venta_mostrador_id__in=ids,
+        ).values('venta_mostrador_id', 'descripcion_pieza', 'cantidad', 'precio_unitario')
+        piezas = pd.DataFrame.from_records(
+            list(registros),
+            columns=['venta_mostrador_id', 'descripcion_pieza', 'cantidad', 'precio_unitario'],
+        ).rename(columns={'venta_mostrador_id': 'orden_id'})
+
+        piezas['cantidad'] = piezas['cantidad'].astype('int64')
+        piezas['subtotal_cent'] = piezas['cantidad'] * _centavos(piezas['precio_unitario'])
+        posiciones = self.ordenes.set_index('id')['posicion']
+        piezas['posicion'] = piezas['orden_id'].map(posiciones)
+        piezas['sub'] = np.arange(len(piezas))
+        return piezas.sort_values(['posicion', 'sub'], kind='stable').reset_index(drop=True)
+
+    @staticmethod
+    def _cargar_cambios_estado(ids):
+        """Cambios de estado del historial, cronológicos por orden (consulta 3)."""
+        registros = HistorialOrden.objects.filter(
+            orden_id__in=ids, tipo_evento='cambio_estado',
+        ).order_by('orden_id', 'fecha_evento', 'pk').values(
+            'orden_id', 'fecha_evento', 'estado_anterior', 'estado_nuevo',
+        )
+        return pd.DataFrame.from_records(
+            list(registros),
+            columns=['orden_id', 'fecha_evento', 'estado_anterior', 'estado_nuevo'],
+        )
+
+    # ------------------------------------------------------------------
+    # COLUMNAS DERIVADAS
+    # ------------------------------------------------------------------
+
+    def _completar_ordenes(self, cambios):
+        """Días hábiles, montos, banderas y tramos por estado (vectorizado)."""
+        marco = self.ordenes
+        hoy = timezone.now().date()
+        total = len(marco)
+
+        # ----- Días -----
+        marco['dias_habiles'] = np.array(
+            calcular_dias_habiles_lote(_fechas(marco['fecha_ingreso']), _fechas(marco['fecha_entrega'])),
+            dtype='int64',
+        )
+        ultimo_cambio = cambios.groupby('orden_id')['fecha_evento'].max()
+        inicio_sin_cambio = marco['id'].map(ultimo_cambio)
+        marco['dias_sin_actualizacion'] = np.array(
+            calcular_dias_habiles_lote(
+                [
+                    inicio if not pd.isna(inicio) else ingreso
+                    for inicio, ingreso in zip(inicio_sin_cambio, marco['fecha_ingreso'])
+                ],
+                [None] * total,
+            ),
+            dtype='int64',
+        )
+        # Cotizacion.dias_sin_respuesta: días NATURALES (envío → respuesta u hoy)
+        envio = _utc(marco['cot_fecha_envio']).dt.floor('D')
+        respuesta = _utc(marco['cot_fecha_respuesta']).dt.floor('D').fillna(pd.Timestamp(hoy, tz='UTC'))
+        marco['dias_sin_respuesta'] = (respuesta - envio).dt.days.fillna(0).astype('int64')
+
+        # ----- Banderas -----
+        marco['activo'] = ~marco['estado'].isin(ESTADOS_FINALES)
+        marco['finalizada'] = marco['estado'] == 'finalizado'
+        marco['entregada'] = marco['estado'] == 'entregado'
+        marco['tiene_vm'] = marco['vm_pk'].notna()
+        marco['tiene_cot'] = marco['cot_pk'].notna()
+        # usuario_acepto: True / False / None (None = sin respuesta)
+        marco['cot_aceptada'] = marco['tiene_cot'] & marco['usuario_acepto'].eq(True)
+        marco['cot_rechazada'] = marco['tiene_cot'] & marco['usuario_acepto'].eq(False)
+        marco['cot_pendiente'] = marco['tiene_cot'] & ~marco['cot_aceptada'] & ~marco['cot_rechazada']
+        marco['es_candidato_rhitso'] = marco['es_candidato_rhitso'].astype(bool)
+        # Banderas de la venta (None si la orden no tiene venta mostrador)
+        for bandera, _, _ in SERVICIOS_VENTA_MOSTRADOR:
+            marco[bandera] = marco[bandera].eq(True)
+
+        # "Sin asignar" = responsable 0 (igual que antes)
+        marco['resp_id'] = marco['responsable_id'].fillna(0).astype('int64')
+        marco['resp_nombre'] = marco['responsable'].where(marco['responsable_id'].notna(), 'Sin asignar')
+
+        # ----- Montos (centavos) -----
+        piezas_por_orden = self.piezas.groupby('orden_id')['subtotal_cent'].agg(['sum', 'size'])
+        marco['piezas_cent'] = marco['id'].map(piezas_por_orden['sum']).fillna(0).astype('int64')
+        marco['num_piezas'] = marco['id'].map(piezas_por_orden['size']).fillna(0).astype('int64')
+        for costo in _COSTOS_VENTA:
+            marco[f'{costo}_cent'] = _centavos(marco[costo])
+        monto_vm = marco['piezas_cent'] + sum(marco[f'{costo}_cent'] for costo in _COSTOS_VENTA)
+        marco['monto_vm_cent'] = monto_vm.where(marco['tiene_vm'], 0)
+
+        # Cotizacion.costo_total_final = piezas aceptadas al cobro + mano de obra aplicada
+        mano_obra = _centavos(marco['costo_mano_obra'])
+        descontada = marco['descontar_mano_obra'].eq(True) & marco['cot_aceptada']
+        monto_cot = _centavos(marco['cobro_piezas']) + mano_obra.where(~descontada, 0)
+        marco['monto_cot_cent'] = monto_cot.where(marco['cot_aceptada'], 0)
+
+        # ----- Presentación -----
+        marco['estado_display'] = marco['estado'].map(_display(OrdenServicio._meta.get_field('estado')))
+        marco['estado_display'] = marco['estado_display'].fillna(marco['estado'])
+        fecha_ingreso = _utc(marco['fecha_ingreso'])
+        marco['anio'] = fecha_ingreso.dt.year.astype('Int64')
+        marco['mes_numero'] = fecha_ingreso.dt.month.astype('Int64')
+
+        self.tramos = self._armar_tramos(cambios)
+
+    def _armar_tramos(self, cambios):
+        """
+        Días hábiles por (orden, estado), misma regla que calcular_dias_por_estatus.
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Cada cambio de estado cierra un tramo y abre otro:
+        - primer tramo: ingreso → primer cambio, en `estado_anterior` del
+          primer cambio (o el estado actual si viene vacío);
+        - luego: cada cambio → el siguiente, en su `estado_nuevo`;
+        - el último tramo llega hasta hoy.
+        Sin cambios registrados: un tramo ingreso → hoy en el estado actual.
+        """
+        marco = self.ordenes
+        datos_orden = marco.set_index('id')[['posicion', 'fecha_ingreso', 'estado']]
+
+        cambios = cambios.join(datos_orden, on='orden_id')
+        cambios['paso'] = cambios.groupby('orden_id').cumcount() + 1
+        cambios['fin'] = cambios.groupby('orden_id')['fecha_evento'].shift(-1)
+
+        de_cambio = pd.DataFrame({
+            'orden_id': cambios['orden_id'],
+            'posicion': cambios['posicion'],
+            'paso': cambios['paso'],
+            'inicio': cambios['fecha_evento'],
+            'fin': cambios['fin'],
+            'estado': cambios['estado_nuevo'],
+        })
+        primeros = cambios[cambios['paso'] == 1]
+        iniciales = pd.DataFrame({
+            'orden_id': primeros['orden_id'],
+            'posicion': primeros['posicion'],
+            'paso': 0,
+            'inicio': primeros['fecha_ingreso'],
+            'fin': primeros['fecha_evento'],
+            'estado': primeros['estado_anterior'].where(
+                primeros['estado_anterior'].fillna('') != '', primeros['estado'],
+            ),
+        })
+        sin_cambios = marco[~marco['id'].isin(cambios['orden_id'])]
+        sin_historial = pd.DataFrame({
+            'orden_id': sin_cambios['id'],
+            'posicion': sin_cambios['posicion'],
+            'paso': 0,
+            'inicio': sin_cambios['fecha_ingreso'],
+            # NaT del mismo tipo que las fechas (hasta hoy)
+            'fin': pd.Series(pd.NaT, index=sin_cambios.index, dtype=cambios['fecha_evento'].dtype),
+            'estado': sin_cambios['estado'],
+        })
+
+        tramos = pd.concat(
+            [frame for frame in (iniciales, de_cambio, sin_historial) if len(frame)],
+        ) if len(marco) else pd.DataFrame(columns=['orden_id', 'posicion', 'paso', 'inicio', 'fin', 'estado'])
+        tramos = tramos[tramos['estado'].fillna('') != '']
+        tramos = tramos.sort_values(['posicion', 'paso'], kind='stable').reset_index(drop=True)
+        tramos['dias'] = np.array(
+            calcular_dias_habiles_lote(_fechas(tramos['inicio']), _fechas(tramos['fin'])),
+            dtype='int64',
+        )
+        # Un renglón por (orden, estado) en orden de aparición
+        return tramos.groupby(['posicion', 'orden_id', 'estado'], sort=False)['dias'].sum().reset_index()
+
+    # ------------------------------------------------------------------
+    # CONCEPTOS VENDIDOS (paquetes, servicios y piezas)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def conceptos(self):
+        """
+        Un renglón por concepto vendido en mostrador, en el orden de antes.
+
+        Por cada venta: paquete, servicios (si se incluyen y cuestan) y
+        piezas (descripción recortada a 50 caracteres).
+        """
+        ventas = self.ordenes[self.ordenes['tiene_vm']]
+        partes = []
+
+        paquetes = ventas[ventas['paquete'] != 'ninguno']
+        partes.append(pd.DataFrame({
+            'posicion': paquetes['posicion'],
+            'resp_id': paquetes['resp_id'],
+            'paso': 0,
+            'sub': 0,
+            'descripcion': 'Paquete ' + paquetes['paquete'].str.upper(),
+            'cantidad': 1,
+            'subtotal_cent': paquetes['costo_paquete_cent'],
+        }))
+        for paso, (bandera, costo, nombre) in enumerate(SERVICIOS_VENTA_MOSTRADOR, 1):
+            incluidos = ventas[ventas[bandera] & (ventas[f'{costo}_cent'] > 0)]
+            partes.append(pd.DataFrame({
+                'posicion': incluidos['posicion'],
+                'resp_id': incluidos['resp_id'],
+                'paso': paso,
+                'sub': 0,
+                'descripcion': nombre,
+                'cantidad': 1,
+                'subtotal_cent': incluidos[f'{costo}_cent'],
+            }))
+        piezas = self.piezas
+        partes.append(pd.DataFrame({
+            'posicion': piezas['posicion'],
+            'resp_id': piezas['orden_id'].map(self.ordenes.set_index('id')['resp_id']),
+            'paso': len(SERVICIOS_VENTA_MOSTRADOR) + 1,
+            'sub': np.arange(len(piezas)),
+            'descripcion': piezas['descripcion_pieza'].str.slice(0, 50),
+            'cantidad': piezas['cantidad'],
+            'subtotal_cent': piezas['subtotal_cent'],
+        }))
+
+        partes = [parte for parte in partes if len(parte)]
+        if not partes:
+            return pd.DataFrame(columns=['posicion', 'resp_id', 'paso', 'sub', 'descripcion', 'cantidad', 'subtotal_cent'])
+        return pd.concat(partes).sort_values(['posicion', 'paso', 'sub'], kind='stable').reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # KPIs Y TABLAS
+    # ------------------------------------------------------------------
+
+    def metricas(self):
+        """
+        Tarjetas de KPIs (mismas llaves que el dashboard).
+
+        Returns:
+            dict: conteos, montos (Decimal), tiempo promedio y % en tiempo.
+            ingreso_promedio_dia lo agrega la vista (depende del rango).
+        """
+        marco = self.ordenes
+        total = len(marco)
+        monto_vm = int(marco['monto_vm_cent'].sum())
+        monto_cot = int(marco['monto_cot_cent'].sum())
+        return {
+            'total_ordenes': total,
+            'ordenes_activas': int(marco['activo'].sum()),
+            'ordenes_finalizadas': int(marco['finalizada'].sum()),
+            'ordenes_entregadas': int(marco['entregada'].sum()),
+            'total_ventas_mostrador': int(marco['tiene_vm'].sum()),
+            'total_con_cotizacion': int(marco['tiene_cot'].sum()),
+            'cotizaciones_aceptadas': int(marco['cot_aceptada'].sum()),
+            'cotizaciones_pendientes': int(marco['cot_pendiente'].sum()),
+            'cotizaciones_rechazadas': int(marco['cot_rechazada'].sum()),
+            'monto_ventas_mostrador': _pesos(monto_vm),
+            'monto_cotizaciones': _pesos(monto_cot),
+            'monto_total': _pesos(monto_vm + monto_cot),
+            'tiempo_promedio': round(int(marco['dias_habiles'].sum()) / total, 1) if total > 0 else 0,
+            'porcentaje_en_tiempo': (
+                round((int((marco['dias_habiles'] <= DIAS_EN_TIEMPO).sum()) / total) * 100, 1)
+                if total > 0 else 0
+            ),
+        }
+
+    def distribucion_estados(self):
+        """{estado legible: cantidad} en orden de aparición."""
+        conteo = self.ordenes.groupby('estado_display', sort=False).size()
+        return {estado: int(cantidad) for estado, cantidad in conteo.items()}
+
+    def responsables(self):
+        """
+        Tabla por responsable de seguimiento (id 0 = "Sin asignar").
+
+        Returns:
+            list[dict]: misma forma que la tabla del dashboard, ordenada por
+            total de órdenes (descendente).
+        """
+        tabla = self.ordenes.groupby('resp_id', sort=False).agg(
+            nombre=('resp_nombre', 'first'),
+            total_ordenes=('id', 'size'),
+            ordenes_activas=('activo', 'sum'),
+            ordenes_finalizadas=('finalizada', 'sum'),
+            ordenes_entregadas=('entregada', 'sum'),
+            ventas_mostrador=('tiene_vm', 'sum'),
+            con_cotizacion=('tiene_cot', 'sum'),
+            cotizaciones_aceptadas=('cot_aceptada', 'sum'),
+            cotizaciones_pendientes=('cot_pendiente', 'sum'),
+            cotizaciones_rechazadas=('cot_rechazada', 'sum'),
+            monto_vm_cent=('monto_vm_cent', 'sum'),
+            monto_cot_cent=('monto_cot_cent', 'sum'),
+            dias_acumulados=('dias_habiles', 'sum'),
+        ).reset_index()
+
+        responsables = []
+        for fila in tabla.to_dict('records'):
+            total = fila['total_ordenes']
+            monto_vm = fila.pop('monto_vm_cent')
+            monto_cot = fila.pop('monto_cot_cent')
+            fila['id'] = fila.pop('resp_id')
+            fila.update({
+                'monto_ventas_mostrador': _pesos(monto_vm),
+                'monto_cotizaciones': _pesos(monto_cot),
+                'tiempo_promedio': round(fila['dias_acumulados'] / total, 1),
+                # Tasa de finalización = porcentaje de órdenes ENTREGADAS
+                'tasa_finalizacion': round((fila['ordenes_entregadas'] / total) * 100, 1),
+                'monto_total': _pesos(monto_vm + monto_cot),
+            })
+            responsables.append(fila)
+        return sorted(responsables, key=lambda x: x['total_ordenes'], reverse=True)
+
+    def sucursales(self):
+        """Órdenes, ventas mostrador, cotizaciones y monto (float) por sucursal."""
+        marco = self.ordenes.assign(monto_cent=self.ordenes['monto_vm_cent'] + self.ordenes['monto_cot_cent'])
+        tabla = marco.groupby('sucursal_id', sort=False).agg(
+            nombre=('sucursal', 'first'),
+            total_ordenes=('id', 'size'),
+            ventas_mostrador=('tiene_vm', 'sum'),
+            cotizaciones=('tiene_cot', 'sum'),
+            monto_cent=('monto_cent', 'sum'),
+        )
+        sucursales = [
+            {
+                'nombre': fila['nombre'],
+                'total_ordenes': fila['total_ordenes'],
+                'ventas_mostrador': fila['ventas_mostrador'],
+                'cotizaciones': fila['cotizaciones'],
+                'monto_total': fila['monto_cent'] / 100,
+            }
+            for fila in tabla.to_dict('records')
+        ]
+        return sorted(sucursales, key=lambda x: x['total_ordenes'], reverse=True)
+
+    def top_piezas(self, limite=5):
+        """
+        Piezas más vendidas (por cantidad), como obtener_top_productos_vendidos.
+
+        Returns:
+            list[dict]: descripcion, cantidad (int), subtotal (Decimal).
+        """
+        tabla = self.piezas.groupby('descripcion_pieza', sort=False).agg(
+            cantidad=('cantidad', 'sum'), subtotal_cent=('subtotal_cent', 'sum'),
+        ).reset_index()
+        piezas = [
+            {
+                'descripcion': fila['descripcion_pieza'],
+                'cantidad': fila['cantidad'],
+                'subtotal': _pesos(fila['subtotal_cent']),
+            }
+            for fila in tabla.to_dict('records')
+        ]
+        return sorted(piezas, key=lambda x: x['cantidad'], reverse=True)[:limite]
+
+    def top_conceptos(self, limite=10):
+        """
+        Paquetes, servicios y piezas más vendidos (por cantidad) — hoja del Excel.
+
+        Returns:
+            list[dict]: descripcion, cantidad, monto (float).
+        """
+        tabla = self.conceptos.groupby('descripcion', sort=False).agg(
+            cantidad=('cantidad', 'sum'), subtotal_cent=('subtotal_cent', 'sum'),
+        ).reset_index()
+        conceptos = [
+            {
+                'descripcion': fila['descripcion'],
+                'cantidad': int(fila['cantidad']),
+                'monto': fila['subtotal_cent'] / 100,
+            }
+            for fila in tabla.to_dict('records')
+        ]
+        return sorted(conceptos, key=lambda x: x['cantidad'], reverse=True)[:limite]
+
+    def grafico_ventas_por_responsable(self, responsables):
+        """
+        Gráfico de ventas mostrador por responsable con categoría y desglose.
+
+        Args:
+            responsables (list[dict]): resultado de self.responsables().
+
+        Returns:
+            dict: labels, data, categorias, iconos y desglose (top 10 conceptos
+            por subtotal de cada responsable).
+        """
+        grafico = {'labels': [], 'data': [], 'categorias': [], 'iconos': [], 'desglose': []}
+
+        ventas = self.ordenes[self.ordenes['tiene_vm']]
+        # La categoría que se muestra es la de la primera venta del responsable
+        primeras = ventas.drop_duplicates('resp_id').set_index('resp_id')
+        por_responsable = self.conceptos.groupby(['resp_id', 'descripcion'], sort=False).agg(
+            cantidad=('cantidad', 'sum'), subtotal_cent=('subtotal_cent', 'sum'),
+        ).reset_index()
+        desgloses = {}
+        for fila in por_responsable.to_dict('records'):
+            desgloses.setdefault(fila['resp_id'], []).append({
+                'descripcion': fila['descripcion'],
+                'cantidad': int(fila['cantidad']),
+                'subtotal': fila['subtotal_cent'] / 100,
+            })
+
+        for responsable in responsables:
+            if responsable['ventas_mostrador'] <= 0:
+                continue
+            venta = primeras.loc[responsable['id']]
+            cat_info = categoria_venta_desde_valores(
+                paquete=venta['paquete'],
+                cantidad_piezas=int(venta['num_piezas']),
+                incluye_cambio_pieza=bool(venta['incluye_cambio_pieza']),
+                incluye_limpieza=bool(venta['incluye_limpieza']),
+                incluye_kit_limpieza=bool(venta['incluye_kit_limpieza']),
+                incluye_reinstalacion_so=bool(venta['incluye_reinstalacion_so']),
+            )
+            desglose = sorted(desgloses.get(responsable['id'], []), key=lambda x: x['subtotal'], reverse=True)
+
+            grafico['labels'].append(responsable['nombre'])
+            grafico['data'].append(float(responsable['monto_ventas_mostrador']))
+            grafico['categorias'].append(cat_info['categoria'])
+            grafico['iconos'].append(cat_info['icono'])
+            grafico['desglose'].append(desglose[:10])
+        return grafico
+
+    def dias_por_estatus(self):
+        """
+        Promedio/mín/máx de días hábiles por estado (como calcular_promedio_dias_por_estatus).
+
+        Returns:
+            dict: {'estados_proceso': {...}, 'estados_finales': {...}} con
+            nombres legibles como llave.
+        """
+        tabla = self.tramos.groupby('estado', sort=False)['dias'].agg(['sum', 'count', 'min', 'max'])
+        estados_proceso = {}
+        estados_finales = {}
+        for estado_codigo, fila in tabla.iterrows():
+            stats = {
+                'promedio': round(int(fila['sum']) / int(fila['count']), 1),
+                'total_ordenes': int(fila['count']),
+                'min': int(fila['min']),
+                'max': int(fila['max']),
+                'codigo': estado_codigo,
+            }
+            destino = estados_finales if estado_codigo in ESTADOS_FINALES else estados_proceso
+            destino[formatear_nombre_estado(estado_codigo)] = stats
+        return {'estados_proceso': estados_proceso, 'estados_finales': estados_finales}
+
+    def datos_mensuales(self):
+        """
+        Estadísticas por mes de ingreso (como agrupar_ordenes_por_mes).
+
+        Returns:
+            list[dict]: un dict por mes, en orden cronológico.
+        """
+        tabla = self.ordenes.groupby(['anio', 'mes_numero'], sort=True).agg(
+            total_ordenes=('id', 'size'),
+            ordenes_finalizadas=('finalizada', 'sum'),
+            ordenes_entregadas=('entregada', 'sum'),
+            ventas_mostrador=('tiene_vm', 'sum'),
+            con_cotizacion=('tiene_cot', 'sum'),
+            cotizaciones_aceptadas=('cot_aceptada', 'sum'),
+            monto_vm_cent=('monto_vm_cent', 'sum'),
+            monto_cot_cent=('monto_cot_cent', 'sum'),
+            dias_acumulados=('dias_habiles', 'sum'),
+        ).reset_index()
+
+        meses = []
+        for fila in tabla.to_dict('records'):
+            anio, mes_numero, total = int(fila['anio']), int(fila['mes_numero']), fila['total_ordenes']
+            monto_vm, monto_cot = _pesos(fila['monto_vm_cent']), _pesos(fila['monto_cot_cent'])
+            meses.append({
+                'mes': f"{MESES[mes_numero - 1]} {anio}",
+                'año': anio,
+                'mes_numero': mes_numero,
+                'mes_key': f"{anio}-{mes_numero:02d}",
+                'total_ordenes': total,
+                'ordenes_finalizadas': fila['ordenes_finalizadas'],
+                'ordenes_entregadas': fila['ordenes_entregadas'],
+                'ventas_mostrador': fila['ventas_mostrador'],
+                'con_cotizacion': fila['con_cotizacion'],
+                'cotizaciones_aceptadas': fila['cotizaciones_aceptadas'],
+                'monto_ventas_mostrador': monto_vm,
+                'monto_cotizaciones': monto_cot,
+                'dias_promedio': round(fila['dias_acumulados'] / total, 1),
+                'monto_total': monto_vm + monto_cot,
+                'porcentaje_finalizadas': round((fila['ordenes_finalizadas'] / total) * 100, 1),
+            })
+        return meses
+
+    def alertas(self):
+        """
+        Órdenes retrasadas, sin actualización, con cotización sin respuesta o
+        mucho tiempo en reparación, de mayor a menor número de días.
+
+        Returns:
+            dict[str, list[dict]]: cada alerta trae la instancia `orden`
+            (una sola consulta para todas) y los datos para la tabla.
+        """
+        marco = self.ordenes
+        dias_reparacion = self.tramos[self.tramos['estado'] == 'reparacion'].set_index('orden_id')['dias']
+        en_reparacion = marco['id'].map(dias_reparacion).fillna(0).astype('int64')
+
+        reglas = {
+            'retrasadas': (
+                marco['activo'] & (marco['dias_habiles'] > DIAS_EN_TIEMPO),
+                marco['dias_habiles'], 'días hábiles',
+            ),
+            'sin_actualizacion': (
+                marco['activo'] & (marco['dias_sin_actualizacion'] > DIAS_SIN_ACTUALIZAR),
+                marco['dias_sin_actualizacion'], 'días sin cambio',
+            ),
+            'cotizaciones_pendientes': (
+                marco['cot_pendiente'] & (marco['dias_sin_respuesta'] > DIAS_COTIZACION_SIN_RESPUESTA),
+                marco['dias_sin_respuesta'], 'días sin respuesta',
+            ),
+            'en_reparacion_larga': (
+                (marco['estado'] == 'reparacion') & (en_reparacion > DIAS_REPARACION_LARGA),
+                en_reparacion, 'días en reparación',
+            ),
+        }
+
+        alguna = np.zeros(len(marco), dtype=bool)
+        for mascara, _, _ in reglas.values():
+            alguna |= mascara.to_numpy(dtype=bool)
+        instancias = OrdenServicio.objects.in_bulk(marco.loc[alguna, 'id'].tolist()) if alguna.any() else {}
+
+        tipos_gama = _display(DetalleEquipo._meta.get_field('gama'))
+        alertas = {}
+        for tipo, (mascara, dias, tipo_dias) in reglas.items():
+            seleccion = marco[mascara.to_numpy(dtype=bool)].assign(dias=dias[mascara.to_numpy(dtype=bool)])
+            lista = []
+            for fila in seleccion.to_dict('records'):
+                tiene_detalle = not pd.isna(fila['detalle_pk'])
+                lista.append({
+                    'orden': instancias[fila['id']],
+                    'dias': int(fila['dias']),
+                    'tipo_dias': tipo_dias,
+                    'orden_cliente': fila['orden_cliente'] if tiene_detalle else 'N/A',
+                    'estado': fila['estado_display'],
+                    'estado_codigo': fila['estado'],
+                    'responsable': fila['resp_nombre'],
+                    'modelo': fila['modelo'] if tiene_detalle else 'N/A',
+                    'gama': tipos_gama.get(fila['gama'], fila['gama']) if tiene_detalle else 'N/A',
+                    'es_candidato_rhitso': fila['es_candidato_rhitso'],
+                })
+            alertas[tipo] = sorted(lista, key=lambda x: x['dias'], reverse=True)
+        return alertas
+
+    def filas(self):
+        """
+        Una fila por orden, lista para las hojas del Excel.
+
+        Returns:
+            list[dict]: datos de equipo, estado, responsable, días, tipo de
+            orden y monto (float), cotización y última actualización.
+        """
+        marco = self.ordenes
+        tipo_orden = np.select(
+            [marco['tiene_vm'], marco['cot_aceptada'], marco['cot_rechazada'], marco['tiene_cot']],
+            ['Venta Mostrador', 'Cotización Aceptada', 'Cotización Rechazada', 'Cotización Pendiente'],
+            default='Servicio Normal',
+        )
+        monto_cent = np.where(marco['tiene_vm'], marco['monto_vm_cent'], marco['monto_cot_cent'])
+        cotizacion = np.select(
+            [marco['cot_aceptada'], marco['cot_rechazada'], marco['tiene_cot']],
+            ['✅ Aceptada', '❌ Rechazada', '⏳ Pendiente'],
+            default='N/A',
+        )
+        tipos_equipo = _display(DetalleEquipo._meta.get_field('tipo_equipo'))
+
+        filas = []
+        for indice, fila in enumerate(marco.to_dict('records')):
+            ultima = fila['ultima_actualizacion']
+            filas.append({
+                'id': fila['id'],
+                'resp_id': fila['resp_id'],
+                'activo': fila['activo'],
+                'estado': fila['estado'],
+                'estado_display': fila['estado_display'],
+                'orden_cliente': fila['orden_cliente'],
+                'numero_serie': fila['numero_serie'],
+                'tipo_equipo': tipos_equipo.get(fila['tipo_equipo'], fila['tipo_equipo']),
+                'marca': fila['marca'],
+                'modelo': fila['modelo'],
+                'responsable': fila['resp_nombre'],
+                'tecnico': fila['tecnico'],
+                'sucursal': fila['sucursal'],
+                'dias_habiles': fila['dias_habiles'],
+                'dias_sin_actualizacion': fila['dias_sin_actualizacion'],
+                'tipo_orden': str(tipo_orden[indice]),
+                'monto': int(monto_cent[indice]) / 100,
+                'cotizacion': str(cotizacion[indice]),
+                'fecha_ingreso': fila['fecha_ingreso'],
+                'ultima_actualizacion': None if pd.isna(ultima) else ultima,
+                'es_candidato_rhitso': fila['es_candidato_rhitso'],
+            })
+        return filas
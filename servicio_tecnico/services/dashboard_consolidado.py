@@ -0,0 +1,295 @@
+"""
+KPIs consolidados de todos los países (tablero ejecutivo regional).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+Cada país tiene su propia base de datos, y los dashboards normales solo ven
+la del subdominio actual. Este módulo calcula los mismos KPIs en los cuatro
+países A LA VEZ (config.middleware_pais.en_todos_los_paises) y los junta en
+un solo resultado:
+
+1. El resultado parcial de cada país se cachea por separado: si un país
+   tarda, los demás ya están listos y la siguiente carga lo toma del caché.
+2. Hay un tiempo límite: el país que no responde a tiempo sale como
+   "sin datos" en lugar de frenar toda la página (su hilo termina en segundo
+   plano y deja su caché para la próxima vez).
+   Mientras ese hilo sigue vivo, un candado en caché (cache.add) evita que
+   cada recarga lance otro cálculo del mismo país: sale "sin datos" hasta
+   que el primero termine.
+3. Los importes se muestran en la moneda de cada país (formato_moneda) y
+   se suman en moneda base (MXN) solo para los países con tipo de cambio
+   configurado (convertir_a_moneda_base).
+
+Efectos secundarios:
+- Lee/escribe el caché de Django (una llave por país y rango de fechas).
+"""
+
+import logging
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from config.middleware_pais import en_todos_los_paises, get_current_db_alias
+from config.paises_config import (
+    PAISES_CONFIG,
+    PAIS_DEFAULT,
+    convertir_a_moneda_base,
+    formato_moneda,
+)
+
+logger = logging.getLogger(__name__)
+
+# Subir si cambia la forma del dict de kpis_pais() (invalida cachés viejos)
+VERSION_CACHE_CONSOLIDADO = 1
+
+ESTADOS_CERRADOS = ('entregado', 'cancelado')
+
+# Conteos que se suman tal cual entre países
+CAMPOS_CONTEO = (
+    'ordenes_ingresadas',
+    'ordenes_entregadas',
+    'ordenes_activas',
+    'ordenes_fuera_garantia_activas',
+    'ordenes_rhitso_activas',
+    'total_cotizaciones',
+    'cotizaciones_aceptadas',
+    'cotizaciones_rechazadas',
+    'cotizaciones_pendientes',
+    'incidencias',
+)
+
+# Importes en moneda local: se formatean por país y se suman en moneda base
+CAMPOS_IMPORTE = ('valor_total_cotizado', 'valor_aceptado')
+
+# Vida máxima del candado de cálculo: si el hilo muere sin soltarlo, caduca
+BLOQUEO_CALCULO_TTL = 60 * 5
+
+
+def _clave_cache(db_alias, fecha_inicio, fecha_fin):
+    """Llave de caché del resultado parcial de un país."""
+    return (
+        f'dashboard_consolidado:v{VERSION_CACHE_CONSOLIDADO}:{db_alias}:'
+        f'{fecha_inicio:%Y%m%d}:{fecha_fin:%Y%m%d}'
+    )
+
+
+def _clave_calculando(clave_cache):
+    """Llave del candado «hay un hilo calculando este país y rango»."""
+    return f'{clave_cache}:calculando'
+
+
+def _numero(valor):
+    """float/int nativo desde numpy; NaN o None → 0."""
+    if valor is None:
+        return 0
+    valor = float(valor)
+    return 0 if math.isnan(valor) else valor
+
+
+def kpis_pais(fecha_inicio, fecha_fin):
+    """
+    KPIs del país activo en el contexto (órdenes, cotizaciones, ScoreCard).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    No recibe el país: corre dentro de `with pais(...)` (lo pone
+    en_todos_los_paises), así que el ORM ya apunta a la BD correcta. Las
+    cotizaciones usan el mismo motor que dashboard_cotizaciones
+    (obtener_dataframe_cotizaciones + calcular_kpis_generales).
+
+    Args:
+        fecha_inicio (datetime): inicio del periodo (timezone-aware).
+        fecha_fin (datetime): fin del periodo (timezone-aware).
+
+    Returns:
+        dict: conteos e importes en la moneda del país (tipos nativos, listo
+        para caché/JSON).
+    """
+    from scorecard.models import Incidencia
+
+    from ..models import OrdenServicio
+    from ..utils_cotizaciones import calcular_kpis_generales, obtener_dataframe_cotizaciones
+
+    activas = ~Q(estado__in=ESTADOS_CERRADOS)
+    ordenes = OrdenServicio.objects.aggregate(
+        ordenes_ingresadas=Count('pk', filter=Q(fecha_ingreso__range=(fecha_inicio, fecha_fin))),
+        ordenes_entregadas=Count('pk', filter=Q(fecha_entrega__range=(fecha_inicio, fecha_fin))),
+        ordenes_activas=Count('pk', filter=activas),
+        ordenes_fuera_garantia_activas=Count('pk', filter=activas & Q(es_fuera_garantia=True)),
+        ordenes_rhitso_activas=Count('pk', filter=activas & Q(es_candidato_rhitso=True)),
+    )
+
+    kpis_cotizacion = calcular_kpis_generales(
+        obtener_dataframe_cotizaciones(fecha_inicio=fecha_inicio, fecha_fin=fecha_fin)
+    )
+
+    incidencias = Incidencia.objects.filter(
+        fecha_deteccion__range=(fecha_inicio.date(), fecha_fin.date()),
+    ).count()
+
+    return {
+        **ordenes,
+        'total_cotizaciones': int(kpis_cotizacion['total_cotizaciones']),
+        'cotizaciones_aceptadas': int(kpis_cotizacion['aceptadas']),
+        'cotizaciones_rechazadas': int(kpis_cotizacion['rechazadas']),
+        'cotizaciones_pendientes': int(kpis_cotizacion['pendientes']),
+        'valor_total_cotizado': round(_numero(kpis_cotizacion['valor_total_cotizado']), 2),
+        'valor_aceptado': round(_numero(kpis_cotizacion['valor_aceptado']), 2),
+        'incidencias': incidencias,
+    }
+
+
+def _kpis_pais_cacheado(fecha_inicio, fecha_fin):
+    """
+    kpis_pais() + guardado en caché (corre en el hilo de cada país).
+
+    Suelta el candado de obtener_kpis_consolidados() al terminar, aunque
+    sea después del tiempo límite o con error.
+    """
+    clave = _clave_cache(get_current_db_alias(), fecha_inicio, fecha_fin)
+    try:
+        resultado = kpis_pais(fecha_inicio, fecha_fin)
+        cache.set(clave, resultado, getattr(settings, 'CACHE_TTL_DASHBOARD', 600))
+        return resultado
+    finally:
+        cache.delete(_clave_calculando(clave))
+
+
+def _tasa(parte, total):
+    """Porcentaje redondeado a 2 decimales (0 si no hay total)."""
+    return round(parte / total * 100, 2) if total else 0
+
+
+def obtener_kpis_consolidados(fecha_inicio, fecha_fin, paises=None, tiempo_limite=None):
+    """
+    KPIs de todos los países, consultados en paralelo y combinados.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    1. Lee del caché los países que ya tienen su resultado.
+    2. Los que faltan se calculan a la vez, uno por hilo; la espera total es
+       la del país más lento (con tope `tiempo_limite`), no la suma. Si otra
+       carga ya está calculando un país (candado tomado), no se lanza un
+       hilo más: ese país sale "sin datos" por ahora.
+    3. Junta todo: filas por país con sus importes en moneda local y totales
+       regionales con importes en moneda base.
+
+    Args:
+        fecha_inicio (datetime): inicio del periodo (timezone-aware).
+        fecha_fin (datetime): fin del periodo (timezone-aware).
+        paises (list | None): subdominios; None = todos los de PAISES_CONFIG.
+        tiempo_limite (float | None): segundos; None =
+            settings.DASHBOARD_CONSOLIDADO_TIEMPO_LIMITE.
+
+    Returns:
+        dict: {'paises': [fila por país], 'totales': {...},
+        'moneda_base': 'MXN', 'paises_sin_datos': [...],
+        'paises_sin_tipo_cambio': [...]}
+    """
+    paises = list(PAISES_CONFIG if paises is None else paises)
+    if tiempo_limite is None:
+        tiempo_limite = getattr(settings, 'DASHBOARD_CONSOLIDADO_TIEMPO_LIMITE', 20)
+
+    claves = {
+        subdominio: _clave_cache(PAISES_CONFIG[subdominio]['db_alias'], fecha_inicio, fecha_fin)
+        for subdominio in paises
+    }
+    parciales, desde_cache = {}, set()
+    for subdominio in paises:
+        guardado = cache.get(claves[subdominio])
+        if guardado is not None:
+            parciales[subdominio] = guardado
+            desde_cache.add(subdominio)
+
+    faltantes, errores = [], {}
+    for subdominio in paises:
+        if subdominio in parciales:
+            continue
+        if cache.add(_clave_calculando(claves[subdominio]), 1, BLOQUEO_CALCULO_TTL):
+            faltantes.append(subdominio)
+        else:
+            # Un hilo de una carga anterior sigue en ese país (lento o caído)
+            errores[subdominio] = TimeoutError(f'{subdominio}: cálculo en curso, aún sin respuesta')
+    if faltantes:
+        calculados, errores_calculo = en_todos_los_paises(
+            _kpis_pais_cacheado, fecha_inicio, fecha_fin,
+            paises=faltantes, tiempo_limite=tiempo_limite,
+        )
+        parciales.update(calculados)
+        errores.update(errores_calculo)
+
+    return consolidar(paises, parciales, errores, desde_cache)
+
+
+def consolidar(paises, parciales, errores=None, desde_cache=()):
+    """
+    Junta los KPIs por país en filas + totales regionales.
+
+    Args:
+        paises (list): subdominios en el orden a mostrar.
+        parciales (dict): {subdominio: dict de kpis_pais()}.
+        errores (dict | None): {subdominio: excepción} de los que fallaron.
+        desde_cache (iterable): subdominios servidos desde caché.
+
+    Returns:
+        dict: ver obtener_kpis_consolidados().
+    """
+    errores = errores or {}
+    pais_base = PAISES_CONFIG[PAIS_DEFAULT]
+    filas = []
+    totales = {campo: 0 for campo in CAMPOS_CONTEO}
+    totales.update({f'{campo}_base': 0.0 for campo in CAMPOS_IMPORTE})
+    cotizaciones_convertidas = 0
+    paises_sin_tipo_cambio = []
+
+    for subdominio in paises:
+        pais_config = PAISES_CONFIG[subdominio]
+        fila = {
+            'subdominio': subdominio,
+            'nombre': pais_config['nombre'],
+            'codigo': pais_config['codigo'],
+            'moneda_codigo': pais_config['moneda_codigo'],
+            'disponible': subdominio in parciales,
+            'desde_cache': subdominio in desde_cache,
+            'error': str(errores[subdominio]) if subdominio in errores else '',
+        }
+        filas.append(fila)
+        kpis = parciales.get(subdominio)
+        if kpis is None:
+            continue
+
+        fila.update(kpis)
+        fila['tasa_aceptacion'] = _tasa(kpis['cotizaciones_aceptadas'], kpis['total_cotizaciones'])
+        for campo in CAMPOS_CONTEO:
+            totales[campo] += kpis[campo]
+
+        convertido = True
+        for campo in CAMPOS_IMPORTE:
+            fila[f'{campo}_fmt'] = formato_moneda(kpis[campo], pais_config)
+            en_base = convertir_a_moneda_base(kpis[campo], pais_config)
+            fila[f'{campo}_base'] = en_base
+            if en_base is None:
+                convertido = False
+            else:
+                totales[f'{campo}_base'] += en_base
+        if convertido:
+            cotizaciones_convertidas += kpis['total_cotizaciones']
+        else:
+            paises_sin_tipo_cambio.append(subdominio)
+
+    totales['tasa_aceptacion'] = _tasa(totales['cotizaciones_aceptadas'], totales['total_cotizaciones'])
+    totales['ticket_promedio_base'] = (
+        round(totales['valor_total_cotizado_base'] / cotizaciones_convertidas, 2)
+        if cotizaciones_convertidas else 0
+    )
+    for campo in (*(f'{c}_base' for c in CAMPOS_IMPORTE), 'ticket_promedio_base'):
+        totales[campo] = round(totales[campo], 2)
+        totales[f'{campo}_fmt'] = formato_moneda(totales[campo], pais_base)
+
+    return {
+        'paises': filas,
+        'totales': totales,
+        'moneda_base': pais_base['moneda_codigo'],
+        'paises_sin_datos': [f['subdominio'] for f in filas if not f['disponible']],
+        'paises_sin_tipo_cambio': paises_sin_tipo_cambio,
+    }
@@ -0,0 +1,112 @@
+"""
+Versión de caché por orden para los fragmentos de detalle_orden.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+El template guarda en caché las secciones pesadas (historial, galería de
+imágenes, tabla de piezas) con {% cache %}. La clave incluye un número de
+versión por orden; cualquier escritura relacionada (signals) lo incrementa,
+así que el siguiente GET ya no encuentra el fragmento viejo y lo vuelve a
+renderizar. No hay que borrar claves una por una.
+
+Efectos secundarios:
+- Lee/escribe la caché por defecto (Redis en producción).
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.middleware_pais import alias_de_pais
+
+# Respaldo: aunque nadie incremente la versión, el fragmento caduca solo.
+FRAGMENTOS_ORDEN_TTL = getattr(settings, 'CACHE_TTL_FRAGMENTOS_ORDEN', 60 * 60 * 24)
+
+
+def _clave_version(db_alias, orden_id):
+    """Clave del contador de versión (país + orden)."""
+    return f'detalle_orden:version:{db_alias}:{orden_id}'
+
+
+def _version_inicial():
+    """
+    Versión de arranque basada en el reloj.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Si Redis desaloja el contador, volver a empezar en 1 podría reutilizar
+    un fragmento viejo guardado con la versión 1. Con milisegundos no pasa.
+    """
+    return int(time.time() * 1000)
+
+
+def version_fragmentos_detalle(orden):
+    """
+    Texto para el vary_on de {% cache %}: país, orden y versión actual.
+
+    Args:
+        orden: OrdenServicio ya cargada (su _state.db indica el país).
+
+    Returns:
+        str: p. ej. 'mexico:15:1760842000123'.
+
+    Efectos secundarios:
+        Crea el contador en caché si todavía no existe.
+    """
+    return versiones_fragmentos_detalle(orden._state.db, [orden.pk])[orden.pk]
+
+
+def versiones_fragmentos_detalle(db_alias, orden_ids):
+    """
+    Versión actual de varias órdenes con una sola lectura (get_many).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Las pantallas de lista (p. ej. la bandeja de pagos) reutilizan este
+    mismo contador para cachear datos por orden. Pedirlo orden por orden
+    serían N viajes a Redis; así es uno (más un add por cada orden que
+    todavía no tenía contador).
+
+    Args:
+        db_alias (str): alias de BD del país.
+        orden_ids (iterable[int]): PKs de OrdenServicio.
+
+    Returns:
+        dict[int, str]: orden_id → 'mexico:15:1760842000123'.
+
+    Efectos secundarios:
+        Crea los contadores que falten.
+    """
+    # 'default' y 'mexico' son la misma BD: comparten contador
+    db_alias = alias_de_pais(db_alias)
+    claves = {orden_id: _clave_version(db_alias, orden_id) for orden_id in orden_ids}
+    encontradas = cache.get_many(list(claves.values()))
+    versiones = {}
+    for orden_id, clave in claves.items():
+        version = encontradas.get(clave)
+        if version is None:
+            version = _version_inicial()
+            if not cache.add(clave, version, FRAGMENTOS_ORDEN_TTL):
+                # Otra petición lo creó al mismo tiempo: usamos el suyo.
+                version = cache.get(clave, version)
+        versiones[orden_id] = f'{db_alias}:{orden_id}:{version}'
+    return versiones
+
+
+def invalidar_fragmentos_detalle(orden_id, db_alias='default'):
+    """
+    Incrementa la versión de la orden; los fragmentos viejos quedan huérfanos.
+
+    Args:
+        orden_id (int): PK de la OrdenServicio.
+        db_alias (str): alias de BD del país donde se escribió.
+
+    Efectos secundarios:
+        incr (o set si el contador no existía) en la caché por defecto.
+    """
+    if not orden_id:
+        return
+    clave = _clave_version(alias_de_pais(db_alias), orden_id)
+    try:
+        cache.incr(clave)
+    except ValueError:
+        # No existía: cualquier valor nuevo invalida lo que hubiera.
+        cache.set(clave, _version_inicial(), FRAGMENTOS_ORDEN_TTL)
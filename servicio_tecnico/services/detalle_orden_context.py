@@ -5,8 +5,13 @@ EXPLICACIÓN PARA PRINCIPIANTES:
 La vista ya no construye el dict enorme inline. Esta función concentra
 formularios, historial, multimedia, cotización, VM y flags de UI.
 
+Imágenes y videos salen de UNA consulta cada uno (agrupados en Python) y los
+"correo ya enviado" son flags de la orden. El historial se entrega perezoso:
+si el fragmento {% cache %} del template existe, ni siquiera se consulta.
+
 Efectos secundarios:
 - Consultas ORM (querysets al template).
+- Crea el contador de versión de fragmentos en caché si no existe.
 - session.pop de feedback_pendiente_* / vigencia / satisfacción.
 """
 
@@ -36,6 +41,56 @@ from servicio_tecnico.forms import (
 )
 from servicio_tecnico.services.formato_garantia import orden_es_candidata_formato_garantia
 from servicio_tecnico.services.formato_oow import orden_es_candidata_formato_oow
+from servicio_tecnico.services.detalle_orden_cache import (
+    FRAGMENTOS_ORDEN_TTL,
+    version_fragmentos_detalle,
+)
+
+
+# Tipos que se muestran en las galerías (en este orden de pestañas).
+TIPOS_GALERIA = ('ingreso', 'diagnostico', 'reparacion', 'egreso', 'autorizacion', 'packing')
+
+# Diagnóstico: requiere los 4 tipos (ingreso + diagnóstico + reparación + egreso)
+# Venta mostrador: requiere solo 3 tipos (ingreso + reparación + egreso), sin diagnóstico
+TIPOS_FOTOS_REWIND = ('ingreso', 'diagnostico', 'reparacion', 'egreso')
+TIPOS_FOTOS_REWIND_VM = ('ingreso', 'reparacion', 'egreso')
+
+
+def _agrupar_por_tipo(queryset):
+    """
+    Reparte una sola consulta de multimedia en listas por tipo.
+
+    Args:
+        queryset: ImagenOrden/VideoOrden ya ordenados.
+
+    Returns:
+        dict tipo → list: siempre trae las claves de TIPOS_GALERIA (vacías si
+        no hay archivos) más cualquier otro tipo presente (p. ej. 'resumen'
+        o las fotos de los formatos OOW/Garantía).
+    """
+    agrupados = {tipo: [] for tipo in TIPOS_GALERIA}
+    for archivo in queryset:
+        agrupados.setdefault(archivo.tipo, []).append(archivo)
+    return agrupados
+
+
+def tipos_fotos_para_rewind(orden, tipos_presentes):
+    """
+    ¿La orden tiene las fotos que exige el correo rewind?
+
+    Args:
+        orden: OrdenServicio (se usa tipo_servicio).
+        tipos_presentes (set[str]): tipos de ImagenOrden con al menos una foto.
+
+    Returns:
+        tuple(bool, bool): (tiene_4_tipos_fotos, tiene_3_tipos_fotos).
+    """
+    tiene_4 = set(TIPOS_FOTOS_REWIND).issubset(tipos_presentes)
+    tiene_3 = (
+        orden.tipo_servicio == 'venta_mostrador'
+        and set(TIPOS_FOTOS_REWIND_VM).issubset(tipos_presentes)
+    )
+    return tiene_4, tiene_3
 
 
 def build_detalle_orden_context(request, orden):
@@ -71,80 +126,51 @@ def build_detalle_orden_context(request, orden):
     # OBTENER HISTORIAL Y COMENTARIOS
     # ========================================================================
 
-    # Historial completo ordenado por fecha (más reciente primero)
-    historial_completo = orden.historial.all().order_by('-fecha_evento')
+    # Historial completo ordenado por fecha (más reciente primero).
+    # EXPLICACIÓN: querysets perezosos; solo se ejecutan si el fragmento
+    # cacheado del template no existe (ver _seccion_historial.html).
+    historial_completo = orden.historial.select_related('usuario').order_by('-fecha_evento')
 
     # Separar historial automático y comentarios
     historial_automatico = historial_completo.exclude(tipo_evento='comentario')
     comentarios = historial_completo.filter(tipo_evento='comentario')
 
     # ========================================================================
-    # ORGANIZAR IMÁGENES POR TIPO
-    # ========================================================================
-
-    imagenes_por_tipo = {
-        'ingreso': orden.imagenes.filter(tipo='ingreso').order_by('-fecha_subida'),
-        'diagnostico': orden.imagenes.filter(tipo='diagnostico').order_by('-fecha_subida'),
-        'reparacion': orden.imagenes.filter(tipo='reparacion').order_by('-fecha_subida'),
-        'egreso': orden.imagenes.filter(tipo='egreso').order_by('-fecha_subida'),
-        'autorizacion': orden.imagenes.filter(tipo='autorizacion').order_by('-fecha_subida'),
-        'packing': orden.imagenes.filter(tipo='packing').order_by('-fecha_subida'),
-    }
-
-    total_imagenes = orden.imagenes.count()
-
-    # ========================================================================
-    # ORGANIZAR VIDEOS POR TIPO
+    # IMÁGENES Y VIDEOS: UNA CONSULTA CADA UNO, AGRUPADOS EN PYTHON
     # ========================================================================
 
-    videos_por_tipo = {
-        'ingreso': orden.videos.filter(tipo='ingreso').order_by('-fecha_subida'),
-        'diagnostico': orden.videos.filter(tipo='diagnostico').order_by('-fecha_subida'),
-        'reparacion': orden.videos.filter(tipo='reparacion').order_by('-fecha_subida'),
-        'egreso': orden.videos.filter(tipo='egreso').order_by('-fecha_subida'),
-        'autorizacion': orden.videos.filter(tipo='autorizacion').order_by('-fecha_subida'),
-        'packing': orden.videos.filter(tipo='packing').order_by('-fecha_subida'),
-    }
+    imagenes_todas = _agrupar_por_tipo(
+        orden.imagenes.select_related('subido_por').order_by('-fecha_subida')
+    )
+    imagenes_por_tipo = {tipo: imagenes_todas[tipo] for tipo in TIPOS_GALERIA}
+    total_imagenes = sum(len(lista) for lista in imagenes_todas.values())
 
-    total_videos = orden.videos.count()
+    videos_todos = _agrupar_por_tipo(
+        orden.videos.select_related('subido_por').order_by('-fecha_subida')
+    )
+    videos_por_tipo = {tipo: videos_todos[tipo] for tipo in TIPOS_GALERIA}
+    total_videos = sum(len(lista) for lista in videos_todos.values())
 
     # ── Video Resumen (generado por Celery — solo puede haber uno por orden) ──
     # Se pasa al template para mostrar el player si ya fue generado anteriormente
-    video_resumen = orden.videos.filter(tipo='resumen').first()
+    video_resumen = next(iter(videos_todos.get('resumen', [])), None)
 
     # Contar fotos de los tipos principales para saber si el botón debe habilitarse
-    n_fotos_para_resumen = orden.imagenes.filter(
-        tipo__in=['ingreso', 'diagnostico', 'reparacion', 'egreso']
-    ).count()
-
-    # Verificar si ya se enviaron correos de imágenes (para el estado de los botones)
-    egreso_correo_ya_enviado = orden.historial.filter(
-        tipo_evento='email',
-        comentario__icontains='imágenes de egreso'
-    ).exists()
-    ingreso_correo_ya_enviado = orden.historial.filter(
-        tipo_evento='email',
-        comentario__icontains='imágenes de ingreso'
-    ).exists()
+    n_fotos_para_resumen = sum(
+        len(imagenes_por_tipo[tipo]) for tipo in TIPOS_FOTOS_REWIND
+    )
+
+    # Correos de imágenes / rewind ya enviados: flags que marca el signal
+    # de HistorialOrden (antes eran 3 búsquedas icontains en el historial).
+    egreso_correo_ya_enviado = orden.correo_imagenes_egreso_enviado
+    ingreso_correo_ya_enviado = orden.correo_imagenes_ingreso_enviado
+    rewind_ya_enviado = orden.correo_rewind_enviado
 
     # ── Botón rewind: ¿tiene los tipos de fotos requeridos? ─────────────────
-    # Diagnóstico: requiere los 4 tipos (ingreso + diagnóstico + reparación + egreso)
-    # Venta mostrador: requiere solo 3 tipos (ingreso + reparación + egreso), sin diagnóstico
-    _tipos_fotos_set = set(
-        orden.imagenes.values_list('tipo', flat=True).distinct()
-    )
-    tiene_4_tipos_fotos = {'ingreso', 'diagnostico', 'reparacion', 'egreso'}.issubset(_tipos_fotos_set)
-    tiene_3_tipos_fotos = (
-        orden.tipo_servicio == 'venta_mostrador' and
-        {'ingreso', 'reparacion', 'egreso'}.issubset(_tipos_fotos_set)
+    tiene_4_tipos_fotos, tiene_3_tipos_fotos = tipos_fotos_para_rewind(
+        orden, {tipo for tipo, lista in imagenes_todas.items() if lista}
     )
 
-    # ── ¿Ya se envió el correo rewind? ───────────────────────────────────────
-    rewind_ya_enviado = orden.historial.filter(
-        tipo_evento='email',
-        comentario__icontains='video rewind'
-    ).exists()
-
     # Botón "Notificar equipo disponible": solo en Finalizado / Listo para Entrega
     equipo_disponible_ya_notificado = (
         orden.fecha_notificacion_equipo_disponible is not None
@@ -345,7 +371,12 @@ def build_detalle_orden_context(request, orden):
         # Historial y comentarios - ACTUALIZADO: Cargar todos (Opción A - Marzo 2026)
         'historial_automatico': historial_automatico,  # Todos los eventos
         'comentarios': comentarios[:20],  # Últimos 20 (comentarios siguen limitados)
-        'total_eventos_historial': historial_automatico.count(),
+        # Método sin llamar: el template lo evalúa solo si el fragmento no está en caché
+        'total_eventos_historial': historial_automatico.count,
+
+        # Fragmentos {% cache %}: TTL de respaldo + versión por orden
+        'fragmentos_ttl': FRAGMENTOS_ORDEN_TTL,
+        'version_fragmentos': version_fragmentos_detalle(orden),
 
         # Imágenes
         'imagenes_por_tipo': imagenes_por_tipo,
@@ -0,0 +1,453 @@
+"""
+Motor de exportación Excel en streaming (openpyxl ``write_only``).
+
+Objetivo de negocio:
+    Los reportes grandes (base garantía, productividad, RHITSO, encuestas)
+    armaban un Workbook completo en memoria, con estilos celda por celda, y
+    al final ``auto_adjust_column_width`` recorría todas las celdas otra vez.
+    Con rangos de fechas amplios eso agotaba el timeout del request y
+    disparaba la memoria del worker.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+    - ``Workbook(write_only=True)`` escribe cada fila directo a un archivo
+      temporal: la memoria ya no crece con el número de filas.
+    - Los estilos son *named styles* registrados una sola vez por libro;
+      cada celda solo guarda el nombre del estilo (no copia Font/Fill).
+    - El ancho de columnas se calcula mientras se escriben las primeras
+      ``filas_muestra`` filas (modo write_only exige fijar anchos antes de
+      mandar la primera fila al disco).
+    - ``iterar_queryset`` recorre el QuerySet con ``.iterator(chunk_size)``
+      para no cargar todas las órdenes a la vez.
+
+Efectos secundarios:
+    Ninguno de BD. ``guardar`` escribe el .xlsx en el destino indicado.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from django.db.models import QuerySet
+from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# Filas por consulta al recorrer QuerySets (iterator(chunk_size=...)).
+EXPORT_CHUNK_SIZE = 500
+
+# Filas que se miden antes de fijar anchos de columna en cada hoja.
+FILAS_MUESTRA_ANCHO = 200
+
+_BORDE_FINO = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin'),
+)
+
+
+def _relleno(color: str) -> PatternFill:
+    """PatternFill sólido de un color hexadecimal (sin #)."""
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+# Catálogo de estilos con nombre. La clave es el nombre que usan las hojas.
+ESTILOS_BASE: dict[str, dict[str, Any]] = {
+    'encabezado': {
+        'font': Font(bold=True, color='FFFFFF', size=11),
+        'fill': _relleno('0d6efd'),
+        'alignment': Alignment(horizontal='center', vertical='center', wrap_text=True),
+        'border': _BORDE_FINO,
+    },
+    'encabezado_corporativo': {
+        'font': Font(name='Calibri', bold=True, color='FFFFFF', size=11),
+        'fill': _relleno('366092'),
+        'alignment': Alignment(horizontal='center', vertical='center', wrap_text=True),
+        'border': _BORDE_FINO,
+    },
+    'encabezado_verde': {
+        'font': Font(bold=True, color='FFFFFF', size=11),
+        'fill': _relleno('198754'),
+        'alignment': Alignment(horizontal='center', vertical='center', wrap_text=True),
+        'border': _BORDE_FINO,
+    },
+    'titulo': {
+        'font': Font(bold=True, size=14, color='1f4e78'),
+        'fill': _relleno('e7e6e6'),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+    },
+    'titulo_oscuro': {
+        'font': Font(bold=True, size=14, color='FFFFFF'),
+        'fill': _relleno('212529'),
+        'alignment': Alignment(horizontal='center', vertical='center'),
+    },
+    'subtitulo': {
+        'font': Font(italic=True, size=10, color='666666'),
+        'alignment': Alignment(horizontal='center'),
+    },
+    'kpi_titulo': {
+        'font': Font(bold=True, size=11, color='495057'),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+    },
+    'kpi_valor': {
+        'font': Font(bold=True, size=16, color='0d6efd'),
+        'alignment': Alignment(horizontal='center', vertical='center'),
+    },
+    'seccion_activas': {
+        'font': Font(bold=True, size=12, color='000000'),
+        'fill': _relleno('ffc107'),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+    },
+    'seccion_cerradas': {
+        'font': Font(bold=True, size=12, color='FFFFFF'),
+        'fill': _relleno('28a745'),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+    },
+    'celda': {
+        'border': _BORDE_FINO,
+    },
+    'celda_moneda': {
+        'border': _BORDE_FINO,
+        'number_format': '#,##0.00',
+    },
+    'celda_compacta': {
+        'font': Font(name='Calibri', size=10),
+        'border': _BORDE_FINO,
+        'alignment': Alignment(horizontal='left', vertical='center'),
+    },
+    'celda_compacta_comentario': {
+        'font': Font(name='Calibri', size=10),
+        'border': _BORDE_FINO,
+        'alignment': Alignment(horizontal='left', vertical='top', wrap_text=True),
+    },
+    'celda_texto_largo': {
+        'border': _BORDE_FINO,
+        'alignment': Alignment(horizontal='left', vertical='top', wrap_text=True),
+    },
+}
+
+
+def nombre_hoja_valido(nombre: str, existentes: Iterable[str]) -> str:
+    """
+    Excel limita a 31 caracteres y no admite nombres duplicados.
+
+    Args:
+        nombre: nombre deseado.
+        existentes: nombres ya usados en el libro.
+
+    Returns:
+        Nombre válido y único.
+    """
+    usados = set(existentes)
+    prohibidos = set(r':\/?*[]')
+    limpio = ''.join(c for c in nombre if c not in prohibidos).strip() or 'Hoja'
+    base = limpio[:31]
+    candidato = base
+    i = 2
+    while candidato in usados:
+        sufijo = f'_{i}'
+        candidato = base[: 31 - len(sufijo)] + sufijo
+        i += 1
+    return candidato
+
+
+def iterar_queryset(
+    queryset: QuerySet,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Recorre un QuerySet por bloques sin cachear todas las filas.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    ``.iterator(chunk_size=N)`` trae N filas por consulta y respeta
+    ``prefetch_related`` (un prefetch por bloque, no por fila).
+
+    Args:
+        queryset: QuerySet ya filtrado y ordenado.
+        chunk_size: filas por bloque.
+
+    Returns:
+        Iterador de instancias (o dicts si el QuerySet usa values()).
+    """
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+class HojaStreaming:
+    """
+    Hoja write-only con estilos con nombre y anchos calculados al vuelo.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Las primeras ``filas_muestra`` filas se guardan en un búfer pequeño
+    mientras se mide el texto más largo de cada columna. Al llenarse el
+    búfer (o al cerrar la hoja) fijamos los anchos y vaciamos el búfer al
+    disco; a partir de ahí cada fila se escribe directamente.
+    """
+
+    def __init__(
+        self,
+        libro: LibroStreaming,
+        titulo: str,
+        *,
+        ancho_min: int = 10,
+        ancho_max: int = 50,
+        anchos_fijos: list[int] | None = None,
+        filas_muestra: int = FILAS_MUESTRA_ANCHO,
+    ) -> None:
+        self.libro = libro
+        self.ws = libro.wb.create_sheet(title=titulo)
+        self.ancho_min = ancho_min
+        self.ancho_max = ancho_max
+        self.anchos_fijos = anchos_fijos
+        self.filas_muestra = filas_muestra
+        self.numero_fila = 0
+        self._anchos: dict[int, int] = {}
+        self._bufer: list[list[Any]] | None = []
+
+    @property
+    def titulo(self) -> str:
+        """Nombre final de la hoja (ya validado por Excel)."""
+        return self.ws.title
+
+    def _medir(self, valores: list[Any], columnas_medibles: bool) -> None:
+        """Actualiza el ancho máximo observado por columna."""
+        if not columnas_medibles:
+            return
+        for col, valor in enumerate(valores, 1):
+            if valor is None:
+                continue
+            texto = valor.value if isinstance(valor, Cell) else valor
+            largo = len(str(texto if texto is not None else ''))
+            if largo > self._anchos.get(col, 0):
+                self._anchos[col] = largo
+
+    def _fijar_anchos(self) -> None:
+        """Aplica anchos de columna (fijos o medidos) antes de la primera escritura."""
+        if self.anchos_fijos:
+            anchos = dict(enumerate(self.anchos_fijos, 1))
+        else:
+            anchos = {
+                col: min(max(largo + 2, self.ancho_min), self.ancho_max)
+                for col, largo in self._anchos.items()
+            }
+        for col, ancho in anchos.items():
+            self.ws.column_dimensions[get_column_letter(col)].width = ancho
+
+    def _vaciar_bufer(self) -> None:
+        """Fija anchos y manda al disco las filas de muestra."""
+        if self._bufer is None:
+            return
+        self._fijar_anchos()
+        for fila in self._bufer:
+            self.ws.append(fila)
+        self._bufer = None
+
+    def fila(
+        self,
+        valores: Iterable[Any],
+        estilo: str | None = None,
+        estilos: dict[int, str] | None = None,
+        *,
+        alto: float | None = None,
+        medir: bool = True,
+    ) -> int:
+        """
+        Agrega una fila a la hoja.
+
+        Args:
+            valores: valores de la fila (None = celda vacía).
+            estilo: named style para todas las celdas con valor.
+            estilos: named style por columna (1-based); gana sobre ``estilo``.
+            alto: alto de fila opcional (títulos).
+            medir: False para filas que no deben influir en el ancho (títulos).
+
+        Returns:
+            Número de fila (1-based) donde quedó escrita.
+        """
+        self.numero_fila += 1
+        if alto is not None:
+            self.ws.row_dimensions[self.numero_fila].height = alto
+
+        celdas: list[Any] = []
+        for col, valor in enumerate(valores, 1):
+            nombre = (estilos or {}).get(col, estilo)
+            if nombre is None:
+                celdas.append(valor)
+                continue
+            celda = WriteOnlyCell(self.ws, value=valor)
+            celda.style = self.libro.estilo(nombre)
+            celdas.append(celda)
+
+        if self._bufer is None:
+            self.ws.append(celdas)
+        else:
+            self._medir(celdas, medir)
+            self._bufer.append(celdas)
+            if len(self._bufer) >= self.filas_muestra:
+                self._vaciar_bufer()
+        return self.numero_fila
+
+    def fila_vacia(self, cantidad: int = 1) -> None:
+        """Deja ``cantidad`` filas en blanco."""
+        for _ in range(cantidad):
+            self.fila([])
+
+    def titulo_combinado(
+        self,
+        texto: str,
+        columnas: int,
+        estilo: str = 'titulo',
+        *,
+        alto: float | None = None,
+    ) -> int:
+        """
+        Fila de título combinada de A hasta ``columnas``.
+
+        Returns:
+            Número de fila del título.
+        """
+        fila = self.fila([texto], estilo=estilo, alto=alto, medir=False)
+        if columnas > 1:
+            self.ws.merged_cells.add(f'A{fila}:{get_column_letter(columnas)}{fila}')
+        return fila
+
+    def congelar(self, celda: str) -> None:
+        """Congela paneles (debe llamarse antes de escribir filas)."""
+        self.ws.freeze_panes = celda
+
+    def autofiltro(self, columnas: int, fila_encabezado: int = 1) -> None:
+        """Autofiltro sobre el rango escrito (se aplica al cerrar)."""
+        ultima = max(self.numero_fila, fila_encabezado)
+        self.ws.auto_filter.ref = (
+            f'A{fila_encabezado}:{get_column_letter(columnas)}{ultima}'
+        )
+
+    def cerrar(self) -> None:
+        """Vacía el búfer pendiente (hojas con menos filas que la muestra)."""
+        self._vaciar_bufer()
+
+
+class LibroStreaming:
+    """
+    Libro write-only con catálogo de estilos registrado una sola vez.
+
+    Uso típico::
+
+        libro = LibroStreaming()
+        hoja = libro.hoja('Datos')
+        hoja.fila(['Folio', 'Estado'], estilo='encabezado')
+        for orden in iterar_queryset(qs):
+            hoja.fila([orden.folio, orden.estado], estilo='celda')
+        libro.guardar(destino)
+    """
+
+    def __init__(self) -> None:
+        self.wb = Workbook(write_only=True)
+        self._registrados: set[str] = set()
+        self._hojas: list[HojaStreaming] = []
+
+    def estilo(self, nombre: str) -> str:
+        """
+        Registra (si hace falta) y devuelve el nombre del named style.
+
+        Los nombres ``estado_<hex>`` / ``fondo_<hex>`` se crean bajo demanda
+        para colores de semáforo (un estilo por color, no por celda).
+        ``<base>@<hex>`` toma un estilo del catálogo y le cambia el relleno
+        (filas coloreadas que conservan fuente, borde y alineación).
+        """
+        clave = f'sigma_{nombre}'
+        if clave in self._registrados:
+            return clave
+
+        if nombre in ESTILOS_BASE:
+            definicion = ESTILOS_BASE[nombre]
+        elif '@' in nombre:
+            base, color = nombre.split('@', 1)
+            if base not in ESTILOS_BASE:
+                raise KeyError(f'Estilo Excel desconocido: {nombre}')
+            definicion = {**ESTILOS_BASE[base], 'fill': _relleno(color)}
+        elif nombre.startswith('estado_'):
+            definicion = {
+                'font': Font(bold=True, color='FFFFFF'),
+                'fill': _relleno(nombre.split('_', 1)[1]),
+                'border': _BORDE_FINO,
+            }
+        elif nombre.startswith('fondo_'):
+            definicion = {
+                'fill': _relleno(nombre.split('_', 1)[1]),
+                'border': _BORDE_FINO,
+            }
+        else:
+            raise KeyError(f'Estilo Excel desconocido: {nombre}')
+
+        estilo = NamedStyle(name=clave)
+        for atributo, valor in definicion.items():
+            setattr(estilo, atributo, valor)
+        self.wb.add_named_style(estilo)
+        self._registrados.add(clave)
+        return clave
+
+    def hoja(self, titulo: str, **opciones: Any) -> HojaStreaming:
+        """Crea una hoja nueva con nombre válido para Excel."""
+        nombre = nombre_hoja_valido(titulo, (h.titulo for h in self._hojas))
+        hoja = HojaStreaming(self, nombre, **opciones)
+        self._hojas.append(hoja)
+        return hoja
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """Nombres de hoja en orden de creación."""
+        return self.wb.sheetnames
+
+    def guardar(self, destino: Any) -> None:
+        """
+        Cierra las hojas y serializa el .xlsx.
+
+        Args:
+            destino: ruta o archivo binario (HttpResponse, BytesIO, tmpfile).
+        """
+        for hoja in self._hojas:
+            hoja.cerrar()
+        self.wb.save(destino)
+
+
+# Firma de la función de progreso que reciben los exportadores.
+ReportarProgreso = Callable[[int, int], None]
+
+
+def sin_progreso(_procesadas: int, _total: int) -> None:
+    """Callback vacío para exportaciones síncronas (dentro del request)."""
+    return None
+
+
+class ContadorProgreso:
+    """
+    Acumula filas escritas y avisa al callback cada ``cada`` filas.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Reportar a Celery en cada fila saturaría Redis; avisamos una vez por
+    bloque (mismo tamaño que el chunk del iterator) y al terminar.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        progreso: ReportarProgreso = sin_progreso,
+        cada: int = EXPORT_CHUNK_SIZE,
+    ) -> None:
+        self.total = max(total, 0)
+        self.progreso = progreso
+        self.cada = max(cada, 1)
+        self.procesadas = 0
+
+    def avanzar(self, cantidad: int = 1) -> None:
+        """Suma ``cantidad`` filas y reporta si se cruzó un bloque."""
+        antes = self.procesadas // self.cada
+        self.procesadas += cantidad
+        if self.procesadas // self.cada != antes:
+            self.progreso(min(self.procesadas, self.total), self.total)
+
+    def terminar(self) -> None:
+        """Reporta el 100 %."""
+        self.progreso(self.total, self.total)
@@ -20,26 +20,23 @@ from datetime import datetime
 from typing import Any
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import QuerySet
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.worksheet.worksheet import Worksheet
+from django.db.models import OuterRef, QuerySet, Subquery
 
 from inventario.models import Empleado, Sucursal
 from servicio_tecnico.excel_exporters import (
-    apply_cell_style,
-    auto_adjust_column_width,
-    calcular_distribucion_estados,
-    calcular_estadisticas_por_responsable,
-    calcular_estadisticas_por_sucursal,
-    calcular_metricas_generales,
+    calcular_resumen_una_pasada,
     get_estado_color,
-    get_header_style,
-    get_kpi_title_style,
-    get_kpi_value_style,
-    get_title_style,
 )
-from servicio_tecnico.models import OrdenServicio
+from servicio_tecnico.models import HistorialOrden, OrdenServicio
+from servicio_tecnico.services.excel_streaming import (
+    ContadorProgreso,
+    HojaStreaming,
+    LibroStreaming,
+    ReportarProgreso,
+    iterar_queryset,
+    sin_progreso,
+)
+from servicio_tecnico.utils_rhitso import calcular_dias_en_estatus
 
 
 # Hojas fijas (sin Top Productos: eso es 100 % Venta Mostrador / FL).
@@ -67,6 +64,15 @@ HEADERS_ORDEN_MAESTRA = [
     'Observaciones/Alertas',
 ]
 
+# Filtros GET que entiende el export (también viajan a Celery).
+FILTROS_EXPORT = (
+    'responsable_id',
+    'fecha_desde',
+    'fecha_hasta',
+    'estado',
+    'sucursal_id',
+)
+
 
 def queryset_base_garantia() -> QuerySet:
     """
@@ -89,17 +95,25 @@ def queryset_base_garantia() -> QuerySet:
 
 def optimizar_queryset_garantia(ordenes: QuerySet) -> QuerySet:
     """
-    Precarga relaciones usadas al pintar filas del Excel.
+    Precarga relaciones y fechas de historial usadas al pintar filas del Excel.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+        "Última actualización" y "Días sin actualizar" leían el historial
+        orden por orden (2 consultas por fila). Ahora salen como subconsultas
+        en el mismo SELECT: ``ultima_fecha_historial`` y ``ultimo_cambio_estado``.
 
     Args:
         ordenes: QuerySet ya filtrado por garantía (y filtros GET).
 
     Returns:
-        El mismo QuerySet con select_related / prefetch_related.
+        El mismo QuerySet con select_related y anotaciones.
 
     Efectos secundarios:
         Ninguno; evita N+1 al recorrer órdenes.
     """
+    historial = HistorialOrden.objects.filter(
+        orden=OuterRef('pk'),
+    ).order_by('-fecha_evento')
     # detalle_equipo = folio, serie, marca; cotizacion = extras en garantía.
     return ordenes.select_related(
         'detalle_equipo',
@@ -108,7 +122,12 @@ def optimizar_queryset_garantia(ordenes: QuerySet) -> QuerySet:
         'tecnico_asignado_actual',
         'venta_mostrador',
         'cotizacion',
-    ).prefetch_related('historial')
+    ).annotate(
+        ultima_fecha_historial=Subquery(historial.values('fecha_evento')[:1]),
+        ultimo_cambio_estado=Subquery(
+            historial.filter(tipo_evento='cambio_estado').values('fecha_evento')[:1],
+        ),
+    )
 
 
 def aplicar_filtros_garantia(
@@ -297,37 +316,80 @@ def nombre_archivo_base_garantia(
 def generar_workbook_base_garantia(
     ordenes: QuerySet,
     filtros_str: str,
-) -> Workbook:
+    progreso: ReportarProgreso = sin_progreso,
+) -> LibroStreaming:
     """
     Construye el .xlsx de garantía (mismas hojas que OOW, sin Top Productos).
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+        El libro es write-only: cada fila va directo a disco. Los totales de
+        las primeras hojas salen de UNA pasada por el QuerySet (iterator por
+        bloques); después se recorren las órdenes por responsable y la lista
+        maestra. En total son 3 recorridos, que es lo que reporta ``progreso``.
+
     Args:
-        ordenes: QuerySet ya filtrado y con prefetch.
+        ordenes: QuerySet ya filtrado y optimizado (``construir_queryset_export``).
         filtros_str: leyenda para el título del resumen.
+        progreso: callback ``(procesadas, total)`` (Celery); vacío en el request.
 
     Returns:
-        Workbook de openpyxl en memoria (aún no se serializa a HTTP).
+        LibroStreaming listo para ``guardar``.
 
     Efectos secundarios:
         Ninguno de escritura en BD.
     """
-    # Reusamos los calculadores del Excel OOW; al pintar omitimos VM.
-    metricas = calcular_metricas_generales(ordenes)
-    distribucion = calcular_distribucion_estados(ordenes)
-    responsables = calcular_estadisticas_por_responsable(ordenes)
-    sucursales = calcular_estadisticas_por_sucursal(ordenes)
+    total = ordenes.count()
+    contador = ContadorProgreso(total * 3, progreso)
 
-    wb = Workbook()
-    wb.remove(wb.active)
+    # Reusamos los calculadores del Excel OOW (una sola pasada); al pintar omitimos VM.
+    metricas, distribucion, responsables, sucursales = calcular_resumen_una_pasada(
+        iterar_queryset(ordenes),
+        al_procesar=lambda _n: contador.avanzar(),
+    )
 
-    _hoja_resumen(wb, metricas, distribucion, filtros_str)
-    _hoja_consolidado_responsables(wb, responsables)
-    _hoja_sucursales(wb, sucursales)
+    libro = LibroStreaming()
+    _hoja_resumen(libro, metricas, distribucion, filtros_str)
+    _hoja_consolidado_responsables(libro, responsables)
+    _hoja_sucursales(libro, sucursales)
     for resp_stat in responsables:
-        _hoja_un_responsable(wb, ordenes, resp_stat)
-    _hoja_todas_las_ordenes(wb, ordenes)
+        _hoja_un_responsable(libro, ordenes, resp_stat, contador)
+    _hoja_todas_las_ordenes(libro, ordenes, metricas['total_ordenes'], contador)
 
-    return wb
+    contador.terminar()
+    return libro
+
+
+def exportar_base_garantia(
+    parametros: dict[str, str],
+    progreso: ReportarProgreso = sin_progreso,
+) -> tuple[str, LibroStreaming] | None:
+    """
+    Punto de entrada para la exportación en segundo plano (Celery).
+
+    Args:
+        parametros: filtros GET (responsable_id, fechas, estado, sucursal_id).
+        progreso: callback ``(procesadas, total)``.
+
+    Returns:
+        (nombre_archivo, libro), o None si no hay órdenes con esos filtros.
+
+    Efectos secundarios:
+        Solo lecturas ORM.
+    """
+    filtros = {clave: parametros.get(clave, '') for clave in FILTROS_EXPORT}
+    ordenes = construir_queryset_export(**filtros)
+    if not ordenes.exists():
+        return None
+
+    libro = generar_workbook_base_garantia(
+        ordenes, texto_filtros_aplicados(**filtros), progreso,
+    )
+    nombre = nombre_archivo_base_garantia(
+        responsable_id=filtros['responsable_id'],
+        estado=filtros['estado'],
+        sucursal_id=filtros['sucursal_id'],
+    )
+    return nombre, libro
 
 
 # ---------------------------------------------------------------------------
@@ -399,13 +461,38 @@ def _tipo_monto_y_cotizacion(orden: OrdenServicio) -> tuple[str, str, str]:
     return tipo, (f'${monto:,.2f}' if monto > 0 else 'N/A'), cotiz
 
 
-def _texto_alertas(orden: OrdenServicio, *, es_cerrada: bool) -> str:
+def _dias_sin_actualizar(orden: OrdenServicio) -> int:
+    """
+    Días hábiles desde el último cambio de estado, sin consultar historial.
+
+    Args:
+        orden: Orden anotada por ``optimizar_queryset_garantia``.
+
+    Returns:
+        Mismo valor que ``orden.dias_sin_actualizacion_estado``.
+
+    Efectos secundarios:
+        Ninguno (si falta la anotación cae a la property, que sí consulta).
+    """
+    if not hasattr(orden, 'ultimo_cambio_estado'):
+        return orden.dias_sin_actualizacion_estado
+    return calcular_dias_en_estatus(orden.ultimo_cambio_estado or orden.fecha_ingreso)
+
+
+def _texto_alertas(
+    orden: OrdenServicio,
+    *,
+    es_cerrada: bool,
+    dias_habiles: int,
+    dias_sin_actualizar: int,
+) -> str:
     """
     Arma el texto de observaciones (retraso / sin actualizar / cierre).
 
     Args:
         orden: OrdenServicio.
         es_cerrada: True si la fila está en la sección entregado/cancelado.
+        dias_habiles / dias_sin_actualizar: ya calculados para la fila.
 
     Returns:
         Cadena lista para la celda (o 'OK' / 'Completada').
@@ -417,10 +504,10 @@ def _texto_alertas(orden: OrdenServicio, *, es_cerrada: bool) -> str:
         return 'CANCELADA' if orden.estado == 'cancelado' else 'Completada'
 
     alertas: list[str] = []
-    if orden.dias_habiles_en_servicio > 15:
+    if dias_habiles > 15:
         alertas.append('RETRASADA')
-    if orden.dias_sin_actualizacion_estado > 5:
-        alertas.append(f'Sin actualizar {orden.dias_sin_actualizacion_estado}d')
+    if dias_sin_actualizar > 5:
+        alertas.append(f'Sin actualizar {dias_sin_actualizar}d')
     return ' | '.join(alertas) if alertas else 'OK'
 
 
@@ -429,7 +516,7 @@ def _ultima_actualizacion(orden: OrdenServicio, con_hora: bool) -> str:
     Fecha del último evento de historial, o N/A.
 
     Args:
-        orden: Orden con historial prefetched.
+        orden: Orden anotada con ``ultima_fecha_historial``.
         con_hora: True para la lista maestra (incluye hora).
 
     Returns:
@@ -438,73 +525,66 @@ def _ultima_actualizacion(orden: OrdenServicio, con_hora: bool) -> str:
     Efectos secundarios:
         Ninguno.
     """
-    ultima = orden.historial.order_by('-fecha_evento').first()
+    ultima = getattr(orden, 'ultima_fecha_historial', None)
     if not ultima:
         return 'N/A'
     fmt = '%d/%m/%Y %H:%M' if con_hora else '%d/%m/%Y'
-    return ultima.fecha_evento.strftime(fmt)
+    return ultima.strftime(fmt)
 
 
-def _pintar_estado_y_retraso(
-    ws: Worksheet,
-    row: int,
-    col_estado: int,
-    col_dias: int,
+def _estilos_fila(
     orden: OrdenServicio,
     *,
-    pintar_retraso: bool,
-) -> None:
+    col_estado: int,
+    col_dias: int,
+    max_col: int,
+    retrasada: bool,
+) -> dict[int, str]:
     """
-    Colorea la celda de estado y, si aplica, los días hábiles en rojo.
+    Named styles por columna: semáforo de estado, retraso y fondo RHITSO.
 
-    Args:
-        ws: Hoja activa.
-        row / col_estado / col_dias: coordenadas.
-        orden: para leer estado y días.
-        pintar_retraso: False en filas ya cerradas.
-
-    Efectos secundarios:
-        Mutación de celdas del workbook en memoria.
-    """
-    color = get_estado_color(orden.estado)
-    celda_estado = ws.cell(row=row, column=col_estado)
-    celda_estado.fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
-    celda_estado.font = Font(bold=True, color='FFFFFF')
+    EXPLICACIÓN PARA PRINCIPIANTES:
+        Antes se creaban Font/PatternFill nuevos en cada celda. Ahora cada
+        color es un estilo con nombre registrado una vez en el libro.
 
-    if pintar_retraso and orden.dias_habiles_en_servicio > 15:
-        celda_dias = ws.cell(row=row, column=col_dias)
-        celda_dias.fill = PatternFill(start_color='dc3545', end_color='dc3545', fill_type='solid')
-        celda_dias.font = Font(bold=True, color='FFFFFF')
+    Args:
+        orden: para leer estado y candidato RHITSO.
+        col_estado / col_dias: columnas con semáforo.
+        max_col: última columna de la fila.
+        retrasada: True si los días hábiles van en rojo.
 
+    Returns:
+        {columna: nombre_estilo}.
 
-def _resaltar_rhitso(
-    ws: Worksheet,
-    row: int,
-    max_col: int,
-    columnas_especiales: set[int],
-) -> None:
+    Efectos secundarios:
+        Ninguno.
     """
-    Pinta de morado claro las celdas que no tienen ya un color de semáforo.
+    estilos: dict[int, str] = {}
+    if orden.es_candidato_rhitso:
+        # Morado claro en las celdas que no llevan semáforo.
+        estilos = {col: 'fondo_ede9fe' for col in range(1, max_col + 1)}
+    estilos[col_estado] = f'estado_{get_estado_color(orden.estado)}'
+    if retrasada:
+        estilos[col_dias] = 'estado_dc3545'
+    return estilos
 
-    Args:
-        ws / row / max_col: rango de la fila.
-        columnas_especiales: columnas que ya tienen fill (estado, retraso).
 
-    Efectos secundarios:
-        Mutación de celdas del workbook.
-    """
-    morado = 'ede9fe'
-    for col in range(1, max_col + 1):
-        if col in columnas_especiales:
-            continue
-        ws.cell(row=row, column=col).fill = PatternFill(
-            start_color=morado, end_color=morado, fill_type='solid',
-        )
+def _datos_equipo(orden: OrdenServicio) -> list[Any]:
+    """Columnas 1-5 comunes: orden cliente, serie, tipo, marca, modelo."""
+    detalle = _detalle_equipo(orden)
+    if not detalle:
+        return ['N/A'] * 5
+    return [
+        detalle.orden_cliente,
+        detalle.numero_serie or 'N/A',
+        detalle.get_tipo_equipo_display(),
+        detalle.marca,
+        detalle.modelo[:30] if detalle.modelo else 'N/A',
+    ]
 
 
-def _escribir_fila_corta(
-    ws: Worksheet,
-    row: int,
+def _fila_corta(
+    hoja: HojaStreaming,
     orden: OrdenServicio,
     *,
     es_cerrada: bool,
@@ -513,60 +593,53 @@ def _escribir_fila_corta(
     Escribe 15 columnas (hoja por responsable).
 
     Args:
-        ws, row, orden: destino y dato.
-        es_cerrada: cambia el texto de observaciones.
+        hoja: destino.
+        orden: dato.
+        es_cerrada: cambia el texto de observaciones y apaga el semáforo de retraso.
 
     Efectos secundarios:
-        Escribe celdas en ``ws``.
+        Escribe una fila en ``hoja``.
     """
-    detalle = _detalle_equipo(orden)
     tipo, monto, cotiz = _tipo_monto_y_cotizacion(orden)
-
-    ws.cell(row=row, column=1).value = detalle.orden_cliente if detalle else 'N/A'
-    ws.cell(row=row, column=2).value = (
-        detalle.numero_serie if detalle and detalle.numero_serie else 'N/A'
-    )
-    ws.cell(row=row, column=3).value = (
-        detalle.get_tipo_equipo_display() if detalle else 'N/A'
-    )
-    ws.cell(row=row, column=4).value = detalle.marca if detalle else 'N/A'
-    ws.cell(row=row, column=5).value = (
-        (detalle.modelo[:30] if detalle.modelo else 'N/A') if detalle else 'N/A'
-    )
-    ws.cell(row=row, column=6).value = orden.get_estado_display()
-    ws.cell(row=row, column=7).value = orden.dias_habiles_en_servicio
-    ws.cell(row=row, column=8).value = orden.dias_sin_actualizacion_estado
-    ws.cell(row=row, column=9).value = tipo
-    ws.cell(row=row, column=10).value = monto
-    ws.cell(row=row, column=11).value = orden.sucursal.nombre
-    ws.cell(row=row, column=12).value = orden.fecha_ingreso.strftime('%d/%m/%Y')
-    ws.cell(row=row, column=13).value = _ultima_actualizacion(orden, con_hora=False)
-    ws.cell(row=row, column=14).value = cotiz
-    ws.cell(row=row, column=15).value = _texto_alertas(orden, es_cerrada=es_cerrada)
-
-    _pintar_estado_y_retraso(
-        ws, row, 6, 7, orden, pintar_retraso=not es_cerrada,
-    )
-    especiales = {6}
-    if not es_cerrada and orden.dias_habiles_en_servicio > 15:
-        especiales.add(7)
-    if orden.es_candidato_rhitso:
-        _resaltar_rhitso(ws, row, 15, especiales)
+    dias = orden.dias_habiles_en_servicio
+    sin_actualizar = _dias_sin_actualizar(orden)
+
+    valores = _datos_equipo(orden) + [
+        orden.get_estado_display(),
+        dias,
+        sin_actualizar,
+        tipo,
+        monto,
+        orden.sucursal.nombre,
+        orden.fecha_ingreso.strftime('%d/%m/%Y'),
+        _ultima_actualizacion(orden, con_hora=False),
+        cotiz,
+        _texto_alertas(
+            orden, es_cerrada=es_cerrada,
+            dias_habiles=dias, dias_sin_actualizar=sin_actualizar,
+        ),
+    ]
+    hoja.fila(valores, estilos=_estilos_fila(
+        orden, col_estado=6, col_dias=7, max_col=15,
+        retrasada=not es_cerrada and dias > 15,
+    ))
 
 
-def _escribir_fila_maestra(ws: Worksheet, row: int, orden: OrdenServicio) -> None:
+def _fila_maestra(hoja: HojaStreaming, orden: OrdenServicio) -> None:
     """
     Escribe 17 columnas (lista maestra Todas las Órdenes).
 
     Args:
-        ws, row, orden: destino y dato.
+        hoja: destino.
+        orden: dato.
 
     Efectos secundarios:
-        Escribe celdas en ``ws``.
+        Escribe una fila en ``hoja``.
     """
-    detalle = _detalle_equipo(orden)
     tipo, monto, cotiz = _tipo_monto_y_cotizacion(orden)
     es_cerrada = orden.estado in ('entregado', 'cancelado')
+    dias = orden.dias_habiles_en_servicio
+    sin_actualizar = _dias_sin_actualizar(orden)
     responsable = (
         orden.responsable_seguimiento.nombre_completo
         if orden.responsable_seguimiento
@@ -578,70 +651,36 @@ def _escribir_fila_maestra(ws: Worksheet, row: int, orden: OrdenServicio) -> Non
         else 'No asignado'
     )
 
-    ws.cell(row=row, column=1).value = detalle.orden_cliente if detalle else 'N/A'
-    ws.cell(row=row, column=2).value = (
-        detalle.numero_serie if detalle and detalle.numero_serie else 'N/A'
-    )
-    ws.cell(row=row, column=3).value = (
-        detalle.get_tipo_equipo_display() if detalle else 'N/A'
-    )
-    ws.cell(row=row, column=4).value = detalle.marca if detalle else 'N/A'
-    ws.cell(row=row, column=5).value = (
-        (detalle.modelo[:30] if detalle.modelo else 'N/A') if detalle else 'N/A'
-    )
-    ws.cell(row=row, column=6).value = orden.get_estado_display()
-    ws.cell(row=row, column=7).value = responsable
-    ws.cell(row=row, column=8).value = tecnico
-    ws.cell(row=row, column=9).value = orden.dias_habiles_en_servicio
-    ws.cell(row=row, column=10).value = orden.dias_sin_actualizacion_estado
-    ws.cell(row=row, column=11).value = tipo
-    ws.cell(row=row, column=12).value = monto
-    ws.cell(row=row, column=13).value = orden.sucursal.nombre
-    ws.cell(row=row, column=14).value = orden.fecha_ingreso.strftime('%d/%m/%Y %H:%M')
-    ws.cell(row=row, column=15).value = _ultima_actualizacion(orden, con_hora=True)
-    ws.cell(row=row, column=16).value = cotiz
-    ws.cell(row=row, column=17).value = _texto_alertas(orden, es_cerrada=es_cerrada)
-
-    _pintar_estado_y_retraso(
-        ws, row, 6, 9, orden, pintar_retraso=not es_cerrada,
-    )
-    especiales = {6}
-    if not es_cerrada and orden.dias_habiles_en_servicio > 15:
-        especiales.add(9)
-    if orden.es_candidato_rhitso:
-        _resaltar_rhitso(ws, row, 17, especiales)
-
-
-def _escribir_encabezados(ws: Worksheet, row: int, headers: list[str]) -> None:
-    """Pinta una fila de encabezados con el estilo azul del export OOW."""
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col_num)
-        cell.value = header
-        apply_cell_style(cell, get_header_style())
-
-
-def _nombre_hoja_unico(wb: Workbook, nombre: str) -> str:
-    """
-    Excel limita a 31 caracteres y no admite nombres duplicados.
+    valores = _datos_equipo(orden) + [
+        orden.get_estado_display(),
+        responsable,
+        tecnico,
+        dias,
+        sin_actualizar,
+        tipo,
+        monto,
+        orden.sucursal.nombre,
+        orden.fecha_ingreso.strftime('%d/%m/%Y %H:%M'),
+        _ultima_actualizacion(orden, con_hora=True),
+        cotiz,
+        _texto_alertas(
+            orden, es_cerrada=es_cerrada,
+            dias_habiles=dias, dias_sin_actualizar=sin_actualizar,
+        ),
+    ]
+    hoja.fila(valores, estilos=_estilos_fila(
+        orden, col_estado=6, col_dias=9, max_col=17,
+        retrasada=not es_cerrada and dias > 15,
+    ))
 
-    Args:
-        wb: workbook ya con hojas.
-        nombre: nombre deseado (responsable).
 
-    Returns:
-        Nombre válido y único.
-    """
-    # Caracteres prohibidos en nombres de hoja de Excel.
-    prohibidos = set(r':\/?*[]')
-    limpio = ''.join(c for c in nombre if c not in prohibidos).strip() or 'Responsable'
-    base = limpio[:28]
-    candidato = base
-    i = 2
-    while candidato in wb.sheetnames:
-        sufijo = f'_{i}'
-        candidato = base[: 31 - len(sufijo)] + sufijo
-        i += 1
-    return candidato
+def _filas_kpi(hoja: HojaStreaming, kpis: list[tuple[str, Any]]) -> None:
+    """Pares nombre/valor; un nombre vacío deja una fila en blanco."""
+    for nombre, valor in kpis:
+        if nombre == '':
+            hoja.fila_vacia()
+            continue
+        hoja.fila([nombre, valor], estilos={1: 'kpi_titulo', 2: 'kpi_valor'})
 
 
 # ---------------------------------------------------------------------------
@@ -649,28 +688,23 @@ def _nombre_hoja_unico(wb: Workbook, nombre: str) -> str:
 # ---------------------------------------------------------------------------
 
 def _hoja_resumen(
-    wb: Workbook,
+    libro: LibroStreaming,
     metricas: dict,
     distribucion: dict,
     filtros_str: str,
 ) -> None:
     """Hoja 1: KPIs (sin Ventas Mostrador) + distribución por estado."""
-    ws = wb.create_sheet('Resumen General')
-    ws.merge_cells('A1:F1')
-    title = ws['A1']
-    title.value = (
-        f"BASE GARANTÍA - {datetime.now().strftime('%d/%m/%Y')} - {filtros_str}"
+    hoja = libro.hoja('Resumen General')
+    hoja.titulo_combinado(
+        f"BASE GARANTÍA - {datetime.now().strftime('%d/%m/%Y')} - {filtros_str}",
+        6, alto=30,
     )
-    apply_cell_style(title, get_title_style())
-    ws.row_dimensions[1].height = 30
-
-    row = 3
-    ws.merge_cells(f'A{row}:F{row}')
-    ws[f'A{row}'] = 'INDICADORES CLAVE (KPIs)'
-    apply_cell_style(ws[f'A{row}'], get_kpi_title_style())
+    hoja.fila_vacia()
+    hoja.titulo_combinado('INDICADORES CLAVE (KPIs)', 6, estilo='kpi_titulo')
+    hoja.fila_vacia()
 
     # Sin filas de VM: en garantía el dinero relevante es la cotización de extras.
-    kpis = [
+    _filas_kpi(hoja, [
         ('Total de Órdenes en Garantía', metricas['total_ordenes']),
         ('Órdenes Activas', metricas['ordenes_activas']),
         ('Órdenes Entregadas', metricas['ordenes_entregadas']),
@@ -684,118 +718,82 @@ def _hoja_resumen(
         ('', ''),
         ('Tiempo Promedio (días hábiles)', metricas['tiempo_promedio']),
         ('% en Tiempo (≤15 días)', f"{metricas['porcentaje_en_tiempo']}%"),
-    ]
+    ])
 
-    row += 2
-    for nombre, valor in kpis:
-        if nombre == '':
-            row += 1
-            continue
-        ws[f'A{row}'] = nombre
-        ws[f'B{row}'] = valor
-        apply_cell_style(ws[f'A{row}'], get_kpi_title_style())
-        apply_cell_style(ws[f'B{row}'], get_kpi_value_style())
-        row += 1
-
-    row += 2
-    ws.merge_cells(f'A{row}:C{row}')
-    ws[f'A{row}'] = 'DISTRIBUCIÓN POR ESTADO'
-    apply_cell_style(ws[f'A{row}'], get_kpi_title_style())
-
-    row += 1
-    ws[f'A{row}'] = 'Estado'
-    ws[f'B{row}'] = 'Cantidad'
-    ws[f'C{row}'] = '% del Total'
-    apply_cell_style(ws[f'A{row}'], get_header_style())
-    apply_cell_style(ws[f'B{row}'], get_header_style())
-    apply_cell_style(ws[f'C{row}'], get_header_style())
+    hoja.fila_vacia(2)
+    hoja.titulo_combinado('DISTRIBUCIÓN POR ESTADO', 3, estilo='kpi_titulo')
+    hoja.fila(['Estado', 'Cantidad', '% del Total'], estilo='encabezado')
 
     total = metricas['total_ordenes'] or 0
-    row += 1
     for estado, cantidad in distribucion.items():
         pct = round((cantidad / total * 100), 1) if total else 0
-        ws[f'A{row}'] = estado
-        ws[f'B{row}'] = cantidad
-        ws[f'C{row}'] = f'{pct}%'
-        row += 1
+        hoja.fila([estado, cantidad, f'{pct}%'])
 
-    auto_adjust_column_width(ws)
 
-
-def _hoja_consolidado_responsables(wb: Workbook, responsables: list[dict]) -> None:
+def _hoja_consolidado_responsables(
+    libro: LibroStreaming,
+    responsables: list[dict],
+) -> None:
     """Hoja 2: una fila por responsable, sin columnas de Venta Mostrador."""
-    ws = wb.create_sheet('Consolidado Responsables')
-    ws.merge_cells('A1:H1')
-    title = ws['A1']
-    title.value = 'ANÁLISIS CONSOLIDADO POR RESPONSABLE DE SEGUIMIENTO'
-    apply_cell_style(title, get_title_style())
-    ws.row_dimensions[1].height = 25
-
-    headers = [
+    hoja = libro.hoja('Consolidado Responsables')
+    hoja.titulo_combinado(
+        'ANÁLISIS CONSOLIDADO POR RESPONSABLE DE SEGUIMIENTO', 8, alto=25,
+    )
+    hoja.fila_vacia()
+    hoja.fila([
         'Responsable', 'Total Órdenes', 'Activas', 'Entregadas',
         'Cotizaciones Aceptadas', 'Monto Cotizaciones',
         'Tiempo Promedio (días)', 'Tasa Entrega (%)',
-    ]
-    _escribir_encabezados(ws, 3, headers)
+    ], estilo='encabezado')
 
-    row = 4
     for resp in responsables:
-        ws.cell(row=row, column=1).value = resp['nombre']
-        ws.cell(row=row, column=2).value = resp['total_ordenes']
-        ws.cell(row=row, column=3).value = resp['ordenes_activas']
-        ws.cell(row=row, column=4).value = resp['ordenes_entregadas']
-        ws.cell(row=row, column=5).value = resp['cotizaciones_aceptadas']
-        ws.cell(row=row, column=6).value = f"${resp['monto_cotizaciones']:,.2f}"
-        ws.cell(row=row, column=7).value = resp['tiempo_promedio']
-        ws.cell(row=row, column=8).value = f"{resp['tasa_entrega']}%"
-        row += 1
-
-    auto_adjust_column_width(ws)
-
-
-def _hoja_sucursales(wb: Workbook, sucursales: list[dict]) -> None:
+        hoja.fila([
+            resp['nombre'],
+            resp['total_ordenes'],
+            resp['ordenes_activas'],
+            resp['ordenes_entregadas'],
+            resp['cotizaciones_aceptadas'],
+            f"${resp['monto_cotizaciones']:,.2f}",
+            resp['tiempo_promedio'],
+            f"{resp['tasa_entrega']}%",
+        ])
+
+
+def _hoja_sucursales(libro: LibroStreaming, sucursales: list[dict]) -> None:
     """Hoja 3: por sucursal, sin columna de Ventas Mostrador."""
-    ws = wb.create_sheet('Por Sucursal')
-    ws.merge_cells('A1:D1')
-    title = ws['A1']
-    title.value = 'ANÁLISIS POR SUCURSAL'
-    apply_cell_style(title, get_title_style())
-    ws.row_dimensions[1].height = 25
-
-    _escribir_encabezados(
-        ws, 3, ['Sucursal', 'Total Órdenes', 'Cotizaciones', 'Monto Total'],
+    hoja = libro.hoja('Por Sucursal')
+    hoja.titulo_combinado('ANÁLISIS POR SUCURSAL', 4, alto=25)
+    hoja.fila_vacia()
+    hoja.fila(
+        ['Sucursal', 'Total Órdenes', 'Cotizaciones', 'Monto Total'],
+        estilo='encabezado',
     )
 
-    row = 4
     for suc in sucursales:
-        ws.cell(row=row, column=1).value = suc['nombre']
-        ws.cell(row=row, column=2).value = suc['total_ordenes']
-        ws.cell(row=row, column=3).value = suc['cotizaciones']
-        ws.cell(row=row, column=4).value = f"${suc['monto_total']:,.2f}"
-        row += 1
-
-    auto_adjust_column_width(ws)
+        hoja.fila([
+            suc['nombre'],
+            suc['total_ordenes'],
+            suc['cotizaciones'],
+            f"${suc['monto_total']:,.2f}",
+        ])
 
 
 def _hoja_un_responsable(
-    wb: Workbook,
+    libro: LibroStreaming,
     ordenes: QuerySet,
     resp_stat: dict,
+    contador: ContadorProgreso,
 ) -> None:
     """Una hoja por responsable: stats (sin VM) + activas + cerradas."""
-    ws = wb.create_sheet(_nombre_hoja_unico(wb, resp_stat['nombre']))
-    ws.merge_cells('A1:P1')
-    title = ws['A1']
-    title.value = f"REPORTE INDIVIDUAL - {resp_stat['nombre']}"
-    apply_cell_style(title, get_title_style())
-    ws.row_dimensions[1].height = 25
-
-    row = 3
-    ws[f'A{row}'] = 'ESTADÍSTICAS PERSONALES'
-    apply_cell_style(ws[f'A{row}'], get_kpi_title_style())
-    row += 2
-
-    stats = [
+    hoja = libro.hoja(resp_stat['nombre'])
+    hoja.titulo_combinado(
+        f"REPORTE INDIVIDUAL - {resp_stat['nombre']}", 16, alto=25,
+    )
+    hoja.fila_vacia()
+    hoja.fila(['ESTADÍSTICAS PERSONALES'], estilo='kpi_titulo', medir=False)
+    hoja.fila_vacia()
+
+    _filas_kpi(hoja, [
         ('Total de Órdenes:', resp_stat['total_ordenes']),
         ('Órdenes Activas:', resp_stat['ordenes_activas']),
         ('Órdenes Entregadas:', resp_stat['ordenes_entregadas']),
@@ -806,16 +804,7 @@ def _hoja_un_responsable(
         ('Cotizaciones Pendientes:', resp_stat['cotizaciones_pendientes']),
         ('Cotizaciones Rechazadas:', resp_stat['cotizaciones_rechazadas']),
         ('Monto Cotizaciones:', f"${resp_stat['monto_cotizaciones']:,.2f}"),
-    ]
-    for nombre, valor in stats:
-        if nombre == '':
-            row += 1
-            continue
-        ws[f'A{row}'] = nombre
-        ws[f'B{row}'] = valor
-        apply_cell_style(ws[f'A{row}'], get_kpi_title_style())
-        apply_cell_style(ws[f'B{row}'], get_kpi_value_style())
-        row += 1
+    ])
 
     # id=0 es el cubo "Sin asignar" que arma excel_exporters (no existe Empleado 0).
     if resp_stat['id'] == 0:
@@ -823,57 +812,45 @@ def _hoja_un_responsable(
     else:
         ordenes_resp = ordenes.filter(responsable_seguimiento__id=resp_stat['id'])
 
-    row += 2
-    activas = ordenes_resp.exclude(estado__in=['entregado', 'cancelado'])
-    ws.merge_cells(f'A{row}:P{row}')
-    seccion = ws[f'A{row}']
-    seccion.value = f'ÓRDENES ACTIVAS ({activas.count()})'
-    seccion.fill = PatternFill(start_color='ffc107', end_color='ffc107', fill_type='solid')
-    seccion.font = Font(bold=True, size=12, color='000000')
-    seccion.alignment = Alignment(horizontal='left', vertical='center')
-
-    row += 1
-    _escribir_encabezados(ws, row, HEADERS_ORDEN_CORTA)
-    row += 1
-    for orden in activas.order_by('-fecha_ingreso'):
-        _escribir_fila_corta(ws, row, orden, es_cerrada=False)
-        row += 1
-
-    row += 2
-    cerradas = ordenes_resp.filter(estado__in=['entregado', 'cancelado'])
-    ws.merge_cells(f'A{row}:P{row}')
-    seccion = ws[f'A{row}']
-    seccion.value = f'ÓRDENES CERRADAS/ENTREGADAS ({cerradas.count()})'
-    seccion.fill = PatternFill(start_color='28a745', end_color='28a745', fill_type='solid')
-    seccion.font = Font(bold=True, size=12, color='FFFFFF')
-    seccion.alignment = Alignment(horizontal='left', vertical='center')
-
-    row += 1
-    _escribir_encabezados(ws, row, HEADERS_ORDEN_CORTA)
-    row += 1
-    for orden in cerradas.order_by('-fecha_ingreso'):
-        _escribir_fila_corta(ws, row, orden, es_cerrada=True)
-        row += 1
-
-    auto_adjust_column_width(ws)
-
-
-def _hoja_todas_las_ordenes(wb: Workbook, ordenes: QuerySet) -> None:
-    """Hoja final: lista maestra (la “base” para Excel / Power BI)."""
-    ws = wb.create_sheet('Todas las Órdenes')
-    ws.merge_cells('A1:Q1')
-    title = ws['A1']
-    title.value = (
-        f'LISTA MAESTRA - ÓRDENES EN GARANTÍA ({ordenes.count()} registros)'
+    # Los conteos ya vienen de la pasada de resumen: no hace falta otro COUNT.
+    total_activas = resp_stat['ordenes_activas']
+    secciones = (
+        (
+            f'ÓRDENES ACTIVAS ({total_activas})',
+            'seccion_activas',
+            ordenes_resp.exclude(estado__in=['entregado', 'cancelado']),
+            False,
+        ),
+        (
+            f"ÓRDENES CERRADAS/ENTREGADAS ({resp_stat['total_ordenes'] - total_activas})",
+            'seccion_cerradas',
+            ordenes_resp.filter(estado__in=['entregado', 'cancelado']),
+            True,
+        ),
     )
-    apply_cell_style(title, get_title_style())
-    ws.row_dimensions[1].height = 25
+    for titulo, estilo, queryset, es_cerrada in secciones:
+        hoja.fila_vacia(2)
+        hoja.titulo_combinado(titulo, 16, estilo=estilo)
+        hoja.fila(HEADERS_ORDEN_CORTA, estilo='encabezado')
+        for orden in iterar_queryset(queryset.order_by('-fecha_ingreso')):
+            _fila_corta(hoja, orden, es_cerrada=es_cerrada)
+            contador.avanzar()
 
-    _escribir_encabezados(ws, 3, HEADERS_ORDEN_MAESTRA)
 
-    row = 4
-    for orden in ordenes:
-        _escribir_fila_maestra(ws, row, orden)
-        row += 1
+def _hoja_todas_las_ordenes(
+    libro: LibroStreaming,
+    ordenes: QuerySet,
+    total: int,
+    contador: ContadorProgreso,
+) -> None:
+    """Hoja final: lista maestra (la “base” para Excel / Power BI)."""
+    hoja = libro.hoja('Todas las Órdenes')
+    hoja.titulo_combinado(
+        f'LISTA MAESTRA - ÓRDENES EN GARANTÍA ({total} registros)', 17, alto=25,
+    )
+    hoja.fila_vacia()
+    hoja.fila(HEADERS_ORDEN_MAESTRA, estilo='encabezado')
 
-    auto_adjust_column_width(ws)
+    for orden in iterar_queryset(ordenes):
+        _fila_maestra(hoja, orden)
+        contador.avanzar()
@@ -0,0 +1,277 @@
+"""
+Exportaciones Excel en segundo plano (Celery + campanita).
+
+Objetivo de negocio:
+    Un reporte con miles de órdenes no debe bloquear el request hasta el
+    timeout. Si el volumen supera ``EXPORT_MAX_FILAS_SINCRONO``, la vista
+    encola la exportación, el worker genera el .xlsx con el motor en
+    streaming y la campanita 🔔 avisa con un enlace de descarga firmado.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+    - ``EXPORTADORES`` mapea un tipo de reporte a la función que lo arma.
+      Cada función recibe ``parametros`` (los filtros GET) y un callback
+      ``progreso(procesadas, total)``, y devuelve ``(nombre, libro)`` o
+      ``None`` si no hay datos.
+    - El archivo se guarda en ``exportaciones/<usuario>/`` del storage por
+      defecto con un prefijo aleatorio; solo se descarga con un token
+      firmado que incluye el usuario dueño. La limpieza diaria
+      (limpiar_exportaciones_vencidas) borra los que ya vencieron.
+    - El polling del avance solo responde al usuario que encoló la tarea
+      (services/tareas_usuario.py).
+
+Efectos secundarios:
+    Encola tareas Celery y escribe archivos .xlsx en el storage por defecto.
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import uuid
+from datetime import timedelta
+from typing import Any
+
+from django.contrib import messages
+from django.core import signing
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Por encima de este número de filas la exportación se manda a Celery.
+EXPORT_MAX_FILAS_SINCRONO = 2000
+
+# Vigencia del enlace de descarga enviado a la campanita (segundos).
+EXPORT_VIGENCIA_ENLACE = 60 * 60 * 24 * 7
+
+_SALT_DESCARGA = 'servicio_tecnico.exportacion_excel'
+
+CONTENT_TYPE_XLSX = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# tipo → (ruta de la función exportadora, título legible para la campanita).
+EXPORTADORES: dict[str, tuple[str, str]] = {
+    'base_garantia': (
+        'servicio_tecnico.services.export_excel_garantia.exportar_base_garantia',
+        'Base de servicios en garantía',
+    ),
+    'productividad_tecnicos': (
+        'servicio_tecnico.services.productividad_tecnicos.exportar_productividad_tecnicos',
+        'Productividad técnicos',
+    ),
+    'candidatos_rhitso': (
+        'servicio_tecnico.views_dashboard_rhitso.exportar_candidatos_rhitso',
+        'Reporte RHITSO',
+    ),
+    'encuestas_satisfaccion': (
+        'servicio_tecnico.views_encuestas.exportar_encuestas_satisfaccion',
+        'Encuestas de satisfacción',
+    ),
+}
+
+
+def obtener_exportador(tipo: str):
+    """
+    Devuelve la función exportadora registrada para ``tipo``.
+
+    Raises:
+        KeyError: si el tipo no existe.
+    """
+    ruta, _titulo = EXPORTADORES[tipo]
+    return import_string(ruta)
+
+
+def titulo_exportacion(tipo: str) -> str:
+    """Título legible del reporte (para la campanita)."""
+    return EXPORTADORES.get(tipo, ('', tipo))[1]
+
+
+def parametros_desde_request(request, claves: tuple[str, ...]) -> dict[str, str]:
+    """
+    Copia solo los filtros GET conocidos (serializables para Celery).
+
+    Args:
+        request: HttpRequest con los filtros.
+        claves: nombres de parámetro que entiende el exportador.
+
+    Returns:
+        dict con strings (vacío = sin filtro).
+    """
+    return {clave: request.GET.get(clave, '') for clave in claves}
+
+
+def encolar_exportacion(
+    tipo: str,
+    parametros: dict[str, Any],
+    usuario,
+    db_alias: str = 'default',
+) -> str:
+    """
+    Encola ``generar_exportacion_excel_task`` y devuelve el task_id.
+
+    Args:
+        tipo: clave de ``EXPORTADORES``.
+        parametros: filtros serializables.
+        usuario: User que recibirá la notificación.
+        db_alias: BD del país activo.
+
+    Returns:
+        str: id de la tarea Celery (para polling).
+    """
+    from servicio_tecnico.tasks import generar_exportacion_excel_task
+
+    from .tareas_usuario import registrar_tarea_de_usuario
+
+    if tipo not in EXPORTADORES:
+        raise KeyError(f'Exportación desconocida: {tipo}')
+
+    tarea = generar_exportacion_excel_task.delay(
+        tipo=tipo,
+        parametros=parametros,
+        usuario_id=usuario.pk,
+        db_alias=db_alias,
+    )
+    registrar_tarea_de_usuario(tarea.id, usuario.pk)
+    logger.info(
+        '[EXPORT-EXCEL] Encolada %s para %s (task_id=%s)',
+        tipo, usuario.username, tarea.id,
+    )
+    return tarea.id
+
+
+def responder_encolada(
+    request: HttpRequest,
+    tipo: str,
+    parametros: dict[str, Any],
+    destino: str,
+) -> HttpResponse:
+    """
+    Encola la exportación del usuario y lo regresa a la pantalla de filtros.
+
+    Args:
+        request: request autenticado (usuario + país activo).
+        tipo: clave de ``EXPORTADORES``.
+        parametros: filtros serializables.
+        destino: URL a la que se redirige (normalmente la misma página).
+
+    Returns:
+        HttpResponseRedirect con un mensaje informativo.
+
+    Efectos secundarios:
+        Encola una tarea Celery.
+    """
+    from config.middleware_pais import get_current_db_alias
+
+    encolar_exportacion(tipo, parametros, request.user, get_current_db_alias())
+    messages.info(
+        request,
+        f'El reporte «{titulo_exportacion(tipo)}» es grande y se está generando '
+        'en segundo plano. Te avisaremos en la campanita 🔔 cuando esté listo.',
+    )
+    return redirect(destino)
+
+
+def respuesta_xlsx(libro, nombre: str) -> HttpResponse:
+    """
+    Serializa el libro directamente en la respuesta HTTP (sin BytesIO extra).
+
+    Args:
+        libro: LibroStreaming listo.
+        nombre: nombre de descarga.
+
+    Returns:
+        HttpResponse attachment .xlsx.
+    """
+    response = HttpResponse(content_type=CONTENT_TYPE_XLSX)
+    response['Content-Disposition'] = f'attachment; filename="{nombre}"'
+    libro.guardar(response)
+    return response
+
+
+def guardar_libro(libro, nombre: str, usuario_id: int) -> str:
+    """
+    Serializa el libro a un temporal y lo sube al storage por defecto.
+
+    Args:
+        libro: LibroStreaming listo.
+        nombre: nombre de archivo visible (.xlsx).
+        usuario_id: dueño del archivo (carpeta).
+
+    Returns:
+        str: ruta relativa dentro del storage.
+    """
+    # EXPLICACIÓN: openpyxl escribe a disco; no armamos el .xlsx en RAM.
+    with tempfile.TemporaryFile(suffix='.xlsx') as temporal:
+        libro.guardar(temporal)
+        temporal.seek(0)
+        ruta = (
+            f'exportaciones/{usuario_id}/{timezone.now():%Y%m}/'
+            f'{uuid.uuid4().hex}_{nombre}'
+        )
+        return default_storage.save(ruta, File(temporal))
+
+
+def token_descarga(ruta: str, usuario_id: int, nombre: str) -> str:
+    """Token firmado (ruta + dueño + nombre visible) para la URL de descarga."""
+    return signing.dumps(
+        {'ruta': ruta, 'usuario': usuario_id, 'nombre': nombre},
+        salt=_SALT_DESCARGA,
+    )
+
+
+def leer_token_descarga(token: str) -> dict[str, Any]:
+    """
+    Valida el token de descarga.
+
+    Raises:
+        signing.BadSignature: token alterado o vencido.
+    """
+    return signing.loads(token, salt=_SALT_DESCARGA, max_age=EXPORT_VIGENCIA_ENLACE)
+
+
+def url_descarga(ruta: str, usuario_id: int, nombre: str) -> str:
+    """URL relativa de descarga firmada (se guarda en Notificacion.url)."""
+    return reverse(
+        'servicio_tecnico:descargar_exportacion_excel',
+        kwargs={'token': token_descarga(ruta, usuario_id, nombre)},
+    )
+
+
+def limpiar_exportaciones_vencidas(segundos: int = EXPORT_VIGENCIA_ENLACE) -> dict[str, int]:
+    """
+    Borra los .xlsx de ``exportaciones/`` más viejos que su enlace de descarga.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Pasada la vigencia del token nadie puede descargarlos, así que solo
+    ocupan disco. El storage agrega la carpeta del país activo: la tarea
+    diaria llama a esta función una vez por país (en_todos_los_paises).
+
+    Args:
+        segundos: antigüedad mínima (por defecto, la vigencia del enlace).
+
+    Returns:
+        dict: {'exportaciones': archivos borrados}.
+    """
+    limite = timezone.now() - timedelta(seconds=segundos)
+    borrados = 0
+    pendientes = ['exportaciones']
+    while pendientes:
+        carpeta = pendientes.pop()
+        try:
+            subcarpetas, archivos = default_storage.listdir(carpeta)
+        except FileNotFoundError:
+            continue
+        pendientes.extend(f'{carpeta}/{nombre}' for nombre in subcarpetas)
+        for nombre in archivos:
+            ruta = f'{carpeta}/{nombre}'
+            try:
+                if default_storage.get_modified_time(ruta) < limite:
+                    default_storage.delete(ruta)
+                    borrados += 1
+            except OSError as exc:
+                logger.warning('[EXPORT-EXCEL] No se pudo borrar %s: %s', ruta, exc)
+    return {'exportaciones': borrados}
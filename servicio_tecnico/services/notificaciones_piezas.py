@@ -42,6 +42,7 @@ def enviar_notificacion_pieza_recibida(orden, seguimiento):
             }
     """
     from django.core.mail import EmailMessage
+    from notificaciones.correo_service import enviar_correo
     from django.conf import settings
     import os
     
@@ -208,7 +209,7 @@ Hecho por Jorge Magos todos los derechos reservados.
             cc=destinatarios_copia if destinatarios_copia else None,
         )
         
-        email.send(fail_silently=False)
+        enviar_correo(email)
         
         # Log exitoso
         print(f"✅ Email enviado correctamente")
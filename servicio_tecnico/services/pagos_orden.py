@@ -9,7 +9,7 @@ aplica IVA de México, suma venta mostrador, resta lo ya pagado y
 valida que no se cobre de más. El diagnóstico de ingreso ya está
 cubierto al recibir el equipo: no entra al cobro.
 
-No es una vista HTTP: lo llaman detalle_orden, el banner de alertas y
+No es una vista HTTP: lo llaman detalle_orden, la bandeja de pagos, el banner de alertas y
 los tests. Así no hinchamos OrdenServicio ni models.py (regla fat models).
 """
 
@@ -20,14 +20,17 @@ from decimal import ROUND_HALF_UP, Decimal
 from io import BytesIO
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.files.base import ContentFile
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import F
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from PIL import Image, ImageOps, UnidentifiedImageError
 
+from config.agregados import Total
 from config.paises_config import get_pais_actual
 from servicio_tecnico.services.historial import registrar_historial
 
@@ -60,6 +63,36 @@ TIPO_REF_ORDEN_CLIENTE = 'orden_cliente'
 TIPO_REF_SERVICE_TAG = 'service_tag'
 TIPO_REF_INTERNO = 'interno'
 
+# Caché de ResumenCobro por orden (se invalida por versión, ver calcular_resumenes_cobro).
+RESUMEN_COBRO_TTL = getattr(settings, 'CACHE_TTL_RESUMEN_COBRO', 60 * 10)
+
+# Conceptos fijos de VentaMostrador.total_venta (las piezas se suman aparte).
+_CONCEPTOS_VENTA_MOSTRADOR = (
+    'costo_paquete',
+    'costo_cambio_pieza',
+    'costo_limpieza',
+    'costo_kit',
+    'costo_reinstalacion',
+    'costo_respaldo',
+)
+
+# Sumas por orden para _leer_importes_cobro (una subconsulta cada una).
+_TOTAL_PAGADO = Total('pagos', suma=(F('monto'), lambda pago: pago.monto))
+# Estimado: precio al cliente si Almacén lo sincronizó; si no, costo de proveedor.
+_TOTAL_PIEZAS_ESTIMADO = Total(
+    'piezas_cotizadas',
+    suma=(
+        F('cantidad') * Coalesce('precio_unitario_cliente', 'costo_unitario'),
+        lambda pieza: (
+            pieza.costo_total if pieza.precio_unitario_cliente is None
+            else pieza.cantidad * pieza.precio_unitario_cliente
+        ),
+    ),
+)
+_TOTAL_PIEZAS_VENDIDAS = Total(
+    'piezas_vendidas', suma=(F('cantidad') * F('precio_unitario'), lambda pieza: pieza.subtotal),
+)
+
 # Estados en los que el negocio espera al menos el 50% (anticipo).
 ESTADOS_REQUIEREN_ANTICIPO_50 = (
     'reparacion',
@@ -225,95 +258,35 @@ def _codigo_pais_activo(codigo_pais: Optional[str] = None) -> str:
         return 'MX'
 
 
-def _suma_precio_piezas(piezas) -> Decimal:
-    """
-    Suma el precio al cliente de un iterable de PiezaCotizada.
-
-    EXPLICACIÓN PARA PRINCIPIANTES:
-    Almacén guarda `precio_unitario_cliente` (sin IVA, con margen).
-    Cotizaciones viejas solo de ST no tienen ese campo: usamos el
-    costo de proveedor como respaldo.
-
-    Args:
-        piezas: queryset o lista de PiezaCotizada.
-
-    Returns:
-        Decimal redondeado a 2 decimales.
-    """
-    total = Decimal('0.00')
-    for pieza in piezas:
-        if pieza.precio_unitario_cliente is not None:
-            total += pieza.cantidad * pieza.precio_unitario_cliente
-        else:
-            total += pieza.costo_total
-    return _dinero(total)
-
-
-def _subtotal_cotizacion(orden) -> tuple[Decimal, bool]:
-    """
-    Subtotal de piezas cotizadas (sin IVA y sin diagnóstico).
-
-    EXPLICACIÓN PARA PRINCIPIANTES:
-    El diagnóstico (mano de obra de ingreso) ya se cubre al recibir
-    el equipo. Aquí solo entran las piezas. Si el cliente ya aceptó,
-    sumamos las aceptadas; si todavía no responde, un estimado con
-    todas las piezas para poder cobrar el anticipo del 50%.
-
-    Args:
-        orden: OrdenServicio (puede o no tener cotizacion).
-
-    Returns:
-        tuple: (subtotal Decimal, es_estimado bool).
-    """
-    cotizacion = getattr(orden, 'cotizacion', None)
-    if cotizacion is None:
-        return Decimal('0.00'), False
-
-    # Paso: cotización aceptada → solo piezas que el cliente sí pidió.
-    if cotizacion.usuario_acepto:
-        return _dinero(cotizacion.monto_piezas_aceptadas_cobro), False
-
-    # Paso: rechazada → ya no cobramos esa cotización (sí puede haber VM).
-    if cotizacion.usuario_acepto is False:
-        return Decimal('0.00'), False
-
-    # Paso: sin respuesta → estimado con todas las piezas (sin MO).
-    return _suma_precio_piezas(cotizacion.piezas_cotizadas.all()), True
-
-
-def calcular_resumen_cobro(orden, codigo_pais: Optional[str] = None) -> ResumenCobro:
+def _armar_resumen(
+    subtotal: Decimal,
+    es_estimado: bool,
+    total_vm: Decimal,
+    pagado: Decimal,
+    codigo: str,
+) -> ResumenCobro:
     """
-    Arma el total a cobrar, lo pagado y el saldo de una orden.
+    Aritmética del cobro a partir de los importes ya leídos de la BD.
 
     Args:
-        orden: OrdenServicio (idealmente con cotizacion, venta_mostrador y pagos).
-        codigo_pais: Override opcional ('MX', 'AR', …) para tests.
+        subtotal: piezas cotizadas sin IVA (aceptadas o estimado).
+        es_estimado: True si el cliente aún no responde la cotización.
+        total_vm: total de la venta mostrador (0 si no hay).
+        pagado: suma de abonos capturados.
+        codigo: código de país ('MX' aplica IVA).
 
     Returns:
         ResumenCobro con todos los importes ya redondeados.
-
-    Efectos secundarios:
-        Lee BD (piezas, pagos, venta mostrador). No escribe.
     """
-    subtotal, es_estimado = _subtotal_cotizacion(orden)
-
     # Paso: IVA 16% solo en México, igual que el PDF que ve el cliente.
-    codigo = _codigo_pais_activo(codigo_pais)
     aplica_iva = codigo == 'MX'
     tasa = IVA_TASA_MX if aplica_iva else Decimal('0.00')
     iva = _dinero(subtotal * tasa) if aplica_iva else Decimal('0.00')
     # Paso: piezas + IVA en un solo monto (la UI no lo vuelve a sumar).
     total_cotizacion_con_iva = _dinero(subtotal + iva)
 
-    venta = getattr(orden, 'venta_mostrador', None)
-    total_vm = _dinero(venta.total_venta) if venta is not None else Decimal('0.00')
-
     total = _dinero(total_cotizacion_con_iva + total_vm)
 
-    # Paso: suma de abonos ya capturados (si no hay, 0).
-    agregado = orden.pagos.aggregate(total=Sum('monto'))['total']
-    pagado = _dinero(agregado or Decimal('0.00'))
-
     saldo = _dinero(total - pagado)
     if saldo < 0:
         saldo = Decimal('0.00')
@@ -347,6 +320,220 @@ def calcular_resumen_cobro(orden, codigo_pais: Optional[str] = None) -> ResumenC
     )
 
 
+def _subtotal_cotizacion(fila) -> tuple[Decimal, bool]:
+    """
+    Subtotal de piezas cotizadas (sin IVA y sin diagnóstico).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El diagnóstico (mano de obra de ingreso) ya se cubre al recibir
+    el equipo. Aquí solo entran las piezas. Si el cliente ya aceptó,
+    sumamos las aceptadas; si todavía no responde, un estimado con
+    todas las piezas para poder cobrar el anticipo del 50%.
+
+    Args:
+        fila: dict de _leer_importes_cobro (una orden).
+
+    Returns:
+        tuple: (subtotal Decimal, es_estimado bool).
+    """
+    if fila['cotizacion__pk'] is None:
+        return Decimal('0.00'), False
+
+    # Paso: cotización aceptada → solo piezas que el cliente sí pidió.
+    if fila['cotizacion__usuario_acepto']:
+        return _dinero(fila['piezas_aceptadas']), False
+
+    # Paso: rechazada → ya no cobramos esa cotización (sí puede haber VM).
+    if fila['cotizacion__usuario_acepto'] is False:
+        return Decimal('0.00'), False
+
+    # Paso: sin respuesta → estimado con todas las piezas (sin MO).
+    return _dinero(fila['piezas_estimado']), True
+
+
+def _total_venta_mostrador(fila) -> Decimal:
+    """
+    Lo mismo que VentaMostrador.total_venta, con los importes de la fila.
+
+    Args:
+        fila: dict de _leer_importes_cobro (una orden).
+
+    Returns:
+        Decimal: paquete + servicios + piezas vendidas (0 si no hay venta).
+    """
+    if fila['venta_mostrador__pk'] is None:
+        return Decimal('0.00')
+    total = sum(fila[f'venta_mostrador__{campo}'] for campo in _CONCEPTOS_VENTA_MOSTRADOR)
+    return _dinero(total + fila['piezas_venta'])
+
+
+def _leer_importes_cobro(db_alias: str, orden_ids) -> list[dict]:
+    """
+    Una fila por orden con todo lo que necesita el resumen (1 consulta).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Cotizacion y VentaMostrador usan la orden como PK (1 a 1), así que
+    se leen con un JOIN sin duplicar filas. Las sumas de piezas y de
+    pagos van como subconsultas (config/agregados.Total): si fueran JOIN,
+    3 piezas × 2 pagos multiplicarían los importes.
+
+    Args:
+        db_alias: alias de BD del país.
+        orden_ids: PKs de OrdenServicio.
+
+    Returns:
+        list[dict]: valores de la orden, su cotización y su venta mostrador.
+    """
+    from servicio_tecnico.models import (
+        TOTALES_COTIZACION,
+        Cotizacion,
+        OrdenServicio,
+        VentaMostrador,
+    )
+
+    return list(
+        OrdenServicio.objects.using(db_alias)
+        .filter(pk__in=orden_ids)
+        .order_by()
+        .annotate(
+            pagado=_TOTAL_PAGADO.subconsulta(OrdenServicio),
+            # La PK de Cotizacion/VentaMostrador ES el id de la orden: sus
+            # subconsultas se correlacionan directo con la orden.
+            piezas_aceptadas=TOTALES_COTIZACION['monto_piezas_aceptadas_cobro'].subconsulta(Cotizacion),
+            piezas_estimado=_TOTAL_PIEZAS_ESTIMADO.subconsulta(Cotizacion),
+            piezas_venta=_TOTAL_PIEZAS_VENDIDAS.subconsulta(VentaMostrador),
+        )
+        .values(
+            'pk',
+            'cotizacion__pk',
+            'cotizacion__usuario_acepto',
+            'venta_mostrador__pk',
+            *(f'venta_mostrador__{campo}' for campo in _CONCEPTOS_VENTA_MOSTRADOR),
+            'pagado',
+            'piezas_aceptadas',
+            'piezas_estimado',
+            'piezas_venta',
+        )
+    )
+
+
+def _clave_resumen(version: str, codigo: str) -> str:
+    """Clave del ResumenCobro en caché (versión por orden + país de IVA)."""
+    return f'pagos_orden:resumen_cobro:{codigo}:{version}'
+
+
+def calcular_resumenes_cobro(
+    ordenes,
+    codigo_pais: Optional[str] = None,
+    usar_cache: bool = True,
+    db_alias: Optional[str] = None,
+) -> dict[int, ResumenCobro]:
+    """
+    Resumen de cobro de muchas órdenes a la vez (listas y bandeja).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Antes cada fila de una lista pedía a la BD su cotización, sus piezas,
+    su venta mostrador y la suma de sus pagos (4+ consultas por orden).
+    Aquí se resuelven todas las órdenes con UNA consulta agrupada y el
+    resultado se guarda en caché por orden. La clave usa la misma versión
+    por orden que los fragmentos de detalle_orden: los signals la suben
+    al guardar/borrar PagoOrden, Cotizacion, PiezaCotizada, VentaMostrador
+    o PiezaVentaMostrador, así que nunca se lee un saldo viejo.
+
+    Args:
+        ordenes: iterable de OrdenServicio o de PKs.
+        codigo_pais: Override opcional ('MX', 'AR', …) para tests.
+        usar_cache: False para leer siempre de la BD (p. ej. dentro del
+            select_for_update de registrar_pago).
+        db_alias: BD del país; por defecto la de la primera orden
+            (o la del request si llegan solo PKs).
+
+    Returns:
+        dict[int, ResumenCobro]: por id de orden. Las órdenes que ya no
+        existen no aparecen.
+
+    Efectos secundarios:
+        Una lectura de BD (solo para las que no estaban en caché) y
+        get_many/set_many en la caché por defecto.
+    """
+    from django.core.cache import cache
+
+    from servicio_tecnico.services.detalle_orden_cache import versiones_fragmentos_detalle
+
+    orden_ids = []
+    for orden in ordenes:
+        if hasattr(orden, '_state'):
+            db_alias = db_alias or _db_de(orden)
+            orden = orden.pk
+        if orden not in orden_ids:
+            orden_ids.append(orden)
+    if not orden_ids:
+        return {}
+    if db_alias is None:
+        from config.middleware_pais import get_current_db_alias
+
+        db_alias = get_current_db_alias()
+    codigo = _codigo_pais_activo(codigo_pais)
+
+    # Paso 1: lo que ya está en caché con la versión vigente de cada orden.
+    resumenes = {}
+    claves = {}
+    if usar_cache:
+        versiones = versiones_fragmentos_detalle(db_alias, orden_ids)
+        claves = {orden_id: _clave_resumen(versiones[orden_id], codigo) for orden_id in orden_ids}
+        en_cache = cache.get_many(list(claves.values()))
+        resumenes = {
+            orden_id: en_cache[clave] for orden_id, clave in claves.items() if clave in en_cache
+        }
+
+    # Paso 2: el resto en una sola consulta.
+    faltantes = [orden_id for orden_id in orden_ids if orden_id not in resumenes]
+    nuevos = {}
+    if faltantes:
+        for fila in _leer_importes_cobro(db_alias, faltantes):
+            subtotal, es_estimado = _subtotal_cotizacion(fila)
+            nuevos[fila['pk']] = _armar_resumen(
+                subtotal,
+                es_estimado,
+                _total_venta_mostrador(fila),
+                _dinero(fila['pagado']),
+                codigo,
+            )
+    if usar_cache and nuevos:
+        cache.set_many(
+            {claves[orden_id]: resumen for orden_id, resumen in nuevos.items()},
+            RESUMEN_COBRO_TTL,
+        )
+    resumenes.update(nuevos)
+
+    # Paso 3: mismo orden en que llegaron.
+    return {orden_id: resumenes[orden_id] for orden_id in orden_ids if orden_id in resumenes}
+
+
+def calcular_resumen_cobro(
+    orden,
+    codigo_pais: Optional[str] = None,
+    usar_cache: bool = True,
+) -> ResumenCobro:
+    """
+    Arma el total a cobrar, lo pagado y el saldo de una orden.
+
+    Args:
+        orden: OrdenServicio ya guardada.
+        codigo_pais: Override opcional ('MX', 'AR', …) para tests.
+        usar_cache: False para leer siempre de la BD.
+
+    Returns:
+        ResumenCobro con todos los importes ya redondeados.
+
+    Efectos secundarios:
+        Los de calcular_resumenes_cobro (a lo más una lectura). No escribe en BD.
+    """
+    return calcular_resumenes_cobro(
+        [orden], codigo_pais=codigo_pais, usar_cache=usar_cache,
+    )[orden.pk]
+
+
 def usuario_puede_registrar_pago(user: Optional[AbstractBaseUser]) -> bool:
     """
     True si el usuario puede capturar un abono (permiso add_pagoorden).
@@ -599,7 +786,10 @@ def registrar_pago(
             .select_for_update()
             .get(pk=orden.pk)
         )
-        resumen = calcular_resumen_cobro(orden_bloqueada, codigo_pais=codigo_pais)
+        # usar_cache=False: el saldo se lee bajo el lock, no de una foto previa.
+        resumen = calcular_resumen_cobro(
+            orden_bloqueada, codigo_pais=codigo_pais, usar_cache=False,
+        )
 
         # Paso: sin cotización ni venta no hay cifra contra la cual abonar.
         if resumen.total_a_cobrar <= Decimal('0.00'):
@@ -0,0 +1,626 @@
+"""
+Paneles de los dashboards de encuestas y feedback de rechazo en una pasada.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+El dashboard de encuestas de satisfacción pedía seis APIs (KPIs, tendencia,
+por responsable, distribución NPS, lista y comentarios) y el de feedback de
+rechazo cinco. Cada una volvía a leer los filtros y a recorrer
+FeedbackCliente por su cuenta, con varios COUNT por KPI; el Excel y el PDF
+repetían todo otra vez.
+
+Aquí se arman TODOS los paneles (menos la lista paginada, que depende de
+la pestaña, la búsqueda y la página) a partir de UNA consulta:
+
+1. `filtrar_feedback()` construye el queryset filtrado (mismos filtros GET
+   del dashboard).
+2. `construir_paneles()` lo lee una sola vez como `.values()` con solo las
+   columnas necesarias y calcula cada panel en Python en el mismo
+   recorrido (KPIs, semanas, responsables, motivos, NPS, comentarios).
+3. `obtener_paneles()` guarda el resultado en caché por país + filtros,
+   junto con una huella (hash) que sirve de ETag. Cualquier FeedbackCliente
+   nuevo, editado o borrado sube la versión del país (signal) y la
+   siguiente lectura vuelve a calcular.
+
+El endpoint del dashboard (`respuesta_paneles`), las APIs antiguas y las
+exportaciones Excel/PDF leen todos de aquí, así que muestran los mismos
+números.
+
+Efectos secundarios:
+- Lee/escribe el caché de Django (versión por país y paneles por filtros).
+"""
+
+import hashlib
+import json
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import DateTimeField, ExpressionWrapper, F
+from django.http import JsonResponse
+from django.utils import timezone
+
+from config.middleware_pais import get_current_db_alias
+
+# Subir si cambia la forma de los paneles (invalida cachés viejos)
+VERSION_CACHE_PANELES = 1
+
+PANELES_FEEDBACK_TTL = getattr(settings, 'CACHE_TTL_PANELES_FEEDBACK', 60 * 10)
+
+# Ventana con la que los paneles cuentan un enlace como "expirado". Se
+# conservan a propósito los 7 días de los dashboards originales
+# (views_encuestas / views_feedback_rechazo_dash), aunque el token de
+# FeedbackCliente valga 12 días (FeedbackCliente.esta_expirado): cambiarlo
+# movería las tasas de respuesta históricas de los reportes.
+DIAS_VIGENCIA = 7
+
+# Comentarios que muestra el dashboard (el PDF con filtros usa todos)
+COMENTARIOS_DASHBOARD = 10
+
+# Filtros GET de cada dashboard (también viajan a Celery en el export)
+FILTROS_SATISFACCION = ('fecha_desde', 'fecha_hasta', 'responsable_id', 'sucursal_id', 'tipo_orden')
+FILTROS_RECHAZO = ('fecha_desde', 'fecha_hasta', 'responsable_id', 'sucursal_id', 'motivo_rechazo')
+
+FILTROS_POR_TIPO = {
+    'satisfaccion': FILTROS_SATISFACCION,
+    'rechazo': FILTROS_RECHAZO,
+}
+
+# Paneles que viajan en el JSON del dashboard, por tipo
+PANELES_DASHBOARD = {
+    'satisfaccion': ('kpis', 'tendencia', 'responsables', 'distribucion_nps', 'comentarios'),
+    'rechazo': ('kpis', 'por_motivo', 'tendencia', 'responsables', 'comentarios'),
+}
+
+# Única lectura de la BD: lo que necesita cualquier panel
+_CAMPOS = (
+    'id',
+    'fecha_creacion',
+    'fecha_respuesta',
+    'correo_enviado',
+    'utilizado',
+    'calificacion_general',
+    'calificacion_atencion',
+    'calificacion_tiempo',
+    'nps',
+    'recomienda',
+    'motivo_rechazo_snapshot',
+    'comentario_cliente',
+    'orden_id',
+    'orden__numero_orden_interno',
+    'orden__detalle_equipo__orden_cliente',
+    'orden__responsable_seguimiento_id',
+    'orden__responsable_seguimiento__nombre_completo',
+)
+
+
+# ============================================================================
+# QUERYSET FILTRADO
+# ============================================================================
+
+def filtrar_feedback(tipo, filtros):
+    """
+    FeedbackCliente del tipo indicado con los filtros GET del dashboard.
+
+    Args:
+        tipo (str): 'satisfaccion' o 'rechazo'.
+        filtros: dict o QueryDict con fecha_desde, fecha_hasta,
+            responsable_id, sucursal_id y tipo_orden (satisfacción) o
+            motivo_rechazo (rechazo).
+
+    Returns:
+        QuerySet con select_related de la orden y `fecha_expiracion`
+        anotada (fecha_creacion + 7 días).
+    """
+    from ..models import FeedbackCliente
+
+    relaciones = ['orden__responsable_seguimiento', 'orden__sucursal', 'orden__detalle_equipo']
+    if tipo == 'rechazo':
+        relaciones.append('cotizacion')
+    qs = FeedbackCliente.objects.filter(tipo=tipo).select_related(*relaciones)
+
+    fecha_desde = filtros.get('fecha_desde')
+    fecha_hasta = filtros.get('fecha_hasta')
+    responsable_id = filtros.get('responsable_id')
+    sucursal_id = filtros.get('sucursal_id')
+
+    if fecha_desde:
+        qs = qs.filter(fecha_creacion__date__gte=fecha_desde)
+    if fecha_hasta:
+        qs = qs.filter(fecha_creacion__date__lte=fecha_hasta)
+    if responsable_id:
+        qs = qs.filter(orden__responsable_seguimiento_id=responsable_id)
+    if sucursal_id:
+        qs = qs.filter(orden__sucursal_id=sucursal_id)
+
+    if tipo == 'satisfaccion':
+        tipo_orden = filtros.get('tipo_orden')
+        if tipo_orden and tipo_orden in ('diagnostico', 'venta_mostrador'):
+            qs = qs.filter(orden__tipo_servicio=tipo_orden)
+    else:
+        motivo_rechazo = filtros.get('motivo_rechazo')
+        if motivo_rechazo:
+            qs = qs.filter(motivo_rechazo_snapshot=motivo_rechazo)
+
+    return qs.annotate(
+        fecha_expiracion=ExpressionWrapper(
+            F('fecha_creacion') + timedelta(days=DIAS_VIGENCIA),
+            output_field=DateTimeField(),
+        )
+    )
+
+
+def hay_filtros(tipo, filtros):
+    """True si el usuario aplicó algún filtro del dashboard."""
+    return any((filtros.get(campo) or '').strip() for campo in FILTROS_POR_TIPO[tipo])
+
+
+# ============================================================================
+# CACHÉ: versión por país + llave por filtros
+# ============================================================================
+
+def _clave_version(db_alias):
+    """Clave del contador de versión de un país."""
+    return f'paneles_feedback:version:{db_alias}'
+
+
+def _version_actual(db_alias):
+    """Versión vigente de los paneles del país (se crea si no existe)."""
+    clave = _clave_version(db_alias)
+    version = cache.get(clave)
+    if version is None:
+        version = int(time.time() * 1000)
+        if not cache.add(clave, version, None):
+            version = cache.get(clave, version)
+    return version
+
+
+def invalidar_paneles_feedback(db_alias='default'):
+    """
+    Sube la versión del país: los paneles cacheados quedan huérfanos.
+
+    Args:
+        db_alias (str): alias de BD del país donde se escribió.
+
+    Efectos secundarios:
+        incr (o set si el contador no existía) en la caché por defecto.
+    """
+    clave = _clave_version(db_alias)
+    try:
+        cache.incr(clave)
+    except ValueError:
+        cache.set(clave, int(time.time() * 1000), None)
+
+
+def _clave_cache(tipo, db_alias, filtros):
+    """
+    Llave de los paneles: tipo, país, versión y filtros.
+
+    Los valores de los filtros los escribe el usuario, así que entran
+    como hash para no armar llaves largas o con caracteres raros.
+    """
+    valores = [str(filtros.get(campo) or '') for campo in FILTROS_POR_TIPO[tipo]]
+    huella_filtros = hashlib.sha1('\x1f'.join(valores).encode('utf-8')).hexdigest()
+    return (
+        f'paneles_feedback:v{VERSION_CACHE_PANELES}:{tipo}:{db_alias}:'
+        f'{_version_actual(db_alias)}:{huella_filtros}'
+    )
+
+
+# ============================================================================
+# CÁLCULO DE PANELES
+# ============================================================================
+
+def _porcentaje(parte, total):
+    """parte / total × 100 con un decimal (0 si no hay total)."""
+    return round((parte / total * 100) if total > 0 else 0, 1)
+
+
+def _nps_score(promotores, detractores, total):
+    """NPS Score = % promotores (9-10) − % detractores (0-6)."""
+    return round(((promotores - detractores) / total * 100) if total > 0 else 0, 1)
+
+
+class _Promedio:
+    """Acumulador de promedio que ignora nulos (igual que AVG en SQL)."""
+
+    __slots__ = ('suma', 'cuenta')
+
+    def __init__(self):
+        self.suma = 0
+        self.cuenta = 0
+
+    def agregar(self, valor):
+        if valor is not None:
+            self.suma += valor
+            self.cuenta += 1
+
+    def valor(self):
+        """Promedio o None si no hubo valores."""
+        return self.suma / self.cuenta if self.cuenta else None
+
+    def redondeado(self):
+        return round(self.valor() or 0, 1)
+
+
+def _inicio_semana(fecha, zona):
+    """
+    Lunes 00:00 (en la zona activa) de la semana de `fecha`.
+
+    EXPLICACIÓN: es lo mismo que devuelve TruncWeek('fecha_creacion') en la
+    BD, que trunca en la zona horaria activa de Django.
+    """
+    local = fecha.astimezone(zona)
+    lunes = local.date() - timedelta(days=local.weekday())
+    return timezone.make_aware(datetime.combine(lunes, dt_time.min), zona)
+
+
+def _orden_numero(fila):
+    """Orden del cliente si existe, si no el número interno."""
+    return fila['orden__detalle_equipo__orden_cliente'] or fila['orden__numero_orden_interno']
+
+
+def _ordenar_desc(items, clave):
+    """
+    Ordena de mayor a menor dejando los None al final.
+
+    El sort de Python es estable: los empates quedan en el orden en que
+    aparecieron en el recorrido.
+    """
+    return sorted(items, key=lambda item: (item[clave] is None, -(item[clave] or 0)))
+
+
+def _comentarios_ordenados(filas):
+    """Respondidas con comentario, de la respuesta más reciente a la más vieja."""
+    con_texto = [f for f in filas if f['utilizado'] and f['comentario_cliente'] != '']
+    return sorted(
+        con_texto,
+        key=lambda f: (f['fecha_respuesta'] is None, -(f['fecha_respuesta'].timestamp() if f['fecha_respuesta'] else 0)),
+    )
+
+
+def _paneles_satisfaccion(filas, ahora, zona, pais):
+    """KPIs, tendencia, responsables, distribución NPS y comentarios (satisfacción)."""
+    from config.paises_config import fecha_local_pais
+
+    enviadas = respondidas = pendientes = expiradas = 0
+    con_recomendacion = recomiendan = 0
+    con_nps = promotores = pasivos = detractores = 0
+    prom_nps, prom_general, prom_atencion, prom_tiempo = _Promedio(), _Promedio(), _Promedio(), _Promedio()
+    semanas = {}
+    responsables = {}
+
+    for f in filas:
+        utilizado = f['utilizado']
+        if not utilizado and f['fecha_creacion'] + timedelta(days=DIAS_VIGENCIA) < ahora:
+            expiradas += 1
+        elif not utilizado and f['correo_enviado']:
+            pendientes += 1
+
+        if utilizado:
+            respondidas += 1
+            nps = f['nps']
+            prom_nps.agregar(nps)
+            prom_general.agregar(f['calificacion_general'])
+            prom_atencion.agregar(f['calificacion_atencion'])
+            prom_tiempo.agregar(f['calificacion_tiempo'])
+            if f['recomienda'] is not None:
+                con_recomendacion += 1
+                recomiendan += f['recomienda'] is True
+            if nps is not None:
+                con_nps += 1
+                promotores += nps >= 9
+                pasivos += 7 <= nps <= 8
+                detractores += nps <= 6
+
+        if not f['correo_enviado']:
+            continue
+        enviadas += 1
+
+        semana = _inicio_semana(f['fecha_creacion'], zona)
+        datos_semana = semanas.get(semana)
+        if datos_semana is None:
+            datos_semana = semanas[semana] = {
+                'enviadas': 0, 'respondidas': 0, 'calificacion': _Promedio(), 'nps': _Promedio(),
+            }
+        datos_semana['enviadas'] += 1
+
+        resp_id = f['orden__responsable_seguimiento_id']
+        datos_resp = responsables.get(resp_id)
+        if datos_resp is None:
+            datos_resp = responsables[resp_id] = {
+                'nombre': f['orden__responsable_seguimiento__nombre_completo'] or '',
+                'enviadas': 0, 'respondidas': 0, 'calificacion': _Promedio(), 'nps': _Promedio(),
+                'recomiendan': 0, 'con_recomendacion': 0,
+                'promotores': 0, 'detractores': 0, 'con_nps': 0,
+            }
+        datos_resp['enviadas'] += 1
+
+        if utilizado:
+            nps = f['nps']
+            datos_semana['respondidas'] += 1
+            datos_semana['calificacion'].agregar(f['calificacion_general'])
+            datos_semana['nps'].agregar(nps)
+            datos_resp['respondidas'] += 1
+            datos_resp['calificacion'].agregar(f['calificacion_general'])
+            datos_resp['nps'].agregar(nps)
+            if f['recomienda'] is not None:
+                datos_resp['con_recomendacion'] += 1
+                datos_resp['recomiendan'] += f['recomienda'] is True
+            if nps is not None:
+                datos_resp['con_nps'] += 1
+                datos_resp['promotores'] += nps >= 9
+                datos_resp['detractores'] += nps <= 6
+
+    kpis = {
+        'total_enviadas': enviadas,
+        'total_respondidas': respondidas,
+        'total_pendientes': pendientes,
+        'total_expiradas': expiradas,
+        'tasa_respuesta': _porcentaje(respondidas, enviadas),
+        'nps_promedio': prom_nps.redondeado(),
+        'calificacion_promedio': prom_general.redondeado(),
+        'calificacion_atencion_promedio': prom_atencion.redondeado(),
+        'calificacion_tiempo_promedio': prom_tiempo.redondeado(),
+        'tasa_recomendacion': _porcentaje(recomiendan, con_recomendacion),
+        'nps_score': _nps_score(promotores, detractores, con_nps),
+    }
+
+    tendencia = {
+        'labels': [],
+        'datasets': {
+            'calificacion_promedio': [],
+            'nps_promedio': [],
+            'tasa_respuesta': [],
+            'total_enviadas': [],
+            'total_respondidas': [],
+        },
+    }
+    for semana in sorted(semanas):
+        datos = semanas[semana]
+        tendencia['labels'].append(semana.strftime('%d/%m/%Y'))
+        tendencia['datasets']['total_enviadas'].append(datos['enviadas'])
+        tendencia['datasets']['total_respondidas'].append(datos['respondidas'])
+        tendencia['datasets']['calificacion_promedio'].append(datos['calificacion'].redondeado())
+        tendencia['datasets']['nps_promedio'].append(datos['nps'].redondeado())
+        tendencia['datasets']['tasa_respuesta'].append(_porcentaje(datos['respondidas'], datos['enviadas']))
+
+    # Ranking por calificación promedio (sin respuestas al final)
+    ranking = _ordenar_desc(
+        [{'id': resp_id, 'datos': datos, 'orden': datos['calificacion'].valor()}
+         for resp_id, datos in responsables.items()],
+        'orden',
+    )
+    lista_responsables = [
+        {
+            'id': item['id'],
+            'nombre': item['datos']['nombre'],
+            'total_enviadas': item['datos']['enviadas'],
+            'total_respondidas': item['datos']['respondidas'],
+            'calificacion_promedio': item['datos']['calificacion'].redondeado(),
+            'nps_promedio': item['datos']['nps'].redondeado(),
+            'tasa_recomendacion': _porcentaje(item['datos']['recomiendan'], item['datos']['con_recomendacion']),
+            'nps_score': _nps_score(item['datos']['promotores'], item['datos']['detractores'], item['datos']['con_nps']),
+        }
+        for item in ranking
+    ]
+
+    distribucion_nps = {
+        'promotores': promotores,
+        'pasivos': pasivos,
+        'detractores': detractores,
+        'total': con_nps,
+        'nps_score': _nps_score(promotores, detractores, con_nps),
+    }
+
+    comentarios = [
+        {
+            'orden_numero': _orden_numero(f),
+            'orden_id': f['orden_id'],
+            'responsable': f['orden__responsable_seguimiento__nombre_completo'] or '',
+            'calificacion': f['calificacion_general'],
+            'nps': f['nps'],
+            'recomienda': f['recomienda'],
+            'comentario': f['comentario_cliente'],
+            'fecha': fecha_local_pais(f['fecha_respuesta'], pais).strftime('%d/%m/%Y') if f['fecha_respuesta'] else '',
+        }
+        for f in _comentarios_ordenados(filas)
+    ]
+
+    return {
+        'kpis': kpis,
+        'tendencia': tendencia,
+        'responsables': lista_responsables,
+        'distribucion_nps': distribucion_nps,
+        'comentarios': comentarios,
+    }
+
+
+def _paneles_rechazo(filas, ahora, zona, pais):
+    """KPIs, motivos, tendencia, responsables y comentarios (rechazo)."""
+    from config.constants import MOTIVO_RECHAZO_COTIZACION
+    from config.paises_config import fecha_local_pais
+
+    motivos_dict = dict(MOTIVO_RECHAZO_COTIZACION)
+    enviados = respondidos = pendientes = expirados = 0
+    motivos = {}
+    semanas = {}
+    responsables = {}
+
+    for f in filas:
+        utilizado = f['utilizado']
+        if utilizado:
+            respondidos += 1
+        elif f['fecha_creacion'] + timedelta(days=DIAS_VIGENCIA) < ahora:
+            expirados += 1
+        elif f['correo_enviado']:
+            pendientes += 1
+
+        if not f['correo_enviado']:
+            continue
+        enviados += 1
+
+        # Motivo, semana y responsable cuentan lo mismo: enviados y respondidos
+        for grupos, clave, nombre in (
+            (motivos, f['motivo_rechazo_snapshot'], None),
+            (semanas, _inicio_semana(f['fecha_creacion'], zona), None),
+            (responsables, f['orden__responsable_seguimiento_id'],
+             f['orden__responsable_seguimiento__nombre_completo'] or ''),
+        ):
+            datos = grupos.get(clave)
+            if datos is None:
+                datos = grupos[clave] = {'total': 0, 'respondidos': 0, 'nombre': nombre}
+            datos['total'] += 1
+            datos['respondidos'] += utilizado
+
+    por_motivo = [
+        {
+            'motivo': clave,
+            'label': motivos_dict.get(clave, clave or 'Sin motivo'),
+            'total': datos['total'],
+            'respondidos': datos['respondidos'],
+        }
+        for clave, datos in motivos.items()
+    ]
+    por_motivo = _ordenar_desc(por_motivo, 'total')
+
+    motivo_label = ''
+    motivo_porcentaje = 0
+    if por_motivo and enviados > 0:
+        top = por_motivo[0]
+        motivo_label = motivos_dict.get(top['motivo'], top['motivo'])
+        motivo_porcentaje = round(top['total'] / enviados * 100, 1)
+
+    kpis = {
+        'total_enviados': enviados,
+        'total_respondidos': respondidos,
+        'total_pendientes': pendientes,
+        'total_expirados': expirados,
+        'tasa_respuesta': _porcentaje(respondidos, enviados),
+        'motivo_mas_frecuente': motivo_label,
+        'motivo_mas_frecuente_porcentaje': motivo_porcentaje,
+    }
+
+    tendencia = {
+        'labels': [],
+        'datasets': {'total_enviados': [], 'total_respondidos': [], 'tasa_respuesta': []},
+    }
+    for semana in sorted(semanas):
+        datos = semanas[semana]
+        tendencia['labels'].append(fecha_local_pais(semana, pais).strftime('%d/%m/%Y'))
+        tendencia['datasets']['total_enviados'].append(datos['total'])
+        tendencia['datasets']['total_respondidos'].append(datos['respondidos'])
+        tendencia['datasets']['tasa_respuesta'].append(_porcentaje(datos['respondidos'], datos['total']))
+
+    lista_responsables = _ordenar_desc([
+        {
+            'id': resp_id,
+            'nombre': datos['nombre'],
+            'total_enviados': datos['total'],
+            'total_respondidos': datos['respondidos'],
+            'tasa_respuesta': _porcentaje(datos['respondidos'], datos['total']),
+        }
+        for resp_id, datos in responsables.items()
+    ], 'total_enviados')
+
+    comentarios = [
+        {
+            'orden_numero': _orden_numero(f),
+            'orden_id': f['orden_id'],
+            'responsable': f['orden__responsable_seguimiento__nombre_completo'] or '',
+            'motivo_rechazo': motivos_dict.get(
+                f['motivo_rechazo_snapshot'], f['motivo_rechazo_snapshot'] or 'Sin motivo',
+            ),
+            'comentario': f['comentario_cliente'],
+            'fecha': fecha_local_pais(f['fecha_respuesta'], pais).strftime('%d/%m/%Y') if f['fecha_respuesta'] else '',
+        }
+        for f in _comentarios_ordenados(filas)
+    ]
+
+    return {
+        'kpis': kpis,
+        'por_motivo': por_motivo,
+        'tendencia': tendencia,
+        'responsables': lista_responsables,
+        'comentarios': comentarios,
+    }
+
+
+def construir_paneles(tipo, queryset):
+    """
+    Calcula todos los paneles del dashboard leyendo el queryset una vez.
+
+    Args:
+        tipo (str): 'satisfaccion' o 'rechazo'.
+        queryset: FeedbackCliente ya filtrado (ver filtrar_feedback).
+
+    Returns:
+        dict con un panel por clave (ver PANELES_DASHBOARD) y 'huella', un
+        hash del contenido que cambia solo si cambian los números. Los
+        comentarios van completos (el dashboard muestra los primeros 10).
+    """
+    from config.paises_config import get_pais_actual
+
+    filas = list(queryset.order_by('id').values(*_CAMPOS))
+    calcular = _paneles_satisfaccion if tipo == 'satisfaccion' else _paneles_rechazo
+    paneles = calcular(filas, timezone.now(), timezone.get_current_timezone(), get_pais_actual())
+    paneles['huella'] = hashlib.sha1(
+        json.dumps(paneles, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+    return paneles
+
+
+def obtener_paneles(tipo, filtros, queryset=None):
+    """
+    Paneles del país actual, desde caché si ya se calcularon con estos filtros.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Pendientes y expiradas dependen de la hora: en caché pueden llevar
+    hasta CACHE_TTL_PANELES_FEEDBACK segundos de atraso si nadie
+    responde, crea o edita feedback en ese tiempo.
+
+    Args:
+        tipo (str): 'satisfaccion' o 'rechazo'.
+        filtros: dict o QueryDict con los filtros del dashboard.
+        queryset: queryset ya filtrado con esos mismos filtros (opcional;
+            si no se pasa se arma con filtrar_feedback). Es perezoso: solo
+            se consulta si los paneles no están en caché.
+
+    Returns:
+        dict de construir_paneles(). Es compartido: NO modificarlo.
+    """
+    clave = _clave_cache(tipo, get_current_db_alias(), filtros)
+    paneles = cache.get(clave)
+    if paneles is None:
+        if queryset is None:
+            queryset = filtrar_feedback(tipo, filtros)
+        paneles = construir_paneles(tipo, queryset)
+        cache.set(clave, paneles, PANELES_FEEDBACK_TTL)
+    return paneles
+
+
+def respuesta_paneles(request, tipo, paneles):
+    """
+    JsonResponse con los paneles del dashboard y su ETag.
+
+    Si el navegador ya tiene esta versión (If-None-Match) responde 304 sin
+    volver a mandar el JSON.
+
+    Returns:
+        JsonResponse, o HttpResponseNotModified (304).
+    """
+    from django.utils.cache import get_conditional_response
+
+    etag = f'"{paneles["huella"]}"'
+    no_modificado = get_conditional_response(request, etag=etag)
+    if no_modificado is not None:
+        return no_modificado
+
+    datos = {panel: paneles[panel] for panel in PANELES_DASHBOARD[tipo]}
+    datos['comentarios'] = datos['comentarios'][:COMENTARIOS_DASHBOARD]
+    response = JsonResponse(datos)
+    response['ETag'] = etag
+    # El navegador guarda la respuesta pero pregunta siempre (If-None-Match)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -20,12 +20,15 @@ from typing import Any, Literal
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Exists, OuterRef, Prefetch, Q, QuerySet
 from django.utils import timezone
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
 
 from config.constants import PAQUETES_CHOICES
 from servicio_tecnico.models import Cotizacion, OrdenServicio, PiezaVentaMostrador, VentaMostrador
+from servicio_tecnico.services.excel_streaming import (
+    ContadorProgreso,
+    LibroStreaming,
+    ReportarProgreso,
+    sin_progreso,
+)
 
 # Estados que cuentan como "trabajo terminado" (egreso / listo o ya entregado).
 ESTADOS_FINALIZADOS = ('finalizado', 'entregado')
@@ -43,6 +46,18 @@ _PAQUETES_MAP = dict(PAQUETES_CHOICES)
 
 TipoFlujoVM = Literal['upsell_oow', 'vm_pura_fl']
 
+# Filtros GET del dashboard → kwargs de generar_workbook_productividad_tecnicos.
+PARAMETROS_EXPORT = {
+    'fecha_inicio': 'fecha_inicio',
+    'fecha_fin': 'fecha_fin',
+    'sucursal': 'sucursal_id',
+    'tecnico': 'tecnico_id',
+    'gama': 'gama',
+}
+
+# Columnas con formato moneda en las hojas de detalle VM (1-based).
+_COLUMNAS_MONEDA_VM = (6, 8, 10, 12, 16)
+
 
 def _datos_cliente_equipo(orden: OrdenServicio) -> tuple[str, str]:
     """
@@ -565,47 +580,6 @@ def agregar_resumen_por_tecnico(
     return resultado
 
 
-def _estilos_excel() -> dict[str, Any]:
-    """Estilos reutilizables al estilo del export de aceptaciones."""
-    return {
-        'header_font': Font(bold=True, color='FFFFFF', size=11),
-        'header_fill': PatternFill(start_color='198754', end_color='198754', fill_type='solid'),
-        'header_align': Alignment(horizontal='center', vertical='center', wrap_text=True),
-        'title_font': Font(bold=True, size=14, color='FFFFFF'),
-        'title_fill': PatternFill(start_color='212529', end_color='212529', fill_type='solid'),
-        'title_align': Alignment(horizontal='center', vertical='center'),
-        'subtitle_font': Font(italic=True, size=10, color='666666'),
-        'border': Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin'),
-        ),
-        'number_fmt': '#,##0.00',
-    }
-
-
-def _aplicar_header(ws, fila: int, headers: list[str], estilos: dict[str, Any]) -> None:
-    """Escribe y estiliza la fila de encabezados."""
-    for col, texto in enumerate(headers, 1):
-        cell = ws.cell(row=fila, column=col, value=texto)
-        cell.font = estilos['header_font']
-        cell.fill = estilos['header_fill']
-        cell.alignment = estilos['header_align']
-        cell.border = estilos['border']
-
-
-def _auto_ajustar(ws, max_width: int = 45) -> None:
-    """Ajusta anchos de columna según contenido."""
-    for col in ws.columns:
-        max_len = 0
-        col_letter = get_column_letter(col[0].column)
-        for cell in col:
-            if cell.value is not None:
-                max_len = max(max_len, len(str(cell.value)))
-        ws.column_dimensions[col_letter].width = min(max_len + 3, max_width)
-
-
 def _fmt_fecha(valor: date | datetime | None) -> str:
     """Formato legible para celdas de fecha."""
     if valor is None:
@@ -622,33 +596,51 @@ def _si_no(valor: bool) -> str:
     return 'Sí' if valor else 'No'
 
 
+def _estilos_moneda(columnas: tuple[int, ...]) -> dict[int, str]:
+    """Named style por columna: moneda donde aplica (el resto usa 'celda')."""
+    return {col: 'celda_moneda' for col in columnas}
+
+
+def _cabecera_hoja(
+    libro: LibroStreaming,
+    nombre_hoja: str,
+    titulo: str,
+    subtitulos: list[str],
+    headers: list[str],
+):
+    """
+    Crea la hoja con título oscuro, subtítulos y encabezado verde.
+
+    Returns:
+        HojaStreaming lista para escribir filas de datos.
+    """
+    hoja = libro.hoja(nombre_hoja, ancho_max=45)
+    hoja.titulo_combinado(titulo, len(headers), estilo='titulo_oscuro')
+    for subtitulo in subtitulos:
+        hoja.titulo_combinado(subtitulo, len(headers), estilo='subtitulo')
+    hoja.fila_vacia()
+    hoja.fila(headers, estilo='encabezado_verde')
+    return hoja
+
+
 def _escribir_hoja_detalle_vm(
-    wb: Workbook,
+    libro: LibroStreaming,
     nombre_hoja: str,
     titulo: str,
     filas_vm: list[dict[str, Any]],
     filtros_texto: str,
-    estilos: dict[str, Any],
+    contador: ContadorProgreso,
 ) -> None:
     """
     Escribe una hoja de detalle VM (upsell OOW o VM pura FL).
 
     Args:
-        wb: Workbook destino.
+        libro: LibroStreaming destino.
         nombre_hoja / titulo: identificación de la hoja.
         filas_vm: datos ya filtrados por tipo de flujo.
-        filtros_texto / estilos: cabecera común.
+        filtros_texto: subtítulo común.
+        contador: progreso de la exportación.
     """
-    ws = wb.create_sheet(nombre_hoja)
-    ws.merge_cells('A1:P1')
-    ws['A1'] = titulo
-    ws['A1'].font = estilos['title_font']
-    ws['A1'].fill = estilos['title_fill']
-    ws['A1'].alignment = estilos['title_align']
-    ws.merge_cells('A2:P2')
-    ws['A2'] = filtros_texto
-    ws['A2'].font = estilos['subtitle_font']
-
     headers = [
         'Orden cliente',
         'Service Tag',
@@ -667,10 +659,10 @@ def _escribir_hoja_detalle_vm(
         'Piezas',
         'Total VM',
     ]
-    _aplicar_header(ws, 4, headers, estilos)
-    fila = 5
+    hoja = _cabecera_hoja(libro, nombre_hoja, titulo, [filtros_texto], headers)
+    estilos = _estilos_moneda(_COLUMNAS_MONEDA_VM)
     for row in filas_vm:
-        vals = [
+        hoja.fila([
             row['folio'],
             row['service_tag'],
             row['folio_vm'],
@@ -687,14 +679,8 @@ def _escribir_hoja_detalle_vm(
             _si_no(row['incluye_kit']),
             row['resumen_piezas'],
             float(row['total_vm']),
-        ]
-        for col, val in enumerate(vals, 1):
-            cell = ws.cell(row=fila, column=col, value=val)
-            cell.border = estilos['border']
-            if col in (6, 8, 10, 12, 16):
-                cell.number_format = estilos['number_fmt']
-        fila += 1
-    _auto_ajustar(ws)
+        ], estilo='celda', estilos=estilos)
+        contador.avanzar()
 
 
 def generar_workbook_productividad_tecnicos(
@@ -703,12 +689,21 @@ def generar_workbook_productividad_tecnicos(
     sucursal_id: int | str | None = None,
     tecnico_id: int | str | None = None,
     gama: str | None = None,
-) -> Workbook | None:
+    progreso: ReportarProgreso = sin_progreso,
+) -> LibroStreaming | None:
     """
     Arma el Excel de productividad con 5 hojas (OOW / upsell / FL / diagnósticos).
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+        Las filas se escriben con el motor write-only (estilos con nombre y
+        anchos calculados al vuelo), así que la memoria no crece con el Excel.
+
+    Args:
+        fecha_inicio / fecha_fin / sucursal_id / tecnico_id / gama: filtros.
+        progreso: callback ``(procesadas, total)`` (Celery); vacío en el request.
+
     Returns:
-        Workbook openpyxl, o None si no hay ninguna fila en las métricas.
+        LibroStreaming, o None si no hay ninguna fila en las métricas.
     """
     filtros = {
         'fecha_inicio': fecha_inicio,
@@ -729,10 +724,13 @@ def generar_workbook_productividad_tecnicos(
     resumen = agregar_resumen_por_tecnico(
         reparaciones, upsell_oow, vm_pura_fl, diagnosticos,
     )
-    estilos = _estilos_excel()
+    contador = ContadorProgreso(
+        len(resumen) + len(reparaciones) + len(upsell_oow)
+        + len(vm_pura_fl) + len(diagnosticos),
+        progreso,
+    )
 
-    wb = Workbook()
-    wb.remove(wb.active)
+    libro = LibroStreaming()
 
     filtros_texto = (
         f"Período: {fecha_inicio or 'Inicio'} - {fecha_fin or 'Actual'}"
@@ -775,32 +773,21 @@ def generar_workbook_productividad_tecnicos(
         'FL Oro',
         'FL Plata',
     ]
-    num_cols = len(headers1)
-    ultima = get_column_letter(num_cols)
-
-    ws1 = wb.create_sheet(HOJAS_EXCEL[0])
-    ws1.merge_cells(f'A1:{ultima}1')
-    ws1['A1'] = 'PRODUCTIVIDAD TÉCNICOS — RESUMEN (OOW vs FL)'
-    ws1['A1'].font = estilos['title_font']
-    ws1['A1'].fill = estilos['title_fill']
-    ws1['A1'].alignment = estilos['title_align']
-    ws1.merge_cells(f'A2:{ultima}2')
-    ws1['A2'] = filtros_texto
-    ws1['A2'].font = estilos['subtitle_font']
-    ws1['A2'].alignment = Alignment(horizontal='center')
-    ws1.merge_cells(f'A3:{ultima}3')
-    ws1['A3'] = (
-        f'Generado: {generado} | '
-        'OOW = diagnóstico/reparación; Upsell = VM adicional en OOW; '
-        'FL = venta mostrador sin diagnóstico'
+    hoja1 = _cabecera_hoja(
+        libro,
+        HOJAS_EXCEL[0],
+        'PRODUCTIVIDAD TÉCNICOS — RESUMEN (OOW vs FL)',
+        [
+            filtros_texto,
+            f'Generado: {generado} | '
+            'OOW = diagnóstico/reparación; Upsell = VM adicional en OOW; '
+            'FL = venta mostrador sin diagnóstico',
+        ],
+        headers1,
     )
-    ws1['A3'].font = estilos['subtitle_font']
-    ws1['A3'].alignment = Alignment(horizontal='center')
-
-    _aplicar_header(ws1, 5, headers1, estilos)
-    fila = 6
+    estilos1 = _estilos_moneda((7, 8, 9))
     for row in resumen:
-        vals = [
+        hoja1.fila([
             row['tecnico'],
             row['sucursales'],
             row['reparaciones_oow'],
@@ -826,28 +813,12 @@ def generar_workbook_productividad_tecnicos(
             row['fl_paquete_premium'],
             row['fl_paquete_oro'],
             row['fl_paquete_plata'],
-        ]
-        for col, val in enumerate(vals, 1):
-            cell = ws1.cell(row=fila, column=col, value=val)
-            cell.border = estilos['border']
-            if col in (7, 8, 9):
-                cell.number_format = estilos['number_fmt']
-        fila += 1
-    _auto_ajustar(ws1)
+        ], estilo='celda', estilos=estilos1)
+        contador.avanzar()
 
     # ------------------------------------------------------------------
     # HOJA 2: Detalle reparaciones OOW
     # ------------------------------------------------------------------
-    ws2 = wb.create_sheet(HOJAS_EXCEL[1])
-    ws2.merge_cells('A1:J1')
-    ws2['A1'] = 'DETALLE REPARACIONES OOW (diagnóstico + cot aceptada)'
-    ws2['A1'].font = estilos['title_font']
-    ws2['A1'].fill = estilos['title_fill']
-    ws2['A1'].alignment = estilos['title_align']
-    ws2.merge_cells('A2:J2')
-    ws2['A2'] = filtros_texto
-    ws2['A2'].font = estilos['subtitle_font']
-
     headers2 = [
         'Orden cliente',
         'Service Tag',
@@ -860,10 +831,16 @@ def generar_workbook_productividad_tecnicos(
         'Valor aceptado cot',
         'Folio VM',
     ]
-    _aplicar_header(ws2, 4, headers2, estilos)
-    fila = 5
+    hoja2 = _cabecera_hoja(
+        libro,
+        HOJAS_EXCEL[1],
+        'DETALLE REPARACIONES OOW (diagnóstico + cot aceptada)',
+        [filtros_texto],
+        headers2,
+    )
+    estilos2 = _estilos_moneda((9,))
     for row in reparaciones:
-        vals = [
+        hoja2.fila([
             row['folio'],
             row['service_tag'],
             row['tecnico'],
@@ -874,50 +851,32 @@ def generar_workbook_productividad_tecnicos(
             _si_no(row['tiene_upsell_vm']),
             float(row['valor_cot_aceptada']),
             row['folio_vm'],
-        ]
-        for col, val in enumerate(vals, 1):
-            cell = ws2.cell(row=fila, column=col, value=val)
-            cell.border = estilos['border']
-            if col == 9:
-                cell.number_format = estilos['number_fmt']
-        fila += 1
-    _auto_ajustar(ws2)
+        ], estilo='celda', estilos=estilos2)
+        contador.avanzar()
 
     # ------------------------------------------------------------------
     # HOJAS 3 y 4: Upsell OOW / VM pura FL
     # ------------------------------------------------------------------
     _escribir_hoja_detalle_vm(
-        wb,
+        libro,
         HOJAS_EXCEL[2],
         'DETALLE UPSELL OOW (adicionales sobre diagnóstico)',
         upsell_oow,
         filtros_texto,
-        estilos,
+        contador,
     )
     _escribir_hoja_detalle_vm(
-        wb,
+        libro,
         HOJAS_EXCEL[3],
         'DETALLE VM PURA FL (sin diagnóstico)',
         vm_pura_fl,
         filtros_texto,
-        estilos,
+        contador,
     )
 
     # ------------------------------------------------------------------
     # HOJA 5: Detalle diagnósticos
     # ------------------------------------------------------------------
-    ws5 = wb.create_sheet(HOJAS_EXCEL[4])
-    ws5.merge_cells('A1:G1')
-    ws5['A1'] = 'DETALLE DIAGNÓSTICOS'
-    ws5['A1'].font = estilos['title_font']
-    ws5['A1'].fill = estilos['title_fill']
-    ws5['A1'].alignment = estilos['title_align']
-    ws5.merge_cells('A2:G2')
-    ws5['A2'] = (
-        f'{filtros_texto} | Fecha: fin diagnóstico o, si falta, fecha de ingreso'
-    )
-    ws5['A2'].font = estilos['subtitle_font']
-
     headers5 = [
         'Orden cliente',
         'Service Tag',
@@ -927,10 +886,15 @@ def generar_workbook_productividad_tecnicos(
         'Longitud texto',
         'Extracto diagnóstico',
     ]
-    _aplicar_header(ws5, 4, headers5, estilos)
-    fila = 5
+    hoja5 = _cabecera_hoja(
+        libro,
+        HOJAS_EXCEL[4],
+        'DETALLE DIAGNÓSTICOS',
+        [f'{filtros_texto} | Fecha: fin diagnóstico o, si falta, fecha de ingreso'],
+        headers5,
+    )
     for row in diagnosticos:
-        vals = [
+        hoja5.fila([
             row['folio'],
             row['service_tag'],
             row['tecnico'],
@@ -938,11 +902,40 @@ def generar_workbook_productividad_tecnicos(
             _fmt_fecha(row['fecha_diagnostico']),
             row['longitud_texto'],
             row['extracto'],
-        ]
-        for col, val in enumerate(vals, 1):
-            cell = ws5.cell(row=fila, column=col, value=val)
-            cell.border = estilos['border']
-        fila += 1
-    _auto_ajustar(ws5)
-
-    return wb
+        ], estilo='celda')
+        contador.avanzar()
+
+    contador.terminar()
+    return libro
+
+
+def exportar_productividad_tecnicos(
+    parametros: dict[str, str],
+    progreso: ReportarProgreso = sin_progreso,
+) -> tuple[str, LibroStreaming] | None:
+    """
+    Punto de entrada para la exportación en segundo plano (Celery).
+
+    Args:
+        parametros: filtros GET del dashboard (fecha_inicio, fecha_fin,
+            sucursal, tecnico, gama).
+        progreso: callback ``(procesadas, total)``.
+
+    Returns:
+        (nombre_archivo, libro), o None si no hay datos.
+    """
+    kwargs = {
+        destino: parametros.get(origen) or None
+        for origen, destino in PARAMETROS_EXPORT.items()
+    }
+    libro = generar_workbook_productividad_tecnicos(**kwargs, progreso=progreso)
+    if libro is None:
+        return None
+    return nombre_archivo_productividad(), libro
+
+
+def nombre_archivo_productividad() -> str:
+    """Nombre de descarga: Productividad_Tecnicos_YYYYMMDD_HHMM.xlsx"""
+    return (
+        f"Productividad_Tecnicos_{timezone.localtime().strftime('%Y%m%d_%H%M')}.xlsx"
+    )
@@ -0,0 +1,305 @@
+"""
+Proyección de filas RHITSO compartida por el dashboard, los Excel y el embudo.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+El dashboard RHITSO, el Excel de candidatos, el Excel de análisis y el
+embudo de conversión necesitan casi los mismos datos de cada orden
+candidata. Antes cada uno recorría las órdenes por su cuenta: días hábiles
+contados día por día (dos o tres veces por orden), último comentario
+buscado en Python entre todos los seguimientos y un `.exists()` por cada
+estado histórico del embudo.
+
+Aquí se arma UNA lista de filas (dicts) por juego de filtros:
+
+1. Una sola consulta `.values()` con anotaciones en la BD: último
+   seguimiento manual (fecha y comentario), incidencias abiertas/resueltas
+   y un Exists() por cada estado del embudo.
+2. Los días hábiles de todas las filas se cuentan de una vez con numpy
+   (utils_rhitso.calcular_dias_habiles_lote).
+3. El resultado se guarda en caché por país + filtros + día. Cualquier
+   cambio en seguimientos, incidencias, catálogo de estados u órdenes
+   candidatas sube la versión del país (signals) y la siguiente lectura
+   vuelve a armar las filas.
+
+Efectos secundarios:
+- Lee/escribe el caché de Django (versión por país y filas por filtros).
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Subquery
+from django.utils import timezone
+from django.utils.encoding import force_str
+
+from config.agregados import Total
+from config.middleware_pais import alias_de_pais, get_current_db_alias
+
+from ..models import EstadoRHITSO, OrdenServicio, SeguimientoRHITSO
+from ..utils_rhitso import calcular_dias_habiles_lote, obtener_color_por_dias_rhitso
+from ..utils_rhitso_analytics import (
+    ESTADO_ACEPTA_COTIZ,
+    ESTADO_ACEPTA_ENVIO,
+    ESTADO_NO_APTO,
+    ESTADO_RECHAZA_COTIZ,
+    ESTADO_RECHAZA_ENVIO,
+    obtener_queryset_candidatos,
+)
+
+# Subir si cambia la forma de las filas (invalida cachés viejos)
+VERSION_CACHE_PROYECCION = 1
+
+PROYECCION_RHITSO_TTL = getattr(settings, 'CACHE_TTL_PROYECCION_RHITSO', 60 * 10)
+
+# Clasificación de pestañas del dashboard / hojas del Excel de candidatos
+ESTADOS_EXCLUIDOS = ('CERRADO', 'USUARIO NO ACEPTA ENVIO A RHITSO')
+ESTADOS_PENDIENTES = ('PENDIENTE DE CONFIRMAR ENVIO A RHITSO',)
+
+# Bandera de la fila → estado que la orden alcanzó alguna vez
+FLAGS_HISTORICOS = {
+    'acepto_envio': ESTADO_ACEPTA_ENVIO,
+    'rechazo_envio': ESTADO_RECHAZA_ENVIO,
+    'acepto_cotiz': ESTADO_ACEPTA_COTIZ,
+    'rechazo_cotiz': ESTADO_RECHAZA_COTIZ,
+    'no_apto': ESTADO_NO_APTO,
+}
+
+_INCIDENCIAS_ABIERTAS = Total('incidencias_rhitso', filtro=('estado', ('ABIERTA', 'EN_REVISION')))
+_INCIDENCIAS_RESUELTAS = Total('incidencias_rhitso', filtro=('estado', ('RESUELTA',)))
+
+_CAMPOS = (
+    'id',
+    'numero_orden_interno',
+    'fecha_ingreso',
+    'estado',
+    'estado_rhitso',
+    'fecha_envio_rhitso',
+    'fecha_recepcion_rhitso',
+    'sucursal__nombre',
+    'tecnico_asignado_actual__nombre_completo',
+    'detalle_equipo__pk',
+    'detalle_equipo__falla_principal',
+    'detalle_equipo__numero_serie',
+    'detalle_equipo__marca',
+    'detalle_equipo__modelo',
+    'detalle_equipo__orden_cliente',
+    'detalle_equipo__diagnostico_sic',
+)
+
+
+# ============================================================================
+# CACHÉ: versión por país + llave por filtros
+# ============================================================================
+
+def _clave_version(db_alias):
+    """Clave del contador de versión de un país ('default' cuenta como 'mexico')."""
+    return f'proyeccion_rhitso:version:{alias_de_pais(db_alias)}'
+
+
+def _version_actual(db_alias):
+    """
+    Versión vigente de las filas del país (se crea si no existe).
+
+    EXPLICACIÓN: se arranca con milisegundos del reloj (igual que
+    detalle_orden_cache) para no reutilizar filas viejas si Redis desaloja
+    el contador.
+    """
+    clave = _clave_version(db_alias)
+    version = cache.get(clave)
+    if version is None:
+        version = int(time.time() * 1000)
+        if not cache.add(clave, version, None):
+            version = cache.get(clave, version)
+    return version
+
+
+def invalidar_proyeccion_rhitso(db_alias='default'):
+    """
+    Sube la versión del país: las filas cacheadas quedan huérfanas.
+
+    Args:
+        db_alias (str): alias de BD del país donde se escribió.
+
+    Efectos secundarios:
+        incr (o set si el contador no existía) en la caché por defecto.
+    """
+    clave = _clave_version(db_alias)
+    try:
+        cache.incr(clave)
+    except ValueError:
+        cache.set(clave, int(time.time() * 1000), None)
+
+
+def _clave_cache(db_alias, fecha_inicio, fecha_fin, sucursal_id):
+    """
+    Llave de las filas: país, versión, filtros y día.
+
+    El día entra en la llave porque los días hábiles cambian a medianoche
+    aunque nadie toque las órdenes.
+    """
+    return (
+        f'proyeccion_rhitso:v{VERSION_CACHE_PROYECCION}:{db_alias}:'
+        f'{_version_actual(db_alias)}:{timezone.now():%Y%m%d}:'
+        f'{fecha_inicio or ""}:{fecha_fin or ""}:{sucursal_id or ""}'
+    )
+
+
+# ============================================================================
+# CONSTRUCCIÓN DE FILAS
+# ============================================================================
+
+def _queryset_proyeccion(fecha_inicio, fecha_fin, sucursal_id):
+    """
+    Candidatos con todo lo que necesita una fila, como dicts (.values()).
+
+    Returns:
+        QuerySet de dicts ordenado por ingreso descendente.
+    """
+    ultimo_manual = SeguimientoRHITSO.objects.filter(
+        orden=OuterRef('pk'),
+        es_cambio_automatico=False,
+    ).order_by('-fecha_actualizacion', '-pk')
+
+    historicos = {
+        f'hist_{flag}': Exists(SeguimientoRHITSO.objects.filter(
+            orden=OuterRef('pk'), estado__estado=nombre_estado,
+        ))
+        for flag, nombre_estado in FLAGS_HISTORICOS.items()
+    }
+
+    return obtener_queryset_candidatos(
+        fecha_inicio, fecha_fin, sucursal_id,
+    ).prefetch_related(None).annotate(
+        ultimo_comentario_fecha=Subquery(ultimo_manual.values('fecha_actualizacion')[:1]),
+        ultimo_comentario_texto=Subquery(ultimo_manual.values('observaciones')[:1]),
+        num_incidencias_abiertas=_INCIDENCIAS_ABIERTAS.subconsulta(OrdenServicio),
+        num_incidencias_resueltas=_INCIDENCIAS_RESUELTAS.subconsulta(OrdenServicio),
+        **historicos,
+    ).values(*_CAMPOS, 'ultimo_comentario_fecha', 'ultimo_comentario_texto',
+             'num_incidencias_abiertas', 'num_incidencias_resueltas', *historicos)
+
+
+def _categoria(estado_rhitso_nombre):
+    """Pestaña del dashboard / hoja del Excel donde va la orden."""
+    if estado_rhitso_nombre in ESTADOS_EXCLUIDOS:
+        return 'excluidos'
+    if estado_rhitso_nombre in ESTADOS_PENDIENTES:
+        return 'pendientes'
+    return 'activos'
+
+
+def _estado_proceso(fecha_envio, fecha_recepcion, ahora):
+    """
+    Misma regla que obtener_estado_proceso_rhitso sin instanciar la orden.
+
+    EXPLICACIÓN: OrdenServicio.dias_en_rhitso son días NATURALES completos
+    entre envío y recepción (o ahora); 0 cuenta como "Solo SIC".
+    """
+    if not fecha_envio or ((fecha_recepcion or ahora) - fecha_envio).days == 0:
+        return 'Solo SIC'
+    return 'Completado' if fecha_recepcion else 'En RHITSO'
+
+
+def construir_proyeccion_rhitso(fecha_inicio=None, fecha_fin=None, sucursal_id=None):
+    """
+    Arma las filas RHITSO sin caché (2 consultas: candidatos y owners).
+
+    Args:
+        fecha_inicio: Filtro opcional por fecha de ingreso (str, date o datetime).
+        fecha_fin: Filtro opcional por fecha de ingreso.
+        sucursal_id: Filtro opcional por sucursal.
+
+    Returns:
+        dict con:
+            'filas': list[dict], una por candidato, ordenadas por ingreso desc.
+            'generada': datetime en que se armaron.
+    """
+    ahora = timezone.now()
+    registros = list(_queryset_proyeccion(fecha_inicio, fecha_fin, sucursal_id))
+    owners = dict(EstadoRHITSO.objects.values_list('estado', 'owner'))
+    estados_orden = dict(OrdenServicio._meta.get_field('estado').flatchoices)
+
+    # Días hábiles de todas las filas en tres llamadas vectorizadas
+    dias_sic = calcular_dias_habiles_lote(
+        [r['fecha_ingreso'] for r in registros],
+        [r['fecha_recepcion_rhitso'] for r in registros],
+    )
+    dias_rhitso = calcular_dias_habiles_lote(
+        [r['fecha_envio_rhitso'] for r in registros],
+        [r['fecha_recepcion_rhitso'] for r in registros],
+    )
+    dias_sin_actualizar = calcular_dias_habiles_lote(
+        [r['ultimo_comentario_fecha'] or r['fecha_ingreso'] for r in registros],
+        [None] * len(registros),
+    )
+
+    filas = []
+    for indice, r in enumerate(registros):
+        tiene_detalle = r['detalle_equipo__pk'] is not None
+        estado_rhitso_nombre = r['estado_rhitso'] or 'Pendiente'
+        abiertas = r['num_incidencias_abiertas']
+        resueltas = r['num_incidencias_resueltas']
+        # Sin envío, calcular_dias_habiles_lote ya devuelve 0 días en RHITSO
+        dias_habiles_rhitso = dias_rhitso[indice]
+
+        fila = {
+            'id': r['id'],
+            'numero_orden_interno': r['numero_orden_interno'],
+            'fecha_ingreso': r['fecha_ingreso'],
+            'estado_orden': force_str(estados_orden.get(r['estado'], r['estado'])),
+            'servicio': r['detalle_equipo__falla_principal'] if tiene_detalle else 'Sin observaciones',
+            'numero_serie': r['detalle_equipo__numero_serie'] if tiene_detalle else 'N/A',
+            'marca': r['detalle_equipo__marca'] if tiene_detalle else 'N/A',
+            'modelo': r['detalle_equipo__modelo'] if tiene_detalle else 'N/A',
+            'orden_cliente': r['detalle_equipo__orden_cliente'] if tiene_detalle else 'N/A',
+            'tiene_detalle': tiene_detalle,
+            'diagnostico_sic': r['detalle_equipo__diagnostico_sic'],
+            'tiene_diagnostico': bool(tiene_detalle and r['detalle_equipo__diagnostico_sic']),
+            'sucursal': r['sucursal__nombre'] or 'N/A',
+            'tecnico_asignado': r['tecnico_asignado_actual__nombre_completo'] or 'Sin asignar',
+            'estado_rhitso_nombre': estado_rhitso_nombre,
+            'estado_rhitso_display': estado_rhitso_nombre,
+            'owner_actual': owners.get(estado_rhitso_nombre, ''),
+            'incidencias_abiertas': abiertas,
+            'incidencias_resueltas': resueltas,
+            'total_incidencias': abiertas + resueltas,
+            'fecha_envio_rhitso': r['fecha_envio_rhitso'],
+            'fecha_recepcion_rhitso': r['fecha_recepcion_rhitso'],
+            'dias_habiles_sic': dias_sic[indice],
+            'dias_habiles_rhitso': dias_habiles_rhitso,
+            'dias_sin_actualizar': dias_sin_actualizar[indice],
+            'fecha_ultimo_comentario': r['ultimo_comentario_fecha'],
+            'ultimo_comentario': r['ultimo_comentario_texto'] or '',
+            'estado_proceso': _estado_proceso(
+                r['fecha_envio_rhitso'], r['fecha_recepcion_rhitso'], ahora,
+            ),
+            'color_badge_dias': obtener_color_por_dias_rhitso(dias_habiles_rhitso),
+            'categoria': _categoria(estado_rhitso_nombre),
+        }
+        fila.update({flag: r[f'hist_{flag}'] for flag in FLAGS_HISTORICOS})
+        filas.append(fila)
+
+    return {'filas': filas, 'generada': ahora}
+
+
+def obtener_proyeccion_rhitso(fecha_inicio=None, fecha_fin=None, sucursal_id=None):
+    """
+    Filas RHITSO del país actual, desde caché si ya se armaron con estos filtros.
+
+    Args:
+        fecha_inicio: Filtro opcional por fecha de ingreso.
+        fecha_fin: Filtro opcional por fecha de ingreso.
+        sucursal_id: Filtro opcional por sucursal.
+
+    Returns:
+        dict de construir_proyeccion_rhitso(). Las filas son compartidas:
+        quien las use NO debe modificarlas.
+    """
+    clave = _clave_cache(get_current_db_alias(), fecha_inicio, fecha_fin, sucursal_id)
+    proyeccion = cache.get(clave)
+    if proyeccion is None:
+        proyeccion = construir_proyeccion_rhitso(fecha_inicio, fecha_fin, sucursal_id)
+        cache.set(clave, proyeccion, PROYECCION_RHITSO_TTL)
+    return proyeccion
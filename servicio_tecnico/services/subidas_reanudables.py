@@ -0,0 +1,299 @@
+"""
+Subidas reanudables por bloques (videos de evidencia).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+Subir un video de 90 MB en UN solo request tiene dos problemas:
+  1) Django lo recibe completo antes de que la vista lo vea (memoria y
+     disco temporal), y luego la vista lo vuelve a copiar a video_tmp/.
+  2) Si el Wi-Fi del taller se corta al 80 %, hay que empezar de cero.
+
+Protocolo (parecido a tus.io, basado en desplazamiento u "offset"):
+  1. POST  crear  → el servidor reserva un id y un archivo .part vacío.
+  2. PATCH bloque → header Upload-Offset = bytes que el cliente cree que ya
+                    están arriba. Si coincide con el tamaño del .part, el
+                    cuerpo se AGREGA al final leyéndolo en trozos de 64 KB
+                    (la memoria no depende del tamaño del video).
+  3. Si la conexión se cae, HEAD/GET devuelve el offset real y el cliente
+     sigue desde ahí (aunque el bloque haya quedado a medias).
+  4. Con el último byte el .part se MUEVE (mismo disco: no se copia) a la
+     ruta que recibe comprimir_video_evidencia_task; la tarea verifica el
+     SHA-256 que el cliente declaró al crear (hasta 95 MB: no se calcula
+     en el request).
+
+Un reintento del cliente puede llegar mientras el PATCH anterior (que el
+navegador ya dio por perdido) sigue escribiendo. Por eso el chequeo de
+offset, el append y el movimiento final se hacen con un flock exclusivo
+sobre el .part: el segundo request no espera, recibe SubidaOcupada (423).
+
+Cada subida son dos archivos en SUBIDAS_REANUDABLES_DIR:
+    <id>.json  → metadatos (orden, usuario, país, tipo, tamaño, sha256...)
+    <id>.part  → bytes recibidos hasta ahora
+Las subidas abandonadas las borra la tarea limpiar_subidas_temporales.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Lectura del cuerpo del request y del archivo al calcular el SHA-256
+TAMANO_LECTURA = 64 * 1024
+
+_ID_VALIDO = re.compile(r'^[0-9a-f]{32}$')
+
+
+class SubidaNoEncontrada(Exception):
+    """El id no existe (nunca se creó, ya se completó o venció)."""
+
+
+class OffsetInvalido(Exception):
+    """
+    El cliente mandó un bloque desde un offset que no es el del servidor.
+
+    Attributes:
+        offset (int): bytes que realmente tiene el servidor.
+    """
+
+    def __init__(self, offset):
+        super().__init__(f'El servidor tiene {offset} bytes')
+        self.offset = offset
+
+
+class SubidaOcupada(Exception):
+    """Otro request de la misma subida está escribiendo (el cliente reintenta)."""
+
+
+def directorio_subidas():
+    """Carpeta de las subidas en curso: SUBIDAS_REANUDABLES_DIR o MEDIA_ROOT/video_tmp/subidas."""
+    return Path(
+        getattr(settings, 'SUBIDAS_REANUDABLES_DIR', '')
+        or os.path.join(settings.MEDIA_ROOT, 'video_tmp', 'subidas')
+    )
+
+
+def _rutas(subida_id):
+    if not _ID_VALIDO.match(subida_id or ''):
+        raise SubidaNoEncontrada(subida_id)
+    base = directorio_subidas()
+    return base / f'{subida_id}.json', base / f'{subida_id}.part'
+
+
+@contextmanager
+def _bloqueo_part(ruta_part):
+    """
+    Abre el .part para agregar y toma su flock exclusivo sin esperar.
+
+    Yields:
+        int: descriptor abierto en O_APPEND (se cierra, y se suelta el
+        bloqueo, al salir).
+
+    Raises:
+        SubidaNoEncontrada: el .part ya no existe (completada o cancelada).
+        SubidaOcupada: otro request tiene el bloqueo.
+    """
+    try:
+        descriptor = os.open(ruta_part, os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        raise SubidaNoEncontrada(ruta_part.stem)
+    try:
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise SubidaOcupada(ruta_part.stem)
+        # Entre abrir y bloquear, otro request pudo completarla (os.replace):
+        # el descriptor seguiría apuntando al archivo ya movido
+        try:
+            vigente = os.stat(ruta_part).st_ino == os.fstat(descriptor).st_ino
+        except FileNotFoundError:
+            vigente = False
+        if not vigente:
+            raise SubidaNoEncontrada(ruta_part.stem)
+        yield descriptor
+    finally:
+        os.close(descriptor)
+
+
+def crear_subida(metadatos):
+    """
+    Reserva una subida nueva.
+
+    Args:
+        metadatos (dict): datos ya validados; debe incluir 'tamano' (int),
+            'sha256' (hex) y 'nombre'. Se guardan tal cual y se devuelven
+            al completar (orden_id, usuario_id, db_alias, tipo, ...).
+
+    Returns:
+        str: id de la subida (32 caracteres hex).
+    """
+    subida_id = uuid.uuid4().hex
+    ruta_meta, ruta_part = _rutas(subida_id)
+    ruta_meta.parent.mkdir(parents=True, exist_ok=True)
+    ruta_part.touch()
+    ruta_meta.write_text(json.dumps({**metadatos, 'creada_en': time.time()}), encoding='utf-8')
+    return subida_id
+
+
+def leer_subida(subida_id):
+    """
+    Metadatos de una subida con su offset actual.
+
+    Returns:
+        dict: metadatos guardados + 'id' y 'offset' (bytes recibidos).
+
+    Raises:
+        SubidaNoEncontrada
+    """
+    ruta_meta, ruta_part = _rutas(subida_id)
+    try:
+        metadatos = json.loads(ruta_meta.read_text(encoding='utf-8'))
+        offset = ruta_part.stat().st_size
+    except (OSError, ValueError):
+        raise SubidaNoEncontrada(subida_id)
+    return {**metadatos, 'id': subida_id, 'offset': offset}
+
+
+def agregar_bloque(subida_id, offset, flujo, longitud):
+    """
+    Agrega al .part los bytes de `flujo` (el cuerpo del request).
+
+    Lee en trozos de TAMANO_LECTURA: si la conexión se corta a la mitad, lo
+    que alcanzó a llegar queda escrito y el cliente retoma desde ahí. El
+    offset se compara con el tamaño del .part ya con el bloqueo tomado.
+
+    Args:
+        offset (int): Upload-Offset que mandó el cliente.
+        flujo: objeto con .read(n) (request de Django).
+        longitud (int): bytes del cuerpo (Content-Length).
+
+    Returns:
+        int: nuevo offset.
+
+    Raises:
+        SubidaNoEncontrada, OffsetInvalido, SubidaOcupada,
+        ValueError: si el bloque se pasa del tamaño declarado.
+    """
+    subida = leer_subida(subida_id)
+    if offset + longitud > subida['tamano']:
+        raise ValueError(
+            f'El bloque termina en el byte {offset + longitud} y el archivo declarado '
+            f'mide {subida["tamano"]}'
+        )
+
+    _ruta_meta, ruta_part = _rutas(subida_id)
+    with _bloqueo_part(ruta_part) as descriptor:
+        recibidos = os.fstat(descriptor).st_size
+        if offset != recibidos:
+            raise OffsetInvalido(recibidos)
+        pendientes = longitud
+        with os.fdopen(descriptor, 'ab', closefd=False) as destino:
+            while pendientes > 0:
+                trozo = flujo.read(min(TAMANO_LECTURA, pendientes))
+                if not trozo:
+                    break
+                destino.write(trozo)
+                pendientes -= len(trozo)
+    return offset + longitud - pendientes
+
+
+def sha256_archivo(ruta):
+    """SHA-256 (hex) de un archivo leyéndolo por trozos."""
+    huella = hashlib.sha256()
+    with open(ruta, 'rb') as archivo:
+        for trozo in iter(lambda: archivo.read(TAMANO_LECTURA), b''):
+            huella.update(trozo)
+    return huella.hexdigest()
+
+
+def completar_subida(subida_id, destino):
+    """
+    Mueve el archivo completo a `destino` (con el bloqueo del .part).
+
+    El SHA-256 NO se verifica aquí: leer 95 MB ocuparía el request. Quien
+    procesa el archivo lo compara con subida['sha256'] (verificar_sha256).
+
+    Args:
+        destino (str|Path): ruta final (en el mismo disco: os.replace no copia).
+
+    Returns:
+        dict: metadatos de la subida (como leer_subida).
+
+    Raises:
+        SubidaNoEncontrada, SubidaOcupada,
+        ValueError: si faltan bytes.
+    """
+    subida = leer_subida(subida_id)
+    ruta_meta, ruta_part = _rutas(subida_id)
+    with _bloqueo_part(ruta_part) as descriptor:
+        recibidos = os.fstat(descriptor).st_size
+        if recibidos != subida['tamano']:
+            raise ValueError(f'Faltan {subida["tamano"] - recibidos} bytes')
+        Path(destino).parent.mkdir(parents=True, exist_ok=True)
+        os.replace(ruta_part, destino)
+        ruta_meta.unlink(missing_ok=True)
+    return {**subida, 'offset': recibidos}
+
+
+def verificar_sha256(ruta, esperado):
+    """
+    Compara el SHA-256 de un archivo con el que declaró el cliente.
+
+    Raises:
+        ValueError: si no coincide (los bytes están mal y reanudar no lo
+        arreglaría: hay que volver a subirlo).
+    """
+    if sha256_archivo(ruta) != esperado.lower():
+        raise ValueError('El archivo llegó dañado (SHA-256 distinto). Vuelve a subirlo.')
+
+
+def cancelar_subida(subida_id):
+    """Borra los archivos de una subida (no falla si ya no existen)."""
+    for ruta in _rutas(subida_id):
+        ruta.unlink(missing_ok=True)
+
+
+def _borrar_viejos(carpeta, limite, patron='*'):
+    """Borra los archivos de `carpeta` (sin recursión) modificados antes de `limite`."""
+    borrados = 0
+    if not carpeta or not Path(carpeta).is_dir():
+        return borrados
+    for ruta in Path(carpeta).glob(patron):
+        try:
+            if ruta.is_file() and ruta.stat().st_mtime < limite:
+                ruta.unlink()
+                borrados += 1
+        except OSError as exc:
+            logger.warning('[SUBIDAS] No se pudo borrar %s: %s', ruta, exc)
+    return borrados
+
+
+def limpiar_subidas_vencidas(horas=None):
+    """
+    Borra lo que quedó a medias en disco hace más de `horas`.
+
+    - Subidas reanudables abandonadas (.part / .json sin tocar).
+    - Videos crudos de video_tmp/ cuya tarea de compresión nunca corrió.
+    - Temporales de Django en FILE_UPLOAD_TEMP_DIR (lo que hacía
+      scripts/mantenimiento/limpiar_uploads_temp.sh por cron).
+
+    Returns:
+        dict: archivos borrados por carpeta.
+    """
+    horas = getattr(settings, 'SUBIDAS_EXPIRACION_HORAS', 24) if horas is None else horas
+    limite = time.time() - horas * 3600
+    return {
+        'subidas': _borrar_viejos(directorio_subidas(), limite),
+        'video_tmp': _borrar_viejos(
+            os.path.join(settings.MEDIA_ROOT, 'video_tmp'), limite, 'sigmavideo_*',
+        ),
+        'upload_temp': _borrar_viejos(getattr(settings, 'FILE_UPLOAD_TEMP_DIR', None), limite),
+    }
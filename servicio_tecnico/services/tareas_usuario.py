@@ -0,0 +1,44 @@
+"""
+Dueño de una tarea Celery encolada desde una vista (para el polling).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+    AsyncResult(task_id) devuelve el estado y el resultado de CUALQUIER
+    tarea: quien conozca el task_id vería el avance o el resultado ajeno
+    (enlaces de descarga, folios de clientes…). Al encolar guardamos en
+    caché quién la pidió; la vista de estado responde 404 si el usuario que
+    pregunta no es ese.
+
+    La caché vive lo mismo que los resultados de Celery
+    (CELERY_RESULT_EXPIRES): después de eso ya no hay nada que consultar.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _clave(task_id: str) -> str:
+    return f'tarea_usuario:{task_id}'
+
+
+def registrar_tarea_de_usuario(task_id: str, usuario_id: int) -> None:
+    """
+    Guarda quién encoló la tarea.
+
+    Args:
+        task_id: id devuelto por .delay().
+        usuario_id: pk del usuario que la pidió.
+    """
+    cache.set(_clave(task_id), usuario_id, getattr(settings, 'CELERY_RESULT_EXPIRES', 60 * 60 * 24))
+
+
+def tarea_es_del_usuario(task_id: str, usuario_id: int) -> bool:
+    """
+    ¿La tarea la encoló este usuario?
+
+    Returns:
+        bool: False también si no hay registro (task_id inventado, vencido o
+        caché caída): en la duda no se muestra nada.
+    """
+    return cache.get(_clave(task_id)) == usuario_id
@@ -23,22 +23,51 @@ def determinar_categoria_venta(venta_mostrador):
         'categoria': str (ej: "Paquete Premium", "Piezas (3 unidades)")
         'icono': str (emoji para visual)
     """
-    # EXPLICACIÓN PARA PRINCIPIANTES:
-    # Estamos dentro de services/, no junto a views.py.
-    # Por eso NO usamos "from .models" (buscaría services/models.py).
-    # Usamos el import absoluto, igual que historial.py y multimedia.py.
-    from servicio_tecnico.models import VentaMostrador
-    
-    # OPCIÓN 1: Si hay paquete (premium/oro/plata)
+    # Solo se cuentan las piezas si no hay paquete (igual que antes: el
+    # paquete decide sin consultar piezas)
     if venta_mostrador.paquete != 'ninguno':
-        paquete_nombre = venta_mostrador.paquete.capitalize()
+        cantidad_piezas = 0
+    else:
+        cantidad_piezas = venta_mostrador.piezas_vendidas.count()
+
+    return categoria_venta_desde_valores(
+        paquete=venta_mostrador.paquete,
+        cantidad_piezas=cantidad_piezas,
+        incluye_cambio_pieza=venta_mostrador.incluye_cambio_pieza,
+        incluye_limpieza=venta_mostrador.incluye_limpieza,
+        incluye_kit_limpieza=venta_mostrador.incluye_kit_limpieza,
+        incluye_reinstalacion_so=venta_mostrador.incluye_reinstalacion_so,
+    )
+
+
+def categoria_venta_desde_valores(paquete, cantidad_piezas, incluye_cambio_pieza,
+                                  incluye_limpieza, incluye_kit_limpieza,
+                                  incluye_reinstalacion_so):
+    """
+    Misma regla que determinar_categoria_venta, a partir de valores sueltos.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El dashboard OOW/FL carga las ventas con .values() (dicts, no
+    instancias) y ya trae contadas las piezas de cada venta; así clasifica
+    sin una consulta por venta.
+
+    PARÁMETROS:
+    - paquete: código del paquete ('ninguno', 'premium', ...)
+    - cantidad_piezas: número de PiezaVentaMostrador de la venta
+    - incluye_*: banderas de servicios adicionales
+
+    RETORNA:
+    dict con keys 'categoria' e 'icono'
+    """
+    # OPCIÓN 1: Si hay paquete (premium/oro/plata)
+    if paquete != 'ninguno':
+        paquete_nombre = paquete.capitalize()
         return {
             'categoria': f'Paquete {paquete_nombre}',
             'icono': '📦'
         }
     
     # OPCIÓN 2: Si hay piezas individuales vendidas
-    cantidad_piezas = venta_mostrador.piezas_vendidas.count()
     if cantidad_piezas > 0:
         plural = "unidad" if cantidad_piezas == 1 else "unidades"
         return {
@@ -47,25 +76,25 @@ def determinar_categoria_venta(venta_mostrador):
         }
     
     # OPCIÓN 3: Si hay servicios adicionales
-    if venta_mostrador.incluye_cambio_pieza:
+    if incluye_cambio_pieza:
         return {
             'categoria': 'Cambio de Pieza',
             'icono': '🔧'
         }
     
-    if venta_mostrador.incluye_limpieza:
+    if incluye_limpieza:
         return {
             'categoria': 'Limpieza & Mantenimiento',
             'icono': '🧹'
         }
     
-    if venta_mostrador.incluye_kit_limpieza:
+    if incluye_kit_limpieza:
         return {
             'categoria': 'Kit Limpieza',
             'icono': '🧽'
         }
     
-    if venta_mostrador.incluye_reinstalacion_so:
+    if incluye_reinstalacion_so:
         return {
             'categoria': 'Reinstalación SO',
             'icono': '💾'
@@ -556,6 +556,32 @@ def _normalizar_registro_garantia(item: dict[str, Any]) -> OrdenGarantiaSicser:
     )
 
 
+def descargar_registros_crudos(origen: str) -> list[dict[str, Any]]:
+    """
+    Descarga el listado completo (todos los países) de una API de SICSER.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Lo usa la sincronización del espejo local (sicser_espejo.py): una sola
+    descarga alimenta a todos los países, sin caché ni normalización aquí.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+
+    Returns:
+        list[dict]: Registros crudos tal como los envía SICSER.
+
+    Raises:
+        SicserAPIError: Si el origen es inválido o la API falla.
+    """
+    if origen == 'oow':
+        payload = _http_get_json(SICSER_API_OOW_URL, SICSER_TOKEN_OOW)
+    elif origen == 'garantia':
+        payload = _http_get_json(SICSER_API_GARANTIAS_URL, SICSER_TOKEN_GARANTIAS)
+    else:
+        raise SicserAPIError(f'Origen SICSER desconocido: {origen}')
+    return list(payload.get('data') or [])
+
+
 def fetch_listado_oow(
     codigo_pais: str,
     texto_busqueda: str = '',
@@ -0,0 +1,494 @@
+"""
+Espejo local de SICSER: sincronización incremental y consulta indexada.
+
+Objetivo de negocio:
+    «Consultar SICSER» dejaba de responder rápido porque cada request
+    descargaba el listado completo (todos los países), normalizaba cada
+    registro, filtraba en Python y además recorría DetalleEquipo para saber
+    qué ya se importó. Ahora Celery Beat mantiene la tabla OrdenSicserEspejo
+    en la BD de cada país y la pantalla solo hace consultas paginadas.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+    - sincronizar_origen() recibe el listado crudo y SOLO escribe lo que
+      cambió: filas nuevas (bulk_create), filas cuya huella SHA-1 cambió
+      (bulk_update) y filas que desaparecieron de SICSER (vigente=False).
+    - El flag ya_importada se recalcula para las filas nuevas o cambiadas
+      de esa sincronización (una consulta a DetalleEquipo por lote), y
+      realinear_flags_importacion() corrige en cada corrida de Beat las
+      filas que quedaron desalineadas sin cambiar en SICSER (orden borrada,
+      orden creada por otro camino).
+    - El filtro «Buscar» usa índices: un folio / service tag exacto va
+      directo; si no, folio / service tag por prefijo, id_externo exacto y
+      texto_busqueda (índice trigram en PostgreSQL, migración 0070) se
+      combinan con OR para no perder coincidencias a mitad del texto.
+    - importar_orden_*_desde_sicser marca la fila al momento (no espera a Beat).
+
+Efectos secundarios:
+    Llamadas HTTP a SICSER (solo en sincronizar_*) y escrituras en
+    OrdenSicserEspejo de la BD indicada por db_alias.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from . import sicser_client
+from .models import DetalleEquipo, OrdenSicserEspejo
+
+logger = logging.getLogger(__name__)
+
+ORIGENES_SICSER = ('oow', 'garantia')
+
+# Filas por página en las pestañas OOW / Garantía.
+SICSER_FILAS_POR_PAGINA = 50
+
+# Tamaño de lote para bulk_create / bulk_update (evita sentencias enormes).
+TAMANO_LOTE_ESPEJO = 500
+
+# Un identificador es una sola palabra con al menos un dígito (ST12, 123456,
+# MX_CIS_MX_DROPOFF_00001); los nombres de cliente no suelen llevar dígitos.
+_RE_IDENTIFICADOR = re.compile(r'^(?=[^\s]*\d)[\w\-/.]+$')
+
+
+def _huella_registro(item: dict[str, Any]) -> str:
+    """SHA-1 estable del registro crudo (claves ordenadas) para detectar cambios."""
+    crudo = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(crudo.encode('utf-8')).hexdigest()
+
+
+def _id_externo_crudo(origen: str, item: dict[str, Any]) -> str:
+    """id_orden (OOW) o numero_dps (garantía) como cadena; '' si no viene."""
+    clave = 'id_orden' if origen == 'oow' else 'numero_dps'
+    valor = str(item.get(clave) or '').strip()
+    return '' if valor in ('', '0') else valor
+
+
+def _codigo_pais_crudo(origen: str, item: dict[str, Any]) -> str:
+    """País del registro sin normalizarlo completo (prefijo de folio o campo pais)."""
+    if origen == 'oow':
+        return sicser_client.parsear_codigo_pais_desde_folio_oow(str(item.get('folio') or ''))
+    return sicser_client.parsear_codigo_pais_garantia(str(item.get('pais') or ''))
+
+
+def _columnas_desde_crudo(origen: str, item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Calcula las columnas normalizadas e indexables de una fila del espejo.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        item: Registro crudo de SICSER.
+
+    Returns:
+        dict: Valores para los campos de OrdenSicserEspejo (sin identidad).
+    """
+    from .sicser_import import parsear_fecha_sicser
+
+    if origen == 'oow':
+        registro = sicser_client._normalizar_registro_oow(item)
+        folio = registro.folio
+        nombre = registro.nombre_cliente
+        fecha = registro.fecha
+        buscables = (
+            registro.folio,
+            registro.service_tag,
+            registro.nombre_cliente,
+            registro.marca,
+            registro.preview_orden_sigma,
+        )
+    else:
+        registro = sicser_client._normalizar_registro_garantia(item)
+        folio = str(registro.numero_dps)
+        nombre = registro.contacto or registro.empresa
+        fecha = registro.fecha_recepcion
+        buscables = (
+            str(registro.numero_dps),
+            registro.service_tag,
+            registro.contacto,
+            registro.empresa,
+            registro.especificaciones,
+            registro.ciudad,
+            registro.estado,
+            registro.cis_etiqueta,
+        )
+
+    return {
+        'codigo_pais': registro.codigo_pais[:2],
+        'folio': folio[:80].upper(),
+        'service_tag': registro.service_tag[:50].upper(),
+        'nombre_cliente': (nombre or '')[:200],
+        'codigo_cis_url': registro.codigo_cis_url[:10],
+        'fecha_sicser': parsear_fecha_sicser(fecha),
+        'texto_busqueda': ' '.join(str(v or '') for v in buscables).lower(),
+        'datos': item,
+        'huella': _huella_registro(item),
+    }
+
+
+CAMPOS_ACTUALIZABLES = (
+    'codigo_pais',
+    'folio',
+    'service_tag',
+    'nombre_cliente',
+    'codigo_cis_url',
+    'fecha_sicser',
+    'texto_busqueda',
+    'datos',
+    'huella',
+    'vigente',
+    'fecha_sincronizacion',
+)
+
+
+def _clave_ultima_sincronizacion(origen: str, codigo_pais: str) -> str:
+    """Clave de caché con la hora de la última sincronización exitosa."""
+    return f'sicser:espejo:{codigo_pais.upper()}:{origen}'
+
+
+def ultima_sincronizacion(origen: str, codigo_pais: str):
+    """datetime de la última sincronización del espejo (None si no hay registro)."""
+    return cache.get(_clave_ultima_sincronizacion(origen, codigo_pais))
+
+
+def _refrescar_flags_importacion(origen: str, db_alias: str, ids_externos) -> int:
+    """
+    Alinea ya_importada/orden de las filas indicadas con DetalleEquipo.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Solo se revisan las filas que la sincronización acaba de crear o
+    actualizar (las demás ya estaban alineadas: la importación marca su fila
+    al momento con marcar_importada_en_espejo). Se consulta por lotes de
+    TAMANO_LOTE_ESPEJO ids para no armar un IN gigante.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        db_alias: BD del país.
+        ids_externos: id_externo de las filas tocadas por la sincronización.
+
+    Returns:
+        int: Filas del espejo corregidas.
+    """
+    ids_externos = list(ids_externos)
+    por_corregir = []
+    for inicio in range(0, len(ids_externos), TAMANO_LOTE_ESPEJO):
+        lote = ids_externos[inicio:inicio + TAMANO_LOTE_ESPEJO]
+        importadas = dict(
+            DetalleEquipo.objects.using(db_alias)
+            .filter(sicser_origen=origen, sicser_id_externo__in=lote)
+            .values_list('sicser_id_externo', 'orden_id')
+        )
+        espejo = OrdenSicserEspejo.objects.using(db_alias).filter(origen=origen, id_externo__in=lote)
+        for fila in espejo.only('pk', 'id_externo', 'ya_importada', 'orden_id'):
+            orden_id = importadas.get(fila.id_externo)
+            if fila.ya_importada != bool(orden_id) or fila.orden_id != orden_id:
+                fila.ya_importada = bool(orden_id)
+                fila.orden_id = orden_id
+                por_corregir.append(fila)
+
+    if por_corregir:
+        OrdenSicserEspejo.objects.using(db_alias).bulk_update(
+            por_corregir,
+            ['ya_importada', 'orden'],
+            batch_size=TAMANO_LOTE_ESPEJO,
+        )
+    return len(por_corregir)
+
+
+def realinear_flags_importacion(origen: str, db_alias: str) -> int:
+    """
+    Corrige ya_importada/orden en filas que la sincronización no tocó.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    _refrescar_flags_importacion solo mira lo que cambió en SICSER. Dos
+    casos quedan fuera y se arreglan aquí con dos consultas baratas:
+      - Huérfanas: ya_importada=True pero orden=NULL (la orden SIGMA se
+        borró y el FK quedó en SET_NULL). Deben volver a «nuevas».
+      - Pendientes que SÍ tienen DetalleEquipo (la orden se creó por otro
+        camino). Se buscan desde DetalleEquipo con un IN sobre subconsulta,
+        así solo se traen los ids que de verdad hay que marcar.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        db_alias: BD del país.
+
+    Returns:
+        int: Filas del espejo corregidas.
+    """
+    espejo = OrdenSicserEspejo.objects.using(db_alias).filter(origen=origen)
+    huerfanas = espejo.filter(ya_importada=True, orden__isnull=True).values_list('id_externo', flat=True)
+    sin_marcar = (
+        DetalleEquipo.objects.using(db_alias)
+        .filter(
+            sicser_origen=origen,
+            sicser_id_externo__in=espejo.filter(ya_importada=False).values('id_externo'),
+        )
+        .values_list('sicser_id_externo', flat=True)
+    )
+    ids_externos = {*huerfanas, *sin_marcar}
+    if not ids_externos:
+        return 0
+    return _refrescar_flags_importacion(origen, db_alias, ids_externos)
+
+
+def sincronizar_origen(
+    origen: str,
+    registros: list[dict[str, Any]],
+    codigo_pais: str,
+    db_alias: str = 'default',
+) -> dict[str, int]:
+    """
+    Aplica un listado crudo de SICSER al espejo de un país (incremental).
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        registros: Listado crudo completo (todos los países).
+        codigo_pais: Código ISO del país cuyo espejo se actualiza.
+        db_alias: Alias de la BD de ese país.
+
+    Returns:
+        dict: Conteos nuevas / actualizadas / retiradas / sin_cambios / flags.
+    """
+    codigo = codigo_pais.upper()
+    ahora = timezone.now()
+
+    # Paso 1: quedarnos con los registros del país, indexados por id externo.
+    entrantes: dict[str, dict[str, Any]] = {}
+    for item in registros:
+        id_externo = _id_externo_crudo(origen, item)
+        if id_externo and _codigo_pais_crudo(origen, item) == codigo:
+            entrantes[id_externo] = item
+
+    manager = OrdenSicserEspejo.objects.using(db_alias)
+
+    # Paso 2: huellas actuales del espejo en UNA consulta.
+    existentes = {
+        id_externo: (pk, huella, vigente)
+        for pk, id_externo, huella, vigente in manager.filter(
+            origen=origen,
+            codigo_pais=codigo,
+        ).values_list('pk', 'id_externo', 'huella', 'vigente')
+    }
+
+    nuevas: list[OrdenSicserEspejo] = []
+    cambiadas: list[OrdenSicserEspejo] = []
+    sin_cambios = 0
+    for id_externo, item in entrantes.items():
+        previo = existentes.get(id_externo)
+        if previo and previo[1] == _huella_registro(item) and previo[2]:
+            sin_cambios += 1
+            continue
+        columnas = _columnas_desde_crudo(origen, item)
+        columnas['codigo_pais'] = codigo
+        if previo:
+            cambiadas.append(OrdenSicserEspejo(
+                pk=previo[0],
+                origen=origen,
+                id_externo=id_externo,
+                vigente=True,
+                fecha_sincronizacion=ahora,
+                **columnas,
+            ))
+        else:
+            nuevas.append(OrdenSicserEspejo(
+                origen=origen,
+                id_externo=id_externo,
+                vigente=True,
+                fecha_sincronizacion=ahora,
+                **columnas,
+            ))
+
+    retiradas_ids = [
+        pk for id_externo, (pk, _huella, vigente) in existentes.items()
+        if vigente and id_externo not in entrantes
+    ]
+
+    with transaction.atomic(using=db_alias):
+        if nuevas:
+            manager.bulk_create(nuevas, batch_size=TAMANO_LOTE_ESPEJO)
+        if cambiadas:
+            manager.bulk_update(cambiadas, CAMPOS_ACTUALIZABLES, batch_size=TAMANO_LOTE_ESPEJO)
+        retiradas = 0
+        if retiradas_ids:
+            retiradas = manager.filter(pk__in=retiradas_ids).update(
+                vigente=False,
+                fecha_sincronizacion=ahora,
+            )
+        flags = _refrescar_flags_importacion(
+            origen,
+            db_alias,
+            [fila.id_externo for fila in nuevas + cambiadas],
+        )
+
+    # La hora de la última sincronización va a caché: filas sin cambios no se tocan.
+    cache.set(_clave_ultima_sincronizacion(origen, codigo), ahora, None)
+
+    resumen = {
+        'nuevas': len(nuevas),
+        'actualizadas': len(cambiadas),
+        'retiradas': retiradas,
+        'sin_cambios': sin_cambios,
+        'flags_importacion': flags,
+    }
+    logger.info('Espejo SICSER %s [%s/%s]: %s', origen, codigo, db_alias, resumen)
+    return resumen
+
+
+def sincronizar_pais(
+    codigo_pais: str,
+    db_alias: str = 'default',
+    origenes: tuple[str, ...] = ORIGENES_SICSER,
+) -> tuple[dict[str, dict[str, int]], dict[str, str]]:
+    """
+    Descarga y sincroniza en línea los orígenes indicados para un solo país.
+
+    Lo usa la pantalla con «Actualizar desde SICSER» (refrescar=1) y el
+    primer acceso de un país cuyo espejo aún está vacío.
+
+    Returns:
+        tuple: (resúmenes por origen, errores por origen).
+    """
+    resumenes: dict[str, dict[str, int]] = {}
+    errores: dict[str, str] = {}
+    for origen in origenes:
+        try:
+            registros = sicser_client.descargar_registros_crudos(origen)
+        except sicser_client.SicserAPIError as exc:
+            errores[origen] = str(exc)
+            logger.warning('Error sincronizando espejo SICSER %s: %s', origen, exc)
+            continue
+        resumenes[origen] = sincronizar_origen(origen, registros, codigo_pais, db_alias)
+    return resumenes, errores
+
+
+def marcar_importada_en_espejo(origen: str, id_externo: str, orden) -> None:
+    """
+    Marca la fila del espejo como importada justo después de crear la orden.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        id_externo: id_orden o numero_dps.
+        orden: OrdenServicio recién creada.
+    """
+    OrdenSicserEspejo.objects.using(orden._state.db or 'default').filter(
+        origen=origen,
+        id_externo=str(id_externo),
+    ).update(ya_importada=True, orden=orden)
+
+
+def resumen_espejo(codigo_pais: str) -> dict[str, Any]:
+    """
+    Totales de las pestañas (badges) en UNA consulta agregada.
+
+    Returns:
+        dict: total_oow, nuevas_oow, total_garantia, nuevas_garantia y
+        filas_oow / filas_garantia (0 = el espejo nunca se ha llenado).
+    """
+    return OrdenSicserEspejo.objects.filter(codigo_pais=codigo_pais.upper()).aggregate(
+        total_oow=Count('pk', filter=Q(origen='oow', vigente=True)),
+        nuevas_oow=Count('pk', filter=Q(origen='oow', vigente=True, ya_importada=False)),
+        total_garantia=Count('pk', filter=Q(origen='garantia', vigente=True)),
+        nuevas_garantia=Count(
+            'pk', filter=Q(origen='garantia', vigente=True, ya_importada=False),
+        ),
+        filas_oow=Count('pk', filter=Q(origen='oow')),
+        filas_garantia=Count('pk', filter=Q(origen='garantia')),
+    )
+
+
+def queryset_listado_espejo(origen: str, codigo_pais: str, texto_busqueda: str = ''):
+    """
+    QuerySet paginable de la pestaña OOW / Garantía (más recientes primero).
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        codigo_pais: Código ISO del tenant.
+        texto_busqueda: Filtro opcional (folio, service tag, cliente, DPS…).
+
+    Returns:
+        QuerySet[OrdenSicserEspejo]
+    """
+    queryset = (
+        OrdenSicserEspejo.objects
+        .filter(origen=origen, codigo_pais=codigo_pais.upper(), vigente=True)
+        .select_related('orden__detalle_equipo')
+        .order_by(F('fecha_sicser').desc(nulls_last=True), '-pk')
+    )
+    filtro = (texto_busqueda or '').strip()
+    if not filtro:
+        return queryset
+
+    # Texto libre (cliente, ciudad…): índice trigram en PostgreSQL
+    por_texto = Q(texto_busqueda__contains=filtro.lower())
+    if not _RE_IDENTIFICADOR.match(filtro):
+        return queryset.filter(por_texto)
+
+    # Folio / service tag exacto: es lo que se escanea o pega; va directo
+    clave = filtro.upper()
+    exactas = queryset.filter(Q(folio=clave) | Q(service_tag=clave))
+    if exactas.exists():
+        return exactas
+    # Parece identificador pero no es exacto: prefijo sobre columnas
+    # indexadas MÁS el texto (un DPS o teléfono a mitad del texto también
+    # cuenta, como en la búsqueda de siempre)
+    return queryset.filter(
+        Q(id_externo=filtro) | Q(folio__startswith=clave) | Q(service_tag__startswith=clave) | por_texto
+    )
+
+
+def filas_para_template(pagina) -> list[dict[str, Any]]:
+    """
+    Convierte una página del espejo a las filas {'registro', 'sigma'} del template.
+
+    Args:
+        pagina: Iterable de OrdenSicserEspejo (ya con select_related).
+
+    Returns:
+        list[dict]: Misma forma que usaba la vista con el listado en vivo.
+    """
+    filas = []
+    for fila in pagina:
+        sigma = None
+        if fila.ya_importada and fila.orden_id:
+            detalle = getattr(fila.orden, 'detalle_equipo', None)
+            sigma = {
+                'orden_id': fila.orden_id,
+                'numero_orden_interno': fila.orden.numero_orden_interno,
+                'orden_cliente': detalle.orden_cliente if detalle else '',
+            }
+        filas.append({'registro': fila.a_registro(), 'sigma': sigma})
+    return filas
+
+
+def buscar_registro(origen: str, id_externo: int, codigo_pais: str):
+    """
+    Busca un registro para importar: primero en el espejo, luego en vivo.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        id_externo: id_orden o numero_dps.
+        codigo_pais: Código ISO del tenant activo.
+
+    Returns:
+        OrdenOOWSicser | OrdenGarantiaSicser | None
+    """
+    fila = (
+        OrdenSicserEspejo.objects
+        .filter(origen=origen, id_externo=str(id_externo), codigo_pais=codigo_pais.upper())
+        .only('origen', 'datos')
+        .first()
+    )
+    if fila:
+        return fila.a_registro()
+
+    # Registro recién creado en SICSER que Beat aún no trae: consulta en vivo.
+    if origen == 'oow':
+        return sicser_client.buscar_registro_oow_por_id(int(id_externo), codigo_pais)
+    return sicser_client.buscar_registro_garantia_por_dps(int(id_externo), codigo_pais)
@@ -19,14 +19,17 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, router, transaction
+from django.db.models import Q
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 from config.constants import MARCAS_EQUIPOS_CHOICES, TIPO_EQUIPO_CHOICES
 from inventario.models import Empleado, Sucursal
 
-from .models import DetalleEquipo, OrdenServicio, ReferenciaGamaEquipo
-from .sicser_client import OrdenGarantiaSicser, OrdenOOWSicser
+from .models import DetalleEquipo, OrdenServicio, OrdenSicserEspejo, ReferenciaGamaEquipo
+from .sicser_client import OrdenGarantiaSicser, OrdenOOWSicser, SicserAPIError
+from .sicser_espejo import buscar_registro, marcar_importada_en_espejo
 
 logger = logging.getLogger(__name__)
 
@@ -144,12 +147,24 @@ def resolver_sucursal_por_cis(codigo_cis_url: str, sucursal_id: int | None = Non
         except Sucursal.DoesNotExist as exc:
             raise SicserImportError('La sucursal seleccionada no es válida o está inactiva.') from exc
 
-    keywords = CIS_SUCURSAL_KEYWORDS.get(codigo_cis_url.upper(), [])
-    sucursales = list(Sucursal.objects.filter(activa=True).order_by('nombre'))
+    return _elegir_sucursal(
+        list(Sucursal.objects.filter(activa=True).order_by('nombre')),
+        codigo_cis_url,
+    )
+
 
+def _elegir_sucursal(sucursales: list[Sucursal], codigo_cis_url: str) -> Sucursal:
+    """
+    Elige entre sucursales activas ya cargadas (la importación por lote las
+    carga una sola vez y llama esto por cada registro).
+
+    Raises:
+        SicserImportError: Si la lista está vacía.
+    """
     if not sucursales:
         raise SicserImportError('No hay sucursales activas en SIGMA. Configure al menos una sucursal.')
 
+    keywords = CIS_SUCURSAL_KEYWORDS.get((codigo_cis_url or '').upper(), [])
     if keywords:
         for sucursal in sucursales:
             nombre = sucursal.nombre.lower()
@@ -448,6 +463,118 @@ def _calcular_gama(marca: str, modelo: str) -> str:
     return 'media'
 
 
+def _claves_registro(origen: str, registro) -> tuple[str, str]:
+    """
+    Identificadores con los que se detectan duplicados en SIGMA.
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        registro: OrdenOOWSicser u OrdenGarantiaSicser.
+
+    Returns:
+        tuple: (id_externo, orden_cliente). OOW usa OOW-{dígitos}; garantía
+        usa el DPS en ambos.
+    """
+    if origen == 'oow':
+        return str(registro.id_orden), registro.preview_orden_sigma
+    return str(registro.numero_dps), str(registro.numero_dps)
+
+
+def _marca_modelo(origen: str, registro) -> tuple[str, str]:
+    """Marca y modelo ya normalizados (los mismos que se guardan y dan la gama)."""
+    if origen == 'oow':
+        return normalizar_marca_oow(registro.marca), (registro.modelo or '')[:100]
+    # Garantías: siempre Dell; el modelo viene en especificaciones.
+    return 'Dell', (registro.especificaciones or 'Latitude')[:100]
+
+
+def _armar_orden(
+    origen: str,
+    registro,
+    sucursal: Sucursal,
+    tecnico: Empleado,
+    gama: str,
+) -> tuple[OrdenServicio, DetalleEquipo]:
+    """
+    Construye (sin guardar) la orden y su detalle a partir del registro SICSER.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    La importación individual y la de lote guardan exactamente lo mismo;
+    solo cambia de dónde salen sucursal, técnico y gama (consulta por
+    orden vs. búsquedas en memoria armadas una vez).
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        registro: OrdenOOWSicser u OrdenGarantiaSicser.
+        sucursal: Sucursal ya resuelta.
+        tecnico: Empleado ya resuelto.
+        gama: 'alta', 'media' o 'baja'.
+
+    Returns:
+        tuple: (OrdenServicio, DetalleEquipo) listos para save() en ese orden.
+    """
+    id_externo, orden_cliente = _claves_registro(origen, registro)
+    marca, modelo = _marca_modelo(origen, registro)
+    cliente_upper = orden_cliente.upper()
+
+    orden = OrdenServicio(
+        sucursal=sucursal,
+        tecnico_asignado_actual=tecnico,
+        tipo_servicio='diagnostico',
+        estado='espera',
+        # Mismo valor que DetalleEquipo.save() sincronizaría: así no hace
+        # un segundo UPDATE de la orden justo después de crearla.
+        es_fuera_garantia=cliente_upper.startswith('OOW-') or cliente_upper.startswith('FL-'),
+    )
+    fecha_ingreso = parsear_fecha_sicser(
+        registro.fecha if origen == 'oow' else registro.fecha_recepcion
+    )
+    if fecha_ingreso:
+        orden.fecha_ingreso = fecha_ingreso
+
+    comunes = dict(
+        orden=orden,
+        marca=marca,
+        modelo=modelo,
+        numero_serie=registro.service_tag.upper(),
+        orden_cliente=orden_cliente,
+        sicser_id_externo=id_externo,
+        sicser_origen=origen,
+        sicser_cis=registro.codigo_cis_url or '',
+        # Momento real del click «Importar» en SIGMA (no la fecha SICSER).
+        fecha_importacion_sicser=timezone.now(),
+        gama=gama,
+        equipo_enciende=True,
+    )
+    if origen == 'oow':
+        detalle = DetalleEquipo(
+            **comunes,
+            tipo_equipo=normalizar_tipo_equipo(registro.tipo_equipo),
+            folio_sicser=registro.folio,
+            email_cliente=registro.email or 'cliente@ejemplo.com',
+            nombre_cliente=registro.nombre_cliente[:200],
+            rfc_cliente=registro.rfc[:13],
+            telefono_cliente=registro.telefono[:20],
+            falla_principal=(registro.descripcion_falla or 'Importada desde SICSER OOW')[:4000],
+            es_mis=False,
+        )
+    else:
+        detalle = DetalleEquipo(
+            **comunes,
+            tipo_equipo='Laptop',
+            folio_sicser=id_externo,
+            sicser_ciudad=(registro.ciudad or '')[:100],
+            sicser_estado=(registro.estado or '')[:100],
+            email_cliente=registro.email_contacto or 'cliente@ejemplo.com',
+            nombre_cliente=(registro.contacto or registro.empresa or '')[:200],
+            telefono_cliente=(registro.telefono or '')[:20],
+            direccion_cliente=(registro.direccion or '')[:300],
+            falla_principal=extraer_falla_garantia(registro.instrucciones_dell),
+            es_mis=es_mis_desde_grupo(registro.nombre_grupo),
+        )
+    return orden, detalle
+
+
 @transaction.atomic
 def importar_orden_oow_desde_sicser(
     registro: OrdenOOWSicser,
@@ -468,14 +595,13 @@ def importar_orden_oow_desde_sicser(
     Raises:
         SicserImportError: Si ya existe o faltan datos obligatorios.
     """
-    id_externo = str(registro.id_orden)
+    id_externo, orden_cliente = _claves_registro('oow', registro)
     existente = buscar_orden_importada('oow', id_externo)
     if existente:
         raise SicserImportError(
             f'Esta orden SICSER ya está en SIGMA como {existente.numero_orden_interno}.'
         )
 
-    orden_cliente = registro.preview_orden_sigma
     # EXPLICACIÓN PARA PRINCIPIANTES:
     # orden_cliente debe ser único en SIGMA. Si ya hay una fila con el mismo
     # número, no creamos otra: avisamos con el folio interno para que el
@@ -497,46 +623,12 @@ def importar_orden_oow_desde_sicser(
 
     sucursal = resolver_sucursal_por_cis(registro.codigo_cis_url, sucursal_id)
     tecnico = resolver_tecnico(usuario)
-    marca = normalizar_marca_oow(registro.marca)
-    tipo_equipo = normalizar_tipo_equipo(registro.tipo_equipo)
-    modelo = (registro.modelo or '')[:100]
-    email = registro.email or 'cliente@ejemplo.com'
-
-    orden = OrdenServicio(
-        sucursal=sucursal,
-        tecnico_asignado_actual=tecnico,
-        tipo_servicio='diagnostico',
-        estado='espera',
+    orden, detalle = _armar_orden(
+        'oow', registro, sucursal, tecnico, _calcular_gama(*_marca_modelo('oow', registro)),
     )
-    fecha_ingreso = parsear_fecha_sicser(registro.fecha)
-    if fecha_ingreso:
-        orden.fecha_ingreso = fecha_ingreso
-
     orden.save()
-
-    detalle = DetalleEquipo(
-        orden=orden,
-        tipo_equipo=tipo_equipo,
-        marca=marca,
-        modelo=modelo,
-        numero_serie=registro.service_tag.upper(),
-        orden_cliente=orden_cliente,
-        folio_sicser=registro.folio,
-        sicser_id_externo=id_externo,
-        sicser_origen='oow',
-        sicser_cis=registro.codigo_cis_url or '',
-        # Momento real del click «Importar» en SIGMA (no la fecha SICSER).
-        fecha_importacion_sicser=timezone.now(),
-        email_cliente=email,
-        nombre_cliente=registro.nombre_cliente[:200],
-        rfc_cliente=registro.rfc[:13],
-        telefono_cliente=registro.telefono[:20],
-        falla_principal=(registro.descripcion_falla or 'Importada desde SICSER OOW')[:4000],
-        gama=_calcular_gama(marca, modelo),
-        equipo_enciende=True,
-        es_mis=False,
-    )
     detalle.save()
+    marcar_importada_en_espejo('oow', id_externo, orden)
 
     orden.refresh_from_db(fields=['es_fuera_garantia', 'numero_orden_interno'])
 
@@ -577,14 +669,13 @@ def importar_orden_garantia_desde_sicser(
     Raises:
         SicserImportError: Si ya existe o faltan datos obligatorios.
     """
-    id_externo = str(registro.numero_dps)
+    id_externo, orden_cliente = _claves_registro('garantia', registro)
     existente = buscar_orden_importada('garantia', id_externo)
     if existente:
         raise SicserImportError(
             f'Esta garantía SICSER ya está en SIGMA como {existente.numero_orden_interno}.'
         )
 
-    orden_cliente = id_externo
     # EXPLICACIÓN PARA PRINCIPIANTES:
     # En garantías Dell el número de cliente SIGMA es el DPS. Si ya existe,
     # no duplicamos: el mensaje incluye el folio interno para localizarla.
@@ -606,47 +697,13 @@ def importar_orden_garantia_desde_sicser(
     # Garantías Dell: CIS inferido desde ciudad/estado (la API no envía CIS explícito).
     sucursal = resolver_sucursal_por_cis(registro.codigo_cis_url or 'SAT', sucursal_id)
     tecnico = resolver_tecnico(usuario)
-    modelo = (registro.especificaciones or 'Latitude')[:100]
-    email = registro.email_contacto or 'cliente@ejemplo.com'
-    nombre_cliente = (registro.contacto or registro.empresa or '')[:200]
-
-    orden = OrdenServicio(
-        sucursal=sucursal,
-        tecnico_asignado_actual=tecnico,
-        tipo_servicio='diagnostico',
-        estado='espera',
+    orden, detalle = _armar_orden(
+        'garantia', registro, sucursal, tecnico,
+        _calcular_gama(*_marca_modelo('garantia', registro)),
     )
-    fecha_ingreso = parsear_fecha_sicser(registro.fecha_recepcion)
-    if fecha_ingreso:
-        orden.fecha_ingreso = fecha_ingreso
-
     orden.save()
-
-    detalle = DetalleEquipo(
-        orden=orden,
-        tipo_equipo='Laptop',
-        marca='Dell',
-        modelo=modelo,
-        numero_serie=registro.service_tag.upper(),
-        orden_cliente=orden_cliente,
-        folio_sicser=id_externo,
-        sicser_id_externo=id_externo,
-        sicser_origen='garantia',
-        sicser_ciudad=(registro.ciudad or '')[:100],
-        sicser_estado=(registro.estado or '')[:100],
-        sicser_cis=registro.codigo_cis_url or '',
-        # Momento real del click «Importar» en SIGMA (no la fecha SICSER).
-        fecha_importacion_sicser=timezone.now(),
-        email_cliente=email,
-        nombre_cliente=nombre_cliente,
-        telefono_cliente=(registro.telefono or '')[:20],
-        direccion_cliente=(registro.direccion or '')[:300],
-        falla_principal=extraer_falla_garantia(registro.instrucciones_dell),
-        gama=_calcular_gama('Dell', modelo),
-        equipo_enciende=True,
-        es_mis=es_mis_desde_grupo(registro.nombre_grupo),
-    )
     detalle.save()
+    marcar_importada_en_espejo('garantia', id_externo, orden)
 
     orden.refresh_from_db(fields=['es_fuera_garantia', 'numero_orden_interno'])
 
@@ -664,3 +721,310 @@ def importar_orden_garantia_desde_sicser(
             f'(garantía Dell) desde SICSER.'
         ),
     )
+
+
+# ============================================================================
+# IMPORTACIÓN POR LOTE (Celery: importar_ordenes_sicser_lote_task)
+# ============================================================================
+# EXPLICACIÓN PARA PRINCIPIANTES:
+# Importar el backlog de la mañana (80 OOW) con el botón por fila eran 80
+# viajes por la UI, y cada uno volvía a cargar sucursales, técnico, gama y
+# buscar duplicados. Aquí todo eso se resuelve UNA vez para la lista:
+#   1. Registros del espejo: 1 consulta (por id o por folio).
+#   2. Duplicados en SIGMA: 1 consulta (id externo o número de cliente).
+#   3. Sucursales, técnico y gama: búsquedas en memoria.
+#   4. Guardado por bloques de TAMANO_LOTE_IMPORTACION en una transacción,
+#      con los folios ORD- del bloque reservados antes con un solo UPDATE.
+
+# Órdenes por transacción. Si el worker muere a la mitad, lo ya guardado
+# queda y una segunda corrida lo reporta como duplicado.
+TAMANO_LOTE_IMPORTACION = 20
+
+# Tope por corrida (una mañana de backlog cabe de sobra).
+MAX_IDENTIFICADORES_LOTE = 300
+
+FILA_CREADA = 'creada'
+FILA_DUPLICADA = 'duplicada'
+FILA_ERROR = 'error'
+
+
+def parsear_identificadores_sicser(texto: str) -> list[str]:
+    """
+    Separa lo que el usuario pegó (líneas, comas, espacios o ;) sin repetidos.
+
+    Args:
+        texto: Folios SICSER o ids externos (id_orden / DPS).
+
+    Returns:
+        list[str]: Identificadores en el orden en que llegaron.
+    """
+    identificadores: list[str] = []
+    for parte in re.split(r'[\s,;]+', texto or ''):
+        if parte and parte not in identificadores:
+            identificadores.append(parte)
+    return identificadores
+
+
+@dataclass
+class _FilaLote:
+    """Estado de un identificador durante la importación por lote."""
+
+    identificador: str
+    registro: object = None
+    espejo: object = None
+    id_externo: str = ''
+    orden_cliente: str = ''
+    estado: str = ''
+    mensaje: str = ''
+    orden: OrdenServicio | None = None
+    detalle: DetalleEquipo | None = None
+
+    def como_dict(self) -> dict:
+        """Fila serializable para el resultado de Celery y el template."""
+        creada = self.estado == FILA_CREADA
+        return {
+            'identificador': self.identificador,
+            'id_externo': self.id_externo,
+            'orden_cliente': self.orden_cliente,
+            'estado': self.estado,
+            'mensaje': self.mensaje,
+            'orden_id': self.orden.pk if creada else None,
+            'numero_orden_interno': self.orden.numero_orden_interno if creada else '',
+        }
+
+
+def _cargar_registros_lote(origen: str, filas: list[_FilaLote], codigo_pais: str) -> None:
+    """
+    Completa registro/espejo de cada fila: 1 consulta al espejo local.
+
+    Lo que Beat aún no trae al espejo se busca en vivo (igual que la
+    importación individual), solo si el identificador es numérico.
+    """
+    identificadores = [fila.identificador for fila in filas]
+    numericos = [i for i in identificadores if i.isdigit()]
+    # El espejo guarda folio en mayúsculas (columna indexada)
+    folios = [i.upper() for i in identificadores]
+
+    por_clave = {}
+    espejos = OrdenSicserEspejo.objects.filter(
+        Q(id_externo__in=numericos) | Q(folio__in=folios),
+        origen=origen,
+        codigo_pais=codigo_pais.upper(),
+    )
+    for espejo in espejos:
+        por_clave[espejo.id_externo] = espejo
+        if espejo.folio:
+            por_clave[espejo.folio.upper()] = espejo
+
+    for fila in filas:
+        fila.espejo = por_clave.get(fila.identificador) or por_clave.get(fila.identificador.upper())
+        if fila.espejo is not None:
+            fila.registro = fila.espejo.a_registro()
+            continue
+        if not fila.identificador.isdigit():
+            fila.estado = FILA_ERROR
+            fila.mensaje = 'No está en el listado SICSER del país. Actualice el listado e intente de nuevo.'
+            continue
+        try:
+            fila.registro = buscar_registro(origen, int(fila.identificador), codigo_pais)
+        except SicserAPIError as exc:
+            fila.estado = FILA_ERROR
+            fila.mensaje = f'SICSER no respondió: {exc}'
+            continue
+        if fila.registro is None:
+            fila.estado = FILA_ERROR
+            fila.mensaje = 'No se encontró en SICSER.'
+
+
+def _marcar_duplicados_lote(origen: str, filas: list[_FilaLote]) -> None:
+    """
+    Marca las filas que ya existen en SIGMA: 1 consulta a DetalleEquipo.
+
+    Mismas dos reglas que la importación individual: mismo registro SICSER
+    (origen + id externo) o mismo número de cliente (sin distinguir mayúsculas).
+    También marca las repetidas dentro de la lista (p. ej. id y folio del
+    mismo registro).
+    """
+    por_id: dict[str, str] = {}
+    por_cliente: dict[str, tuple[str, str]] = {}
+    existentes = (
+        DetalleEquipo.objects
+        .annotate(cliente_mayus=Upper('orden_cliente'))
+        .filter(
+            Q(sicser_origen=origen, sicser_id_externo__in=[f.id_externo for f in filas])
+            | Q(cliente_mayus__in=[f.orden_cliente.upper() for f in filas])
+        )
+        .values_list('sicser_origen', 'sicser_id_externo', 'cliente_mayus', 'orden_cliente',
+                     'orden__numero_orden_interno')
+    )
+    for origen_bd, id_externo, cliente_mayus, orden_cliente, folio in existentes:
+        if origen_bd == origen and id_externo:
+            por_id[id_externo] = folio
+        por_cliente[cliente_mayus] = (orden_cliente, folio)
+
+    vistos: set[str] = set()
+    for fila in filas:
+        if fila.id_externo in por_id:
+            fila.estado = FILA_DUPLICADA
+            fila.mensaje = f'Ya está en SIGMA como {por_id[fila.id_externo]}.'
+        elif fila.orden_cliente.upper() in por_cliente:
+            orden_cliente, folio = por_cliente[fila.orden_cliente.upper()]
+            fila.estado = FILA_DUPLICADA
+            fila.mensaje = f'Ya existe una orden con número de cliente "{orden_cliente}" ({folio}).'
+        elif fila.id_externo in vistos:
+            fila.estado = FILA_DUPLICADA
+            fila.mensaje = 'Repetida en la lista.'
+        vistos.add(fila.id_externo)
+
+
+def _guardar_bloque(origen: str, bloque: list[_FilaLote], db_alias: str) -> None:
+    """
+    Guarda un bloque de órdenes en una transacción con folios reservados juntos.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Los folios se reservan ANTES, en su propia transacción corta: dentro del
+    bloque el candado de la fila de ContadorFolio duraría los 20 guardados
+    (con sus signals) y frenaría cualquier otra orden nueva del país. Si el
+    bloque se cae después, esos folios quedan como hueco (igual que cuando
+    falla una orden creada a mano).
+
+    Cada orden va en su propio savepoint: si una falla (p. ej. otra persona
+    la importó desde la UI un segundo antes y choca con la restricción
+    única), solo esa fila queda en error y su folio se salta. Nunca se
+    repite un folio.
+    """
+
+    espejos = []
+    folios = OrdenServicio.reservar_folios(len(bloque), db_alias)
+    with transaction.atomic(using=db_alias):
+        for fila, folio in zip(bloque, folios):
+            fila.orden.numero_orden_interno = folio
+            try:
+                with transaction.atomic(using=db_alias):
+                    fila.orden.save()
+                    fila.detalle.save()
+            except IntegrityError:
+                fila.estado = FILA_DUPLICADA
+                fila.mensaje = 'Otra importación la creó al mismo tiempo.'
+                continue
+            except Exception as exc:
+                logger.exception('Lote SICSER: error guardando %s %s', origen, fila.id_externo)
+                fila.estado = FILA_ERROR
+                fila.mensaje = str(exc)[:200]
+                continue
+
+            fila.estado = FILA_CREADA
+            fila.mensaje = f'Orden {folio} creada con número de cliente {fila.orden_cliente}.'
+            if fila.espejo is not None:
+                fila.espejo.ya_importada = True
+                fila.espejo.orden = fila.orden
+                espejos.append(fila.espejo)
+            else:
+                marcar_importada_en_espejo(origen, fila.id_externo, fila.orden)
+
+        if espejos:
+            OrdenSicserEspejo.objects.using(db_alias).bulk_update(espejos, ['ya_importada', 'orden'])
+
+
+def importar_ordenes_sicser_en_lote(
+    origen: str,
+    identificadores: list[str],
+    usuario,
+    codigo_pais: str,
+    sucursal_id: int | None = None,
+    progreso=None,
+) -> list[dict]:
+    """
+    Importa muchos registros SICSER (folios o ids externos) de una vez.
+
+    Objetivo de negocio:
+        Que la recepción importe el backlog de la mañana con un solo envío
+        y vea el resultado de cada folio (creada, ya existía o error).
+
+    Args:
+        origen: 'oow' o 'garantia'.
+        identificadores: Folios SICSER o id_orden / DPS (ver
+            parsear_identificadores_sicser).
+        usuario: Usuario que ejecuta la importación (define el técnico).
+        codigo_pais: Código ISO del país activo (filtra el espejo).
+        sucursal_id: Sucursal forzada; None = automática por CIS.
+        progreso: callable(procesadas, total) opcional (Celery update_state).
+
+    Returns:
+        list[dict]: Una fila por identificador, en el orden recibido
+        (ver _FilaLote.como_dict).
+
+    Raises:
+        SicserImportError: Lista vacía o demasiado larga, origen inválido,
+            sin sucursales activas o sin técnico disponible.
+
+    Efectos secundarios:
+        Crea OrdenServicio + DetalleEquipo (con historial y signals, igual
+        que la importación individual) y marca el espejo como importado.
+    """
+    if origen not in ('oow', 'garantia'):
+        raise SicserImportError('Tipo de importación SICSER inválido.')
+    if not identificadores:
+        raise SicserImportError('No se indicó ningún folio para importar.')
+    if len(identificadores) > MAX_IDENTIFICADORES_LOTE:
+        raise SicserImportError(
+            f'Máximo {MAX_IDENTIFICADORES_LOTE} folios por importación '
+            f'(se recibieron {len(identificadores)}).'
+        )
+
+    filas = [_FilaLote(identificador=identificador) for identificador in identificadores]
+    total = len(filas)
+
+    # Paso 1: registros SICSER (espejo local; en vivo solo lo que falte).
+    _cargar_registros_lote(origen, filas, codigo_pais)
+    candidatas = [fila for fila in filas if not fila.estado]
+    for fila in candidatas:
+        fila.id_externo, fila.orden_cliente = _claves_registro(origen, fila.registro)
+
+    # Paso 2: duplicados contra SIGMA y dentro de la lista.
+    if candidatas:
+        _marcar_duplicados_lote(origen, candidatas)
+    candidatas = [fila for fila in candidatas if not fila.estado]
+    for fila in candidatas:
+        if not fila.registro.service_tag:
+            fila.estado = FILA_ERROR
+            fila.mensaje = 'El registro SICSER no trae service tag; no se puede importar.'
+    candidatas = [fila for fila in candidatas if not fila.estado]
+
+    # Paso 3: sucursal, técnico y gama resueltos una vez (búsquedas en memoria).
+    if candidatas:
+        tecnico = resolver_tecnico(usuario)
+        if sucursal_id:
+            sucursal_fija = resolver_sucursal_por_cis('', sucursal_id)
+        else:
+            sucursal_fija = None
+            sucursales = list(Sucursal.objects.filter(activa=True).order_by('nombre'))
+        referencias = ReferenciaGamaEquipo.obtener_gamas(
+            [_marca_modelo(origen, fila.registro) for fila in candidatas]
+        )
+        for fila, referencia in zip(candidatas, referencias):
+            codigo_cis = fila.registro.codigo_cis_url or ('SAT' if origen == 'garantia' else '')
+            sucursal = sucursal_fija or _elegir_sucursal(sucursales, codigo_cis)
+            fila.orden, fila.detalle = _armar_orden(
+                origen, fila.registro, sucursal, tecnico,
+                referencia.gama if referencia else 'media',
+            )
+
+    # Paso 4: guardar por bloques reportando avance.
+    db_alias = router.db_for_write(OrdenServicio)
+    procesadas = total - len(candidatas)
+    if progreso:
+        progreso(procesadas, total)
+    for inicio in range(0, len(candidatas), TAMANO_LOTE_IMPORTACION):
+        bloque = candidatas[inicio:inicio + TAMANO_LOTE_IMPORTACION]
+        _guardar_bloque(origen, bloque, db_alias)
+        procesadas += len(bloque)
+        if progreso:
+            progreso(procesadas, total)
+
+    creadas = sum(1 for fila in filas if fila.estado == FILA_CREADA)
+    logger.info(
+        'Lote SICSER %s: %s de %s órdenes creadas (usuario=%s)',
+        origen, creadas, total, getattr(usuario, 'pk', None),
+    )
+    return [fila.como_dict() for fila in filas]
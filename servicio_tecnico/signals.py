@@ -25,7 +25,7 @@ Este archivo contiene 2 signals principales:
     2. registrar_incidencia_critica - Detecta incidencias con gravedad CRITICA
 """
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
@@ -35,8 +35,19 @@ from .models import (
     IncidenciaRHITSO,
     SeguimientoRHITSO,
     EstadoRHITSO,
-    HistorialOrden
+    HistorialOrden,
+    ImagenOrden,
+    VideoOrden,
+    Cotizacion,
+    PiezaCotizada,
+    SeguimientoPieza,
+    VentaMostrador,
+    PiezaVentaMostrador,
+    PagoOrden,
+    ReferenciaGamaEquipo,
+    FeedbackCliente,
 )
+from scorecard.models import ComponenteEquipo
 
 
 # ============================================================================
@@ -60,8 +71,10 @@ def guardar_estado_rhitso_anterior(sender, instance, **kwargs):
     Este signal se ejecuta ANTES (pre_save) de que se guarde la OrdenServicio.
     
     ¿Qué hace?
-        Busca el valor actual de estado_rhitso en la base de datos y lo guarda
-        en una variable temporal del objeto (_estado_rhitso_anterior).
+        Toma el valor de estado_rhitso que tenía la orden al cargarse de la BD
+        (OrdenServicio.valor_original) y lo guarda en una variable temporal
+        del objeto (_estado_rhitso_anterior). No hace SELECT: la foto se tomó
+        en from_db.
         
         Esto es necesario porque en post_save ya no podemos saber qué valor
         tenía antes, porque ya se guardó el nuevo valor.
@@ -71,22 +84,10 @@ def guardar_estado_rhitso_anterior(sender, instance, **kwargs):
         prefijo underscore (_). Estos no se guardan en la BD, solo existen
         durante la ejecución.
     """
-    # Si la orden ya existe en la BD (tiene pk), buscar el valor anterior
-    if instance.pk:
-        try:
-            orden_anterior = OrdenServicio.objects.get(pk=instance.pk)
-            # Guardar el valor anterior en una variable temporal
-            instance._estado_rhitso_anterior = orden_anterior.estado_rhitso
-            # Aprovechamos la misma query para capturar el estado del flujo normal
-            instance._estado_anterior = orden_anterior.estado
-        except OrdenServicio.DoesNotExist:
-            # Si no existe (raro), marcar como None
-            instance._estado_rhitso_anterior = None
-            instance._estado_anterior = None
-    else:
-        # Si es una orden nueva, no hay estado anterior
-        instance._estado_rhitso_anterior = None
-        instance._estado_anterior = None
+    # Orden nueva → valor_original devuelve None (no hay estado anterior)
+    instance._estado_rhitso_anterior = instance.valor_original('estado_rhitso')
+    # Aprovechamos la misma foto para el estado del flujo normal
+    instance._estado_anterior = instance.valor_original('estado')
 
 
 @receiver(post_save, sender=OrdenServicio)
@@ -754,3 +755,187 @@ def notificar_inspectores_control_calidad(sender, instance: OrdenServicio, creat
                 mensaje=f'La reparación del equipo {etiqueta_orden} (S/T: {service_tag}) ha concluido. El equipo está listo para su inspección de calidad.',
                 url=url_orden,
             )
+
+
+# ============================================================================
+# SIGNAL: FLAGS DE CORREO ENVIADO + VERSIÓN DE CACHÉ DEL DETALLE DE ORDEN
+# ============================================================================
+
+@receiver(post_save, sender=HistorialOrden)
+def marcar_correo_evidencia_enviado(sender, instance: HistorialOrden, created: bool, **kwargs):
+    """
+    Marca en la orden los correos de evidencia ya enviados al cliente.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El detalle de la orden ya no busca frases en el historial en cada carga;
+    aquí, al registrarse el evento 'email', se ponen en True los flags que
+    correspondan (ver HistorialOrden.MARCAS_CORREO_ENVIADO).
+
+    Efectos secundarios:
+        UPDATE de OrdenServicio (solo filas con el flag aún en False) y, si la
+        orden está cargada en el evento, también actualiza esa instancia para
+        que un save() posterior no regrese el flag a False.
+    """
+    if not created:
+        return
+    flags = instance.flags_correo_enviado()
+    if not flags:
+        return
+
+    db_alias = kwargs.get('using') or 'default'
+    OrdenServicio.objects.using(db_alias).filter(pk=instance.orden_id).update(
+        **dict.fromkeys(flags, True)
+    )
+    if HistorialOrden.orden.is_cached(instance):
+        for flag in flags:
+            setattr(instance.orden, flag, True)
+
+
+# Modelo → atributo con el PK de la orden. Cotizacion, DetalleEquipo y
+# VentaMostrador usan la orden como PK, por eso sus hijos ya traen el id.
+_ORDEN_ID_POR_MODELO = {
+    OrdenServicio: 'pk',
+    DetalleEquipo: 'orden_id',
+    HistorialOrden: 'orden_id',
+    ImagenOrden: 'orden_id',
+    VideoOrden: 'orden_id',
+    Cotizacion: 'orden_id',
+    PiezaCotizada: 'cotizacion_id',
+    SeguimientoPieza: 'orden_id',
+    VentaMostrador: 'orden_id',
+    PiezaVentaMostrador: 'venta_mostrador_id',
+    PagoOrden: 'orden_id',
+}
+
+
+@receiver(post_save, sender=OrdenServicio)
+@receiver(post_delete, sender=OrdenServicio)
+@receiver(post_save, sender=DetalleEquipo)
+@receiver(post_delete, sender=DetalleEquipo)
+@receiver(post_save, sender=HistorialOrden)
+@receiver(post_delete, sender=HistorialOrden)
+@receiver(post_save, sender=ImagenOrden)
+@receiver(post_delete, sender=ImagenOrden)
+@receiver(post_save, sender=VideoOrden)
+@receiver(post_delete, sender=VideoOrden)
+@receiver(post_save, sender=Cotizacion)
+@receiver(post_delete, sender=Cotizacion)
+@receiver(post_save, sender=PiezaCotizada)
+@receiver(post_delete, sender=PiezaCotizada)
+@receiver(post_save, sender=SeguimientoPieza)
+@receiver(post_delete, sender=SeguimientoPieza)
+@receiver(post_save, sender=VentaMostrador)
+@receiver(post_delete, sender=VentaMostrador)
+@receiver(post_save, sender=PiezaVentaMostrador)
+@receiver(post_delete, sender=PiezaVentaMostrador)
+@receiver(post_save, sender=PagoOrden)
+@receiver(post_delete, sender=PagoOrden)
+def invalidar_cache_detalle_orden(sender, instance, **kwargs):
+    """
+    Sube la versión de caché del detalle de la orden afectada.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Cualquier alta, cambio o baja de algo que se pinta en detalle_orden
+    deja obsoletos los fragmentos {% cache %} de esa orden.
+
+    Efectos secundarios:
+        incr de un contador en la caché por defecto.
+    """
+    from .services.detalle_orden_cache import invalidar_fragmentos_detalle
+
+    orden_id = getattr(instance, _ORDEN_ID_POR_MODELO[sender], None)
+    invalidar_fragmentos_detalle(orden_id, kwargs.get('using') or 'default')
+
+
+@receiver(post_save, sender=OrdenServicio)
+@receiver(post_delete, sender=OrdenServicio)
+@receiver(post_save, sender=SeguimientoRHITSO)
+@receiver(post_delete, sender=SeguimientoRHITSO)
+@receiver(post_save, sender=IncidenciaRHITSO)
+@receiver(post_delete, sender=IncidenciaRHITSO)
+@receiver(post_save, sender=EstadoRHITSO)
+@receiver(post_delete, sender=EstadoRHITSO)
+@receiver(post_save, sender=DetalleEquipo)
+@receiver(post_delete, sender=DetalleEquipo)
+def invalidar_cache_proyeccion_rhitso(sender, instance, **kwargs):
+    """
+    Sube la versión de las filas RHITSO cacheadas del país.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El dashboard y los Excel RHITSO leen filas ya armadas
+    (services/proyeccion_rhitso.py). Un seguimiento, una incidencia, un
+    owner del catálogo, el equipo de una candidata o una orden candidata
+    las dejan obsoletas. Las órdenes que no son ni fueron candidatas no
+    aparecen en esas filas, así que guardarlas no invalida nada; desmarcar
+    una candidata sí (compara con el valor original, ver
+    OrdenServicio.CAMPOS_RASTREADOS).
+
+    Efectos secundarios:
+        incr de un contador en la caché por defecto; para DetalleEquipo,
+        un SELECT por PK de su orden.
+    """
+    using = kwargs.get('using') or 'default'
+    if sender is OrdenServicio:
+        era_candidata = not kwargs.get('created') and instance.valor_original('es_candidato_rhitso')
+        if not (instance.es_candidato_rhitso or era_candidata):
+            return
+    elif sender is DetalleEquipo:
+        if not OrdenServicio.objects.using(using).filter(
+            pk=instance.orden_id, es_candidato_rhitso=True,
+        ).exists():
+            return
+    from .services.proyeccion_rhitso import invalidar_proyeccion_rhitso
+
+    invalidar_proyeccion_rhitso(using)
+
+
+@receiver(post_save, sender=ReferenciaGamaEquipo)
+@receiver(post_delete, sender=ReferenciaGamaEquipo)
+def invalidar_indice_gamas(sender, instance, **kwargs):
+    """
+    Rearma el índice en memoria de gamas del país al editar el catálogo.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    ReferenciaGamaEquipo.obtener_gama() busca en un índice armado una vez
+    (ver config/indice_texto.py). Crear, editar o borrar una referencia lo
+    deja viejo; aquí se descarta para que el siguiente uso lo vuelva a armar.
+
+    Efectos secundarios:
+        incr de un contador en la caché por defecto.
+    """
+    from .models import INDICE_GAMAS
+
+    INDICE_GAMAS.invalidar(kwargs.get('using') or 'default')
+
+
+@receiver(post_save, sender=ComponenteEquipo)
+@receiver(post_delete, sender=ComponenteEquipo)
+def invalidar_indice_componentes(sender, instance, **kwargs):
+    """
+    Rearma el índice de componentes (almacén → ST) al editar ComponenteEquipo.
+
+    Efectos secundarios:
+        incr de un contador en la caché por defecto.
+    """
+    from almacen.utils.resolver_componente import INDICE_COMPONENTES
+
+    INDICE_COMPONENTES.invalidar(kwargs.get('using') or 'default')
+
+
+@receiver(post_save, sender=FeedbackCliente)
+@receiver(post_delete, sender=FeedbackCliente)
+def invalidar_paneles_feedback_cliente(sender, instance, **kwargs):
+    """
+    Descarta los paneles cacheados de encuestas y feedback de rechazo.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Un feedback nuevo (o una respuesta del cliente) cambia los KPIs, las
+    semanas y los comentarios de ambos dashboards; se sube la versión del
+    país para que la siguiente carga vuelva a calcular.
+
+    Efectos secundarios:
+        incr de un contador en la caché por defecto.
+    """
+    from .services.paneles_feedback import invalidar_paneles_feedback
+
+    invalidar_paneles_feedback(kwargs.get('using') or 'default')
@@ -23,9 +23,11 @@ Flujo del correo RHITSO:
 import os
 import logging
 import traceback
+from functools import lru_cache
 
 from celery import shared_task
 from notificaciones.utils import notificar_exito, notificar_error
+from notificaciones.correo_service import adjuntar_recursos_inline, enviar_correo
 from config.constants import FFMPEG_DRAWTEXT_FONT
 
 logger = logging.getLogger('servicio_tecnico')
@@ -218,7 +220,7 @@ def enviar_correo_rhitso_task(
                 with open(imagen_path, 'rb') as f:
                     email_msg.attach(os.path.basename(imagen_path), f.read(), 'image/jpeg')
 
-        email_msg.send()
+        enviar_correo(email_msg)
         logger.info(f"[RHITSO] Correo enviado exitosamente a {destinatarios_principales}")
 
         # ===================================================================
@@ -364,8 +366,6 @@ def enviar_feedback_rechazo_task(self, feedback_id, usuario_id=None, db_alias='d
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
 
     from .models import FeedbackCliente, HistorialOrden
 
@@ -469,38 +469,10 @@ def enviar_feedback_rechazo_task(self, feedback_id, usuario_id=None, db_alias='d
         )
         email_msg.content_subtype = 'html'
 
-        # ── Adjuntar logo SIC ──
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[FEEDBACK-RECHAZO] Error al adjuntar logo: {e}")
-
-        # ── Adjuntar iconos de redes sociales ──
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[FEEDBACK-RECHAZO] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[FEEDBACK-RECHAZO]')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[FEEDBACK-RECHAZO] Correo enviado a {email_cliente}")
 
         # ── Marcar correo como enviado ──
@@ -590,8 +562,6 @@ def enviar_vigencia_vencida_task(self, orden_id, usuario_id=None, db_alias='defa
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
 
     from .models import OrdenServicio, HistorialOrden
 
@@ -656,38 +626,10 @@ def enviar_vigencia_vencida_task(self, orden_id, usuario_id=None, db_alias='defa
         )
         email_msg.content_subtype = 'html'
 
-        # ── Adjuntar logo SIC ──
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[VIGENCIA-VENCIDA] Error al adjuntar logo: {e}")
-
-        # ── Adjuntar iconos de redes sociales ──
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[VIGENCIA-VENCIDA] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[VIGENCIA-VENCIDA]')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[VIGENCIA-VENCIDA] Correo enviado a {email_cliente}")
 
         # ── Registrar en historial ──
@@ -759,6 +701,67 @@ def enviar_vigencia_vencida_task(self, orden_id, usuario_id=None, db_alias='defa
 # TAREA 2: ENVIAR DIAGNÓSTICO AL CLIENTE
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _parte_imagen_proceso_rhitso(cid_name, static_rel, subtype):
+    """
+    Imagen del proceso RHITSO redimensionada como parte MIME inline.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Son imágenes estáticas: se comprimen a máx. 640px la primera vez y el
+    resultado se reutiliza en todos los correos de diagnóstico del proceso.
+
+    Returns:
+        MIMEImage | None: None si la imagen no está en static/.
+    """
+    import io
+    from django.contrib.staticfiles import finders
+    from email.mime.image import MIMEImage
+    from PIL import Image
+
+    img_path = finders.find(static_rel)
+    if not img_path:
+        logger.warning(f"[DIAGNOSTICO] Imagen RHITSO no encontrada: {static_rel}")
+        return None
+
+    # Comprimir / redimensionar para clientes de correo
+    img = Image.open(img_path)
+    if img.mode in ('RGBA', 'LA', 'P') and subtype == 'jpeg':
+        fondo = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        fondo.paste(
+            img,
+            mask=img.split()[-1] if img.mode == 'RGBA' else None,
+        )
+        img = fondo
+    elif img.mode not in ('RGB', 'L') and subtype == 'png':
+        img = img.convert('RGBA')
+
+    max_lado = 640
+    if max(img.size) > max_lado:
+        ratio = max_lado / max(img.size)
+        nuevo_tamano = (int(img.size[0] * ratio), int(img.size[1] * ratio))
+        img = img.resize(nuevo_tamano, Image.Resampling.LANCZOS)
+
+    buffer_img = io.BytesIO()
+    if subtype == 'jpeg':
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img.save(buffer_img, format='JPEG', quality=75, optimize=True)
+    else:
+        img.save(buffer_img, format='PNG', optimize=True)
+    buffer_img.seek(0)
+
+    mime_img = MIMEImage(buffer_img.getvalue(), _subtype=subtype)
+    mime_img.add_header('Content-ID', f'<{cid_name}>')
+    mime_img.add_header(
+        'Content-Disposition',
+        'inline',
+        filename=f'{cid_name}.{subtype}',
+    )
+    return mime_img
+
+
 @shared_task(
     bind=True,
     max_retries=3,
@@ -803,8 +806,6 @@ def enviar_diagnostico_cliente_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
     from PIL import Image
 
     from .models import OrdenServicio, ImagenOrden
@@ -1074,36 +1075,8 @@ def enviar_diagnostico_cliente_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Adjuntar logo SIC
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[DIAGNOSTICO] Error al adjuntar logo: {e}")
-
-        # Adjuntar iconos de redes sociales
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[DIAGNOSTICO] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[DIAGNOSTICO]')
 
         # Galería del proceso (solo plantilla reparación a nivel componente).
         # EXPLICACIÓN PARA PRINCIPIANTES:
@@ -1121,54 +1094,14 @@ def enviar_diagnostico_cliente_task(
             ]
             for cid_name, static_rel, subtype in imagenes_proceso_rhitso:
                 try:
-                    img_path = finders.find(static_rel)
-                    if not img_path:
-                        logger.warning(
-                            f"[DIAGNOSTICO] Imagen RHITSO no encontrada: {static_rel}"
-                        )
-                        continue
-
-                    # Comprimir / redimensionar para clientes de correo
-                    img = Image.open(img_path)
-                    if img.mode in ('RGBA', 'LA', 'P') and subtype == 'jpeg':
-                        fondo = Image.new('RGB', img.size, (255, 255, 255))
-                        if img.mode == 'P':
-                            img = img.convert('RGBA')
-                        fondo.paste(
-                            img,
-                            mask=img.split()[-1] if img.mode == 'RGBA' else None,
-                        )
-                        img = fondo
-                    elif img.mode not in ('RGB', 'L') and subtype == 'png':
-                        img = img.convert('RGBA')
-
-                    max_lado = 640
-                    if max(img.size) > max_lado:
-                        ratio = max_lado / max(img.size)
-                        nuevo_tamano = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-                        img = img.resize(nuevo_tamano, Image.Resampling.LANCZOS)
-
-                    buffer_img = io.BytesIO()
-                    if subtype == 'jpeg':
-                        if img.mode != 'RGB':
-                            img = img.convert('RGB')
-                        img.save(buffer_img, format='JPEG', quality=75, optimize=True)
-                    else:
-                        img.save(buffer_img, format='PNG', optimize=True)
-                    buffer_img.seek(0)
-
-                    mime_img = MIMEImage(buffer_img.getvalue(), _subtype=subtype)
-                    mime_img.add_header('Content-ID', f'<{cid_name}>')
-                    mime_img.add_header(
-                        'Content-Disposition',
-                        'inline',
-                        filename=f'{cid_name}.{subtype}',
-                    )
-                    email_msg.attach(mime_img)
+                    mime_img = _parte_imagen_proceso_rhitso(cid_name, static_rel, subtype)
                 except Exception as e:
                     logger.warning(
                         f"[DIAGNOSTICO] Error al adjuntar imagen proceso {cid_name}: {e}"
                     )
+                    continue
+                if mime_img is not None:
+                    email_msg.attach(mime_img)
 
         # Adjuntar PDF
         with open(resultado_pdf['ruta'], 'rb') as f:
@@ -1178,7 +1111,7 @@ def enviar_diagnostico_cliente_task(
         for img_data in imagenes_comprimidas:
             email_msg.attach(img_data['nombre'], img_data['contenido'], 'image/jpeg')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(
             f"[DIAGNOSTICO] Correo enviado a {email_cliente} "
             f"(plantilla={tipo_plantilla})"
@@ -1381,8 +1314,6 @@ def enviar_imagenes_cliente_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
     from PIL import Image
 
     from .models import OrdenServicio, ImagenOrden, HistorialOrden
@@ -1612,42 +1543,14 @@ def enviar_imagenes_cliente_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Adjuntar logo SIC
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[IMAGENES] Error al adjuntar logo: {e}")
-
-        # Adjuntar iconos de redes sociales
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[IMAGENES] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[IMAGENES]')
 
         # Adjuntar imágenes comprimidas
         for img_data in imagenes_comprimidas:
             email_msg.attach(img_data['nombre'], img_data['contenido'], 'image/jpeg')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[IMAGENES] Correo enviado a {email_cliente}")
 
         # ===================================================================
@@ -1789,8 +1692,6 @@ def enviar_imagenes_egreso_cliente_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
     from PIL import Image
 
     from .models import OrdenServicio, ImagenOrden, HistorialOrden
@@ -1942,42 +1843,14 @@ def enviar_imagenes_egreso_cliente_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Adjuntar logo SIC
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[IMAGENES-EGRESO] Error al adjuntar logo: {e}")
-
-        # Adjuntar iconos de redes sociales
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[IMAGENES-EGRESO] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[IMAGENES-EGRESO]')
 
         # Adjuntar imágenes de egreso comprimidas
         for img_data in imagenes_comprimidas:
             email_msg.attach(img_data['nombre'], img_data['contenido'], 'image/jpeg')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[IMAGENES-EGRESO] Correo enviado a {email_cliente}")
 
         # ===================================================================
@@ -2106,10 +1979,8 @@ def enviar_notificacion_equipo_disponible_task(
     import re
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from django.core.mail import EmailMessage
     from django.template.loader import render_to_string
-    from email.mime.image import MIMEImage
 
     from .models import HistorialOrden, OrdenServicio
     from inventario.models import Empleado
@@ -2241,41 +2112,10 @@ def enviar_notificacion_equipo_disponible_task(
         )
         email_msg.content_subtype = 'html'
 
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header(
-                        'Content-Disposition', 'inline', filename='logo_sic.png'
-                    )
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning('[EQUIPO-DISPONIBLE] Logo CID: %s', e)
-
-        iconos_sociales = {
-            'icon_link': 'images/utilitys/link.png',
-            'icon_instagram': 'images/utilitys/instagram.png',
-            'icon_facebook': 'images/utilitys/facebook.png',
-            'icon_whatsapp': 'images/utilitys/whatsapp.png',
-        }
-        for cid_name, icon_static_path in iconos_sociales.items():
-            icon_path = finders.find(icon_static_path)
-            if not icon_path:
-                continue
-            try:
-                with open(icon_path, 'rb') as f:
-                    icon_mime = MIMEImage(f.read(), _subtype='png')
-                    icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                    icon_mime.add_header(
-                        'Content-Disposition', 'inline', filename=f'{cid_name}.png'
-                    )
-                    email_msg.attach(icon_mime)
-            except Exception as e:
-                logger.warning('[EQUIPO-DISPONIBLE] Icono %s: %s', cid_name, e)
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[EQUIPO-DISPONIBLE]')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         # La vista ya marcó fecha_notificacion_equipo_disponible (candado).
         # Aquí solo registramos el historial tras el envío exitoso.
@@ -2374,8 +2214,6 @@ def enviar_feedback_satisfaccion_task(self, feedback_id, usuario_id=None, db_ali
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
 
     from .models import FeedbackCliente, HistorialOrden
 
@@ -2453,38 +2291,10 @@ def enviar_feedback_satisfaccion_task(self, feedback_id, usuario_id=None, db_ali
         )
         email_msg.content_subtype = 'html'
 
-        # ── Logo SIC (CID inline) ──
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[FEEDBACK-SATISFACCION] Error al adjuntar logo: {e}")
-
-        # ── Iconos de redes sociales ──
-        iconos_sociales = {
-            'icon_link':      'images/utilitys/link.png',
-            'icon_instagram': 'images/utilitys/instagram.png',
-            'icon_facebook':  'images/utilitys/facebook.png',
-            'icon_whatsapp':  'images/utilitys/whatsapp.png',
-        }
-        for cid_name, icon_static_path in iconos_sociales.items():
-            icon_path = finders.find(icon_static_path)
-            if icon_path:
-                try:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-                except Exception as e:
-                    logger.warning(f"[FEEDBACK-SATISFACCION] Error al adjuntar icono {cid_name}: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[FEEDBACK-SATISFACCION]')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         # ── Marcar correo como enviado ──
         FeedbackCliente.objects.filter(pk=feedback_id).update(correo_enviado=True)
@@ -2555,18 +2365,13 @@ def enviar_feedback_satisfaccion_task(self, feedback_id, usuario_id=None, db_ali
 @shared_task(bind=True, max_retries=3, default_retry_delay=60, name='servicio_tecnico.enviar_recordatorio_encuesta')
 def enviar_recordatorio_encuesta_task(self, feedback_id, db_alias='default'):
     """
-    Envía un correo de recordatorio al cliente para que conteste
+    Encola el correo de recordatorio al cliente para que conteste
     la encuesta de satisfacción antes de que expire (día 10 de 12).
-    """
-    import re
-    from django.core.mail import EmailMessage
-    from django.template.loader import render_to_string
-    from django.utils import timezone
-    from django.conf import settings
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
 
-    from .models import FeedbackCliente, HistorialOrden
+    El envío real lo hace la bandeja de salida (notificaciones.correo_service),
+    que agrupa la ráfaga de las 8:00 AM en lotes sobre sesiones SMTP reutilizadas.
+    """
+    from .models import FeedbackCliente
 
     try:
         try:
@@ -2577,122 +2382,193 @@ def enviar_recordatorio_encuesta_task(self, feedback_id, db_alias='default'):
         except FeedbackCliente.DoesNotExist:
             return {'success': False, 'mensaje': f'FeedbackCliente ID {feedback_id} no encontrado.'}
 
-        # Doble verificación: no enviar si ya respondió o el recordatorio ya fue enviado
-        if feedback.utilizado:
-            return {'success': False, 'mensaje': 'El cliente ya respondió la encuesta.'}
-        if feedback.recordatorio_enviado:
-            return {'success': False, 'mensaje': 'Recordatorio ya enviado previamente.'}
+        return _encolar_recordatorio_encuesta(feedback, _recordatorios_encuesta_en_bandeja([feedback_id]))
 
-        orden   = feedback.orden
-        detalle = orden.detalle_equipo
-        email_cliente = detalle.email_cliente if detalle else None
+    except Exception as exc:
+        logger.error(f"[RECORDATORIO-ENCUESTA] Error para FeedbackCliente ID {feedback_id}: {exc}\n{traceback.format_exc()}")
+        raise self.retry(exc=exc, countdown=60)
 
-        if not email_cliente:
-            return {'success': False, 'mensaje': 'Sin email de cliente.'}
 
-        # ── Construir URL y datos del equipo ──
-        from config.paises_config import get_pais_actual
-        _pais = get_pais_actual()
-        site_url     = _pais.get('url_base', getattr(settings, 'SITE_URL', 'http://localhost:8000'))
-        feedback_url = f"{site_url}/feedback-satisfaccion/{feedback.token}/"
+def _recordatorios_encuesta_en_bandeja(feedback_ids):
+    """Referencias de recordatorios que ya esperan en la bandeja de salida (una consulta)."""
+    from notificaciones.models import CorreoSaliente
 
-        marca_equipo  = detalle.marca       or ''
-        modelo_equipo = detalle.modelo      or ''
-        tipo_equipo   = detalle.tipo_equipo or ''
-        folio = (
-            detalle.orden_cliente if detalle and detalle.orden_cliente
-            else orden.numero_orden_interno
-        )
+    return set(
+        CorreoSaliente.objects.filter(
+            referencia__in=[f'recordatorio_encuesta:{feedback_id}' for feedback_id in feedback_ids],
+            estado__in=('pendiente', 'enviando'),
+        ).values_list('referencia', flat=True)
+    )
 
-        fecha_entrega_str = ''
-        if orden.fecha_entrega:
-            fecha_entrega_str = timezone.localtime(orden.fecha_entrega).strftime('%d/%m/%Y')
 
-        ahora_local = timezone.localtime(timezone.now())
+def _encolar_recordatorio_encuesta(feedback, en_bandeja):
+    """
+    Arma el correo de recordatorio de un FeedbackCliente y lo deja en la bandeja.
 
-        # ── Contexto: reutilizamos el mismo template con dias_vigencia ajustado ──
-        context_email = {
-            'folio':            folio,
-            'marca_equipo':     marca_equipo,
-            'modelo_equipo':    modelo_equipo,
-            'tipo_equipo':      tipo_equipo,
-            'fecha_entrega':    fecha_entrega_str,
-            'feedback_url':     feedback_url,
-            'dias_vigencia':    feedback.dias_restantes,  # Días que quedan realmente
-            'fecha_envio':      ahora_local.strftime('%d/%m/%Y'),
-            'es_recordatorio':  True,  # Flag para personalizar el template si se desea
-        }
+    Args:
+        feedback: FeedbackCliente con orden__detalle_equipo ya cargado.
+        en_bandeja (set): referencias ya pendientes (ver _recordatorios_encuesta_en_bandeja).
 
-        html_content = render_to_string(
-            'servicio_tecnico/emails/feedback_satisfaccion.html',
-            context_email
-        )
+    Returns:
+        dict: {'success': bool, ...} igual que enviar_recordatorio_encuesta_task.
 
-        asunto      = f'Recordatorio: ¿Cómo fue tu experiencia? — Folio {folio}'
-        email_match = re.search(r'<(.+?)>', settings.DEFAULT_FROM_EMAIL)
-        email_solo  = email_match.group(1) if email_match else settings.DEFAULT_FROM_EMAIL
-        remitente   = f"Servicio Técnico System <{email_solo}>"
+    Efectos secundarios:
+        Crea un CorreoSaliente (encolar_correo).
+    """
+    import re
+    from django.template.loader import render_to_string
+    from django.utils import timezone
+    from django.conf import settings
 
-        email_msg = EmailMessage(
-            subject=asunto, body=html_content,
-            from_email=remitente, to=[email_cliente],
-        )
-        email_msg.content_subtype = 'html'
+    from notificaciones.correo_service import encolar_correo
+
+    # Doble verificación: no enviar si ya respondió o el recordatorio ya fue enviado
+    if feedback.utilizado:
+        return {'success': False, 'mensaje': 'El cliente ya respondió la encuesta.'}
+    if feedback.recordatorio_enviado:
+        return {'success': False, 'mensaje': 'Recordatorio ya enviado previamente.'}
+
+    orden   = feedback.orden
+    detalle = orden.detalle_equipo
+    email_cliente = detalle.email_cliente if detalle else None
+
+    if not email_cliente:
+        return {'success': False, 'mensaje': 'Sin email de cliente.'}
+
+    # ── Construir URL y datos del equipo ──
+    from config.paises_config import get_pais_actual
+    _pais = get_pais_actual()
+    site_url     = _pais.get('url_base', getattr(settings, 'SITE_URL', 'http://localhost:8000'))
+    feedback_url = f"{site_url}/feedback-satisfaccion/{feedback.token}/"
+
+    marca_equipo  = detalle.marca       or ''
+    modelo_equipo = detalle.modelo      or ''
+    tipo_equipo   = detalle.tipo_equipo or ''
+    folio = (
+        detalle.orden_cliente if detalle and detalle.orden_cliente
+        else orden.numero_orden_interno
+    )
+
+    fecha_entrega_str = ''
+    if orden.fecha_entrega:
+        fecha_entrega_str = timezone.localtime(orden.fecha_entrega).strftime('%d/%m/%Y')
+
+    ahora_local = timezone.localtime(timezone.now())
+
+    # ── Contexto: reutilizamos el mismo template con dias_vigencia ajustado ──
+    context_email = {
+        'folio':            folio,
+        'marca_equipo':     marca_equipo,
+        'modelo_equipo':    modelo_equipo,
+        'tipo_equipo':      tipo_equipo,
+        'fecha_entrega':    fecha_entrega_str,
+        'feedback_url':     feedback_url,
+        'dias_vigencia':    feedback.dias_restantes,  # Días que quedan realmente
+        'fecha_envio':      ahora_local.strftime('%d/%m/%Y'),
+        'es_recordatorio':  True,  # Flag para personalizar el template si se desea
+    }
+
+    html_content = render_to_string(
+        'servicio_tecnico/emails/feedback_satisfaccion.html',
+        context_email
+    )
+
+    asunto      = f'Recordatorio: ¿Cómo fue tu experiencia? — Folio {folio}'
+    email_match = re.search(r'<(.+?)>', settings.DEFAULT_FROM_EMAIL)
+    email_solo  = email_match.group(1) if email_match else settings.DEFAULT_FROM_EMAIL
+    remitente   = f"Servicio Técnico System <{email_solo}>"
+
+    # ── Encolar en la bandeja de salida ──
+    # EXPLICACIÓN PARA PRINCIPIANTES:
+    # Los recordatorios salen todos juntos a las 8:00 AM. En vez de abrir
+    # una sesión SMTP por correo, se guardan en CorreoSaliente y el worker
+    # de correo los manda por lotes (respetando el cupo por dominio).
+    # El flag recordatorio_enviado y el historial los registra
+    # registrar_recordatorio_encuesta_enviado() cuando el correo sí salió.
+    referencia = f'recordatorio_encuesta:{feedback.pk}'
+    if referencia in en_bandeja:
+        return {'success': False, 'mensaje': 'Recordatorio ya está en la bandeja de salida.'}
+
+    encolar_correo(
+        asunto=asunto,
+        cuerpo_html=html_content,
+        para=[email_cliente],
+        remitente=remitente,
+        referencia=referencia,
+        accion_enviado='servicio_tecnico.tasks.registrar_recordatorio_encuesta_enviado',
+        datos_accion={
+            'feedback_id': feedback.pk,
+            'dias_restantes': feedback.dias_restantes,
+        },
+    )
+
+    logger.info(f"[RECORDATORIO-ENCUESTA] Encolado para {email_cliente}, Orden {folio}")
+    return {'success': True, 'feedback_id': feedback.pk, 'destinatario': email_cliente}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, name='servicio_tecnico.enviar_recordatorios_encuesta_lote')
+def enviar_recordatorios_encuesta_lote_task(self, feedback_ids, db_alias='default'):
+    """
+    Encola los correos de recordatorio de un lote de encuestas (Beat 8:00).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Misma lógica que enviar_recordatorio_encuesta_task, pero los feedbacks y
+    las referencias ya en bandeja se cargan con una consulta cada uno para
+    todo el lote. Solo se reintentan los que fallaron.
+    """
+    from .models import FeedbackCliente
 
-        # ── Logo SIC (CID inline) ──
+    feedbacks = FeedbackCliente.objects.select_related(
+        'orden__detalle_equipo',
+        'enviado_por',
+    ).filter(pk__in=feedback_ids)
+    en_bandeja = _recordatorios_encuesta_en_bandeja(feedback_ids)
+
+    encolados, fallidos = 0, []
+    for feedback in feedbacks:
         try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[RECORDATORIO-ENCUESTA] Error al adjuntar logo: {e}")
-
-        # ── Iconos de redes sociales ──
-        iconos_sociales = {
-            'icon_link':      'images/utilitys/link.png',
-            'icon_instagram': 'images/utilitys/instagram.png',
-            'icon_facebook':  'images/utilitys/facebook.png',
-            'icon_whatsapp':  'images/utilitys/whatsapp.png',
-        }
-        for cid_name, icon_static_path in iconos_sociales.items():
-            icon_path = finders.find(icon_static_path)
-            if icon_path:
-                try:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-                except Exception as e:
-                    logger.warning(f"[RECORDATORIO-ENCUESTA] Error al adjuntar icono {cid_name}: {e}")
+            if _encolar_recordatorio_encuesta(feedback, en_bandeja)['success']:
+                encolados += 1
+        except Exception as exc:
+            logger.error(f"[RECORDATORIO-ENCUESTA] Error para FeedbackCliente ID {feedback.pk}: {exc}")
+            fallidos.append(feedback.pk)
 
-        email_msg.send(fail_silently=False)
+    if fallidos and self.request.retries < self.max_retries:
+        raise self.retry(args=(fallidos,), kwargs={'db_alias': db_alias}, countdown=60)
+    return {'success': True, 'encolados': encolados, 'fallidos': len(fallidos)}
 
-        # ── Marcar recordatorio como enviado ──
-        FeedbackCliente.objects.filter(pk=feedback_id).update(recordatorio_enviado=True)
 
-        # ── Registrar en historial ──
-        HistorialOrden.objects.create(
-            orden=orden,
-            tipo_evento='email',
-            comentario=(
-                f"🔔 Recordatorio de encuesta de satisfacción enviado al cliente ({email_cliente})\n"
-                f"⏳ Quedan {feedback.dias_restantes} día(s) — Token ID: {feedback_id}"
-            ),
-            usuario=feedback.enviado_por,
-            es_sistema=True,
-        )
+def registrar_recordatorio_encuesta_enviado(correo, feedback_id, dias_restantes):
+    """
+    Acción post-envío del recordatorio de encuesta (la llama la bandeja de correo).
 
-        logger.info(f"[RECORDATORIO-ENCUESTA] Enviado a {email_cliente} para Orden {folio}")
-        return {'success': True, 'feedback_id': feedback_id, 'destinatario': email_cliente}
+    Args:
+        correo: CorreoSaliente recién enviado (su _state.db es la BD del país).
+        feedback_id (int): PK del FeedbackCliente.
+        dias_restantes (int): días de vigencia al momento de encolar.
 
-    except Exception as exc:
-        logger.error(f"[RECORDATORIO-ENCUESTA] Error para FeedbackCliente ID {feedback_id}: {exc}\n{traceback.format_exc()}")
-        raise self.retry(exc=exc, countdown=60)
+    Efectos secundarios:
+        Marca recordatorio_enviado y registra el evento 'email' en el historial.
+    """
+    from .models import FeedbackCliente, HistorialOrden
+
+    db_alias = correo._state.db
+    feedback = FeedbackCliente.objects.using(db_alias).select_related(
+        'orden', 'enviado_por',
+    ).get(pk=feedback_id)
+    FeedbackCliente.objects.using(db_alias).filter(pk=feedback_id).update(recordatorio_enviado=True)
+
+    HistorialOrden.objects.using(db_alias).create(
+        orden=feedback.orden,
+        tipo_evento='email',
+        comentario=(
+            f"🔔 Recordatorio de encuesta de satisfacción enviado al cliente ({', '.join(correo.para)})\n"
+            f"⏳ Quedan {dias_restantes} día(s) — Token ID: {feedback_id}"
+        ),
+        usuario=feedback.enviado_por,
+        es_sistema=True,
+    )
+    logger.info(f"[RECORDATORIO-ENCUESTA] Enviado a {', '.join(correo.para)} (feedback {feedback_id})")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -2707,20 +2583,23 @@ def enviar_recordatorio_encuesta_task(self, feedback_id, db_alias='default'):
 #   - aún no han expirado (≤12 días)
 #   - no se les ha enviado recordatorio (recordatorio_enviado=False)
 
+# Encuestas por tarea Celery en el barrido diario (un lote = una tarea)
+TAMANO_LOTE_RECORDATORIOS_ENCUESTA = 50
+
+
 @shared_task(name='servicio_tecnico.verificar_encuestas_pendientes')
 def verificar_encuestas_pendientes_task():
     """
     Tarea periódica diaria (Celery Beat) que detecta encuestas de satisfacción
     que llevan 10+ días sin respuesta y dispara el recordatorio por correo.
 
-    MULTI-PAÍS: Itera sobre TODOS los países configurados para no omitir
-    encuestas de ninguna base de datos. Pasa db_alias a cada recordatorio
-    para que Celery use la BD correcta al ejecutarlo.
+    MULTI-PAÍS: Revisa TODOS los países configurados a la vez
+    (en_todos_los_paises) para no omitir encuestas de ninguna base de datos.
+    Pasa db_alias a cada recordatorio para que Celery use la BD correcta.
     """
     from datetime import timedelta
     from django.utils import timezone
-    from config.paises_config import PAISES_CONFIG
-    from .models import FeedbackCliente
+    from config.middleware_pais import en_todos_los_paises, sumar_resultados
 
     ahora = timezone.now()
 
@@ -2728,38 +2607,55 @@ def verificar_encuestas_pendientes_task():
     limite_inferior = ahora - timedelta(days=12)  # No expiradas aún
     limite_superior = ahora - timedelta(days=10)  # Al menos 10 días de antigüedad
 
-    total_global = 0
+    resultados, _errores = en_todos_los_paises(
+        _encolar_recordatorios_encuesta_pais, limite_inferior, limite_superior,
+    )
+    return {'procesadas': sumar_resultados(resultados).get('procesadas', 0)}
 
-    # Iterar sobre cada país para revisar su BD independiente
-    for subdominio, pais_config in PAISES_CONFIG.items():
-        db_alias = pais_config['db_alias']
 
-        pendientes = FeedbackCliente.objects.using(db_alias).filter(
+def _encolar_recordatorios_encuesta_pais(limite_inferior, limite_superior):
+    """
+    Encola los recordatorios de encuesta del país activo.
+
+    Corre dentro de en_todos_los_paises(): el país lo indica el contexto.
+    Solo se leen los IDs (una consulta) y se reparten en lotes de
+    TAMANO_LOTE_RECORDATORIOS_ENCUESTA para enviar_recordatorios_encuesta_lote_task.
+
+    Args:
+        limite_inferior / limite_superior: ventana de fecha_creacion.
+
+    Returns:
+        dict: {'procesadas': encuestas encontradas en este país}
+    """
+    from config.middleware_pais import get_current_db_alias
+    from .models import FeedbackCliente
+
+    db_alias = get_current_db_alias()
+
+    pendientes = list(
+        FeedbackCliente.objects.using(db_alias).filter(
             tipo='satisfaccion',
             correo_enviado=True,
             utilizado=False,
             recordatorio_enviado=False,
             fecha_creacion__lte=limite_superior,
             fecha_creacion__gte=limite_inferior,
-        )
-
-        total = pendientes.count()
-        logger.info(f"[VERIFICAR-ENCUESTAS] [{subdominio}] Encontradas {total} encuesta(s) para recordatorio.")
+        ).values_list('pk', flat=True)
+    )
 
-        for feedback in pendientes:
-            try:
-                # Pasar db_alias para que la señal task_prerun configure el contexto correcto
-                enviar_recordatorio_encuesta_task.delay(feedback_id=feedback.pk, db_alias=db_alias)
-                logger.info(
-                    f"[VERIFICAR-ENCUESTAS] [{subdominio}] Recordatorio encolado para "
-                    f"FeedbackCliente ID {feedback.pk} (Orden {feedback.orden.numero_orden_interno})"
-                )
-            except Exception as e:
-                logger.error(f"[VERIFICAR-ENCUESTAS] [{subdominio}] Error al encolar feedback ID {feedback.pk}: {e}")
+    total = len(pendientes)
+    logger.info(f"[VERIFICAR-ENCUESTAS] [{db_alias}] Encontradas {total} encuesta(s) para recordatorio.")
 
-        total_global += total
+    try:
+        # db_alias en kwargs para que la señal task_prerun configure el contexto correcto
+        despachar_en_lotes(
+            enviar_recordatorios_encuesta_lote_task, pendientes, db_alias, TAMANO_LOTE_RECORDATORIOS_ENCUESTA,
+        )
+    except Exception as e:
+        logger.error(f"[VERIFICAR-ENCUESTAS] [{db_alias}] Error al encolar recordatorios: {e}")
+        return {'procesadas': 0}
 
-    return {'procesadas': total_global}
+    return {'procesadas': total}
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -2797,6 +2693,7 @@ def enviar_recordatorio_imagen_task(self, orden_id, tipo_recordatorio, db_alias=
         construir_mensaje_recordatorio_egreso_inspector,
         construir_mensaje_recordatorio_ingreso_inspector,
         construir_mensaje_recordatorio_tecnico,
+        comentario_historial_recordatorio,
         obtener_etiqueta_orden,
         orden_requiere_recordatorio_egreso_inspector,
         orden_requiere_recordatorio_ingreso_inspector,
@@ -2827,12 +2724,10 @@ def enviar_recordatorio_imagen_task(self, orden_id, tipo_recordatorio, db_alias=
             if not orden_requiere_recordatorio_ingreso_inspector(orden):
                 return {'success': False, 'mensaje': 'La orden ya no requiere recordatorio de ingreso.'}
             titulo, mensaje = construir_mensaje_recordatorio_ingreso_inspector(orden)
-            tipo_foto_historial = 'ingreso'
         else:
             if not orden_requiere_recordatorio_egreso_inspector(orden):
                 return {'success': False, 'mensaje': 'La orden ya no requiere recordatorio de egreso.'}
             titulo, mensaje = construir_mensaje_recordatorio_egreso_inspector(orden)
-            tipo_foto_historial = 'egreso'
 
         # Broadcast a todos los inspectores activos (mismo patrón que ingreso)
         inspectores = Empleado.objects.filter(
@@ -2862,9 +2757,8 @@ def enviar_recordatorio_imagen_task(self, orden_id, tipo_recordatorio, db_alias=
                     f'{inspector.pk} orden {orden_id}: {exc_push}'
                 )
 
-        comentario_historial = (
-            f'🔔 Recordatorio de fotos de {tipo_foto_historial} enviado a '
-            f'{destinatarios_notificados} inspector(es) — Orden {etiqueta}'
+        comentario_historial = comentario_historial_recordatorio(
+            tipo_recordatorio, etiqueta, destinatarios_notificados,
         )
 
     elif tipo_recordatorio == 'tecnico_faltantes':
@@ -2895,9 +2789,8 @@ def enviar_recordatorio_imagen_task(self, orden_id, tipo_recordatorio, db_alias=
             )
             raise self.retry(exc=exc_push, countdown=60)
 
-        comentario_historial = (
-            f'🔔 Recordatorio de fotos pendientes enviado al técnico '
-            f'{tecnico.nombre_completo} — Orden {etiqueta}'
+        comentario_historial = comentario_historial_recordatorio(
+            tipo_recordatorio, etiqueta, destinatarios_notificados, tecnico.nombre_completo,
         )
 
     else:
@@ -2938,74 +2831,187 @@ def verificar_recordatorios_imagenes_task():
         - Egreso inspector: en finalizado sin fotos de egreso.
         - Técnico: en finalizado con diag/rep faltantes según cotización.
 
-    MULTI-PAÍS: Itera PAISES_CONFIG y pasa db_alias a cada tarea hija.
+    MULTI-PAÍS: Revisa todos los países a la vez (en_todos_los_paises) y pasa
+    db_alias a cada tarea hija.
     """
-    from config.paises_config import PAISES_CONFIG
+    from config.middleware_pais import en_todos_los_paises, sumar_resultados
 
-    from .utils_recordatorio_imagenes import (
-        ordenes_pendientes_egreso_inspector,
-        ordenes_pendientes_ingreso_inspector,
-        ordenes_pendientes_tecnico,
+    resultados, _errores = en_todos_los_paises(_encolar_recordatorios_imagenes_pais)
+    return {'procesadas': sumar_resultados(resultados).get('procesadas', 0)}
+
+
+def _encolar_recordatorios_imagenes_pais():
+    """
+    Encola los recordatorios de fotos faltantes del país activo.
+
+    Corre dentro de en_todos_los_paises(): el país lo indica el contexto.
+    Las reglas se resuelven en SQL (recordatorios_pendientes_pais) y los
+    mensajes ya armados viajan en lotes de TAMANO_LOTE_RECORDATORIOS a
+    enviar_recordatorios_imagen_lote_task.
+
+    Returns:
+        dict: {'procesadas': recordatorios encolados en este país}
+    """
+    from config.middleware_pais import get_current_db_alias
+
+    from .utils_recordatorio_imagenes import TAMANO_LOTE_RECORDATORIOS, recordatorios_pendientes_pais
+
+    db_alias = get_current_db_alias()
+    recordatorios = recordatorios_pendientes_pais(db_alias)
+
+    try:
+        lotes = despachar_en_lotes(
+            enviar_recordatorios_imagen_lote_task, recordatorios, db_alias, TAMANO_LOTE_RECORDATORIOS,
+        )
+    except Exception as exc:
+        logger.error(f'[VERIFICAR-RECORDATORIO-IMAGEN] [{db_alias}] Error al encolar lotes: {exc}')
+        return {'procesadas': 0}
+
+    logger.info(
+        f'[VERIFICAR-RECORDATORIO-IMAGEN] [{db_alias}] '
+        f'{len(recordatorios)} recordatorio(s) encolado(s) en {lotes} lote(s).'
     )
+    return {'procesadas': len(recordatorios)}
 
-    total_global = 0
 
-    for subdominio, pais_config in PAISES_CONFIG.items():
-        db_alias = pais_config['db_alias']
-        encoladas_pais = 0
+def despachar_en_lotes(tarea_lote, elementos, db_alias, tamano):
+    """
+    Reparte `elementos` en trozos y los encola como un solo group de Celery.
 
-        # 1) Ingreso faltante tras 2 días → inspectores
-        for orden in ordenes_pendientes_ingreso_inspector(db_alias):
-            try:
-                enviar_recordatorio_imagen_task.delay(
-                    orden_id=orden.pk,
-                    tipo_recordatorio='ingreso_inspector',
-                    db_alias=db_alias,
-                )
-                encoladas_pais += 1
-            except Exception as exc:
-                logger.error(
-                    f'[VERIFICAR-RECORDATORIO-IMAGEN] [{subdominio}] '
-                    f'Error al encolar ingreso inspector orden {orden.pk}: {exc}'
-                )
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    En vez de una tarea por orden (miles de mensajes al broker a las 8:00),
+    cada tarea recibe `tamano` elementos. group() publica todas las tareas
+    de una vez y los workers las reparten entre sí.
 
-        # 2) Egreso faltante en finalizado → inspectores (repetición diaria)
-        for orden in ordenes_pendientes_egreso_inspector(db_alias):
-            try:
-                enviar_recordatorio_imagen_task.delay(
-                    orden_id=orden.pk,
-                    tipo_recordatorio='egreso_inspector',
-                    db_alias=db_alias,
-                )
-                encoladas_pais += 1
-            except Exception as exc:
-                logger.error(
-                    f'[VERIFICAR-RECORDATORIO-IMAGEN] [{subdominio}] '
-                    f'Error al encolar egreso inspector orden {orden.pk}: {exc}'
-                )
+    Args:
+        tarea_lote: tarea Celery que recibe (lista, db_alias=...).
+        elementos (list): datos serializables a JSON.
+        db_alias (str): país; task_prerun lo usa para activar la BD.
+        tamano (int): elementos por tarea.
+
+    Returns:
+        int: número de lotes encolados.
+    """
+    from celery import group
+
+    lotes = [elementos[inicio:inicio + tamano] for inicio in range(0, len(elementos), tamano)]
+    if lotes:
+        group(tarea_lote.s(lote, db_alias=db_alias) for lote in lotes).apply_async()
+    return len(lotes)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, name='servicio_tecnico.enviar_recordatorios_imagen_lote')
+def enviar_recordatorios_imagen_lote_task(self, recordatorios, db_alias='default'):
+    """
+    Envía un lote de recordatorios de imágenes ya armados por el Beat.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Cada elemento trae título, mensaje, URL y usuarios a notificar
+    (ver utils_recordatorio_imagenes._recordatorio_listo), así que aquí no se
+    recalculan reglas: una consulta para descartar lo ya enviado hoy, una
+    para cargar los usuarios y luego push + campanita + historial.
+
+    Parámetros:
+        recordatorios (list[dict]): lote armado por recordatorios_pendientes_pais().
+        db_alias: Alias de BD del país (configurado por task_prerun).
+
+    Efectos secundarios:
+        - Notifica inspectores o técnico de cada orden.
+        - Actualiza RecordatorioImagenOrden (una escritura para todo el lote).
+        - Registra un evento en HistorialOrden por orden notificada.
+        - Reintenta solo los recordatorios que no llegaron a nadie.
+    """
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    from notificaciones.push_service import enviar_push_a_usuario
+    from notificaciones.utils import notificar_warning
+
+    from .models import HistorialOrden, RecordatorioImagenOrden
+    from .utils_recordatorio_imagenes import comentario_historial_recordatorio, inicio_de_hoy
+
+    # Si el Beat corrió dos veces hoy, no repetir (mismo criterio que debe_recordar_hoy)
+    ya_enviados = set(
+        RecordatorioImagenOrden.objects.using(db_alias)
+        .filter(
+            orden_id__in=[r['orden_id'] for r in recordatorios],
+            fecha_ultimo_envio__gte=inicio_de_hoy(),
+        )
+        .values_list('orden_id', 'tipo')
+    )
+    usuarios = get_user_model().objects.using(db_alias).in_bulk(
+        {usuario_id for r in recordatorios for usuario_id in r['usuario_ids']}
+    )
 
-        # 3) Evidencias técnico en finalizado (según cotización / VM)
-        for orden in ordenes_pendientes_tecnico(db_alias):
+    enviados, fallidos = [], []
+    for recordatorio in recordatorios:
+        if (recordatorio['orden_id'], recordatorio['tipo_recordatorio']) in ya_enviados:
+            continue
+
+        destinatarios = 0
+        for usuario_id in recordatorio['usuario_ids']:
+            usuario = usuarios.get(usuario_id)
+            if usuario is None:
+                continue
             try:
-                enviar_recordatorio_imagen_task.delay(
-                    orden_id=orden.pk,
-                    tipo_recordatorio='tecnico_faltantes',
-                    db_alias=db_alias,
+                enviar_push_a_usuario(
+                    usuario=usuario,
+                    titulo=recordatorio['titulo'],
+                    mensaje=recordatorio['mensaje'],
+                    url=recordatorio['url'],
                 )
-                encoladas_pais += 1
-            except Exception as exc:
-                logger.error(
-                    f'[VERIFICAR-RECORDATORIO-IMAGEN] [{subdominio}] '
-                    f'Error al encolar técnico orden {orden.pk}: {exc}'
+                notificar_warning(
+                    titulo=recordatorio['titulo'],
+                    mensaje=recordatorio['mensaje'],
+                    usuario=usuario,
+                    app_origen='servicio_tecnico',
+                    url=recordatorio['url'],
+                )
+                destinatarios += 1
+            except Exception as exc_push:
+                logger.warning(
+                    f'[RECORDATORIO-IMAGEN] Error notificando usuario {usuario_id} '
+                    f'orden {recordatorio["orden_id"]}: {exc_push}'
                 )
 
-        logger.info(
-            f'[VERIFICAR-RECORDATORIO-IMAGEN] [{subdominio}] '
-            f'{encoladas_pais} recordatorio(s) encolado(s).'
+        if destinatarios == 0:
+            fallidos.append(recordatorio)
+            continue
+
+        HistorialOrden.objects.using(db_alias).create(
+            orden_id=recordatorio['orden_id'],
+            tipo_evento='sistema',
+            comentario=comentario_historial_recordatorio(
+                recordatorio['tipo_recordatorio'],
+                recordatorio['etiqueta'],
+                destinatarios,
+                recordatorio['tecnico'],
+            ),
+            es_sistema=True,
         )
-        total_global += encoladas_pais
+        enviados.append(recordatorio)
 
-    return {'procesadas': total_global}
+    if enviados:
+        ahora = timezone.now()
+        RecordatorioImagenOrden.objects.using(db_alias).bulk_create(
+            [
+                RecordatorioImagenOrden(
+                    orden_id=r['orden_id'], tipo=r['tipo_recordatorio'], fecha_ultimo_envio=ahora,
+                )
+                for r in enviados
+            ],
+            update_conflicts=True,
+            unique_fields=['orden', 'tipo'],
+            update_fields=['fecha_ultimo_envio'],
+        )
+
+    logger.info(
+        f'[RECORDATORIO-IMAGEN] [{db_alias}] Lote: {len(enviados)} enviado(s), '
+        f'{len(fallidos)} sin destinatario, {len(recordatorios) - len(enviados) - len(fallidos)} ya enviado(s) hoy.'
+    )
+    if fallidos and self.request.retries < self.max_retries:
+        raise self.retry(args=(fallidos,), kwargs={'db_alias': db_alias}, countdown=60)
+    return {'success': True, 'enviados': len(enviados), 'fallidos': len(fallidos)}
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -3026,8 +3032,6 @@ def enviar_seguimiento_cliente_task(self, orden_id, usuario_id=None, db_alias='d
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
-    from email.mime.image import MIMEImage
 
     from .models import OrdenServicio, EnlaceSeguimientoCliente, HistorialOrden
 
@@ -3110,38 +3114,10 @@ def enviar_seguimiento_cliente_task(self, orden_id, usuario_id=None, db_alias='d
         )
         email_msg.content_subtype = 'html'
 
-        # ── Logo SIC (CID inline) ──
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[SEGUIMIENTO-CLIENTE] Error al adjuntar logo: {e}")
-
-        # ── Iconos de redes sociales ──
-        iconos_sociales = {
-            'icon_link':      'images/utilitys/link.png',
-            'icon_instagram': 'images/utilitys/instagram.png',
-            'icon_facebook':  'images/utilitys/facebook.png',
-            'icon_whatsapp':  'images/utilitys/whatsapp.png',
-        }
-        for cid_name, icon_static_path in iconos_sociales.items():
-            icon_path = finders.find(icon_static_path)
-            if icon_path:
-                try:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-                except Exception as e:
-                    logger.warning(f"[SEGUIMIENTO-CLIENTE] Error al adjuntar icono {cid_name}: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[SEGUIMIENTO-CLIENTE]')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         # ── Marcar correo como enviado ──
         EnlaceSeguimientoCliente.objects.filter(pk=enlace.pk).update(correo_enviado=True)
@@ -4285,6 +4261,7 @@ def comprimir_video_evidencia_task(
     usuario_id: int,
     orientacion_video: int = 0,
     db_alias: str = 'default',
+    sha256_esperado: str | None = None,
 ):
     """
     Tarea Celery: comprime un video de evidencia con FFmpeg y guarda el VideoOrden.
@@ -4312,6 +4289,8 @@ def comprimir_video_evidencia_task(
         descripcion       : Descripción opcional del técnico
         empleado_id       : ID del Empleado que sube el video (para VideoOrden.subido_por)
         usuario_id        : ID del User Django (para la notificación campanita y push)
+        sha256_esperado   : SHA-256 que declaró el navegador (subida reanudable);
+                            si no coincide, el video no se procesa
     """
     import subprocess
     import shutil
@@ -4354,6 +4333,11 @@ def comprimir_video_evidencia_task(
                 f"Archivo temporal no encontrado: {archivo_tmp_path}. "
                 f"Puede haberse limpiado antes de que Celery procesara la tarea."
             )
+        if sha256_esperado:
+            # Se verifica aquí y no en el request: son hasta 95 MB de lectura.
+            # ValueError → no se reintenta y el técnico recibe la notificación.
+            from servicio_tecnico.services.subidas_reanudables import verificar_sha256
+            verificar_sha256(archivo_tmp_path, sha256_esperado)
 
         # =====================================================================
         # PASO 2: OBTENER OBJETOS DJANGO DESDE LA BD
@@ -4704,7 +4688,6 @@ def enviar_rewind_egreso_email_task(self, prev_result, orden_id, usuario_id, des
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from email.mime.image import MIMEImage
 
     from .models import OrdenServicio, VideoOrden, HistorialOrden
@@ -4867,38 +4850,10 @@ def enviar_rewind_egreso_email_task(self, prev_result, orden_id, usuario_id, des
             except Exception as e:
                 logger.warning(f"[REWIND-EMAIL] No se pudo adjuntar thumbnail: {e}")
 
-        # ── Logo SIC ─────────────────────────────────────────────────────────
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[REWIND-EMAIL] Error al adjuntar logo: {e}")
-
-        # ── Iconos de redes sociales ──────────────────────────────────────────
-        try:
-            iconos_sociales = {
-                'icon_link':      'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook':  'images/utilitys/facebook.png',
-                'icon_whatsapp':  'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[REWIND-EMAIL] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[REWIND-EMAIL]')
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[REWIND-EMAIL] Correo rewind enviado a {email_cliente}")
 
         # =====================================================================
@@ -5017,8 +4972,8 @@ def enviar_rewind_egreso_email_task(self, prev_result, orden_id, usuario_id, des
     max_retries=3,
     default_retry_delay=60,
     name='servicio_tecnico.enviar_evidencia_video',
-    soft_time_limit=600,
-    time_limit=660,
+    # Sin límites propios: usa los de la cola 'ai' (config/colas_celery.py),
+    # que cubren OLLAMA_VISION_TIMEOUT más la extracción de frames y el correo
 )
 def enviar_evidencia_video_task(
     self, orden_id, video_ids, destinatarios_copia,
@@ -5043,7 +4998,6 @@ def enviar_evidencia_video_task(
     from django.utils import timezone
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from email.mime.image import MIMEImage
 
     from .models import OrdenServicio, VideoOrden, HistorialOrden
@@ -5261,34 +5215,8 @@ def enviar_evidencia_video_task(
         )
         email_msg.content_subtype = 'html'
 
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header('Content-Disposition', 'inline', filename='logo_sic.png')
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning(f"[EVIDENCIA-VIDEO] Error al adjuntar logo: {e}")
-
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header('Content-Disposition', 'inline', filename=f'{cid_name}.png')
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning(f"[EVIDENCIA-VIDEO] Error al adjuntar iconos: {e}")
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[EVIDENCIA-VIDEO]')
 
         for v_data in videos_data:
             if v_data['tiene_thumbnail'] and v_data['thumbnail_bytes']:
@@ -5300,7 +5228,7 @@ def enviar_evidencia_video_task(
                 except Exception as e_thumb:
                     logger.warning(f"[EVIDENCIA-VIDEO] Error adjuntando thumbnail {v_data['id']}: {e_thumb}")
 
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
         logger.info(f"[EVIDENCIA-VIDEO] Correo enviado a {email_cliente}")
 
         # ===================================================================
@@ -5431,12 +5359,10 @@ def enviar_formato_oow_email_task(
     """
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from django.core.mail import EmailMessage
     from django.template.loader import render_to_string
     from django.utils import timezone
     from email.mime.application import MIMEApplication
-    from email.mime.image import MIMEImage
     from email.utils import formataddr, parseaddr
 
     from decouple import config
@@ -5549,41 +5475,8 @@ def enviar_formato_oow_email_task(
         )
         email_msg.content_subtype = 'html'
 
-        # Logo e iconos inline (CID) — mismos assets que diagnóstico.
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header(
-                        'Content-Disposition', 'inline', filename='logo_sic.png',
-                    )
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning('[FORMATO_OOW] Error al adjuntar logo: %s', e)
-
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header(
-                            'Content-Disposition',
-                            'inline',
-                            filename=f'{cid_name}.png',
-                        )
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning('[FORMATO_OOW] Error al adjuntar iconos: %s', e)
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[FORMATO_OOW]')
 
         with formato.pdf.open('rb') as fh:
             pdf_bytes = fh.read()
@@ -5594,7 +5487,7 @@ def enviar_formato_oow_email_task(
             filename=f'FormatoOOW_{orden_sicser}.pdf',
         )
         email_msg.attach(pdf_mime)
-        email_msg.send()
+        enviar_correo(email_msg)
 
         destinarios_txt = ', '.join(destinatarios)
         HistorialOrden.objects.create(
@@ -5650,12 +5543,10 @@ def enviar_formato_garantia_email_task(
     """
     from django.conf import settings
     from django.contrib.auth import get_user_model
-    from django.contrib.staticfiles import finders
     from django.core.mail import EmailMessage
     from django.template.loader import render_to_string
     from django.utils import timezone
     from email.mime.application import MIMEApplication
-    from email.mime.image import MIMEImage
     from email.utils import formataddr, parseaddr
 
     from decouple import config
@@ -5762,40 +5653,8 @@ def enviar_formato_garantia_email_task(
         )
         email_msg.content_subtype = 'html'
 
-        try:
-            logo_path = finders.find('images/logos/logo_sic.png')
-            if logo_path:
-                with open(logo_path, 'rb') as f:
-                    logo_mime = MIMEImage(f.read(), _subtype='png')
-                    logo_mime.add_header('Content-ID', '<logo_sic>')
-                    logo_mime.add_header(
-                        'Content-Disposition', 'inline', filename='logo_sic.png',
-                    )
-                    email_msg.attach(logo_mime)
-        except Exception as e:
-            logger.warning('[FORMATO_GARANTIA] Error al adjuntar logo: %s', e)
-
-        try:
-            iconos_sociales = {
-                'icon_link': 'images/utilitys/link.png',
-                'icon_instagram': 'images/utilitys/instagram.png',
-                'icon_facebook': 'images/utilitys/facebook.png',
-                'icon_whatsapp': 'images/utilitys/whatsapp.png',
-            }
-            for cid_name, icon_static_path in iconos_sociales.items():
-                icon_path = finders.find(icon_static_path)
-                if icon_path:
-                    with open(icon_path, 'rb') as f:
-                        icon_mime = MIMEImage(f.read(), _subtype='png')
-                        icon_mime.add_header('Content-ID', f'<{cid_name}>')
-                        icon_mime.add_header(
-                            'Content-Disposition',
-                            'inline',
-                            filename=f'{cid_name}.png',
-                        )
-                        email_msg.attach(icon_mime)
-        except Exception as e:
-            logger.warning('[FORMATO_GARANTIA] Error al adjuntar iconos: %s', e)
+        # Logo SIC + iconos sociales (CID inline, partes MIME compartidas)
+        adjuntar_recursos_inline(email_msg, log_prefix='[FORMATO_GARANTIA]')
 
         with formato.pdf.open('rb') as fh:
             pdf_bytes = fh.read()
@@ -5806,7 +5665,7 @@ def enviar_formato_garantia_email_task(
             filename=f'FormatoGarantia_{orden_sicser}.pdf',
         )
         email_msg.attach(pdf_mime)
-        email_msg.send()
+        enviar_correo(email_msg)
 
         destinarios_txt = ', '.join(destinatarios)
         HistorialOrden.objects.create(
@@ -5830,6 +5689,298 @@ def enviar_formato_garantia_email_task(
         raise self.retry(exc=exc, countdown=60)
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# TAREA: Espejo local de SICSER (Celery Beat cada 5 minutos)
+# ═══════════════════════════════════════════════════════════════════════
+# La API de SICSER no acepta filtro por fecha ni paginación, así que la
+# descargamos UNA vez por origen y repartimos los registros entre países.
+# sincronizar_origen solo escribe las filas cuya huella cambió.
+
+@shared_task(name='servicio_tecnico.sincronizar_espejo_sicser')
+def sincronizar_espejo_sicser_task():
+    """
+    Sincroniza OrdenSicserEspejo de todos los países con la API de SICSER.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    La pantalla «Consultar SICSER» ya no llama a SICSER en cada visita:
+    lee el espejo local. Esta tarea lo mantiene al día descargando los
+    listados OOW y garantía una sola vez y sincronizando cada BD de país.
+    Después realinea los flags de importación de filas que SICSER no cambió
+    (órdenes borradas o creadas por otro camino), aunque la descarga falle.
+
+    Returns:
+        dict: {'<subdominio>': {'oow': {...}, 'garantia': {...},
+        'flags_realineados': int}, 'errores': {...}}
+    """
+    from config.paises_config import PAISES_CONFIG
+    from .sicser_client import SicserAPIError, descargar_registros_crudos
+    from .sicser_espejo import ORIGENES_SICSER, realinear_flags_importacion, sincronizar_origen
+
+    resultado: dict = {'errores': {}}
+    descargas = {}
+    for origen in ORIGENES_SICSER:
+        try:
+            descargas[origen] = descargar_registros_crudos(origen)
+        except SicserAPIError as exc:
+            resultado['errores'][origen] = str(exc)
+            logger.warning('[ESPEJO-SICSER] Error descargando %s: %s', origen, exc)
+
+    for subdominio, pais_config in PAISES_CONFIG.items():
+        resumen_pais = {}
+        for origen, registros in descargas.items():
+            try:
+                resumen_pais[origen] = sincronizar_origen(
+                    origen,
+                    registros,
+                    pais_config['codigo'],
+                    db_alias=pais_config['db_alias'],
+                )
+            except Exception as exc:
+                logger.error(
+                    '[ESPEJO-SICSER] [%s] Error sincronizando %s: %s',
+                    subdominio, origen, exc, exc_info=True,
+                )
+                resultado['errores'][f'{subdominio}:{origen}'] = str(exc)
+        realineados = 0
+        for origen in ORIGENES_SICSER:
+            try:
+                realineados += realinear_flags_importacion(origen, pais_config['db_alias'])
+            except Exception as exc:
+                logger.error(
+                    '[ESPEJO-SICSER] [%s] Error realineando flags %s: %s',
+                    subdominio, origen, exc, exc_info=True,
+                )
+                resultado['errores'][f'{subdominio}:{origen}:flags'] = str(exc)
+        resumen_pais['flags_realineados'] = realineados
+        resultado[subdominio] = resumen_pais
+
+    return resultado
+
+
+# ============================================================================
+# TAREA: IMPORTACIÓN DE ÓRDENES SICSER POR LOTE
+# ============================================================================
+# «Importar varias» en Consultar SICSER: la recepción pega los folios del
+# backlog y esta tarea crea las órdenes por bloques (sicser_import), con
+# avance por polling y aviso en la campanita al terminar.
+
+@shared_task(bind=True, name='servicio_tecnico.importar_ordenes_sicser_lote')
+def importar_ordenes_sicser_lote_task(
+    self, origen, identificadores, usuario_id, codigo_pais, sucursal_id=None, db_alias='default',
+):
+    """
+    Importa una lista de folios SICSER y avisa el resultado por la campanita.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Repetirla es seguro: lo que ya se creó en una corrida anterior sale
+    como «duplicada» y no se vuelve a crear.
+
+    Parámetros:
+        self            : Referencia a la tarea Celery (bind=True)
+        origen          : 'oow' o 'garantia'
+        identificadores : folios o ids externos ya separados
+        usuario_id      : ID del usuario que pidió la importación
+        codigo_pais     : código ISO del país (filtra el espejo)
+        sucursal_id     : sucursal forzada o None (automática por CIS)
+        db_alias        : BD del país (la fija task_prerun)
+
+    Returns:
+        dict: {'success', 'filas', 'creadas', 'duplicadas', 'errores'}
+    """
+    from django.contrib.auth import get_user_model
+    from django.urls import reverse
+
+    from .sicser_import import (
+        FILA_CREADA,
+        FILA_DUPLICADA,
+        FILA_ERROR,
+        SicserImportError,
+        importar_ordenes_sicser_en_lote,
+    )
+
+    usuario = get_user_model().objects.filter(pk=usuario_id).first()
+    logger.info(
+        f"[SICSER-LOTE] Importando {len(identificadores)} {origen} para usuario {usuario_id} ({db_alias})"
+    )
+
+    def reportar(procesadas, total):
+        porcentaje = round(procesadas * 100 / total) if total else 100
+        self.update_state(state='PROGRESS', meta={
+            'procesadas': procesadas,
+            'total': total,
+            'porcentaje': porcentaje,
+        })
+
+    try:
+        filas = importar_ordenes_sicser_en_lote(
+            origen, identificadores, usuario, codigo_pais,
+            sucursal_id=sucursal_id, progreso=reportar,
+        )
+    except SicserImportError as exc:
+        notificar_error(
+            titulo='Importación SICSER no realizada',
+            mensaje=str(exc)[:200],
+            usuario=usuario,
+            task_id=self.request.id,
+            app_origen='servicio_tecnico',
+        )
+        return {'success': False, 'error': str(exc), 'filas': [],
+                'creadas': 0, 'duplicadas': 0, 'errores': 0}
+
+    conteo = {
+        estado: sum(1 for fila in filas if fila['estado'] == estado)
+        for estado in (FILA_CREADA, FILA_DUPLICADA, FILA_ERROR)
+    }
+    notificar_exito(
+        titulo=f"Importación SICSER: {conteo[FILA_CREADA]} órdenes creadas",
+        mensaje=(
+            f"{conteo[FILA_DUPLICADA]} ya existían y {conteo[FILA_ERROR]} con error "
+            f"de {len(filas)} folios."
+        ),
+        usuario=usuario,
+        task_id=self.request.id,
+        app_origen='servicio_tecnico',
+        url=reverse('servicio_tecnico:consultar_sicser') + '?tab=importadas_hoy',
+    )
+    return {
+        'success': True,
+        'filas': filas,
+        'creadas': conteo[FILA_CREADA],
+        'duplicadas': conteo[FILA_DUPLICADA],
+        'errores': conteo[FILA_ERROR],
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# TAREA: Limpieza de subidas a medias (Celery Beat diario)
+# ═══════════════════════════════════════════════════════════════════════
+# Reemplaza a scripts/mantenimiento/limpiar_uploads_temp.sh (cron): además
+# de los temporales de Django borra las subidas reanudables abandonadas,
+# los videos crudos de video_tmp/ que nunca llegaron a comprimirse y las
+# exportaciones Excel cuyo enlace de descarga ya venció.
+
+@shared_task(name='servicio_tecnico.limpiar_subidas_temporales', ignore_result=True)
+def limpiar_subidas_temporales_task(horas=None):
+    """
+    Borra los archivos de subidas interrumpidas con más de `horas` sin tocar.
+
+    También borra, en cada país, las exportaciones Excel cuyo enlace de
+    descarga ya venció (exportaciones/<usuario>/ del storage).
+
+    Args:
+        horas (int|None): antigüedad mínima. None = SUBIDAS_EXPIRACION_HORAS.
+
+    Returns:
+        dict: archivos borrados por carpeta.
+    """
+    from config.middleware_pais import en_todos_los_paises, sumar_resultados
+
+    from .services.exportaciones_excel import limpiar_exportaciones_vencidas
+    from .services.subidas_reanudables import limpiar_subidas_vencidas
+
+    borrados = limpiar_subidas_vencidas(horas)
+    resultados, _errores = en_todos_los_paises(limpiar_exportaciones_vencidas)
+    borrados['exportaciones'] = sumar_resultados(resultados).get('exportaciones', 0)
+    logger.info('[SUBIDAS] Limpieza de temporales: %s', borrados)
+    return borrados
+
+
+# ============================================================================
+# TAREA: EXPORTACIONES EXCEL EN SEGUNDO PLANO
+# ============================================================================
+# Los reportes con muchas filas (base garantía, productividad, RHITSO,
+# encuestas) ya no se arman dentro del request: la vista encola esta tarea y
+# la campanita entrega el enlace de descarga firmado al terminar.
+
+@shared_task(
+    bind=True,
+    soft_time_limit=1500,         # 25 minutos — override del global de 5 min
+    time_limit=1800,              # 30 minutos — override del global de 10 min
+    name='servicio_tecnico.generar_exportacion_excel',
+)
+def generar_exportacion_excel_task(self, tipo, parametros, usuario_id, db_alias='default'):
+    """
+    Genera un .xlsx con el motor en streaming y avisa por la campanita.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    1. Busca la función exportadora registrada para ``tipo``.
+    2. Mientras escribe filas reporta avance con ``update_state('PROGRESS')``
+       (la vista ``estado_exportacion_excel`` lo lee por polling).
+    3. Guarda el archivo en el storage y crea una notificación con el enlace
+       de descarga firmado (solo el usuario dueño puede abrirlo).
+
+    Parámetros:
+        self       : Referencia a la tarea Celery (bind=True)
+        tipo       : clave de EXPORTADORES (ej. 'base_garantia')
+        parametros : filtros GET serializados
+        usuario_id : ID del usuario que pidió el reporte
+        db_alias   : BD del país (la fija task_prerun)
+
+    Returns:
+        dict: {'success': bool, 'ruta': str | None, 'url': str | None}
+    """
+    from django.contrib.auth import get_user_model
+
+    from .services.exportaciones_excel import (
+        guardar_libro,
+        obtener_exportador,
+        titulo_exportacion,
+        url_descarga,
+    )
+
+    titulo = titulo_exportacion(tipo)
+    usuario = get_user_model().objects.filter(pk=usuario_id).first()
+    logger.info(f"[EXPORT-EXCEL] Iniciando {tipo} para usuario {usuario_id} ({db_alias})")
+
+    def reportar(procesadas, total):
+        porcentaje = round(procesadas * 100 / total) if total else 100
+        self.update_state(state='PROGRESS', meta={
+            'procesadas': procesadas,
+            'total': total,
+            'porcentaje': porcentaje,
+        })
+
+    try:
+        resultado = obtener_exportador(tipo)(parametros, progreso=reportar)
+        if resultado is None:
+            notificar_error(
+                titulo=f"{titulo}: sin datos",
+                mensaje="No hay registros con los filtros aplicados.",
+                usuario=usuario,
+                task_id=self.request.id,
+                app_origen='servicio_tecnico',
+            )
+            return {'success': False, 'ruta': None, 'url': None}
+
+        nombre, libro = resultado
+        ruta = guardar_libro(libro, nombre, usuario_id)
+        url = url_descarga(ruta, usuario_id, nombre)
+        notificar_exito(
+            titulo=f"{titulo} listo",
+            mensaje=f"{nombre} — haz clic para descargarlo (enlace válido 7 días).",
+            usuario=usuario,
+            task_id=self.request.id,
+            app_origen='servicio_tecnico',
+            url=url,
+        )
+        logger.info(f"[EXPORT-EXCEL] {tipo} guardado en {ruta}")
+        return {'success': True, 'ruta': ruta, 'url': url}
+
+    except Exception as exc:
+        logger.error(f"[EXPORT-EXCEL] Error generando {tipo}: {exc}", exc_info=True)
+        try:
+            notificar_error(
+                titulo=f"Error al generar {titulo}",
+                mensaje=str(exc)[:200],
+                usuario=usuario,
+                task_id=self.request.id,
+                app_origen='servicio_tecnico',
+            )
+        except Exception:
+            pass
+        raise
+
+
 # EXPLICACIÓN: Celery solo autodescubre servicio_tecnico/tasks.py.
 # Importar aquí registra la tarea de validación de pagos sin hinchar este archivo.
 from servicio_tecnico.tasks_pagos import (  # noqa: E402, F401
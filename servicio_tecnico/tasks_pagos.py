@@ -82,6 +82,7 @@ def notificar_validacion_pago_task(
         url_base_pais_email,
     )
     from config.paises_config import fecha_local_pais, get_pais_actual
+    from notificaciones.correo_service import enviar_correo
     from servicio_tecnico.models import PagoOrden
     from servicio_tecnico.services.notificaciones_pagos import (
         TIPO_PAGO_NO_APARECE,
@@ -189,7 +190,7 @@ def notificar_validacion_pago_task(
             to=emails_to,
         )
         email_msg.content_subtype = 'html'
-        email_msg.send(fail_silently=False)
+        enviar_correo(email_msg)
 
         logger.info(
             '%s Email enviado a %s (pago=%s evento=%s)',
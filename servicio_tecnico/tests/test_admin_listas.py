@@ -0,0 +1,138 @@
+"""
+Tests de presupuesto de consultas en las listas del admin de Servicio Técnico.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+Con config/admin_rendimiento.py, la lista del admin hace el mismo número de
+consultas con 2 filas que con 10 (nada de una consulta por fila), y las
+bitácoras (historial, eventos) se recorren por cursor sin contar la tabla.
+
+Usamos RequestFactory y llamamos changelist_view() directo para no pasar por
+Axes ni PaisMiddleware.
+"""
+
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from config.admin_rendimiento import CURSOR_VAR
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.models import (
+    Cotizacion,
+    EnlaceSeguimientoCliente,
+    EventoSeguimientoCliente,
+    HistorialOrden,
+    OrdenServicio,
+)
+
+
+class AdminListasBase(TestCase):
+    """Superusuario, sucursal/técnico y un helper que cuenta consultas."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.superusuario = get_user_model().objects.create_superuser(
+            username='admin_listas', email='admin.listas@test.local', password='x',
+        )
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Admin', ciudad='CDMX')
+        self.empleado = Empleado.objects.create(
+            nombre_completo='Técnico Admin',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='tec.admin@test.local',
+            sucursal=self.sucursal,
+            rol='tecnico',
+        )
+
+    def _crear_ordenes(self, cantidad):
+        for numero in range(cantidad):
+            orden = OrdenServicio.objects.create(
+                sucursal=self.sucursal,
+                tipo_servicio='diagnostico',
+                estado='cotizacion',
+                tecnico_asignado_actual=self.empleado,
+            )
+            if numero % 2 == 0:
+                Cotizacion.objects.create(orden=orden)
+            HistorialOrden.objects.create(
+                orden=orden, tipo_evento='comentario', comentario='Nota', usuario=self.empleado,
+            )
+            enlace = EnlaceSeguimientoCliente.objects.create(orden=orden, token=f'token-admin-{orden.pk}')
+            EventoSeguimientoCliente.objects.create(enlace=enlace, tipo='chat_abierto')
+
+    def _lista(self, modelo, **params):
+        """Renderiza la lista del admin; devuelve (consultas, ChangeList)."""
+        request = self.factory.get('/admin/', params)
+        request.user = self.superusuario
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = site._registry[modelo].changelist_view(request)
+            respuesta.render()
+        self.assertEqual(respuesta.status_code, 200)
+        return len(consultas), respuesta.context_data['cl']
+
+    def _assert_presupuesto(self, modelo, presupuesto):
+        self._crear_ordenes(2)
+        pocas, _ = self._lista(modelo)
+        self._crear_ordenes(8)
+        muchas, cl = self._lista(modelo)
+
+        self.assertEqual(pocas, muchas, 'La lista no debe hacer consultas por fila')
+        self.assertLessEqual(muchas, presupuesto)
+        return cl
+
+
+class OrdenServicioAdminListaTest(AdminListasBase):
+
+    def test_presupuesto_de_consultas(self):
+        cl = self._assert_presupuesto(OrdenServicio, presupuesto=9)
+        self.assertIsNone(cl.full_result_count)
+
+
+class HistorialOrdenAdminListaTest(AdminListasBase):
+
+    def test_presupuesto_de_consultas(self):
+        self._assert_presupuesto(HistorialOrden, presupuesto=4)
+
+    def test_paginacion_por_cursor(self):
+        self._crear_ordenes(5)
+        esperados = list(HistorialOrden.objects.order_by('-fecha_evento', '-pk').values_list('pk', flat=True))
+        vistos, params = [], {}
+
+        with patch.object(site._registry[HistorialOrden], 'list_per_page', 2):
+            while True:
+                _, cl = self._lista(HistorialOrden, **params)
+                vistos += [fila.pk for fila in cl.result_list]
+                if not cl.url_siguiente:
+                    break
+                params = {CURSOR_VAR: parse_qs(urlparse(cl.url_siguiente).query)[CURSOR_VAR][0]}
+
+        self.assertEqual(vistos, esperados)
+        self.assertIsNotNone(cl.url_primera_pagina)
+
+    def test_ordenar_por_columna_usa_paginacion_normal(self):
+        self._crear_ordenes(3)
+        _, cl = self._lista(HistorialOrden, o='2')
+
+        self.assertFalse(cl.usa_cursor)
+        self.assertEqual(cl.result_count, HistorialOrden.objects.count())
+
+    def test_cursor_invalido_no_revienta(self):
+        request = self.factory.get('/admin/', {CURSOR_VAR: 'no-es-cursor'})
+        request.user = self.superusuario
+        respuesta = site._registry[HistorialOrden].changelist_view(request)
+
+        self.assertEqual(respuesta.status_code, 302)
+        self.assertIn('e=1', respuesta.url)
+
+
+class EventoSeguimientoClienteAdminListaTest(AdminListasBase):
+
+    def test_presupuesto_de_consultas(self):
+        cl = self._assert_presupuesto(EventoSeguimientoCliente, presupuesto=2)
+        self.assertTrue(cl.usa_cursor)
+        self.assertIsNone(cl.url_siguiente)
@@ -0,0 +1,352 @@
+"""
+Tests del marco columnar del dashboard OOW/FL (services/analitica_oow_fl.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+MarcoOOWFL reemplaza los recorridos en Python del dashboard y del Excel.
+Estos tests comparan cada resultado contra las funciones anteriores
+(excel_exporters, utils_rhitso, ventas_mostrador_analytics y las
+propiedades de OrdenServicio) con órdenes que cubren: venta mostrador con
+piezas, cotización aceptada/rechazada/pendiente, cambios de estado en el
+historial y una orden sin responsable. También verifican que el número de
+consultas no crece con el número de órdenes.
+"""
+
+import inspect
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from scorecard.models import ComponenteEquipo
+from servicio_tecnico import views_dashboard_oow_fl
+from servicio_tecnico.excel_exporters import (
+    calcular_distribucion_estados,
+    calcular_estadisticas_por_responsable,
+    calcular_estadisticas_por_sucursal,
+    calcular_metricas_generales,
+    calcular_top_productos,
+)
+from servicio_tecnico.models import (
+    Cotizacion,
+    DetalleEquipo,
+    HistorialOrden,
+    OrdenServicio,
+    PiezaCotizada,
+    PiezaVentaMostrador,
+    VentaMostrador,
+)
+from servicio_tecnico.services.analitica_oow_fl import MarcoOOWFL
+from servicio_tecnico.services.ventas_mostrador_analytics import obtener_top_productos_vendidos
+from servicio_tecnico.utils_rhitso import (
+    agrupar_ordenes_por_mes,
+    calcular_dias_por_estatus,
+    calcular_promedio_dias_por_estatus,
+)
+
+User = get_user_model()
+
+
+class DatosOOWFLBase(TestCase):
+    """Seis órdenes fuera de garantía que cubren cada caso del dashboard."""
+
+    def setUp(self):
+        self.ahora = timezone.now()
+        self.sucursal_a = Sucursal.objects.create(nombre='Sucursal Marco A', ciudad='CDMX')
+        self.sucursal_b = Sucursal.objects.create(nombre='Sucursal Marco B', ciudad='GDL')
+        self.tecnico = self._empleado('Técnico Marco', 'tec.marco@test.local')
+        self.resp_1 = self._empleado('Responsable Uno', 'resp.uno@test.local')
+        self.resp_2 = self._empleado('Responsable Dos', 'resp.dos@test.local')
+        self.componente = ComponenteEquipo.objects.create(
+            nombre='Pantalla Marco', tipo_equipo='laptop', activo=True,
+        )
+
+        # 1) Venta mostrador con paquete, servicios y piezas (entregada)
+        self.orden_vm = self._orden(
+            'entregado', self.resp_1, self.sucursal_a, dias_atras=40,
+            tipo_servicio='venta_mostrador', entregada_hace=30,
+        )
+        venta = VentaMostrador.objects.create(
+            orden=self.orden_vm,
+            paquete='premium',
+            costo_paquete=Decimal('5500.00'),
+            incluye_limpieza=True,
+            costo_limpieza=Decimal('350.50'),
+            incluye_kit_limpieza=True,
+            costo_kit=Decimal('0.00'),
+        )
+        for descripcion, cantidad, precio in (('SSD 1TB', 2, '1299.99'), ('RAM 16GB', 1, '899.10')):
+            PiezaVentaMostrador.objects.create(
+                venta_mostrador=venta,
+                descripcion_pieza=descripcion,
+                cantidad=cantidad,
+                precio_unitario=Decimal(precio),
+            )
+
+        # 2) Segunda venta mostrador del mismo responsable, sin paquete (activa)
+        self.orden_vm_2 = self._orden(
+            'diagnostico', self.resp_1, self.sucursal_b, dias_atras=3, tipo_servicio='venta_mostrador',
+        )
+        venta_2 = VentaMostrador.objects.create(
+            orden=self.orden_vm_2,
+            incluye_cambio_pieza=True,
+            costo_cambio_pieza=Decimal('400.00'),
+        )
+        PiezaVentaMostrador.objects.create(
+            venta_mostrador=venta_2, descripcion_pieza='SSD 1TB', cantidad=1, precio_unitario=Decimal('1299.99'),
+        )
+
+        # 3) Cotización aceptada con piezas, en reparación desde hace semanas
+        self.orden_aceptada = self._orden('reparacion', self.resp_1, self.sucursal_b, dias_atras=45)
+        self._cambio_estado(self.orden_aceptada, 'espera', 'diagnostico', dias_atras=44)
+        self._cambio_estado(self.orden_aceptada, 'diagnostico', 'reparacion', dias_atras=35)
+        cotizacion = Cotizacion.objects.create(
+            orden=self.orden_aceptada, costo_mano_obra=Decimal('250.00'), usuario_acepto=True,
+        )
+        for aceptada, cantidad, costo, precio_cliente in (
+            (True, 2, Decimal('100.00'), Decimal('150.00')),
+            (False, 1, Decimal('40.00'), None),
+        ):
+            PiezaCotizada.objects.create(
+                cotizacion=cotizacion,
+                componente=self.componente,
+                cantidad=cantidad,
+                costo_unitario=costo,
+                precio_unitario_cliente=precio_cliente,
+                aceptada_por_cliente=aceptada,
+            )
+
+        # 4) Cotización rechazada (finalizada)
+        self.orden_rechazada = self._orden('finalizado', self.resp_2, self.sucursal_a, dias_atras=12)
+        Cotizacion.objects.create(
+            orden=self.orden_rechazada, costo_mano_obra=Decimal('300.00'), usuario_acepto=False,
+        )
+
+        # 5) Cotización pendiente, sin responsable, enviada hace 10 días
+        self.orden_pendiente = self._orden('cotizacion', None, self.sucursal_a, dias_atras=20)
+        cotizacion_pendiente = Cotizacion.objects.create(
+            orden=self.orden_pendiente, costo_mano_obra=Decimal('180.00'),
+        )
+        Cotizacion.objects.filter(pk=cotizacion_pendiente.pk).update(
+            fecha_envio=self.ahora - timedelta(days=10),
+        )
+
+        # 6) Servicio normal cancelado, mes anterior
+        self.orden_cancelada = self._orden('cancelado', self.resp_2, self.sucursal_b, dias_atras=70)
+
+        self.ordenes = OrdenServicio.objects.filter(sucursal__in=[self.sucursal_a, self.sucursal_b])
+
+    def _empleado(self, nombre, email):
+        return Empleado.objects.create(
+            nombre_completo=nombre,
+            cargo='Técnico',
+            area='Laboratorio',
+            email=email,
+            sucursal=self.sucursal_a,
+        )
+
+    def _orden(self, estado, responsable, sucursal, dias_atras, tipo_servicio='diagnostico', entregada_hace=None):
+        """Orden fuera de garantía con detalle de equipo y fechas en el pasado."""
+        orden = OrdenServicio.objects.create(
+            sucursal=sucursal,
+            tipo_servicio=tipo_servicio,
+            estado=estado,
+            es_fuera_garantia=True,
+            tecnico_asignado_actual=self.tecnico,
+            responsable_seguimiento=responsable,
+        )
+        DetalleEquipo.objects.create(
+            orden=orden,
+            orden_cliente=f'OOW-MARCO-{orden.pk}',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude 5420 con un nombre de modelo bastante largo',
+            numero_serie=f'SN-MARCO-{orden.pk}',
+            email_cliente='cliente.marco@test.local',
+            falla_principal='No enciende',
+            gama='alta',
+        )
+        fecha_ingreso = self.ahora - timedelta(days=dias_atras)
+        cambios = {'fecha_ingreso': fecha_ingreso}
+        if entregada_hace is not None:
+            cambios['fecha_entrega'] = self.ahora - timedelta(days=entregada_hace)
+        OrdenServicio.objects.filter(pk=orden.pk).update(**cambios)
+        HistorialOrden.objects.filter(orden=orden).update(fecha_evento=fecha_ingreso)
+        orden.refresh_from_db()
+        return orden
+
+    def _cambio_estado(self, orden, anterior, nuevo, dias_atras):
+        evento = HistorialOrden.objects.create(
+            orden=orden, tipo_evento='cambio_estado', estado_anterior=anterior, estado_nuevo=nuevo,
+        )
+        HistorialOrden.objects.filter(pk=evento.pk).update(fecha_evento=self.ahora - timedelta(days=dias_atras))
+
+    def _sin_decimales(self, registros, campos):
+        """Convierte a float los montos Decimal para comparar con las funciones del Excel."""
+        return [{**r, **{campo: float(r[campo]) for campo in campos}} for r in registros]
+
+
+
+class MarcoOOWFLTest(DatosOOWFLBase):
+    """El marco da lo mismo que los cálculos orden por orden."""
+
+    def test_metricas_y_distribucion_como_excel(self):
+        marco = MarcoOOWFL(self.ordenes)
+        metricas = marco.metricas()
+        anteriores = calcular_metricas_generales(self.ordenes)
+
+        for llave, valor in anteriores.items():
+            with self.subTest(llave=llave):
+                self.assertEqual(float(metricas[llave]), valor)
+        self.assertIsInstance(metricas['monto_total'], Decimal)
+        self.assertEqual(marco.distribucion_estados(), calcular_distribucion_estados(self.ordenes))
+
+    def test_responsables_y_sucursales_como_excel(self):
+        marco = MarcoOOWFL(self.ordenes)
+        responsables = self._sin_decimales(
+            marco.responsables(), ('monto_ventas_mostrador', 'monto_cotizaciones', 'monto_total'),
+        )
+        anteriores = calcular_estadisticas_por_responsable(self.ordenes)
+        for anterior in anteriores:
+            anterior['tasa_finalizacion'] = anterior.pop('tasa_entrega')
+
+        self.assertEqual(responsables, anteriores)
+        self.assertIn('Sin asignar', [r['nombre'] for r in responsables])
+        self.assertEqual(marco.sucursales(), calcular_estadisticas_por_sucursal(self.ordenes))
+
+    def test_rankings_de_productos(self):
+        marco = MarcoOOWFL(self.ordenes)
+
+        self.assertEqual(marco.top_piezas(limite=5), obtener_top_productos_vendidos(self.ordenes, limite=5))
+        # El Excel sumaba floats; el marco suma centavos exactos
+        anteriores = [{**p, 'monto': round(p['monto'], 2)} for p in calcular_top_productos(self.ordenes, limite=10)]
+        self.assertEqual(marco.top_conceptos(limite=10), anteriores)
+
+    def test_dias_por_estatus_y_meses_como_utils_rhitso(self):
+        marco = MarcoOOWFL(self.ordenes)
+
+        self.assertEqual(marco.dias_por_estatus(), calcular_promedio_dias_por_estatus(self.ordenes))
+        self.assertEqual(marco.datos_mensuales(), agrupar_ordenes_por_mes(self.ordenes))
+
+    def test_filas_como_propiedades_de_la_orden(self):
+        filas = MarcoOOWFL(self.ordenes).filas()
+
+        self.assertEqual([f['id'] for f in filas], list(self.ordenes.values_list('pk', flat=True)))
+        for fila in filas:
+            orden = OrdenServicio.objects.get(pk=fila['id'])
+            with self.subTest(orden=orden.pk):
+                self.assertEqual(fila['dias_habiles'], orden.dias_habiles_en_servicio)
+                self.assertEqual(fila['dias_sin_actualizacion'], orden.dias_sin_actualizacion_estado)
+                self.assertEqual(fila['es_candidato_rhitso'], orden.es_candidato_rhitso)
+                self.assertEqual(fila['estado_display'], orden.get_estado_display())
+                self.assertEqual(fila['tipo_equipo'], orden.detalle_equipo.get_tipo_equipo_display())
+                ultima = orden.historial.order_by('-fecha_evento').first()
+                self.assertEqual(fila['ultima_actualizacion'], ultima.fecha_evento)
+
+        por_id = {f['id']: f for f in filas}
+        self.assertEqual(por_id[self.orden_vm.pk]['tipo_orden'], 'Venta Mostrador')
+        self.assertEqual(por_id[self.orden_vm.pk]['monto'], float(self.orden_vm.venta_mostrador.total_venta))
+        self.assertEqual(por_id[self.orden_aceptada.pk]['cotizacion'], '✅ Aceptada')
+        self.assertEqual(
+            por_id[self.orden_aceptada.pk]['monto'], float(self.orden_aceptada.cotizacion.costo_total_final),
+        )
+        self.assertEqual(por_id[self.orden_rechazada.pk]['tipo_orden'], 'Cotización Rechazada')
+        self.assertEqual(por_id[self.orden_pendiente.pk]['cotizacion'], '⏳ Pendiente')
+        self.assertEqual(por_id[self.orden_pendiente.pk]['responsable'], 'Sin asignar')
+        self.assertEqual(por_id[self.orden_cancelada.pk]['tipo_orden'], 'Servicio Normal')
+
+    def test_alertas_como_reglas_por_orden(self):
+        alertas = MarcoOOWFL(self.ordenes).alertas()
+
+        esperadas = {tipo: [] for tipo in alertas}
+        for orden in self.ordenes:
+            activa = orden.estado not in ['entregado', 'cancelado']
+            if activa and orden.dias_habiles_en_servicio > 15:
+                esperadas['retrasadas'].append((orden.pk, orden.dias_habiles_en_servicio))
+            if activa and orden.dias_sin_actualizacion_estado > 5:
+                esperadas['sin_actualizacion'].append((orden.pk, orden.dias_sin_actualizacion_estado))
+            if hasattr(orden, 'cotizacion') and orden.cotizacion.usuario_acepto is None:
+                if orden.cotizacion.dias_sin_respuesta > 7:
+                    esperadas['cotizaciones_pendientes'].append((orden.pk, orden.cotizacion.dias_sin_respuesta))
+            if orden.estado == 'reparacion':
+                dias = calcular_dias_por_estatus(orden).get('reparacion', 0)
+                if dias > 10:
+                    esperadas['en_reparacion_larga'].append((orden.pk, dias))
+
+        for tipo, lista in alertas.items():
+            with self.subTest(tipo=tipo):
+                esperada = sorted(esperadas[tipo], key=lambda x: x[1], reverse=True)
+                self.assertEqual([(a['orden'].pk, a['dias']) for a in lista], esperada)
+        self.assertTrue(alertas['en_reparacion_larga'])
+        self.assertTrue(alertas['cotizaciones_pendientes'])
+
+    def test_conjunto_vacio(self):
+        marco = MarcoOOWFL(OrdenServicio.objects.none())
+
+        self.assertEqual(marco.metricas()['total_ordenes'], 0)
+        self.assertEqual(marco.metricas()['tiempo_promedio'], 0)
+        self.assertEqual(marco.responsables(), [])
+        self.assertEqual(marco.top_piezas(), [])
+        self.assertEqual(marco.datos_mensuales(), [])
+        self.assertEqual(marco.dias_por_estatus(), {'estados_proceso': {}, 'estados_finales': {}})
+        self.assertEqual(marco.filas(), [])
+        self.assertTrue(all(lista == [] for lista in marco.alertas().values()))
+
+    def _consultas_del_marco(self):
+        with CaptureQueriesContext(connections['default']) as capturadas:
+            marco = MarcoOOWFL(self.ordenes)
+            marco.metricas()
+            marco.responsables()
+            marco.grafico_ventas_por_responsable(marco.responsables())
+            marco.dias_por_estatus()
+            marco.datos_mensuales()
+            marco.alertas()
+            marco.filas()
+        return len(capturadas)
+
+    def test_consultas_no_crecen_con_las_ordenes(self):
+        antes = self._consultas_del_marco()
+        for _ in range(5):
+            orden = self._orden('reparacion', self.resp_2, self.sucursal_a, dias_atras=30)
+            self._cambio_estado(orden, 'espera', 'reparacion', dias_atras=25)
+            Cotizacion.objects.create(orden=orden, costo_mano_obra=Decimal('100.00'))
+
+        self.assertEqual(self._consultas_del_marco(), antes)
+
+
+class VistasOOWFLConMarcoTest(DatosOOWFLBase):
+    """El dashboard y el Excel se arman con el marco (sin consultas por orden)."""
+
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='gerente_marco', password='x')
+
+    def _get(self, vista, **params):
+        request = self.factory.get('/', params)
+        request.user = self.user
+        return inspect.unwrap(vista)(request)
+
+    def test_dashboard_contexto(self):
+        with patch.object(views_dashboard_oow_fl, 'render') as render:
+            self._get(views_dashboard_oow_fl.dashboard_seguimiento_oow_fl)
+        contexto = render.call_args.args[2]
+
+        anteriores = calcular_metricas_generales(OrdenServicio.objects.filter(es_fuera_garantia=True))
+        self.assertEqual(contexto['metricas']['total_ordenes'], anteriores['total_ordenes'])
+        self.assertEqual(float(contexto['metricas']['monto_total']), anteriores['monto_total'])
+        self.assertEqual(contexto['total_ordenes_tabla'], 6)
+        self.assertEqual(len(contexto['alertas']['en_reparacion_larga']), 1)
+
+    def test_excel_por_responsable(self):
+        respuesta = self._get(views_dashboard_oow_fl.exportar_excel_dashboard_oow_fl, responsable_id=self.resp_1.pk)
+
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertIn('spreadsheetml', respuesta['Content-Type'])
+        self.assertTrue(respuesta.content.startswith(b'PK'))
@@ -0,0 +1,160 @@
+"""
+Tests del benchmark sintético (scripts/benchmark).
+
+Se genera una escala diminuta en la BD de prueba de México para verificar
+que los datos son deterministas, que se pueden borrar sin dejar rastro y
+que los casos principales corren sin error. En Argentina (alias que no es
+'default') se comprueba que un bloque interrumpido no deja filas a medias.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from config.middleware_pais import pais
+from scripts.benchmark import datos, medicion
+from servicio_tecnico.models import OrdenServicio
+
+
+def _silencio(*_args):
+    pass
+
+
+class GeneracionDatosTests(TestCase):
+    databases = {'default', 'mexico'}
+
+    def _generar(self, semilla=0):
+        return datos.generar('mexico', 24, semilla=semilla, hasta=date(2026, 6, 30),
+                             tamano_bloque=10, salida=_silencio)
+
+    def _huella(self):
+        with pais('mexico'):
+            return list(
+                OrdenServicio.objects.filter(numero_orden_interno__startswith=datos.PREFIJO)
+                .order_by('numero_orden_interno')
+                .values_list('numero_orden_interno', 'estado', 'tipo_servicio', 'fecha_ingreso')
+            )
+
+    def test_misma_semilla_mismos_datos(self):
+        totales = self._generar()
+        self.assertEqual(totales['ordenes'], 24)
+        primera = self._huella()
+
+        datos.limpiar('mexico', salida=_silencio)
+        self.assertEqual(self._huella(), [])
+
+        self._generar()
+        self.assertEqual(self._huella(), primera)
+
+    def test_semilla_distinta_cambia_datos(self):
+        self._generar(semilla=0)
+        primera = self._huella()
+        datos.limpiar('mexico', salida=_silencio)
+        self._generar(semilla=1)
+        self.assertNotEqual(self._huella(), primera)
+
+    def test_reanudar_salta_bloques_completos(self):
+        self._generar()
+        self.assertEqual(self._generar(), {})
+
+
+class GeneracionOtroPaisTests(TestCase):
+    """En un país que no es 'default' cada bloque es atómico en SU BD."""
+
+    databases = {'default', 'argentina'}
+
+    def _generar(self):
+        return datos.generar('argentina', 24, hasta=date(2026, 6, 30), tamano_bloque=10, salida=_silencio)
+
+    def _numeros(self):
+        with pais('argentina'):
+            return list(
+                OrdenServicio.objects.filter(numero_orden_interno__startswith=datos.PREFIJO)
+                .order_by('numero_orden_interno')
+                .values_list('numero_orden_interno', flat=True)
+            )
+
+    def test_interrumpir_a_media_de_bloque_y_reanudar(self):
+        bloque_real = datos._bloque
+
+        def bloque_cortado(subdominio, semilla, numero, inicio, cantidad, *args):
+            # El segundo bloque escribe todo menos su última orden y "muere"
+            if numero == 1:
+                bloque_real(subdominio, semilla, numero, inicio, cantidad - 1, *args)
+                raise KeyboardInterrupt
+            return bloque_real(subdominio, semilla, numero, inicio, cantidad, *args)
+
+        with patch.object(datos, '_bloque', side_effect=bloque_cortado), self.assertRaises(KeyboardInterrupt):
+            self._generar()
+        self.assertEqual(len(self._numeros()), 10)  # solo el primer bloque
+
+        totales = self._generar()
+
+        self.assertEqual(totales['ordenes'], 14)
+        self.assertEqual(len(set(self._numeros())), 24)
+        datos.limpiar('argentina', salida=_silencio)
+        self.assertEqual(self._numeros(), [])
+
+
+class MedicionCasosTests(TestCase):
+    databases = {'default', 'mexico'}
+
+    @classmethod
+    def setUpTestData(cls):
+        datos.generar('mexico', 24, hasta=date(2026, 6, 30), tamano_bloque=10, salida=_silencio)
+
+    def test_casos_corren_sin_error(self):
+        for nombre in ('dashboard_encuestas_paneles', 'lista_ordenes_activas',
+                       'buscar_orden_por_serie', 'beat_recordatorios_imagenes'):
+            with self.subTest(caso=nombre):
+                medida = medicion.medir_caso(nombre, 'mexico', repeticiones=1, calentamiento=0)
+                self.assertNotIn('error', medida)
+                self.assertGreater(medida['consultas'], 0)
+
+    def test_caso_con_error_no_detiene_la_corrida(self):
+        from scripts.benchmark.casos import CASOS
+
+        CASOS['_falla'] = ('dashboards', lambda ctx: 1 / 0)
+        self.addCleanup(CASOS.pop, '_falla')
+        medida = medicion.medir_caso('_falla', 'mexico', repeticiones=1, calentamiento=0)
+        self.assertIn('ZeroDivisionError', medida['error'])
+
+
+class CompararTests(TestCase):
+    def _corrida(self, **casos):
+        return {'meta': {}, 'casos': casos}
+
+    def _estados(self, filas):
+        return {(fila['caso'], fila['metrica']): fila['estado'] for fila in filas}
+
+    def test_regresiones_y_mejoras(self):
+        base = self._corrida(
+            a={'tiempo_ms_mediana': 100, 'consultas': 5, 'rss_pico_mb': 100},
+            b={'tiempo_ms_mediana': 100, 'consultas': 5, 'rss_pico_mb': 100},
+        )
+        nuevo = self._corrida(
+            a={'tiempo_ms_mediana': 130, 'consultas': 6, 'rss_pico_mb': 110},
+            b={'tiempo_ms_mediana': 50, 'consultas': 3, 'rss_pico_mb': None},
+        )
+        estados = self._estados(medicion.comparar(base, nuevo))
+        self.assertEqual(estados[('a', 'tiempo_ms_mediana')], 'regresion')
+        self.assertEqual(estados[('a', 'consultas')], 'regresion')
+        self.assertEqual(estados[('a', 'rss_pico_mb')], 'igual')
+        self.assertEqual(estados[('b', 'tiempo_ms_mediana')], 'mejora')
+        self.assertEqual(estados[('b', 'consultas')], 'mejora')
+        self.assertNotIn(('b', 'rss_pico_mb'), estados)
+
+    def test_diferencias_de_pocos_ms_son_ruido(self):
+        filas = medicion.comparar(
+            self._corrida(a={'tiempo_ms_mediana': 2}),
+            self._corrida(a={'tiempo_ms_mediana': 4}),
+        )
+        self.assertEqual(filas[0]['estado'], 'igual')
+
+    def test_caso_que_empieza_a_fallar_es_regresion(self):
+        filas = medicion.comparar(
+            self._corrida(a={'tiempo_ms_mediana': 10}),
+            self._corrida(a={'error': 'RuntimeError: 500'}),
+        )
+        self.assertEqual(self._estados(filas), {('a', 'error'): 'regresion'})
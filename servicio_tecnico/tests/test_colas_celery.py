@@ -0,0 +1,134 @@
+"""
+Tests de la topología de colas de Celery (config/colas_celery.py).
+"""
+
+import json
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from config import colas_celery
+from config.celery import app, marcar_hora_encolado
+
+
+def _tareas_registradas():
+    app.loader.import_default_modules()
+    return {nombre: tarea for nombre, tarea in app.tasks.items() if not nombre.startswith('celery.')}
+
+
+def _cola(nombre):
+    return app.amqp.router.route({}, nombre)['queue'].name
+
+
+class RedisFalso:
+    """Listas en memoria con la API mínima que usa estado_colas."""
+
+    def __init__(self, listas):
+        self.listas = listas
+
+    def llen(self, nombre):
+        return len(self.listas.get(nombre, []))
+
+    def lindex(self, nombre, indice):
+        return self.listas[nombre][indice]
+
+
+def _mensaje(encolada_en=None):
+    headers = {'task': 'x'}
+    if encolada_en is not None:
+        headers[colas_celery.HEADER_ENCOLADA_EN] = encolada_en
+    return json.dumps({'headers': headers, 'body': ''})
+
+
+class RutasTests(SimpleTestCase):
+    def test_todas_las_tareas_declaran_su_cola(self):
+        declaradas = {nombre for tareas in colas_celery.TAREAS_POR_COLA.values() for nombre in tareas}
+        self.assertEqual(set(_tareas_registradas()) - declaradas, set())
+
+    def test_cada_tarea_en_una_sola_cola(self):
+        nombres = [nombre for tareas in colas_celery.TAREAS_POR_COLA.values() for nombre in tareas]
+        self.assertEqual(len(nombres), len(set(nombres)))
+
+    def test_rutas(self):
+        self.assertEqual(_cola('servicio_tecnico.generar_video_resumen'), 'media')
+        self.assertEqual(_cola('servicio_tecnico.enviar_imagenes_cliente'), 'ai')
+        self.assertEqual(_cola('servicio_tecnico.enviar_feedback_satisfaccion'), 'mail')
+        self.assertEqual(_cola('servicio_tecnico.verificar_encuestas_pendientes'), 'beat')
+        self.assertEqual(_cola('servicio_tecnico.generar_exportacion_excel'), 'default')
+        self.assertEqual(_cola('tarea.no_declarada'), 'default')
+
+
+class AnotacionesTests(SimpleTestCase):
+    def setUp(self):
+        self.tareas = _tareas_registradas()
+
+    def test_limites_de_la_cola_si_la_tarea_no_declara(self):
+        correo = self.tareas['servicio_tecnico.enviar_feedback_satisfaccion']
+        self.assertEqual((correo.soft_time_limit, correo.time_limit), (240, 300))
+        vision = self.tareas['servicio_tecnico.enviar_evidencia_video']
+        self.assertEqual((vision.soft_time_limit, vision.time_limit), (900, 1020))
+
+    def test_limites_del_decorador_mandan(self):
+        video = self.tareas['servicio_tecnico.generar_video_resumen']
+        self.assertEqual((video.soft_time_limit, video.time_limit), (900, 1200))
+
+    def test_acks_late_solo_en_idempotentes(self):
+        self.assertTrue(self.tareas['notificaciones.procesar_bandeja_correo'].acks_late)
+        self.assertTrue(self.tareas['notificaciones.procesar_bandeja_correo'].reject_on_worker_lost)
+        self.assertTrue(self.tareas['servicio_tecnico.comprimir_video_evidencia'].acks_late)
+        self.assertFalse(self.tareas['servicio_tecnico.generar_video_resumen'].acks_late)
+        self.assertFalse(self.tareas['servicio_tecnico.enviar_diagnostico_cliente'].acks_late)
+
+    def test_media_no_se_reencola_si_muere_el_worker(self):
+        for nombre in colas_celery.TAREAS_POR_COLA[colas_celery.COLA_MEDIA]:
+            with self.subTest(tarea=nombre):
+                self.assertFalse(self.tareas[nombre].reject_on_worker_lost)
+
+    def test_prioridades(self):
+        self.assertEqual(self.tareas['servicio_tecnico.enviar_diagnostico_cliente'].priority, 0)
+        self.assertEqual(self.tareas['servicio_tecnico.enviar_recordatorios_encuesta_lote'].priority, 6)
+        self.assertEqual(self.tareas['servicio_tecnico.generar_video_resumen'].priority, 3)
+
+
+class HoraEncoladoTests(SimpleTestCase):
+    def test_agrega_header_sin_pisar(self):
+        headers = {}
+        with patch('config.celery.time.time', return_value=100.0):
+            marcar_hora_encolado(headers=headers)
+            self.assertEqual(headers[colas_celery.HEADER_ENCOLADA_EN], 100.0)
+            headers[colas_celery.HEADER_ENCOLADA_EN] = 50.0
+            marcar_hora_encolado(headers=headers)
+        self.assertEqual(headers[colas_celery.HEADER_ENCOLADA_EN], 50.0)
+
+
+class EstadoColasTests(SimpleTestCase):
+    def test_pendientes_y_espera_del_mas_viejo(self):
+        sep = colas_celery.SEPARADOR_PRIORIDAD
+        cliente = RedisFalso({
+            # el más viejo está a la derecha (índice -1)
+            'mail': [_mensaje(990), _mensaje(940)],
+            f'mail{sep}6': [_mensaje(900)],
+            'media': [_mensaje()],  # sin header (encolado antes del cambio)
+        })
+        filas = {fila['cola']: fila for fila in colas_celery.estado_colas(cliente, ahora=1000)}
+
+        self.assertEqual(filas['mail']['pendientes'], 3)
+        self.assertEqual(filas['mail']['por_prioridad'], {0: 2, 3: 0, 6: 1, 9: 0})
+        self.assertEqual(filas['mail']['espera_s'], 100)
+        self.assertEqual(filas['media']['pendientes'], 1)
+        self.assertIsNone(filas['media']['espera_s'])
+        self.assertEqual(filas['ai']['pendientes'], 0)
+        self.assertEqual(list(filas), list(colas_celery.COLAS))
+
+    def test_comando_json(self):
+        cliente = RedisFalso({'ai': [_mensaje(10)]})
+        conexion = MagicMock()
+        conexion.__enter__.return_value.default_channel.client = cliente
+        salida = StringIO()
+        with patch.object(app, 'connection_for_read', return_value=conexion), \
+                patch('config.colas_celery.time.time', return_value=70):
+            call_command('estado_colas_celery', '--json', '--sin-workers', stdout=salida)
+        filas = {fila['cola']: fila for fila in json.loads(salida.getvalue())}
+        self.assertEqual((filas['ai']['pendientes'], filas['ai']['espera_s']), (1, 60))
@@ -0,0 +1,176 @@
+"""
+Tests del motor de consultas agrupadas del concentrado semanal.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+Los reportes (semanal, tendencia, mensual y trimestral) ya no recorren
+órdenes en Python: la BD clasifica con Case/When y cuenta con GROUP BY.
+Aquí comprobamos que la clasificación SQL coincide con la de Python, que
+los conteos son los mismos y que los periodos cerrados salen de caché.
+"""
+
+from datetime import date, datetime, time
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.concentrado_semanal import (
+    anotar_clasificacion,
+    clasificar_sitio,
+    clasificar_tipo_equipo,
+    obtener_concentrado_semanal,
+    obtener_reporte_mensual,
+    obtener_reporte_trimestral,
+    obtener_tendencia_semanal,
+)
+from servicio_tecnico.models import DetalleEquipo, OrdenServicio
+
+CACHE_LOCAL = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+# Semana ISO 10 de 2025: lunes 3 a viernes 7 de marzo (ya cerrada).
+LUNES = date(2025, 3, 3)
+
+
+def _a_las_diez(dia):
+    """datetime consciente a las 10:00 del día indicado."""
+    return timezone.make_aware(datetime.combine(dia, time(10, 0)))
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class ConcentradoAgrupadoTest(TestCase):
+    """Clasificación en SQL, conteos agrupados y caché de periodos cerrados."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        """
+        Drop Off, Satélite y una foránea con órdenes de cada tipo.
+
+        Efectos secundarios: crea Sucursal, Empleado, OrdenServicio y
+        DetalleEquipo en la BD de test y limpia la caché local.
+        """
+        cache.clear()
+        self.drop = Sucursal.objects.create(nombre='CIS Drop Off', ciudad='CDMX')
+        self.satelite = Sucursal.objects.create(nombre='CIS Satelite', ciudad='CDMX')
+        self.foranea = Sucursal.objects.create(nombre='Monterrey', ciudad='MTY')
+        self.tecnico = Empleado.objects.create(
+            nombre_completo='Técnico Concentrado',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='concentrado@test.local',
+            sucursal=self.drop,
+        )
+
+        self.lenovo = self._orden(self.drop, LUNES, marca='Lenovo')
+        self.oow = self._orden(self.drop, LUNES, marca='Dell', orden_cliente=' oow-123')
+        self.mis = self._orden(self.satelite, date(2025, 3, 5), marca='Dell', es_mis=True)
+        self.fl = self._orden(self.satelite, date(2025, 3, 5), marca='Lenovo', orden_cliente='FL-9')
+        self.hp = self._orden(self.drop, date(2025, 3, 7), marca='HP')
+        self.foranea_dell = self._orden(self.foranea, LUNES, marca='Dell')
+        self.sin_detalle = self._orden(self.drop, LUNES, detalle=False)
+        self.sabado = self._orden(self.drop, date(2025, 3, 8), marca='Dell')
+        self.cancelada = self._orden(self.drop, LUNES, marca='Dell', estado='cancelado')
+
+        # Egreso: la Lenovo sale el jueves de la misma semana
+        OrdenServicio.objects.filter(pk=self.lenovo.pk).update(
+            fecha_finalizacion=_a_las_diez(date(2025, 3, 6)),
+        )
+
+    def _orden(self, sucursal, dia, *, marca='Dell', orden_cliente='', es_mis=False,
+               estado='espera', detalle=True):
+        """Crea una orden con fecha de ingreso fija (y su detalle si aplica)."""
+        orden = OrdenServicio.objects.create(
+            sucursal=sucursal,
+            tipo_servicio='diagnostico',
+            estado=estado,
+            tecnico_asignado_actual=self.tecnico,
+        )
+        OrdenServicio.objects.filter(pk=orden.pk).update(fecha_ingreso=_a_las_diez(dia))
+        if detalle:
+            DetalleEquipo.objects.create(
+                orden=orden,
+                orden_cliente=orden_cliente,
+                es_mis=es_mis,
+                tipo_equipo='Laptop',
+                marca=marca,
+                modelo='Modelo',
+                numero_serie=f'SN-CONC-{orden.pk}',
+                email_cliente='cliente@test.local',
+                falla_principal='No enciende',
+                gama='media',
+            )
+        return orden
+
+    def test_clasificacion_sql_coincide_con_python(self):
+        """Case/When da el mismo sitio y tipo que clasificar_sitio/tipo_equipo."""
+        anotadas = anotar_clasificacion(
+            OrdenServicio.objects.select_related('sucursal', 'detalle_equipo')
+        )
+        for orden in anotadas:
+            self.assertEqual(orden.sitio_concentrado, clasificar_sitio(orden.sucursal.nombre))
+            detalle = getattr(orden, 'detalle_equipo', None)
+            esperado = clasificar_tipo_equipo(detalle) if detalle else None
+            self.assertEqual(orden.tipo_concentrado, esperado, msg=orden.pk)
+
+    def test_concentrado_semanal_cuenta_y_cachea_semana_cerrada(self):
+        """Conteos por día/sitio/tipo; la segunda llamada no toca la BD."""
+        datos = obtener_concentrado_semanal(LUNES)
+
+        self.assertEqual(datos['ingreso']['DROP OFF']['LENOVO']['Lunes'], 1)
+        self.assertEqual(datos['ingreso']['DROP OFF']['OOW']['Lunes'], 1)
+        self.assertEqual(datos['ingreso']['DROP OFF']['OOW']['Viernes'], 1)
+        self.assertEqual(datos['ingreso']['SATELITE']['MIS DELL']['Miércoles'], 1)
+        self.assertEqual(datos['ingreso']['SATELITE']['OOW']['Miércoles'], 1)
+        self.assertEqual(datos['totales_ingreso']['total'], 5)
+        self.assertEqual(datos['mail_in_service'], 1)
+        self.assertEqual(datos['carry_in_dropoff'], 3)
+        self.assertEqual(datos['carry_in_sic'], 1)
+        self.assertEqual(datos['egreso']['DROP OFF']['LENOVO']['Jueves'], 1)
+        # Asignación cuenta todas las órdenes L-V del técnico (foránea y sin detalle incluidas)
+        self.assertEqual(datos['asignacion'][0]['nombre'], 'Técnico Concentrado')
+        self.assertEqual(datos['asignacion'][0]['total'], 7)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(obtener_concentrado_semanal(LUNES), datos)
+
+    def test_filtro_de_sucursal_entra_en_la_clave_de_cache(self):
+        """Un filtro distinto no reutiliza el concentrado de otro filtro."""
+        obtener_concentrado_semanal(LUNES)
+
+        datos = obtener_concentrado_semanal(LUNES, sucursal_id=self.satelite.pk)
+
+        self.assertEqual(datos['totales_ingreso']['total'], 2)
+
+    def test_reporte_mensual_y_trimestral_comparten_una_consulta_por_fecha(self):
+        """Dos consultas agrupadas para todo el año; el año cerrado queda en caché."""
+        with self.assertNumQueries(2):
+            mensual = obtener_reporte_mensual(2025)
+
+        marzo = mensual['meses_lista'][2]
+        # Mensual: todas las órdenes no canceladas (sábado, foránea y sin detalle incluidas)
+        self.assertEqual(marzo['ingreso'], 8)
+        self.assertEqual(marzo['egreso'], 1)
+        self.assertEqual(mensual['Q1']['total_ingreso'], 8)
+
+        with self.assertNumQueries(0):
+            trimestral = obtener_reporte_trimestral(2025)
+
+        # Trimestral: solo Drop Off / Satélite con detalle
+        self.assertEqual(trimestral['Q1']['total_ingreso'], 6)
+        self.assertEqual(trimestral['Q1']['ingreso']['DROP OFF']['DELL'], 1)
+        self.assertEqual(trimestral['Q1']['ingreso']['DROP OFF']['OOW'], 2)
+        self.assertEqual(trimestral['Q1']['egreso']['DROP OFF']['LENOVO'], 1)
+        self.assertEqual(trimestral['Q2']['total_ingreso'], 0)
+
+    def test_tendencia_semanal_por_semana_iso(self):
+        """Semanas ISO del año; solo días hábiles."""
+        tendencia = obtener_tendencia_semanal(2025)
+
+        self.assertEqual(len(tendencia['semanas']), 52)
+        self.assertEqual(tendencia['etiquetas'][0], 'S1')
+        self.assertEqual(tendencia['ingresos'][9], 7)
+        self.assertEqual(tendencia['egresos'][9], 1)
+        self.assertEqual(sum(tendencia['ingresos']), 7)
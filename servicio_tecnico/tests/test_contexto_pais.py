@@ -0,0 +1,176 @@
+"""
+Tests del contexto de país basado en contextvars (config/middleware_pais.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) `with pais(...)` activa el país, se puede anidar y siempre restaura.
+2) El decorador funciona en funciones sync y async; dos corrutinas a la vez
+   ven cada una su propio país.
+3) en_todos_los_paises() corre la función en hilos, cada uno con su país,
+   y separa los errores sin frenar a los demás países.
+4) El middleware (también en modo async) y los hooks de Celery usan el
+   mismo contexto que consulta el DB Router.
+"""
+
+import asyncio
+import threading
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from config.celery import configurar_contexto_pais, limpiar_contexto_pais
+from config.db_router import PaisDBRouter
+from config.middleware_pais import (
+    PaisMiddleware,
+    en_todos_los_paises,
+    get_current_db_alias,
+    get_current_pais_codigo,
+    pais,
+    sumar_resultados,
+)
+from config.paises_config import PAISES_CONFIG, get_pais_actual
+from servicio_tecnico.models import OrdenServicio
+
+
+class PaisContextManagerTest(SimpleTestCase):
+    """API `with pais(...)` / `@pais(...)`."""
+
+    def test_bloque_activa_anida_y_restaura(self):
+        self.assertEqual(get_current_db_alias(), 'default')
+
+        with pais('argentina') as pais_config:
+            self.assertEqual(pais_config['codigo'], 'AR')
+            self.assertEqual(get_current_db_alias(), 'argentina')
+            with pais('chile'):
+                self.assertEqual(get_pais_actual()['codigo'], 'CL')
+            self.assertEqual(get_current_pais_codigo(), 'AR')
+
+        self.assertEqual(get_current_db_alias(), 'default')
+
+    def test_restaura_aunque_haya_error(self):
+        with self.assertRaises(RuntimeError):
+            with pais('colombia'):
+                raise RuntimeError('falla dentro del bloque')
+
+        self.assertIsNone(get_current_pais_codigo())
+
+    def test_pais_desconocido(self):
+        with self.assertRaises(ValueError):
+            pais('narnia')
+
+    def test_router_usa_el_contexto(self):
+        router = PaisDBRouter()
+
+        with pais('chile'):
+            self.assertEqual(router.db_for_read(OrdenServicio), 'chile')
+        self.assertEqual(router.db_for_read(OrdenServicio), 'default')
+
+    def test_decorador_sync_y_async(self):
+        @pais('argentina')
+        def alias_sync():
+            return get_current_db_alias()
+
+        @pais('colombia')
+        async def alias_async():
+            await asyncio.sleep(0)
+            return get_current_db_alias()
+
+        self.assertEqual(alias_sync(), 'argentina')
+        self.assertEqual(asyncio.run(alias_async()), 'colombia')
+        self.assertEqual(get_current_db_alias(), 'default')
+
+    def test_corrutinas_concurrentes_no_se_mezclan(self):
+        async def leer_dos_veces(subdominio):
+            with pais(subdominio):
+                antes = get_current_db_alias()
+                await asyncio.sleep(0.01)
+                return antes, get_current_db_alias()
+
+        async def ambas():
+            return await asyncio.gather(leer_dos_veces('chile'), leer_dos_veces('argentina'))
+
+        self.assertEqual(
+            asyncio.run(ambas()),
+            [('chile', 'chile'), ('argentina', 'argentina')],
+        )
+
+
+class EnTodosLosPaisesTest(SimpleTestCase):
+    """Fan-out concurrente sobre PAISES_CONFIG."""
+
+    def test_cada_hilo_ve_su_pais(self):
+        barrera = threading.Barrier(len(PAISES_CONFIG), timeout=5)
+
+        def contar():
+            # Si los países corrieran uno tras otro, la barrera expiraría
+            barrera.wait()
+            return {'alias': get_current_db_alias(), 'conteo': 2}
+
+        with pais('chile'):
+            resultados, errores = en_todos_los_paises(contar, max_hilos=len(PAISES_CONFIG))
+            self.assertEqual(get_current_db_alias(), 'chile')
+
+        self.assertEqual(errores, {})
+        self.assertEqual(
+            {sub: r['alias'] for sub, r in resultados.items()},
+            {sub: cfg['db_alias'] for sub, cfg in PAISES_CONFIG.items()},
+        )
+        self.assertEqual(sumar_resultados(resultados), {'conteo': 2 * len(PAISES_CONFIG)})
+
+    def test_error_de_un_pais_no_frena_a_los_demas(self):
+        def fallar_en_argentina():
+            if get_current_db_alias() == 'argentina':
+                raise ConnectionError('BD caída')
+            return {'procesadas': 1}
+
+        with self.assertLogs('config.middleware_pais', level='ERROR'):
+            resultados, errores = en_todos_los_paises(fallar_en_argentina)
+
+        self.assertEqual(list(errores), ['argentina'])
+        self.assertIsInstance(errores['argentina'], ConnectionError)
+        self.assertEqual(set(resultados), set(PAISES_CONFIG) - {'argentina'})
+
+    @override_settings(PAISES_HILOS_MAX=1)
+    def test_un_hilo_corre_en_el_hilo_actual(self):
+        hilo_actual = threading.get_ident()
+
+        resultados, _errores = en_todos_los_paises(
+            lambda: threading.get_ident(), paises=['mexico', 'chile'],
+        )
+
+        self.assertEqual(set(resultados.values()), {hilo_actual})
+
+
+@override_settings(ALLOWED_HOSTS=['.sigmasystem.work'])
+class MiddlewareYCeleryTest(SimpleTestCase):
+    """El middleware y los hooks de Celery activan el mismo contexto."""
+
+    def test_middleware_async(self):
+        async def vista(request):
+            await asyncio.sleep(0)
+            return HttpResponse(get_current_db_alias())
+
+        middleware = PaisMiddleware(vista)
+        request = RequestFactory().get('/', HTTP_HOST='argentina.sigmasystem.work')
+
+        response = asyncio.run(middleware(request))
+
+        self.assertEqual(response.content, b'argentina')
+        self.assertEqual(request.pais_codigo, 'AR')
+        self.assertEqual(get_current_db_alias(), 'default')
+
+    def test_middleware_sync(self):
+        middleware = PaisMiddleware(lambda request: HttpResponse(get_current_db_alias()))
+        request = RequestFactory().get('/', HTTP_HOST='colombia.sigmasystem.work')
+
+        self.assertEqual(middleware(request).content, b'colombia')
+        self.assertEqual(get_current_db_alias(), 'default')
+
+    def test_hooks_de_celery(self):
+        configurar_contexto_pais(task_id='t-1', task=None, args=(), kwargs={'db_alias': 'chile'})
+        self.assertEqual(get_current_db_alias(), 'chile')
+
+        limpiar_contexto_pais(
+            task_id='t-1', task=None, args=(), kwargs={}, retval=None, state='SUCCESS',
+        )
+        self.assertEqual(get_current_db_alias(), 'default')
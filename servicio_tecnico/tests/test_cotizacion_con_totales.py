@@ -0,0 +1,104 @@
+"""
+Tests de Cotizacion.objects.con_totales() y los costos de piezas.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+costo_total_piezas, costo_piezas_aceptadas, monto_piezas_aceptadas_cobro, etc.
+dan lo mismo anotados, sobre piezas precargadas o consultando; los dos
+primeros caminos no tocan la BD al leer la propiedad.
+"""
+
+from decimal import Decimal
+
+from django.test import TestCase
+
+from inventario.models import Empleado, Sucursal
+from scorecard.models import ComponenteEquipo
+from servicio_tecnico.models import Cotizacion, OrdenServicio, PiezaCotizada
+
+PROPIEDADES = (
+    'costo_total_piezas',
+    'costo_piezas_aceptadas',
+    'costo_piezas_rechazadas',
+    'monto_piezas_aceptadas_cobro',
+    'precio_piezas_aceptadas_cliente',
+    'margen_estimado',
+    'costo_total_final',
+)
+
+
+class CotizacionConTotalesTest(TestCase):
+    """Anotación, prefetch y consulta dan los mismos costos."""
+
+    def setUp(self):
+        sucursal = Sucursal.objects.create(nombre='Sucursal Totales', ciudad='CDMX')
+        empleado = Empleado.objects.create(
+            nombre_completo='Técnico Totales',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='tec.totales@test.local',
+            sucursal=sucursal,
+            rol='tecnico',
+        )
+        componente = ComponenteEquipo.objects.create(
+            nombre='Pantalla Totales', tipo_equipo='laptop', activo=True,
+        )
+        self.cotizaciones = []
+        for _ in range(2):
+            orden = OrdenServicio.objects.create(
+                sucursal=sucursal,
+                tipo_servicio='diagnostico',
+                estado='cotizacion',
+                tecnico_asignado_actual=empleado,
+            )
+            cotizacion = Cotizacion.objects.create(
+                orden=orden, costo_mano_obra=Decimal('100.00'), usuario_acepto=True,
+            )
+            piezas = (
+                (True, 2, Decimal('100.00'), Decimal('150.00')),
+                (True, 1, Decimal('80.00'), None),
+                (False, 1, Decimal('40.00'), Decimal('70.00')),
+                (None, 1, Decimal('10.00'), None),
+            )
+            for aceptada, cantidad, costo, precio_cliente in piezas:
+                PiezaCotizada.objects.create(
+                    cotizacion=cotizacion,
+                    componente=componente,
+                    cantidad=cantidad,
+                    costo_unitario=costo,
+                    precio_unitario_cliente=precio_cliente,
+                    aceptada_por_cliente=aceptada,
+                )
+            self.cotizaciones.append(cotizacion)
+
+    def _valores(self, cotizacion):
+        return {propiedad: getattr(cotizacion, propiedad) for propiedad in PROPIEDADES}
+
+    def test_tres_caminos_mismo_resultado(self):
+        pk = self.cotizaciones[0].pk
+
+        consultando = self._valores(Cotizacion.objects.get(pk=pk))
+
+        anotada = Cotizacion.objects.con_totales().get(pk=pk)
+        with self.assertNumQueries(0):
+            anotado = self._valores(anotada)
+
+        precargada = Cotizacion.objects.prefetch_related('piezas_cotizadas').get(pk=pk)
+        with self.assertNumQueries(0):
+            en_memoria = self._valores(precargada)
+
+        self.assertEqual(consultando, anotado)
+        self.assertEqual(consultando, en_memoria)
+        self.assertEqual(consultando['costo_total_piezas'], Decimal('330.00'))
+        self.assertEqual(consultando['costo_piezas_aceptadas'], Decimal('280.00'))
+        self.assertEqual(consultando['costo_piezas_rechazadas'], Decimal('40.00'))
+        # 2 × 150 (precio cliente) + 1 × 80 (sin precio → costo proveedor)
+        self.assertEqual(consultando['monto_piezas_aceptadas_cobro'], Decimal('380.00'))
+        self.assertEqual(consultando['precio_piezas_aceptadas_cliente'], Decimal('300.00'))
+        self.assertEqual(consultando['costo_total_final'], Decimal('480.00'))
+
+    def test_lista_en_una_consulta(self):
+        with self.assertNumQueries(1):
+            totales = [c.costo_total_final for c in Cotizacion.objects.con_totales()]
+
+        self.assertEqual(totales, [Decimal('480.00')] * 2)
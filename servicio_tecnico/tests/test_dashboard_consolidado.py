@@ -0,0 +1,247 @@
+"""
+Tests del dashboard consolidado de países (services/dashboard_consolidado.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) consolidar() suma conteos, formatea por país y convierte a moneda base
+   solo los países con tipo de cambio.
+2) Un país ya cacheado no se vuelve a consultar; uno que no responde a
+   tiempo sale como "sin datos" sin frenar a los demás.
+3) kpis_pais() cuenta órdenes reales en la BD del país activo.
+"""
+
+import json
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from config.middleware_pais import pais
+from config.paises_config import PAISES_CONFIG, formato_moneda
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.models import OrdenServicio
+from servicio_tecnico.services import dashboard_consolidado
+from servicio_tecnico.services.dashboard_consolidado import (
+    consolidar,
+    kpis_pais,
+    obtener_kpis_consolidados,
+)
+from servicio_tecnico.views_dashboard_consolidado import dashboard_consolidado as dashboard_consolidado_vista
+
+User = get_user_model()
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def _kpis(**valores):
+    """Dict con la forma de kpis_pais() (todo en cero salvo lo indicado)."""
+    base = {campo: 0 for campo in dashboard_consolidado.CAMPOS_CONTEO}
+    base.update({campo: 0.0 for campo in dashboard_consolidado.CAMPOS_IMPORTE})
+    base.update(valores)
+    return base
+
+
+def _rango():
+    fin = timezone.now()
+    return fin - timedelta(days=30), fin
+
+
+class ConsolidarTest(SimpleTestCase):
+    """Unión de resultados por país (sin BD)."""
+
+    def test_suma_conteos_y_convierte_solo_con_tipo_cambio(self):
+        parciales = {
+            'mexico': _kpis(ordenes_ingresadas=5, total_cotizaciones=4, cotizaciones_aceptadas=2,
+                            valor_total_cotizado=1000.0, valor_aceptado=600.0),
+            'chile': _kpis(ordenes_ingresadas=3, total_cotizaciones=1, cotizaciones_aceptadas=1,
+                           valor_total_cotizado=50000.0, valor_aceptado=50000.0),
+            'argentina': _kpis(ordenes_ingresadas=2, valor_total_cotizado=9999.0),
+        }
+        configs = {
+            'mexico': {**PAISES_CONFIG['mexico'], 'moneda_tipo_cambio_base': 1.0},
+            'chile': {**PAISES_CONFIG['chile'], 'moneda_tipo_cambio_base': 0.02},
+            'argentina': {**PAISES_CONFIG['argentina'], 'moneda_tipo_cambio_base': 0.0},
+        }
+
+        with mock.patch.dict(dashboard_consolidado.PAISES_CONFIG, configs):
+            resultado = consolidar(['mexico', 'chile', 'argentina'], parciales)
+
+        totales = resultado['totales']
+        self.assertEqual(totales['ordenes_ingresadas'], 10)
+        self.assertEqual(totales['tasa_aceptacion'], 60.0)
+        # 1000 MXN + 50000 CLP * 0.02; Argentina (sin tipo de cambio) no suma
+        self.assertEqual(totales['valor_total_cotizado_base'], 2000.0)
+        self.assertEqual(totales['valor_aceptado_base'], 1600.0)
+        self.assertEqual(totales['ticket_promedio_base'], 400.0)
+        self.assertEqual(resultado['paises_sin_tipo_cambio'], ['argentina'])
+        self.assertEqual(resultado['moneda_base'], 'MXN')
+
+        chile = resultado['paises'][1]
+        self.assertEqual(chile['valor_total_cotizado_fmt'], formato_moneda(50000.0, configs['chile']))
+        self.assertEqual(chile['tasa_aceptacion'], 100.0)
+
+    def test_pais_con_error_queda_sin_datos(self):
+        resultado = consolidar(
+            ['mexico', 'colombia'],
+            {'mexico': _kpis(ordenes_activas=7)},
+            errores={'colombia': TimeoutError('colombia: sin respuesta en 1s')},
+        )
+
+        self.assertEqual(resultado['paises_sin_datos'], ['colombia'])
+        self.assertEqual(resultado['totales']['ordenes_activas'], 7)
+        self.assertIn('sin respuesta', resultado['paises'][1]['error'])
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class FanOutConsolidadoTest(SimpleTestCase):
+    """Caché por país y tiempo límite del fan-out."""
+
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(PAISES_HILOS_MAX=1)
+    def test_pais_en_cache_no_se_vuelve_a_consultar(self):
+        fecha_inicio, fecha_fin = _rango()
+        consultados = []
+
+        def kpis_falsos(_inicio, _fin):
+            from config.middleware_pais import get_current_db_alias
+            consultados.append(get_current_db_alias())
+            return _kpis(ordenes_activas=1)
+
+        with mock.patch.object(dashboard_consolidado, 'kpis_pais', side_effect=kpis_falsos):
+            primero = obtener_kpis_consolidados(fecha_inicio, fecha_fin, paises=['mexico', 'chile'])
+            segundo = obtener_kpis_consolidados(fecha_inicio, fecha_fin, paises=['mexico', 'chile'])
+
+        self.assertEqual(consultados, ['mexico', 'chile'])
+        self.assertFalse(any(fila['desde_cache'] for fila in primero['paises']))
+        self.assertTrue(all(fila['desde_cache'] for fila in segundo['paises']))
+        self.assertEqual(segundo['totales']['ordenes_activas'], 2)
+
+    @override_settings(PAISES_HILOS_MAX=4)
+    def test_pais_lento_no_frena_a_los_demas(self):
+        fecha_inicio, fecha_fin = _rango()
+        liberar = threading.Event()
+
+        def kpis_falsos(_inicio, _fin):
+            from config.middleware_pais import get_current_db_alias
+            if get_current_db_alias() == 'chile':
+                liberar.wait(5)
+            return _kpis(ordenes_activas=1)
+
+        with mock.patch.object(dashboard_consolidado, 'kpis_pais', side_effect=kpis_falsos), \
+                self.assertLogs('config.middleware_pais', level='WARNING'):
+            inicio = time.monotonic()
+            resultado = obtener_kpis_consolidados(
+                fecha_inicio, fecha_fin, paises=['mexico', 'chile'], tiempo_limite=0.2,
+            )
+            transcurrido = time.monotonic() - inicio
+            liberar.set()
+
+        self.assertLess(transcurrido, 4)
+        self.assertEqual(resultado['paises_sin_datos'], ['chile'])
+        self.assertEqual(resultado['totales']['ordenes_activas'], 1)
+
+    @override_settings(PAISES_HILOS_MAX=4)
+    def test_recarga_no_lanza_otro_hilo_para_el_pais_en_curso(self):
+        # Rango propio: el hilo lento de otro test puede seguir escribiendo
+        # en la llave del rango por defecto (la llave es por día)
+        fecha_inicio, fecha_fin = (fecha - timedelta(days=400) for fecha in _rango())
+        liberar = threading.Event()
+        llamadas_chile = []
+
+        def kpis_falsos(_inicio, _fin):
+            from config.middleware_pais import get_current_db_alias
+            if get_current_db_alias() == 'chile':
+                llamadas_chile.append(1)
+                liberar.wait(5)
+            return _kpis(ordenes_activas=1)
+
+        with mock.patch.object(dashboard_consolidado, 'kpis_pais', side_effect=kpis_falsos), \
+                self.assertLogs('config.middleware_pais', level='WARNING'):
+            for _ in range(3):
+                resultado = obtener_kpis_consolidados(
+                    fecha_inicio, fecha_fin, paises=['mexico', 'chile'], tiempo_limite=0.2,
+                )
+            self.assertEqual(len(llamadas_chile), 1)
+            self.assertEqual(resultado['paises_sin_datos'], ['chile'])
+            self.assertIn('en curso', resultado['paises'][1]['error'])
+
+            # Al terminar, el hilo deja su caché y suelta el candado
+            liberar.set()
+            for _ in range(50):
+                if not cache.get(dashboard_consolidado._clave_calculando(
+                        dashboard_consolidado._clave_cache('chile', fecha_inicio, fecha_fin))):
+                    break
+                time.sleep(0.05)
+            final = obtener_kpis_consolidados(
+                fecha_inicio, fecha_fin, paises=['mexico', 'chile'], tiempo_limite=0.2,
+            )
+
+        self.assertEqual(len(llamadas_chile), 1)
+        self.assertEqual(final['paises_sin_datos'], [])
+        self.assertEqual(final['totales']['ordenes_activas'], 2)
+
+
+@override_settings(CACHES=CACHE_LOCAL, PAISES_HILOS_MAX=1)
+class KpisPaisTest(TestCase):
+    """Consultas reales sobre la BD del país activo."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        cache.clear()
+        with pais('mexico'):
+            sucursal = Sucursal.objects.create(nombre='Sucursal Consolidado', ciudad='CDMX')
+            tecnico = Empleado.objects.create(
+                nombre_completo='Técnico Consolidado',
+                cargo='Técnico',
+                area='Laboratorio',
+                email='tec.consolidado@test.local',
+                sucursal=sucursal,
+                user=User.objects.create_user(username='tec_consolidado', password='x'),
+                rol='tecnico',
+            )
+            for estado, fuera_garantia in (('diagnostico', True), ('reparacion', False), ('entregado', True)):
+                OrdenServicio.objects.create(
+                    sucursal=sucursal,
+                    tipo_servicio='diagnostico',
+                    estado=estado,
+                    es_fuera_garantia=fuera_garantia,
+                    tecnico_asignado_actual=tecnico,
+                )
+        self.usuario = User.objects.create_superuser('gerente_consolidado', 'g@test.local', 'x')
+
+    def test_cuenta_ordenes_del_pais(self):
+        fecha_inicio, fecha_fin = _rango()
+        fecha_fin += timedelta(minutes=1)
+
+        with pais('mexico'):
+            kpis = kpis_pais(fecha_inicio, fecha_fin)
+
+        self.assertEqual(kpis['ordenes_ingresadas'], 3)
+        self.assertEqual(kpis['ordenes_activas'], 2)
+        self.assertEqual(kpis['ordenes_fuera_garantia_activas'], 1)
+        self.assertEqual(kpis['total_cotizaciones'], 0)
+        self.assertIsInstance(kpis['valor_total_cotizado'], float)
+
+    def test_vista_json(self):
+        # RequestFactory (no client.login) para no pasar por Django-Axes
+        manana = (timezone.localdate() + timedelta(days=1)).strftime('%Y-%m-%d')
+        request = RequestFactory().get('/', {'formato': 'json', 'fecha_fin': manana})
+        request.user = self.usuario
+
+        with mock.patch.object(dashboard_consolidado, 'PAISES_CONFIG',
+                               {'mexico': PAISES_CONFIG['mexico']}):
+            response = dashboard_consolidado_vista(request)
+
+        self.assertEqual(response.status_code, 200)
+        datos = json.loads(response.content.decode())
+        self.assertEqual(datos['fecha_fin'], manana)
+        self.assertEqual(datos['paises_sin_datos'], [])
+        self.assertEqual(datos['totales']['ordenes_activas'], 2)
@@ -0,0 +1,226 @@
+"""
+Tests del detalle de orden con pocas consultas y fragmentos en caché.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+- Imágenes y videos se leen con una consulta cada uno y se agrupan en Python.
+- Los "correo ya enviado" son flags de la orden que marca el signal de
+  HistorialOrden, no búsquedas de texto en el historial.
+- Historial, galería y tabla de piezas se cachean por orden; cualquier
+  escritura relacionada sube la versión y el siguiente GET los re-renderiza.
+- La página completa tiene un tope de consultas que este test vigila.
+"""
+
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
+from django.db import connections
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.models import DetalleEquipo, HistorialOrden, ImagenOrden, OrdenServicio
+from servicio_tecnico.services.detalle_orden_cache import (
+    invalidar_fragmentos_detalle,
+    versiones_fragmentos_detalle,
+)
+from servicio_tecnico.services.detalle_orden_context import build_detalle_orden_context
+from servicio_tecnico.views_detalle_orden import detalle_orden
+
+User = get_user_model()
+
+MEDIA_TEMPORAL = tempfile.mkdtemp(prefix='sigma_detalle_test_')
+
+CACHE_LOCAL = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+STORAGES_TEST = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# Tope de consultas de un GET con los fragmentos ya en caché. Si sube, alguna
+# sección volvió a consultar por tipo o por fila: revisar antes de aumentarlo.
+CONSULTAS_MAXIMAS_DETALLE = 20
+
+TABLA_HISTORIAL = HistorialOrden._meta.db_table
+TABLA_IMAGENES = ImagenOrden._meta.db_table
+
+
+def _consultas_a(consultas, tabla):
+    """SELECTs capturados que leen de la tabla indicada."""
+    return [
+        q['sql'] for q in consultas.captured_queries
+        if q['sql'].startswith('SELECT') and f'FROM "{tabla}"' in q['sql']
+    ]
+
+
+@override_settings(CACHES=CACHE_LOCAL, STORAGES=STORAGES_TEST, MEDIA_ROOT=MEDIA_TEMPORAL)
+class DetalleOrdenConsultasTest(TestCase):
+    """Tope de consultas, multimedia agrupada, flags de correo e invalidación."""
+
+    databases = {'default', 'mexico'}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_TEMPORAL, ignore_errors=True)
+
+    def setUp(self):
+        """
+        Orden en diagnóstico con detalle, fotos de varios tipos e historial.
+
+        Efectos secundarios: crea Sucursal, User, Empleado, OrdenServicio,
+        DetalleEquipo, ImagenOrden e HistorialOrden; limpia la caché local.
+        """
+        cache.clear()
+        self.factory = RequestFactory()
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Detalle', ciudad='CDMX')
+        self.user = User.objects.create_user(username='detalle_consultas', password='x')
+        self.empleado = Empleado.objects.create(
+            nombre_completo='Técnico Detalle',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='detalle.consultas@test.local',
+            sucursal=self.sucursal,
+            user=self.user,
+            rol='tecnico',
+            contraseña_configurada=True,
+        )
+        ct = ContentType.objects.get_for_model(OrdenServicio)
+        self.user.user_permissions.add(
+            Permission.objects.get(content_type=ct, codename='view_ordenservicio'),
+        )
+        self.orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            estado='diagnostico',
+            tecnico_asignado_actual=self.empleado,
+        )
+        DetalleEquipo.objects.create(
+            orden=self.orden,
+            orden_cliente='OOW-DETALLE-1',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie='SN-DETALLE-1',
+            email_cliente='cliente.detalle@test.local',
+            falla_principal='No enciende',
+            gama='media',
+        )
+        for tipo in ('ingreso', 'ingreso', 'diagnostico', 'reparacion', 'egreso', 'identificacion_oow'):
+            ImagenOrden.objects.create(
+                orden=self.orden,
+                tipo=tipo,
+                imagen=f'servicio_tecnico/imagenes/{tipo}.jpg',
+                subido_por=self.empleado,
+            )
+        for n in range(3):
+            HistorialOrden.objects.create(
+                orden=self.orden,
+                tipo_evento='comentario',
+                comentario=f'Comentario de prueba {n}',
+                usuario=self.empleado,
+            )
+
+    def _request(self):
+        """GET autenticado con sesión y mensajes (sin middleware de país)."""
+        request = self.factory.get('/')
+        request.user = self.user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def _cargar_orden(self):
+        """La orden como la carga la vista (sin caché de relaciones previa)."""
+        return OrdenServicio.objects.select_related('detalle_equipo').get(pk=self.orden.pk)
+
+    def test_multimedia_agrupada_en_una_consulta(self):
+        """Una sola lectura de imágenes; listas por tipo y total con todos los tipos."""
+        with CaptureQueriesContext(connections['default']) as consultas:
+            ctx = build_detalle_orden_context(self._request(), self._cargar_orden())
+
+        self.assertEqual(len(_consultas_a(consultas, TABLA_IMAGENES)), 1)
+        self.assertEqual(len(ctx['imagenes_por_tipo']['ingreso']), 2)
+        self.assertEqual(ctx['imagenes_por_tipo']['autorizacion'], [])
+        self.assertNotIn('identificacion_oow', ctx['imagenes_por_tipo'])
+        self.assertEqual(ctx['total_imagenes'], 6)
+        self.assertEqual(ctx['n_fotos_para_resumen'], 5)
+        self.assertTrue(ctx['tiene_4_tipos_fotos'])
+        self.assertFalse(ctx['tiene_3_tipos_fotos'])
+        self.assertIsNone(ctx['video_resumen'])
+        # El historial queda perezoso: no se consultó al armar el context
+        self.assertEqual(_consultas_a(consultas, TABLA_HISTORIAL), [])
+
+    def test_flags_de_correo_los_marca_el_historial(self):
+        """Un evento 'email' con la frase marca el flag en BD y en la instancia."""
+        orden = self._cargar_orden()
+        HistorialOrden.objects.create(
+            orden=orden,
+            tipo_evento='email',
+            comentario='📧 Video rewind — imágenes de egreso enviadas al cliente (x@test.local)',
+        )
+        HistorialOrden.objects.create(
+            orden=orden,
+            tipo_evento='comentario',
+            comentario='Se enviarán las imágenes de ingreso mañana',
+        )
+
+        self.assertTrue(orden.correo_rewind_enviado)
+        self.assertTrue(orden.correo_imagenes_egreso_enviado)
+        orden.save()
+        orden.refresh_from_db()
+        self.assertTrue(orden.correo_rewind_enviado)
+        self.assertTrue(orden.correo_imagenes_egreso_enviado)
+        self.assertFalse(orden.correo_imagenes_ingreso_enviado)
+
+    def test_get_con_fragmentos_en_cache_respeta_el_tope(self):
+        """El segundo GET no lee el historial y queda bajo el tope de consultas."""
+        primera = detalle_orden(self._request(), orden_id=self.orden.pk)
+        self.assertEqual(primera.status_code, 200)
+
+        with CaptureQueriesContext(connections['default']) as consultas:
+            segunda = detalle_orden(self._request(), orden_id=self.orden.pk)
+
+        self.assertEqual(segunda.status_code, 200)
+        self.assertEqual(_consultas_a(consultas, TABLA_HISTORIAL), [])
+        self.assertLessEqual(len(consultas.captured_queries), CONSULTAS_MAXIMAS_DETALLE)
+        self.assertIn('Comentario de prueba 2', segunda.content.decode('utf-8'))
+
+    def test_escritura_relacionada_invalida_los_fragmentos(self):
+        """Un comentario nuevo sube la versión y aparece en el siguiente GET."""
+        detalle_orden(self._request(), orden_id=self.orden.pk)
+
+        HistorialOrden.objects.create(
+            orden=self.orden,
+            tipo_evento='comentario',
+            comentario='Comentario posterior al caché',
+            usuario=self.empleado,
+        )
+        response = detalle_orden(self._request(), orden_id=self.orden.pk)
+
+        self.assertIn('Comentario posterior al caché', response.content.decode('utf-8'))
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class VersionFragmentosAliasTest(SimpleTestCase):
+    """'default' y 'mexico' son la misma BD: comparten el contador de la orden."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_escritura_via_default_invalida_la_version_de_mexico(self):
+        antes = versiones_fragmentos_detalle('mexico', [7])[7]
+        otro_pais = versiones_fragmentos_detalle('argentina', [7])[7]
+
+        invalidar_fragmentos_detalle(7, 'default')
+
+        self.assertNotEqual(versiones_fragmentos_detalle('mexico', [7])[7], antes)
+        self.assertEqual(versiones_fragmentos_detalle('argentina', [7])[7], otro_pais)
@@ -0,0 +1,269 @@
+"""
+Tests del motor Excel en streaming y de las exportaciones en segundo plano.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+Validamos tres capas:
+1) LibroStreaming: anchos calculados, estilos con nombre y títulos combinados.
+2) generar_exportacion_excel_task: guarda el .xlsx y avisa en la campanita
+   con un enlace firmado que solo abre el dueño.
+3) La vista de export encola en Celery cuando el volumen supera el umbral.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from openpyxl import load_workbook
+
+from inventario.models import Empleado, Sucursal
+from notificaciones.models import Notificacion
+from servicio_tecnico import views_export_garantia, views_exportaciones
+from servicio_tecnico.models import DetalleEquipo, OrdenServicio
+from servicio_tecnico.services.excel_streaming import LibroStreaming
+from servicio_tecnico.services.exportaciones_excel import (
+    encolar_exportacion,
+    leer_token_descarga,
+    limpiar_exportaciones_vencidas,
+)
+from servicio_tecnico.tasks import generar_exportacion_excel_task
+
+User = get_user_model()
+
+MEDIA_TEMPORAL = tempfile.mkdtemp(prefix='sigma_export_test_')
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+STORAGES_TEST = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+
+def _leer(libro):
+    """Serializa un LibroStreaming y lo vuelve a abrir en modo normal."""
+    buffer = BytesIO()
+    libro.guardar(buffer)
+    return load_workbook(BytesIO(buffer.getvalue()))
+
+
+class LibroStreamingTest(SimpleTestCase):
+    """Motor write-only: anchos, estilos con nombre y combinados."""
+
+    def test_anchos_se_miden_con_las_filas_de_muestra(self):
+        """La columna más larga define el ancho (acotado por ancho_max)."""
+        libro = LibroStreaming()
+        hoja = libro.hoja('Datos', ancho_max=30)
+        hoja.fila(['Folio', 'Descripción'], estilo='encabezado')
+        hoja.fila(['A1', 'x' * 80])
+
+        ws = _leer(libro)['Datos']
+
+        self.assertEqual(ws.column_dimensions['A'].width, 10)
+        self.assertEqual(ws.column_dimensions['B'].width, 30)
+        self.assertEqual(ws['B2'].value, 'x' * 80)
+
+    def test_estilos_con_nombre_y_titulo_combinado(self):
+        """Cada color es un named style; el título no infla el ancho."""
+        libro = LibroStreaming()
+        hoja = libro.hoja('Resumen')
+        hoja.titulo_combinado('TÍTULO MUY LARGO ' * 10, 3, alto=30)
+        hoja.fila(['Estado', 'Monto', 'Nota'], estilo='encabezado')
+        hoja.fila(
+            ['Espera', 1500.5, 'ok'],
+            estilos={1: 'estado_dc3545', 2: 'celda_moneda', 3: 'celda@ede9fe'},
+        )
+
+        wb = _leer(libro)
+        ws = wb['Resumen']
+
+        self.assertIn('A1:C1', [str(r) for r in ws.merged_cells.ranges])
+        self.assertEqual(ws.row_dimensions[1].height, 30)
+        self.assertLess(ws.column_dimensions['A'].width, 20)
+        self.assertEqual(ws['A3'].style, 'sigma_estado_dc3545')
+        self.assertEqual(ws['A3'].fill.fgColor.rgb, '00dc3545')
+        self.assertEqual(ws['B3'].number_format, '#,##0.00')
+        self.assertEqual(ws['C3'].fill.fgColor.rgb, '00ede9fe')
+
+    def test_nombres_de_hoja_validos_y_unicos(self):
+        """Caracteres prohibidos fuera, máximo 31 y sin duplicados."""
+        libro = LibroStreaming()
+        libro.hoja('Ana/Pérez: [Soporte]')
+        libro.hoja('Ana/Pérez: [Soporte]')
+        libro.hoja('N' * 40)
+
+        self.assertEqual(
+            libro.sheetnames,
+            ['AnaPérez Soporte', 'AnaPérez Soporte_2', 'N' * 31],
+        )
+
+    def test_estilo_desconocido_falla(self):
+        """Un nombre fuera del catálogo es un error de programación."""
+        with self.assertRaises(KeyError):
+            LibroStreaming().estilo('no_existe')
+
+
+@override_settings(STORAGES=STORAGES_TEST, MEDIA_ROOT=MEDIA_TEMPORAL, CACHES=CACHE_LOCAL)
+class ExportacionSegundoPlanoTest(TestCase):
+    """La tarea guarda el archivo y la campanita lleva a la descarga."""
+
+    databases = {'default', 'mexico'}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_TEMPORAL, ignore_errors=True)
+
+    def setUp(self):
+        """
+        Usuario gerencial con una orden en garantía.
+
+        Efectos secundarios: crea Sucursal, User, Empleado y OrdenServicio.
+        """
+        from django.contrib.messages.storage.fallback import FallbackStorage
+        from django.contrib.sessions.backends.db import SessionStore
+
+        self.factory = RequestFactory()
+        self.SessionStore = SessionStore
+        self.FallbackStorage = FallbackStorage
+
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Export', ciudad='CDMX')
+        self.user = User.objects.create_user(username='export_fondo', password='x')
+        self.otro = User.objects.create_user(username='export_ajeno', password='x')
+        ct = ContentType.objects.get_for_model(OrdenServicio)
+        self.user.user_permissions.add(
+            Permission.objects.get(content_type=ct, codename='view_dashboard_gerencial'),
+        )
+        self.empleado = Empleado.objects.create(
+            nombre_completo='Responsable Export',
+            cargo='Gerente',
+            area='Administración',
+            email='export.fondo@test.local',
+            sucursal=self.sucursal,
+        )
+        orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            estado='espera',
+            es_fuera_garantia=False,
+            tecnico_asignado_actual=self.empleado,
+            responsable_seguimiento=self.empleado,
+        )
+        DetalleEquipo.objects.create(
+            orden=orden,
+            orden_cliente='SIC-FONDO-01',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie='SN-FONDO-01',
+            email_cliente='fondo@test.local',
+            falla_principal='Pantalla',
+            gama='media',
+        )
+
+    def _request(self, vista, usuario, *args, query=None):
+        """GET autenticado con sesión y mensajes (sin middleware de país)."""
+        request = self.factory.get('/', data=query or {})
+        request.user = usuario
+        request.session = self.SessionStore()
+        request.session.create()
+        request._messages = self.FallbackStorage(request)
+        return vista(request, *args)
+
+    def test_tarea_guarda_archivo_y_notifica_con_enlace(self):
+        """SUCCESS: notificación con URL firmada que solo abre el dueño."""
+        with patch.object(generar_exportacion_excel_task, 'update_state') as progreso:
+            resultado = generar_exportacion_excel_task(
+                tipo='base_garantia',
+                parametros={},
+                usuario_id=self.user.pk,
+            )
+
+        self.assertTrue(resultado['success'])
+        self.assertTrue(progreso.called)
+        notificacion = Notificacion.objects.get(usuario=self.user, tipo='exito')
+        self.assertEqual(notificacion.url, resultado['url'])
+
+        token = resultado['url'].rstrip('/').rsplit('/', 1)[-1]
+        self.assertEqual(leer_token_descarga(token)['usuario'], self.user.pk)
+
+        response = self._request(
+            views_exportaciones.descargar_exportacion_excel, self.user, token,
+        )
+        self.assertEqual(response.status_code, 200)
+        wb = load_workbook(BytesIO(b''.join(response.streaming_content)))
+        folios = [
+            fila[0]
+            for fila in wb['Todas las Órdenes'].iter_rows(min_row=4, max_col=1, values_only=True)
+        ]
+        self.assertIn('SIC-FONDO-01', folios)
+
+        with self.assertRaises(Http404):
+            self._request(views_exportaciones.descargar_exportacion_excel, self.otro, token)
+
+    def test_token_alterado_no_descarga(self):
+        """Una firma inválida responde 404."""
+        with self.assertRaises(Http404):
+            self._request(
+                views_exportaciones.descargar_exportacion_excel, self.user, 'token-falso',
+            )
+
+    def test_volumen_grande_se_encola(self):
+        """Sobre el umbral la vista no arma el Excel: encola y redirige."""
+        with patch.object(views_export_garantia, 'EXPORT_MAX_FILAS_SINCRONO', 0), \
+                patch('servicio_tecnico.services.exportaciones_excel.encolar_exportacion') as encolar:
+            response = self._request(
+                views_export_garantia.exportar_excel_base_garantia,
+                self.user,
+                query={'estado': 'espera'},
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('estado=espera', response.url)
+        tipo, parametros, usuario, _db_alias = encolar.call_args.args
+        self.assertEqual(tipo, 'base_garantia')
+        self.assertEqual(parametros['estado'], 'espera')
+        self.assertEqual(usuario, self.user)
+
+    @patch('servicio_tecnico.views_exportaciones.AsyncResult')
+    def test_estado_solo_lo_ve_quien_encolo(self, mock_resultado):
+        """Otro usuario con el task_id recibe 404 (no ve la URL de descarga)."""
+        mock_resultado.return_value = MagicMock(
+            state='SUCCESS', result={'success': True, 'url': '/descarga/firmada/'},
+        )
+        with patch('servicio_tecnico.tasks.generar_exportacion_excel_task.delay') as delay:
+            delay.return_value.id = 'tarea-export-1'
+            task_id = encolar_exportacion('base_garantia', {}, self.user)
+
+        response = self._request(views_exportaciones.estado_exportacion_excel, self.user, task_id)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'/descarga/firmada/', response.content)
+
+        with self.assertRaises(Http404):
+            self._request(views_exportaciones.estado_exportacion_excel, self.otro, task_id)
+        with self.assertRaises(Http404):
+            self._request(views_exportaciones.estado_exportacion_excel, self.user, 'tarea-inventada')
+
+    def test_limpieza_borra_solo_exportaciones_vencidas(self):
+        """Los .xlsx con el enlace vencido se borran; los recientes se quedan."""
+        carpeta = os.path.join(MEDIA_TEMPORAL, 'exportaciones', str(self.user.pk), '202610')
+        os.makedirs(carpeta, exist_ok=True)
+        vieja, nueva = os.path.join(carpeta, 'vieja.xlsx'), os.path.join(carpeta, 'nueva.xlsx')
+        for ruta in (vieja, nueva):
+            with open(ruta, 'wb') as archivo:
+                archivo.write(b'xlsx')
+        hace_ocho_dias = time.time() - 8 * 24 * 3600
+        os.utime(vieja, (hace_ocho_dias, hace_ocho_dias))
+
+        self.assertEqual(limpiar_exportaciones_vencidas(), {'exportaciones': 1})
+        self.assertFalse(os.path.exists(vieja))
+        self.assertTrue(os.path.exists(nueva))
@@ -331,7 +331,11 @@ class ExportBaseGarantiaExcelTest(TestCase):
         El resumen no escribe 'Ventas Mostrador' (KPI que sí trae el OOW).
         """
         ordenes = construir_queryset_export()
-        wb = generar_workbook_base_garantia(ordenes, 'Todos los registros')
+        libro = generar_workbook_base_garantia(ordenes, 'Todos los registros')
+        # El libro es write-only: hay que serializarlo para leer celdas.
+        buffer = BytesIO()
+        libro.guardar(buffer)
+        wb = load_workbook(BytesIO(buffer.getvalue()))
         ws = wb['Resumen General']
         textos = [
             celda.value
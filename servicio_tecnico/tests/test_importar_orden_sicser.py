@@ -7,12 +7,14 @@ redirect: concatenar '?tab=garantia' al *nombre* de la vista. Django intenta
 hacer reverse de ese string y falla (NoReverseMatch). Estos tests cubren eso.
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth.models import Permission, User
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.contrib.sessions.middleware import SessionMiddleware
+from django.http import Http404
 from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 
@@ -436,12 +438,10 @@ class ConsultarSicserPestanasImportadasTest(TestCase):
         self.user.user_permissions.add(perm)
         self.listado = reverse('servicio_tecnico:consultar_sicser')
 
-    @patch('servicio_tecnico.sicser_client.fetch_listado_garantias')
-    @patch('servicio_tecnico.sicser_client.fetch_listado_oow')
+    @patch('servicio_tecnico.sicser_client.descargar_registros_crudos')
     def test_tabs_importadas_hoy_e_historico_responden_200(
         self,
-        mock_oow,
-        mock_garantia,
+        mock_descarga,
     ):
         """
         Ambas pestañas locales responden 200 sin depender de la API real.
@@ -450,8 +450,7 @@ class ConsultarSicserPestanasImportadasTest(TestCase):
         Usamos RequestFactory (no Client) para no pasar por middleware que
         redirige (cambio de contraseña, etc.) y solo probar la vista.
         """
-        mock_oow.return_value = ([], 0)
-        mock_garantia.return_value = ([], 0)
+        mock_descarga.return_value = []
 
         for tab in ('importadas_hoy', 'importadas'):
             with self.subTest(tab=tab):
@@ -467,3 +466,248 @@ class ConsultarSicserPestanasImportadasTest(TestCase):
                     self.assertIn('Órdenes importadas a SIGMA hoy', html)
                 else:
                     self.assertIn('Histórico de órdenes importadas a SIGMA', html)
+
+
+def _oow_crudo(id_orden, **extra):
+    """Registro crudo OOW mínimo (MX) como lo devuelve la API de SICSER."""
+    item = {
+        'id_orden': id_orden,
+        'folio': f'MX_CIS_MX_DROPOFF_{id_orden:05d}',
+        'service_tag': f'STLOTE{id_orden}',
+        'nombre_cliente': f'Cliente Lote {id_orden}',
+        'marca': 'Dell',
+        'modelo': 'Latitude 5420',
+        'email': f'lote{id_orden}@test.local',
+        'fecha': '2026-10-01 10:00:00',
+    }
+    item.update(extra)
+    return item
+
+
+class ImportarOrdenesSicserLoteTest(TestCase):
+    """
+    importar_ordenes_sicser_en_lote: folios por bloque, duplicados y avance.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El espejo se llena con sincronizar_origen (sin API real). Contamos las
+    consultas al espejo y al contador de folios: deben ser una por lote /
+    bloque, no una por orden.
+    """
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        """Espejo OOW con 5 registros + usuario técnico."""
+        from servicio_tecnico.sicser_espejo import sincronizar_origen
+
+        self.sucursal = Sucursal.objects.create(nombre='Drop Off Lote', ciudad='CDMX')
+        self.user = User.objects.create_user(username='lote_sicser', password='testpass123')
+        Empleado.objects.create(
+            nombre_completo='Lote SICSER',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='lote.sicser@test.local',
+            sucursal=self.sucursal,
+            user=self.user,
+        )
+        sincronizar_origen('oow', [_oow_crudo(i) for i in range(1, 6)], 'MX')
+
+    def _importar(self, identificadores, **kwargs):
+        from servicio_tecnico.sicser_import import importar_ordenes_sicser_en_lote
+
+        return importar_ordenes_sicser_en_lote('oow', identificadores, self.user, 'MX', **kwargs)
+
+    def test_crea_ordenes_con_folios_consecutivos(self):
+        """Por id o por folio; espejo marcado y datos iguales a la individual."""
+        from servicio_tecnico.models import OrdenSicserEspejo
+
+        filas = self._importar(['1', 'MX_CIS_MX_DROPOFF_00002', '3'])
+
+        self.assertEqual([f['estado'] for f in filas], ['creada'] * 3)
+        folios = [f['numero_orden_interno'] for f in filas]
+        consecutivos = [int(folio.rsplit('-', 1)[1]) for folio in folios]
+        self.assertEqual(consecutivos, list(range(consecutivos[0], consecutivos[0] + 3)))
+
+        detalle = DetalleEquipo.objects.select_related('orden').get(sicser_id_externo='2')
+        self.assertEqual(detalle.orden.numero_orden_interno, folios[1])
+        self.assertEqual(detalle.numero_serie, 'STLOTE2')
+        self.assertEqual(detalle.sicser_origen, 'oow')
+        self.assertEqual(detalle.orden.sucursal, self.sucursal)
+        self.assertTrue(detalle.orden.es_fuera_garantia)
+        self.assertEqual(
+            set(OrdenSicserEspejo.objects.filter(ya_importada=True).values_list('id_externo', flat=True)),
+            {'1', '2', '3'},
+        )
+
+    def test_duplicados_repetidos_y_no_encontrados(self):
+        """Lo ya importado o repetido no se crea; lo desconocido queda en error."""
+        self._importar(['1'])
+
+        with patch('servicio_tecnico.sicser_import.buscar_registro', return_value=None):
+            filas = self._importar(['1', '2', 'MX_CIS_MX_DROPOFF_00002', 'NOEXISTE', '999'])
+
+        self.assertEqual(
+            [f['estado'] for f in filas],
+            ['duplicada', 'creada', 'duplicada', 'error', 'error'],
+        )
+        self.assertEqual(filas[2]['mensaje'], 'Repetida en la lista.')
+        self.assertEqual(DetalleEquipo.objects.filter(sicser_origen='oow').count(), 2)
+
+    def test_consultas_por_lote_no_por_orden(self):
+        """Espejo: 1 SELECT para todo; contador de folios: 1 UPDATE por bloque."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from servicio_tecnico.models import ContadorFolio, OrdenSicserEspejo
+
+        OrdenServicio.reservar_folios(1, 'default')  # contador ya sembrado
+        tabla_espejo = OrdenSicserEspejo._meta.db_table
+        tabla_contador = ContadorFolio._meta.db_table
+        avance = []
+
+        with patch('servicio_tecnico.sicser_import.TAMANO_LOTE_IMPORTACION', 2), \
+                CaptureQueriesContext(connection) as consultas:
+            filas = self._importar(
+                ['1', '2', '3', '4', '5'],
+                progreso=lambda procesadas, total: avance.append((procesadas, total)),
+            )
+
+        sql = [consulta['sql'] for consulta in consultas.captured_queries]
+        self.assertEqual([f['estado'] for f in filas], ['creada'] * 5)
+        self.assertEqual(
+            sum(1 for q in sql if q.startswith('SELECT') and f'FROM "{tabla_espejo}"' in q), 1,
+        )
+        self.assertEqual(sum(1 for q in sql if q.startswith('UPDATE') and tabla_contador in q), 3)
+        self.assertEqual(sum(1 for q in sql if q.startswith('UPDATE') and tabla_espejo in q), 3)
+        self.assertEqual(avance, [(0, 5), (2, 5), (4, 5), (5, 5)])
+
+    def test_folios_se_reservan_fuera_de_la_transaccion_del_bloque(self):
+        """El candado del contador no dura los guardados del bloque."""
+        from django.db import connections
+
+        conexion = connections['default']
+        profundidad = {}
+        reservar = OrdenServicio.reservar_folios
+        guardar = OrdenServicio.save
+
+        def reservar_espia(cantidad, using):
+            profundidad.setdefault('reserva', len(connections[using].atomic_blocks))
+            return reservar(cantidad, using)
+
+        def guardar_espia(orden, *args, **kwargs):
+            profundidad.setdefault('guardado', len(conexion.atomic_blocks))
+            return guardar(orden, *args, **kwargs)
+
+        base = len(conexion.atomic_blocks)
+        with patch.object(OrdenServicio, 'reservar_folios', side_effect=reservar_espia), \
+                patch.object(OrdenServicio, 'save', guardar_espia):
+            filas = self._importar(['1', '2'])
+
+        self.assertEqual([f['estado'] for f in filas], ['creada'] * 2)
+        self.assertEqual(profundidad['reserva'], base)
+        self.assertEqual(profundidad['guardado'], base + 2)  # bloque + savepoint
+
+    def test_lista_demasiado_larga(self):
+        """Más de MAX_IDENTIFICADORES_LOTE → error de negocio sin tocar la BD."""
+        from servicio_tecnico.sicser_import import MAX_IDENTIFICADORES_LOTE
+
+        with self.assertRaises(SicserImportError):
+            self._importar([str(i) for i in range(MAX_IDENTIFICADORES_LOTE + 1)])
+
+    def test_parsear_identificadores(self):
+        """Líneas, comas, espacios y punto y coma; sin repetidos."""
+        from servicio_tecnico.sicser_import import parsear_identificadores_sicser
+
+        self.assertEqual(
+            parsear_identificadores_sicser(' 12\n13, 14;12  MX_CIS_A_1\n'),
+            ['12', '13', '14', 'MX_CIS_A_1'],
+        )
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ImportarOrdenesSicserLoteVistaTest(TestCase):
+    """La vista encola la tarea (202) o rechaza la petición (400)."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        """Usuario con permiso add_ordenservicio."""
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='lote_vista', password='testpass123')
+        self.user.user_permissions.add(Permission.objects.get(
+            content_type=ContentType.objects.get_for_model(OrdenServicio),
+            codename='add_ordenservicio',
+        ))
+        self.url = reverse('servicio_tecnico:importar_ordenes_sicser_lote')
+
+    def _post(self, data):
+        request = self.factory.post(self.url, data)
+        request.user = self.user
+        return views_sicser.importar_ordenes_sicser_lote(request)
+
+    @patch('servicio_tecnico.tasks.importar_ordenes_sicser_lote_task.delay')
+    def test_encola_y_devuelve_url_de_estado(self, mock_delay):
+        """202 con task_id; la tarea recibe la lista ya separada."""
+        mock_delay.return_value = MagicMock(id='tarea-lote-1')
+
+        response = self._post({'tipo': 'oow', 'identificadores': '11\n12, 13', 'sucursal_id': ''})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(
+            json.loads(response.content)['url_estado'],
+            reverse('servicio_tecnico:estado_importacion_sicser_lote', args=['tarea-lote-1']),
+        )
+        kwargs = mock_delay.call_args.kwargs
+        self.assertEqual(kwargs['identificadores'], ['11', '12', '13'])
+        self.assertEqual(kwargs['origen'], 'oow')
+        self.assertIsNone(kwargs['sucursal_id'])
+
+    @patch('celery.result.AsyncResult')
+    @patch('servicio_tecnico.tasks.importar_ordenes_sicser_lote_task.delay')
+    def test_estado_solo_para_quien_encolo(self, mock_delay, mock_resultado):
+        """Las filas (órdenes de cliente) no se muestran a otro usuario con el task_id."""
+        mock_delay.return_value = MagicMock(id='tarea-lote-2')
+        mock_resultado.return_value = MagicMock(
+            state='SUCCESS',
+            result={'success': True, 'filas': [{'orden_cliente': 'OOW-1'}], 'creadas': 1},
+        )
+        self._post({'tipo': 'oow', 'identificadores': '11'})
+        otro = User.objects.create_user(username='lote_ajeno', password='testpass123')
+        otro.user_permissions.add(*self.user.user_permissions.all())
+
+        def _estado(usuario):
+            request = self.factory.get('/x/')
+            request.user = usuario
+            return views_sicser.estado_importacion_sicser_lote(request, task_id='tarea-lote-2')
+
+        respuesta = json.loads(_estado(self.user).content)
+        self.assertEqual(respuesta['filas'], [{'orden_cliente': 'OOW-1'}])
+        with self.assertRaises(Http404):
+            _estado(otro)
+
+    @patch('servicio_tecnico.tasks.importar_ordenes_sicser_lote_task.delay')
+    def test_sin_folios_responde_400(self, mock_delay):
+        """Sin identificadores no se encola nada."""
+        response = self._post({'tipo': 'garantia', 'identificadores': ' \n '})
+
+        self.assertEqual(response.status_code, 400)
+        mock_delay.assert_not_called()
+
+    @patch('servicio_tecnico.sicser_client.descargar_registros_crudos')
+    def test_panel_con_pendientes_de_la_pagina(self, mock_descarga):
+        """La pestaña OOW muestra «Importar varias» con los ids pendientes."""
+        from servicio_tecnico.sicser_espejo import sincronizar_origen
+
+        mock_descarga.return_value = []
+        sincronizar_origen('oow', [_oow_crudo(21), _oow_crudo(22)], 'MX')
+        self.user.user_permissions.add(Permission.objects.get(
+            content_type=ContentType.objects.get_for_model(OrdenServicio),
+            codename='view_ordenservicio',
+        ))
+        request = self.factory.get(reverse('servicio_tecnico:consultar_sicser'), {'tab': 'oow'})
+        request.user = User.objects.get(pk=self.user.pk)  # permisos sin caché
+
+        html = views_sicser.consultar_sicser(request).content.decode()
+
+        self.assertIn('Importar varias órdenes OOW', html)
+        self.assertRegex(html, r'data-pendientes="(22 21|21 22) "')
@@ -0,0 +1,106 @@
+"""
+Tests del índice en memoria de ReferenciaGamaEquipo.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+obtener_gama() / obtener_gamas() deben responder lo mismo que la búsqueda
+original contra la BD (exacta primero, luego la primera referencia cuyo
+modelo_base aparece en el modelo), pero sin consultar la BD en cada
+llamada y rearmándose cuando cambia el catálogo.
+"""
+
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from servicio_tecnico.models import ReferenciaGamaEquipo
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def _obtener_gama_en_bd(marca, modelo):
+    """Búsqueda original (una consulta por paso) para comparar resultados."""
+    referencia = ReferenciaGamaEquipo.objects.filter(
+        marca__iexact=marca, modelo_base__iexact=modelo, activo=True,
+    ).first()
+    if referencia:
+        return referencia
+    for ref in ReferenciaGamaEquipo.objects.filter(marca__iexact=marca, activo=True):
+        if ref.modelo_base.lower() in modelo.lower():
+            return ref
+    return None
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class IndiceGamasTest(TestCase):
+    """El índice da las mismas referencias que la BD y se invalida al editar."""
+
+    def setUp(self):
+        cache.clear()
+        catalogo = (
+            ('Lenovo', 'ThinkPad', 'alta', True),
+            ('Lenovo', 'ThinkPad X1', 'alta', True),
+            ('Lenovo', 'IdeaPad', 'media', True),
+            ('Lenovo', 'Legion', 'alta', False),
+            ('Dell', 'Inspiron', 'media', True),
+            ('Dell', 'Inspiron 15', 'baja', True),
+            ('Dell', 'Latitude', 'alta', True),
+            ('HP', 'Pavilion', 'media', True),
+        )
+        for marca, modelo_base, gama, activo in catalogo:
+            ReferenciaGamaEquipo.objects.create(
+                marca=marca,
+                modelo_base=modelo_base,
+                gama=gama,
+                rango_costo_min=Decimal('1000.00'),
+                rango_costo_max=Decimal('2000.00'),
+                activo=activo,
+            )
+
+    def test_mismas_respuestas_que_la_bd(self):
+        pares = [
+            (marca, modelo)
+            for marca in ('Lenovo', 'LENOVO', 'dell', 'HP', 'Acer')
+            for modelo in (
+                'ThinkPad', 'thinkpad x1 carbon', 'ThinkPad T14', 'IdeaPad 3',
+                'Legion 5', 'Inspiron 15', 'INSPIRON 15 3000', 'Inspiron 14',
+                'Latitude 5420', 'Pavilion x360', 'Aspire 5', '',
+            )
+        ]
+        esperadas = [_obtener_gama_en_bd(marca, modelo) for marca, modelo in pares]
+
+        self.assertEqual(ReferenciaGamaEquipo.obtener_gamas(pares), esperadas)
+        self.assertEqual(
+            [ReferenciaGamaEquipo.obtener_gama(marca, modelo) for marca, modelo in pares],
+            esperadas,
+        )
+        self.assertEqual(ReferenciaGamaEquipo.obtener_gama('Dell', 'Inspiron 15 3520').gama, 'media')
+
+    def test_lote_sin_consultas_con_indice_armado(self):
+        ReferenciaGamaEquipo.obtener_gama('Dell', 'Latitude')
+
+        with self.assertNumQueries(0):
+            gamas = [
+                referencia.gama if referencia else None
+                for referencia in ReferenciaGamaEquipo.obtener_gamas(
+                    [('Dell', 'Latitude 7440'), ('HP', 'Pavilion 15'), ('Acer', 'Nitro')] * 50,
+                )
+            ]
+
+        self.assertEqual(gamas, ['alta', 'media', None] * 50)
+
+    def test_editar_catalogo_rearma_el_indice(self):
+        self.assertIsNone(ReferenciaGamaEquipo.obtener_gama('Acer', 'Nitro 5'))
+
+        ReferenciaGamaEquipo.objects.create(
+            marca='Acer',
+            modelo_base='Nitro',
+            gama='alta',
+            rango_costo_min=Decimal('1000.00'),
+            rango_costo_max=Decimal('2000.00'),
+        )
+        self.assertEqual(ReferenciaGamaEquipo.obtener_gama('Acer', 'Nitro 5').gama, 'alta')
+
+        ReferenciaGamaEquipo.objects.filter(modelo_base='Pavilion').get().delete()
+        self.assertIsNone(ReferenciaGamaEquipo.obtener_gama('HP', 'Pavilion 15'))
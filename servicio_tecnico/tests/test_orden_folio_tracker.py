@@ -0,0 +1,157 @@
+"""
+Tests de la foto de campos de OrdenServicio y del contador de folios.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+- Guardar una orden ya cargada no debe volver a leerla de la BD: el
+  estado/técnico anteriores salen de la foto tomada en from_db.
+- Los folios ORD-<año>-NNNN salen de ContadorFolio y continúan la
+  numeración que ya existía.
+"""
+
+from django.db import connections
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.models import ContadorFolio, HistorialOrden, OrdenServicio
+
+TABLA_ORDEN = OrdenServicio._meta.db_table
+
+
+class OrdenServicioTrackerFolioTest(TestCase):
+    """Cambios detectados sin SELECT extra y folios consecutivos."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        """
+        Sucursal con dos técnicos.
+
+        Efectos secundarios: crea Sucursal y Empleado en la BD de test.
+        """
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Folios', ciudad='CDMX')
+        self.tecnico = Empleado.objects.create(
+            nombre_completo='Técnico Uno',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='folio.uno@test.local',
+            sucursal=self.sucursal,
+        )
+        self.otro_tecnico = Empleado.objects.create(
+            nombre_completo='Técnico Dos',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='folio.dos@test.local',
+            sucursal=self.sucursal,
+        )
+        self.año = timezone.now().year
+
+    def _crear_orden(self, **extra):
+        """Orden mínima en diagnóstico."""
+        return OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            estado='espera',
+            tecnico_asignado_actual=self.tecnico,
+            **extra,
+        )
+
+    def test_folios_consecutivos_desde_el_contador(self):
+        """Cada orden nueva recibe el siguiente número del año."""
+        primera = self._crear_orden()
+        segunda = self._crear_orden()
+
+        self.assertEqual(primera.numero_orden_interno, f'ORD-{self.año}-0001')
+        self.assertEqual(segunda.numero_orden_interno, f'ORD-{self.año}-0002')
+        contador = ContadorFolio.objects.get(
+            clave=ContadorFolio.CLAVE_ORDEN_SERVICIO, año=self.año,
+        )
+        self.assertEqual(contador.ultimo_numero, 2)
+
+    def test_contador_continua_la_numeracion_existente(self):
+        """La primera vez se siembra con el mayor folio numérico ya usado."""
+        self._crear_orden(numero_orden_interno=f'ORD-{self.año}-9999')
+        self._crear_orden(numero_orden_interno=f'ORD-{self.año}-10000')
+
+        nueva = self._crear_orden()
+
+        self.assertEqual(nueva.numero_orden_interno, f'ORD-{self.año}-10001')
+
+    def test_reservar_bloque_de_folios(self):
+        """Un bloque reserva N consecutivos con un UPDATE; save() sigue después."""
+        self._crear_orden()
+
+        bloque = OrdenServicio.reservar_folios(3, 'default')
+        siguiente = self._crear_orden()
+
+        self.assertEqual(bloque, [f'ORD-{self.año}-{n:04d}' for n in (2, 3, 4)])
+        self.assertEqual(siguiente.numero_orden_interno, f'ORD-{self.año}-0005')
+
+    def test_guardar_orden_cargada_no_vuelve_a_leerla(self):
+        """Cambio de estado y técnico sin SELECT a la tabla de órdenes."""
+        orden = OrdenServicio.objects.get(pk=self._crear_orden().pk)
+        orden.estado = 'diagnostico'
+        orden.tecnico_asignado_actual = self.otro_tecnico
+
+        with CaptureQueriesContext(connections['default']) as consultas:
+            orden.save()
+
+        lecturas_orden = [
+            q['sql'] for q in consultas.captured_queries
+            if q['sql'].startswith('SELECT') and f'FROM "{TABLA_ORDEN}"' in q['sql']
+        ]
+        self.assertEqual(lecturas_orden, [])
+        self.assertTrue(HistorialOrden.objects.filter(
+            orden=orden, tipo_evento='cambio_estado',
+            estado_anterior='espera', estado_nuevo='diagnostico',
+        ).exists())
+        self.assertTrue(HistorialOrden.objects.filter(
+            orden=orden, tipo_evento='cambio_tecnico', tecnico_anterior=self.tecnico,
+        ).exists())
+
+    def test_segundo_save_compara_contra_lo_ultimo_guardado(self):
+        """Tras guardar, la foto se actualiza: no se repite el historial."""
+        orden = OrdenServicio.objects.get(pk=self._crear_orden().pk)
+        orden.estado = 'diagnostico'
+        orden.save()
+        orden.save()
+
+        self.assertEqual(
+            HistorialOrden.objects.filter(orden=orden, tipo_evento='cambio_estado').count(),
+            1,
+        )
+
+    def test_save_parcial_no_da_por_guardados_los_demas_campos(self):
+        """update_fields=['estado'] no marca el técnico cambiado en memoria como original."""
+        orden = OrdenServicio.objects.get(pk=self._crear_orden().pk)
+        orden.estado = 'diagnostico'
+        orden.tecnico_asignado_actual = self.otro_tecnico
+        orden.save(update_fields=['estado'])
+
+        self.assertEqual(orden.valor_original('tecnico_asignado_actual_id'), self.tecnico.pk)
+        self.assertFalse(
+            HistorialOrden.objects.filter(orden=orden, tipo_evento='cambio_tecnico').exists(),
+        )
+
+        orden.save()
+
+        self.assertTrue(HistorialOrden.objects.filter(
+            orden=orden, tipo_evento='cambio_tecnico', tecnico_anterior=self.tecnico,
+        ).exists())
+        self.assertEqual(
+            OrdenServicio.objects.get(pk=orden.pk).tecnico_asignado_actual_id,
+            self.otro_tecnico.pk,
+        )
+        self.assertEqual(
+            HistorialOrden.objects.filter(orden=orden, tipo_evento='cambio_estado').count(),
+            1,
+        )
+
+    def test_instancia_armada_a_mano_consulta_el_valor_original(self):
+        """Sin foto (no salió de una consulta) se lee una vez de la BD."""
+        orden = self._crear_orden()
+        suelta = OrdenServicio(pk=orden.pk)
+
+        self.assertEqual(suelta.valor_original('estado'), 'espera')
+        self.assertEqual(suelta.valor_original('tecnico_asignado_actual_id'), self.tecnico.pk)
@@ -33,11 +33,13 @@ from servicio_tecnico.models import (
     OrdenServicio,
     PagoOrden,
     PiezaCotizada,
+    PiezaVentaMostrador,
     VentaMostrador,
 )
 from servicio_tecnico.services.pagos_orden import (
     _db_de,
     calcular_resumen_cobro,
+    calcular_resumenes_cobro,
     mensaje_alerta_pago_por_estado,
     registrar_pago,
 )
@@ -262,6 +264,129 @@ class CalcularResumenCobroTest(TestCase):
         self.assertEqual(alias_esperado, 'default')
 
 
+class CalcularResumenesCobroLoteTest(TestCase):
+    """
+    Objetivo: la versión en lote da lo mismo que el cálculo por orden,
+    con una sola consulta, y la caché se invalida al registrar un pago.
+    """
+
+    def setUp(self):
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Lote', ciudad='CDMX')
+        self.empleado = Empleado.objects.create(
+            nombre_completo='Cajero Lote',
+            cargo='Recepcionista',
+            area='FRONTDESK',
+            email='cajero.lote@test.local',
+            sucursal=self.sucursal,
+            rol='recepcionista',
+            activo=True,
+        )
+        self.componente = ComponenteEquipo.objects.create(
+            nombre='Teclado Lote', tipo_equipo='laptop', activo=True,
+        )
+
+        # Aceptada: 2 × 150 aceptadas (la rechazada no cuenta) + VM + un pago
+        self.aceptada = self._orden_con_cotizacion(True, [
+            (2, Decimal('100.00'), Decimal('150.00'), True),
+            (1, Decimal('900.00'), Decimal('999.00'), False),
+        ])
+        venta = VentaMostrador.objects.create(
+            orden=self.aceptada,
+            folio_venta='VM-LOTE-01',
+            costo_limpieza=Decimal('100.00'),
+            incluye_limpieza=True,
+        )
+        PiezaVentaMostrador.objects.create(
+            venta_mostrador=venta,
+            descripcion_pieza='Cargador',
+            cantidad=2,
+            precio_unitario=Decimal('25.00'),
+        )
+        PagoOrden.objects.create(
+            orden=self.aceptada, monto=Decimal('100.00'), tipo='anticipo',
+            metodo='efectivo', registrado_por=self.empleado,
+        )
+        # Pendiente: estimado con todas las piezas; sin precio cliente usa el costo
+        self.pendiente = self._orden_con_cotizacion(None, [
+            (1, Decimal('40.00'), None, None),
+            (3, Decimal('10.00'), Decimal('20.00'), None),
+        ])
+        self.sin_cotizacion = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            tecnico_asignado_actual=self.empleado,
+        )
+
+    def _orden_con_cotizacion(self, acepto, piezas):
+        orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            estado='cotizacion',
+            tecnico_asignado_actual=self.empleado,
+        )
+        cotizacion = Cotizacion.objects.create(
+            orden=orden, costo_mano_obra=Decimal('100.00'), usuario_acepto=acepto,
+        )
+        for cantidad, costo, precio_cliente, aceptada in piezas:
+            PiezaCotizada.objects.create(
+                cotizacion=cotizacion,
+                componente=self.componente,
+                cantidad=cantidad,
+                costo_unitario=costo,
+                precio_unitario_cliente=precio_cliente,
+                aceptada_por_cliente=aceptada,
+            )
+        return orden
+
+    def test_importes_por_orden(self):
+        """Feliz: cada orden con sus piezas, VM y pagos; dict en el orden pedido."""
+        ordenes = [self.aceptada, self.pendiente, self.sin_cotizacion]
+        resumenes = calcular_resumenes_cobro(ordenes, codigo_pais='MX', usar_cache=False)
+
+        self.assertEqual(list(resumenes), [orden.pk for orden in ordenes])
+        aceptada = resumenes[self.aceptada.pk]
+        # 300 piezas + 48 IVA + (100 limpieza + 50 piezas VM) = 498
+        self.assertEqual(aceptada.subtotal_cotizacion, Decimal('300.00'))
+        self.assertEqual(aceptada.total_venta_mostrador, Decimal('150.00'))
+        self.assertEqual(aceptada.total_a_cobrar, Decimal('498.00'))
+        self.assertEqual(aceptada.pagado, Decimal('100.00'))
+        self.assertEqual(aceptada.saldo, Decimal('398.00'))
+
+        pendiente = resumenes[self.pendiente.pk]
+        # 1 × 40 (costo) + 3 × 20 (precio cliente) = 100
+        self.assertTrue(pendiente.es_estimado)
+        self.assertEqual(pendiente.subtotal_cotizacion, Decimal('100.00'))
+        self.assertEqual(pendiente.pagado, Decimal('0.00'))
+
+        sin_cotizacion = resumenes[self.sin_cotizacion.pk]
+        self.assertEqual(sin_cotizacion.total_a_cobrar, Decimal('0.00'))
+        self.assertTrue(sin_cotizacion.cubierto_100)
+
+        # El cálculo por orden es el mismo
+        self.assertEqual(calcular_resumen_cobro(self.aceptada, codigo_pais='MX'), aceptada)
+
+    def test_una_consulta_para_todas_las_ordenes(self):
+        """Rendimiento: N órdenes = 1 consulta (no 4 por fila)."""
+        ordenes = [self.aceptada, self.pendiente, self.sin_cotizacion]
+        with self.assertNumQueries(1):
+            calcular_resumenes_cobro(ordenes, codigo_pais='MX', usar_cache=False)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_cache_se_invalida_al_registrar_pago(self):
+        """Caché: la segunda lectura no toca la BD; un pago nuevo la invalida."""
+        antes = calcular_resumen_cobro(self.aceptada, codigo_pais='MX')
+        with self.assertNumQueries(0):
+            self.assertEqual(calcular_resumen_cobro(self.aceptada, codigo_pais='MX'), antes)
+
+        registrar_pago(
+            self.aceptada, self.empleado, Decimal('50.00'),
+            'anticipo', 'efectivo', codigo_pais='MX',
+        )
+        despues = calcular_resumen_cobro(self.aceptada, codigo_pais='MX')
+        self.assertEqual(despues.pagado, Decimal('150.00'))
+        self.assertEqual(despues.saldo, Decimal('348.00'))
+
+
 class DetalleOrdenPagosIntegracionTest(TestCase):
     """
     POST reales a detalle_orden para registrar pago y alertar al entregar.
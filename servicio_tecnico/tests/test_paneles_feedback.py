@@ -0,0 +1,334 @@
+"""
+Tests de los paneles de encuestas y feedback de rechazo (services/paneles_feedback.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) Los paneles calculados en una pasada coinciden con los aggregate /
+   values().annotate() que usaban antes las APIs (KPIs, semanas con
+   TruncWeek, responsables, motivos, comentarios).
+2) Se leen con UNA consulta sin importar cuántos feedbacks haya.
+3) El endpoint por lotes responde con ETag y 304 si nada cambió; la segunda
+   lectura sale del caché y un feedback nuevo lo invalida.
+4) Las APIs individuales y los exports leen los mismos paneles.
+"""
+
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+from django.db.models.functions import TruncWeek
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico import views_encuestas, views_feedback_rechazo_dash
+from servicio_tecnico.models import DetalleEquipo, FeedbackCliente, OrdenServicio
+from servicio_tecnico.services.paneles_feedback import (
+    construir_paneles,
+    filtrar_feedback,
+    obtener_paneles,
+)
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+User = get_user_model()
+
+
+class PanelesFeedbackBase(TestCase):
+    """Dos responsables, una orden sin responsable y feedbacks de ambos tipos."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        cache.clear()
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Paneles', ciudad='CDMX')
+        self.ana = self._empleado('Ana Paneles', 'ana_paneles')
+        self.beto = self._empleado('Beto Paneles', 'beto_paneles')
+        self.orden_ana = self._orden(self.ana, 'OOW-PAN-1')
+        self.orden_beto = self._orden(self.beto, '')
+        self.orden_sin = self._orden(None, 'OOW-PAN-3')
+        self._tokens = 0
+
+    def _empleado(self, nombre, usuario):
+        user = User.objects.create_user(username=usuario, password='x')
+        return Empleado.objects.create(
+            nombre_completo=nombre,
+            cargo='Técnico',
+            area='Laboratorio',
+            email=f'{usuario}@test.local',
+            sucursal=self.sucursal,
+            user=user,
+            rol='tecnico',
+        )
+
+    def _orden(self, responsable, orden_cliente):
+        orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            tecnico_asignado_actual=self.ana,
+        )
+        OrdenServicio.objects.filter(pk=orden.pk).update(responsable_seguimiento=responsable)
+        DetalleEquipo.objects.create(
+            orden=orden,
+            orden_cliente=orden_cliente,
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie=f'SN-PAN-{orden.pk}',
+            email_cliente='cliente@test.local',
+            nombre_cliente='Cliente Paneles',
+            falla_principal='No enciende',
+        )
+        orden.refresh_from_db()
+        return orden
+
+    def _feedback(self, orden, tipo='satisfaccion', dias=0, respondido_hace=None, **campos):
+        """Crea un feedback y le pone fecha_creacion hace `dias` días."""
+        self._tokens += 1
+        ahora = timezone.now()
+        fb = FeedbackCliente.objects.create(
+            orden=orden,
+            token=f'token-paneles-{tipo}-{self._tokens}',
+            tipo=tipo,
+            correo_enviado=campos.pop('correo_enviado', True),
+            fecha_respuesta=ahora - timedelta(days=respondido_hace) if respondido_hace is not None else None,
+            **campos,
+        )
+        FeedbackCliente.objects.filter(pk=fb.pk).update(fecha_creacion=ahora - timedelta(days=dias))
+        return fb
+
+    def _escenario_satisfaccion(self):
+        self._feedback(self.orden_ana, utilizado=True, respondido_hace=1, calificacion_general=5,
+                       calificacion_atencion=5, calificacion_tiempo=4, nps=10, recomienda=True,
+                       comentario_cliente='Excelente servicio')
+        self._feedback(self.orden_ana, dias=9, utilizado=True, respondido_hace=8, calificacion_general=3,
+                       calificacion_atencion=2, nps=6, recomienda=False)
+        self._feedback(self.orden_beto, utilizado=True, respondido_hace=2, calificacion_general=4,
+                       calificacion_tiempo=3, nps=8, recomienda=True,
+                       comentario_cliente='Bien')
+        self._feedback(self.orden_beto)                                    # pendiente
+        self._feedback(self.orden_beto, dias=10)                           # expirada
+        self._feedback(self.orden_sin, dias=10, correo_enviado=False)      # expirada sin envío
+        self._feedback(self.orden_sin, dias=15, utilizado=True, respondido_hace=3,
+                       comentario_cliente='Sin calificar')
+
+    def _escenario_rechazo(self):
+        self._feedback(self.orden_ana, 'rechazo', motivo_rechazo_snapshot='costo_alto', utilizado=True,
+                       respondido_hace=1, comentario_cliente='Muy caro')
+        self._feedback(self.orden_ana, 'rechazo', dias=9, motivo_rechazo_snapshot='costo_alto')
+        self._feedback(self.orden_beto, 'rechazo', motivo_rechazo_snapshot='tiempo_largo', utilizado=True,
+                       respondido_hace=4, comentario_cliente='Tarda mucho')
+        self._feedback(self.orden_sin, 'rechazo', motivo_rechazo_snapshot='')
+        self._feedback(self.orden_sin, 'rechazo', correo_enviado=False, motivo_rechazo_snapshot='otro')
+
+
+class PanelesSatisfaccionTest(PanelesFeedbackBase):
+    """Los paneles coinciden con los aggregates de la BD."""
+
+    def test_kpis_igual_que_aggregate(self):
+        self._escenario_satisfaccion()
+        qs = filtrar_feedback('satisfaccion', {})
+        now = timezone.now()
+        respondidas = qs.filter(utilizado=True)
+        avgs = respondidas.aggregate(nps=Avg('nps'), general=Avg('calificacion_general'),
+                                     atencion=Avg('calificacion_atencion'), tiempo=Avg('calificacion_tiempo'))
+
+        kpis = construir_paneles('satisfaccion', qs)['kpis']
+
+        self.assertEqual(kpis['total_enviadas'], qs.filter(correo_enviado=True).count())
+        self.assertEqual(kpis['total_respondidas'], respondidas.count())
+        self.assertEqual(kpis['total_pendientes'], qs.filter(
+            utilizado=False, correo_enviado=True, fecha_expiracion__gte=now).count())
+        self.assertEqual(kpis['total_expiradas'], qs.filter(utilizado=False, fecha_expiracion__lt=now).count())
+        self.assertEqual(kpis['nps_promedio'], round(avgs['nps'], 1))
+        self.assertEqual(kpis['calificacion_promedio'], round(avgs['general'], 1))
+        self.assertEqual(kpis['calificacion_atencion_promedio'], round(avgs['atencion'], 1))
+        self.assertEqual(kpis['calificacion_tiempo_promedio'], round(avgs['tiempo'], 1))
+        # 10 promotor, 6 detractor, 8 pasivo → (1 - 1) / 3
+        self.assertEqual(kpis['nps_score'], 0.0)
+        self.assertEqual(kpis['tasa_recomendacion'], round(2 / 3 * 100, 1))
+        self.assertEqual(kpis['tasa_respuesta'], round(4 / 6 * 100, 1))
+
+    def test_tendencia_igual_que_truncweek(self):
+        self._escenario_satisfaccion()
+        qs = filtrar_feedback('satisfaccion', {})
+        semanas = list(
+            qs.filter(correo_enviado=True)
+            .annotate(semana=TruncWeek('fecha_creacion'))
+            .values('semana')
+            .annotate(total=Count('id'), respondidas=Count('id', filter=Q(utilizado=True)),
+                      cal=Avg('calificacion_general', filter=Q(utilizado=True)))
+            .order_by('semana')
+        )
+
+        tendencia = construir_paneles('satisfaccion', qs)['tendencia']
+
+        self.assertEqual(tendencia['labels'], [s['semana'].strftime('%d/%m/%Y') for s in semanas])
+        self.assertEqual(tendencia['datasets']['total_enviadas'], [s['total'] for s in semanas])
+        self.assertEqual(tendencia['datasets']['total_respondidas'], [s['respondidas'] for s in semanas])
+        self.assertEqual(tendencia['datasets']['calificacion_promedio'],
+                         [round(s['cal'] or 0, 1) for s in semanas])
+
+    def test_responsables_nps_y_comentarios(self):
+        self._escenario_satisfaccion()
+        paneles = construir_paneles('satisfaccion', filtrar_feedback('satisfaccion', {}))
+
+        # Ana (5+3)/2 y Beto 4 empatan: quedan en orden de aparición. La orden
+        # sin responsable no tiene calificación y va al final.
+        ranking = [(r['id'], r['calificacion_promedio']) for r in paneles['responsables']]
+        self.assertEqual(ranking, [(self.ana.pk, 4.0), (self.beto.pk, 4.0), (None, 0)])
+        beto = paneles['responsables'][1]
+        self.assertEqual((beto['nombre'], beto['total_enviadas'], beto['total_respondidas']),
+                         ('Beto Paneles', 3, 1))
+
+        self.assertEqual(paneles['distribucion_nps'],
+                         {'promotores': 1, 'pasivos': 1, 'detractores': 1, 'total': 3, 'nps_score': 0.0})
+
+        # Más reciente primero; orden_cliente vacío cae al número interno
+        comentarios = paneles['comentarios']
+        self.assertEqual([c['comentario'] for c in comentarios],
+                         ['Excelente servicio', 'Bien', 'Sin calificar'])
+        self.assertEqual(comentarios[0]['orden_numero'], 'OOW-PAN-1')
+        self.assertEqual(comentarios[1]['orden_numero'], self.orden_beto.numero_orden_interno)
+        self.assertEqual(comentarios[2]['responsable'], '')
+
+    def test_una_consulta_sin_importar_los_feedbacks(self):
+        self._escenario_satisfaccion()
+        with CaptureQueriesContext(connection) as pocas:
+            construir_paneles('satisfaccion', filtrar_feedback('satisfaccion', {}))
+        for _ in range(10):
+            self._feedback(self.orden_beto, utilizado=True, respondido_hace=0, nps=9,
+                           comentario_cliente='Otro')
+        with CaptureQueriesContext(connection) as muchas:
+            construir_paneles('satisfaccion', filtrar_feedback('satisfaccion', {}))
+        self.assertEqual(len(pocas), 1)
+        self.assertEqual(len(muchas), 1)
+
+
+class PanelesRechazoTest(PanelesFeedbackBase):
+    """KPIs, motivos y ranking de rechazo."""
+
+    def test_kpis_y_motivos(self):
+        self._escenario_rechazo()
+        qs = filtrar_feedback('rechazo', {})
+        motivos_bd = {
+            m['motivo_rechazo_snapshot']: (m['total'], m['respondidos'])
+            for m in qs.filter(correo_enviado=True).values('motivo_rechazo_snapshot')
+            .annotate(total=Count('id'), respondidos=Count('id', filter=Q(utilizado=True)))
+        }
+
+        paneles = construir_paneles('rechazo', qs)
+
+        self.assertEqual(
+            {m['motivo']: (m['total'], m['respondidos']) for m in paneles['por_motivo']}, motivos_bd,
+        )
+        # Empates en orden de aparición, el más frecuente primero
+        self.assertEqual([m['label'] for m in paneles['por_motivo']],
+                         ['Costo muy elevado', 'Tiempo de reparación muy largo', 'Sin motivo'])
+        kpis = paneles['kpis']
+        self.assertEqual(
+            (kpis['total_enviados'], kpis['total_respondidos'], kpis['total_pendientes'], kpis['total_expirados']),
+            (4, 2, 1, 1),
+        )
+        self.assertEqual(kpis['motivo_mas_frecuente'], 'Costo muy elevado')
+        self.assertEqual(kpis['motivo_mas_frecuente_porcentaje'], 50.0)
+
+    def test_responsables_y_filtro_por_motivo(self):
+        self._escenario_rechazo()
+        paneles = construir_paneles('rechazo', filtrar_feedback('rechazo', {}))
+        self.assertEqual(
+            [(r['id'], r['total_enviados'], r['tasa_respuesta']) for r in paneles['responsables']],
+            [(self.ana.pk, 2, 50.0), (self.beto.pk, 1, 100.0), (None, 1, 0.0)],
+        )
+
+        filtrado = construir_paneles('rechazo', filtrar_feedback('rechazo', {'motivo_rechazo': 'tiempo_largo'}))
+        self.assertEqual(filtrado['kpis']['total_enviados'], 1)
+        self.assertEqual([c['comentario'] for c in filtrado['comentarios']], ['Tarda mucho'])
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class EndpointPanelesTest(PanelesFeedbackBase):
+    """Endpoint por lotes: ETag, caché por filtros e invalidación."""
+
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.admin = User.objects.create_superuser('admin_paneles', 'a@test.local', 'x')
+
+    def _get(self, vista, datos=None, **extra):
+        request = self.factory.get('/paneles/', datos or {}, **extra)
+        request.user = self.admin
+        return vista(request)
+
+    def test_json_con_todos_los_paneles_y_304(self):
+        self._escenario_satisfaccion()
+        respuesta = self._get(views_encuestas.api_encuestas_paneles)
+        self.assertEqual(respuesta.status_code, 200)
+        datos = json.loads(respuesta.content)
+        self.assertEqual(
+            set(datos), {'kpis', 'tendencia', 'responsables', 'distribucion_nps', 'comentarios'},
+        )
+        self.assertEqual(datos['kpis']['total_enviadas'], 6)
+
+        etag = respuesta['ETag']
+        with self.assertNumQueries(0):
+            no_modificado = self._get(views_encuestas.api_encuestas_paneles, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(no_modificado.status_code, 304)
+
+    def test_apis_individuales_leen_el_mismo_panel(self):
+        self._escenario_rechazo()
+        lote = json.loads(self._get(views_feedback_rechazo_dash.api_feedback_rechazo_paneles).content)
+        with self.assertNumQueries(0):
+            kpis = json.loads(self._get(views_feedback_rechazo_dash.api_feedback_rechazo_kpis).content)
+            motivos = json.loads(self._get(views_feedback_rechazo_dash.api_feedback_rechazo_por_motivo).content)
+        self.assertEqual(kpis, lote['kpis'])
+        self.assertEqual(motivos['motivos'], lote['por_motivo'])
+
+    def test_filtros_distintos_no_comparten_paneles(self):
+        self._escenario_satisfaccion()
+        todos = obtener_paneles('satisfaccion', {})
+        de_ana = obtener_paneles('satisfaccion', {'responsable_id': str(self.ana.pk)})
+        self.assertEqual(todos['kpis']['total_enviadas'], 6)
+        self.assertEqual(de_ana['kpis']['total_enviadas'], 2)
+
+    def test_feedback_nuevo_invalida_y_cambia_etag(self):
+        self._escenario_satisfaccion()
+        antes = self._get(views_encuestas.api_encuestas_paneles)
+
+        self._feedback(self.orden_ana, utilizado=True, respondido_hace=0, nps=9, comentario_cliente='Nuevo')
+
+        despues = self._get(views_encuestas.api_encuestas_paneles, HTTP_IF_NONE_MATCH=antes['ETag'])
+        self.assertEqual(despues.status_code, 200)
+        self.assertNotEqual(despues['ETag'], antes['ETag'])
+        self.assertEqual(json.loads(despues.content)['comentarios'][0]['comentario'], 'Nuevo')
+
+    def test_excel_usa_los_paneles_del_dashboard(self):
+        self._escenario_satisfaccion()
+        paneles = obtener_paneles('satisfaccion', {})
+        _, libro = views_encuestas.exportar_encuestas_satisfaccion({})
+        self.assertEqual([h.title for h in libro.wb.worksheets], ['Resumen KPIs', 'Encuestas', 'Por Responsable'])
+        self.assertEqual(paneles['kpis']['total_enviadas'], 6)
+
+    @patch('servicio_tecnico.pdf_encuestas.generar_pdf_reporte_encuestas')
+    def test_pdf_usa_los_paneles_del_dashboard(self, mock_generar):
+        from io import BytesIO
+
+        self._escenario_satisfaccion()
+        mock_generar.return_value = BytesIO(b'%PDF-1.4 paneles')
+        paneles = obtener_paneles('satisfaccion', {})
+
+        request = self.factory.get('/pdf/')
+        request.user = self.admin
+        respuesta = views_encuestas.exportar_encuestas_pdf(request)
+
+        self.assertEqual(respuesta.status_code, 200)
+        datos = mock_generar.call_args[0][0]
+        self.assertEqual(datos['kpis'], paneles['kpis'])
+        self.assertEqual(datos['nps_dist'], paneles['distribucion_nps'])
+        self.assertEqual(datos['responsables'][-1]['nombre'], '(Sin responsable)')
+        self.assertEqual(len(datos['comentarios']), 3)
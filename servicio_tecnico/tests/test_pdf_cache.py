@@ -0,0 +1,156 @@
+"""
+Tests del caché de PDFs por huella (config/pdf_cache.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) Mismas entradas → el segundo generar_pdf() sale del caché con los mismos
+   bytes (y se reescribe en la ruta que esperan las tareas).
+2) Cambiar un dato del PDF (folio, campo de la orden) cambia la huella.
+3) El directorio se recorta por tamaño borrando lo menos usado (LRU).
+4) PNG → JPG y los QR se preparan una sola vez por proceso.
+"""
+
+import os
+import shutil
+import tempfile
+
+from PIL import Image as PILImage
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from config import pdf_cache
+from config.pdf_cache import guardar_artefacto, imagen_sin_transparencia, recortar_cache
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.models import DetalleEquipo, OrdenServicio
+from servicio_tecnico.utils.pdf_diagnostico import PDFGeneratorDiagnostico
+
+User = get_user_model()
+
+DIRECTORIO_TEMPORAL = tempfile.mkdtemp(prefix='sigma_pdf_cache_test_')
+MEDIA_TEMPORAL = os.path.join(DIRECTORIO_TEMPORAL, 'media')
+CACHE_TEMPORAL = os.path.join(DIRECTORIO_TEMPORAL, 'cache')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_TEMPORAL, PDF_CACHE_DIR=CACHE_TEMPORAL, PDF_CACHE_ACTIVO=True)
+class PDFCacheTest(TestCase):
+    """Aciertos, invalidación por huella, recorte LRU y recursos por proceso."""
+
+    databases = {'default', 'mexico'}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(DIRECTORIO_TEMPORAL, ignore_errors=True)
+
+    def setUp(self):
+        shutil.rmtree(CACHE_TEMPORAL, ignore_errors=True)
+        sucursal = Sucursal.objects.create(nombre='Sucursal PDF', ciudad='CDMX')
+        tecnico = Empleado.objects.create(
+            nombre_completo='Técnico PDF',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='tec.pdf@test.local',
+            sucursal=sucursal,
+            user=User.objects.create_user(username='tec_pdf_cache', password='x'),
+            rol='tecnico',
+        )
+        self.orden = OrdenServicio.objects.create(
+            sucursal=sucursal,
+            tipo_servicio='diagnostico',
+            estado='diagnostico',
+            tecnico_asignado_actual=tecnico,
+        )
+        DetalleEquipo.objects.create(
+            orden=self.orden,
+            orden_cliente='OOW-PDF-1',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie='SN-PDF-1',
+            falla_principal='No enciende',
+            diagnostico_sic='Falla en tarjeta madre',
+        )
+
+    def _generador(self, folio='MX_PDF_0001'):
+        """Generador de diagnóstico con la orden recién leída de BD."""
+        orden = OrdenServicio.objects.select_related('detalle_equipo').get(pk=self.orden.pk)
+        return PDFGeneratorDiagnostico(
+            orden,
+            folio=folio,
+            componentes_seleccionados=[
+                {'componente_db': 'Pantalla', 'dpn': 'DPN: 0XPJWG', 'seleccionado': True},
+            ],
+            email_empleado='tecnico@test.local',
+        )
+
+    def test_segunda_generacion_sale_del_cache(self):
+        primero = self._generador().generar_pdf()
+        self.assertTrue(primero['success'])
+        self.assertNotIn('desde_cache', primero)
+        with open(primero['ruta'], 'rb') as archivo:
+            contenido = archivo.read()
+        os.remove(primero['ruta'])
+
+        segundo = self._generador().generar_pdf()
+
+        self.assertTrue(segundo['desde_cache'])
+        self.assertEqual(segundo['huella'], primero['huella'])
+        self.assertEqual(segundo['archivo'], primero['archivo'])
+        # La tarea borra el archivo al enviarlo: el acierto lo vuelve a escribir
+        with open(segundo['ruta'], 'rb') as archivo:
+            self.assertEqual(archivo.read(), contenido)
+        self.assertEqual(segundo['size'], len(contenido))
+
+    def test_cambiar_entradas_cambia_la_huella(self):
+        huella = self._generador().huella_artefacto()
+
+        self.assertEqual(self._generador().huella_artefacto(), huella)
+        self.assertNotEqual(self._generador(folio='MX_PDF_0002').huella_artefacto(), huella)
+        DetalleEquipo.objects.filter(orden=self.orden).update(diagnostico_sic='Falla en pantalla')
+        self.assertNotEqual(self._generador().huella_artefacto(), huella)
+
+    @override_settings(PDF_CACHE_ACTIVO=False)
+    def test_cache_desactivado_no_guarda(self):
+        resultado = self._generador().generar_pdf()
+
+        self.assertTrue(resultado['success'])
+        self.assertNotIn('huella', resultado)
+        self.assertFalse(os.path.isdir(CACHE_TEMPORAL))
+
+    def test_recorte_borra_lo_menos_usado(self):
+        huellas = [f'{n:02d}' + 'a' * 62 for n in range(3)]
+        for n, huella in enumerate(huellas):
+            guardar_artefacto(huella, b'x' * 1000, {'nombre_archivo': f'{n}.pdf'})
+            ruta = pdf_cache._rutas(huella)[0]
+            os.utime(ruta, ns=(n * 10**9, n * 10**9))
+        # Leer el más viejo lo marca como recién usado
+        self.assertIsNotNone(pdf_cache.obtener_artefacto(huellas[0]))
+
+        borrados = recortar_cache(max_bytes=2500)
+
+        self.assertEqual(borrados, 1)
+        self.assertIsNotNone(pdf_cache.obtener_artefacto(huellas[0]))
+        self.assertIsNone(pdf_cache.obtener_artefacto(huellas[1]))
+        self.assertIsNotNone(pdf_cache.obtener_artefacto(huellas[2]))
+
+    def test_png_se_convierte_una_vez_por_proceso(self):
+        ruta_png = os.path.join(DIRECTORIO_TEMPORAL, 'logo.png')
+        PILImage.new('RGBA', (40, 20), (255, 0, 0, 0)).save(ruta_png, 'PNG')
+        pdf_cache._jpg_fondo_blanco.cache_clear()
+
+        for _ in range(3):
+            lector = imagen_sin_transparencia(ruta_png)
+
+        self.assertEqual(lector.getSize(), (40, 20))
+        info = pdf_cache._jpg_fondo_blanco.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_qr_se_genera_una_vez_por_dato(self):
+        pdf_cache.qr_png.cache_clear()
+
+        primero = pdf_cache.qr_png('https://wa.me/5215500000000')
+        segundo = pdf_cache.qr_png('https://wa.me/5215500000000')
+
+        self.assertIs(primero, segundo)
+        self.assertTrue(primero.startswith(b'\x89PNG'))
+        self.assertEqual(pdf_cache.qr_png.cache_info().misses, 1)
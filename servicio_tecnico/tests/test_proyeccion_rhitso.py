@@ -0,0 +1,394 @@
+"""
+Tests de la proyección de filas RHITSO (services/proyeccion_rhitso.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) Cada fila trae los mismos valores que calculaban antes el dashboard y el
+   Excel orden por orden (días hábiles, último comentario manual,
+   incidencias, owner, estado del proceso).
+2) El embudo cuenta con las banderas históricas de las filas y coincide con
+   los QuerySets de _con_estado_historico.
+3) Las consultas no crecen con las órdenes, la segunda lectura sale del
+   caché y un seguimiento nuevo, el equipo de una candidata o desmarcar
+   una candidata lo invalidan.
+4) calcular_dias_habiles_lote da lo mismo que calcular_dias_habiles.
+"""
+
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico import views_dashboard_rhitso
+from servicio_tecnico.models import (
+    DetalleEquipo,
+    EstadoRHITSO,
+    IncidenciaRHITSO,
+    OrdenServicio,
+    SeguimientoRHITSO,
+    TipoIncidenciaRHITSO,
+)
+from servicio_tecnico.services.proyeccion_rhitso import (
+    _version_actual,
+    construir_proyeccion_rhitso,
+    invalidar_proyeccion_rhitso,
+    obtener_proyeccion_rhitso,
+)
+from servicio_tecnico.utils_rhitso import calcular_dias_habiles, calcular_dias_habiles_lote
+from servicio_tecnico.utils_rhitso_analytics import (
+    ESTADO_ACEPTA_COTIZ,
+    ESTADO_ACEPTA_ENVIO,
+    ESTADO_NO_APTO,
+    ESTADO_RECHAZA_ENVIO,
+    _con_estado_historico,
+    obtener_embudo_rhitso,
+    obtener_queryset_candidatos,
+)
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+User = get_user_model()
+
+
+class ProyeccionRhitsoBase(TestCase):
+    """Catálogo de estados, un técnico y un helper para crear candidatos."""
+
+    def setUp(self):
+        cache.clear()
+        self.sucursal = Sucursal.objects.create(nombre='Satelite Proyección', ciudad='CDMX')
+        self.tecnico = Empleado.objects.create(
+            nombre_completo='Técnico Proyección',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='tec.proyeccion@test.local',
+            sucursal=self.sucursal,
+            rol='tecnico',
+        )
+        self.estados = {
+            nombre: EstadoRHITSO.objects.create(estado=nombre, owner=owner, orden=numero)
+            for numero, (nombre, owner) in enumerate((
+                ('PENDIENTE DE CONFIRMAR ENVIO A RHITSO', 'SIC'),
+                (ESTADO_ACEPTA_ENVIO, 'CLIENTE'),
+                (ESTADO_RECHAZA_ENVIO, 'CLIENTE'),
+                ('EQUIPO EN RHITSO', 'RHITSO'),
+                (ESTADO_ACEPTA_COTIZ, 'CLIENTE'),
+                (ESTADO_NO_APTO, 'RHITSO'),
+            ), start=1)
+        }
+        self.tipo_incidencia = TipoIncidenciaRHITSO.objects.create(nombre='Retraso')
+        self.contador = 0
+
+    def _candidata(self, estado_rhitso, historial=(), dias_ingreso=12, envio=None, recepcion=None,
+                   con_detalle=True):
+        """
+        Orden candidata con seguimientos manuales (estado, días atrás, comentario).
+
+        El estado inicial genera además un seguimiento automático (signal).
+        """
+        self.contador += 1
+        orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            estado='diagnostico',
+            tecnico_asignado_actual=self.tecnico,
+            es_candidato_rhitso=True,
+            estado_rhitso=estado_rhitso,
+        )
+        if con_detalle:
+            DetalleEquipo.objects.create(
+                orden=orden,
+                orden_cliente=f'OOW-PROY-{self.contador}',
+                tipo_equipo='Laptop',
+                marca='Lenovo',
+                modelo='ThinkPad',
+                numero_serie=f'SN-PROY-{self.contador}',
+                falla_principal='No enciende',
+                diagnostico_sic='Tarjeta madre' if self.contador % 2 else '',
+            )
+        ahora = timezone.now()
+        for nombre_estado, dias, comentario in historial:
+            seguimiento = SeguimientoRHITSO.objects.create(
+                orden=orden,
+                estado=self.estados[nombre_estado],
+                observaciones=comentario,
+                es_cambio_automatico=False,
+            )
+            SeguimientoRHITSO.objects.filter(pk=seguimiento.pk).update(
+                fecha_actualizacion=ahora - timedelta(days=dias),
+            )
+        OrdenServicio.objects.filter(pk=orden.pk).update(
+            fecha_ingreso=ahora - timedelta(days=dias_ingreso),
+            fecha_envio_rhitso=ahora - timedelta(days=envio) if envio is not None else None,
+            fecha_recepcion_rhitso=ahora - timedelta(days=recepcion) if recepcion is not None else None,
+        )
+        return orden
+
+    def _escenario(self):
+        ordenes = {
+            'en_rhitso': self._candidata(
+                'EQUIPO EN RHITSO',
+                historial=[
+                    (ESTADO_ACEPTA_ENVIO, 9, 'Cliente acepta'),
+                    ('EQUIPO EN RHITSO', 6, 'Enviado'),
+                ],
+                envio=6,
+            ),
+            'completada': self._candidata(
+                ESTADO_ACEPTA_COTIZ,
+                historial=[
+                    (ESTADO_ACEPTA_ENVIO, 20, ''),
+                    (ESTADO_ACEPTA_COTIZ, 3, 'Acepta cotización'),
+                ],
+                dias_ingreso=25, envio=15, recepcion=2,
+            ),
+            'no_apto': self._candidata(
+                ESTADO_NO_APTO,
+                historial=[(ESTADO_ACEPTA_ENVIO, 5, ''), (ESTADO_NO_APTO, 1, 'Sin reparación')],
+                envio=4,
+            ),
+            'rechazo': self._candidata(
+                ESTADO_RECHAZA_ENVIO, historial=[(ESTADO_RECHAZA_ENVIO, 2, 'No acepta')],
+            ),
+            'pendiente': self._candidata('PENDIENTE DE CONFIRMAR ENVIO A RHITSO', dias_ingreso=3),
+            'sin_detalle': self._candidata('', con_detalle=False, dias_ingreso=1),
+        }
+        IncidenciaRHITSO.objects.create(
+            orden=ordenes['en_rhitso'], tipo_incidencia=self.tipo_incidencia,
+            titulo='Retraso', descripcion_detallada='x', usuario_registro=self.tecnico,
+        )
+        IncidenciaRHITSO.objects.create(
+            orden=ordenes['en_rhitso'], tipo_incidencia=self.tipo_incidencia,
+            titulo='Resuelta', descripcion_detallada='x', usuario_registro=self.tecnico,
+            estado='RESUELTA',
+        )
+        return ordenes
+
+
+class FilasProyeccionTest(ProyeccionRhitsoBase):
+    """Las filas reproducen el cálculo orden por orden."""
+
+    def _esperado(self, orden):
+        """Cálculo anterior del dashboard sobre la orden recién leída."""
+        orden = OrdenServicio.objects.get(pk=orden.pk)
+        manual = orden.seguimientos_rhitso.filter(
+            es_cambio_automatico=False,
+        ).order_by('-fecha_actualizacion').first()
+        return {
+            'dias_habiles_sic': calcular_dias_habiles(orden.fecha_ingreso, orden.fecha_recepcion_rhitso),
+            'dias_habiles_rhitso': (
+                calcular_dias_habiles(orden.fecha_envio_rhitso, orden.fecha_recepcion_rhitso)
+                if orden.fecha_envio_rhitso else 0
+            ),
+            'dias_sin_actualizar': calcular_dias_habiles(
+                manual.fecha_actualizacion if manual else orden.fecha_ingreso,
+            ),
+            'ultimo_comentario': manual.observaciones if manual else '',
+            'estado_orden': orden.get_estado_display(),
+        }
+
+    def test_filas_igual_que_orden_por_orden(self):
+        ordenes = self._escenario()
+
+        filas = {fila['id']: fila for fila in construir_proyeccion_rhitso()['filas']}
+
+        self.assertEqual(len(filas), len(ordenes))
+        for orden in ordenes.values():
+            fila = filas[orden.pk]
+            for campo, valor in self._esperado(orden).items():
+                self.assertEqual(fila[campo], valor, (orden.pk, campo))
+
+        en_rhitso = filas[ordenes['en_rhitso'].pk]
+        self.assertEqual(en_rhitso['ultimo_comentario'], 'Enviado')
+        self.assertEqual(en_rhitso['owner_actual'], 'RHITSO')
+        self.assertEqual(
+            (en_rhitso['incidencias_abiertas'], en_rhitso['total_incidencias']), (1, 2),
+        )
+        self.assertEqual(en_rhitso['estado_proceso'], 'En RHITSO')
+        self.assertEqual(filas[ordenes['completada'].pk]['estado_proceso'], 'Completado')
+        self.assertEqual(filas[ordenes['pendiente'].pk]['estado_proceso'], 'Solo SIC')
+
+        self.assertEqual(filas[ordenes['rechazo'].pk]['categoria'], 'excluidos')
+        self.assertEqual(filas[ordenes['pendiente'].pk]['categoria'], 'pendientes')
+        sin_detalle = filas[ordenes['sin_detalle'].pk]
+        self.assertEqual(sin_detalle['estado_rhitso_nombre'], 'Pendiente')
+        self.assertEqual((sin_detalle['numero_serie'], sin_detalle['servicio']), ('N/A', 'Sin observaciones'))
+
+    def test_consultas_no_crecen_con_las_ordenes(self):
+        self._escenario()
+        with CaptureQueriesContext(connection) as pocas:
+            construir_proyeccion_rhitso()
+
+        self._escenario()
+        self._escenario()
+        with CaptureQueriesContext(connection) as muchas:
+            total = len(construir_proyeccion_rhitso()['filas'])
+
+        self.assertEqual(total, 18)
+        self.assertEqual(len(muchas), len(pocas))
+        self.assertLessEqual(len(muchas), 2)
+
+    def test_embudo_coincide_con_querysets(self):
+        self._escenario()
+        embudo = obtener_embudo_rhitso()
+        candidatos = obtener_queryset_candidatos()
+        acepto = _con_estado_historico(candidatos, ESTADO_ACEPTA_ENVIO)
+
+        def ids(queryset):
+            return list(queryset.values_list('id', flat=True))
+
+        self.assertEqual(embudo['total_candidatos'], candidatos.count())
+        self.assertEqual(embudo['acepto_envio_ids'], ids(acepto))
+        self.assertEqual(
+            embudo['rechazo_envio_ids'], ids(_con_estado_historico(candidatos, ESTADO_RECHAZA_ENVIO)),
+        )
+        self.assertEqual(embudo['acepto_cotiz_ids'], ids(_con_estado_historico(acepto, ESTADO_ACEPTA_COTIZ)))
+        self.assertEqual(embudo['no_apto_ids'], ids(_con_estado_historico(acepto, ESTADO_NO_APTO)))
+        self.assertEqual(
+            (embudo['acepto_envio_count'], embudo['sin_decision_envio_count'],
+             embudo['total_cohorte_acepto'], embudo['en_proceso_cohorte_count']),
+            (3, 2, 3, 1),
+        )
+        self.assertEqual(embudo['acepto_envio_pct'], 50.0)
+        # Los *_qs siguen siendo QuerySets perezosos con el mismo contenido
+        self.assertEqual(ids(embudo['sin_decision_envio_qs']), embudo['sin_decision_envio_ids'])
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class CacheProyeccionTest(ProyeccionRhitsoBase):
+    """Caché por filtros e invalidación por signals."""
+
+    def test_segunda_lectura_sale_del_cache(self):
+        self._escenario()
+        primera = obtener_proyeccion_rhitso()
+
+        with self.assertNumQueries(0):
+            segunda = obtener_proyeccion_rhitso()
+            embudo = obtener_embudo_rhitso(proyeccion=segunda)
+
+        self.assertEqual(primera, segunda)
+        self.assertEqual(embudo['total_candidatos'], 6)
+
+    def test_filtros_distintos_no_comparten_filas(self):
+        ordenes = self._escenario()
+        otra = Sucursal.objects.create(nombre='Drop Proyección', ciudad='CDMX')
+        OrdenServicio.objects.filter(pk=ordenes['rechazo'].pk).update(sucursal=otra)
+
+        self.assertEqual(len(obtener_proyeccion_rhitso()['filas']), 6)
+        self.assertEqual(len(obtener_proyeccion_rhitso(sucursal_id=str(otra.pk))['filas']), 1)
+
+    def test_seguimiento_nuevo_invalida(self):
+        ordenes = self._escenario()
+        antes = obtener_proyeccion_rhitso()
+        self.assertEqual(
+            len(obtener_embudo_rhitso(proyeccion=antes)['rechazo_envio_ids']), 1,
+        )
+
+        SeguimientoRHITSO.objects.create(
+            orden=ordenes['pendiente'],
+            estado=self.estados[ESTADO_RECHAZA_ENVIO],
+            observaciones='Cambió de opinión',
+        )
+
+        despues = obtener_proyeccion_rhitso()
+        fila = next(f for f in despues['filas'] if f['id'] == ordenes['pendiente'].pk)
+        self.assertTrue(fila['rechazo_envio'])
+        self.assertEqual(fila['ultimo_comentario'], 'Cambió de opinión')
+
+    def test_desmarcar_candidata_invalida(self):
+        ordenes = self._escenario()
+        self.assertEqual(len(obtener_proyeccion_rhitso()['filas']), 6)
+
+        orden = OrdenServicio.objects.get(pk=ordenes['rechazo'].pk)
+        orden.es_candidato_rhitso = False
+        orden.save()
+
+        ids = {fila['id'] for fila in obtener_proyeccion_rhitso()['filas']}
+        self.assertEqual(len(ids), 5)
+        self.assertNotIn(orden.pk, ids)
+
+    def test_editar_equipo_de_candidata_invalida(self):
+        ordenes = self._escenario()
+        obtener_proyeccion_rhitso()
+
+        detalle = DetalleEquipo.objects.get(orden=ordenes['en_rhitso'])
+        detalle.numero_serie = 'SN-CORREGIDO'
+        detalle.save()
+
+        fila = next(f for f in obtener_proyeccion_rhitso()['filas'] if f['id'] == ordenes['en_rhitso'].pk)
+        self.assertEqual(fila['numero_serie'], 'SN-CORREGIDO')
+
+    def test_orden_que_nunca_fue_candidata_no_invalida(self):
+        self._escenario()
+        obtener_proyeccion_rhitso()
+        orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio='diagnostico',
+            estado='diagnostico',
+            tecnico_asignado_actual=self.tecnico,
+        )
+        DetalleEquipo.objects.create(
+            orden=orden, orden_cliente='OOW-NO-CAND', tipo_equipo='Laptop', marca='Dell',
+            modelo='Latitude', numero_serie='SN-NO-CAND', falla_principal='Pantalla',
+        )
+
+        with self.assertNumQueries(0):
+            obtener_proyeccion_rhitso()
+
+    def test_escritura_via_default_invalida_mexico(self):
+        """'default' y 'mexico' son la misma BD: comparten contador de versión."""
+        antes = _version_actual('mexico')
+
+        invalidar_proyeccion_rhitso('default')
+
+        self.assertNotEqual(_version_actual('mexico'), antes)
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class VistasProyeccionTest(ProyeccionRhitsoBase):
+    """Dashboard y Excel de candidatos leen las mismas filas."""
+
+    def test_dashboard_y_excel_comparten_filas(self):
+        ordenes = self._escenario()
+        request = RequestFactory().get('/servicio-tecnico/rhitso/dashboard/')
+        request.user = User.objects.create_superuser('admin_proy', 'a@test.local', 'x')
+
+        respuesta = views_dashboard_rhitso.dashboard_rhitso(request)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertContains(respuesta, 'SN-PROY-1')
+
+        # El Excel reutiliza la proyección cacheada por el dashboard
+        with self.assertNumQueries(0):
+            _, libro = views_dashboard_rhitso.exportar_candidatos_rhitso({})
+        titulos = [hoja.title for hoja in libro.wb.worksheets]
+        self.assertEqual(titulos, ['Activos (4)', 'Pendientes (1)', 'Excluidos (1)'])
+
+        fila = next(
+            f for f in obtener_proyeccion_rhitso()['filas'] if f['id'] == ordenes['en_rhitso'].pk
+        )
+        valores = views_dashboard_rhitso._fila_excel_rhitso(fila)
+        self.assertEqual(valores[8:10], ['RHITSO', '1/2'])
+        self.assertEqual(valores[-1], 'Enviado')
+
+
+class DiasHabilesLoteTest(SimpleTestCase):
+    """El conteo vectorizado respeta la regla de calcular_dias_habiles."""
+
+    def test_igual_que_dia_por_dia(self):
+        base = date(2025, 10, 1)
+        pares = [
+            (base + timedelta(days=inicio), base + timedelta(days=fin))
+            for inicio in range(0, 21, 3)
+            for fin in range(0, 21, 2)
+        ]
+        pares += [(base, None), ('2025-10-09', '2025-10-14'), (None, base)]
+
+        self.assertEqual(
+            calcular_dias_habiles_lote([p[0] for p in pares], [p[1] for p in pares]),
+            [calcular_dias_habiles(*p) if p[0] is not None else 0 for p in pares],
+        )
+        self.assertEqual(calcular_dias_habiles_lote([], []), [])
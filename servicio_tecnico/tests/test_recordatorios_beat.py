@@ -0,0 +1,211 @@
+"""
+Tests del barrido diario de recordatorios (imágenes y encuestas).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+1) Las reglas de elegibilidad se resuelven en SQL: el número de consultas por
+   país no crece con el número de órdenes.
+2) Los mensajes que salen del barrido son los mismos que arma la lógica
+   orden por orden (construir_mensaje_*).
+3) La tarea por lote notifica, registra historial y marca el envío de todo
+   el lote; si el Beat corre dos veces el mismo día, no repite.
+4) El Beat reparte el trabajo en lotes (un group de Celery por país).
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico import tasks
+from servicio_tecnico.models import (
+    Cotizacion,
+    DetalleEquipo,
+    HistorialOrden,
+    ImagenOrden,
+    OrdenServicio,
+    RecordatorioImagenOrden,
+)
+from servicio_tecnico.utils_recordatorio_imagenes import (
+    construir_mensaje_recordatorio_tecnico,
+    recordatorios_pendientes_pais,
+)
+
+User = get_user_model()
+
+
+class RecordatoriosImagenesBeatTest(TestCase):
+    """Selección por QuerySets anotados + envío por lotes."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        self.sucursal = Sucursal.objects.create(nombre='Sucursal Beat', ciudad='CDMX')
+        self.tecnico = self._empleado('tecnico_beat', 'tecnico')
+        self.inspector = self._empleado('inspector_beat', 'inspector')
+        self.contador = 0
+
+    def _empleado(self, username, rol):
+        return Empleado.objects.create(
+            nombre_completo=f'Empleado {username}',
+            cargo=rol,
+            area='Laboratorio',
+            email=f'{username}@test.local',
+            sucursal=self.sucursal,
+            user=User.objects.create_user(username=username, password='x'),
+            rol=rol,
+        )
+
+    def _orden(self, estado, tipos_imagen=(), acepto='sin_cotizacion', dias_creada=3, **campos):
+        """Orden con detalle, imágenes y (opcional) cotización; fechas movidas al pasado."""
+        self.contador += 1
+        orden = OrdenServicio.objects.create(
+            sucursal=self.sucursal,
+            tipo_servicio=campos.pop('tipo_servicio', 'diagnostico'),
+            estado=estado,
+            tecnico_asignado_actual=self.tecnico,
+        )
+        DetalleEquipo.objects.create(
+            orden=orden,
+            orden_cliente=f'OOW-BEAT-{self.contador}',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie=f'SN-BEAT-{self.contador}',
+            falla_principal='No enciende',
+        )
+        for tipo in tipos_imagen:
+            ImagenOrden.objects.create(
+                orden=orden, tipo=tipo, imagen=f'x/{tipo}.jpg', subido_por=self.tecnico,
+            )
+        if acepto != 'sin_cotizacion':
+            Cotizacion.objects.create(orden=orden, costo_mano_obra=Decimal('100'), usuario_acepto=acepto)
+
+        creada = timezone.now() - timedelta(days=dias_creada)
+        OrdenServicio.objects.filter(pk=orden.pk).update(
+            fecha_ingreso=creada,
+            fecha_finalizacion=timezone.now() - timedelta(days=1) if estado == 'finalizado' else None,
+            **campos,
+        )
+        HistorialOrden.objects.filter(orden=orden, tipo_evento='creacion').update(fecha_evento=creada)
+        return orden
+
+    def _escenario(self):
+        """Un caso de cada regla + órdenes que NO deben recordarse."""
+        return {
+            'ingreso': self._orden('diagnostico'),
+            # Finalizadas ayer pero ingresadas hace 10 días: fuera de la ventana de ingreso
+            'egreso_y_tecnico': self._orden(
+                'finalizado', tipos_imagen=['diagnostico'], acepto=True, dias_creada=10,
+            ),
+            'venta_mostrador': self._orden(
+                'finalizado', tipos_imagen=['egreso'], tipo_servicio='venta_mostrador', dias_creada=10,
+            ),
+            # No deben salir: ingreso reciente, ingreso viejo, finalizada completa
+            'reciente': self._orden('diagnostico', dias_creada=1),
+            'vieja': self._orden('diagnostico', dias_creada=10),
+            'completa': self._orden(
+                'finalizado', tipos_imagen=['ingreso', 'egreso', 'diagnostico'], acepto=False, dias_creada=10,
+            ),
+        }
+
+    def _claves(self, recordatorios):
+        return {(r['orden_id'], r['tipo_recordatorio']) for r in recordatorios}
+
+    def test_reglas_en_sql(self):
+        ordenes = self._escenario()
+
+        recordatorios = recordatorios_pendientes_pais('default')
+
+        self.assertEqual(self._claves(recordatorios), {
+            (ordenes['ingreso'].pk, 'ingreso_inspector'),
+            (ordenes['egreso_y_tecnico'].pk, 'egreso_inspector'),
+            (ordenes['egreso_y_tecnico'].pk, 'tecnico_faltantes'),
+            (ordenes['venta_mostrador'].pk, 'tecnico_faltantes'),
+        })
+        tecnico = next(
+            r for r in recordatorios
+            if r['orden_id'] == ordenes['egreso_y_tecnico'].pk and r['tipo_recordatorio'] == 'tecnico_faltantes'
+        )
+        orden = OrdenServicio.objects.select_related('detalle_equipo', 'cotizacion').get(
+            pk=ordenes['egreso_y_tecnico'].pk,
+        )
+        self.assertEqual((tecnico['titulo'], tecnico['mensaje']), construir_mensaje_recordatorio_tecnico(orden))
+        self.assertIn('Reparación', tecnico['mensaje'])
+        self.assertEqual(tecnico['usuario_ids'], [self.tecnico.user_id])
+
+    def test_consultas_no_crecen_con_las_ordenes(self):
+        self._escenario()
+        with CaptureQueriesContext(connection) as pocas:
+            recordatorios_pendientes_pais('default')
+
+        self._escenario()
+        self._escenario()
+        with CaptureQueriesContext(connection) as muchas:
+            total = len(recordatorios_pendientes_pais('default'))
+
+        self.assertEqual(total, 12)
+        self.assertEqual(len(muchas), len(pocas))
+        self.assertLessEqual(len(muchas), 4)
+
+    def test_recordado_hoy_no_vuelve_a_salir(self):
+        orden = self._orden('diagnostico')
+        RecordatorioImagenOrden.objects.create(
+            orden=orden, tipo='ingreso_inspector', fecha_ultimo_envio=timezone.now(),
+        )
+        ayer = self._orden('diagnostico')
+        RecordatorioImagenOrden.objects.create(
+            orden=ayer, tipo='ingreso_inspector', fecha_ultimo_envio=timezone.now() - timedelta(days=1),
+        )
+
+        self.assertEqual(
+            self._claves(recordatorios_pendientes_pais('default')),
+            {(ayer.pk, 'ingreso_inspector')},
+        )
+
+    @patch('notificaciones.utils.notificar_warning')
+    @patch('notificaciones.push_service.enviar_push_a_usuario')
+    def test_lote_notifica_registra_y_no_repite(self, mock_push, mock_campanita):
+        ordenes = self._escenario()
+        lote = recordatorios_pendientes_pais('default')
+
+        resultado = tasks.enviar_recordatorios_imagen_lote_task.apply(
+            args=(lote,), kwargs={'db_alias': 'default'},
+        ).get()
+
+        self.assertEqual(resultado['enviados'], 4)
+        self.assertEqual(mock_push.call_count, 4)
+        self.assertEqual(RecordatorioImagenOrden.objects.count(), 4)
+        self.assertTrue(HistorialOrden.objects.filter(
+            orden=ordenes['venta_mostrador'],
+            comentario__startswith='🔔 Recordatorio de fotos pendientes enviado al técnico',
+        ).exists())
+        self.assertEqual(recordatorios_pendientes_pais('default'), [])
+
+        # El mismo lote otra vez (Beat duplicado): nada nuevo
+        repetido = tasks.enviar_recordatorios_imagen_lote_task.apply(
+            args=(lote,), kwargs={'db_alias': 'default'},
+        ).get()
+        self.assertEqual(repetido['enviados'], 0)
+        self.assertEqual(mock_push.call_count, 4)
+
+    @patch('celery.group')
+    def test_beat_encola_por_lotes(self, mock_group):
+        for _ in range(3):
+            self._escenario()
+
+        with patch('servicio_tecnico.utils_recordatorio_imagenes.TAMANO_LOTE_RECORDATORIOS', 5), \
+                patch('config.middleware_pais.get_current_db_alias', return_value='default'):
+            resultado = tasks._encolar_recordatorios_imagenes_pais()
+
+        self.assertEqual(resultado, {'procesadas': 12})
+        firmas = list(mock_group.call_args.args[0])
+        self.assertEqual([len(firma.args[0]) for firma in firmas], [5, 5, 2])
+        self.assertTrue(all(firma.kwargs == {'db_alias': 'default'} for firma in firmas))
+        mock_group.return_value.apply_async.assert_called_once_with()
@@ -0,0 +1,187 @@
+"""
+Tests de la medición de rendimiento (config/rendimiento.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+Se arma una vista de prueba que hace consultas repetidas, renderiza una
+plantilla, usa la caché y abre una URL `data:` (urllib sin red). Con el
+muestreo al 100% el middleware debe contar todo eso y ponerlo en el header
+Server-Timing (solo a usuarios staff o con DEBUG); con muestreo 0 no debe tocar nada. También se prueban el log
+JSON de requests lentos, las tareas Celery y presupuesto_consultas.
+"""
+
+import json
+import logging
+import urllib.request
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template import engines
+from django.test import RequestFactory, TestCase, override_settings
+
+from config.logging_formatters import RendimientoFormatter
+from config.rendimiento import (
+    MedicionRendimientoMiddleware,
+    PresupuestoConsultasExcedido,
+    finalizar_medicion_tarea,
+    iniciar_medicion_tarea,
+    medicion_actual,
+    presupuesto_consultas,
+)
+
+CACHE_LOCAL = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def vista_con_trabajo(request):
+    """Tres consultas iguales (N+1), una plantilla, caché y HTTP."""
+    for _ in range(3):
+        list(User.objects.filter(username='nadie'))
+    html = engines['django'].from_string('<p>{{ texto }}</p>').render({'texto': 'hola'})
+    cache.set('rendimiento-test', 1)
+    cache.get('rendimiento-test')
+    cache.get('rendimiento-no-existe')
+    cache.get_many(['rendimiento-test', 'rendimiento-tampoco'])
+    with urllib.request.urlopen('data:,ok') as respuesta:
+        respuesta.read()
+    return HttpResponse(html)
+
+
+@override_settings(CACHES=CACHE_LOCAL, RENDIMIENTO_MUESTREO=1)
+class MiddlewareRendimientoTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _medir(self, vista=vista_con_trabajo, usuario=None):
+        medidas = []
+
+        def vista_espia(request):
+            respuesta = vista(request)
+            medidas.append(medicion_actual())
+            return respuesta
+
+        request = self.factory.get('/prueba/')
+        request.user = usuario or User(username='staff_rendimiento', is_staff=True)
+        respuesta = MedicionRendimientoMiddleware(vista_espia)(request)
+        return respuesta, medidas[0]
+
+    def test_cuenta_consultas_plantillas_cache_y_http(self):
+        respuesta, medicion = self._medir()
+
+        self.assertEqual(medicion.consultas.total, 3)
+        self.assertEqual(medicion.consultas.duplicadas, 2)
+        self.assertEqual(medicion.consultas.mas_repetida()[1], 3)
+        self.assertEqual((medicion.cache_aciertos, medicion.cache_fallos), (2, 2))
+        self.assertEqual(medicion.http_llamadas, 1)
+        self.assertGreater(medicion.plantillas_ms, 0)
+
+        timing = respuesta['Server-Timing']
+        self.assertIn('db;dur=', timing)
+        self.assertIn('"3 consultas, 2 duplicadas"', timing)
+        self.assertIn('cache;desc="2 aciertos, 2 fallos"', timing)
+        self.assertIn('total;dur=', timing)
+
+    def test_al_terminar_no_queda_medicion_ni_envolturas(self):
+        from django.db import connection
+
+        self._medir()
+        self.assertIsNone(medicion_actual())
+        self.assertEqual(connection.execute_wrappers, [])
+
+    @override_settings(RENDIMIENTO_MUESTREO=0)
+    def test_fuera_de_la_muestra_no_mide(self):
+        respuesta = MedicionRendimientoMiddleware(vista_con_trabajo)(self.factory.get('/prueba/'))
+        self.assertFalse(respuesta.has_header('Server-Timing'))
+
+    def test_server_timing_solo_para_staff(self):
+        for usuario in (AnonymousUser(), User(username='cliente_rendimiento')):
+            respuesta, medicion = self._medir(usuario=usuario)
+            self.assertFalse(respuesta.has_header('Server-Timing'), usuario)
+            self.assertEqual(medicion.consultas.total, 3)
+
+        with override_settings(DEBUG=True):
+            respuesta, _ = self._medir(usuario=AnonymousUser())
+        self.assertTrue(respuesta.has_header('Server-Timing'))
+
+    @override_settings(RENDIMIENTO_SERVER_TIMING=False)
+    def test_server_timing_se_puede_apagar(self):
+        respuesta, medicion = self._medir()
+        self.assertFalse(respuesta.has_header('Server-Timing'))
+        self.assertEqual(medicion.consultas.total, 3)
+
+    @override_settings(RENDIMIENTO_UMBRAL_CONSULTAS=3)
+    def test_request_con_muchas_consultas_va_al_log_en_json(self):
+        with self.assertLogs('rendimiento', 'WARNING') as logs:
+            self._medir()
+
+        datos = logs.records[0].rendimiento
+        self.assertEqual(datos['ruta'], '/prueba/')
+        self.assertEqual(datos['status'], 200)
+        self.assertEqual(datos['consultas'], 3)
+        self.assertEqual(datos['sql_mas_repetido_veces'], 3)
+        self.assertIn('auth_user', datos['sql_mas_repetido'])
+
+        linea = json.loads(RendimientoFormatter().format(logs.records[0]))
+        self.assertEqual(linea['nivel'], 'WARNING')
+        self.assertEqual(linea['consultas'], 3)
+
+    def test_request_rapido_no_va_al_log(self):
+        logger = logging.getLogger('rendimiento')
+        with self.assertNoLogs(logger, 'WARNING'):
+            self._medir(lambda request: HttpResponse('ok'))
+
+
+@override_settings(RENDIMIENTO_MUESTREO=1, RENDIMIENTO_UMBRAL_CONSULTAS=2)
+class MedicionTareasCeleryTest(TestCase):
+
+    def test_tarea_medida_y_registrada(self):
+        iniciar_medicion_tarea('tarea-1', 'servicio_tecnico.tasks.prueba')
+        User.objects.count()
+        User.objects.count()
+        with self.assertLogs('rendimiento', 'WARNING') as logs:
+            medicion = finalizar_medicion_tarea('tarea-1', 'SUCCESS')
+
+        self.assertEqual(medicion.consultas.total, 2)
+        self.assertIsNone(medicion_actual())
+        datos = logs.records[0].rendimiento
+        self.assertEqual((datos['nombre'], datos['estado']), ('servicio_tecnico.tasks.prueba', 'SUCCESS'))
+
+    @override_settings(RENDIMIENTO_MUESTREO=0)
+    def test_tarea_fuera_de_la_muestra(self):
+        iniciar_medicion_tarea('tarea-2', 'x')
+        self.assertIsNone(medicion_actual())
+        self.assertIsNone(finalizar_medicion_tarea('tarea-2', 'SUCCESS'))
+
+
+class PresupuestoConsultasTest(TestCase):
+
+    def test_dentro_del_presupuesto(self):
+        with presupuesto_consultas(2, estricto=True) as presupuesto:
+            User.objects.count()
+        self.assertEqual(presupuesto.consultas.total, 1)
+
+    def test_estricto_falla_con_la_consulta_mas_repetida(self):
+        with self.assertRaises(PresupuestoConsultasExcedido) as error:
+            with presupuesto_consultas(1, estricto=True):
+                User.objects.count()
+                User.objects.count()
+        self.assertIn('2 consultas (presupuesto 1)', str(error.exception))
+        self.assertIn('auth_user', str(error.exception))
+
+    @override_settings(RENDIMIENTO_PRESUPUESTO_ESTRICTO=False)
+    def test_no_estricto_solo_avisa(self):
+        with self.assertLogs('rendimiento', 'WARNING'):
+            with presupuesto_consultas(0):
+                User.objects.count()
+
+    @override_settings(RENDIMIENTO_PRESUPUESTO_ESTRICTO=True)
+    def test_como_decorador_cada_llamada_cuenta_por_separado(self):
+        @presupuesto_consultas(1)
+        def una_consulta():
+            return User.objects.count()
+
+        # Si el contador se compartiera, la segunda llamada sumaría 2
+        una_consulta()
+        una_consulta()
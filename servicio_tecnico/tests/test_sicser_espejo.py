@@ -0,0 +1,326 @@
+"""
+Tests del espejo local de SICSER (sicser_espejo.py + consultar_sicser).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+La pantalla «Consultar SICSER» ya no descarga la API en cada request: lee
+OrdenSicserEspejo. Aquí comprobamos que la sincronización solo escribe lo
+que cambió y que la vista pagina desde la tabla local.
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth.models import Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico import views_sicser
+from servicio_tecnico.models import DetalleEquipo, OrdenServicio, OrdenSicserEspejo
+from servicio_tecnico.sicser_espejo import (
+    SICSER_FILAS_POR_PAGINA,
+    buscar_registro,
+    queryset_listado_espejo,
+    realinear_flags_importacion,
+    resumen_espejo,
+    sincronizar_origen,
+)
+
+CACHE_LOCAL = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+def _oow(id_orden, pais='MX', **extra):
+    """Registro crudo OOW mínimo como lo devuelve la API de SICSER."""
+    item = {
+        'id_orden': id_orden,
+        'folio': f'{pais}_CIS_{pais}_DROPOFF_{id_orden:05d}',
+        'service_tag': f'ST{id_orden}',
+        'nombre_cliente': f'Cliente {id_orden}',
+        'marca': 'Dell',
+        'fecha': '2026-10-01 10:00:00',
+    }
+    item.update(extra)
+    return item
+
+
+def _detalle_importado(id_externo):
+    """Orden SIGMA mínima importada desde el registro OOW `id_externo`."""
+    sucursal = Sucursal.objects.create(nombre=f'Sucursal Espejo {id_externo}', ciudad='CDMX')
+    empleado = Empleado.objects.create(
+        nombre_completo=f'Técnico Espejo {id_externo}',
+        cargo='Técnico',
+        area='Laboratorio',
+        email=f'espejo{id_externo}@test.local',
+        sucursal=sucursal,
+    )
+    orden = OrdenServicio.objects.create(
+        sucursal=sucursal,
+        tipo_servicio='diagnostico',
+        estado='espera',
+        tecnico_asignado_actual=empleado,
+    )
+    DetalleEquipo.objects.create(
+        orden=orden,
+        sicser_origen='oow',
+        sicser_id_externo=str(id_externo),
+        tipo_equipo='Laptop',
+        marca='Dell',
+        modelo='Latitude',
+        numero_serie=f'ST{id_externo}',
+        email_cliente='a@b.com',
+        falla_principal='No enciende',
+        gama='media',
+    )
+    return orden
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class SincronizarEspejoSicserTest(TestCase):
+    """sincronizar_origen: altas, cambios por huella, retiros y flags."""
+
+    databases = {'default', 'mexico'}
+
+    def test_primera_sincronizacion_crea_solo_filas_del_pais(self):
+        """Los registros de otros países no entran al espejo de MX."""
+        resumen = sincronizar_origen('oow', [_oow(1), _oow(2), _oow(3, pais='CL')], 'MX')
+
+        self.assertEqual(resumen['nuevas'], 2)
+        self.assertEqual(
+            set(OrdenSicserEspejo.objects.values_list('id_externo', flat=True)),
+            {'1', '2'},
+        )
+        fila = OrdenSicserEspejo.objects.get(id_externo='1')
+        self.assertEqual(fila.codigo_pais, 'MX')
+        self.assertIn('cliente 1', fila.texto_busqueda)
+        self.assertEqual(fila.a_registro().folio, 'MX_CIS_MX_DROPOFF_00001')
+
+    def test_registros_sin_cambios_no_se_reescriben(self):
+        """Misma huella → cero escrituras en la segunda pasada."""
+        sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+
+        resumen = sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+
+        self.assertEqual(resumen['nuevas'], 0)
+        self.assertEqual(resumen['actualizadas'], 0)
+        self.assertEqual(resumen['sin_cambios'], 2)
+
+    def test_cambio_de_huella_actualiza_la_fila(self):
+        """Si SICSER cambia un dato, la fila se actualiza en su lugar."""
+        sincronizar_origen('oow', [_oow(1)], 'MX')
+        pk_original = OrdenSicserEspejo.objects.get(id_externo='1').pk
+
+        resumen = sincronizar_origen('oow', [_oow(1, nombre_cliente='Nuevo Nombre')], 'MX')
+
+        self.assertEqual(resumen['actualizadas'], 1)
+        fila = OrdenSicserEspejo.objects.get(id_externo='1')
+        self.assertEqual(fila.pk, pk_original)
+        self.assertEqual(fila.nombre_cliente, 'Nuevo Nombre')
+
+    def test_registro_ausente_queda_no_vigente_y_vuelve_si_reaparece(self):
+        """Desaparecer de SICSER marca vigente=False sin borrar la fila."""
+        sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+
+        resumen = sincronizar_origen('oow', [_oow(1)], 'MX')
+        self.assertEqual(resumen['retiradas'], 1)
+        self.assertFalse(OrdenSicserEspejo.objects.get(id_externo='2').vigente)
+
+        sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+        self.assertTrue(OrdenSicserEspejo.objects.get(id_externo='2').vigente)
+
+    def test_flag_importada_sale_de_detalle_equipo(self):
+        """Las órdenes ya importadas a SIGMA quedan enlazadas en el espejo."""
+        sucursal = Sucursal.objects.create(nombre='Sucursal Espejo', ciudad='CDMX')
+        empleado = Empleado.objects.create(
+            nombre_completo='Técnico Espejo',
+            cargo='Técnico',
+            area='Laboratorio',
+            email='espejo@test.local',
+            sucursal=sucursal,
+        )
+        orden = OrdenServicio.objects.create(
+            sucursal=sucursal,
+            tipo_servicio='diagnostico',
+            estado='espera',
+            tecnico_asignado_actual=empleado,
+        )
+        DetalleEquipo.objects.create(
+            orden=orden,
+            sicser_origen='oow',
+            sicser_id_externo='2',
+            tipo_equipo='Laptop',
+            marca='Dell',
+            modelo='Latitude',
+            numero_serie='ST2',
+            email_cliente='a@b.com',
+            falla_principal='No enciende',
+            gama='media',
+        )
+
+        sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+
+        fila = OrdenSicserEspejo.objects.get(id_externo='2')
+        self.assertTrue(fila.ya_importada)
+        self.assertEqual(fila.orden_id, orden.pk)
+        resumen = resumen_espejo('MX')
+        self.assertEqual(resumen['total_oow'], 2)
+        self.assertEqual(resumen['nuevas_oow'], 1)
+
+    def test_flags_solo_se_revisan_en_filas_tocadas(self):
+        """Filas sin cambios no consultan DetalleEquipo; la que cambia sí se alinea."""
+        sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+        orden = _detalle_importado(2)
+
+        resumen = sincronizar_origen('oow', [_oow(1), _oow(2)], 'MX')
+        self.assertEqual(resumen['flags_importacion'], 0)
+        self.assertFalse(OrdenSicserEspejo.objects.get(id_externo='2').ya_importada)
+
+        resumen = sincronizar_origen('oow', [_oow(1), _oow(2, marca='Alienware')], 'MX')
+        self.assertEqual(resumen['flags_importacion'], 1)
+        self.assertEqual(OrdenSicserEspejo.objects.get(id_externo='2').orden_id, orden.pk)
+
+    def test_realinear_corrige_filas_que_sicser_no_cambio(self):
+        """Orden borrada vuelve a «nueva»; orden creada por otro camino se marca."""
+        borrada = _detalle_importado(1)
+        sincronizar_origen('oow', [_oow(1), _oow(2), _oow(3)], 'MX')
+        self.assertTrue(OrdenSicserEspejo.objects.get(id_externo='1').ya_importada)
+
+        borrada.delete()
+        otra = _detalle_importado(2)
+        self.assertEqual(realinear_flags_importacion('oow', 'default'), 2)
+
+        huerfana = OrdenSicserEspejo.objects.get(id_externo='1')
+        self.assertFalse(huerfana.ya_importada)
+        self.assertIsNone(huerfana.orden_id)
+        self.assertEqual(OrdenSicserEspejo.objects.get(id_externo='2').orden_id, otra.pk)
+        self.assertEqual(resumen_espejo('MX')['nuevas_oow'], 2)
+        self.assertEqual(realinear_flags_importacion('oow', 'default'), 0)
+
+    @patch('servicio_tecnico.sicser_client.buscar_registro_oow_por_id')
+    def test_buscar_registro_lee_espejo_antes_que_api(self, mock_api):
+        """Si el registro está en el espejo no se llama a SICSER."""
+        sincronizar_origen('oow', [_oow(7)], 'MX')
+
+        registro = buscar_registro('oow', 7, 'MX')
+
+        self.assertEqual(registro.id_orden, 7)
+        mock_api.assert_not_called()
+
+
+@override_settings(
+    CACHES=CACHE_LOCAL,
+    STORAGES={
+        'default': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        },
+        'staticfiles': {
+            'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+        },
+    },
+)
+class ConsultarSicserEspejoViewTest(TestCase):
+    """La vista pagina desde el espejo sin tocar la API de SICSER."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        """
+        Usuario con view_ordenservicio y espejo con más de una página.
+
+        Efectos secundarios: crea User, Permission y filas del espejo en BD test.
+        """
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='espejo_sicser', password='x')
+        ct = ContentType.objects.get_for_model(OrdenServicio)
+        self.user.user_permissions.add(
+            Permission.objects.get(content_type=ct, codename='view_ordenservicio'),
+        )
+        self.listado = reverse('servicio_tecnico:consultar_sicser')
+        sincronizar_origen(
+            'oow',
+            [_oow(i) for i in range(1, SICSER_FILAS_POR_PAGINA + 6)],
+            'MX',
+        )
+
+    @patch('servicio_tecnico.sicser_client.descargar_registros_crudos')
+    def test_listado_oow_paginado_desde_espejo(self, mock_descarga):
+        """Página 2 trae el resto y no hay descarga porque el espejo ya tiene datos."""
+        request = self.factory.get(self.listado, {'tab': 'oow', 'page': '2'})
+        request.user = self.user
+
+        response = views_sicser.consultar_sicser(request)
+
+        self.assertEqual(response.status_code, 200)
+        mock_descarga.assert_not_called()
+        html = response.content.decode()
+        self.assertIn('Página 2 de 2', html)
+        self.assertIn(f'{SICSER_FILAS_POR_PAGINA + 5} encontradas', html)
+
+    @patch('servicio_tecnico.sicser_client.descargar_registros_crudos')
+    def test_busqueda_filtra_en_bd(self, mock_descarga):
+        """q filtra por texto_busqueda dentro de la consulta paginada."""
+        request = self.factory.get(self.listado, {'tab': 'oow', 'q': 'ST12'})
+        request.user = self.user
+
+        response = views_sicser.consultar_sicser(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('1 encontradas', response.content.decode())
+
+
+def _where(queryset):
+    """Solo la cláusula WHERE del SQL (el SELECT trae todas las columnas)."""
+    return str(queryset.query).split(' WHERE ', 1)[1]
+
+
+@override_settings(CACHES=CACHE_LOCAL)
+class BusquedaEspejoSicserTest(TestCase):
+    """queryset_listado_espejo: identificadores por columnas indexadas, nombres por texto."""
+
+    databases = {'default', 'mexico'}
+
+    def setUp(self):
+        sincronizar_origen('oow', [_oow(i) for i in range(1, 25)], 'MX')
+
+    def test_folio_por_prefijo_sin_importar_mayusculas(self):
+        queryset = queryset_listado_espejo('oow', 'MX', 'mx_cis_mx_dropoff_0002')
+
+        self.assertEqual(
+            set(queryset.values_list('id_externo', flat=True)),
+            {'20', '21', '22', '23', '24'},
+        )
+
+    def test_service_tag_exacto_va_directo_sin_texto(self):
+        queryset = queryset_listado_espejo('oow', 'MX', 'st12')
+
+        self.assertNotIn('texto_busqueda', _where(queryset))
+        self.assertEqual(list(queryset.values_list('id_externo', flat=True)), ['12'])
+
+    def test_numero_suma_prefijo_y_coincidencias_a_mitad_del_texto(self):
+        """Un número que abre un service tag no oculta las filas que lo contienen en medio."""
+        sincronizar_origen(
+            'oow',
+            [_oow(i) for i in range(1, 25)]
+            + [_oow(40, service_tag='55012'), _oow(41, nombre_cliente='Tel 4455012')],
+            'MX',
+        )
+
+        queryset = queryset_listado_espejo('oow', 'MX', '5501')
+
+        self.assertIn('texto_busqueda', _where(queryset))
+        self.assertEqual(set(queryset.values_list('id_externo', flat=True)), {'40', '41'})
+
+    def test_folio_e_id_externo(self):
+        folio = queryset_listado_espejo('oow', 'MX', 'mx_cis_mx_dropoff_00007')
+        self.assertEqual(list(folio.values_list('id_externo', flat=True)), ['7'])
+        self.assertEqual(
+            list(queryset_listado_espejo('oow', 'MX', '13').values_list('id_externo', flat=True)),
+            ['13'],
+        )
+
+    def test_texto_libre_busca_en_texto_busqueda(self):
+        queryset = queryset_listado_espejo('oow', 'MX', 'Cliente 17')
+
+        self.assertIn('texto_busqueda', _where(queryset))
+        self.assertEqual(list(queryset.values_list('id_externo', flat=True)), ['17'])
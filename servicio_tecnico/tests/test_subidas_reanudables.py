@@ -0,0 +1,283 @@
+"""
+Tests de la subida reanudable de videos (services/subidas_reanudables.py
+y views_subidas_reanudables.py).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+No se corre FFmpeg ni Celery: .delay() se reemplaza por un mock y las
+subidas se guardan en una carpeta temporal (override_settings). Usamos
+RequestFactory (no Client) para no pasar por PaisMiddleware.
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from inventario.models import Empleado, Sucursal
+from servicio_tecnico.models import OrdenServicio
+from servicio_tecnico.services import subidas_reanudables as subidas
+from servicio_tecnico.tasks import comprimir_video_evidencia_task
+from servicio_tecnico.views_subidas_reanudables import iniciar_subida_video, subida_video
+
+User = get_user_model()
+
+VIDEO = bytes(range(256)) * 40  # 10 KB
+
+
+def _sha(datos):
+    return hashlib.sha256(datos).hexdigest()
+
+
+class _CarpetaTemporal:
+    """Mezcla: MEDIA_ROOT y carpeta de subidas en un tmp que se borra al final."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        ajustes = override_settings(
+            MEDIA_ROOT=self.tmp,
+            SUBIDAS_REANUDABLES_DIR=os.path.join(self.tmp, 'subidas'),
+            FILE_UPLOAD_TEMP_DIR=None,
+            SUBIDA_BLOQUE_MAX_MB=1,
+        )
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+
+
+class ServicioSubidasTests(_CarpetaTemporal, SimpleTestCase):
+    def _crear(self, datos=VIDEO):
+        return subidas.crear_subida({'tamano': len(datos), 'sha256': _sha(datos), 'nombre': 'v.mp4'})
+
+    def test_bloques_y_completar(self):
+        subida_id = self._crear()
+        self.assertEqual(subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:4000]), 4000), 4000)
+        self.assertEqual(subidas.leer_subida(subida_id)['offset'], 4000)
+        resto = len(VIDEO) - 4000
+        self.assertEqual(subidas.agregar_bloque(subida_id, 4000, io.BytesIO(VIDEO[4000:]), resto), len(VIDEO))
+
+        destino = os.path.join(self.tmp, 'final.mp4')
+        subidas.completar_subida(subida_id, destino)
+        with open(destino, 'rb') as archivo:
+            self.assertEqual(archivo.read(), VIDEO)
+        with self.assertRaises(subidas.SubidaNoEncontrada):
+            subidas.leer_subida(subida_id)
+
+    def test_offset_distinto_devuelve_el_del_servidor(self):
+        subida_id = self._crear()
+        subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:100]), 100)
+        with self.assertRaises(subidas.OffsetInvalido) as ctx:
+            subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:100]), 100)
+        self.assertEqual(ctx.exception.offset, 100)
+
+    def test_bloque_cortado_deja_lo_recibido(self):
+        subida_id = self._crear()
+        # Content-Length dice 1000 pero la conexión solo entregó 300 bytes
+        self.assertEqual(subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:300]), 1000), 300)
+        self.assertEqual(subidas.leer_subida(subida_id)['offset'], 300)
+
+    def test_no_acepta_mas_bytes_que_los_declarados(self):
+        subida_id = self._crear(VIDEO[:10])
+        with self.assertRaises(ValueError):
+            subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:11]), 11)
+
+    def test_completar_sin_todos_los_bytes(self):
+        subida_id = self._crear()
+        subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:10]), 10)
+        with self.assertRaises(ValueError):
+            subidas.completar_subida(subida_id, os.path.join(self.tmp, 'final.mp4'))
+        self.assertEqual(subidas.leer_subida(subida_id)['offset'], 10)
+
+    def test_verificar_sha256(self):
+        ruta = os.path.join(self.tmp, 'v.mp4')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(VIDEO)
+        subidas.verificar_sha256(ruta, _sha(VIDEO).upper())
+        with self.assertRaises(ValueError):
+            subidas.verificar_sha256(ruta, _sha(b'otra cosa'))
+
+    def test_bloque_mientras_otro_request_escribe(self):
+        subida_id = self._crear()
+        _ruta_meta, ruta_part = subidas._rutas(subida_id)
+
+        # Un PATCH anterior (ya abandonado por el navegador) sigue escribiendo
+        with subidas._bloqueo_part(ruta_part) as descriptor:
+            os.write(descriptor, VIDEO[:100])
+            with self.assertRaises(subidas.SubidaOcupada):
+                subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:100]), 100)
+            with self.assertRaises(subidas.SubidaOcupada):
+                subidas.completar_subida(subida_id, os.path.join(self.tmp, 'final.mp4'))
+
+        # Al soltarlo, el reintento ve el offset real en vez de duplicar bytes
+        with self.assertRaises(subidas.OffsetInvalido) as ctx:
+            subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:100]), 100)
+        self.assertEqual(ctx.exception.offset, 100)
+
+    def test_bloque_despues_de_completar(self):
+        subida_id = self._crear(VIDEO[:10])
+        subidas.agregar_bloque(subida_id, 0, io.BytesIO(VIDEO[:10]), 10)
+        subidas.completar_subida(subida_id, os.path.join(self.tmp, 'final.mp4'))
+        with self.assertRaises(subidas.SubidaNoEncontrada):
+            subidas.agregar_bloque(subida_id, 10, io.BytesIO(b''), 0)
+
+    def test_id_invalido(self):
+        with self.assertRaises(subidas.SubidaNoEncontrada):
+            subidas.leer_subida('../../settings')
+
+    def test_limpieza_borra_solo_lo_vencido(self):
+        vieja, nueva = self._crear(), self._crear()
+        video_tmp = os.path.join(self.tmp, 'video_tmp')
+        os.makedirs(video_tmp)
+        crudo = os.path.join(video_tmp, 'sigmavideo_abc.webm')
+        with open(crudo, 'wb') as archivo:
+            archivo.write(b'x')
+        hace_dos_dias = time.time() - 48 * 3600
+        for ruta in [crudo, *(subidas.directorio_subidas() / f'{vieja}{ext}' for ext in ('.json', '.part'))]:
+            os.utime(ruta, (hace_dos_dias, hace_dos_dias))
+
+        borrados = subidas.limpiar_subidas_vencidas(24)
+
+        self.assertEqual(borrados, {'subidas': 2, 'video_tmp': 1, 'upload_temp': 0})
+        self.assertFalse(os.path.exists(crudo))
+        subidas.leer_subida(nueva)
+        with self.assertRaises(subidas.SubidaNoEncontrada):
+            subidas.leer_subida(vieja)
+
+
+class VistasSubidaReanudableTests(_CarpetaTemporal, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        sucursal = Sucursal.objects.create(nombre='Sucursal Subidas', ciudad='CDMX')
+        self.user = User.objects.create_superuser(username='tec_subidas', password='x', email='t@x.com')
+        self.empleado = Empleado.objects.create(
+            nombre_completo='Técnico Subidas', cargo='Técnico', area='Laboratorio',
+            sucursal=sucursal, user=self.user,
+        )
+        self.orden = OrdenServicio.objects.create(
+            sucursal=sucursal, tecnico_asignado_actual=self.empleado, tipo_servicio='diagnostico',
+        )
+        pais = patch('config.paises_config.get_pais_actual', return_value={'db_alias': 'default'})
+        pais.start()
+        self.addCleanup(pais.stop)
+
+    def _iniciar(self, **extra):
+        datos = {
+            'tipo': 'diagnostico', 'descripcion': 'Parpadea', 'orientacion_video': '90',
+            'nombre': 'grabacion.webm', 'tamano': len(VIDEO), 'content_type': 'video/webm;codecs=vp9',
+            'sha256': _sha(VIDEO), **extra,
+        }
+        request = self.factory.post('/x/', datos)
+        request.user = self.user
+        return iniciar_subida_video(request, orden_id=self.orden.pk)
+
+    def _llamar(self, metodo, subida_id, cuerpo=b'', usuario=None, **headers):
+        request = self.factory.generic(metodo, '/x/', data=cuerpo,
+                                       content_type='application/offset+octet-stream', **headers)
+        request.user = usuario or self.user
+        return subida_video(request, subida_id=subida_id)
+
+    def _patch(self, subida_id, offset, cuerpo):
+        return self._llamar('PATCH', subida_id, cuerpo, HTTP_UPLOAD_OFFSET=str(offset))
+
+    def test_flujo_completo_encola_la_compresion(self):
+        respuesta = self._iniciar()
+        self.assertEqual(respuesta.status_code, 201)
+        datos = json.loads(respuesta.content)
+        self.assertEqual(datos['url'], reverse('servicio_tecnico:subida_video', args=[datos['id']]))
+
+        parcial = self._patch(datos['id'], 0, VIDEO[:6000])
+        self.assertEqual(parcial['Upload-Offset'], '6000')
+
+        with patch('servicio_tecnico.tasks.comprimir_video_evidencia_task.delay') as delay:
+            final = self._patch(datos['id'], 6000, VIDEO[6000:])
+
+        self.assertEqual(final.status_code, 200)
+        self.assertTrue(json.loads(final.content)['task_queued'])
+        kwargs = delay.call_args.kwargs
+        self.assertEqual(
+            {k: kwargs[k] for k in ('orden_id', 'tipo', 'descripcion', 'orientacion_video',
+                                    'empleado_id', 'tamano_bytes', 'nombre_original', 'db_alias')},
+            {'orden_id': self.orden.pk, 'tipo': 'diagnostico', 'descripcion': 'Parpadea',
+             'orientacion_video': 90, 'empleado_id': self.empleado.pk, 'tamano_bytes': len(VIDEO),
+             'nombre_original': 'grabacion.webm', 'db_alias': 'default'},
+        )
+        self.assertEqual(kwargs['sha256_esperado'], _sha(VIDEO))
+        ruta = kwargs['archivo_tmp_path']
+        self.assertTrue(ruta.startswith(os.path.join(self.tmp, 'video_tmp', 'sigmavideo_')))
+        with open(ruta, 'rb') as archivo:
+            self.assertEqual(archivo.read(), VIDEO)
+
+    def test_reanudar_tras_corte(self):
+        subida_id = json.loads(self._iniciar().content)['id']
+        self._patch(subida_id, 0, VIDEO[:3000])
+
+        # El cliente cree que no llegó nada: el servidor le dice dónde va
+        conflicto = self._patch(subida_id, 0, VIDEO[:3000])
+        self.assertEqual(conflicto.status_code, 409)
+        self.assertEqual(json.loads(conflicto.content)['offset'], 3000)
+
+        estado = self._llamar('HEAD', subida_id)
+        self.assertEqual(estado['Upload-Offset'], '3000')
+
+    def test_patch_concurrente_responde_423(self):
+        subida_id = json.loads(self._iniciar().content)['id']
+        _ruta_meta, ruta_part = subidas._rutas(subida_id)
+
+        with subidas._bloqueo_part(ruta_part):
+            respuesta = self._patch(subida_id, 0, VIDEO[:3000])
+
+        self.assertEqual(respuesta.status_code, 423)
+        self.assertEqual(self._llamar('HEAD', subida_id)['Upload-Offset'], '0')
+
+    def test_valida_al_iniciar(self):
+        respuesta = self._iniciar(nombre='virus.exe', tamano=200 * 1024 * 1024)
+        self.assertEqual(respuesta.status_code, 400)
+        self.assertEqual(set(json.loads(respuesta.content)['form_errors']), {'nombre', 'tamano'})
+
+    def test_bloque_demasiado_grande(self):
+        subida_id = json.loads(self._iniciar().content)['id']
+        respuesta = self._llamar('PATCH', subida_id, b'x' * (1024 * 1024 + 1), HTTP_UPLOAD_OFFSET='0')
+        self.assertEqual(respuesta.status_code, 413)
+
+    def test_otro_usuario_no_ve_la_subida(self):
+        subida_id = json.loads(self._iniciar().content)['id']
+        otro = User.objects.create_superuser(username='otro_subidas', password='x', email='o@x.com')
+        self.assertEqual(self._llamar('HEAD', subida_id, usuario=otro).status_code, 404)
+        self.assertEqual(self._llamar('DELETE', subida_id, usuario=otro).status_code, 404)
+
+    def test_cancelar(self):
+        subida_id = json.loads(self._iniciar().content)['id']
+        self.assertEqual(self._llamar('DELETE', subida_id).status_code, 200)
+        self.assertEqual(self._llamar('HEAD', subida_id).status_code, 404)
+
+
+class VerificacionEnLaTareaTests(_CarpetaTemporal, TestCase):
+    """El SHA-256 se comprueba en comprimir_video_evidencia_task, no en el request."""
+
+    databases = {'default', 'mexico'}
+
+    def test_la_tarea_descarta_un_video_con_otro_sha(self):
+        ruta = os.path.join(self.tmp, 'sigmavideo_danado.webm')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(VIDEO)
+
+        with patch('subprocess.run') as ffmpeg:
+            resultado = comprimir_video_evidencia_task.apply(kwargs={
+                'archivo_tmp_path': ruta, 'nombre_original': 'grabacion.webm',
+                'tamano_bytes': len(VIDEO), 'orden_id': 1, 'tipo': 'diagnostico',
+                'descripcion': '', 'empleado_id': 1, 'usuario_id': 1,
+                'sha256_esperado': _sha(b'otra cosa'),
+            })
+
+        self.assertIsInstance(resultado.result, ValueError)
+        ffmpeg.assert_not_called()
+        self.assertFalse(os.path.exists(ruta))
@@ -147,9 +147,9 @@ class CompatibilidadFase4ReexportsTest(SimpleTestCase):
         self.assertTrue(hasattr(views_encuestas, 'Q'))
         self.assertTrue(hasattr(views_encuestas, 'Paginator'))
         self.assertTrue(hasattr(views_encuestas, 'Sucursal'))
-        self.assertTrue(hasattr(views_encuestas, 'Font'))
+        self.assertTrue(hasattr(views_encuestas, 'LibroStreaming'))
         self.assertTrue(hasattr(views_feedback_rechazo_dash, 'timezone'))
-        self.assertTrue(hasattr(views_feedback_rechazo_dash, 'Count'))
+        self.assertTrue(hasattr(views_feedback_rechazo_dash, 'Q'))
         self.assertTrue(hasattr(views_feedback_rechazo_dash, 'get_column_letter'))
         self.assertTrue(hasattr(views_seguimiento_enlaces, 'Empleado'))
         self.assertTrue(hasattr(views_seguimiento_enlaces, 'Sucursal'))
@@ -201,13 +201,9 @@ class CompatibilidadDashboardsFase8Test(SimpleTestCase):
             (
                 views_dashboard_rhitso,
                 (
-                    'Prefetch',
                     'timezone',
                     'openpyxl',
                     'Font',
-                    'OrdenServicio',
-                    'EstadoRHITSO',
-                    'calcular_dias_habiles',
                     'permission_required_with_message',
                 ),
             ),
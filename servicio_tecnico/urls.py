@@ -216,6 +216,14 @@ urlpatterns = [
          views.exportar_excel_dashboard_oow_fl, 
          name='exportar_excel_dashboard_oow_fl'),
     
+    # ========================================================================
+    # DASHBOARD CONSOLIDADO DE TODOS LOS PAÍSES
+    # ========================================================================
+    # KPIs de MX/AR/CL/CO consultados en paralelo; ?formato=json para la API
+    path('dashboard/consolidado/',
+         views.dashboard_consolidado,
+         name='dashboard_consolidado'),
+
     # ========================================================================
     # DASHBOARD DE COTIZACIONES - ANALYTICS CON PLOTLY Y ML (Enero 2025)
     # ========================================================================
@@ -369,6 +377,15 @@ urlpatterns = [
          views.exportar_excel_base_garantia,
          name='exportar_excel_base_garantia'),
 
+    # Exportaciones Excel grandes: se generan en Celery y la campanita
+    # entrega el enlace firmado de descarga.
+    path('reportes/exportaciones/<str:task_id>/estado/',
+         views.estado_exportacion_excel,
+         name='estado_exportacion_excel'),
+    path('reportes/exportaciones/descargar/<str:token>/',
+         views.descargar_exportacion_excel,
+         name='descargar_exportacion_excel'),
+
     # Exportación a PDF del concentrado (landscape, 3 tablas)
     path('concentrado-semanal/exportar-pdf/',
          views.exportar_concentrado_pdf,
@@ -381,6 +398,12 @@ urlpatterns = [
     path('sicser/importar/',
          views.importar_orden_sicser,
          name='importar_orden_sicser'),
+    path('sicser/importar-lote/',
+         views.importar_ordenes_sicser_lote,
+         name='importar_ordenes_sicser_lote'),
+    path('sicser/importar-lote/<str:task_id>/estado/',
+         views.estado_importacion_sicser_lote,
+         name='estado_importacion_sicser_lote'),
     path('sicser/abrir-formato-oow/',
          views.abrir_formato_oow_desde_sicser,
          name='abrir_formato_oow_desde_sicser'),
@@ -469,6 +492,9 @@ urlpatterns = [
          views.dashboard_encuestas, name='dashboard_encuestas'),
 
     # APIs JSON para el dashboard de encuestas
+    # (paneles = todos los gráficos en una respuesta, con ETag)
+    path('encuestas/api/paneles/',
+         views.api_encuestas_paneles, name='api_encuestas_paneles'),
     path('encuestas/api/kpis/',
          views.api_encuestas_kpis, name='api_encuestas_kpis'),
     path('encuestas/api/tendencia/',
@@ -501,6 +527,8 @@ urlpatterns = [
          views.dashboard_feedback_rechazo, name='dashboard_feedback_rechazo'),
 
     # APIs JSON para el dashboard de feedback de rechazo
+    path('feedback-rechazo/api/paneles/',
+         views.api_feedback_rechazo_paneles, name='api_feedback_rechazo_paneles'),
     path('feedback-rechazo/api/kpis/',
          views.api_feedback_rechazo_kpis, name='api_feedback_rechazo_kpis'),
     path('feedback-rechazo/api/por-motivo/',
@@ -549,6 +577,14 @@ urlpatterns = [
     path('directorio-empleados/', views.directorio_empleados, name='directorio_empleados'),
     path('directorio-empleados/<int:empleado_id>/', views.perfil_empleado, name='perfil_empleado'),
 
+    # ── Subida reanudable de videos de evidencia (por bloques) ──
+    # POST: Crea la subida (valida nombre/tamaño/tipo y guarda el SHA-256 esperado)
+    path('ordenes/<int:orden_id>/videos/subidas/',
+         views.iniciar_subida_video, name='iniciar_subida_video'),
+    # HEAD/GET: offset actual · PATCH: agrega un bloque · DELETE: cancela
+    path('videos/subidas/<str:subida_id>/',
+         views.subida_video, name='subida_video'),
+
     # ── Video Resumen de Galería (Celery + FFmpeg Ken Burns) ──
     # POST: Encola la tarea de generación del video resumen para una orden
     path('ordenes/<int:orden_id>/video-resumen/generar/',
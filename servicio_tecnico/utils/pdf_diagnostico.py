@@ -21,7 +21,6 @@ Estructura del PDF generado:
 """
 
 import os
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -33,12 +32,12 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.pdfgen import canvas
 
-# Pillow - Para manipular imágenes (convertir PNG a JPG, etc.)
-from PIL import Image as PILImage
-
 # Django
 from django.conf import settings
 
+# Caché de PDFs por huella + imágenes preparadas una vez por proceso
+from config.pdf_cache import cachear_pdf, calcular_huella, imagen_sin_transparencia, version_modelo
+
 # Constantes del proyecto
 from config.constants import COMPONENTES_DIAGNOSTICO_ORDEN
 
@@ -142,41 +141,14 @@ class PDFGeneratorDiagnostico:
         
         return None
     
-    def _convertir_png_a_jpg(self, ruta_png: str) -> str:
+    def _convertir_png_a_jpg(self, ruta_png: str):
         """
         Convierte una imagen PNG con transparencia a JPG con fondo blanco.
         Necesario porque ReportLab a veces tiene problemas con PNG transparentes.
+        El JPG se guarda en memoria del proceso (config.pdf_cache), así el logo
+        se convierte una sola vez y no se crean archivos temporales.
         """
-        try:
-            if not os.path.exists(ruta_png):
-                return ruta_png
-            
-            imagen_original = PILImage.open(ruta_png)
-            
-            if imagen_original.format != 'PNG':
-                return ruta_png
-            
-            ancho, alto = imagen_original.size
-            imagen_nueva = PILImage.new('RGB', (ancho, alto), (255, 255, 255))
-            
-            if imagen_original.mode == 'RGBA':
-                imagen_nueva.paste(imagen_original, (0, 0), imagen_original)
-            else:
-                imagen_nueva.paste(imagen_original, (0, 0))
-            
-            archivo_temporal = tempfile.NamedTemporaryFile(
-                suffix='.jpg', delete=False, prefix='diag_'
-            )
-            imagen_nueva.save(archivo_temporal.name, 'JPEG', quality=90)
-            
-            imagen_original.close()
-            imagen_nueva.close()
-            
-            return archivo_temporal.name
-            
-        except Exception as e:
-            print(f"Error convirtiendo imagen {ruta_png}: {str(e)}")
-            return ruta_png
+        return imagen_sin_transparencia(ruta_png)
     
     def _agregar_imagen_al_pdf(self, canvas_obj, ruta_imagen: str, x: float, y: float,
                                ancho_max: float, alto_max: float) -> bool:
@@ -187,10 +159,8 @@ class PDFGeneratorDiagnostico:
             return False
         
         try:
-            ruta_procesada = self._convertir_png_a_jpg(ruta_imagen)
-            
-            with PILImage.open(ruta_procesada) as img:
-                ancho_original, alto_original = img.size
+            imagen = self._convertir_png_a_jpg(ruta_imagen)
+            ancho_original, alto_original = imagen.getSize()
             
             escala_ancho = ancho_max / ancho_original
             escala_alto = alto_max / alto_original
@@ -203,17 +173,11 @@ class PDFGeneratorDiagnostico:
             y_centrado = y + (alto_max - alto_final) / 2
             
             canvas_obj.drawImage(
-                ruta_procesada, x_centrado, y_centrado,
+                imagen, x_centrado, y_centrado,
                 width=ancho_final, height=alto_final,
                 preserveAspectRatio=True
             )
             
-            if ruta_procesada != ruta_imagen and os.path.exists(ruta_procesada):
-                try:
-                    os.unlink(ruta_procesada)
-                except:
-                    pass
-            
             return True
             
         except Exception as e:
@@ -269,6 +233,24 @@ class PDFGeneratorDiagnostico:
         
         return y - (lineas_totales * linea_altura)
     
+    def huella_artefacto(self) -> str:
+        """
+        Huella de las entradas del PDF para config.pdf_cache.
+        
+        Orden, detalle, folio, componentes marcados, email del empleado,
+        empresa del país y la fecha (aparece en el header y en el nombre).
+        """
+        return calcular_huella('diagnostico', self, [
+            version_modelo(self.orden),
+            version_modelo(self.detalle_equipo),
+            self.folio,
+            self.componentes_seleccionados,
+            self.email_empleado,
+            self.pais_config,
+            datetime.now().strftime('%Y%m%d'),
+        ])
+    
+    @cachear_pdf
     def generar_pdf(self) -> Dict[str, Any]:
         """
         Genera el PDF completo del formato de diagnóstico.
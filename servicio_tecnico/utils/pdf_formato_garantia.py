@@ -57,6 +57,7 @@ from config.constants import (
     catalogo_vistas_dano_estetico,
 )
 from config.paises_config import get_pais_actual
+from config.pdf_cache import cachear_pdf, calcular_huella, qr_png, version_modelo
 from servicio_tecnico.services.vistas_dano import vistas_dano_para_pdf
 
 logger = logging.getLogger('servicio_tecnico')
@@ -98,6 +99,36 @@ class PDFFormatoServicioGarantia:
         self._estilos = getSampleStyleSheet()
         self._crear_estilos()
 
+    def huella_artefacto(self) -> str:
+        """
+        Huella para config.pdf_cache: formato, orden, equipo, vistas y escaneos.
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Cubre todo lo que lee el documento. La fecha del día entra porque la
+        hoja imprime la fecha de emisión cuando el formato no tiene una propia.
+
+        Returns:
+            str: SHA-256 de las entradas del PDF.
+        """
+        from servicio_tecnico.models import ImagenOrden
+
+        escaneos = list(
+            ImagenOrden.objects.filter(
+                orden=self.orden,
+                tipo='escaneo_garantia',
+            ).order_by('-fecha_subida').values_list('pk', 'imagen')[:4]
+        )
+        return calcular_huella('formato_garantia', self, [
+            version_modelo(self.formato),
+            version_modelo(self.orden),
+            version_modelo(self.detalle),
+            [version_modelo(vista) for vista in self.formato.vistas_dano.order_by('pk')],
+            escaneos,
+            self.pais_config,
+            date.today().isoformat(),
+        ])
+
+    @cachear_pdf
     def generar_pdf(self) -> Dict[str, Any]:
         """
         Construye el PDF completo en un buffer BytesIO.
@@ -1011,50 +1042,28 @@ class PDFFormatoServicioGarantia:
         """
         Genera un QR hacia el primer WhatsApp del pie Dell.
 
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        El número es fijo, así que el PNG del QR se arma una vez por proceso
+        (config.pdf_cache.qr_png) y cada PDF solo lo envuelve en un RLImage.
+
         Args:
             lado_mm: tamaño del cuadrado en milímetros.
 
         Returns:
             RLImage o None si falla la librería qrcode.
         """
-        try:
-            import qrcode
-        except ImportError:
-            logger.warning('[PDF_FORMATO_GARANTIA] qrcode no disponible; se omite QR')
-            return None
-
         # wa.me espera dígitos internacionales (México = 52)
         digitos = ''.join(c for c in WHATSAPP_FORMATO_GARANTIA_NUMEROS[0] if c.isdigit())
         url = f'https://wa.me/52{digitos}'
         try:
-            qr = qrcode.QRCode(version=1, box_size=4, border=1)
-            qr.add_data(url)
-            qr.make(fit=True)
-            img = qr.make_image(fill_color='black', back_color='white')
-            # EXPLICACIÓN PARA PRINCIPIANTES:
-            # RLImage de ReportLab pide una ruta de archivo (o file-like BytesIO
-            # en algunas versiones). Guardamos el PNG en BytesIO y lo pasamos
-            # directo; si falla, caemos a archivo temporal.
-            buf = io.BytesIO()
-            img.save(buf, format='PNG')
-            buf.seek(0)
-            try:
-                return RLImage(buf, width=lado_mm * mm, height=lado_mm * mm)
-            except Exception:
-                import tempfile
-                import os
-                fd, ruta = tempfile.mkstemp(suffix='.png')
-                os.close(fd)
-                with open(ruta, 'wb') as fh:
-                    fh.write(buf.getvalue())
-                # Guardamos la ruta para no perder el archivo antes de build()
-                if not hasattr(self, '_qr_temp_paths'):
-                    self._qr_temp_paths = []
-                self._qr_temp_paths.append(ruta)
-                return RLImage(ruta, width=lado_mm * mm, height=lado_mm * mm)
+            png = qr_png(url, box_size=4, border=1)
+        except ImportError:
+            logger.warning('[PDF_FORMATO_GARANTIA] qrcode no disponible; se omite QR')
+            return None
         except Exception as exc:
             logger.warning('[PDF_FORMATO_GARANTIA] No se pudo generar QR: %s', exc)
             return None
+        return RLImage(io.BytesIO(png), width=lado_mm * mm, height=lado_mm * mm)
 
     def _construir_pagina_servicio_final(self) -> List:
         """
@@ -48,6 +48,7 @@ from config.constants import (
     catalogo_vistas_dano_estetico,
 )
 from config.paises_config import get_pais_actual
+from config.pdf_cache import cachear_pdf, calcular_huella, version_modelo
 from servicio_tecnico.services.vistas_dano import vistas_dano_para_pdf
 
 logger = logging.getLogger('servicio_tecnico')
@@ -92,6 +93,36 @@ class PDFFormatoServicioOOW:
         self._estilos = getSampleStyleSheet()
         self._crear_estilos()
 
+    def huella_artefacto(self) -> str:
+        """
+        Huella para config.pdf_cache: formato, orden, equipo, vistas y escaneos.
+
+        EXPLICACIÓN PARA PRINCIPIANTES:
+        Cubre todo lo que lee el documento. La fecha del día entra porque la
+        hoja imprime la fecha de emisión cuando el formato no tiene una propia.
+
+        Returns:
+            str: SHA-256 de las entradas del PDF.
+        """
+        from servicio_tecnico.models import ImagenOrden
+
+        escaneos = list(
+            ImagenOrden.objects.filter(
+                orden=self.orden,
+                tipo='escaneo_oow',
+            ).order_by('-fecha_subida').values_list('pk', 'imagen')[:4]
+        )
+        return calcular_huella('formato_oow', self, [
+            version_modelo(self.formato),
+            version_modelo(self.orden),
+            version_modelo(self.detalle),
+            [version_modelo(vista) for vista in self.formato.vistas_dano.order_by('pk')],
+            escaneos,
+            self.pais_config,
+            timezone.localdate().isoformat(),
+        ])
+
+    @cachear_pdf
     def generar_pdf(self) -> Dict[str, Any]:
         """
         Construye el PDF completo en un buffer BytesIO.
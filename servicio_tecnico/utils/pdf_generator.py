@@ -24,7 +24,6 @@ Estructura del PDF generado:
 """
 
 import os
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -39,12 +38,12 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase.pdfmetrics import stringWidth
 
-# Pillow - Librería para manipular imágenes (convertir PNG a JPG, etc.)
-from PIL import Image as PILImage
-
 # Django
 from django.conf import settings
 
+# Caché de PDFs por huella + imágenes preparadas una vez por proceso
+from config.pdf_cache import cachear_pdf, calcular_huella, imagen_sin_transparencia, version_modelo
+
 
 class PDFGeneratorRhitso:
     """
@@ -172,7 +171,7 @@ class PDFGeneratorRhitso:
             fontName='Helvetica'
         ))
     
-    def _convertir_png_a_jpg(self, ruta_png: str) -> str:
+    def _convertir_png_a_jpg(self, ruta_png: str):
         """
         Convierte una imagen PNG con transparencia a JPG con fondo blanco.
         
@@ -181,64 +180,18 @@ class PDFGeneratorRhitso:
         Esta función convierte el PNG a JPG con fondo blanco para asegurar compatibilidad.
         
         ¿Cómo funciona?
-        1. Abre la imagen PNG con Pillow
-        2. Crea una nueva imagen con fondo blanco del mismo tamaño
-        3. Pega la imagen PNG encima del fondo blanco
-        4. Guarda como JPG en un archivo temporal
-        5. Retorna la ruta del archivo temporal
+        1. La conversión la hace config.pdf_cache.imagen_sin_transparencia
+        2. El JPG queda en memoria del proceso (logos y diagrama se convierten
+           una sola vez, no en cada PDF) y no se crean archivos temporales
+        3. Si el archivo no es PNG se devuelve el original sin convertir
         
         Args:
             ruta_png: Ruta del archivo PNG original
             
         Returns:
-            Ruta del archivo JPG temporal creado
+            ImageReader de ReportLab listo para drawImage
         """
-        try:
-            # Verificar que el archivo existe
-            if not os.path.exists(ruta_png):
-                return ruta_png
-            
-            # Abrir la imagen original con Pillow
-            imagen_original = PILImage.open(ruta_png)
-            
-            # Solo procesar si es PNG (verificar por el formato)
-            if imagen_original.format != 'PNG':
-                return ruta_png  # Si no es PNG, devolver la ruta original
-            
-            # Obtener dimensiones de la imagen
-            ancho, alto = imagen_original.size
-            
-            # Crear nueva imagen con fondo blanco
-            imagen_nueva = PILImage.new('RGB', (ancho, alto), (255, 255, 255))
-            
-            # Si la imagen tiene transparencia (modo RGBA), convertir primero
-            if imagen_original.mode == 'RGBA':
-                # Pegar la imagen original sobre el fondo blanco
-                # La transparencia se rellena con blanco automáticamente
-                imagen_nueva.paste(imagen_original, (0, 0), imagen_original)
-            else:
-                # Si no tiene transparencia, simplemente convertir
-                imagen_nueva.paste(imagen_original, (0, 0))
-            
-            # Crear archivo temporal para el JPG
-            archivo_temporal = tempfile.NamedTemporaryFile(
-                suffix='.jpg',
-                delete=False,  # No eliminar automáticamente
-                prefix='rhitso_'
-            )
-            
-            # Guardar como JPG con calidad del 90%
-            imagen_nueva.save(archivo_temporal.name, 'JPEG', quality=90)
-            
-            # Cerrar imágenes para liberar memoria
-            imagen_original.close()
-            imagen_nueva.close()
-            
-            return archivo_temporal.name
-            
-        except Exception as e:
-            print(f"Error convirtiendo imagen {ruta_png}: {str(e)}")
-            return ruta_png  # En caso de error, devolver la ruta original
+        return imagen_sin_transparencia(ruta_png)
     
     def _agregar_imagen_al_pdf(self, canvas_obj, ruta_imagen: str, x: float, y: float, 
                                ancho_max: float, alto_max: float) -> bool:
@@ -272,12 +225,11 @@ class PDFGeneratorRhitso:
             return False
         
         try:
-            # Convertir PNG a JPG si es necesario
-            ruta_procesada = self._convertir_png_a_jpg(ruta_imagen)
+            # Convertir PNG a JPG si es necesario (cacheado por proceso)
+            imagen = self._convertir_png_a_jpg(ruta_imagen)
             
-            # Obtener dimensiones de la imagen usando PIL
-            with PILImage.open(ruta_procesada) as img:
-                ancho_original, alto_original = img.size
+            # Obtener dimensiones de la imagen
+            ancho_original, alto_original = imagen.getSize()
             
             # Calcular escala para que quepa manteniendo proporciones
             escala_ancho = ancho_max / ancho_original
@@ -294,7 +246,7 @@ class PDFGeneratorRhitso:
             
             # Dibujar la imagen en el PDF
             canvas_obj.drawImage(
-                ruta_procesada,
+                imagen,
                 x_centrado,
                 y_centrado,
                 width=ancho_final,
@@ -302,28 +254,32 @@ class PDFGeneratorRhitso:
                 preserveAspectRatio=True
             )
             
-            # Si se creó un archivo temporal, eliminarlo
-            if ruta_procesada != ruta_imagen and os.path.exists(ruta_procesada):
-                try:
-                    os.unlink(ruta_procesada)
-                except:
-                    pass  # No importa si no se puede eliminar
-            
             return True
             
         except Exception as e:
             print(f"Error agregando imagen al PDF: {str(e)}")
-            
-            # Limpiar archivo temporal en caso de error
-            if 'ruta_procesada' in locals() and ruta_procesada != ruta_imagen:
-                try:
-                    if os.path.exists(ruta_procesada):
-                        os.unlink(ruta_procesada)
-                except:
-                    pass
-            
             return False
     
+    def huella_artefacto(self) -> str:
+        """
+        Huella de las entradas del PDF para config.pdf_cache.
+        
+        EXPLICACIÓN:
+        Incluye la orden, el detalle del equipo, las imágenes de autorización
+        y la fecha del día (el formato imprime la fecha de emisión). Si nada
+        de eso cambió, se reutiliza el PDF ya generado.
+        
+        Returns:
+            SHA-256 en hexadecimal
+        """
+        return calcular_huella('rhitso', self, [
+            version_modelo(self.orden),
+            version_modelo(self.detalle_equipo),
+            [version_modelo(imagen) for imagen in self.imagenes_autorizacion],
+            datetime.now().strftime('%Y%m%d'),
+        ])
+    
+    @cachear_pdf
     def generar_pdf(self) -> Dict[str, Any]:
         """
         Genera el PDF completo del formato RHITSO.
@@ -72,7 +72,7 @@ def obtener_dataframe_cotizaciones(fecha_inicio=None, fecha_fin=None,
     # ========================================
     # EXPLICACIÓN: select_related() evita consultas múltiples a la BD
     # Es como hacer un JOIN en SQL
-    cotizaciones = Cotizacion.objects.select_related(
+    cotizaciones = Cotizacion.objects.con_totales().select_related(
         'orden',
         'orden__sucursal',
         'orden__tecnico_asignado_actual',
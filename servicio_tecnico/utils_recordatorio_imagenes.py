@@ -18,17 +18,29 @@ Hay DOS disparadores:
 
 Este módulo concentra TODA la lógica de negocio (quién avisar, qué fotos
 faltan y con qué mensaje) para que las tareas Celery solo orquesten el envío.
+
+El barrido diario expresa las reglas como QuerySets anotados (Exists por tipo
+de imagen, último recordatorio por subconsulta, ventanas de fechas): cada
+país se resuelve con unas pocas consultas sin importar cuántas órdenes haya,
+y los mensajes salen ya armados hacia las tareas por lote.
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Iterable
+from datetime import datetime, time, timedelta
 
-from django.db.models import OuterRef, Subquery
+from django.db.models import Exists, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.urls import reverse
 from django.utils import timezone
 
 from config.constants import TIPO_IMAGEN_CHOICES
-from servicio_tecnico.models import Cotizacion, HistorialOrden, OrdenServicio, RecordatorioImagenOrden
+from servicio_tecnico.models import (
+    Cotizacion,
+    HistorialOrden,
+    ImagenOrden,
+    OrdenServicio,
+    RecordatorioImagenOrden,
+)
 
 # Plazo mínimo antes del recordatorio de ingreso al inspector (2 días = 48 h)
 HORAS_ANTES_RECORDATORIO = 48
@@ -42,6 +54,9 @@ ESTADOS_EXCLUIDOS_INGRESO_INSPECTOR = {'cancelado', 'entregado'}
 # Etiquetas legibles de tipos de imagen para mensajes al técnico
 ETIQUETAS_TIPO_IMAGEN = dict(TIPO_IMAGEN_CHOICES)
 
+# Recordatorios por tarea Celery en el barrido diario (un lote = una tarea)
+TAMANO_LOTE_RECORDATORIOS = 50
+
 
 def obtener_etiqueta_orden(orden: OrdenServicio) -> str:
     """
@@ -69,6 +84,10 @@ def obtener_tipos_imagen(orden: OrdenServicio) -> set[str]:
     Returns:
         set[str]: Códigos de tipo presentes (ej. {'ingreso', 'egreso'}).
     """
+    # El barrido diario ya los trae anotados (Exists): no volver a consultar
+    anotados = getattr(orden, 'tipos_imagen_presentes', None)
+    if anotados is not None:
+        return anotados
     return set(orden.imagenes.values_list('tipo', flat=True).distinct())
 
 
@@ -113,6 +132,11 @@ def _limite_ventana_maxima() -> datetime:
     return timezone.now() - timedelta(days=DIAS_MAX_VENTANA_RECORDATORIO)
 
 
+def inicio_de_hoy() -> datetime:
+    """Medianoche local de hoy: lo enviado antes de esto fue "otro día"."""
+    return timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+
+
 def dentro_ventana_una_semana(fecha_referencia: datetime | None) -> bool:
     """
     Indica si una fecha de referencia tiene como máximo 7 días de antigüedad.
@@ -338,7 +362,34 @@ def orden_requiere_recordatorio_tecnico(orden: OrdenServicio) -> bool:
     return bool(tipos_faltantes_tecnico(orden))
 
 
-def ordenes_pendientes_ingreso_inspector(db_alias: str) -> Iterable[OrdenServicio]:
+def _tiene_imagen(tipo: str) -> Exists:
+    """Exists correlacionado: ¿la orden ya tiene alguna imagen de este tipo?"""
+    return Exists(ImagenOrden.objects.filter(orden=OuterRef('pk'), tipo=tipo))
+
+
+def _sin_recordatorio_hoy(candidatas: QuerySet, tipo_recordatorio: str) -> QuerySet:
+    """
+    Versión en SQL de debe_recordar_hoy() para todo el QuerySet.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Anota la fecha del último recordatorio de ese tipo (subconsulta) y deja
+    pasar solo las órdenes que nunca lo recibieron o lo recibieron antes de
+    la medianoche local de hoy.
+    """
+    ultimo_envio = (
+        RecordatorioImagenOrden.objects
+        .filter(orden=OuterRef('pk'), tipo=tipo_recordatorio)
+        .order_by('-fecha_ultimo_envio')
+        .values('fecha_ultimo_envio')[:1]
+    )
+    return (
+        candidatas
+        .annotate(ultimo_recordatorio=Subquery(ultimo_envio))
+        .filter(Q(ultimo_recordatorio__isnull=True) | Q(ultimo_recordatorio__lt=inicio_de_hoy()))
+    )
+
+
+def ordenes_pendientes_ingreso_inspector(db_alias: str) -> QuerySet:
     """
     Órdenes candidatas a recordatorio de ingreso para inspectores (Beat diario).
 
@@ -347,15 +398,13 @@ def ordenes_pendientes_ingreso_inspector(db_alias: str) -> Iterable[OrdenServici
     Args:
         db_alias: Alias de base de datos del país activo.
 
-    Yields:
-        OrdenServicio: Órdenes sin ingreso en ventana y que deben recordarse hoy.
+    Returns:
+        QuerySet[OrdenServicio]: Órdenes sin ingreso en ventana y que deben
+        recordarse hoy (una sola consulta al iterarlo).
     """
-    limite_min = _limite_48_horas()
-    limite_max = _limite_ventana_maxima()
-
     # Subconsulta: fecha del evento 'creacion' en historial
     fecha_creacion_subq = (
-        HistorialOrden.objects.using(db_alias)
+        HistorialOrden.objects
         .filter(orden=OuterRef('pk'), tipo_evento='creacion')
         .order_by('fecha_evento')
         .values('fecha_evento')[:1]
@@ -364,27 +413,20 @@ def ordenes_pendientes_ingreso_inspector(db_alias: str) -> Iterable[OrdenServici
     candidatas = (
         OrdenServicio.objects.using(db_alias)
         .exclude(estado__in=ESTADOS_EXCLUIDOS_INGRESO_INSPECTOR)
-        .exclude(imagenes__tipo='ingreso')
-        .annotate(fecha_creacion_sistema=Subquery(fecha_creacion_subq))
+        .filter(~_tiene_imagen('ingreso'))
+        # Fecha de creación del historial o fecha_ingreso como respaldo
+        .annotate(fecha_creacion_sistema=Coalesce(Subquery(fecha_creacion_subq), 'fecha_ingreso'))
+        # Al menos 2 días (antes aún no toca) y como máximo 1 semana (ya no insistimos)
+        .filter(
+            fecha_creacion_sistema__lte=_limite_48_horas(),
+            fecha_creacion_sistema__gte=_limite_ventana_maxima(),
+        )
         .select_related('detalle_equipo')
-        .distinct()
     )
-
-    for orden in candidatas:
-        # Usar fecha de creación del historial o fecha_ingreso como respaldo
-        referencia = orden.fecha_creacion_sistema or orden.fecha_ingreso
-        # Menos de 2 días → aún no toca
-        if referencia > limite_min:
-            continue
-        # Más de 1 semana → ya no insistimos
-        if referencia < limite_max:
-            continue
-        if not debe_recordar_hoy(orden, 'ingreso_inspector', db_alias):
-            continue
-        yield orden
+    return _sin_recordatorio_hoy(candidatas, 'ingreso_inspector')
 
 
-def ordenes_pendientes_egreso_inspector(db_alias: str) -> Iterable[OrdenServicio]:
+def ordenes_pendientes_egreso_inspector(db_alias: str) -> QuerySet:
     """
     Órdenes en finalizado sin fotos de egreso (repetición diaria vía Beat).
 
@@ -393,60 +435,146 @@ def ordenes_pendientes_egreso_inspector(db_alias: str) -> Iterable[OrdenServicio
     Args:
         db_alias: Alias de base de datos del país activo.
 
-    Yields:
-        OrdenServicio: Órdenes que aún requieren aviso de egreso hoy.
+    Returns:
+        QuerySet[OrdenServicio]: Órdenes que aún requieren aviso de egreso hoy.
     """
-    limite_max = _limite_ventana_maxima()
-
     candidatas = (
         OrdenServicio.objects.using(db_alias)
-        .filter(estado='finalizado')
-        .filter(fecha_finalizacion__gte=limite_max)
-        .exclude(imagenes__tipo='egreso')
+        .filter(estado='finalizado', fecha_finalizacion__gte=_limite_ventana_maxima())
+        .filter(~_tiene_imagen('egreso'))
         .select_related('detalle_equipo')
-        .distinct()
     )
-
-    for orden in candidatas:
-        if not orden_requiere_recordatorio_egreso_inspector(orden):
-            continue
-        if not debe_recordar_hoy(orden, 'egreso_inspector', db_alias):
-            continue
-        yield orden
+    return _sin_recordatorio_hoy(candidatas, 'egreso_inspector')
 
 
-def ordenes_pendientes_tecnico(db_alias: str) -> Iterable[OrdenServicio]:
+def ordenes_pendientes_tecnico(db_alias: str) -> QuerySet:
     """
     Órdenes en finalizado con evidencias pendientes para el técnico (Beat).
 
     Solo órdenes finalizadas en los últimos 7 días.
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    La matriz de tipos_requeridos_tecnico() escrita como filtros Q:
+    - Cotización aceptada → falta diagnóstico o reparación.
+    - Cotización rechazada o pendiente → falta diagnóstico.
+    - Sin cotización y venta mostrador → falta reparación.
+    Cada orden trae anotado tiene_diagnostico / tiene_reparacion para que el
+    mensaje se arme sin otra consulta.
+
     Args:
         db_alias: Alias de base de datos del país activo.
 
-    Yields:
-        OrdenServicio: Órdenes que aún requieren aviso al técnico hoy.
+    Returns:
+        QuerySet[OrdenServicio]: Órdenes que aún requieren aviso al técnico hoy.
     """
-    limite_max = _limite_ventana_maxima()
+    con_cotizacion = Q(cotizacion__isnull=False)
+    aceptada = Q(cotizacion__usuario_acepto=True)
+    no_aceptada = Q(cotizacion__usuario_acepto=False) | Q(cotizacion__usuario_acepto__isnull=True)
+    falta_diagnostico = Q(tiene_diagnostico=False)
+    falta_reparacion = Q(tiene_reparacion=False)
 
     candidatas = (
         OrdenServicio.objects.using(db_alias)
-        .filter(estado='finalizado')
-        .filter(fecha_finalizacion__gte=limite_max)
+        .filter(
+            estado='finalizado',
+            fecha_finalizacion__gte=_limite_ventana_maxima(),
+            tecnico_asignado_actual__user__is_active=True,
+        )
+        .annotate(
+            tiene_diagnostico=_tiene_imagen('diagnostico'),
+            tiene_reparacion=_tiene_imagen('reparacion'),
+        )
+        .filter(
+            (con_cotizacion & aceptada & (falta_diagnostico | falta_reparacion))
+            | (con_cotizacion & no_aceptada & falta_diagnostico)
+            | (Q(cotizacion__isnull=True, tipo_servicio='venta_mostrador') & falta_reparacion)
+        )
         .select_related(
             'tecnico_asignado_actual__user',
             'detalle_equipo',
             'cotizacion',
         )
-        .distinct()
     )
+    return _sin_recordatorio_hoy(candidatas, 'tecnico_faltantes')
+
+
+def _recordatorio_listo(orden, tipo_recordatorio, titulo, mensaje, usuario_ids, tecnico=''):
+    """Datos ya renderizados de un recordatorio (serializable a JSON para Celery)."""
+    return {
+        'orden_id': orden.pk,
+        'tipo_recordatorio': tipo_recordatorio,
+        'titulo': titulo,
+        'mensaje': mensaje,
+        'url': reverse('servicio_tecnico:detalle_orden', kwargs={'orden_id': orden.pk}),
+        'etiqueta': obtener_etiqueta_orden(orden),
+        'usuario_ids': list(usuario_ids),
+        'tecnico': tecnico,
+    }
+
+
+def recordatorios_pendientes_pais(db_alias: str) -> list[dict]:
+    """
+    Todos los recordatorios de imágenes que tocan hoy en un país, ya armados.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Antes se revisaba orden por orden (varias consultas cada una) y se
+    encolaba una tarea por orden. Ahora son unas pocas consultas por país:
+    inspectores activos (una vez), y un QuerySet anotado por tipo de
+    recordatorio. El resultado va directo a las tareas por lote.
 
-    for orden in candidatas:
-        if not orden_requiere_recordatorio_tecnico(orden):
-            continue
-        if not debe_recordar_hoy(orden, 'tecnico_faltantes', db_alias):
-            continue
-        yield orden
+    Args:
+        db_alias: Alias de base de datos del país activo.
+
+    Returns:
+        list[dict]: ver _recordatorio_listo().
+    """
+    from inventario.models import Empleado
+
+    recordatorios = []
+
+    inspectores = list(
+        Empleado.objects.using(db_alias)
+        .filter(rol='inspector', user__is_active=True)
+        .values_list('user_id', flat=True)
+    )
+    if inspectores:
+        # 1) Ingreso faltante tras 2 días → inspectores
+        for orden in ordenes_pendientes_ingreso_inspector(db_alias):
+            titulo, mensaje = construir_mensaje_recordatorio_ingreso_inspector(orden)
+            recordatorios.append(_recordatorio_listo(orden, 'ingreso_inspector', titulo, mensaje, inspectores))
+        # 2) Egreso faltante en finalizado → inspectores (repetición diaria)
+        for orden in ordenes_pendientes_egreso_inspector(db_alias):
+            titulo, mensaje = construir_mensaje_recordatorio_egreso_inspector(orden)
+            recordatorios.append(_recordatorio_listo(orden, 'egreso_inspector', titulo, mensaje, inspectores))
+
+    # 3) Evidencias técnico en finalizado (según cotización / VM)
+    for orden in ordenes_pendientes_tecnico(db_alias):
+        orden.tipos_imagen_presentes = {
+            tipo for tipo in ('diagnostico', 'reparacion') if getattr(orden, f'tiene_{tipo}')
+        }
+        tecnico = orden.tecnico_asignado_actual
+        titulo, mensaje = construir_mensaje_recordatorio_tecnico(orden)
+        recordatorios.append(_recordatorio_listo(
+            orden, 'tecnico_faltantes', titulo, mensaje, [tecnico.user_id], tecnico.nombre_completo,
+        ))
+
+    return recordatorios
+
+
+def comentario_historial_recordatorio(
+    tipo_recordatorio: str,
+    etiqueta: str,
+    destinatarios: int,
+    tecnico: str = '',
+) -> str:
+    """Texto del evento de HistorialOrden que deja cada recordatorio enviado."""
+    if tipo_recordatorio == 'tecnico_faltantes':
+        return f'🔔 Recordatorio de fotos pendientes enviado al técnico {tecnico} — Orden {etiqueta}'
+    tipo_foto = 'ingreso' if tipo_recordatorio == 'ingreso_inspector' else 'egreso'
+    return (
+        f'🔔 Recordatorio de fotos de {tipo_foto} enviado a '
+        f'{destinatarios} inspector(es) — Orden {etiqueta}'
+    )
 
 
 def construir_mensaje_recordatorio_ingreso_inspector(orden: OrdenServicio) -> tuple[str, str]:
@@ -21,9 +21,20 @@ Fecha: Octubre 2025
 """
 
 from datetime import datetime, date, timedelta
+
+import numpy as np
 from django.utils import timezone
 
 
+def _a_fecha(valor):
+    """Convierte str 'YYYY-MM-DD', date o datetime a date (None se respeta)."""
+    if isinstance(valor, str):
+        return datetime.strptime(valor, '%Y-%m-%d').date()
+    if isinstance(valor, datetime):
+        return valor.date()
+    return valor
+
+
 def calcular_dias_habiles(fecha_inicio, fecha_fin=None):
     """
     Calcula los días hábiles TRANSCURRIDOS entre dos fechas.
@@ -82,19 +93,9 @@ def calcular_dias_habiles(fecha_inicio, fecha_fin=None):
         - Asume semana laboral estándar de lunes a viernes
         - Si fecha_inicio > fecha_fin, retorna 0
     """
-    # Convertir fecha_inicio a objeto date
-    if isinstance(fecha_inicio, str):
-        fecha_inicio = datetime.strptime(fecha_inicio, '%Y-%m-%d').date()
-    elif isinstance(fecha_inicio, datetime):
-        fecha_inicio = fecha_inicio.date()
-    
-    # Convertir fecha_fin a objeto date (o usar hoy)
-    if fecha_fin is None:
-        fecha_fin = timezone.now().date()
-    elif isinstance(fecha_fin, str):
-        fecha_fin = datetime.strptime(fecha_fin, '%Y-%m-%d').date()
-    elif isinstance(fecha_fin, datetime):
-        fecha_fin = fecha_fin.date()
+    # Convertir ambas fechas a objeto date (fin = hoy si no se indica)
+    fecha_inicio = _a_fecha(fecha_inicio)
+    fecha_fin = timezone.now().date() if fecha_fin is None else _a_fecha(fecha_fin)
     
     # Si fecha_inicio es mayor que fecha_fin, retornar 0
     if fecha_inicio > fecha_fin:
@@ -123,6 +124,47 @@ def calcular_dias_habiles(fecha_inicio, fecha_fin=None):
     return dias_habiles
 
 
+def calcular_dias_habiles_lote(fechas_inicio, fechas_fin):
+    """
+    Igual que calcular_dias_habiles, pero para muchos pares de fechas a la vez.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    ================================
+    calcular_dias_habiles recorre el calendario día por día; para un reporte
+    con cientos de órdenes y tres conteos por orden eso son miles de vueltas
+    en Python. numpy.busday_count cuenta los lunes-viernes de un rango en C
+    y acepta arreglos completos, así que todos los conteos salen de una sola
+    llamada.
+
+    La regla es la misma: no cuenta el día de inicio, sí el día final, y si
+    inicio >= fin el resultado es 0. Por eso se le pasa el rango
+    [inicio + 1, fin + 1) a busday_count.
+
+    Args:
+        fechas_inicio (list): date, datetime o str por par. None → 0 días.
+        fechas_fin (list): date, datetime, str o None (None = hoy) por par.
+
+    Returns:
+        list[int]: días hábiles transcurridos, en el mismo orden.
+    """
+    hoy = timezone.now().date()
+    fines = [hoy if fin is None else _a_fecha(fin) for fin in fechas_fin]
+    # Inicio desconocido: se iguala al fin para que cuente 0
+    inicios = [
+        fin if inicio is None else _a_fecha(inicio)
+        for inicio, fin in zip(fechas_inicio, fines)
+    ]
+    if not inicios:
+        return []
+
+    un_dia = np.timedelta64(1, 'D')
+    dias = np.busday_count(
+        np.array(inicios, dtype='datetime64[D]') + un_dia,
+        np.array(fines, dtype='datetime64[D]') + un_dia,
+    )
+    return np.maximum(dias, 0).tolist()
+
+
 def calcular_dias_en_estatus(fecha_ultimo_cambio, fecha_fin=None):
     """
     Calcula los días hábiles desde el último cambio de estado hasta ahora (o fecha_fin).
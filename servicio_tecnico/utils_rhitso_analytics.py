@@ -135,86 +135,105 @@ def _porcentaje(parte, total):
     return round((parte / total) * 100, 1)
 
 
-def _ids_de_queryset(queryset):
-    """Extrae lista de IDs de un queryset de órdenes."""
-    return list(queryset.values_list('id', flat=True))
+def _ids_por_filas(filas, condicion):
+    """IDs de las filas de la proyección que cumplen la condición (mismo orden)."""
+    return [fila['id'] for fila in filas if condicion(fila)]
 
 
-def obtener_embudo_rhitso(fecha_inicio=None, fecha_fin=None, sucursal_id=None):
+def obtener_embudo_rhitso(fecha_inicio=None, fecha_fin=None, sucursal_id=None, proyeccion=None):
     """
     Calcula el embudo completo de conversión RHITSO.
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Conteos, porcentajes e IDs salen de las banderas históricas de la
+    proyección RHITSO (services/proyeccion_rhitso.py, cacheada), no de una
+    consulta COUNT por segmento. Los ``*_qs`` se siguen entregando como
+    QuerySets perezosos: solo tocan la BD si alguien los recorre.
+
     Args:
         fecha_inicio: Filtro opcional por fecha de ingreso.
         fecha_fin: Filtro opcional por fecha de ingreso.
         sucursal_id: Filtro opcional por sucursal.
+        proyeccion: dict de obtener_proyeccion_rhitso() con los mismos
+            filtros, si quien llama ya lo tiene (evita volver a buscarlo).
 
     Returns:
         dict con conteos, porcentajes, IDs por segmento y queryset de candidatos.
     """
-    candidatos = obtener_queryset_candidatos(fecha_inicio, fecha_fin, sucursal_id)
-    total_candidatos = candidatos.count()
+    from .services.proyeccion_rhitso import obtener_proyeccion_rhitso
 
-    acepto_envio = _con_estado_historico(candidatos, ESTADO_ACEPTA_ENVIO)
-    rechazo_envio = _con_estado_historico(candidatos, ESTADO_RECHAZA_ENVIO)
+    if proyeccion is None:
+        proyeccion = obtener_proyeccion_rhitso(fecha_inicio, fecha_fin, sucursal_id)
+    filas = proyeccion['filas']
+    candidatos = obtener_queryset_candidatos(fecha_inicio, fecha_fin, sucursal_id)
+    total_candidatos = len(filas)
 
+    acepto_envio_ids = _ids_por_filas(filas, lambda f: f['acepto_envio'])
+    rechazo_envio_ids = _ids_por_filas(filas, lambda f: f['rechazo_envio'])
     # Sin decisión de envío: nunca llegaron a aceptar ni rechazar envío
-    sin_decision_envio = candidatos.exclude(
-        Q(seguimientos_rhitso__estado__estado=ESTADO_ACEPTA_ENVIO)
-        | Q(seguimientos_rhitso__estado__estado=ESTADO_RECHAZA_ENVIO)
-    ).distinct()
+    sin_decision_envio_ids = _ids_por_filas(
+        filas, lambda f: not f['acepto_envio'] and not f['rechazo_envio'],
+    )
 
     # Cohorte nivel 3: solo quienes aceptaron el envío a RHITSO
-    cohorte_acepto_envio = acepto_envio
-    total_cohorte_acepto = cohorte_acepto_envio.count()
-
-    acepto_cotiz = _con_estado_historico(cohorte_acepto_envio, ESTADO_ACEPTA_COTIZ)
-    rechazo_cotiz = _con_estado_historico(cohorte_acepto_envio, ESTADO_RECHAZA_COTIZ)
-    no_apto = _con_estado_historico(cohorte_acepto_envio, ESTADO_NO_APTO)
-
+    cohorte = [fila for fila in filas if fila['acepto_envio']]
+    total_cohorte_acepto = len(cohorte)
+    acepto_cotiz_ids = _ids_por_filas(cohorte, lambda f: f['acepto_cotiz'])
+    rechazo_cotiz_ids = _ids_por_filas(cohorte, lambda f: f['rechazo_cotiz'])
+    no_apto_ids = _ids_por_filas(cohorte, lambda f: f['no_apto'])
     # En proceso: aceptaron envío pero sin ningún estado de cotización/no apto
-    en_proceso_cohorte = cohorte_acepto_envio.exclude(
-        Q(seguimientos_rhitso__estado__estado=ESTADO_ACEPTA_COTIZ)
-        | Q(seguimientos_rhitso__estado__estado=ESTADO_RECHAZA_COTIZ)
-        | Q(seguimientos_rhitso__estado__estado=ESTADO_NO_APTO)
-    ).distinct()
+    en_proceso_cohorte_ids = _ids_por_filas(
+        cohorte, lambda f: not (f['acepto_cotiz'] or f['rechazo_cotiz'] or f['no_apto']),
+    )
+
+    acepto_envio = _con_estado_historico(candidatos, ESTADO_ACEPTA_ENVIO)
+    cohorte_acepto_envio = acepto_envio
 
     return {
         'candidatos_qs': candidatos,
         'total_candidatos': total_candidatos,
         # Nivel 2 — decisión de envío
-        'acepto_envio_count': acepto_envio.count(),
-        'rechazo_envio_count': rechazo_envio.count(),
-        'sin_decision_envio_count': sin_decision_envio.count(),
-        'acepto_envio_pct': _porcentaje(acepto_envio.count(), total_candidatos),
-        'rechazo_envio_pct': _porcentaje(rechazo_envio.count(), total_candidatos),
-        'sin_decision_envio_pct': _porcentaje(sin_decision_envio.count(), total_candidatos),
-        'acepto_envio_ids': _ids_de_queryset(acepto_envio),
-        'rechazo_envio_ids': _ids_de_queryset(rechazo_envio),
-        'sin_decision_envio_ids': _ids_de_queryset(sin_decision_envio),
+        'acepto_envio_count': len(acepto_envio_ids),
+        'rechazo_envio_count': len(rechazo_envio_ids),
+        'sin_decision_envio_count': len(sin_decision_envio_ids),
+        'acepto_envio_pct': _porcentaje(len(acepto_envio_ids), total_candidatos),
+        'rechazo_envio_pct': _porcentaje(len(rechazo_envio_ids), total_candidatos),
+        'sin_decision_envio_pct': _porcentaje(len(sin_decision_envio_ids), total_candidatos),
+        'acepto_envio_ids': acepto_envio_ids,
+        'rechazo_envio_ids': rechazo_envio_ids,
+        'sin_decision_envio_ids': sin_decision_envio_ids,
         # Nivel 3 — cohorte aceptó envío
         'cohorte_acepto_envio_qs': cohorte_acepto_envio,
         'total_cohorte_acepto': total_cohorte_acepto,
-        'acepto_cotiz_count': acepto_cotiz.count(),
-        'rechazo_cotiz_count': rechazo_cotiz.count(),
-        'no_apto_count': no_apto.count(),
-        'en_proceso_cohorte_count': en_proceso_cohorte.count(),
-        'acepto_cotiz_pct': _porcentaje(acepto_cotiz.count(), total_cohorte_acepto),
-        'rechazo_cotiz_pct': _porcentaje(rechazo_cotiz.count(), total_cohorte_acepto),
-        'no_apto_pct': _porcentaje(no_apto.count(), total_cohorte_acepto),
-        'en_proceso_cohorte_pct': _porcentaje(en_proceso_cohorte.count(), total_cohorte_acepto),
-        'acepto_cotiz_ids': _ids_de_queryset(acepto_cotiz),
-        'rechazo_cotiz_ids': _ids_de_queryset(rechazo_cotiz),
-        'no_apto_ids': _ids_de_queryset(no_apto),
-        'en_proceso_cohorte_ids': _ids_de_queryset(en_proceso_cohorte),
-        # Querysets para detalle
+        'acepto_cotiz_count': len(acepto_cotiz_ids),
+        'rechazo_cotiz_count': len(rechazo_cotiz_ids),
+        'no_apto_count': len(no_apto_ids),
+        'en_proceso_cohorte_count': len(en_proceso_cohorte_ids),
+        'acepto_cotiz_pct': _porcentaje(len(acepto_cotiz_ids), total_cohorte_acepto),
+        'rechazo_cotiz_pct': _porcentaje(len(rechazo_cotiz_ids), total_cohorte_acepto),
+        'no_apto_pct': _porcentaje(len(no_apto_ids), total_cohorte_acepto),
+        'en_proceso_cohorte_pct': _porcentaje(len(en_proceso_cohorte_ids), total_cohorte_acepto),
+        'acepto_cotiz_ids': acepto_cotiz_ids,
+        'rechazo_cotiz_ids': rechazo_cotiz_ids,
+        'no_apto_ids': no_apto_ids,
+        'en_proceso_cohorte_ids': en_proceso_cohorte_ids,
+        # Querysets para detalle (perezosos)
         'acepto_envio_qs': acepto_envio,
-        'rechazo_envio_qs': rechazo_envio,
-        'sin_decision_envio_qs': sin_decision_envio,
-        'acepto_cotiz_qs': acepto_cotiz,
-        'rechazo_cotiz_qs': rechazo_cotiz,
-        'no_apto_qs': no_apto,
-        'en_proceso_cohorte_qs': en_proceso_cohorte,
+        'rechazo_envio_qs': _con_estado_historico(candidatos, ESTADO_RECHAZA_ENVIO),
+        'sin_decision_envio_qs': candidatos.exclude(
+            Q(seguimientos_rhitso__estado__estado=ESTADO_ACEPTA_ENVIO)
+            | Q(seguimientos_rhitso__estado__estado=ESTADO_RECHAZA_ENVIO)
+        ).distinct(),
+        'acepto_cotiz_qs': _con_estado_historico(cohorte_acepto_envio, ESTADO_ACEPTA_COTIZ),
+        'rechazo_cotiz_qs': _con_estado_historico(cohorte_acepto_envio, ESTADO_RECHAZA_COTIZ),
+        'no_apto_qs': _con_estado_historico(cohorte_acepto_envio, ESTADO_NO_APTO),
+        'en_proceso_cohorte_qs': cohorte_acepto_envio.exclude(
+            Q(seguimientos_rhitso__estado__estado=ESTADO_ACEPTA_COTIZ)
+            | Q(seguimientos_rhitso__estado__estado=ESTADO_RECHAZA_COTIZ)
+            | Q(seguimientos_rhitso__estado__estado=ESTADO_NO_APTO)
+        ).distinct(),
+        # Filas de la proyección (detalle por segmento sin volver a la BD)
+        'filas': filas,
     }
 
 
@@ -338,6 +357,24 @@ def construir_fila_detalle_orden(orden):
     }
 
 
+def fila_detalle_desde_proyeccion(fila):
+    """
+    Columnas de detalle del embudo a partir de una fila de la proyección RHITSO.
+
+    Mismas llaves que construir_fila_detalle_orden(), sin consultas.
+    """
+    detalle = {
+        campo: fila[campo]
+        for campo in (
+            'id', 'numero_orden_interno', 'orden_cliente', 'numero_serie', 'marca',
+            'modelo', 'sucursal', 'fecha_ingreso', 'tecnico_asignado', 'estado_orden',
+            'acepto_envio', 'rechazo_envio', 'acepto_cotiz', 'rechazo_cotiz', 'no_apto',
+        )
+    }
+    detalle['estado_rhitso_actual'] = fila['estado_rhitso_nombre']
+    return detalle
+
+
 def obtener_detalle_todas_candidatas(fecha_inicio=None, fecha_fin=None, sucursal_id=None):
     """
     Lista de detalle para todas las órdenes candidatas con flags de embudo.
@@ -350,8 +387,10 @@ def obtener_detalle_todas_candidatas(fecha_inicio=None, fecha_fin=None, sucursal
     Returns:
         list[dict]: Una fila por orden candidata.
     """
-    candidatos = obtener_queryset_candidatos(fecha_inicio, fecha_fin, sucursal_id)
-    return [construir_fila_detalle_orden(orden) for orden in candidatos]
+    from .services.proyeccion_rhitso import obtener_proyeccion_rhitso
+
+    proyeccion = obtener_proyeccion_rhitso(fecha_inicio, fecha_fin, sucursal_id)
+    return [fila_detalle_desde_proyeccion(fila) for fila in proyeccion['filas']]
 
 
 def obtener_detalle_ordenes_por_segmento(segmento, embudo):
@@ -365,16 +404,11 @@ def obtener_detalle_ordenes_por_segmento(segmento, embudo):
     Returns:
         list[dict]: Filas de detalle del segmento solicitado.
     """
-    mapa_segmentos = {
-        'acepto_envio': embudo['acepto_envio_qs'],
-        'rechazo_envio': embudo['rechazo_envio_qs'],
-        'sin_decision_envio': embudo['sin_decision_envio_qs'],
-        'acepto_cotiz': embudo['acepto_cotiz_qs'],
-        'rechazo_cotiz': embudo['rechazo_cotiz_qs'],
-        'no_apto': embudo['no_apto_qs'],
-        'en_proceso_cohorte': embudo['en_proceso_cohorte_qs'],
-    }
-    qs = mapa_segmentos.get(segmento)
-    if qs is None:
+    segmentos = (
+        'acepto_envio', 'rechazo_envio', 'sin_decision_envio', 'acepto_cotiz',
+        'rechazo_cotiz', 'no_apto', 'en_proceso_cohorte',
+    )
+    if segmento not in segmentos:
         return []
-    return [construir_fila_detalle_orden(orden) for orden in qs]
+    ids = set(embudo[f'{segmento}_ids'])
+    return [fila_detalle_desde_proyeccion(fila) for fila in embudo['filas'] if fila['id'] in ids]
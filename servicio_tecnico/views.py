@@ -107,6 +107,7 @@ from .views_dashboard_cotizaciones import (  # noqa: F401
     exportar_analisis_rechazos,
     exportar_dashboard_cotizaciones,
 )
+from .views_dashboard_consolidado import dashboard_consolidado  # noqa: F401
 from .views_export_productividad_tecnicos import (  # noqa: F401
     exportar_productividad_tecnicos,
 )
@@ -114,6 +115,10 @@ from .views_export_garantia import (  # noqa: F401
     exportar_base_garantia,
     exportar_excel_base_garantia,
 )
+from .views_exportaciones import (  # noqa: F401
+    descargar_exportacion_excel,
+    estado_exportacion_excel,
+)
 from .views_dashboard_seguimiento_piezas import (  # noqa: F401
     dashboard_seguimiento_piezas,
     exportar_dashboard_seguimiento_piezas,
@@ -129,7 +134,12 @@ from .views_ordenes import (  # noqa: F401
     lista_ordenes_finalizadas,
     seleccionar_tipo_orden,
 )
-from .views_sicser import consultar_sicser, importar_orden_sicser  # noqa: F401
+from .views_sicser import (  # noqa: F401
+    consultar_sicser,
+    estado_importacion_sicser_lote,
+    importar_orden_sicser,
+    importar_ordenes_sicser_lote,
+)
 from .views_formato_oow import (  # noqa: F401
     abrir_formato_oow_desde_sicser,
     formato_oow_eliminar_evidencia,
@@ -157,6 +167,10 @@ from .views_referencias_gama import (  # noqa: F401
     lista_referencias_gama,
     reactivar_referencia_gama,
 )
+from .views_subidas_reanudables import (  # noqa: F401
+    iniciar_subida_video,
+    subida_video,
+)
 from .views_video_resumen import (  # noqa: F401
     comprimir_video_resumen,
     estado_compresion_resumen,
@@ -208,6 +222,7 @@ from .views_encuestas import (  # noqa: F401
     api_encuestas_distribucion_nps,
     api_encuestas_kpis,
     api_encuestas_lista,
+    api_encuestas_paneles,
     api_encuestas_por_responsable,
     api_encuestas_tendencia,
     dashboard_encuestas,
@@ -219,6 +234,7 @@ from .views_feedback_rechazo_dash import (  # noqa: F401
     api_feedback_rechazo_comentarios,
     api_feedback_rechazo_kpis,
     api_feedback_rechazo_lista,
+    api_feedback_rechazo_paneles,
     api_feedback_rechazo_por_motivo,
     api_feedback_rechazo_tendencia,
     dashboard_feedback_rechazo,
@@ -0,0 +1,69 @@
+"""
+Dashboard ejecutivo consolidado de todos los países.
+
+urls.py sigue usando views.<nombre> porque views.py reexporta estos símbolos.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+--------------------------------
+La vista solo lee el rango de fechas y llama a
+services/dashboard_consolidado.py, que consulta los cuatro países en
+paralelo (con caché por país). Con ?formato=json devuelve los mismos datos
+para consumirlos desde otro tablero.
+"""
+
+from datetime import datetime, timedelta
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.utils import timezone
+
+from .decorators import permission_required_with_message
+from .services.dashboard_consolidado import obtener_kpis_consolidados
+
+
+def _leer_fecha(valor, por_defecto, hora):
+    """'YYYY-MM-DD' → datetime timezone-aware a la `hora` dada (o el default)."""
+    try:
+        dia = datetime.strptime(valor, '%Y-%m-%d').date() if valor else por_defecto
+    except ValueError:
+        dia = por_defecto
+    return timezone.make_aware(datetime.combine(dia, hora))
+
+
+@login_required
+@permission_required_with_message('servicio_tecnico.view_dashboard_gerencial')
+def dashboard_consolidado(request):
+    """
+    KPIs de México, Argentina, Chile y Colombia en una sola página.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    No usa @cache_page_dashboard: el caché vive por país dentro del servicio,
+    así un país lento o caído no invalida lo ya calculado de los demás.
+
+    Parámetros GET:
+        fecha_inicio (str): 'YYYY-MM-DD'. Default: hace 90 días.
+        fecha_fin (str): 'YYYY-MM-DD'. Default: hoy.
+        formato (str): 'json' para devolver JsonResponse.
+
+    Returns:
+        HttpResponse | JsonResponse: template o los datos consolidados.
+    """
+    hoy = timezone.localdate()
+    fecha_inicio = _leer_fecha(request.GET.get('fecha_inicio'), hoy - timedelta(days=90), datetime.min.time())
+    fecha_fin = _leer_fecha(request.GET.get('fecha_fin'), hoy, datetime.max.time())
+
+    consolidado = obtener_kpis_consolidados(fecha_inicio, fecha_fin)
+
+    if request.GET.get('formato') == 'json':
+        return JsonResponse({
+            'fecha_inicio': fecha_inicio.strftime('%Y-%m-%d'),
+            'fecha_fin': fecha_fin.strftime('%Y-%m-%d'),
+            **consolidado,
+        })
+
+    return render(request, 'servicio_tecnico/dashboard_consolidado.html', {
+        'fecha_inicio': fecha_inicio.strftime('%Y-%m-%d'),
+        'fecha_fin': fecha_fin.strftime('%Y-%m-%d'),
+        **consolidado,
+    })
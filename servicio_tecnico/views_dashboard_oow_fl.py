@@ -62,6 +62,63 @@ def queryset_base_oow_fl(prefijo_filtro: str = 'ambos') -> QuerySet:
     return ordenes
 
 
+def filtrar_ordenes_oow_fl(params):
+    """
+    Órdenes OOW/FL con los filtros GET del dashboard (y de su export).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El dashboard y el Excel aplicaban los mismos filtros copiados en dos
+    lugares; ahora ambos llaman a esta función.
+
+    Args:
+        params: request.GET (responsable_id, fecha_desde, fecha_hasta,
+            estado, sucursal_id, prefijo).
+
+    Returns:
+        QuerySet de OrdenServicio filtrado (orden por defecto del modelo).
+
+    Efectos secundarios:
+        Ninguno (solo arma el QuerySet).
+    """
+    from datetime import datetime
+
+    responsable_id = params.get('responsable_id', '')
+    fecha_desde = params.get('fecha_desde', '')
+    fecha_hasta = params.get('fecha_hasta', '')
+    estado_filtro = params.get('estado', '')
+    sucursal_id = params.get('sucursal_id', '')
+
+    ordenes = queryset_base_oow_fl(params.get('prefijo', 'ambos'))
+
+    if responsable_id == 'sin_asignar':
+        # Filtrar solo órdenes sin responsable asignado
+        ordenes = ordenes.filter(responsable_seguimiento__isnull=True)
+    elif responsable_id:
+        ordenes = ordenes.filter(responsable_seguimiento_id=responsable_id)
+
+    if fecha_desde:
+        try:
+            fecha_desde_obj = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
+            ordenes = ordenes.filter(fecha_ingreso__date__gte=fecha_desde_obj)
+        except ValueError:
+            pass  # Ignorar si el formato es inválido
+
+    if fecha_hasta:
+        try:
+            fecha_hasta_obj = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
+            ordenes = ordenes.filter(fecha_ingreso__date__lte=fecha_hasta_obj)
+        except ValueError:
+            pass
+
+    if estado_filtro:
+        ordenes = ordenes.filter(estado=estado_filtro)
+
+    if sucursal_id:
+        ordenes = ordenes.filter(sucursal_id=sucursal_id)
+
+    return ordenes
+
+
 # ============================================================================
 # DASHBOARD DE SEGUIMIENTO ESPECIALIZADO OOW/FL (FUERA DE GARANTÍA)
 # ============================================================================
@@ -82,16 +139,9 @@ def dashboard_seguimiento_oow_fl(request):
     Efectos secundarios:
         Ninguno de escritura; solo lecturas ORM y render del template.
     """
-    from django.db.models import Count, Sum, Avg, F, When, Case, Value, CharField
-    from django.db.models.functions import Coalesce
-    from decimal import Decimal
-    from datetime import timedelta
-    from .utils_rhitso import (
-        calcular_dias_habiles,
-        calcular_dias_por_estatus,
-        calcular_promedio_dias_por_estatus,
-        agrupar_ordenes_por_mes
-    )
+    from datetime import datetime
+    from .services.analitica_oow_fl import MarcoOOWFL
+    from .utils_rhitso import calcular_dias_habiles
     
     # =========================================================================
     # PASO 1: OBTENER FILTROS DE LA URL
@@ -106,115 +156,23 @@ def dashboard_seguimiento_oow_fl(request):
     prefijo_filtro = request.GET.get('prefijo', 'ambos')  # 'OOW', 'FL', o 'ambos'
     
     # =========================================================================
-    # PASO 2: QUERY BASE (es_fuera_garantia + opcional tipo_servicio)
-    # =========================================================================
-    
-    ordenes = queryset_base_oow_fl(prefijo_filtro)
-    
-    # Optimizar consultas con select_related y prefetch_related
-    ordenes = ordenes.select_related(
-        'detalle_equipo',
-        'sucursal',
-        'responsable_seguimiento',
-        'tecnico_asignado_actual',
-        'venta_mostrador',
-        'cotizacion'
-    ).prefetch_related(
-        'historial'
-    )
-    
-    # =========================================================================
-    # PASO 3: APLICAR FILTROS ADICIONALES
+    # PASO 2-3: QUERY BASE (es_fuera_garantia + tipo_servicio) Y FILTROS
     # =========================================================================
     
-    if responsable_id == 'sin_asignar':
-        # Filtrar solo órdenes sin responsable asignado
-        ordenes = ordenes.filter(responsable_seguimiento__isnull=True)
-    elif responsable_id:
-        ordenes = ordenes.filter(responsable_seguimiento_id=responsable_id)
-    
-    if fecha_desde:
-        try:
-            from datetime import datetime
-            fecha_desde_obj = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
-            ordenes = ordenes.filter(fecha_ingreso__date__gte=fecha_desde_obj)
-        except ValueError:
-            pass  # Ignorar si el formato es inválido
-    
-    if fecha_hasta:
-        try:
-            from datetime import datetime
-            fecha_hasta_obj = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
-            ordenes = ordenes.filter(fecha_ingreso__date__lte=fecha_hasta_obj)
-        except ValueError:
-            pass
-    
-    if estado_filtro:
-        ordenes = ordenes.filter(estado=estado_filtro)
-    
-    if sucursal_id:
-        ordenes = ordenes.filter(sucursal_id=sucursal_id)
+    ordenes = filtrar_ordenes_oow_fl(request.GET)
     
     # =========================================================================
-    # PASO 4: CALCULAR MÉTRICAS GENERALES
+    # PASO 4: CARGAR EL MARCO Y CALCULAR MÉTRICAS GENERALES
     # =========================================================================
     
-    total_ordenes = ordenes.count()
-    
-    # Contar por estado
-    ordenes_activas = ordenes.exclude(estado__in=['entregado', 'cancelado']).count()
-    ordenes_finalizadas = ordenes.filter(estado='finalizado').count()
-    ordenes_entregadas = ordenes.filter(estado='entregado').count()
-    
-    # Contar ventas mostrador
-    total_ventas_mostrador = ordenes.filter(venta_mostrador__isnull=False).count()
-    
-    # Contar con cotización
-    total_con_cotizacion = ordenes.filter(cotizacion__isnull=False).count()
-    cotizaciones_aceptadas = ordenes.filter(
-        cotizacion__isnull=False,
-        cotizacion__usuario_acepto=True
-    ).count()
-    cotizaciones_pendientes = ordenes.filter(
-        cotizacion__isnull=False,
-        cotizacion__usuario_acepto__isnull=True
-    ).count()
-    cotizaciones_rechazadas = ordenes.filter(
-        cotizacion__isnull=False,
-        cotizacion__usuario_acepto=False
-    ).count()
-    
-    # Calcular montos totales
-    monto_total_ventas_mostrador = Decimal('0.00')
-    monto_total_cotizaciones = Decimal('0.00')
-    
-    for orden in ordenes:
-        if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-            monto_total_ventas_mostrador += orden.venta_mostrador.total_venta
-        
-        if hasattr(orden, 'cotizacion') and orden.cotizacion:
-            if orden.cotizacion.usuario_acepto:
-                monto_total_cotizaciones += orden.cotizacion.costo_total_final
-    
-    monto_total_general = monto_total_ventas_mostrador + monto_total_cotizaciones
-    
-    # Calcular tiempo promedio (días hábiles)
-    total_dias_habiles = 0
-    ordenes_con_tiempo = 0
-    
-    for orden in ordenes:
-        dias = orden.dias_habiles_en_servicio
-        if dias >= 0:
-            total_dias_habiles += dias
-            ordenes_con_tiempo += 1
-    
-    tiempo_promedio = round(total_dias_habiles / ordenes_con_tiempo, 1) if ordenes_con_tiempo > 0 else 0
-    
-    # Calcular % en tiempo (<= 15 días hábiles)
-    ordenes_en_tiempo = sum(1 for orden in ordenes if orden.dias_habiles_en_servicio <= 15)
-    porcentaje_en_tiempo = round((ordenes_en_tiempo / total_ordenes) * 100, 1) if total_ordenes > 0 else 0
+    # EXPLICACIÓN: MarcoOOWFL carga órdenes, piezas VM y cambios de estado en
+    # 3 consultas y calcula todo con pandas (ver services/analitica_oow_fl.py).
+    marco = MarcoOOWFL(ordenes)
+    metricas = marco.metricas()
+    total_ordenes = metricas['total_ordenes']
     
     # Calcular ingreso promedio diario
+    ingreso_promedio_dia = 0
     if fecha_desde and fecha_hasta:
         try:
             fecha_desde_obj = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
@@ -222,253 +180,29 @@ def dashboard_seguimiento_oow_fl(request):
             dias_rango = calcular_dias_habiles(fecha_desde_obj, fecha_hasta_obj)
             if dias_rango > 0:
                 ingreso_promedio_dia = round(total_ordenes / dias_rango, 1)
-            else:
-                ingreso_promedio_dia = 0
-        except:
+        except ValueError:
             ingreso_promedio_dia = 0
-    else:
-        ingreso_promedio_dia = 0
+    metricas['ingreso_promedio_dia'] = ingreso_promedio_dia
     
     # =========================================================================
     # PASO 5: AGRUPAR POR RESPONSABLE DE SEGUIMIENTO
     # =========================================================================
     
-    responsables_data = {}
-    
-    for orden in ordenes:
-        # EXPLICACIÓN: Algunas órdenes OOW/FL pueden no tener responsable asignado.
-        # En ese caso usamos id=0 y nombre "Sin asignar" para no romper el dashboard.
-        if orden.responsable_seguimiento:
-            resp_id = orden.responsable_seguimiento.id
-            resp_nombre = orden.responsable_seguimiento.nombre_completo
-        else:
-            resp_id = 0
-            resp_nombre = "Sin asignar"
-        
-        if resp_id not in responsables_data:
-            responsables_data[resp_id] = {
-                'id': resp_id,
-                'nombre': resp_nombre,
-                'total_ordenes': 0,
-                'ordenes_activas': 0,
-                'ordenes_finalizadas': 0,
-                'ordenes_entregadas': 0,
-                'ventas_mostrador': 0,
-                'con_cotizacion': 0,
-                'cotizaciones_aceptadas': 0,
-                'cotizaciones_pendientes': 0,
-                'cotizaciones_rechazadas': 0,
-                'monto_ventas_mostrador': Decimal('0.00'),
-                'monto_cotizaciones': Decimal('0.00'),
-                'dias_acumulados': 0,
-            }
-        
-        # Acumular estadísticas
-        responsables_data[resp_id]['total_ordenes'] += 1
-        
-        if orden.estado not in ['entregado', 'cancelado']:
-            responsables_data[resp_id]['ordenes_activas'] += 1
-        
-        if orden.estado == 'finalizado':
-            responsables_data[resp_id]['ordenes_finalizadas'] += 1
-        
-        if orden.estado == 'entregado':
-            responsables_data[resp_id]['ordenes_entregadas'] += 1
-        
-        if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-            responsables_data[resp_id]['ventas_mostrador'] += 1
-            responsables_data[resp_id]['monto_ventas_mostrador'] += orden.venta_mostrador.total_venta
-        
-        if hasattr(orden, 'cotizacion') and orden.cotizacion:
-            responsables_data[resp_id]['con_cotizacion'] += 1
-            if orden.cotizacion.usuario_acepto is True:
-                responsables_data[resp_id]['cotizaciones_aceptadas'] += 1
-                responsables_data[resp_id]['monto_cotizaciones'] += orden.cotizacion.costo_total_final
-            elif orden.cotizacion.usuario_acepto is False:
-                responsables_data[resp_id]['cotizaciones_rechazadas'] += 1
-            else:
-                # Si es None (null), está pendiente
-                responsables_data[resp_id]['cotizaciones_pendientes'] += 1
-        
-        responsables_data[resp_id]['dias_acumulados'] += orden.dias_habiles_en_servicio
-    
-    # Calcular promedios y montos totales por responsable
-    for resp_id, data in responsables_data.items():
-        if data['total_ordenes'] > 0:
-            data['tiempo_promedio'] = round(data['dias_acumulados'] / data['total_ordenes'], 1)
-            # Tasa de finalización = porcentaje de órdenes ENTREGADAS
-            data['tasa_finalizacion'] = round(
-                (data['ordenes_entregadas'] / data['total_ordenes']) * 100,
-                1
-            )
-        else:
-            data['tiempo_promedio'] = 0
-            data['tasa_finalizacion'] = 0
-        
-        data['monto_total'] = data['monto_ventas_mostrador'] + data['monto_cotizaciones']
-    
-    # Convertir a lista y ordenar por total de órdenes (descendente)
-    responsables_lista = sorted(
-        responsables_data.values(),
-        key=lambda x: x['total_ordenes'],
-        reverse=True
-    )
+    # Ordenado por total de órdenes (descendente); id 0 = "Sin asignar"
+    responsables_lista = marco.responsables()
     
     # =========================================================================
-    # PASO 5.5: PREPARAR GRÁFICO 1 - VENTAS MOSTRADOR POR RESPONSABLE + CATEGORÍA
+    # PASO 5.5: GRÁFICO 1 - VENTAS MOSTRADOR POR RESPONSABLE + CATEGORÍA
     # =========================================================================
     
-    # Crear estructura con datos de ventas mostrador por responsable
-    # Incluyendo la categoría de producto vendido
-    grafico_ventas_mostrador_responsables = {
-        'labels': [],  # Nombres de responsables
-        'data': [],  # Montos en $
-        'categorias': [],  # Categoría de producto vendido
-        'iconos': [],  # Emojis para visual
-        'desglose': [],  # NUEVO: Desglose completo de productos por responsable
-    }
-    
-    # Filtrar responsables que tengan ventas mostrador > 0
-    responsables_con_ventas = [
-        r for r in responsables_lista 
-        if r['ventas_mostrador'] > 0
-    ]
-    
-    # Para cada responsable con ventas, obtener categoría de producto
-    for responsable in responsables_con_ventas:
-        resp_id = responsable['id']
-        
-        # Obtener todas las órdenes de este responsable con venta mostrador
-        # EXPLICACIÓN: Mismo manejo seguro — si no tiene responsable, su id es 0
-        ordenes_resp = [
-            o for o in ordenes
-            if (o.responsable_seguimiento.id if o.responsable_seguimiento else 0) == resp_id
-        ]
-        
-        # NUEVO: Crear desglose detallado de productos vendidos por este responsable
-        productos_responsable = {}  # {descripcion: {cantidad, subtotal, categoria}}
-        categorias_contador = {}
-        
-        for orden in ordenes_resp:
-            if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-                venta = orden.venta_mostrador
-                
-                # ===== INCLUIR PAQUETES =====
-                if venta.paquete != 'ninguno':
-                    desc_paquete = f"Paquete {venta.paquete.upper()}"
-                    costo_paq = float(venta.costo_paquete)
-                    
-                    if desc_paquete not in productos_responsable:
-                        productos_responsable[desc_paquete] = {
-                            'cantidad': 0,
-                            'subtotal': 0
-                        }
-                    
-                    productos_responsable[desc_paquete]['cantidad'] += 1
-                    productos_responsable[desc_paquete]['subtotal'] += costo_paq
-                
-                # ===== INCLUIR SERVICIOS =====
-                servicios_venta = []
-                
-                if venta.incluye_cambio_pieza and venta.costo_cambio_pieza > 0:
-                    servicios_venta.append({
-                        'nombre': 'Cambio de Pieza',
-                        'costo': float(venta.costo_cambio_pieza)
-                    })
-                
-                if venta.incluye_limpieza and venta.costo_limpieza > 0:
-                    servicios_venta.append({
-                        'nombre': 'Limpieza y Mantenimiento',
-                        'costo': float(venta.costo_limpieza)
-                    })
-                
-                if venta.incluye_kit_limpieza and venta.costo_kit > 0:
-                    servicios_venta.append({
-                        'nombre': 'Kit de Limpieza',
-                        'costo': float(venta.costo_kit)
-                    })
-                
-                if venta.incluye_reinstalacion_so and venta.costo_reinstalacion > 0:
-                    servicios_venta.append({
-                        'nombre': 'Reinstalación SO',
-                        'costo': float(venta.costo_reinstalacion)
-                    })
-                
-                # Agregar servicios al desglose
-                for servicio in servicios_venta:
-                    desc_servicio = servicio['nombre']
-                    costo_servicio = servicio['costo']
-                    
-                    if desc_servicio not in productos_responsable:
-                        productos_responsable[desc_servicio] = {
-                            'cantidad': 0,
-                            'subtotal': 0
-                        }
-                    
-                    productos_responsable[desc_servicio]['cantidad'] += 1
-                    productos_responsable[desc_servicio]['subtotal'] += costo_servicio
-                
-                # ===== INCLUIR PIEZAS INDIVIDUALES =====
-                piezas = venta.piezas_vendidas.all()
-                for pieza in piezas:
-                    desc = pieza.descripcion_pieza[:50]  # Truncar descripción
-                    
-                    if desc not in productos_responsable:
-                        productos_responsable[desc] = {
-                            'cantidad': 0,
-                            'subtotal': 0
-                        }
-                    
-                    productos_responsable[desc]['cantidad'] += pieza.cantidad
-                    productos_responsable[desc]['subtotal'] += float(pieza.subtotal)
-                
-                # Contar categorías
-                cat_info = determinar_categoria_venta(venta)
-                categoria = cat_info['categoria']
-                categorias_contador[categoria] = categorias_contador.get(categoria, 0) + 1
-        
-        # Obtener la categoría más vendida
-        if categorias_contador:
-            categoria_principal = max(categorias_contador, key=categorias_contador.get)
-            # Obtener información de la primera venta para obtener icono
-            primera_venta = None
-            for orden in ordenes_resp:
-                if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-                    primera_venta = orden.venta_mostrador
-                    break
-            
-            cat_info = determinar_categoria_venta(primera_venta) if primera_venta else {'categoria': 'Desconocido', 'icono': '❓'}
-        else:
-            cat_info = {'categoria': 'Sin categoría', 'icono': '❌'}
-        
-        # NUEVO: Ordenar productos por subtotal (mayor primero)
-        productos_ordenados = sorted(
-            productos_responsable.items(),
-            key=lambda x: x[1]['subtotal'],
-            reverse=True
-        )
-        
-        # Convertir a formato para tooltip
-        desglose_texto = []
-        for desc, info in productos_ordenados[:10]:  # Top 10 productos
-            desglose_texto.append({
-                'descripcion': desc,
-                'cantidad': info['cantidad'],
-                'subtotal': info['subtotal']
-            })
-        
-        # Agregar datos al gráfico
-        grafico_ventas_mostrador_responsables['labels'].append(responsable['nombre'])
-        grafico_ventas_mostrador_responsables['data'].append(float(responsable['monto_ventas_mostrador']))
-        grafico_ventas_mostrador_responsables['categorias'].append(cat_info['categoria'])
-        grafico_ventas_mostrador_responsables['iconos'].append(cat_info['icono'])
-        grafico_ventas_mostrador_responsables['desglose'].append(desglose_texto)
+    # Solo responsables con ventas mostrador, con categoría y desglose (top 10)
+    grafico_ventas_mostrador_responsables = marco.grafico_ventas_por_responsable(responsables_lista)
     
     # =========================================================================
     # PASO 5.6: PREPARAR GRÁFICO 2 - TOP PRODUCTOS VENDIDOS
     # =========================================================================
     
-    top_productos = obtener_top_productos_vendidos(ordenes, limite=5)
+    top_productos = marco.top_piezas(limite=5)
     
     grafico_top_productos = {
         'labels': [p['descripcion'][:30] for p in top_productos],  # Truncar descripciones largas
@@ -481,7 +215,7 @@ def dashboard_seguimiento_oow_fl(request):
     # =========================================================================
     
     # Obtener estadísticas separadas: estados de proceso vs estados finales
-    resultado_dias_por_estatus = calcular_promedio_dias_por_estatus(ordenes)
+    resultado_dias_por_estatus = marco.dias_por_estatus()
     
     # Estados de proceso (sin entregado/cancelado) - para la tabla principal
     dias_por_estatus_proceso = resultado_dias_por_estatus['estados_proceso']
@@ -493,81 +227,16 @@ def dashboard_seguimiento_oow_fl(request):
     # PASO 7: GENERAR DATOS MENSUALES
     # =========================================================================
     
-    datos_mensuales = agrupar_ordenes_por_mes(ordenes)
+    datos_mensuales = marco.datos_mensuales()
     
     # =========================================================================
     # PASO 8: IDENTIFICAR ALERTAS
     # =========================================================================
     
-    alertas = {
-        'retrasadas': [],  # >15 días hábiles
-        'sin_actualizacion': [],  # >5 días sin cambio de estado
-        'cotizaciones_pendientes': [],  # >7 días sin respuesta
-        'en_reparacion_larga': [],  # >10 días en estado 'reparacion'
-    }
-    
-    # Función auxiliar para construir datos de alerta con información completa
-    def construir_datos_alerta(orden, dias, tipo_dias='hábiles'):
-        """
-        Construye un diccionario con toda la información necesaria para mostrar
-        una alerta en el dashboard de forma profesional.
-        
-        Args:
-            orden: Instancia de OrdenServicio
-            dias: Número de días de la alerta
-            tipo_dias: Descripción del tipo de días (hábiles, sin respuesta, etc.)
-        
-        Returns:
-            dict: Diccionario con datos completos de la alerta
-        """
-        return {
-            'orden': orden,
-            'dias': dias,
-            'tipo_dias': tipo_dias,
-            # Información adicional para tablas mejoradas
-            'orden_cliente': orden.detalle_equipo.orden_cliente if orden.detalle_equipo else 'N/A',
-            'estado': orden.get_estado_display(),
-            'estado_codigo': orden.estado,
-            'responsable': orden.responsable_seguimiento.nombre_completo if orden.responsable_seguimiento else 'Sin asignar',
-            'modelo': orden.detalle_equipo.modelo if orden.detalle_equipo else 'N/A',
-            'gama': orden.detalle_equipo.get_gama_display() if orden.detalle_equipo and hasattr(orden.detalle_equipo, 'get_gama_display') else orden.detalle_equipo.gama if orden.detalle_equipo else 'N/A',
-            'es_candidato_rhitso': orden.es_candidato_rhitso,
-        }
-    
-    for orden in ordenes:
-        # Retrasadas (>15 días hábiles sin entregar)
-        # Excluir estados finales: entregado y cancelado
-        if orden.estado not in ['entregado', 'cancelado'] and orden.dias_habiles_en_servicio > 15:
-            alertas['retrasadas'].append(
-                construir_datos_alerta(orden, orden.dias_habiles_en_servicio, 'días hábiles')
-            )
-        
-        # Sin actualización (>5 días hábiles)
-        dias_sin_act = orden.dias_sin_actualizacion_estado
-        if dias_sin_act > 5 and orden.estado not in ['entregado', 'cancelado']:
-            alertas['sin_actualizacion'].append(
-                construir_datos_alerta(orden, dias_sin_act, 'días sin cambio')
-            )
-        
-        # Cotizaciones pendientes (>7 días sin respuesta)
-        if hasattr(orden, 'cotizacion') and orden.cotizacion:
-            if orden.cotizacion.usuario_acepto is None and orden.cotizacion.dias_sin_respuesta > 7:
-                alertas['cotizaciones_pendientes'].append(
-                    construir_datos_alerta(orden, orden.cotizacion.dias_sin_respuesta, 'días sin respuesta')
-                )
-        
-        # En reparación prolongada (>10 días en estado reparacion)
-        if orden.estado == 'reparacion':
-            dias_por_estado = calcular_dias_por_estatus(orden)
-            dias_reparacion = dias_por_estado.get('reparacion', 0)
-            if dias_reparacion > 10:
-                alertas['en_reparacion_larga'].append(
-                    construir_datos_alerta(orden, dias_reparacion, 'días en reparación')
-                )
-    
-    # Ordenar alertas por días (mayor a menor) para priorizar las más críticas
-    for tipo_alerta in alertas:
-        alertas[tipo_alerta].sort(key=lambda x: x['dias'], reverse=True)
+    # retrasadas (>15 días hábiles), sin_actualizacion (>5 días sin cambio),
+    # cotizaciones_pendientes (>7 días sin respuesta) y en_reparacion_larga
+    # (>10 días en 'reparacion'), cada lista de mayor a menor número de días
+    alertas = marco.alertas()
     
     # =========================================================================
     # PASO 9: PREPARAR DATOS PARA GRÁFICOS (Chart.js)
@@ -611,10 +280,7 @@ def dashboard_seguimiento_oow_fl(request):
     }
     
     # Gráfico 4: Distribución por estado
-    estados_distribucion = {}
-    for orden in ordenes:
-        estado = orden.get_estado_display()
-        estados_distribucion[estado] = estados_distribucion.get(estado, 0) + 1
+    estados_distribucion = marco.distribucion_estados()
     
     grafico_distribucion_estados = {
         'labels': list(estados_distribucion.keys()),
@@ -660,23 +326,7 @@ def dashboard_seguimiento_oow_fl(request):
         'lista_estados': lista_estados,
         
         # Métricas generales
-        'metricas': {
-            'total_ordenes': total_ordenes,
-            'ordenes_activas': ordenes_activas,
-            'ordenes_finalizadas': ordenes_finalizadas,
-            'ordenes_entregadas': ordenes_entregadas,
-            'total_ventas_mostrador': total_ventas_mostrador,
-            'total_con_cotizacion': total_con_cotizacion,
-            'cotizaciones_aceptadas': cotizaciones_aceptadas,
-            'cotizaciones_pendientes': cotizaciones_pendientes,
-            'cotizaciones_rechazadas': cotizaciones_rechazadas,
-            'monto_ventas_mostrador': monto_total_ventas_mostrador,
-            'monto_cotizaciones': monto_total_cotizaciones,
-            'monto_total': monto_total_general,
-            'tiempo_promedio': tiempo_promedio,
-            'porcentaje_en_tiempo': porcentaje_en_tiempo,
-            'ingreso_promedio_dia': ingreso_promedio_dia,
-        },
+        'metricas': metricas,
         
         # Datos por responsable
         'responsables': responsables_lista,
@@ -711,8 +361,12 @@ def dashboard_seguimiento_oow_fl(request):
         'grafico_top_productos': grafico_top_productos,
         
         # Órdenes completas (para tabla detallada)
-        'ordenes': ordenes[:100],  # Limitar a 100 para rendimiento inicial
-        'total_ordenes_tabla': ordenes.count(),
+        'ordenes': ordenes.select_related(
+            'detalle_equipo',
+            'sucursal',
+            'responsable_seguimiento',
+        )[:100],  # Limitar a 100 para rendimiento inicial
+        'total_ordenes_tabla': total_ordenes,
     }
     
     return render(request, 'servicio_tecnico/dashboard_seguimiento_oow_fl.html', context)
@@ -742,10 +396,8 @@ def exportar_excel_dashboard_oow_fl(request):
         from .excel_exporters import (
             get_header_style, get_title_style, get_kpi_title_style, get_kpi_value_style,
             get_estado_color, apply_cell_style, auto_adjust_column_width,
-            calcular_metricas_generales, calcular_distribucion_estados,
-            calcular_estadisticas_por_responsable, calcular_top_productos,
-            calcular_estadisticas_por_sucursal
         )
+        from .services.analitica_oow_fl import MarcoOOWFL
     except ImportError as e:
         from django.http import JsonResponse
         return JsonResponse({
@@ -764,57 +416,21 @@ def exportar_excel_dashboard_oow_fl(request):
     sucursal_id = request.GET.get('sucursal_id', '')
     prefijo_filtro = request.GET.get('prefijo', 'ambos')
     
-    # Misma regla que el dashboard: booleano + tipo_servicio (no string del folio)
-    ordenes = queryset_base_oow_fl(prefijo_filtro)
-    
-    # Optimizar consultas
-    ordenes = ordenes.select_related(
-        'detalle_equipo',
-        'sucursal',
-        'responsable_seguimiento',
-        'tecnico_asignado_actual',
-        'venta_mostrador',
-        'cotizacion'
-    ).prefetch_related('historial')
-    
-    # Aplicar filtros adicionales
-    if responsable_id == 'sin_asignar':
-        ordenes = ordenes.filter(responsable_seguimiento__isnull=True)
-    elif responsable_id:
-        ordenes = ordenes.filter(responsable_seguimiento_id=responsable_id)
-    
-    if fecha_desde:
-        try:
-            fecha_desde_obj = datetime.strptime(fecha_desde, '%Y-%m-%d').date()
-            ordenes = ordenes.filter(fecha_ingreso__date__gte=fecha_desde_obj)
-        except ValueError:
-            pass
-    
-    if fecha_hasta:
-        try:
-            fecha_hasta_obj = datetime.strptime(fecha_hasta, '%Y-%m-%d').date()
-            ordenes = ordenes.filter(fecha_ingreso__date__lte=fecha_hasta_obj)
-        except ValueError:
-            pass
-    
-    if estado_filtro:
-        ordenes = ordenes.filter(estado=estado_filtro)
-    
-    if sucursal_id:
-        ordenes = ordenes.filter(sucursal_id=sucursal_id)
-    
-    # Ordenar por fecha de ingreso
-    ordenes = ordenes.order_by('-fecha_ingreso')
+    # Mismos filtros que el dashboard, ordenado por fecha de ingreso
+    ordenes = filtrar_ordenes_oow_fl(request.GET).order_by('-fecha_ingreso')
     
     # =========================================================================
-    # PASO 2: CALCULAR MÉTRICAS Y ESTADÍSTICAS
+    # PASO 2: CALCULAR MÉTRICAS Y ESTADÍSTICAS (MISMO MARCO QUE EL DASHBOARD)
     # =========================================================================
     
-    metricas = calcular_metricas_generales(ordenes)
-    distribucion_estados = calcular_distribucion_estados(ordenes)
-    responsables_stats = calcular_estadisticas_por_responsable(ordenes)
-    top_productos = calcular_top_productos(ordenes, limite=10)
-    sucursales_stats = calcular_estadisticas_por_sucursal(ordenes)
+    marco = MarcoOOWFL(ordenes)
+    metricas = marco.metricas()
+    distribucion_estados = marco.distribucion_estados()
+    responsables_stats = marco.responsables()
+    top_productos = marco.top_conceptos(limite=10)
+    sucursales_stats = marco.sucursales()
+    # Una fila por orden (mismo orden que el QuerySet) para las hojas de detalle
+    filas_ordenes = marco.filas()
     
     # =========================================================================
     # PASO 3: CREAR WORKBOOK
@@ -959,7 +575,7 @@ def exportar_excel_dashboard_oow_fl(request):
         ws2.cell(row=row, column=8).value = f"${resp['monto_cotizaciones']:,.2f}"
         ws2.cell(row=row, column=9).value = f"${resp['monto_total']:,.2f}"
         ws2.cell(row=row, column=10).value = resp['tiempo_promedio']
-        ws2.cell(row=row, column=11).value = f"{resp['tasa_entrega']}%"
+        ws2.cell(row=row, column=11).value = f"{resp['tasa_finalizacion']}%"
         row += 1
     
     auto_adjust_column_width(ws2)
@@ -1061,7 +677,7 @@ def exportar_excel_dashboard_oow_fl(request):
             ('Órdenes Activas:', resp_stat['ordenes_activas']),
             ('Órdenes Entregadas:', resp_stat['ordenes_entregadas']),
             ('Tiempo Promedio:', f"{resp_stat['tiempo_promedio']} días"),
-            ('Tasa de Entrega:', f"{resp_stat['tasa_entrega']}%"),
+            ('Tasa de Entrega:', f"{resp_stat['tasa_finalizacion']}%"),
             ('', ''),  # Separador
             ('Ventas Mostrador:', resp_stat['ventas_mostrador']),
             ('Monto Ventas Mostrador:', f"${resp_stat['monto_ventas_mostrador']:,.2f}"),
@@ -1092,20 +708,16 @@ def exportar_excel_dashboard_oow_fl(request):
             
             row += 1
         
-        # Obtener órdenes del responsable.
-        # EXPLICACIÓN: Si el id es 0 significa "Sin asignar" — filtramos por NULL en la BD,
-        # ya que no existe ningún empleado con id=0.
-        if resp_stat['id'] == 0:
-            ordenes_resp = ordenes.filter(responsable_seguimiento__isnull=True)
-        else:
-            ordenes_resp = ordenes.filter(responsable_seguimiento__id=resp_stat['id'])
+        # Filas del responsable (id 0 = "Sin asignar"), ya en orden de ingreso descendente
+        filas_resp = [fila for fila in filas_ordenes if fila['resp_id'] == resp_stat['id']]
+        filas_activas_resp = [fila for fila in filas_resp if fila['activo']]
+        filas_cerradas_resp = [fila for fila in filas_resp if not fila['activo']]
         
         # ============== SECCIÓN: ÓRDENES ACTIVAS ==============
         row += 2
         ws_resp.merge_cells(f'A{row}:P{row}')
         activas_section = ws_resp[f'A{row}']
-        ordenes_activas_resp = ordenes_resp.exclude(estado__in=['entregado', 'cancelado'])
-        activas_section.value = f"🔄 ÓRDENES ACTIVAS ({ordenes_activas_resp.count()})"
+        activas_section.value = f"🔄 ÓRDENES ACTIVAS ({len(filas_activas_resp)})"
         activas_section.fill = PatternFill(start_color="ffc107", end_color="ffc107", fill_type="solid")
         activas_section.font = Font(bold=True, size=12, color="000000")
         activas_section.alignment = Alignment(horizontal="left", vertical="center")
@@ -1127,76 +739,34 @@ def exportar_excel_dashboard_oow_fl(request):
         row += 1
         
         # Datos de órdenes activas
-        for orden in ordenes_activas_resp.order_by('-fecha_ingreso'):
-            ws_resp.cell(row=row, column=1).value = orden.detalle_equipo.orden_cliente
-            ws_resp.cell(row=row, column=2).value = orden.detalle_equipo.numero_serie if orden.detalle_equipo.numero_serie else 'N/A'
-            ws_resp.cell(row=row, column=3).value = orden.detalle_equipo.get_tipo_equipo_display()
-            ws_resp.cell(row=row, column=4).value = orden.detalle_equipo.marca
-            ws_resp.cell(row=row, column=5).value = orden.detalle_equipo.modelo[:30] if orden.detalle_equipo.modelo else 'N/A'
-            ws_resp.cell(row=row, column=6).value = orden.get_estado_display()
-            ws_resp.cell(row=row, column=7).value = orden.dias_habiles_en_servicio
-            ws_resp.cell(row=row, column=8).value = orden.dias_sin_actualizacion_estado
-            
-            # Tipo de orden
-            tipo_orden = 'Servicio Normal'
-            monto = 0
-            if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-                tipo_orden = 'Venta Mostrador'
-                monto = float(orden.venta_mostrador.total_venta)
-            elif hasattr(orden, 'cotizacion') and orden.cotizacion:
-                if orden.cotizacion.usuario_acepto:
-                    tipo_orden = 'Cotización Aceptada'
-                    monto = float(orden.cotizacion.costo_total_final)
-                elif orden.cotizacion.usuario_acepto is False:
-                    tipo_orden = 'Cotización Rechazada'
-                else:
-                    tipo_orden = 'Cotización Pendiente'
-            
-            ws_resp.cell(row=row, column=9).value = tipo_orden
-            ws_resp.cell(row=row, column=10).value = f"${monto:,.2f}" if monto > 0 else 'N/A'
-            ws_resp.cell(row=row, column=11).value = orden.sucursal.nombre
-            ws_resp.cell(row=row, column=12).value = orden.fecha_ingreso.strftime('%d/%m/%Y')
-            
-            # Última actualización (del historial)
-            ultima_act = orden.historial.order_by('-fecha_evento').first()
-            ws_resp.cell(row=row, column=13).value = ultima_act.fecha_evento.strftime('%d/%m/%Y') if ultima_act else 'N/A'
-            
-            # Estado de cotización
-            cotiz_estado = 'N/A'
-            if hasattr(orden, 'cotizacion') and orden.cotizacion:
-                if orden.cotizacion.usuario_acepto is True:
-                    cotiz_estado = '✅ Aceptada'
-                elif orden.cotizacion.usuario_acepto is False:
-                    cotiz_estado = '❌ Rechazada'
-                else:
-                    cotiz_estado = '⏳ Pendiente'
-            ws_resp.cell(row=row, column=14).value = cotiz_estado
+        for fila in filas_activas_resp:
+            _escribir_fila_orden_responsable(ws_resp, row, fila)
             
             # Observaciones/Alertas
             alertas = []
-            if orden.dias_habiles_en_servicio > 15:
+            if fila['dias_habiles'] > 15:
                 alertas.append('⚠️ RETRASADA')
-            if orden.dias_sin_actualizacion_estado > 5:
-                alertas.append(f'🔴 Sin actualizar {orden.dias_sin_actualizacion_estado}d')
+            if fila['dias_sin_actualizacion'] > 5:
+                alertas.append(f"🔴 Sin actualizar {fila['dias_sin_actualizacion']}d")
             ws_resp.cell(row=row, column=15).value = ' | '.join(alertas) if alertas else 'OK'
             
             # Colorear estado
-            color_estado = get_estado_color(orden.estado)
+            color_estado = get_estado_color(fila['estado'])
             ws_resp.cell(row=row, column=6).fill = PatternFill(start_color=color_estado, end_color=color_estado, fill_type="solid")
             ws_resp.cell(row=row, column=6).font = Font(bold=True, color="FFFFFF")
             
             # Colorear días si está retrasada
-            if orden.dias_habiles_en_servicio > 15:
+            if fila['dias_habiles'] > 15:
                 ws_resp.cell(row=row, column=7).fill = PatternFill(start_color="dc3545", end_color="dc3545", fill_type="solid")
                 ws_resp.cell(row=row, column=7).font = Font(bold=True, color="FFFFFF")
             
             # Resaltar fila completa si es candidato RHITSO (morado claro)
-            if orden.es_candidato_rhitso:
+            if fila['es_candidato_rhitso']:
                 rhitso_color = "ede9fe"  # Morado claro (igual que en dashboard)
                 for col in range(1, 16):  # Columnas 1-15
                     cell = ws_resp.cell(row=row, column=col)
                     # Solo aplicar si la celda no tiene ya un color especial (estado, retrasada)
-                    if col not in [6, 7] or (col == 7 and orden.dias_habiles_en_servicio <= 15):
+                    if col not in [6, 7] or (col == 7 and fila['dias_habiles'] <= 15):
                         cell.fill = PatternFill(start_color=rhitso_color, end_color=rhitso_color, fill_type="solid")
             
             row += 1
@@ -1205,8 +775,7 @@ def exportar_excel_dashboard_oow_fl(request):
         row += 2
         ws_resp.merge_cells(f'A{row}:P{row}')
         cerradas_section = ws_resp[f'A{row}']
-        ordenes_cerradas_resp = ordenes_resp.filter(estado__in=['entregado', 'cancelado'])
-        cerradas_section.value = f"✅ ÓRDENES CERRADAS/ENTREGADAS ({ordenes_cerradas_resp.count()})"
+        cerradas_section.value = f"✅ ÓRDENES CERRADAS/ENTREGADAS ({len(filas_cerradas_resp)})"
         cerradas_section.fill = PatternFill(start_color="28a745", end_color="28a745", fill_type="solid")
         cerradas_section.font = Font(bold=True, size=12, color="FFFFFF")
         cerradas_section.alignment = Alignment(horizontal="left", vertical="center")
@@ -1222,59 +791,19 @@ def exportar_excel_dashboard_oow_fl(request):
         row += 1
         
         # Datos de órdenes cerradas
-        for orden in ordenes_cerradas_resp.order_by('-fecha_ingreso'):
-            ws_resp.cell(row=row, column=1).value = orden.detalle_equipo.orden_cliente
-            ws_resp.cell(row=row, column=2).value = orden.detalle_equipo.numero_serie if orden.detalle_equipo.numero_serie else 'N/A'
-            ws_resp.cell(row=row, column=3).value = orden.detalle_equipo.get_tipo_equipo_display()
-            ws_resp.cell(row=row, column=4).value = orden.detalle_equipo.marca
-            ws_resp.cell(row=row, column=5).value = orden.detalle_equipo.modelo[:30] if orden.detalle_equipo.modelo else 'N/A'
-            ws_resp.cell(row=row, column=6).value = orden.get_estado_display()
-            ws_resp.cell(row=row, column=7).value = orden.dias_habiles_en_servicio
-            ws_resp.cell(row=row, column=8).value = orden.dias_sin_actualizacion_estado
-            
-            # Tipo de orden y monto
-            tipo_orden = 'Servicio Normal'
-            monto = 0
-            if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-                tipo_orden = 'Venta Mostrador'
-                monto = float(orden.venta_mostrador.total_venta)
-            elif hasattr(orden, 'cotizacion') and orden.cotizacion:
-                if orden.cotizacion.usuario_acepto:
-                    tipo_orden = 'Cotización Aceptada'
-                    monto = float(orden.cotizacion.costo_total_final)
-                elif orden.cotizacion.usuario_acepto is False:
-                    tipo_orden = 'Cotización Rechazada'
-                else:
-                    tipo_orden = 'Cotización Pendiente'
-            
-            ws_resp.cell(row=row, column=9).value = tipo_orden
-            ws_resp.cell(row=row, column=10).value = f"${monto:,.2f}" if monto > 0 else 'N/A'
-            ws_resp.cell(row=row, column=11).value = orden.sucursal.nombre
-            ws_resp.cell(row=row, column=12).value = orden.fecha_ingreso.strftime('%d/%m/%Y')
-            
-            ultima_act = orden.historial.order_by('-fecha_evento').first()
-            ws_resp.cell(row=row, column=13).value = ultima_act.fecha_evento.strftime('%d/%m/%Y') if ultima_act else 'N/A'
-            
-            cotiz_estado = 'N/A'
-            if hasattr(orden, 'cotizacion') and orden.cotizacion:
-                if orden.cotizacion.usuario_acepto is True:
-                    cotiz_estado = '✅ Aceptada'
-                elif orden.cotizacion.usuario_acepto is False:
-                    cotiz_estado = '❌ Rechazada'
-                else:
-                    cotiz_estado = '⏳ Pendiente'
-            ws_resp.cell(row=row, column=14).value = cotiz_estado
+        for fila in filas_cerradas_resp:
+            _escribir_fila_orden_responsable(ws_resp, row, fila)
             
             # Para órdenes cerradas, solo mostrar si fue cancelada
-            ws_resp.cell(row=row, column=15).value = '❌ CANCELADA' if orden.estado == 'cancelado' else 'Completada'
+            ws_resp.cell(row=row, column=15).value = '❌ CANCELADA' if fila['estado'] == 'cancelado' else 'Completada'
             
             # Colorear estado
-            color_estado = get_estado_color(orden.estado)
+            color_estado = get_estado_color(fila['estado'])
             ws_resp.cell(row=row, column=6).fill = PatternFill(start_color=color_estado, end_color=color_estado, fill_type="solid")
             ws_resp.cell(row=row, column=6).font = Font(bold=True, color="FFFFFF")
             
             # Resaltar fila completa si es candidato RHITSO (morado claro)
-            if orden.es_candidato_rhitso:
+            if fila['es_candidato_rhitso']:
                 rhitso_color = "ede9fe"  # Morado claro (igual que en dashboard)
                 for col in range(1, 16):  # Columnas 1-15
                     cell = ws_resp.cell(row=row, column=col)
@@ -1295,7 +824,7 @@ def exportar_excel_dashboard_oow_fl(request):
     # Título
     ws_all.merge_cells('A1:Q1')
     title_cell = ws_all['A1']
-    title_cell.value = f"LISTA MAESTRA - TODAS LAS ÓRDENES OOW-/FL- ({ordenes.count()} registros)"
+    title_cell.value = f"LISTA MAESTRA - TODAS LAS ÓRDENES OOW-/FL- ({metricas['total_ordenes']} registros)"
     apply_cell_style(title_cell, get_title_style())
     ws_all.row_dimensions[1].height = 25
     
@@ -1315,62 +844,37 @@ def exportar_excel_dashboard_oow_fl(request):
     
     # Datos de todas las órdenes
     row = 4
-    for orden in ordenes:
-        ws_all.cell(row=row, column=1).value = orden.detalle_equipo.orden_cliente
-        ws_all.cell(row=row, column=2).value = orden.detalle_equipo.numero_serie if orden.detalle_equipo.numero_serie else 'N/A'
-        ws_all.cell(row=row, column=3).value = orden.detalle_equipo.get_tipo_equipo_display()
-        ws_all.cell(row=row, column=4).value = orden.detalle_equipo.marca
-        ws_all.cell(row=row, column=5).value = orden.detalle_equipo.modelo[:30] if orden.detalle_equipo.modelo else 'N/A'
-        ws_all.cell(row=row, column=6).value = orden.get_estado_display()
-        ws_all.cell(row=row, column=7).value = orden.responsable_seguimiento.nombre_completo if orden.responsable_seguimiento else 'Sin asignar'
-        ws_all.cell(row=row, column=8).value = orden.tecnico_asignado_actual.nombre_completo if orden.tecnico_asignado_actual else 'No asignado'
-        ws_all.cell(row=row, column=9).value = orden.dias_habiles_en_servicio
-        ws_all.cell(row=row, column=10).value = orden.dias_sin_actualizacion_estado
-        
-        # Tipo de orden y monto
-        tipo_orden = 'Servicio Normal'
-        monto = 0
-        if hasattr(orden, 'venta_mostrador') and orden.venta_mostrador:
-            tipo_orden = 'Venta Mostrador'
-            monto = float(orden.venta_mostrador.total_venta)
-        elif hasattr(orden, 'cotizacion') and orden.cotizacion:
-            if orden.cotizacion.usuario_acepto:
-                tipo_orden = 'Cotización Aceptada'
-                monto = float(orden.cotizacion.costo_total_final)
-            elif orden.cotizacion.usuario_acepto is False:
-                tipo_orden = 'Cotización Rechazada'
-            else:
-                tipo_orden = 'Cotización Pendiente'
-        
-        ws_all.cell(row=row, column=11).value = tipo_orden
-        ws_all.cell(row=row, column=12).value = f"${monto:,.2f}" if monto > 0 else 'N/A'
-        ws_all.cell(row=row, column=13).value = orden.sucursal.nombre
-        ws_all.cell(row=row, column=14).value = orden.fecha_ingreso.strftime('%d/%m/%Y %H:%M')
-        
-        # Última actualización
-        ultima_act = orden.historial.order_by('-fecha_evento').first()
-        ws_all.cell(row=row, column=15).value = ultima_act.fecha_evento.strftime('%d/%m/%Y %H:%M') if ultima_act else 'N/A'
-        
-        # Estado de cotización
-        cotiz_estado = 'N/A'
-        if hasattr(orden, 'cotizacion') and orden.cotizacion:
-            if orden.cotizacion.usuario_acepto is True:
-                cotiz_estado = '✅ Aceptada'
-            elif orden.cotizacion.usuario_acepto is False:
-                cotiz_estado = '❌ Rechazada'
-            else:
-                cotiz_estado = '⏳ Pendiente'
-        ws_all.cell(row=row, column=16).value = cotiz_estado
+    for fila in filas_ordenes:
+        activa = fila['activo']
+        retrasada = activa and fila['dias_habiles'] > 15
+        ultima_act = fila['ultima_actualizacion']
+        
+        ws_all.cell(row=row, column=1).value = fila['orden_cliente']
+        ws_all.cell(row=row, column=2).value = fila['numero_serie'] if fila['numero_serie'] else 'N/A'
+        ws_all.cell(row=row, column=3).value = fila['tipo_equipo']
+        ws_all.cell(row=row, column=4).value = fila['marca']
+        ws_all.cell(row=row, column=5).value = fila['modelo'][:30] if fila['modelo'] else 'N/A'
+        ws_all.cell(row=row, column=6).value = fila['estado_display']
+        ws_all.cell(row=row, column=7).value = fila['responsable']
+        ws_all.cell(row=row, column=8).value = fila['tecnico'] or 'No asignado'
+        ws_all.cell(row=row, column=9).value = fila['dias_habiles']
+        ws_all.cell(row=row, column=10).value = fila['dias_sin_actualizacion']
+        ws_all.cell(row=row, column=11).value = fila['tipo_orden']
+        ws_all.cell(row=row, column=12).value = f"${fila['monto']:,.2f}" if fila['monto'] > 0 else 'N/A'
+        ws_all.cell(row=row, column=13).value = fila['sucursal']
+        ws_all.cell(row=row, column=14).value = fila['fecha_ingreso'].strftime('%d/%m/%Y %H:%M')
+        ws_all.cell(row=row, column=15).value = ultima_act.strftime('%d/%m/%Y %H:%M') if ultima_act else 'N/A'
+        ws_all.cell(row=row, column=16).value = fila['cotizacion']
         
         # Observaciones/Alertas
         alertas = []
-        if orden.estado not in ['entregado', 'cancelado']:
-            if orden.dias_habiles_en_servicio > 15:
+        if activa:
+            if fila['dias_habiles'] > 15:
                 alertas.append('⚠️ RETRASADA')
-            if orden.dias_sin_actualizacion_estado > 5:
-                alertas.append(f'🔴 Sin actualizar {orden.dias_sin_actualizacion_estado}d')
+            if fila['dias_sin_actualizacion'] > 5:
+                alertas.append(f"🔴 Sin actualizar {fila['dias_sin_actualizacion']}d")
         else:
-            if orden.estado == 'cancelado':
+            if fila['estado'] == 'cancelado':
                 alertas.append('❌ CANCELADA')
             else:
                 alertas.append('✅ Completada')
@@ -1378,25 +882,22 @@ def exportar_excel_dashboard_oow_fl(request):
         ws_all.cell(row=row, column=17).value = ' | '.join(alertas) if alertas else 'OK'
         
         # Colorear estado
-        color_estado = get_estado_color(orden.estado)
+        color_estado = get_estado_color(fila['estado'])
         ws_all.cell(row=row, column=6).fill = PatternFill(start_color=color_estado, end_color=color_estado, fill_type="solid")
         ws_all.cell(row=row, column=6).font = Font(bold=True, color="FFFFFF")
         
         # Colorear días si está retrasada
-        if orden.estado not in ['entregado', 'cancelado'] and orden.dias_habiles_en_servicio > 15:
+        if retrasada:
             ws_all.cell(row=row, column=9).fill = PatternFill(start_color="dc3545", end_color="dc3545", fill_type="solid")
             ws_all.cell(row=row, column=9).font = Font(bold=True, color="FFFFFF")
         
         # Resaltar fila completa si es candidato RHITSO (morado claro)
-        if orden.es_candidato_rhitso:
+        if fila['es_candidato_rhitso']:
             rhitso_color = "ede9fe"  # Morado claro (igual que en dashboard)
             for col in range(1, 18):  # Columnas 1-17
-                cell = ws_all.cell(row=row, column=col)
                 # Solo aplicar si la celda no tiene ya un color especial (estado en col 6, días en col 9)
-                es_celda_estado = (col == 6)
-                es_celda_retrasada = (col == 9 and orden.estado not in ['entregado', 'cancelado'] and orden.dias_habiles_en_servicio > 15)
-                if not es_celda_estado and not es_celda_retrasada:
-                    cell.fill = PatternFill(start_color=rhitso_color, end_color=rhitso_color, fill_type="solid")
+                if col != 6 and not (col == 9 and retrasada):
+                    ws_all.cell(row=row, column=col).fill = PatternFill(start_color=rhitso_color, end_color=rhitso_color, fill_type="solid")
         
         row += 1
     
@@ -1452,3 +953,30 @@ def exportar_excel_dashboard_oow_fl(request):
     return response
 
 
+def _escribir_fila_orden_responsable(ws, row, fila):
+    """
+    Columnas 1-14 de una orden en la hoja individual de un responsable.
+
+    Args:
+        ws: hoja de openpyxl.
+        row (int): renglón donde se escribe.
+        fila (dict): fila de MarcoOOWFL.filas().
+
+    Efectos secundarios:
+        Escribe valores en la hoja (los colores los aplica quien llama).
+    """
+    ultima_act = fila['ultima_actualizacion']
+    ws.cell(row=row, column=1).value = fila['orden_cliente']
+    ws.cell(row=row, column=2).value = fila['numero_serie'] if fila['numero_serie'] else 'N/A'
+    ws.cell(row=row, column=3).value = fila['tipo_equipo']
+    ws.cell(row=row, column=4).value = fila['marca']
+    ws.cell(row=row, column=5).value = fila['modelo'][:30] if fila['modelo'] else 'N/A'
+    ws.cell(row=row, column=6).value = fila['estado_display']
+    ws.cell(row=row, column=7).value = fila['dias_habiles']
+    ws.cell(row=row, column=8).value = fila['dias_sin_actualizacion']
+    ws.cell(row=row, column=9).value = fila['tipo_orden']
+    ws.cell(row=row, column=10).value = f"${fila['monto']:,.2f}" if fila['monto'] > 0 else 'N/A'
+    ws.cell(row=row, column=11).value = fila['sucursal']
+    ws.cell(row=row, column=12).value = fila['fecha_ingreso'].strftime('%d/%m/%Y')
+    ws.cell(row=row, column=13).value = ultima_act.strftime('%d/%m/%Y') if ultima_act else 'N/A'
+    ws.cell(row=row, column=14).value = fila['cotizacion']
@@ -7,25 +7,24 @@ NO incluye gestión RHITSO por orden (eso está en views_rhitso.py, Fase 7).
 
 import openpyxl
 from django.contrib.auth.decorators import login_required
-from django.db.models import Prefetch
 from django.http import HttpResponse
 from django.shortcuts import render
+from django.urls import reverse
 from django.utils import timezone
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
 
 from .decorators import permission_required_with_message
-from .models import (
-    EstadoRHITSO,
-    IncidenciaRHITSO,
-    OrdenServicio,
-    SeguimientoRHITSO,
+from .services.excel_streaming import (
+    ContadorProgreso,
+    LibroStreaming,
+    sin_progreso,
 )
-from .utils_rhitso import (
-    calcular_dias_en_estatus,
-    calcular_dias_habiles,
-    obtener_color_por_dias_rhitso,
-    obtener_estado_proceso_rhitso,
+from .services.exportaciones_excel import (
+    EXPORT_MAX_FILAS_SINCRONO,
+    parametros_desde_request,
+    responder_encolada,
+    respuesta_xlsx,
 )
 
 
@@ -45,6 +44,7 @@ def dashboard_rhitso(request):
     Returns:
         HttpResponse con el dashboard renderizado
     """
+    from .services.proyeccion_rhitso import obtener_proyeccion_rhitso
     from .utils_rhitso_analytics import obtener_embudo_rhitso
 
     # Filtros compartidos con el reporte de análisis (GET params)
@@ -52,241 +52,57 @@ def dashboard_rhitso(request):
     fecha_fin = request.GET.get('fecha_fin', '')
     sucursal_id = request.GET.get('sucursal', '') or None
 
+    # =======================================================================
+    # PASO 1: FILAS DE CANDIDATOS RHITSO (PROYECCIÓN COMPARTIDA)
+    # =======================================================================
+
+    # EXPLICACIÓN: Las filas (días hábiles, último comentario, incidencias,
+    # owner, banderas del embudo) las arma services/proyeccion_rhitso.py con
+    # una consulta anotada y quedan en caché; los Excel usan las mismas.
+    proyeccion = obtener_proyeccion_rhitso(
+        fecha_inicio or None, fecha_fin or None, sucursal_id,
+    )
+    filas = proyeccion['filas']
+
     embudo = obtener_embudo_rhitso(
         fecha_inicio=fecha_inicio or None,
         fecha_fin=fecha_fin or None,
         sucursal_id=sucursal_id,
+        proyeccion=proyeccion,
     )
 
-    # =======================================================================
-    # PASO 1: CONSULTA OPTIMIZADA DE CANDIDATOS RHITSO
-    # =======================================================================
-
-    # Esto evita el "N+1 problem" (hacer una consulta por cada relación)
-    candidatos_rhitso = OrdenServicio.objects.filter(
-        es_candidato_rhitso=True,
-        id__in=embudo['candidatos_qs'].values_list('id', flat=True),
-    ).select_related(
-        'detalle_equipo',              # Información del equipo
-        'sucursal',                    # Sucursal de la orden
-        'tecnico_asignado_actual',     # Técnico asignado
-        'responsable_seguimiento'      # Responsable del seguimiento
-    ).prefetch_related(
-
-        # para relaciones many-to-many o reverse foreign keys
-        Prefetch(
-            'seguimientos_rhitso',
-            queryset=SeguimientoRHITSO.objects.select_related('estado', 'usuario_actualizacion').order_by('-fecha_actualizacion'),
-            to_attr='seguimientos_ordenados'
-        ),
-        Prefetch(
-            'incidencias_rhitso',
-            queryset=IncidenciaRHITSO.objects.filter(estado__in=['ABIERTA', 'EN_REVISION']),
-            to_attr='incidencias_abiertas'
-        ),
-        Prefetch(
-            'incidencias_rhitso',
-            queryset=IncidenciaRHITSO.objects.filter(estado='RESUELTA'),
-            to_attr='incidencias_resueltas_lista'
-        ),
-    ).order_by('-fecha_ingreso')
-    
     # =======================================================================
     # PASO 2: CALCULAR ESTADÍSTICAS GENERALES
     # =======================================================================
-    
-    # EXPLICACIÓN: Count() es una función agregada que cuenta registros
-    # Usamos Q() para condiciones complejas (OR, AND, NOT)
-    total_candidatos = candidatos_rhitso.count()
-    total_enviados = candidatos_rhitso.filter(fecha_envio_rhitso__isnull=False).count()
-    total_con_diagnostico = candidatos_rhitso.exclude(detalle_equipo__diagnostico_sic='').count()
-    
-    # Contar incidencias abiertas (en todas las órdenes)
-    total_incidencias_abiertas = IncidenciaRHITSO.objects.filter(
-        orden__in=candidatos_rhitso,
-        estado__in=['ABIERTA', 'EN_REVISION']
-    ).count()
-    
+
+    # EXPLICACIÓN: Se cuentan sobre las filas ya armadas (sin COUNT por métrica)
+    total_candidatos = len(filas)
+    total_enviados = sum(1 for fila in filas if fila['fecha_envio_rhitso'])
+    # Igual que exclude(detalle_equipo__diagnostico_sic=''): sin detalle también cuenta
+    total_con_diagnostico = sum(1 for fila in filas if fila['diagnostico_sic'] != '')
+    total_incidencias_abiertas = sum(fila['incidencias_abiertas'] for fila in filas)
+
     # =======================================================================
     # PASO 3: CALCULAR ESTADÍSTICAS POR SUCURSAL
     # =======================================================================
-    
+
     # EXPLICACIÓN: Contamos cuántas órdenes hay en cada sucursal
     # Estas son las 3 sucursales principales según el sistema PHP
     stats_sucursal = {
-        'satelite': candidatos_rhitso.filter(sucursal__nombre__icontains='Satelite').count(),
-        'drop': candidatos_rhitso.filter(sucursal__nombre__icontains='Drop').count(),
-        'mis': candidatos_rhitso.filter(sucursal__nombre__icontains='MIS').count(),
+        clave: sum(1 for fila in filas if texto in fila['sucursal'].lower())
+        for clave, texto in (('satelite', 'satelite'), ('drop', 'drop'), ('mis', 'mis'))
     }
-    
+
     # =======================================================================
-    # PASO 4: PREPARAR DATOS DETALLADOS DE CADA ORDEN
+    # PASO 4: SEPARAR ÓRDENES POR CATEGORÍA
     # =======================================================================
-    
-    # EXPLICACIÓN: Estados que indican órdenes "excluidas" del proceso activo
-    estados_excluidos = ['CERRADO', 'USUARIO NO ACEPTA ENVIO A RHITSO']
-    estados_pendientes = ['PENDIENTE DE CONFIRMAR ENVIO A RHITSO']
-    
-    # Listas para separar órdenes por categoría
-    activos = []
-    pendientes = []
-    excluidos = []
-    
-    # Iterar sobre cada orden para preparar sus datos
-    for orden in candidatos_rhitso:
-        # ===================================================================
-        # 4.1: INFORMACIÓN BÁSICA
-        # ===================================================================
-        detalle = orden.detalle_equipo
-        
-        # Estado RHITSO actual (campo de texto simple)
-        estado_rhitso_nombre = orden.estado_rhitso if orden.estado_rhitso else 'Pendiente'
-        estado_rhitso_display = estado_rhitso_nombre
-        
-        # Buscar owner del estado (si existe en catálogo)
-        try:
-            estado_obj = EstadoRHITSO.objects.get(estado=estado_rhitso_nombre)
-            owner_actual = estado_obj.owner
-        except EstadoRHITSO.DoesNotExist:
-            owner_actual = ''
-        
-        # ===================================================================
-        # 4.2: CALCULAR DÍAS HÁBILES
-        # ===================================================================
-        
-        # Días hábiles en SIC (tiempo total del proceso desde ingreso hasta completar)
-        # EXPLICACIÓN: Este cálculo representa el tiempo TOTAL de la orden, incluyendo
-        # todo el ciclo: diagnóstico SIC + envío a RHITSO + recepción de RHITSO
-        if orden.fecha_recepcion_rhitso:
-            # Si ya regresó de RHITSO, contar desde ingreso hasta recepción (proceso completado)
-            dias_habiles_sic = calcular_dias_habiles(
-                orden.fecha_ingreso,
-                orden.fecha_recepcion_rhitso
-            )
-        else:
-            # Si no ha regresado (o nunca se envió), contar hasta hoy
-            dias_habiles_sic = calcular_dias_habiles(orden.fecha_ingreso)
-        
-        # Días hábiles en RHITSO (si aplica)
-        dias_habiles_rhitso = 0
-        if orden.fecha_envio_rhitso:
-            if orden.fecha_recepcion_rhitso:
-                # Ya regresó de RHITSO
-                dias_habiles_rhitso = calcular_dias_habiles(
-                    orden.fecha_envio_rhitso,
-                    orden.fecha_recepcion_rhitso
-                )
-            else:
-                # Todavía en RHITSO
-                dias_habiles_rhitso = calcular_dias_habiles(
-                    orden.fecha_envio_rhitso
-                )
-        
-        # ===================================================================
-        # 4.3: CALCULAR DÍAS SIN ACTUALIZACIÓN
-        # ===================================================================
-        
-        # EXPLICACIÓN: Buscamos el último comentario de usuario (no del sistema)
-        ultimo_seguimiento_usuario = None
-        if hasattr(orden, 'seguimientos_ordenados') and orden.seguimientos_ordenados:
-            # Buscar el último seguimiento que NO sea automático
-            for seg in orden.seguimientos_ordenados:
-                if not seg.es_cambio_automatico:
-                    ultimo_seguimiento_usuario = seg
-                    break
-        
-        if ultimo_seguimiento_usuario:
-            dias_sin_actualizar = calcular_dias_en_estatus(
-                ultimo_seguimiento_usuario.fecha_actualizacion
-            )
-            fecha_ultimo_comentario = ultimo_seguimiento_usuario.fecha_actualizacion
-            ultimo_comentario = ultimo_seguimiento_usuario.observaciones
-        else:
-            # Si no hay seguimientos, contar desde fecha de ingreso
-            dias_sin_actualizar = calcular_dias_en_estatus(orden.fecha_ingreso)
-            fecha_ultimo_comentario = None
-            ultimo_comentario = ''
-        
-        # ===================================================================
-        # 4.4: CONTAR INCIDENCIAS
-        # ===================================================================
-        
-        # EXPLICACIÓN: Usamos los prefetch que definimos arriba
-        incidencias_abiertas_count = len(orden.incidencias_abiertas) if hasattr(orden, 'incidencias_abiertas') else 0
-        incidencias_resueltas_count = len(orden.incidencias_resueltas_lista) if hasattr(orden, 'incidencias_resueltas_lista') else 0
-        total_incidencias = incidencias_abiertas_count + incidencias_resueltas_count
-        
-        # ===================================================================
-        # 4.5: DETERMINAR ESTADO DEL PROCESO
-        # ===================================================================
-        
-        estado_proceso = obtener_estado_proceso_rhitso(orden)
-        
-        # ===================================================================
-        # 4.6: DETERMINAR COLOR SEGÚN DÍAS EN RHITSO
-        # ===================================================================
-        
-        color_badge_dias = obtener_color_por_dias_rhitso(dias_habiles_rhitso)
-        
-        # ===================================================================
-        # 4.7: CONSTRUIR DICCIONARIO CON TODA LA INFORMACIÓN
-        # ===================================================================
-        
-        orden_data = {
-            # Información básica
-            'id': orden.id,
-            'numero_orden_interno': orden.numero_orden_interno,
-            'fecha_ingreso': orden.fecha_ingreso,
-            'estado_orden': orden.get_estado_display(),
-            
-            # Información del equipo
-            'servicio': detalle.falla_principal if detalle else 'Sin observaciones',
-            'numero_serie': detalle.numero_serie if detalle else 'N/A',
-            'marca': detalle.marca if detalle else 'N/A',
-            'modelo': detalle.modelo if detalle else 'N/A',
-            'orden_cliente': detalle.orden_cliente if detalle else 'N/A',
-            
-            # Sucursal
-            'sucursal': orden.sucursal.nombre if orden.sucursal else 'N/A',
-            
-            # Estado RHITSO
-            'estado_rhitso_nombre': estado_rhitso_nombre,
-            'estado_rhitso_display': estado_rhitso_display,
-            'owner_actual': owner_actual,
-            
-            # Incidencias
-            'incidencias_abiertas': incidencias_abiertas_count,
-            'incidencias_resueltas': incidencias_resueltas_count,
-            'total_incidencias': total_incidencias,
-            
-            # Fechas y tiempos
-            'fecha_envio_rhitso': orden.fecha_envio_rhitso,
-            'dias_habiles_sic': dias_habiles_sic,
-            'dias_habiles_rhitso': dias_habiles_rhitso,
-            'dias_sin_actualizar': dias_sin_actualizar,
-            'fecha_ultimo_comentario': fecha_ultimo_comentario,
-            'ultimo_comentario': ultimo_comentario,
-            
-            # Estado del proceso
-            'estado_proceso': estado_proceso,
-            'color_badge_dias': color_badge_dias,
-            
-            # Diagnóstico
-            'tiene_diagnostico': bool(detalle and detalle.diagnostico_sic),
-        }
-        
-        # ===================================================================
-        # 4.8: CLASIFICAR ORDEN EN CATEGORÍA CORRESPONDIENTE
-        # ===================================================================
-        
-        # EXPLICACIÓN: Separamos las órdenes según su estado RHITSO
-        if estado_rhitso_nombre in estados_excluidos:
-            excluidos.append(orden_data)
-        elif estado_rhitso_nombre in estados_pendientes:
-            pendientes.append(orden_data)
-        else:
-            activos.append(orden_data)
-    
+
+    # EXPLICACIÓN: Cada fila ya trae su categoría (activos / pendientes /
+    # excluidos) según su estado RHITSO.
+    activos = [fila for fila in filas if fila['categoria'] == 'activos']
+    pendientes = [fila for fila in filas if fila['categoria'] == 'pendientes']
+    excluidos = [fila for fila in filas if fila['categoria'] == 'excluidos']
+
     # =======================================================================
     # PASO 5: OBTENER LISTA DE ESTADOS RHITSO PARA FILTROS
     # =======================================================================
@@ -330,8 +146,8 @@ def dashboard_rhitso(request):
         'estados_pendientes': estados_pendientes_lista,
         'estados_excluidos': estados_excluidos_lista,
         
-        # Información adicional
-        'fecha_actualizacion': timezone.now(),
+        # Información adicional (momento en que se armaron las filas)
+        'fecha_actualizacion': proyeccion['generada'],
 
         # Embudo de conversión RHITSO
         'embudo': embudo,
@@ -347,359 +163,194 @@ def dashboard_rhitso(request):
 # EXPORTACIÓN EXCEL RHITSO CON OPENPYXL
 # =============================================================================
 
+# Encabezados del reporte de candidatos (17 columnas).
+HEADERS_EXCEL_RHITSO = [
+    'Servicio Cliente',
+    'N° Serie',
+    'Marca',
+    'Modelo',
+    'Fecha Ingreso a SIC',
+    'Sucursal',
+    'Estado General',
+    'Estado RHITSO',
+    'Owner',
+    'Incidencias',
+    'Fecha Envío RHITSO',
+    'Días Hábiles SIC',
+    'Días Hábiles RHITSO',
+    'Días en estatus',
+    'Estado Proceso',
+    'Fecha Último Comentario',
+    'Comentario'
+]
+
+# Anchos óptimos para cada columna (en caracteres)
+ANCHOS_EXCEL_RHITSO = [20, 15, 15, 15, 18, 15, 18, 25, 15, 12, 18, 18, 18, 15, 20, 20, 50]
+
+# Filtros GET del dashboard que entiende el export (también viajan a Celery).
+FILTROS_EXCEL_RHITSO = ('fecha_inicio', 'fecha_fin', 'sucursal')
+
+
+def _filtros_export_rhitso(parametros):
+    """
+    Filtros del export como argumentos de la proyección RHITSO.
+
+    Args:
+        parametros: dict con fecha_inicio, fecha_fin y sucursal (strings).
+
+    Returns:
+        tuple (fecha_inicio, fecha_fin, sucursal_id); vacíos → None.
+    """
+    return (
+        parametros.get('fecha_inicio') or None,
+        parametros.get('fecha_fin') or None,
+        parametros.get('sucursal') or None,
+    )
+
+
+def _fila_excel_rhitso(fila):
+    """
+    Los 17 valores del Excel para una fila de la proyección RHITSO.
+
+    Args:
+        fila: dict de services.proyeccion_rhitso (días, owner e incidencias
+            ya calculados).
+
+    Returns:
+        list con los valores en el orden de HEADERS_EXCEL_RHITSO.
+    """
+    fecha_ultimo_comentario = fila['fecha_ultimo_comentario']
+    return [
+        fila['orden_cliente'] if fila['tiene_detalle'] else 'Sin orden',
+        fila['numero_serie'],
+        fila['marca'],
+        fila['modelo'],
+        fila['fecha_ingreso'].strftime('%d/%m/%Y') if fila['fecha_ingreso'] else '',
+        fila['sucursal'],
+        fila['estado_orden'],
+        fila['estado_rhitso_nombre'],
+        fila['owner_actual'],
+        f"{fila['incidencias_abiertas']}/{fila['total_incidencias']}",
+        fila['fecha_envio_rhitso'].strftime('%d/%m/%Y') if fila['fecha_envio_rhitso'] else 'No enviado',
+        fila['dias_habiles_sic'],
+        fila['dias_habiles_rhitso'],
+        fila['dias_sin_actualizar'],
+        fila['estado_proceso'],
+        fecha_ultimo_comentario.strftime('%d/%m/%Y %H:%M') if fecha_ultimo_comentario else 'Sin comentario',
+        fila['ultimo_comentario'] or 'Sin comentario',
+    ]
+
+
+def _color_fila_rhitso(estado_proceso, dias_sin_actualizar):
+    """
+    Color de fondo de la fila según estado del proceso y urgencia.
+
+    Returns:
+        str | None: hexadecimal sin '#', o None si la fila va sin color.
+    """
+    # Rojo si tiene más de 5 días sin actualizar (URGENTE) gana sobre todo.
+    if dias_sin_actualizar > 5:
+        return 'F8D7DA'
+    return {
+        'Completado': 'D4EDDA',   # Verde claro
+        'En RHITSO': 'FFF3CD',    # Amarillo claro
+        'Solo en SIC': 'E2E3E5',  # Gris claro
+    }.get(estado_proceso)
+
+
+def exportar_candidatos_rhitso(parametros, progreso=sin_progreso):
+    """
+    Arma el Excel de candidatos RHITSO (Activos / Pendientes / Excluidos).
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    - Las órdenes se recorren por bloques (``iterator``) y cada fila se guarda
+      como una lista de 17 valores; el nombre de hoja lleva el conteo, así que
+      clasificamos antes de escribir.
+    - El libro es write-only: estilos con nombre (uno por color de fila) en
+      lugar de crear Font/PatternFill en cada celda.
+
+    Args:
+        parametros: filtros GET del dashboard (fecha_inicio, fecha_fin, sucursal).
+        progreso: callback ``(procesadas, total)`` (Celery).
+
+    Returns:
+        tuple (nombre_archivo, LibroStreaming). Siempre hay libro (hojas
+        vacías si no hay candidatos), igual que el export original.
+    """
+    from .services.proyeccion_rhitso import obtener_proyeccion_rhitso
+
+    # Mismas filas que el dashboard (caché compartido por filtros)
+    filas_proyeccion = obtener_proyeccion_rhitso(*_filtros_export_rhitso(parametros))['filas']
+    contador = ContadorProgreso(len(filas_proyeccion) * 2, progreso)
+
+    categorias = {'activos': [], 'pendientes': [], 'excluidos': []}
+    for fila in filas_proyeccion:
+        categorias[fila['categoria']].append(
+            (_fila_excel_rhitso(fila), fila['estado_proceso'], fila['dias_sin_actualizar'])
+        )
+        contador.avanzar()
+    activos, pendientes, excluidos = (
+        categorias['activos'], categorias['pendientes'], categorias['excluidos'],
+    )
+
+    libro = LibroStreaming()
+    columna_comentario = len(HEADERS_EXCEL_RHITSO)
+    for titulo, filas in (
+        (f"Activos ({len(activos)})", activos),
+        (f"Pendientes ({len(pendientes)})", pendientes),
+        (f"Excluidos ({len(excluidos)})", excluidos),
+    ):
+        hoja = libro.hoja(titulo, anchos_fijos=ANCHOS_EXCEL_RHITSO)
+        # Congelar primera fila: los encabezados quedan visibles al hacer scroll.
+        hoja.congelar('A2')
+        hoja.fila(HEADERS_EXCEL_RHITSO, estilo='encabezado_corporativo')
+        for valores, estado_proceso, dias_sin_actualizar in filas:
+            color = _color_fila_rhitso(estado_proceso, dias_sin_actualizar)
+            sufijo = f'@{color}' if color else ''
+            hoja.fila(
+                valores,
+                estilo=f'celda_compacta{sufijo}',
+                estilos={columna_comentario: f'celda_compacta_comentario{sufijo}'},
+            )
+            contador.avanzar()
+        # Auto-filtro: permite al usuario filtrar datos directamente en Excel
+        hoja.autofiltro(columna_comentario)
+
+    contador.terminar()
+    nombre_archivo = f'Reporte_RHITSO_{timezone.now().strftime("%Y%m%d_%H%M")}.xlsx'
+    return nombre_archivo, libro
+
+
 @login_required
 @permission_required_with_message('servicio_tecnico.view_ordenservicio')
 def exportar_excel_rhitso(request):
     """
     Genera y descarga un reporte Excel profesional de candidatos RHITSO.
 
+    EXPLICACIÓN: Si hay más de ``EXPORT_MAX_FILAS_SINCRONO`` candidatos el
+    reporte se genera en Celery y la campanita avisa con el enlace.
+
     Args:
         request: HttpRequest object
-    
+
     Returns:
-        HttpResponse con archivo Excel para descarga
+        HttpResponse con archivo Excel para descarga, o redirect al dashboard
+        si el reporte se encoló.
     """
-    # =========================================================================
-    # PASO 1: PREPARAR DATOS (REUTILIZAR LÓGICA DEL DASHBOARD)
-    # =========================================================================
-    
-    # EXPLICACIÓN: Reutilizamos la misma consulta optimizada del dashboard
+    parametros = parametros_desde_request(request, FILTROS_EXCEL_RHITSO)
+
     from .utils_rhitso_analytics import obtener_queryset_candidatos
 
-    fecha_inicio = request.GET.get('fecha_inicio', '') or None
-    fecha_fin = request.GET.get('fecha_fin', '') or None
-    sucursal_id = request.GET.get('sucursal', '') or None
+    total = obtener_queryset_candidatos(*_filtros_export_rhitso(parametros)).count()
+    if total > EXPORT_MAX_FILAS_SINCRONO:
+        destino = reverse('servicio_tecnico:dashboard_rhitso')
+        return responder_encolada(
+            request, 'candidatos_rhitso', parametros,
+            f'{destino}?{request.GET.urlencode()}',
+        )
 
-    candidatos_rhitso = obtener_queryset_candidatos(
-        fecha_inicio, fecha_fin, sucursal_id
-    ).select_related(
-        'detalle_equipo',
-        'sucursal',
-        'tecnico_asignado_actual',
-        'responsable_seguimiento'
-    ).prefetch_related(
-        Prefetch(
-            'seguimientos_rhitso',
-            queryset=SeguimientoRHITSO.objects.select_related('estado', 'usuario_actualizacion').order_by('-fecha_actualizacion'),
-            to_attr='seguimientos_ordenados'
-        ),
-        Prefetch(
-            'incidencias_rhitso',
-            queryset=IncidenciaRHITSO.objects.filter(estado__in=['ABIERTA', 'EN_REVISION']),
-            to_attr='incidencias_abiertas'
-        ),
-        Prefetch(
-            'incidencias_rhitso',
-            queryset=IncidenciaRHITSO.objects.filter(estado='RESUELTA'),
-            to_attr='incidencias_resueltas_lista'
-        ),
-    ).order_by('-fecha_ingreso')
-    
-    # Estados para clasificación
-    estados_excluidos = ['CERRADO', 'USUARIO NO ACEPTA ENVIO A RHITSO']
-    estados_pendientes = ['PENDIENTE DE CONFIRMAR ENVIO A RHITSO']
-    
-    # Listas para separar órdenes por categoría
-    activos = []
-    pendientes = []
-    excluidos = []
-    
-    # Procesar cada orden
-    for orden in candidatos_rhitso:
-        detalle = orden.detalle_equipo
-        
-        # Estado RHITSO actual
-        estado_rhitso_nombre = orden.estado_rhitso if orden.estado_rhitso else 'Pendiente'
-        estado_rhitso_display = estado_rhitso_nombre
-        
-        # Buscar owner del estado
-        try:
-            estado_obj = EstadoRHITSO.objects.get(estado=estado_rhitso_nombre)
-            owner_actual = estado_obj.owner
-        except EstadoRHITSO.DoesNotExist:
-            owner_actual = ''
-        
-        # Calcular días hábiles en SIC (tiempo total del proceso)
-        if orden.fecha_recepcion_rhitso:
-            dias_habiles_sic = calcular_dias_habiles(orden.fecha_ingreso, orden.fecha_recepcion_rhitso)
-        else:
-            dias_habiles_sic = calcular_dias_habiles(orden.fecha_ingreso)
-        
-        # Calcular días hábiles en RHITSO
-        dias_habiles_rhitso = 0
-        if orden.fecha_envio_rhitso:
-            if orden.fecha_recepcion_rhitso:
-                dias_habiles_rhitso = calcular_dias_habiles(orden.fecha_envio_rhitso, orden.fecha_recepcion_rhitso)
-            else:
-                dias_habiles_rhitso = calcular_dias_habiles(orden.fecha_envio_rhitso)
-        
-        # Calcular días sin actualización
-        ultimo_seguimiento_usuario = None
-        if hasattr(orden, 'seguimientos_ordenados') and orden.seguimientos_ordenados:
-            for seg in orden.seguimientos_ordenados:
-                if not seg.es_cambio_automatico:
-                    ultimo_seguimiento_usuario = seg
-                    break
-        
-        if ultimo_seguimiento_usuario:
-            dias_sin_actualizar = calcular_dias_en_estatus(ultimo_seguimiento_usuario.fecha_actualizacion)
-            fecha_ultimo_comentario = ultimo_seguimiento_usuario.fecha_actualizacion
-            ultimo_comentario = ultimo_seguimiento_usuario.observaciones
-        else:
-            dias_sin_actualizar = calcular_dias_en_estatus(orden.fecha_ingreso)
-            fecha_ultimo_comentario = None
-            ultimo_comentario = ''
-        
-        # Contar incidencias
-        incidencias_abiertas_count = len(orden.incidencias_abiertas) if hasattr(orden, 'incidencias_abiertas') else 0
-        incidencias_resueltas_count = len(orden.incidencias_resueltas_lista) if hasattr(orden, 'incidencias_resueltas_lista') else 0
-        total_incidencias = incidencias_abiertas_count + incidencias_resueltas_count
-        
-        # Determinar estado del proceso
-        estado_proceso = obtener_estado_proceso_rhitso(orden)
-        
-        # Construir diccionario con toda la información
-        orden_data = {
-            'orden_cliente': detalle.orden_cliente if detalle else 'Sin orden',
-            'numero_serie': detalle.numero_serie if detalle else 'N/A',
-            'marca': detalle.marca if detalle else 'N/A',
-            'modelo': detalle.modelo if detalle else 'N/A',
-            'fecha_ingreso': orden.fecha_ingreso,
-            'sucursal': orden.sucursal.nombre if orden.sucursal else 'N/A',
-            'estado_orden': orden.get_estado_display(),
-            'estado_rhitso_display': estado_rhitso_display,
-            'owner_actual': owner_actual,
-            'total_incidencias': f"{incidencias_abiertas_count}/{total_incidencias}",
-            'fecha_envio_rhitso': orden.fecha_envio_rhitso,
-            'dias_habiles_sic': dias_habiles_sic,
-            'dias_habiles_rhitso': dias_habiles_rhitso,
-            'dias_sin_actualizar': dias_sin_actualizar,
-            'estado_proceso': estado_proceso,
-            'fecha_ultimo_comentario': fecha_ultimo_comentario,
-            'ultimo_comentario': ultimo_comentario if ultimo_comentario else 'Sin comentario',
-        }
-        
-        # Clasificar orden en categoría correspondiente
-        if estado_rhitso_nombre in estados_excluidos:
-            excluidos.append(orden_data)
-        elif estado_rhitso_nombre in estados_pendientes:
-            pendientes.append(orden_data)
-        else:
-            activos.append(orden_data)
-    
-    # =========================================================================
-    # PASO 2: CREAR WORKBOOK DE EXCEL
-    # =========================================================================
-    
-    # EXPLICACIÓN: Workbook es el archivo Excel completo
-    wb = openpyxl.Workbook()
-    
-    # Eliminar la hoja por defecto
-    if 'Sheet' in wb.sheetnames:
-        del wb['Sheet']
-    
-    # =========================================================================
-    # PASO 3: DEFINIR ESTILOS PROFESIONALES (COMO INVENTARIO)
-    # =========================================================================
-    
-    # EXPLICACIÓN: Definimos estilos reutilizables para mantener consistencia
-    
-    # Fuente para encabezados: Blanco, negrita, tamaño 11
-    header_font = Font(
-        name='Calibri',
-        bold=True,
-        color="FFFFFF",
-        size=11
-    )
-    
-    # Relleno azul para encabezados (#366092 es el azul corporativo)
-    header_fill = PatternFill(
-        start_color="366092",
-        end_color="366092",
-        fill_type="solid"
-    )
-    
-    # Alineación centrada para encabezados
-    header_alignment = Alignment(
-        horizontal='center',
-        vertical='center',
-        wrap_text=True
-    )
-    
-    # Bordes para todas las celdas
-    thin_border = Border(
-        left=Side(style='thin', color='000000'),
-        right=Side(style='thin', color='000000'),
-        top=Side(style='thin', color='000000'),
-        bottom=Side(style='thin', color='000000')
-    )
-    
-    # Fuente normal para datos
-    normal_font = Font(name='Calibri', size=10)
-    
-    # Alineación para comentarios (con wrap text)
-    wrap_alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-        wrap_text=True
-    )
-    
-    # =========================================================================
-    # PASO 4: DEFINIR ENCABEZADOS (17 COLUMNAS)
-    # =========================================================================
-    
-    # EXPLICACIÓN: Estos son los títulos de las columnas que aparecerán en Excel
-    headers = [
-        'Servicio Cliente',
-        'N° Serie',
-        'Marca',
-        'Modelo',
-        'Fecha Ingreso a SIC',
-        'Sucursal',
-        'Estado General',
-        'Estado RHITSO',
-        'Owner',
-        'Incidencias',
-        'Fecha Envío RHITSO',
-        'Días Hábiles SIC',
-        'Días Hábiles RHITSO',
-        'Días en estatus',
-        'Estado Proceso',
-        'Fecha Último Comentario',
-        'Comentario'
-    ]
-    
-    # Anchos óptimos para cada columna (en caracteres)
-    column_widths = [20, 15, 15, 15, 18, 15, 18, 25, 15, 12, 18, 18, 18, 15, 20, 20, 50]
-    
-    # =========================================================================
-    # PASO 5: FUNCIÓN AUXILIAR PARA CREAR HOJAS FORMATEADAS
-    # =========================================================================
-    
-    def crear_hoja_excel(nombre_hoja, datos_lista, color_categoria):
-        """
-        Crea una hoja de Excel con formato profesional.
-
-        """
-        # Crear la hoja
-        ws = wb.create_sheet(nombre_hoja)
-        
-        # PASO 5.1: Agregar encabezados con estilo
-        for col_num, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-        
-        # PASO 5.2: Configurar anchos de columna
-        for col_num, width in enumerate(column_widths, start=1):
-            column_letter = get_column_letter(col_num)
-            ws.column_dimensions[column_letter].width = width
-        
-        # PASO 5.3: Congelar primera fila (encabezados)
-        # EXPLICACIÓN: freeze_panes permite que los encabezados permanezcan
-        # visibles cuando el usuario hace scroll hacia abajo
-        ws.freeze_panes = 'A2'
-        
-        # PASO 5.4: Agregar datos fila por fila
-        for row_num, orden in enumerate(datos_lista, start=2):
-            # Preparar los valores de cada columna
-            valores = [
-                orden['orden_cliente'],
-                orden['numero_serie'],
-                orden['marca'],
-                orden['modelo'],
-                orden['fecha_ingreso'].strftime('%d/%m/%Y') if orden['fecha_ingreso'] else '',
-                orden['sucursal'],
-                orden['estado_orden'],
-                orden['estado_rhitso_display'],
-                orden['owner_actual'],
-                orden['total_incidencias'],
-                orden['fecha_envio_rhitso'].strftime('%d/%m/%Y') if orden['fecha_envio_rhitso'] else 'No enviado',
-                orden['dias_habiles_sic'],
-                orden['dias_habiles_rhitso'],
-                orden['dias_sin_actualizar'],
-                orden['estado_proceso'],
-                orden['fecha_ultimo_comentario'].strftime('%d/%m/%Y %H:%M') if orden['fecha_ultimo_comentario'] else 'Sin comentario',
-                orden['ultimo_comentario']
-            ]
-            
-            # Escribir valores en las celdas
-            for col_num, valor in enumerate(valores, start=1):
-                cell = ws.cell(row=row_num, column=col_num, value=valor)
-                cell.font = normal_font
-                cell.border = thin_border
-                
-                # Aplicar wrap text en la columna de comentarios (última columna)
-                if col_num == len(headers):  # Columna de comentario
-                    cell.alignment = wrap_alignment
-                else:
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-            
-            # PASO 5.5: Colorear fila según estado y urgencia
-            # EXPLICACIÓN: Aplicamos colores para identificar visualmente el estado
-            
-            estado_proc = orden['estado_proceso']
-            dias_sin_act = orden['dias_sin_actualizar']
-            
-            # Determinar color de fila
-            row_fill = None
-            
-            if estado_proc == 'Completado':
-                # Verde claro para órdenes completadas
-                row_fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-            elif estado_proc == 'En RHITSO':
-                # Amarillo claro para órdenes en RHITSO
-                row_fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-            elif estado_proc == 'Solo en SIC':
-                # Gris claro para órdenes solo en SIC
-                row_fill = PatternFill(start_color="E2E3E5", end_color="E2E3E5", fill_type="solid")
-            
-            # Sobrescribir con rojo si tiene más de 5 días sin actualizar (URGENTE)
-            if dias_sin_act > 5:
-                row_fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-            
-            # Aplicar el color a toda la fila
-            if row_fill:
-                for col_num in range(1, len(headers) + 1):
-                    ws.cell(row=row_num, column=col_num).fill = row_fill
-        
-        # PASO 5.6: Agregar auto-filtro a los encabezados
-        # EXPLICACIÓN: Permite al usuario filtrar datos directamente en Excel
-        ws.auto_filter.ref = ws.dimensions
-    
-    # =========================================================================
-    # PASO 6: CREAR LAS 3 HOJAS
-    # =========================================================================
-    
-    # Hoja 1: Activos
-    crear_hoja_excel(f"Activos ({len(activos)})", activos, "FFF3CD")
-    
-    # Hoja 2: Pendientes
-    crear_hoja_excel(f"Pendientes ({len(pendientes)})", pendientes, "E2E3E5")
-    
-    # Hoja 3: Excluidos
-    crear_hoja_excel(f"Excluidos ({len(excluidos)})", excluidos, "F8D7DA")
-    
-    # =========================================================================
-    # PASO 7: PREPARAR RESPUESTA HTTP PARA DESCARGA
-    # =========================================================================
-    
-    # EXPLICACIÓN: Creamos una respuesta HTTP con el tipo de contenido adecuado
-    # para que el navegador sepa que es un archivo Excel y lo descargue
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    
-    # Definir el nombre del archivo con fecha y hora actual
-    nombre_archivo = f'Reporte_RHITSO_{timezone.now().strftime("%Y%m%d_%H%M")}.xlsx'
-    response['Content-Disposition'] = f'attachment; filename="{nombre_archivo}"'
-    
-    # Guardar el workbook en la respuesta
-    wb.save(response)
-    
-    return response
+    nombre_archivo, libro = exportar_candidatos_rhitso(parametros)
+    return respuesta_xlsx(libro, nombre_archivo)
 
 
 @login_required
@@ -717,18 +368,21 @@ def exportar_analisis_rhitso(request):
     Returns:
         HttpResponse con archivo Excel (.xlsx) para descarga.
     """
+    from .services.proyeccion_rhitso import obtener_proyeccion_rhitso
     from .utils_rhitso_analytics import (
+        fila_detalle_desde_proyeccion,
         obtener_embudo_rhitso,
         obtener_filas_hoja_rechazos_y_no_aptos,
-        obtener_detalle_todas_candidatas,
     )
 
     fecha_inicio = request.GET.get('fecha_inicio', '') or None
     fecha_fin = request.GET.get('fecha_fin', '') or None
     sucursal_id = request.GET.get('sucursal', '') or None
 
-    embudo = obtener_embudo_rhitso(fecha_inicio, fecha_fin, sucursal_id)
-    detalle_candidatos = obtener_detalle_todas_candidatas(fecha_inicio, fecha_fin, sucursal_id)
+    # Embudo y detalle salen de la misma proyección (banderas históricas anotadas)
+    proyeccion = obtener_proyeccion_rhitso(fecha_inicio, fecha_fin, sucursal_id)
+    embudo = obtener_embudo_rhitso(fecha_inicio, fecha_fin, sucursal_id, proyeccion=proyeccion)
+    detalle_candidatos = [fila_detalle_desde_proyeccion(fila) for fila in proyeccion['filas']]
     comentarios_rechazo = obtener_filas_hoja_rechazos_y_no_aptos(embudo['candidatos_qs'])
 
     wb = openpyxl.Workbook()
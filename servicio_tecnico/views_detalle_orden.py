@@ -97,13 +97,13 @@ def detalle_orden(request, orden_id):
             'detalle_equipo',
             'orden_original',
             'incidencia_scorecard',
-        ).prefetch_related(
-            'imagenes',
-            'historial__usuario',
-            'historial__tecnico_anterior',
-            'historial__tecnico_nuevo',
-            'pagos__registrado_por',
+            'cotizacion',
+            'venta_mostrador',
         ),
+        # EXPLICACIÓN: sin prefetch_related. El context consulta imágenes,
+        # videos y pagos una vez cada uno con su propio orden/select_related
+        # (un prefetch aquí se ignoraría) y el historial solo se lee si su
+        # fragmento no está en caché.
         pk=orden_id,
     )
 
@@ -234,6 +234,22 @@ def handle_subir_imagenes(request, orden, empleado_actual):
                 if mensaje_estado:
                     mensaje += f' {mensaje_estado}.'
 
+                # Datos para los modales de egreso / rewind (solo al subir egreso).
+                # EXPLICACIÓN: los "ya enviado" son flags de la orden y los tipos
+                # de foto salen de una sola consulta.
+                egreso_correo_ya_enviado = rewind_ya_enviado = False
+                tiene_4_tipos_fotos = tiene_3_tipos_fotos = False
+                if tipo_imagen == 'egreso':
+                    from servicio_tecnico.services.detalle_orden_context import (
+                        tipos_fotos_para_rewind,
+                    )
+                    egreso_correo_ya_enviado = orden.correo_imagenes_egreso_enviado
+                    rewind_ya_enviado = orden.correo_rewind_enviado
+                    tiene_4_tipos_fotos, tiene_3_tipos_fotos = tipos_fotos_para_rewind(
+                        orden,
+                        set(orden.imagenes.values_list('tipo', flat=True).distinct()),
+                    )
+
                 # Retornar respuesta JSON exitosa
                 return JsonResponse({
                     'success': True,
@@ -244,32 +260,13 @@ def handle_subir_imagenes(request, orden, empleado_actual):
                     'cambio_estado': cambio_realizado,
                     # Flag para el frontend: indica si ya existe un envío previo de
                     # imágenes de egreso por correo (para mostrar u ocultar el modal)
-                    'egreso_correo_ya_enviado': (
-                        HistorialOrden.objects
-                        .filter(orden=orden, tipo_evento='email')
-                        .filter(comentario__icontains='imágenes de egreso')
-                        .exists()
-                    ) if tipo_imagen == 'egreso' else False,
-                     # Si la orden ya tiene los 4 tipos de fotos (para disparar modal rewind)
-                    'tiene_4_tipos_fotos': (
-                        {'ingreso', 'diagnostico', 'reparacion', 'egreso'}.issubset(
-                            set(orden.imagenes.values_list('tipo', flat=True).distinct())
-                        )
-                    ) if tipo_imagen == 'egreso' else False,
+                    'egreso_correo_ya_enviado': egreso_correo_ya_enviado,
+                    # Si la orden ya tiene los 4 tipos de fotos (para disparar modal rewind)
+                    'tiene_4_tipos_fotos': tiene_4_tipos_fotos,
                     # Venta mostrador: solo requiere 3 tipos (sin diagnóstico)
-                    'tiene_3_tipos_fotos': (
-                        orden.tipo_servicio == 'venta_mostrador' and
-                        {'ingreso', 'reparacion', 'egreso'}.issubset(
-                            set(orden.imagenes.values_list('tipo', flat=True).distinct())
-                        )
-                    ) if tipo_imagen == 'egreso' else False,
+                    'tiene_3_tipos_fotos': tiene_3_tipos_fotos,
                     # Si el video rewind ya fue enviado al cliente
-                    'rewind_ya_enviado': (
-                        orden.historial.filter(
-                            tipo_evento='email',
-                            comentario__icontains='video rewind'
-                        ).exists()
-                    ) if tipo_imagen == 'egreso' else False,
+                    'rewind_ya_enviado': rewind_ya_enviado,
                     'tipo_imagen': tipo_imagen,
                 })
             else:
@@ -316,7 +313,6 @@ def handle_subir_video(request, orden, empleado_actual):
         HttpResponse si el flujo terminó (redirect/JSON); None para
         continuar al render GET (form inválido con messages).
     """
-    import uuid as _uuid_video
     logger.info(f"🎥 Video recibido para Orden {orden.numero_orden_interno} — encolando en Celery")
 
     # Verificar que llegó el archivo
@@ -357,11 +353,7 @@ def handle_subir_video(request, orden, empleado_actual):
     # MEDIA_ROOT es un directorio persistente al que el worker Celery tiene acceso.
     # La tarea Celery es responsable de borrar el archivo en su bloque finally.
     try:
-        extension_entrada = os.path.splitext(video_file.name)[1].lower() or '.webm'
-        video_tmp_dir = os.path.join(settings.MEDIA_ROOT, 'video_tmp')
-        os.makedirs(video_tmp_dir, exist_ok=True)
-        nombre_tmp = f"sigmavideo_{_uuid_video.uuid4().hex[:8]}{extension_entrada}"
-        archivo_tmp_path = os.path.join(video_tmp_dir, nombre_tmp)
+        archivo_tmp_path = ruta_video_tmp(video_file.name)
         with open(archivo_tmp_path, 'wb') as tmp_in:
             for chunk in video_file.chunks():
                 tmp_in.write(chunk)
@@ -372,6 +364,45 @@ def handle_subir_video(request, orden, empleado_actual):
             'error': 'Error al recibir el archivo de video. Intenta de nuevo.',
         }, status=500)
 
+    return encolar_video_evidencia(
+        request, orden, empleado_actual,
+        archivo_tmp_path=archivo_tmp_path,
+        nombre_original=video_file.name,
+        tamano_bytes=video_file.size,
+        tipo=tipo_video,
+        descripcion=descripcion,
+        orientacion_video=orientacion_video,
+    )
+
+
+def ruta_video_tmp(nombre_original):
+    """
+    Ruta nueva en MEDIA_ROOT/video_tmp/ para un video crudo (crea la carpeta).
+
+    Args:
+        nombre_original (str): nombre del archivo subido (se conserva la extensión
+            para que FFmpeg detecte el contenedor).
+    """
+    import uuid as _uuid_video
+
+    extension_entrada = os.path.splitext(nombre_original)[1].lower() or '.webm'
+    video_tmp_dir = os.path.join(settings.MEDIA_ROOT, 'video_tmp')
+    os.makedirs(video_tmp_dir, exist_ok=True)
+    return os.path.join(video_tmp_dir, f"sigmavideo_{_uuid_video.uuid4().hex[:8]}{extension_entrada}")
+
+
+def encolar_video_evidencia(request, orden, empleado_actual, *, archivo_tmp_path, nombre_original,
+                            tamano_bytes, tipo, descripcion, orientacion_video, sha256_esperado=None):
+    """
+    Despacha comprimir_video_evidencia_task para un video crudo ya en disco.
+
+    La usan la subida clásica (handle_subir_video) y la reanudable
+    (views_subidas_reanudables, que manda sha256_esperado para que la tarea
+    verifique el archivo). Si no se puede encolar, borra el archivo.
+
+    Returns:
+        JsonResponse: éxito (task_queued) o error.
+    """
     # ── Despachar la tarea Celery ─────────────────────────────────────────
     # EXPLICACIÓN: sin perfil Empleado no hay PK para la tarea; evitar AttributeError.
     if empleado_actual is None:
@@ -389,19 +420,20 @@ def handle_subir_video(request, orden, empleado_actual):
         from config.paises_config import get_pais_actual
         comprimir_video_evidencia_task.delay(
             archivo_tmp_path=archivo_tmp_path,
-            nombre_original=video_file.name,
-            tamano_bytes=video_file.size,
+            nombre_original=nombre_original,
+            tamano_bytes=tamano_bytes,
             orden_id=orden.pk,
-            tipo=tipo_video,
+            tipo=tipo,
             descripcion=descripcion,
             empleado_id=empleado_actual.pk,
             usuario_id=request.user.pk,
             orientacion_video=orientacion_video,
             db_alias=get_pais_actual()['db_alias'],
+            sha256_esperado=sha256_esperado,
         )
         logger.info(
             f"✅ Tarea Celery encolada para video de Orden {orden.numero_orden_interno} "
-            f"({round(video_file.size / (1024*1024), 1)} MB, tipo={tipo_video})"
+            f"({round(tamano_bytes / (1024*1024), 1)} MB, tipo={tipo})"
         )
     except Exception as e:
         # Si Celery no está disponible (Redis caído, etc.), limpiar el tmp
@@ -426,4 +458,3 @@ def handle_subir_video(request, orden, empleado_actual):
             'Recibirás una notificación cuando esté listo.'
         ),
     })
-
@@ -9,17 +9,37 @@ import logging
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Count, Q
+from django.db.models import Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
+from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.http import require_http_methods
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
 
+from config.rendimiento import presupuesto_consultas
 from inventario.models import Empleado, Sucursal
 
 from .decorators import permission_required_with_message
+from .services.excel_streaming import (
+    ContadorProgreso,
+    LibroStreaming,
+    iterar_queryset,
+    sin_progreso,
+)
+from .services.exportaciones_excel import (
+    EXPORT_MAX_FILAS_SINCRONO,
+    parametros_desde_request,
+    responder_encolada,
+    respuesta_xlsx,
+)
+from .services.paneles_feedback import (
+    COMENTARIOS_DASHBOARD,
+    FILTROS_SATISFACCION,
+    filtrar_feedback,
+    hay_filtros,
+    obtener_paneles,
+    respuesta_paneles,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,46 +51,34 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
+# Filtros GET comunes del panel (también viajan a Celery en el export).
+FILTROS_ENCUESTAS = FILTROS_SATISFACCION
+
+
 def _filtrar_encuestas_satisfaccion(request):
     """
     Helper: construye queryset base de FeedbackCliente tipo 'satisfaccion'
     aplicando los filtros GET comunes (fecha, responsable, sucursal, tipo_orden).
     Retorna el queryset con annotate de fecha_expiracion.
     """
-    from .models import FeedbackCliente
-    from django.db.models import F, ExpressionWrapper, DateTimeField
-    from datetime import timedelta
-
-    qs = FeedbackCliente.objects.filter(tipo='satisfaccion').select_related(
-        'orden__responsable_seguimiento',
-        'orden__sucursal',
-        'orden__detalle_equipo',
-    )
+    return _encuestas_por_filtros(request.GET)
 
-    fecha_desde = request.GET.get('fecha_desde')
-    fecha_hasta = request.GET.get('fecha_hasta')
-    responsable_id = request.GET.get('responsable_id')
-    sucursal_id = request.GET.get('sucursal_id')
-    tipo_orden = request.GET.get('tipo_orden')
 
-    if fecha_desde:
-        qs = qs.filter(fecha_creacion__date__gte=fecha_desde)
-    if fecha_hasta:
-        qs = qs.filter(fecha_creacion__date__lte=fecha_hasta)
-    if responsable_id:
-        qs = qs.filter(orden__responsable_seguimiento_id=responsable_id)
-    if sucursal_id:
-        qs = qs.filter(orden__sucursal_id=sucursal_id)
-    if tipo_orden and tipo_orden in ('diagnostico', 'venta_mostrador'):
-        qs = qs.filter(orden__tipo_servicio=tipo_orden)
-
-    qs = qs.annotate(
-        fecha_expiracion=ExpressionWrapper(
-            F('fecha_creacion') + timedelta(days=7),
-            output_field=DateTimeField()
-        )
-    )
-    return qs
+def _encuestas_por_filtros(filtros):
+    """
+    Mismo queryset que ``_filtrar_encuestas_satisfaccion`` pero a partir de
+    un dict (o QueryDict) de filtros, para poder usarlo fuera del request.
+    """
+    return filtrar_feedback('satisfaccion', filtros)
+
+
+def _paneles_encuestas(request):
+    """
+    Paneles del dashboard (KPIs, tendencia, responsables, NPS y comentarios)
+    con los filtros GET, calculados en una pasada y cacheados por filtros.
+    Ver services/paneles_feedback.py.
+    """
+    return obtener_paneles('satisfaccion', request.GET, _filtrar_encuestas_satisfaccion(request))
 
 
 
@@ -100,63 +108,33 @@ def dashboard_encuestas(request):
 @login_required
 @permission_required_with_message('servicio_tecnico.view_dashboard_gerencial')
 @require_http_methods(['GET'])
-def api_encuestas_kpis(request):
-    """
-    API JSON: KPIs globales del dashboard de encuestas.
+@presupuesto_consultas(5)
+def api_encuestas_paneles(request):
     """
-    from django.db.models import Avg
+    API JSON: todos los paneles del dashboard en una sola respuesta.
 
-    now = timezone.now()
-    qs = _filtrar_encuestas_satisfaccion(request)
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El dashboard hace UNA petición (más la de la lista paginada) en lugar
+    de una por gráfico. Lleva ETag: si los datos no cambiaron desde la
+    última carga, se responde 304 y el navegador reutiliza su copia.
 
-    total_enviadas = qs.filter(correo_enviado=True).count()
-    total_respondidas = qs.filter(utilizado=True).count()
-    total_pendientes = qs.filter(
-        utilizado=False, correo_enviado=True, fecha_expiracion__gte=now
-    ).count()
-    total_expiradas = qs.filter(
-        utilizado=False, fecha_expiracion__lt=now
-    ).count()
-
-    tasa_respuesta = round(
-        (total_respondidas / total_enviadas * 100) if total_enviadas > 0 else 0, 1
-    )
+    Returns:
+        JSON con kpis, tendencia, responsables, distribucion_nps y
+        comentarios (los mismos que las APIs individuales).
+    """
+    return respuesta_paneles(request, 'satisfaccion', _paneles_encuestas(request))
 
-    respondidas_qs = qs.filter(utilizado=True)
-    avgs = respondidas_qs.aggregate(
-        nps_promedio=Avg('nps'),
-        calificacion_promedio=Avg('calificacion_general'),
-        calificacion_atencion_promedio=Avg('calificacion_atencion'),
-        calificacion_tiempo_promedio=Avg('calificacion_tiempo'),
-    )
 
-    total_con_recomendacion = respondidas_qs.filter(recomienda__isnull=False).count()
-    total_recomiendan = respondidas_qs.filter(recomienda=True).count()
-    tasa_recomendacion = round(
-        (total_recomiendan / total_con_recomendacion * 100) if total_con_recomendacion > 0 else 0, 1
-    )
 
-    # NPS Score = % promotores (9-10) - % detractores (0-6)
-    respondidas_con_nps = respondidas_qs.filter(nps__isnull=False).count()
-    promotores = respondidas_qs.filter(nps__gte=9).count()
-    detractores = respondidas_qs.filter(nps__lte=6).count()
-    nps_score = round(
-        ((promotores - detractores) / respondidas_con_nps * 100) if respondidas_con_nps > 0 else 0, 1
-    )
 
-    return JsonResponse({
-        'total_enviadas': total_enviadas,
-        'total_respondidas': total_respondidas,
-        'total_pendientes': total_pendientes,
-        'total_expiradas': total_expiradas,
-        'tasa_respuesta': tasa_respuesta,
-        'nps_promedio': round(avgs['nps_promedio'] or 0, 1),
-        'calificacion_promedio': round(avgs['calificacion_promedio'] or 0, 1),
-        'calificacion_atencion_promedio': round(avgs['calificacion_atencion_promedio'] or 0, 1),
-        'calificacion_tiempo_promedio': round(avgs['calificacion_tiempo_promedio'] or 0, 1),
-        'tasa_recomendacion': tasa_recomendacion,
-        'nps_score': nps_score,
-    })
+@login_required
+@permission_required_with_message('servicio_tecnico.view_dashboard_gerencial')
+@require_http_methods(['GET'])
+def api_encuestas_kpis(request):
+    """
+    API JSON: KPIs globales del dashboard de encuestas.
+    """
+    return JsonResponse(_paneles_encuestas(request)['kpis'])
 
 
 
@@ -168,50 +146,7 @@ def api_encuestas_tendencia(request):
     """
     API JSON: tendencia temporal de métricas (agrupado por semana).
     """
-    from django.db.models import Avg
-    from django.db.models.functions import TruncWeek
-
-    qs = _filtrar_encuestas_satisfaccion(request).filter(correo_enviado=True)
-
-    datos_por_semana = (
-        qs.annotate(semana=TruncWeek('fecha_creacion'))
-        .values('semana')
-        .annotate(
-            total_enviadas=Count('id'),
-            total_respondidas=Count('id', filter=Q(utilizado=True)),
-            calificacion_promedio=Avg('calificacion_general', filter=Q(utilizado=True)),
-            nps_promedio=Avg('nps', filter=Q(utilizado=True)),
-        )
-        .order_by('semana')
-    )
-
-    labels = []
-    datasets = {
-        'calificacion_promedio': [],
-        'nps_promedio': [],
-        'tasa_respuesta': [],
-        'total_enviadas': [],
-        'total_respondidas': [],
-    }
-
-    for row in datos_por_semana:
-        semana = row['semana']
-        labels.append(semana.strftime('%d/%m/%Y'))
-        datasets['total_enviadas'].append(row['total_enviadas'])
-        datasets['total_respondidas'].append(row['total_respondidas'])
-        datasets['calificacion_promedio'].append(
-            round(row['calificacion_promedio'] or 0, 1)
-        )
-        datasets['nps_promedio'].append(
-            round(row['nps_promedio'] or 0, 1)
-        )
-        tasa = round(
-            (row['total_respondidas'] / row['total_enviadas'] * 100)
-            if row['total_enviadas'] > 0 else 0, 1
-        )
-        datasets['tasa_respuesta'].append(tasa)
-
-    return JsonResponse({'labels': labels, 'datasets': datasets})
+    return JsonResponse(_paneles_encuestas(request)['tendencia'])
 
 
 
@@ -223,52 +158,7 @@ def api_encuestas_por_responsable(request):
     """
     API JSON: métricas agrupadas por responsable de seguimiento.
     """
-    from django.db.models import Avg
-
-    qs = _filtrar_encuestas_satisfaccion(request).filter(correo_enviado=True)
-
-    datos = (
-        qs.values(
-            'orden__responsable_seguimiento__id',
-            'orden__responsable_seguimiento__nombre_completo',
-        )
-        .annotate(
-            total_enviadas=Count('id'),
-            total_respondidas=Count('id', filter=Q(utilizado=True)),
-            calificacion_promedio=Avg('calificacion_general', filter=Q(utilizado=True)),
-            nps_promedio=Avg('nps', filter=Q(utilizado=True)),
-            total_recomiendan=Count('id', filter=Q(utilizado=True, recomienda=True)),
-            total_con_recomendacion=Count('id', filter=Q(utilizado=True, recomienda__isnull=False)),
-            promotores=Count('id', filter=Q(utilizado=True, nps__gte=9)),
-            detractores=Count('id', filter=Q(utilizado=True, nps__lte=6)),
-            respondidas_con_nps=Count('id', filter=Q(utilizado=True, nps__isnull=False)),
-        )
-        .order_by('-calificacion_promedio')
-    )
-
-    responsables = []
-    for row in datos:
-        nombre = row['orden__responsable_seguimiento__nombre_completo'] or ''
-        tasa_rec = round(
-            (row['total_recomiendan'] / row['total_con_recomendacion'] * 100)
-            if row['total_con_recomendacion'] > 0 else 0, 1
-        )
-        nps_s = round(
-            ((row['promotores'] - row['detractores']) / row['respondidas_con_nps'] * 100)
-            if row['respondidas_con_nps'] > 0 else 0, 1
-        )
-        responsables.append({
-            'id': row['orden__responsable_seguimiento__id'],
-            'nombre': nombre,
-            'total_enviadas': row['total_enviadas'],
-            'total_respondidas': row['total_respondidas'],
-            'calificacion_promedio': round(row['calificacion_promedio'] or 0, 1),
-            'nps_promedio': round(row['nps_promedio'] or 0, 1),
-            'tasa_recomendacion': tasa_rec,
-            'nps_score': nps_s,
-        })
-
-    return JsonResponse({'responsables': responsables})
+    return JsonResponse({'responsables': _paneles_encuestas(request)['responsables']})
 
 
 
@@ -280,30 +170,7 @@ def api_encuestas_distribucion_nps(request):
     """
     API JSON: distribución NPS (Promotores 9-10 / Pasivos 7-8 / Detractores 0-6).
     """
-    qs = _filtrar_encuestas_satisfaccion(request).filter(
-        utilizado=True, nps__isnull=False
-    )
-
-    datos = qs.aggregate(
-        promotores=Count('id', filter=Q(nps__gte=9)),
-        pasivos=Count('id', filter=Q(nps__gte=7, nps__lte=8)),
-        detractores=Count('id', filter=Q(nps__lte=6)),
-        total=Count('id'),
-    )
-
-    total = datos['total'] or 0
-    nps_score = round(
-        ((datos['promotores'] - datos['detractores']) / total * 100)
-        if total > 0 else 0, 1
-    )
-
-    return JsonResponse({
-        'promotores': datos['promotores'],
-        'pasivos': datos['pasivos'],
-        'detractores': datos['detractores'],
-        'total': total,
-        'nps_score': nps_score,
-    })
+    return JsonResponse(_paneles_encuestas(request)['distribucion_nps'])
 
 
 
@@ -404,124 +271,67 @@ def api_encuestas_comentarios(request):
     """
     API JSON: últimos comentarios de clientes con calificación.
     """
-    from config.paises_config import fecha_local_pais, get_pais_actual
-    pais = get_pais_actual()
-    qs = _filtrar_encuestas_satisfaccion(request).filter(
-        utilizado=True,
-    ).exclude(
-        comentario_cliente=''
-    ).order_by('-fecha_respuesta')[:10]
-
-    comentarios = []
-    for fb in qs:
-        comentarios.append({
-            'orden_numero': (
-                fb.orden.detalle_equipo.orden_cliente
-                if hasattr(fb.orden, 'detalle_equipo') and fb.orden.detalle_equipo.orden_cliente
-                else fb.orden.numero_orden_interno
-            ),
-            'orden_id': fb.orden.id,
-            'responsable': str(fb.orden.responsable_seguimiento) if fb.orden.responsable_seguimiento else '',
-            'calificacion': fb.calificacion_general,
-            'nps': fb.nps,
-            'recomienda': fb.recomienda,
-            'comentario': fb.comentario_cliente,
-            'fecha': fecha_local_pais(fb.fecha_respuesta, pais).strftime('%d/%m/%Y') if fb.fecha_respuesta else '',
-        })
+    return JsonResponse({'comentarios': _paneles_encuestas(request)['comentarios'][:COMENTARIOS_DASHBOARD]})
 
-    return JsonResponse({'comentarios': comentarios})
 
 
 
-
-@login_required
-@permission_required_with_message('servicio_tecnico.view_ordenservicio')
-def exportar_encuestas_excel(request):
-    """
-    Exporta las encuestas de satisfacción filtradas a un archivo Excel.
-    Genera 3 hojas: Resumen KPIs, Encuestas detalladas, Por Responsable.
+def exportar_encuestas_satisfaccion(parametros, progreso=sin_progreso):
     """
-    from openpyxl import Workbook
-    from django.db.models import Avg
+    Arma el Excel de encuestas (3 hojas: Resumen KPIs, Encuestas, Por Responsable).
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    - KPIs y "Por Responsable" salen de los mismos paneles que el dashboard
+      (services/paneles_feedback.py), así que el Excel muestra los mismos
+      números que la pantalla.
+    - Las encuestas se recorren con ``iterator`` y se escriben con el motor
+      write-only, así que la memoria no crece con el número de filas.
+
+    Args:
+        parametros: filtros GET del panel (ver ``FILTROS_ENCUESTAS``).
+        progreso: callback ``(procesadas, total)`` (Celery).
+
+    Returns:
+        tuple (nombre_archivo, LibroStreaming).
+    """
     now = timezone.now()
-    qs = _filtrar_encuestas_satisfaccion(request).filter(correo_enviado=True)
-
-    # Estilos
-    header_font = Font(bold=True, color='FFFFFF', size=11)
-    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
+    qs = _encuestas_por_filtros(parametros)
+    paneles = obtener_paneles('satisfaccion', parametros, qs)
+    kpis = paneles['kpis']
+    qs = qs.filter(correo_enviado=True)
 
-    wb = Workbook()
+    total_enviadas = kpis['total_enviadas']
+    contador = ContadorProgreso(total_enviadas, progreso)
 
-    # ── HOJA 1: Resumen KPIs ──────────────────────────────────────────
-    ws_resumen = wb.active
-    ws_resumen.title = 'Resumen KPIs'
-
-    total_enviadas = qs.count()
-    total_respondidas = qs.filter(utilizado=True).count()
-    total_pendientes = qs.filter(utilizado=False, fecha_expiracion__gte=now).count()
-    total_expiradas = qs.filter(utilizado=False, fecha_expiracion__lt=now).count()
-    tasa_respuesta = round((total_respondidas / total_enviadas * 100) if total_enviadas > 0 else 0, 1)
-
-    respondidas_qs = qs.filter(utilizado=True)
-    avgs = respondidas_qs.aggregate(
-        cal_prom=Avg('calificacion_general'),
-        nps_prom=Avg('nps'),
-        cal_atencion=Avg('calificacion_atencion'),
-        cal_tiempo=Avg('calificacion_tiempo'),
-    )
+    libro = LibroStreaming()
 
-    kpis = [
-        ('Métrica', 'Valor'),
+    # ── HOJA 1: Resumen KPIs ──────────────────────────────────────────
+    hoja_resumen = libro.hoja('Resumen KPIs', anchos_fijos=[35, 20])
+    hoja_resumen.fila(['Métrica', 'Valor'], estilo='encabezado_corporativo')
+    for metrica, valor in (
         ('Total Encuestas Enviadas', total_enviadas),
-        ('Total Respondidas', total_respondidas),
-        ('Total Pendientes', total_pendientes),
-        ('Total Expiradas', total_expiradas),
-        ('Tasa de Respuesta (%)', f'{tasa_respuesta}%'),
-        ('Calificación General Promedio', round(avgs['cal_prom'] or 0, 2)),
-        ('NPS Promedio', round(avgs['nps_prom'] or 0, 2)),
-        ('Calificación Atención Promedio', round(avgs['cal_atencion'] or 0, 2)),
-        ('Calificación Tiempo Promedio', round(avgs['cal_tiempo'] or 0, 2)),
-    ]
-
-    for row_idx, (metrica, valor) in enumerate(kpis, 1):
-        ws_resumen.cell(row=row_idx, column=1, value=metrica)
-        ws_resumen.cell(row=row_idx, column=2, value=valor)
-        if row_idx == 1:
-            for col in (1, 2):
-                cell = ws_resumen.cell(row=1, column=col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = thin_border
-        else:
-            for col in (1, 2):
-                ws_resumen.cell(row=row_idx, column=col).border = thin_border
-
-    ws_resumen.column_dimensions['A'].width = 35
-    ws_resumen.column_dimensions['B'].width = 20
+        ('Total Respondidas', kpis['total_respondidas']),
+        ('Total Pendientes', kpis['total_pendientes']),
+        ('Total Expiradas', kpis['total_expiradas']),
+        ('Tasa de Respuesta (%)', f"{kpis['tasa_respuesta']}%"),
+        ('Calificación General Promedio', kpis['calificacion_promedio']),
+        ('NPS Promedio', kpis['nps_promedio']),
+        ('Calificación Atención Promedio', kpis['calificacion_atencion_promedio']),
+        ('Calificación Tiempo Promedio', kpis['calificacion_tiempo_promedio']),
+    ):
+        hoja_resumen.fila([metrica, valor], estilo='celda')
 
     # ── HOJA 2: Encuestas Detalladas ──────────────────────────────────
-    ws_encuestas = wb.create_sheet('Encuestas')
     headers = [
         'Orden', 'Equipo', 'Email Cliente', 'Responsable', 'Sucursal',
         'Tipo Orden', 'Fecha Envío', 'Fecha Respuesta', 'Estado',
         'Calificación General', 'NPS', 'Recomienda',
         'Calificación Atención', 'Calificación Tiempo', 'Comentario'
     ]
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws_encuestas.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    for row_idx, fb in enumerate(qs.order_by('-fecha_creacion'), 2):
+    hoja_encuestas = libro.hoja('Encuestas', anchos_fijos=[18] * len(headers))
+    hoja_encuestas.fila(headers, estilo='encabezado_corporativo')
+
+    for fb in iterar_queryset(qs.order_by('-fecha_creacion')):
         orden = fb.orden
         detalle = getattr(orden, 'detalle_equipo', None)
 
@@ -532,7 +342,7 @@ def exportar_encuestas_excel(request):
         else:
             estado_str = 'Pendiente'
 
-        valores = [
+        hoja_encuestas.fila([
             detalle.orden_cliente if detalle and detalle.orden_cliente else orden.numero_orden_interno,
             f"{detalle.marca} {detalle.get_tipo_equipo_display()} {detalle.modelo}" if detalle else '',
             detalle.email_cliente if detalle else '',
@@ -548,76 +358,57 @@ def exportar_encuestas_excel(request):
             fb.calificacion_atencion or '',
             fb.calificacion_tiempo or '',
             fb.comentario_cliente,
-        ]
-        for col_idx, valor in enumerate(valores, 1):
-            cell = ws_encuestas.cell(row=row_idx, column=col_idx, value=valor)
-            cell.border = thin_border
-
-    for col_idx in range(1, len(headers) + 1):
-        ws_encuestas.column_dimensions[get_column_letter(col_idx)].width = 18
+        ], estilo='celda')
+        contador.avanzar()
 
     # ── HOJA 3: Por Responsable ───────────────────────────────────────
-    ws_resp = wb.create_sheet('Por Responsable')
     headers_resp = [
         'Responsable', 'Enviadas', 'Respondidas', 'Tasa Respuesta (%)',
         'Calificación Promedio', 'NPS Promedio', 'NPS Score', 'Tasa Recomendación (%)'
     ]
-    for col_idx, header in enumerate(headers_resp, 1):
-        cell = ws_resp.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    datos_resp = (
-        qs.values(
-            'orden__responsable_seguimiento__nombre_completo',
-        )
-        .annotate(
-            total_enviadas=Count('id'),
-            total_respondidas=Count('id', filter=Q(utilizado=True)),
-            calificacion_promedio=Avg('calificacion_general', filter=Q(utilizado=True)),
-            nps_promedio=Avg('nps', filter=Q(utilizado=True)),
-            promotores=Count('id', filter=Q(utilizado=True, nps__gte=9)),
-            detractores=Count('id', filter=Q(utilizado=True, nps__lte=6)),
-            resp_con_nps=Count('id', filter=Q(utilizado=True, nps__isnull=False)),
-            total_recomiendan=Count('id', filter=Q(utilizado=True, recomienda=True)),
-            total_con_rec=Count('id', filter=Q(utilizado=True, recomienda__isnull=False)),
+    hoja_resp = libro.hoja('Por Responsable', anchos_fijos=[22] * len(headers_resp))
+    hoja_resp.fila(headers_resp, estilo='encabezado_corporativo')
+
+    for resp in paneles['responsables']:
+        tasa_r = round(
+            (resp['total_respondidas'] / resp['total_enviadas'] * 100) if resp['total_enviadas'] > 0 else 0, 1
         )
-        .order_by('-calificacion_promedio')
-    )
+        hoja_resp.fila([
+            resp['nombre'],
+            resp['total_enviadas'],
+            resp['total_respondidas'],
+            f'{tasa_r}%',
+            resp['calificacion_promedio'],
+            resp['nps_promedio'],
+            resp['nps_score'],
+            f"{resp['tasa_recomendacion']}%",
+        ], estilo='celda')
 
-    for row_idx, row in enumerate(datos_resp, 2):
-        nombre = row['orden__responsable_seguimiento__nombre_completo'] or ''
-        tasa_r = round((row['total_respondidas'] / row['total_enviadas'] * 100) if row['total_enviadas'] > 0 else 0, 1)
-        nps_s = round(((row['promotores'] - row['detractores']) / row['resp_con_nps'] * 100) if row['resp_con_nps'] > 0 else 0, 1)
-        tasa_rec = round((row['total_recomiendan'] / row['total_con_rec'] * 100) if row['total_con_rec'] > 0 else 0, 1)
+    contador.terminar()
+    return f"Encuestas_Satisfaccion_{now.strftime('%Y%m%d')}.xlsx", libro
 
-        valores = [
-            nombre,
-            row['total_enviadas'],
-            row['total_respondidas'],
-            f'{tasa_r}%',
-            round(row['calificacion_promedio'] or 0, 2),
-            round(row['nps_promedio'] or 0, 2),
-            nps_s,
-            f'{tasa_rec}%',
-        ]
-        for col_idx, valor in enumerate(valores, 1):
-            cell = ws_resp.cell(row=row_idx, column=col_idx, value=valor)
-            cell.border = thin_border
-
-    for col_idx in range(1, len(headers_resp) + 1):
-        ws_resp.column_dimensions[get_column_letter(col_idx)].width = 22
-
-    # Generar respuesta
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    fecha_str = now.strftime('%Y%m%d')
-    response['Content-Disposition'] = f'attachment; filename=Encuestas_Satisfaccion_{fecha_str}.xlsx'
-    wb.save(response)
-    return response
+
+@login_required
+@permission_required_with_message('servicio_tecnico.view_ordenservicio')
+def exportar_encuestas_excel(request):
+    """
+    Exporta las encuestas de satisfacción filtradas a un archivo Excel.
+    Genera 3 hojas: Resumen KPIs, Encuestas detalladas, Por Responsable.
+    Con más de ``EXPORT_MAX_FILAS_SINCRONO`` encuestas se genera en Celery
+    y la campanita avisa con el enlace de descarga.
+    """
+    parametros = parametros_desde_request(request, FILTROS_ENCUESTAS)
+
+    total = obtener_paneles('satisfaccion', parametros)['kpis']['total_enviadas']
+    if total > EXPORT_MAX_FILAS_SINCRONO:
+        destino = reverse('servicio_tecnico:dashboard_encuestas')
+        return responder_encolada(
+            request, 'encuestas_satisfaccion', parametros,
+            f'{destino}?{request.GET.urlencode()}',
+        )
+
+    nombre_archivo, libro = exportar_encuestas_satisfaccion(parametros)
+    return respuesta_xlsx(libro, nombre_archivo)
 
 
 
@@ -629,10 +420,10 @@ def exportar_encuestas_pdf(request):
     Genera y descarga el Reporte Ejecutivo PDF del Panel de Encuestas.
 
     EXPLICACIÓN PARA PRINCIPIANTES:
-    Esta vista calcula todos los datos necesarios para el reporte ejecutivo
-    (KPIs, tendencia, distribución NPS, ranking por responsable y comentarios),
-    los empaqueta en un diccionario y llama al módulo pdf_encuestas.py para
-    generar el PDF con ReportLab + matplotlib.
+    Esta vista toma los paneles del dashboard (KPIs, tendencia, distribución
+    NPS, ranking por responsable y comentarios, ver
+    services/paneles_feedback.py), los empaqueta en un diccionario y llama
+    al módulo pdf_encuestas.py para generar el PDF con ReportLab + matplotlib.
 
     Comportamiento de comentarios:
       - Si hay filtros activos (fecha, responsable, sucursal o tipo_orden):
@@ -644,13 +435,9 @@ def exportar_encuestas_pdf(request):
     responsable_id, sucursal_id, tipo_orden) se aplican aquí para mantener
     coherencia entre lo que ve el usuario y lo que descarga en PDF.
     """
-    from django.db.models import Avg, Count, Q
-    from django.db.models.functions import TruncWeek
     from .pdf_encuestas import generar_pdf_reporte_encuestas
-    from config.paises_config import fecha_local_pais, get_pais_actual
 
-    pais = get_pais_actual()
-    now  = timezone.now()
+    now = timezone.now()
 
     # ---- 1. Queryset base con filtros ----
     qs = _filtrar_encuestas_satisfaccion(request)
@@ -662,183 +449,20 @@ def exportar_encuestas_pdf(request):
     sucursal_id    = request.GET.get('sucursal_id', '').strip()
     tipo_orden     = request.GET.get('tipo_orden', '').strip()
 
-    hay_filtros = any([fecha_desde, fecha_hasta, responsable_id, sucursal_id, tipo_orden])
-
-    # ---- 2. KPIs globales ----
-    total_enviadas    = qs.filter(correo_enviado=True).count()
-    total_respondidas = qs.filter(utilizado=True).count()
-    total_pendientes  = qs.filter(utilizado=False, correo_enviado=True,
-                                  fecha_expiracion__gte=now).count()
-    total_expiradas   = qs.filter(utilizado=False,
-                                  fecha_expiracion__lt=now).count()
-
-    tasa_respuesta = round(
-        (total_respondidas / total_enviadas * 100) if total_enviadas > 0 else 0, 1
-    )
-
-    respondidas_qs = qs.filter(utilizado=True)
-    avgs = respondidas_qs.aggregate(
-        nps_promedio=Avg('nps'),
-        calificacion_promedio=Avg('calificacion_general'),
-        calificacion_atencion_promedio=Avg('calificacion_atencion'),
-        calificacion_tiempo_promedio=Avg('calificacion_tiempo'),
-    )
-
-    total_con_recomendacion = respondidas_qs.filter(recomienda__isnull=False).count()
-    total_recomiendan       = respondidas_qs.filter(recomienda=True).count()
-    tasa_recomendacion = round(
-        (total_recomiendan / total_con_recomendacion * 100)
-        if total_con_recomendacion > 0 else 0, 1
-    )
-
-    # NPS Score = % Promotores (9-10) − % Detractores (0-6)
-    respondidas_con_nps = respondidas_qs.filter(nps__isnull=False).count()
-    promotores_kpi  = respondidas_qs.filter(nps__gte=9).count()
-    detractores_kpi = respondidas_qs.filter(nps__lte=6).count()
-    nps_score_kpi = round(
-        ((promotores_kpi - detractores_kpi) / respondidas_con_nps * 100)
-        if respondidas_con_nps > 0 else 0, 1
-    )
-
-    kpis = {
-        'total_enviadas': total_enviadas,
-        'total_respondidas': total_respondidas,
-        'total_pendientes': total_pendientes,
-        'total_expiradas': total_expiradas,
-        'tasa_respuesta': tasa_respuesta,
-        'nps_promedio': round(avgs['nps_promedio'] or 0, 1),
-        'calificacion_promedio': round(avgs['calificacion_promedio'] or 0, 1),
-        'calificacion_atencion_promedio': round(avgs['calificacion_atencion_promedio'] or 0, 1),
-        'calificacion_tiempo_promedio': round(avgs['calificacion_tiempo_promedio'] or 0, 1),
-        'tasa_recomendacion': tasa_recomendacion,
-        'nps_score': nps_score_kpi,
-    }
-
-    # ---- 3. Tendencia semanal ----
-    datos_tendencia = (
-        qs.filter(correo_enviado=True)
-        .annotate(semana=TruncWeek('fecha_creacion'))
-        .values('semana')
-        .annotate(
-            total_enviadas_s=Count('id'),
-            total_respondidas_s=Count('id', filter=Q(utilizado=True)),
-            calificacion_promedio_s=Avg('calificacion_general', filter=Q(utilizado=True)),
-        )
-        .order_by('semana')
-    )
-
-    labels_tend = []
-    enviadas_tend = []
-    respondidas_tend = []
-    calificacion_tend = []
-
-    for row in datos_tendencia:
-        labels_tend.append(row['semana'].strftime('%d/%m/%Y'))
-        enviadas_tend.append(row['total_enviadas_s'])
-        respondidas_tend.append(row['total_respondidas_s'])
-        calificacion_tend.append(round(row['calificacion_promedio_s'] or 0, 1))
-
-    tendencia = {
-        'labels': labels_tend,
-        'datasets': {
-            'total_enviadas': enviadas_tend,
-            'total_respondidas': respondidas_tend,
-            'calificacion_promedio': calificacion_tend,
-        },
-    }
-
-    # ---- 4. Distribución NPS ----
-    nps_agg = qs.filter(utilizado=True, nps__isnull=False).aggregate(
-        promotores=Count('id', filter=Q(nps__gte=9)),
-        pasivos=Count('id', filter=Q(nps__gte=7, nps__lte=8)),
-        detractores=Count('id', filter=Q(nps__lte=6)),
-        total=Count('id'),
-    )
-    nps_total = nps_agg['total'] or 0
-    nps_score_dist = round(
-        ((nps_agg['promotores'] - nps_agg['detractores']) / nps_total * 100)
-        if nps_total > 0 else 0, 1
-    )
-    nps_dist = {
-        'promotores': nps_agg['promotores'],
-        'pasivos': nps_agg['pasivos'],
-        'detractores': nps_agg['detractores'],
-        'total': nps_total,
-        'nps_score': nps_score_dist,
-    }
-
-    # ---- 5. Ranking por responsable ----
-    datos_resp = (
-        qs.filter(correo_enviado=True)
-        .values(
-            'orden__responsable_seguimiento__id',
-            'orden__responsable_seguimiento__nombre_completo',
-        )
-        .annotate(
-            total_enviadas_r=Count('id'),
-            total_respondidas_r=Count('id', filter=Q(utilizado=True)),
-            calificacion_promedio=Avg('calificacion_general', filter=Q(utilizado=True)),
-            nps_promedio=Avg('nps', filter=Q(utilizado=True)),
-            total_recomiendan=Count('id', filter=Q(utilizado=True, recomienda=True)),
-            total_con_recomendacion=Count('id', filter=Q(utilizado=True, recomienda__isnull=False)),
-            promotores=Count('id', filter=Q(utilizado=True, nps__gte=9)),
-            detractores=Count('id', filter=Q(utilizado=True, nps__lte=6)),
-            respondidas_con_nps=Count('id', filter=Q(utilizado=True, nps__isnull=False)),
-        )
-        .order_by('-calificacion_promedio')
-    )
+    hay_filtros_activos = hay_filtros('satisfaccion', request.GET)
 
-    responsables = []
-    for row in datos_resp:
-        nombre = row['orden__responsable_seguimiento__nombre_completo'] or '(Sin responsable)'
-        t_env  = row['total_enviadas_r']
-        t_resp = row['total_respondidas_r']
-        nps_s  = round(
-            ((row['promotores'] - row['detractores']) / row['respondidas_con_nps'] * 100)
-            if row['respondidas_con_nps'] > 0 else 0, 1
-        )
-        tasa_rec = round(
-            (row['total_recomiendan'] / row['total_con_recomendacion'] * 100)
-            if row['total_con_recomendacion'] > 0 else 0, 1
-        )
-        responsables.append({
-            'id': row['orden__responsable_seguimiento__id'],
-            'nombre': nombre,
-            'total_enviadas': t_env,
-            'total_respondidas': t_resp,
-            'calificacion_promedio': round(row['calificacion_promedio'] or 0, 1),
-            'nps_promedio': round(row['nps_promedio'] or 0, 1),
-            'tasa_recomendacion': tasa_rec,
-            'nps_score': nps_s,
-        })
+    # ---- 2-5. KPIs, tendencia, NPS y ranking: mismos paneles que el dashboard ----
+    paneles = obtener_paneles('satisfaccion', request.GET, qs)
+    responsables = [
+        dict(resp, nombre=resp['nombre'] or '(Sin responsable)')
+        for resp in paneles['responsables']
+    ]
 
     # ---- 6. Comentarios ----
     # Con filtros activos → todos; sin filtros → últimos 10
-    comentarios_qs = (
-        qs.filter(utilizado=True)
-        .exclude(comentario_cliente='')
-        .order_by('-fecha_respuesta')
-    )
-    if not hay_filtros:
-        comentarios_qs = comentarios_qs[:10]
-
-    comentarios = []
-    for fb in comentarios_qs:
-        comentarios.append({
-            'orden_numero': (
-                fb.orden.detalle_equipo.orden_cliente
-                if hasattr(fb.orden, 'detalle_equipo') and fb.orden.detalle_equipo.orden_cliente
-                else fb.orden.numero_orden_interno
-            ),
-            'orden_id': fb.orden.id,
-            'responsable': str(fb.orden.responsable_seguimiento) if fb.orden.responsable_seguimiento else '',
-            'calificacion': fb.calificacion_general,
-            'nps': fb.nps,
-            'recomienda': fb.recomienda,
-            'comentario': fb.comentario_cliente,
-            'fecha': fecha_local_pais(fb.fecha_respuesta, pais).strftime('%d/%m/%Y')
-                     if fb.fecha_respuesta else '',
-        })
+    comentarios = paneles['comentarios']
+    if not hay_filtros_activos:
+        comentarios = comentarios[:COMENTARIOS_DASHBOARD]
 
     # ---- 7. Descripción del período ----
     partes_periodo = []
@@ -865,7 +489,7 @@ def exportar_encuestas_pdf(request):
         from .models import AnalisisSentimientoEncuesta
 
         encuestas_para_hash = list(
-            respondidas_qs
+            qs.filter(utilizado=True)
             .order_by('fecha_respuesta')
             .values(
                 'calificacion_general',
@@ -895,13 +519,13 @@ def exportar_encuestas_pdf(request):
 
     # ---- 9. Empaquetar y generar PDF ----
     datos_pdf = {
-        'kpis': kpis,
-        'tendencia': tendencia,
-        'nps_dist': nps_dist,
+        'kpis': paneles['kpis'],
+        'tendencia': paneles['tendencia'],
+        'nps_dist': paneles['distribucion_nps'],
         'responsables': responsables,
         'comentarios': comentarios,
         'periodo': periodo,
-        'filtros_activos': hay_filtros,
+        'filtros_activos': hay_filtros_activos,
         'analisis_ia': analisis_ia,   # None si no hay análisis guardado
     }
 
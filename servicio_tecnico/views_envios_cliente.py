@@ -708,12 +708,8 @@ def obtener_destinatarios_egreso(request, orden_id):
                 ]
 
         # Verificar si ya se enviaron imágenes de egreso previamente
-        egreso_ya_enviado = (
-            HistorialOrden.objects
-            .filter(orden=orden, tipo_evento='email')
-            .filter(comentario__icontains='imágenes de egreso')
-            .exists()
-        )
+        # (flag que marca el signal de HistorialOrden al registrar el correo)
+        egreso_ya_enviado = orden.correo_imagenes_egreso_enviado
 
         # Contar imágenes de egreso disponibles
         imagenes_egreso_count = ImagenOrden.objects.filter(
@@ -14,22 +14,27 @@ EXPLICACIÓN PARA PRINCIPIANTES:
     para no hinchar views_dashboard_oow_fl.py.
 """
 
-from io import BytesIO
-
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
+from django.urls import reverse
 
 from config.constants import ESTADO_ORDEN_CHOICES
 from inventario.models import Empleado, Sucursal
 from servicio_tecnico.decorators import permission_required_with_message
 from servicio_tecnico.services.export_excel_garantia import (
+    FILTROS_EXPORT,
     construir_queryset_export,
     generar_workbook_base_garantia,
     nombre_archivo_base_garantia,
     queryset_base_garantia,
     texto_filtros_aplicados,
 )
+from servicio_tecnico.services.exportaciones_excel import (
+    EXPORT_MAX_FILAS_SINCRONO,
+    responder_encolada,
+    respuesta_xlsx,
+)
 
 
 def _filtros_desde_request(request: HttpRequest) -> dict[str, str]:
@@ -45,13 +50,7 @@ def _filtros_desde_request(request: HttpRequest) -> dict[str, str]:
     Efectos secundarios:
         Ninguno.
     """
-    return {
-        'responsable_id': request.GET.get('responsable_id', ''),
-        'fecha_desde': request.GET.get('fecha_desde', ''),
-        'fecha_hasta': request.GET.get('fecha_hasta', ''),
-        'estado': request.GET.get('estado', ''),
-        'sucursal_id': request.GET.get('sucursal_id', ''),
-    }
+    return {clave: request.GET.get(clave, '') for clave in FILTROS_EXPORT}
 
 
 @login_required
@@ -98,35 +97,35 @@ def exportar_excel_base_garantia(request: HttpRequest) -> HttpResponse:
     """
     Genera y descarga el Excel de órdenes en garantía.
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+        Hasta ``EXPORT_MAX_FILAS_SINCRONO`` órdenes el archivo se arma en el
+        request. Con más, se encola en Celery y la campanita avisa con el
+        enlace de descarga (así no se agota el timeout del servidor).
+
     Args:
         request: GET con los mismos filtros que la página.
 
     Returns:
-        Attachment .xlsx.
+        Attachment .xlsx, o redirect a la página de filtros si se encoló.
 
     Efectos secundarios:
-        Ninguno de escritura en BD; el archivo se arma en memoria.
+        Ninguno de escritura en BD; puede encolar una tarea Celery.
     """
     filtros = _filtros_desde_request(request)
     ordenes = construir_queryset_export(**filtros)
-    leyenda = texto_filtros_aplicados(**filtros)
 
-    workbook = generar_workbook_base_garantia(ordenes, leyenda)
+    if ordenes.count() > EXPORT_MAX_FILAS_SINCRONO:
+        destino = reverse('servicio_tecnico:exportar_base_garantia')
+        return responder_encolada(
+            request, 'base_garantia', filtros, f'{destino}?{request.GET.urlencode()}',
+        )
 
-    buffer = BytesIO()
-    workbook.save(buffer)
-    buffer.seek(0)
+    leyenda = texto_filtros_aplicados(**filtros)
+    libro = generar_workbook_base_garantia(ordenes, leyenda)
 
     nombre = nombre_archivo_base_garantia(
         responsable_id=filtros['responsable_id'],
         estado=filtros['estado'],
         sucursal_id=filtros['sucursal_id'],
     )
-    response = HttpResponse(
-        buffer.getvalue(),
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = f'attachment; filename="{nombre}"'
-    return response
+    return respuesta_xlsx(libro, nombre)
@@ -12,17 +12,23 @@ EXPLICACIÓN PARA PRINCIPIANTES:
     hinchar views_dashboard_cotizaciones.py (~3400 LOC).
 """
 
-from datetime import datetime
-from io import BytesIO
-
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
+from django.urls import reverse
 
 from servicio_tecnico.decorators import permission_required_with_message
+from servicio_tecnico.services.exportaciones_excel import (
+    EXPORT_MAX_FILAS_SINCRONO,
+    parametros_desde_request,
+    responder_encolada,
+    respuesta_xlsx,
+)
 from servicio_tecnico.services.productividad_tecnicos import (
-    generar_workbook_productividad_tecnicos,
+    PARAMETROS_EXPORT,
+    exportar_productividad_tecnicos as exportar_libro_productividad,
+    queryset_ordenes_finalizadas,
 )
 
 
@@ -37,46 +43,34 @@ def exportar_productividad_tecnicos(request: HttpRequest) -> HttpResponse:
             (fecha_inicio, fecha_fin, sucursal, tecnico, gama).
 
     Returns:
-        HttpResponse con attachment .xlsx, o redirect al dashboard si no hay datos.
+        HttpResponse con attachment .xlsx, o redirect al dashboard si no hay
+        datos o si el reporte se encoló en segundo plano.
 
     Efectos secundarios:
-        Solo lectura de BD; no encola tareas ni modifica registros.
+        Solo lectura de BD; con períodos grandes encola una tarea Celery.
     """
     # Mismos query params que dashboard_cotizaciones / otros exports.
-    fecha_inicio = request.GET.get('fecha_inicio') or None
-    fecha_fin = request.GET.get('fecha_fin') or None
-    sucursal_id = request.GET.get('sucursal') or None
-    tecnico_id = request.GET.get('tecnico') or None
-    gama = request.GET.get('gama') or None
+    parametros = parametros_desde_request(request, tuple(PARAMETROS_EXPORT))
 
-    workbook = generar_workbook_productividad_tecnicos(
-        fecha_inicio=fecha_inicio,
-        fecha_fin=fecha_fin,
-        sucursal_id=sucursal_id,
-        tecnico_id=tecnico_id,
-        gama=gama,
-    )
+    # El volumen lo marcan las órdenes finalizadas del período.
+    volumen = queryset_ordenes_finalizadas(**{
+        destino: parametros[origen] or None
+        for origen, destino in PARAMETROS_EXPORT.items()
+    }).count()
+    if volumen > EXPORT_MAX_FILAS_SINCRONO:
+        destino = reverse('servicio_tecnico:dashboard_cotizaciones')
+        return responder_encolada(
+            request, 'productividad_tecnicos', parametros,
+            f'{destino}?{request.GET.urlencode()}',
+        )
 
-    if workbook is None:
+    resultado = exportar_libro_productividad(parametros)
+    if resultado is None:
         messages.warning(
             request,
             'No hay datos de productividad de técnicos con los filtros aplicados.',
         )
         return redirect('servicio_tecnico:dashboard_cotizaciones')
 
-    # Serializar a memoria y devolver como descarga.
-    buffer = BytesIO()
-    workbook.save(buffer)
-    buffer.seek(0)
-
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-    nombre = f'Productividad_Tecnicos_{timestamp}.xlsx'
-
-    response = HttpResponse(
-        buffer.getvalue(),
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = f'attachment; filename="{nombre}"'
-    return response
+    nombre, libro = resultado
+    return respuesta_xlsx(libro, nombre)
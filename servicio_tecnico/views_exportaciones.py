@@ -0,0 +1,123 @@
+"""
+Vistas HTTP de exportaciones Excel en segundo plano (polling + descarga).
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+Estas vistas NO generan el .xlsx. Solo:
+1) Consultan AsyncResult para que el frontend muestre el avance
+2) Entregan el archivo terminado a partir del enlace firmado de la campanita
+
+El trabajo pesado está en tasks.py (generar_exportacion_excel_task) y en
+services/exportaciones_excel.py. urls.py usa views.<nombre> porque views.py
+reexporta estos nombres.
+"""
+
+import logging
+
+from celery.result import AsyncResult
+from django.contrib.auth.decorators import login_required
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, JsonResponse
+from django.views.decorators.http import require_http_methods
+
+from .services.exportaciones_excel import CONTENT_TYPE_XLSX, leer_token_descarga
+from .services.tareas_usuario import tarea_es_del_usuario
+
+logger = logging.getLogger(__name__)
+
+
+@login_required
+@require_http_methods(["GET"])
+def estado_exportacion_excel(request, task_id):
+    """
+    Polling del estado de una exportación Excel encolada.
+
+    Args:
+        task_id (str): ID de tarea Celery devuelto al encolar.
+
+    Returns:
+        JsonResponse con estado, listo, porcentaje y URL de descarga si SUCCESS.
+        404 si la tarea no la encoló el usuario del request.
+
+    Efectos secundarios:
+        Solo lectura (Redis AsyncResult).
+    """
+    if not tarea_es_del_usuario(task_id, request.user.pk):
+        raise Http404('Exportación no encontrada.')
+
+    resultado = AsyncResult(task_id)
+    estado = resultado.state
+
+    respuesta = {
+        'estado': estado,
+        'listo': estado in ('SUCCESS', 'FAILURE'),
+        'porcentaje': 0,
+    }
+
+    if estado == 'PROGRESS':
+        info = resultado.info or {}
+        respuesta.update({
+            'porcentaje': info.get('porcentaje', 0),
+            'procesadas': info.get('procesadas', 0),
+            'total': info.get('total', 0),
+        })
+
+    elif estado == 'SUCCESS':
+        data = resultado.result or {}
+        respuesta['porcentaje'] = 100
+        respuesta['url'] = data.get('url')
+        if not data.get('success'):
+            respuesta['error'] = 'No hay registros con los filtros aplicados.'
+
+    elif estado == 'FAILURE':
+        error = resultado.result
+        if isinstance(error, Exception):
+            respuesta['error'] = str(error)[:300]
+        else:
+            respuesta['error'] = 'Error desconocido al generar el reporte.'
+
+    return JsonResponse(respuesta)
+
+
+@login_required
+@require_http_methods(["GET"])
+def descargar_exportacion_excel(request, token):
+    """
+    Entrega el .xlsx generado en segundo plano.
+
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    El token firmado trae la ruta, el dueño y el nombre visible. Si alguien
+    lo altera, lo comparte con otro usuario o ya venció, respondemos 404
+    (no revelamos si el archivo existe).
+
+    Args:
+        token (str): token de ``url_descarga``.
+
+    Returns:
+        FileResponse attachment .xlsx.
+
+    Efectos secundarios:
+        Lectura del storage por defecto.
+    """
+    try:
+        datos = leer_token_descarga(token)
+    except signing.BadSignature:
+        raise Http404('Enlace de descarga inválido o vencido.')
+
+    if datos.get('usuario') != request.user.pk:
+        logger.warning(
+            '[EXPORT-EXCEL] Usuario %s intentó descargar un archivo ajeno',
+            request.user.pk,
+        )
+        raise Http404('Enlace de descarga inválido o vencido.')
+
+    ruta = datos.get('ruta', '')
+    if not ruta or not default_storage.exists(ruta):
+        raise Http404('El archivo ya no está disponible.')
+
+    return FileResponse(
+        default_storage.open(ruta, 'rb'),
+        as_attachment=True,
+        filename=datos.get('nombre') or 'reporte.xlsx',
+        content_type=CONTENT_TYPE_XLSX,
+    )
@@ -9,7 +9,7 @@ import logging
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Count, Q
+from django.db.models import Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
 from django.utils import timezone
@@ -17,9 +17,17 @@ from django.views.decorators.http import require_http_methods
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
 
+from config.rendimiento import presupuesto_consultas
 from inventario.models import Empleado, Sucursal
 
 from .decorators import permission_required_with_message
+from .services.paneles_feedback import (
+    COMENTARIOS_DASHBOARD,
+    filtrar_feedback,
+    hay_filtros,
+    obtener_paneles,
+    respuesta_paneles,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,41 +42,16 @@ def _filtrar_feedback_rechazo(request):
     aplicando los filtros GET comunes (fecha, responsable, sucursal, motivo).
     Retorna el queryset con annotate de fecha_expiracion.
     """
-    from .models import FeedbackCliente
-    from django.db.models import F, ExpressionWrapper, DateTimeField
-    from datetime import timedelta
-
-    qs = FeedbackCliente.objects.filter(tipo='rechazo').select_related(
-        'orden__responsable_seguimiento',
-        'orden__sucursal',
-        'orden__detalle_equipo',
-        'cotizacion',
-    )
-
-    fecha_desde = request.GET.get('fecha_desde')
-    fecha_hasta = request.GET.get('fecha_hasta')
-    responsable_id = request.GET.get('responsable_id')
-    sucursal_id = request.GET.get('sucursal_id')
-    motivo_rechazo = request.GET.get('motivo_rechazo')
+    return filtrar_feedback('rechazo', request.GET)
 
-    if fecha_desde:
-        qs = qs.filter(fecha_creacion__date__gte=fecha_desde)
-    if fecha_hasta:
-        qs = qs.filter(fecha_creacion__date__lte=fecha_hasta)
-    if responsable_id:
-        qs = qs.filter(orden__responsable_seguimiento_id=responsable_id)
-    if sucursal_id:
-        qs = qs.filter(orden__sucursal_id=sucursal_id)
-    if motivo_rechazo:
-        qs = qs.filter(motivo_rechazo_snapshot=motivo_rechazo)
 
-    qs = qs.annotate(
-        fecha_expiracion=ExpressionWrapper(
-            F('fecha_creacion') + timedelta(days=7),
-            output_field=DateTimeField()
-        )
-    )
-    return qs
+def _paneles_rechazo(request):
+    """
+    Paneles del dashboard (KPIs, motivos, tendencia, responsables y
+    comentarios) con los filtros GET, calculados en una pasada y cacheados
+    por filtros. Ver services/paneles_feedback.py.
+    """
+    return obtener_paneles('rechazo', request.GET, _filtrar_feedback_rechazo(request))
 
 
 
@@ -101,53 +84,32 @@ def dashboard_feedback_rechazo(request):
 @login_required
 @permission_required_with_message('servicio_tecnico.view_dashboard_gerencial')
 @require_http_methods(['GET'])
-def api_feedback_rechazo_kpis(request):
+@presupuesto_consultas(5)
+def api_feedback_rechazo_paneles(request):
     """
-    API JSON: KPIs globales del dashboard de feedback de rechazo.
-    """
-    now = timezone.now()
-    qs = _filtrar_feedback_rechazo(request)
+    API JSON: todos los paneles del dashboard en una sola respuesta.
 
-    total_enviados = qs.filter(correo_enviado=True).count()
-    total_respondidos = qs.filter(utilizado=True).count()
-    total_pendientes = qs.filter(
-        utilizado=False, correo_enviado=True, fecha_expiracion__gte=now
-    ).count()
-    total_expirados = qs.filter(
-        utilizado=False, fecha_expiracion__lt=now
-    ).count()
-
-    tasa_respuesta = round(
-        (total_respondidos / total_enviados * 100) if total_enviados > 0 else 0, 1
-    )
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Igual que api_encuestas_paneles: una petición (más la de la lista
+    paginada) en lugar de una por gráfico, con ETag para responder 304 si
+    los datos no cambiaron.
 
-    # Motivo más frecuente
-    motivo_top = (
-        qs.filter(correo_enviado=True)
-        .values('motivo_rechazo_snapshot')
-        .annotate(total=Count('id'))
-        .order_by('-total')
-        .first()
-    )
+    Returns:
+        JSON con kpis, por_motivo, tendencia, responsables y comentarios.
+    """
+    return respuesta_paneles(request, 'rechazo', _paneles_rechazo(request))
 
-    from config.constants import MOTIVO_RECHAZO_COTIZACION
-    motivos_dict = dict(MOTIVO_RECHAZO_COTIZACION)
 
-    motivo_label = ''
-    motivo_porcentaje = 0
-    if motivo_top and total_enviados > 0:
-        motivo_label = motivos_dict.get(motivo_top['motivo_rechazo_snapshot'], motivo_top['motivo_rechazo_snapshot'])
-        motivo_porcentaje = round(motivo_top['total'] / total_enviados * 100, 1)
 
-    return JsonResponse({
-        'total_enviados': total_enviados,
-        'total_respondidos': total_respondidos,
-        'total_pendientes': total_pendientes,
-        'total_expirados': total_expirados,
-        'tasa_respuesta': tasa_respuesta,
-        'motivo_mas_frecuente': motivo_label,
-        'motivo_mas_frecuente_porcentaje': motivo_porcentaje,
-    })
+
+@login_required
+@permission_required_with_message('servicio_tecnico.view_dashboard_gerencial')
+@require_http_methods(['GET'])
+def api_feedback_rechazo_kpis(request):
+    """
+    API JSON: KPIs globales del dashboard de feedback de rechazo.
+    """
+    return JsonResponse(_paneles_rechazo(request)['kpis'])
 
 
 
@@ -159,31 +121,7 @@ def api_feedback_rechazo_por_motivo(request):
     """
     API JSON: distribución por motivo de rechazo.
     """
-    qs = _filtrar_feedback_rechazo(request).filter(correo_enviado=True)
-
-    from config.constants import MOTIVO_RECHAZO_COTIZACION
-    motivos_dict = dict(MOTIVO_RECHAZO_COTIZACION)
-
-    datos = (
-        qs.values('motivo_rechazo_snapshot')
-        .annotate(
-            total=Count('id'),
-            respondidos=Count('id', filter=Q(utilizado=True)),
-        )
-        .order_by('-total')
-    )
-
-    motivos = []
-    for row in datos:
-        clave = row['motivo_rechazo_snapshot']
-        motivos.append({
-            'motivo': clave,
-            'label': motivos_dict.get(clave, clave or 'Sin motivo'),
-            'total': row['total'],
-            'respondidos': row['respondidos'],
-        })
-
-    return JsonResponse({'motivos': motivos})
+    return JsonResponse({'motivos': _paneles_rechazo(request)['por_motivo']})
 
 
 
@@ -195,40 +133,7 @@ def api_feedback_rechazo_tendencia(request):
     """
     API JSON: tendencia temporal semanal de feedbacks de rechazo.
     """
-    from django.db.models.functions import TruncWeek
-    from config.paises_config import fecha_local_pais, get_pais_actual
-    pais = get_pais_actual()
-
-    qs = _filtrar_feedback_rechazo(request).filter(correo_enviado=True)
-
-    datos_por_semana = (
-        qs.annotate(semana=TruncWeek('fecha_creacion'))
-        .values('semana')
-        .annotate(
-            total_enviados=Count('id'),
-            total_respondidos=Count('id', filter=Q(utilizado=True)),
-        )
-        .order_by('semana')
-    )
-
-    labels = []
-    datasets = {
-        'total_enviados': [],
-        'total_respondidos': [],
-        'tasa_respuesta': [],
-    }
-
-    for row in datos_por_semana:
-        labels.append(fecha_local_pais(row['semana'], pais).strftime('%d/%m/%Y'))
-        datasets['total_enviados'].append(row['total_enviados'])
-        datasets['total_respondidos'].append(row['total_respondidos'])
-        tasa = round(
-            (row['total_respondidos'] / row['total_enviados'] * 100)
-            if row['total_enviados'] > 0 else 0, 1
-        )
-        datasets['tasa_respuesta'].append(tasa)
-
-    return JsonResponse({'labels': labels, 'datasets': datasets})
+    return JsonResponse(_paneles_rechazo(request)['tendencia'])
 
 
 
@@ -328,30 +233,7 @@ def api_feedback_rechazo_comentarios(request):
     """
     API JSON: últimos comentarios de clientes en feedbacks de rechazo.
     """
-    from config.constants import MOTIVO_RECHAZO_COTIZACION
-    from config.paises_config import fecha_local_pais, get_pais_actual
-    motivos_dict = dict(MOTIVO_RECHAZO_COTIZACION)
-    pais = get_pais_actual()
-
-    qs = _filtrar_feedback_rechazo(request).filter(
-        utilizado=True,
-    ).exclude(
-        comentario_cliente=''
-    ).order_by('-fecha_respuesta')[:10]
-
-    comentarios = []
-    for fb in qs:
-        detalle = getattr(fb.orden, 'detalle_equipo', None)
-        comentarios.append({
-            'orden_numero': detalle.orden_cliente if detalle and detalle.orden_cliente else fb.orden.numero_orden_interno,
-            'orden_id': fb.orden.id,
-            'responsable': str(fb.orden.responsable_seguimiento) if fb.orden.responsable_seguimiento else '',
-            'motivo_rechazo': motivos_dict.get(fb.motivo_rechazo_snapshot, fb.motivo_rechazo_snapshot or 'Sin motivo'),
-            'comentario': fb.comentario_cliente,
-            'fecha': fecha_local_pais(fb.fecha_respuesta, pais).strftime('%d/%m/%Y') if fb.fecha_respuesta else '',
-        })
-
-    return JsonResponse({'comentarios': comentarios})
+    return JsonResponse({'comentarios': _paneles_rechazo(request)['comentarios'][:COMENTARIOS_DASHBOARD]})
 
 
 
@@ -362,13 +244,17 @@ def exportar_feedback_rechazo_excel(request):
     """
     Exporta los feedbacks de rechazo filtrados a un archivo Excel.
     Genera 3 hojas: Resumen KPIs, Feedbacks detallados, Por Motivo.
+    KPIs y motivos salen de los mismos paneles que el dashboard.
     """
     from openpyxl import Workbook
     from config.constants import MOTIVO_RECHAZO_COTIZACION
 
     motivos_dict = dict(MOTIVO_RECHAZO_COTIZACION)
     now = timezone.now()
-    qs = _filtrar_feedback_rechazo(request).filter(correo_enviado=True)
+    qs = _filtrar_feedback_rechazo(request)
+    paneles = obtener_paneles('rechazo', request.GET, qs)
+    kpis_panel = paneles['kpis']
+    qs = qs.filter(correo_enviado=True)
 
     # Estilos
     header_font = Font(bold=True, color='FFFFFF', size=11)
@@ -385,19 +271,13 @@ def exportar_feedback_rechazo_excel(request):
     ws_resumen = wb.active
     ws_resumen.title = 'Resumen KPIs'
 
-    total_enviados = qs.count()
-    total_respondidos = qs.filter(utilizado=True).count()
-    total_pendientes = qs.filter(utilizado=False, fecha_expiracion__gte=now).count()
-    total_expirados = qs.filter(utilizado=False, fecha_expiracion__lt=now).count()
-    tasa_respuesta = round((total_respondidos / total_enviados * 100) if total_enviados > 0 else 0, 1)
-
     kpis = [
         ('Métrica', 'Valor'),
-        ('Total Feedbacks Enviados', total_enviados),
-        ('Total Respondidos', total_respondidos),
-        ('Total Pendientes', total_pendientes),
-        ('Total Expirados', total_expirados),
-        ('Tasa de Respuesta (%)', f'{tasa_respuesta}%'),
+        ('Total Feedbacks Enviados', kpis_panel['total_enviados']),
+        ('Total Respondidos', kpis_panel['total_respondidos']),
+        ('Total Pendientes', kpis_panel['total_pendientes']),
+        ('Total Expirados', kpis_panel['total_expirados']),
+        ('Tasa de Respuesta (%)', f"{kpis_panel['tasa_respuesta']}%"),
     ]
 
     for row_idx, (metrica, valor) in enumerate(kpis, 1):
@@ -470,20 +350,10 @@ def exportar_feedback_rechazo_excel(request):
         cell.alignment = header_alignment
         cell.border = thin_border
 
-    datos_motivos = (
-        qs.values('motivo_rechazo_snapshot')
-        .annotate(
-            total=Count('id'),
-            respondidos=Count('id', filter=Q(utilizado=True)),
-        )
-        .order_by('-total')
-    )
-
-    for row_idx, row in enumerate(datos_motivos, 2):
-        clave = row['motivo_rechazo_snapshot']
+    for row_idx, row in enumerate(paneles['por_motivo'], 2):
         tasa = round((row['respondidos'] / row['total'] * 100) if row['total'] > 0 else 0, 1)
         valores = [
-            motivos_dict.get(clave, clave or 'Sin motivo'),
+            row['label'],
             row['total'],
             row['respondidos'],
             f'{tasa}%',
@@ -513,8 +383,8 @@ def exportar_feedback_rechazo_pdf(request):
     Genera y descarga el Reporte Ejecutivo PDF del Panel de Feedback de Rechazo.
 
     EXPLICACIÓN PARA PRINCIPIANTES:
-    Misma idea que exportar_encuestas_pdf: la vista arma KPIs, motivos,
-    tendencia, ranking y comentarios; luego busca el análisis IA ya
+    Misma idea que exportar_encuestas_pdf: la vista toma KPIs, motivos,
+    tendencia, ranking y comentarios de los paneles del dashboard; luego busca el análisis IA ya
     guardado (caché, tipo_encuesta='rechazo') y lo anexa si existe.
     No vuelve a llamar a Gemini/Ollama.
 
@@ -529,12 +399,9 @@ def exportar_feedback_rechazo_pdf(request):
     Efectos secundarios:
         Ninguno en BD. Devuelve HttpResponse PDF o redirect con messages.
     """
-    from django.db.models.functions import TruncWeek
     from config.constants import MOTIVO_RECHAZO_COTIZACION
-    from config.paises_config import fecha_local_pais, get_pais_actual
     from .pdf_feedback_rechazo import generar_pdf_reporte_rechazo
 
-    pais = get_pais_actual()
     now = timezone.now()
     motivos_dict = dict(MOTIVO_RECHAZO_COTIZACION)
 
@@ -546,169 +413,19 @@ def exportar_feedback_rechazo_pdf(request):
     responsable_id = request.GET.get('responsable_id', '').strip()
     sucursal_id = request.GET.get('sucursal_id', '').strip()
     motivo_rechazo = request.GET.get('motivo_rechazo', '').strip()
-    hay_filtros = any([
-        fecha_desde, fecha_hasta, responsable_id, sucursal_id, motivo_rechazo,
-    ])
-
-    # ---- 2. KPIs (espejo de api_feedback_rechazo_kpis) ----
-    total_enviados = qs.filter(correo_enviado=True).count()
-    total_respondidos = qs.filter(utilizado=True).count()
-    total_pendientes = qs.filter(
-        utilizado=False, correo_enviado=True, fecha_expiracion__gte=now,
-    ).count()
-    total_expirados = qs.filter(
-        utilizado=False, fecha_expiracion__lt=now,
-    ).count()
-    tasa_respuesta = round(
-        (total_respondidos / total_enviados * 100) if total_enviados > 0 else 0,
-        1,
-    )
-
-    motivo_top = (
-        qs.filter(correo_enviado=True)
-        .values('motivo_rechazo_snapshot')
-        .annotate(total=Count('id'))
-        .order_by('-total')
-        .first()
-    )
-    motivo_label = ''
-    motivo_porcentaje = 0
-    if motivo_top and total_enviados > 0:
-        motivo_label = motivos_dict.get(
-            motivo_top['motivo_rechazo_snapshot'],
-            motivo_top['motivo_rechazo_snapshot'],
-        )
-        motivo_porcentaje = round(
-            motivo_top['total'] / total_enviados * 100, 1,
-        )
+    hay_filtros_activos = hay_filtros('rechazo', request.GET)
 
-    kpis = {
-        'total_enviados': total_enviados,
-        'total_respondidos': total_respondidos,
-        'total_pendientes': total_pendientes,
-        'total_expirados': total_expirados,
-        'tasa_respuesta': tasa_respuesta,
-        'motivo_mas_frecuente': motivo_label,
-        'motivo_mas_frecuente_porcentaje': motivo_porcentaje,
-    }
-
-    # ---- 3. Motivos (espejo de api_feedback_rechazo_por_motivo) ----
-    qs_enviados = qs.filter(correo_enviado=True)
-    datos_motivos = (
-        qs_enviados.values('motivo_rechazo_snapshot')
-        .annotate(
-            total=Count('id'),
-            respondidos=Count('id', filter=Q(utilizado=True)),
-        )
-        .order_by('-total')
-    )
-    motivos = []
-    for row in datos_motivos:
-        clave = row['motivo_rechazo_snapshot']
-        motivos.append({
-            'motivo': clave,
-            'label': motivos_dict.get(clave, clave or 'Sin motivo'),
-            'total': row['total'],
-            'respondidos': row['respondidos'],
-        })
-
-    # ---- 4. Tendencia semanal ----
-    datos_tendencia = (
-        qs_enviados.annotate(semana=TruncWeek('fecha_creacion'))
-        .values('semana')
-        .annotate(
-            total_enviados_s=Count('id'),
-            total_respondidos_s=Count('id', filter=Q(utilizado=True)),
-        )
-        .order_by('semana')
-    )
-    labels_tend = []
-    enviados_tend = []
-    respondidos_tend = []
-    tasas_tend = []
-    for row in datos_tendencia:
-        labels_tend.append(
-            fecha_local_pais(row['semana'], pais).strftime('%d/%m/%Y')
-        )
-        enviados_tend.append(row['total_enviados_s'])
-        respondidos_tend.append(row['total_respondidos_s'])
-        tasas_tend.append(round(
-            (row['total_respondidos_s'] / row['total_enviados_s'] * 100)
-            if row['total_enviados_s'] > 0 else 0,
-            1,
-        ))
-    tendencia = {
-        'labels': labels_tend,
-        'datasets': {
-            'total_enviados': enviados_tend,
-            'total_respondidos': respondidos_tend,
-            'tasa_respuesta': tasas_tend,
-        },
-    }
-
-    # ---- 5. Ranking por responsable ----
-    datos_resp = (
-        qs_enviados.values(
-            'orden__responsable_seguimiento__id',
-            'orden__responsable_seguimiento__nombre_completo',
-        )
-        .annotate(
-            total_enviados_r=Count('id'),
-            total_respondidos_r=Count('id', filter=Q(utilizado=True)),
-        )
-        .order_by('-total_enviados_r')
-    )
-    responsables = []
-    for row in datos_resp:
-        nombre = (
-            row['orden__responsable_seguimiento__nombre_completo']
-            or '(Sin responsable)'
-        )
-        t_env = row['total_enviados_r']
-        t_resp = row['total_respondidos_r']
-        responsables.append({
-            'id': row['orden__responsable_seguimiento__id'],
-            'nombre': nombre,
-            'total_enviados': t_env,
-            'total_respondidos': t_resp,
-            'tasa_respuesta': round(
-                (t_resp / t_env * 100) if t_env > 0 else 0, 1,
-            ),
-        })
+    # ---- 2-5. KPIs, motivos, tendencia y ranking: mismos paneles que el dashboard ----
+    paneles = obtener_paneles('rechazo', request.GET, qs)
+    responsables = [
+        dict(resp, nombre=resp['nombre'] or '(Sin responsable)')
+        for resp in paneles['responsables']
+    ]
 
     # ---- 6. Comentarios (con filtros → todos; sin → últimos 10) ----
-    comentarios_qs = (
-        qs.filter(utilizado=True)
-        .exclude(comentario_cliente='')
-        .order_by('-fecha_respuesta')
-    )
-    if not hay_filtros:
-        comentarios_qs = comentarios_qs[:10]
-
-    comentarios = []
-    for fb in comentarios_qs:
-        detalle = getattr(fb.orden, 'detalle_equipo', None)
-        comentarios.append({
-            'orden_numero': (
-                detalle.orden_cliente
-                if detalle and detalle.orden_cliente
-                else fb.orden.numero_orden_interno
-            ),
-            'orden_id': fb.orden.id,
-            'responsable': (
-                str(fb.orden.responsable_seguimiento)
-                if fb.orden.responsable_seguimiento else ''
-            ),
-            'motivo_rechazo': motivos_dict.get(
-                fb.motivo_rechazo_snapshot,
-                fb.motivo_rechazo_snapshot or 'Sin motivo',
-            ),
-            'comentario': fb.comentario_cliente,
-            'fecha': (
-                fecha_local_pais(fb.fecha_respuesta, pais).strftime('%d/%m/%Y')
-                if fb.fecha_respuesta else ''
-            ),
-        })
+    comentarios = paneles['comentarios']
+    if not hay_filtros_activos:
+        comentarios = comentarios[:COMENTARIOS_DASHBOARD]
 
     # ---- 7. Período legible ----
     partes_periodo = []
@@ -764,13 +481,13 @@ def exportar_feedback_rechazo_pdf(request):
 
     # ---- 9. Generar PDF ----
     datos_pdf = {
-        'kpis': kpis,
-        'motivos': motivos,
-        'tendencia': tendencia,
+        'kpis': paneles['kpis'],
+        'motivos': paneles['por_motivo'],
+        'tendencia': paneles['tendencia'],
         'responsables': responsables,
         'comentarios': comentarios,
         'periodo': periodo,
-        'filtros_activos': hay_filtros,
+        'filtros_activos': hay_filtros_activos,
         'analisis_ia': analisis_ia,
     }
 
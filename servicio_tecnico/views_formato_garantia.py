@@ -360,11 +360,12 @@ def abrir_formato_garantia_desde_sicser(request):
         Puede crear OrdenServicio vía sicser_import; redirige al wizard.
     """
     from config.paises_config import get_pais_actual
-    from .sicser_client import SicserAPIError, buscar_registro_garantia_por_dps
+    from .sicser_client import SicserAPIError
+    from .sicser_espejo import buscar_registro
     from .sicser_import import (
         SicserImportError,
+        buscar_orden_importada,
         importar_orden_garantia_desde_sicser,
-        mapa_importaciones_sicser,
     )
     from .services.formato_garantia import obtener_o_crear_borrador
 
@@ -382,16 +383,14 @@ def abrir_formato_garantia_desde_sicser(request):
         return redirect(redirect_listado)
 
     codigo_pais = get_pais_actual().get('codigo', 'MX')
-    _, mapa_garantia = mapa_importaciones_sicser()
 
     try:
-        if id_externo in mapa_garantia:
-            orden_id = mapa_garantia[id_externo]['orden_id']
-            orden = OrdenServicio.objects.get(pk=orden_id)
+        orden = buscar_orden_importada('garantia', id_externo)
+        if orden:
             obtener_o_crear_borrador(orden, usuario=request.user)
             return redirect('servicio_tecnico:formato_garantia_wizard', orden_id=orden.pk)
 
-        registro = buscar_registro_garantia_por_dps(int(id_externo), codigo_pais)
+        registro = buscar_registro('garantia', int(id_externo), codigo_pais)
         if not registro:
             raise SicserImportError(
                 'No se encontró la garantía en SICSER. Actualice el listado e intente de nuevo.'
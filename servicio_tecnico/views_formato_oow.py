@@ -360,11 +360,12 @@ def abrir_formato_oow_desde_sicser(request):
         Puede crear OrdenServicio vía sicser_import; redirige al wizard.
     """
     from config.paises_config import get_pais_actual
-    from .sicser_client import SicserAPIError, buscar_registro_oow_por_id
+    from .sicser_client import SicserAPIError
+    from .sicser_espejo import buscar_registro
     from .sicser_import import (
         SicserImportError,
+        buscar_orden_importada,
         importar_orden_oow_desde_sicser,
-        mapa_importaciones_sicser,
     )
     from .services.formato_oow import obtener_o_crear_borrador
 
@@ -382,17 +383,15 @@ def abrir_formato_oow_desde_sicser(request):
         return redirect(redirect_listado)
 
     codigo_pais = get_pais_actual().get('codigo', 'MX')
-    mapa_oow, _ = mapa_importaciones_sicser()
 
     try:
         # Si ya está importada, abrir wizard directo
-        if id_externo in mapa_oow:
-            orden_id = mapa_oow[id_externo]['orden_id']
-            orden = OrdenServicio.objects.get(pk=orden_id)
+        orden = buscar_orden_importada('oow', id_externo)
+        if orden:
             obtener_o_crear_borrador(orden, usuario=request.user)
             return redirect('servicio_tecnico:formato_oow_wizard', orden_id=orden.pk)
 
-        registro = buscar_registro_oow_por_id(int(id_externo), codigo_pais)
+        registro = buscar_registro('oow', int(id_externo), codigo_pais)
         if not registro:
             raise SicserImportError(
                 'No se encontró la orden OOW en SICSER. Actualice el listado e intente de nuevo.'
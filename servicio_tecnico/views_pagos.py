@@ -22,6 +22,7 @@ from servicio_tecnico.forms import ValidarPagoOrdenForm
 from servicio_tecnico.models import PagoOrden
 from servicio_tecnico.services.pagos_orden import (
     FILTROS_BANDEJA_VALIDACION,
+    calcular_resumenes_cobro,
     contar_pagos_abiertos_validacion,
     listar_pagos_abiertos_validacion,
     usuario_puede_validar_pago,
@@ -107,6 +108,12 @@ def bandeja_pagos_validacion(request):
     paginator = Paginator(pagos, PAGOS_POR_PAGINA)
     pagina = paginator.get_page(request.GET.get('page'))
 
+    # Paso: saldo de la orden de cada abono; todas las de la página en una
+    # sola consulta (o de caché), no una por fila.
+    resumenes = calcular_resumenes_cobro([pago.orden for pago in pagina])
+    for pago in pagina:
+        pago.resumen_orden = resumenes.get(pago.orden_id)
+
     return render(
         request,
         'servicio_tecnico/bandeja_pagos_validacion.html',
@@ -13,6 +13,7 @@ from urllib.parse import quote
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.http import Http404, JsonResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 from django.views.decorators.http import require_http_methods
@@ -26,32 +27,43 @@ logger = logging.getLogger(__name__)
 @permission_required_with_message('servicio_tecnico.view_ordenservicio')
 def consultar_sicser(request):
     """
-    Pantalla de consulta en tiempo real de órdenes SICSER (OOW y garantía Dell).
+    Pantalla de consulta de órdenes SICSER (OOW y garantía Dell).
 
     Fase 1: listar y abrir formato digital en SICSER.
     Fase 2: importar registros como órdenes nuevas en SIGMA (botón por fila).
     UI: badges de «nuevas» en pestañas + Importadas hoy / Histórico (local).
 
+    EXPLICACIÓN PARA PRINCIPIANTES:
+    Ya no descargamos SICSER en cada request: leemos el espejo local
+    (OrdenSicserEspejo) que Celery Beat sincroniza cada pocos minutos.
+    Así cada página es una consulta paginada e indexada a la BD del país.
+
     Parámetros GET:
         tab (str): 'oow', 'garantia', 'importadas_hoy' o 'importadas' — pestaña activa.
         q (str): Texto de búsqueda (folio, service tag, cliente, DPS).
-        refrescar (str): Si es '1', omite caché y vuelve a consultar SICSER.
+        page (str): Página del listado OOW / Garantía.
+        refrescar (str): Si es '1', sincroniza el espejo con SICSER antes de listar.
 
     Efectos secundarios:
-        Solo lectura remota (API SICSER) + consultas locales de importaciones;
-        no crea órdenes por sí sola (eso lo hace importar_orden_sicser).
+        Con refrescar=1 (o si el espejo del país está vacío) consulta SICSER
+        y escribe en OrdenSicserEspejo; no crea órdenes por sí sola.
     """
+    from django.core.paginator import Paginator
+
+    from config.middleware_pais import get_current_db_alias
     from config.paises_config import get_pais_actual
     from inventario.models import Sucursal
-    from .sicser_client import (
-        SicserAPIError,
-        fetch_listado_garantias,
-        fetch_listado_oow,
+    from .sicser_espejo import (
+        SICSER_FILAS_POR_PAGINA,
+        filas_para_template,
+        queryset_listado_espejo,
+        resumen_espejo,
+        sincronizar_pais,
+        ultima_sincronizacion,
     )
     from .sicser_import import (
         contar_ordenes_importadas_sicser,
         listar_ordenes_importadas_sicser,
-        mapa_importaciones_sicser,
     )
 
     pais = get_pais_actual()
@@ -61,89 +73,56 @@ def consultar_sicser(request):
         tab = 'oow'
 
     texto_busqueda = request.GET.get('q', '').strip()
-    usar_cache = request.GET.get('refrescar') != '1'
+    refresco_forzado = request.GET.get('refrescar') == '1'
 
-    # EXPLICACIÓN PARA PRINCIPIANTES:
-    # Pedimos AMBAS APIs sin filtro de búsqueda para calcular badges de «N nuevas».
-    # La búsqueda `q` se aplica después solo a la pestaña activa.
-    ordenes_oow_todas = []
-    ordenes_garantia_todas = []
-    total_oow_pais = 0
-    total_garantia_pais = 0
     error_oow = ''
     error_garantia = ''
-    api_oow_ok = False
-    api_garantia_ok = False
+    resumen = resumen_espejo(codigo_pais)
 
-    try:
-        ordenes_oow_todas, total_oow_pais = fetch_listado_oow(
-            codigo_pais=codigo_pais,
-            texto_busqueda='',
-            usar_cache=usar_cache,
+    # EXPLICACIÓN PARA PRINCIPIANTES:
+    # Sincronizamos en línea solo si el usuario lo pide (botón ⟳) o si el
+    # espejo de la pestaña activa nunca se ha llenado (primer uso antes de Beat).
+    if refresco_forzado:
+        origenes_a_sincronizar = ('oow', 'garantia')
+    elif (
+        tab in ('oow', 'garantia')
+        and not resumen[f'filas_{tab}']
+        and ultima_sincronizacion(tab, codigo_pais) is None
+    ):
+        origenes_a_sincronizar = (tab,)
+    else:
+        origenes_a_sincronizar = ()
+    if origenes_a_sincronizar:
+        _, errores = sincronizar_pais(
+            codigo_pais,
+            db_alias=get_current_db_alias(),
+            origenes=origenes_a_sincronizar,
         )
-        api_oow_ok = True
-    except SicserAPIError as exc:
-        error_oow = str(exc)
-        logger.warning('Error consultando API OOW SICSER: %s', exc)
+        error_oow = errores.get('oow', '')
+        error_garantia = errores.get('garantia', '')
+        resumen = resumen_espejo(codigo_pais)
 
-    try:
-        ordenes_garantia_todas, total_garantia_pais = fetch_listado_garantias(
-            codigo_pais=codigo_pais,
-            texto_busqueda='',
-            usar_cache=usar_cache,
-        )
-        api_garantia_ok = True
-    except SicserAPIError as exc:
-        error_garantia = str(exc)
-        logger.warning('Error consultando API Garantías SICSER: %s', exc)
+    # Si SICSER falló pero el espejo ya tiene datos, seguimos mostrándolos:
+    # el error solo bloquea la pestaña cuando no hay nada que enseñar.
+    api_oow_ok = not (error_oow and not resumen['filas_oow'])
+    api_garantia_ok = not (error_garantia and not resumen['filas_garantia'])
 
-    mapa_oow, mapa_garantia = mapa_importaciones_sicser()
     sucursales = Sucursal.objects.filter(activa=True).order_by('nombre')
     puede_importar = request.user.has_perm('servicio_tecnico.add_ordenservicio')
 
-    # Badges: pendientes = en SICSER y aún no importadas a SIGMA.
-    nuevas_oow = (
-        sum(1 for o in ordenes_oow_todas if str(o.id_orden) not in mapa_oow)
-        if api_oow_ok else 0
-    )
-    nuevas_garantia = (
-        sum(1 for o in ordenes_garantia_todas if str(o.numero_dps) not in mapa_garantia)
-        if api_garantia_ok else 0
-    )
-
-    # Aplicar búsqueda solo a la pestaña activa (reutiliza el filtro del cliente).
-    if tab == 'oow' and texto_busqueda and api_oow_ok:
-        ordenes_oow, _ = fetch_listado_oow(
-            codigo_pais=codigo_pais,
-            texto_busqueda=texto_busqueda,
-            usar_cache=True,
+    pagina = None
+    filas_oow = []
+    filas_garantia = []
+    if tab in ('oow', 'garantia') and (api_oow_ok if tab == 'oow' else api_garantia_ok):
+        paginator = Paginator(
+            queryset_listado_espejo(tab, codigo_pais, texto_busqueda),
+            SICSER_FILAS_POR_PAGINA,
         )
-    else:
-        ordenes_oow = ordenes_oow_todas if tab == 'oow' else []
-
-    if tab == 'garantia' and texto_busqueda and api_garantia_ok:
-        ordenes_garantia, _ = fetch_listado_garantias(
-            codigo_pais=codigo_pais,
-            texto_busqueda=texto_busqueda,
-            usar_cache=True,
-        )
-    else:
-        ordenes_garantia = ordenes_garantia_todas if tab == 'garantia' else []
-
-    filas_oow = [
-        {
-            'registro': orden,
-            'sigma': mapa_oow.get(str(orden.id_orden)),
-        }
-        for orden in ordenes_oow
-    ]
-    filas_garantia = [
-        {
-            'registro': orden,
-            'sigma': mapa_garantia.get(str(orden.numero_dps)),
-        }
-        for orden in ordenes_garantia
-    ]
+        pagina = paginator.get_page(request.GET.get('page'))
+        if tab == 'oow':
+            filas_oow = filas_para_template(pagina)
+        else:
+            filas_garantia = filas_para_template(pagina)
 
     total_importadas = contar_ordenes_importadas_sicser()
     total_importadas_hoy = contar_ordenes_importadas_sicser(solo_hoy=True)
@@ -173,19 +152,29 @@ def consultar_sicser(request):
         'filas_oow': filas_oow,
         'filas_garantia': filas_garantia,
         'filas_importadas': filas_importadas,
-        'total_oow_pais': total_oow_pais,
-        'total_garantia_pais': total_garantia_pais,
-        'total_oow_mostrado': len(filas_oow),
-        'total_garantia_mostrado': len(filas_garantia),
-        'nuevas_oow': nuevas_oow,
-        'nuevas_garantia': nuevas_garantia,
+        'pagina_sicser': pagina,
+        'total_oow_pais': resumen['total_oow'],
+        'total_garantia_pais': resumen['total_garantia'],
+        'total_oow_mostrado': pagina.paginator.count if pagina and tab == 'oow' else 0,
+        'total_garantia_mostrado': (
+            pagina.paginator.count if pagina and tab == 'garantia' else 0
+        ),
+        'nuevas_oow': resumen['nuevas_oow'],
+        'nuevas_garantia': resumen['nuevas_garantia'],
         'total_importadas': total_importadas,
         'total_importadas_hoy': total_importadas_hoy,
         'api_oow_ok': api_oow_ok,
         'api_garantia_ok': api_garantia_ok,
-        'error_oow': error_oow,
-        'error_garantia': error_garantia,
-        'refresco_forzado': not usar_cache,
+        'error_oow': error_oow if not api_oow_ok else '',
+        'error_garantia': error_garantia if not api_garantia_ok else '',
+        'aviso_sincronizacion': (
+            error_oow if tab == 'oow' and api_oow_ok else
+            error_garantia if tab == 'garantia' and api_garantia_ok else ''
+        ),
+        'ultima_sincronizacion': (
+            ultima_sincronizacion(tab, codigo_pais) if tab in ('oow', 'garantia') else None
+        ),
+        'refresco_forzado': refresco_forzado and not (error_oow or error_garantia),
         'sucursales': sucursales,
         'puede_importar': puede_importar,
     }
@@ -211,11 +200,8 @@ def importar_orden_sicser(request):
         Crea OrdenServicio + DetalleEquipo en la base de datos del país activo.
     """
     from config.paises_config import get_pais_actual
-    from .sicser_client import (
-        SicserAPIError,
-        buscar_registro_garantia_por_dps,
-        buscar_registro_oow_por_id,
-    )
+    from .sicser_client import SicserAPIError
+    from .sicser_espejo import buscar_registro
     from .sicser_import import (
         SicserImportError,
         importar_orden_garantia_desde_sicser,
@@ -247,7 +233,7 @@ def importar_orden_sicser(request):
 
     try:
         if tipo == 'oow':
-            registro = buscar_registro_oow_por_id(int(id_externo), codigo_pais)
+            registro = buscar_registro('oow', int(id_externo), codigo_pais)
             if not registro:
                 raise SicserImportError(
                     'No se encontró la orden OOW en SICSER. Actualice el listado e intente de nuevo.'
@@ -258,7 +244,7 @@ def importar_orden_sicser(request):
                 sucursal_id=sucursal_id,
             )
         else:
-            registro = buscar_registro_garantia_por_dps(int(id_externo), codigo_pais)
+            registro = buscar_registro('garantia', int(id_externo), codigo_pais)
             if not registro:
                 raise SicserImportError(
                     'No se encontró la garantía en SICSER. Actualice el listado e intente de nuevo.'
@@ -277,3 +263,125 @@ def importar_orden_sicser(request):
         # mensaje al usuario y vuelta al listado SICSER, sin 500.
         messages.error(request, f'No se pudo importar desde SICSER: {exc}')
         return redirect(redirect_listado)
+
+
+@login_required
+@permission_required_with_message('servicio_tecnico.add_ordenservicio')
+@require_http_methods(['POST'])
+def importar_ordenes_sicser_lote(request):
+    """
+    Encola la importación de varios folios SICSER («Importar varias»).
+
+    Parámetros POST:
+        tipo (str): 'oow' o 'garantia'.
+        identificadores (str): folios o ids pegados (uno por línea, comas o espacios).
+        sucursal_id (str, opcional): Sucursal SIGMA a asignar a todas.
+
+    Returns:
+        JsonResponse 202 con task_id y url_estado para el polling, o 400.
+
+    Efectos secundarios:
+        Encola importar_ordenes_sicser_lote_task en la BD del país activo.
+    """
+    from config.middleware_pais import get_current_db_alias
+    from config.paises_config import get_pais_actual
+    from .services.tareas_usuario import registrar_tarea_de_usuario
+    from .sicser_import import MAX_IDENTIFICADORES_LOTE, parsear_identificadores_sicser
+    from .tasks import importar_ordenes_sicser_lote_task
+
+    tipo = request.POST.get('tipo', '').strip().lower()
+    identificadores = parsear_identificadores_sicser(request.POST.get('identificadores', ''))
+    sucursal_id_raw = request.POST.get('sucursal_id', '').strip()
+    sucursal_id = int(sucursal_id_raw) if sucursal_id_raw.isdigit() else None
+
+    if tipo not in ('oow', 'garantia') or not identificadores:
+        return JsonResponse({
+            'success': False,
+            'error': 'Indique el tipo y al menos un folio SICSER.',
+        }, status=400)
+    if len(identificadores) > MAX_IDENTIFICADORES_LOTE:
+        return JsonResponse({
+            'success': False,
+            'error': f'Máximo {MAX_IDENTIFICADORES_LOTE} folios por importación.',
+        }, status=400)
+
+    tarea = importar_ordenes_sicser_lote_task.delay(
+        origen=tipo,
+        identificadores=identificadores,
+        usuario_id=request.user.pk,
+        codigo_pais=get_pais_actual().get('codigo', 'MX'),
+        sucursal_id=sucursal_id,
+        db_alias=get_current_db_alias(),
+    )
+    registrar_tarea_de_usuario(tarea.id, request.user.pk)
+    logger.info(
+        '[SICSER-LOTE] Encolados %s folios %s para %s (task_id=%s)',
+        len(identificadores), tipo, request.user.username, tarea.id,
+    )
+    return JsonResponse({
+        'success': True,
+        'task_id': tarea.id,
+        'total': len(identificadores),
+        'url_estado': reverse('servicio_tecnico:estado_importacion_sicser_lote', args=[tarea.id]),
+    }, status=202)
+
+
+@login_required
+@permission_required_with_message('servicio_tecnico.add_ordenservicio')
+@require_http_methods(['GET'])
+def estado_importacion_sicser_lote(request, task_id):
+    """
+    Polling del estado de una importación SICSER por lote.
+
+    Args:
+        task_id (str): ID de tarea Celery devuelto al encolar.
+
+    Returns:
+        JsonResponse con estado, listo y porcentaje; al terminar, las filas
+        (una por folio) y los conteos creadas / duplicadas / errores.
+        404 si la importación no la encoló el usuario del request (las filas
+        traen órdenes de cliente).
+
+    Efectos secundarios:
+        Solo lectura (Redis AsyncResult).
+    """
+    from celery.result import AsyncResult
+
+    from .services.tareas_usuario import tarea_es_del_usuario
+
+    if not tarea_es_del_usuario(task_id, request.user.pk):
+        raise Http404('Importación no encontrada.')
+
+    resultado = AsyncResult(task_id)
+    estado = resultado.state
+
+    respuesta = {
+        'estado': estado,
+        'listo': estado in ('SUCCESS', 'FAILURE'),
+        'porcentaje': 0,
+    }
+
+    if estado == 'PROGRESS':
+        info = resultado.info or {}
+        respuesta.update({
+            'porcentaje': info.get('porcentaje', 0),
+            'procesadas': info.get('procesadas', 0),
+            'total': info.get('total', 0),
+        })
+
+    elif estado == 'SUCCESS':
+        data = resultado.result or {}
+        respuesta['porcentaje'] = 100
+        for clave in ('filas', 'creadas', 'duplicadas', 'errores'):
+            respuesta[clave] = data.get(clave, 0 if clave != 'filas' else [])
+        if not data.get('success'):
+            respuesta['error'] = data.get('error') or 'No se pudo importar el lote.'
+
+    elif estado == 'FAILURE':
+        error = resultado.result
+        if isinstance(error, Exception):
+            respuesta['error'] = str(error)[:300]
+        else:
+            respuesta['error'] = 'Error desconocido al importar desde SICSER.'
+
+    return JsonResponse(respuesta)
@@ -0,0 +1,218 @@
+"""
+Vistas HTTP de la subida reanudable de videos de evidencia.
+
+EXPLICACIÓN PARA PRINCIPIANTES:
+El formulario clásico (form_type='subir_video' en detalle_orden) manda el
+video entero en UN request. Aquí el navegador (static/ts/subida_reanudable.ts)
+lo manda en bloques:
+
+    POST   /ordenes/<id>/videos/subidas/      → crea la subida (201, id + url)
+    HEAD   /videos/subidas/<id>/              → offset actual (header Upload-Offset)
+    PATCH  /videos/subidas/<id>/              → agrega un bloque desde Upload-Offset
+    DELETE /videos/subidas/<id>/              → cancela
+
+El cuerpo del PATCH se lee con request.read() por trozos y se escribe directo
+al .part (services/subidas_reanudables.py); nunca se arma en memoria. Con el
+último bloque el archivo se entrega a comprimir_video_evidencia_task igual
+que en la subida clásica; la tarea verifica el SHA-256 antes de comprimir.
+Si otro PATCH de la misma subida sigue escribiendo se responde 423 y el
+navegador reintenta.
+urls.py usa views.iniciar_subida_video porque views.py reexporta estos nombres.
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods
+
+from .decorators import permission_required_with_message
+from .forms import IniciarSubidaVideoForm
+from .models import OrdenServicio
+from .services import subidas_reanudables as subidas
+
+logger = logging.getLogger(__name__)
+
+
+def _respuesta_offset(offset, status=200, **datos):
+    """JsonResponse con el offset en el cuerpo y en el header Upload-Offset."""
+    respuesta = JsonResponse({'offset': offset, **datos}, status=status)
+    respuesta['Upload-Offset'] = str(offset)
+    respuesta['Cache-Control'] = 'no-store'
+    return respuesta
+
+
+def _subida_del_usuario(request, subida_id):
+    """
+    Metadatos de la subida si pertenece al usuario y al país del request.
+
+    Returns:
+        dict | None: None si no existe o es de otro usuario/país (se responde
+        404 en ambos casos para no revelar ids ajenos).
+    """
+    from config.paises_config import get_pais_actual
+
+    try:
+        subida = subidas.leer_subida(subida_id)
+    except subidas.SubidaNoEncontrada:
+        return None
+    if subida['usuario_id'] != request.user.pk or subida['db_alias'] != get_pais_actual()['db_alias']:
+        return None
+    return subida
+
+
+def _ocupada():
+    """423: otro request de la misma subida está escribiendo."""
+    return JsonResponse({
+        'success': False,
+        'error': 'Otro envío de este video sigue en curso. Reintentando…',
+    }, status=423)
+
+
+def _no_encontrada():
+    return JsonResponse({
+        'success': False,
+        'error': 'La subida no existe o ya venció. Vuelve a seleccionar el video.',
+    }, status=404)
+
+
+@login_required
+@permission_required_with_message('servicio_tecnico.view_ordenservicio')
+@require_http_methods(["POST"])
+def iniciar_subida_video(request, orden_id):
+    """
+    Crea una subida reanudable para un video de la orden.
+
+    Args:
+        orden_id (int): PK de OrdenServicio.
+
+    Returns:
+        JsonResponse 201 con id, url y offset (0), o 400 con form_errors.
+    """
+    from config.paises_config import get_pais_actual
+
+    orden = get_object_or_404(OrdenServicio, pk=orden_id)
+    form = IniciarSubidaVideoForm(request.POST)
+    if not form.is_valid():
+        return JsonResponse({
+            'success': False,
+            'error': 'Error en el formulario de video.',
+            'form_errors': dict(form.errors),
+        }, status=400)
+
+    datos = form.cleaned_data
+    subida_id = subidas.crear_subida({
+        'orden_id': orden.pk,
+        'usuario_id': request.user.pk,
+        'db_alias': get_pais_actual()['db_alias'],
+        'tipo': datos['tipo'],
+        'descripcion': datos.get('descripcion', ''),
+        'orientacion_video': datos['orientacion_video'],
+        'nombre': datos['nombre'],
+        'tamano': datos['tamano'],
+        'sha256': datos['sha256'].lower(),
+    })
+    logger.info(
+        f"🎥 Subida reanudable {subida_id} creada — Orden {orden.numero_orden_interno} "
+        f"({round(datos['tamano'] / (1024 * 1024), 1)} MB)"
+    )
+    return _respuesta_offset(
+        0, status=201, success=True, id=subida_id,
+        url=reverse('servicio_tecnico:subida_video', args=[subida_id]),
+        bloque_max=settings.SUBIDA_BLOQUE_MAX_MB * 1024 * 1024,
+    )
+
+
+@login_required
+@permission_required_with_message('servicio_tecnico.view_ordenservicio')
+@require_http_methods(["HEAD", "GET", "PATCH", "DELETE"])
+def subida_video(request, subida_id):
+    """
+    Consulta (HEAD/GET), continúa (PATCH) o cancela (DELETE) una subida.
+
+    PATCH espera el header Upload-Offset y el bloque como cuerpo crudo
+    (application/offset+octet-stream). Si el offset no coincide responde 409
+    con el offset real para que el cliente retome desde ahí; si otro PATCH
+    de la misma subida sigue escribiendo, 423.
+
+    Args:
+        subida_id (str): id devuelto por iniciar_subida_video.
+
+    Returns:
+        JsonResponse con el offset; con el último bloque, la respuesta de
+        encolar_video_evidencia (task_queued).
+    """
+    subida = _subida_del_usuario(request, subida_id)
+    if subida is None:
+        return _no_encontrada()
+
+    if request.method in ('HEAD', 'GET'):
+        return _respuesta_offset(subida['offset'], success=True, tamano=subida['tamano'])
+
+    if request.method == 'DELETE':
+        subidas.cancelar_subida(subida_id)
+        return JsonResponse({'success': True})
+
+    # ── PATCH: agregar un bloque ──────────────────────────────────────────
+    try:
+        offset = int(request.headers['Upload-Offset'])
+        longitud = int(request.headers.get('Content-Length') or 0)
+    except (KeyError, ValueError):
+        return JsonResponse({
+            'success': False,
+            'error': 'Faltan los headers Upload-Offset / Content-Length.',
+        }, status=400)
+    if longitud > settings.SUBIDA_BLOQUE_MAX_MB * 1024 * 1024:
+        return JsonResponse({
+            'success': False,
+            'error': f'El bloque supera {settings.SUBIDA_BLOQUE_MAX_MB} MB.',
+        }, status=413)
+
+    try:
+        nuevo_offset = subidas.agregar_bloque(subida_id, offset, request, longitud)
+    except subidas.SubidaNoEncontrada:
+        return _no_encontrada()
+    except subidas.OffsetInvalido as exc:
+        return _respuesta_offset(exc.offset, status=409, success=False,
+                                 error='El servidor tiene otro offset; reanuda desde ahí.')
+    except subidas.SubidaOcupada:
+        return _ocupada()
+    except ValueError as exc:
+        return JsonResponse({'success': False, 'error': str(exc)}, status=400)
+
+    if nuevo_offset < subida['tamano']:
+        return _respuesta_offset(nuevo_offset, success=True)
+
+    return _completar(request, subida)
+
+
+def _completar(request, subida):
+    """Mueve el archivo completo y lo encola como en la subida clásica."""
+    from .views_detalle_orden_multimedia import encolar_video_evidencia, ruta_video_tmp
+
+    orden = get_object_or_404(OrdenServicio, pk=subida['orden_id'])
+    empleado_actual = request.user.empleado if hasattr(request.user, 'empleado') else None
+
+    archivo_tmp_path = ruta_video_tmp(subida['nombre'])
+    try:
+        subidas.completar_subida(subida['id'], archivo_tmp_path)
+    except subidas.SubidaNoEncontrada:
+        return _no_encontrada()
+    except subidas.SubidaOcupada:
+        return _ocupada()
+    except ValueError as exc:
+        return JsonResponse({'success': False, 'error': str(exc)}, status=400)
+
+    return encolar_video_evidencia(
+        request, orden, empleado_actual,
+        archivo_tmp_path=archivo_tmp_path,
+        nombre_original=subida['nombre'],
+        tamano_bytes=subida['tamano'],
+        tipo=subida['tipo'],
+        descripcion=subida['descripcion'],
+        orientacion_video=subida['orientacion_video'],
+        sha256_esperado=subida['sha256'],
+    )
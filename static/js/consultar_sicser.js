@@ -23,4 +23,140 @@ if (document.readyState === 'loading') {
 else {
     inicializarImportacionSicser();
 }
-//# sourceMappingURL=consultar_sicser.js.map
\ No newline at end of file
+// ============================================================================
+// IMPORTAR VARIAS (lote en segundo plano)
+// Servidor: views_sicser.importar_ordenes_sicser_lote / estado_importacion_sicser_lote
+// ============================================================================
+const INTERVALO_ESTADO_LOTE_MS = 2000;
+const CLASES_ESTADO_LOTE = {
+    creada: 'bg-success',
+    duplicada: 'bg-secondary',
+    error: 'bg-danger',
+};
+function inicializarImportacionLoteSicser() {
+    var _a;
+    const formulario = document.querySelector('form.js-sicser-lote-form');
+    const panel = document.getElementById('sicser-lote');
+    if (!formulario || !panel) {
+        return;
+    }
+    const textarea = formulario.querySelector('textarea[name="identificadores"]');
+    const botonEnviar = formulario.querySelector('.js-sicser-lote-enviar');
+    const botonPendientes = formulario.querySelector('.js-sicser-lote-pendientes');
+    const progreso = panel.querySelector('.js-sicser-lote-progreso');
+    const barra = (_a = progreso === null || progreso === void 0 ? void 0 : progreso.querySelector('.progress-bar')) !== null && _a !== void 0 ? _a : null;
+    const mensaje = panel.querySelector('.js-sicser-lote-mensaje');
+    const resultados = panel.querySelector('.js-sicser-lote-resultados');
+    const urlOrden = formulario.dataset.urlOrden || '';
+    botonPendientes === null || botonPendientes === void 0 ? void 0 : botonPendientes.addEventListener('click', () => {
+        if (textarea) {
+            textarea.value = (botonPendientes.dataset.pendientes || '').trim().split(/\s+/).join('\n');
+        }
+    });
+    function mostrarAvance(porcentaje) {
+        progreso === null || progreso === void 0 ? void 0 : progreso.classList.remove('d-none');
+        if (barra) {
+            barra.style.width = `${porcentaje}%`;
+        }
+    }
+    function mostrarMensaje(texto, clase) {
+        if (mensaje) {
+            mensaje.className = `small mt-2 mb-0 js-sicser-lote-mensaje ${clase}`;
+            mensaje.textContent = texto;
+        }
+    }
+    function pintarFilas(filas) {
+        const cuerpo = resultados === null || resultados === void 0 ? void 0 : resultados.querySelector('tbody');
+        if (!resultados || !cuerpo) {
+            return;
+        }
+        cuerpo.replaceChildren(...filas.map((fila) => {
+            const tr = document.createElement('tr');
+            const folio = document.createElement('td');
+            const codigo = document.createElement('code');
+            codigo.textContent = fila.identificador;
+            folio.append(codigo);
+            const resultado = document.createElement('td');
+            const badge = document.createElement('span');
+            badge.className = `badge ${CLASES_ESTADO_LOTE[fila.estado]} me-1`;
+            badge.textContent = fila.estado;
+            resultado.append(badge, document.createTextNode(fila.mensaje));
+            const orden = document.createElement('td');
+            if (fila.orden_id) {
+                const enlace = document.createElement('a');
+                enlace.href = urlOrden.replace('/0/', `/${fila.orden_id}/`);
+                enlace.textContent = fila.numero_orden_interno;
+                orden.append(enlace);
+            }
+            tr.append(folio, resultado, orden);
+            return tr;
+        }));
+        resultados.classList.remove('d-none');
+    }
+    async function consultarEstado(url) {
+        let estado;
+        try {
+            const respuesta = await fetch(url, { headers: { 'X-Requested-With': 'XMLHttpRequest' } });
+            estado = await respuesta.json();
+        }
+        catch {
+            // Corte momentáneo: se vuelve a preguntar en el siguiente ciclo
+            window.setTimeout(() => consultarEstado(url), INTERVALO_ESTADO_LOTE_MS);
+            return;
+        }
+        mostrarAvance(estado.porcentaje);
+        if (!estado.listo) {
+            window.setTimeout(() => consultarEstado(url), INTERVALO_ESTADO_LOTE_MS);
+            return;
+        }
+        if (botonEnviar) {
+            botonEnviar.disabled = false;
+        }
+        if (estado.error) {
+            mostrarMensaje(estado.error, 'text-danger');
+            return;
+        }
+        mostrarMensaje(`${estado.creadas} creadas · ${estado.duplicadas} ya existían · ${estado.errores} con error.`, estado.errores ? 'text-warning' : 'text-success');
+        pintarFilas(estado.filas || []);
+    }
+    formulario.addEventListener('submit', async (evento) => {
+        evento.preventDefault();
+        const campoSucursal = formulario.querySelector('.js-sicser-sucursal');
+        const selectorSucursal = document.querySelector('#sicser-sucursal-import');
+        if (campoSucursal && selectorSucursal) {
+            campoSucursal.value = selectorSucursal.value;
+        }
+        if (botonEnviar) {
+            botonEnviar.disabled = true;
+        }
+        resultados === null || resultados === void 0 ? void 0 : resultados.classList.add('d-none');
+        mostrarAvance(0);
+        mostrarMensaje('Importando en segundo plano… puede seguir trabajando; le avisaremos en la campanita.', 'text-muted');
+        try {
+            const respuesta = await fetch(formulario.action, {
+                method: 'POST',
+                body: new FormData(formulario),
+                headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            });
+            const datos = await respuesta.json();
+            if (respuesta.status !== 202) {
+                throw new Error(datos.error || `Código ${respuesta.status}`);
+            }
+            consultarEstado(datos.url_estado);
+        }
+        catch (error) {
+            if (botonEnviar) {
+                botonEnviar.disabled = false;
+            }
+            progreso === null || progreso === void 0 ? void 0 : progreso.classList.add('d-none');
+            mostrarMensaje(`No se pudo iniciar la importación: ${error.message}`, 'text-danger');
+        }
+    });
+}
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', inicializarImportacionLoteSicser);
+}
+else {
+    inicializarImportacionLoteSicser();
+}
+//# sourceMappingURL=consultar_sicser.js.map
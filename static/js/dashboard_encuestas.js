@@ -21,12 +21,8 @@ class DashboardEncuestas {
         if (!urlsEl)
             return;
         this.urls = {
-            kpis: urlsEl.dataset.urlKpis || '',
-            tendencia: urlsEl.dataset.urlTendencia || '',
-            responsable: urlsEl.dataset.urlResponsable || '',
-            nps: urlsEl.dataset.urlNps || '',
+            paneles: urlsEl.dataset.urlPaneles || '',
             lista: urlsEl.dataset.urlLista || '',
-            comentarios: urlsEl.dataset.urlComentarios || '',
             exportar: urlsEl.dataset.urlExportar || '',
             exportarPdf: urlsEl.dataset.urlExportarPdf || '',
             analisisIA: urlsEl.dataset.urlAnalisisIa || '',
@@ -131,71 +127,72 @@ class DashboardEncuestas {
         this.cargarTodo();
     }
     cargarTodo() {
-        this.cargarKPIs();
-        this.cargarTendencia();
-        this.cargarDistribucionNPS();
-        this.cargarPorResponsable();
+        this.cargarPaneles();
         this.cargarTabla();
-        this.cargarComentarios();
     }
-    // ── KPIs ─────────────────────────────────────────────────────────
-    cargarKPIs() {
+    // ── Paneles (KPIs, tendencia, NPS, responsables y comentarios) ───
+    /**
+     * Una sola petición para todos los gráficos. El servidor responde con
+     * ETag: si los datos no cambiaron, el navegador reutiliza su copia (304).
+     */
+    cargarPaneles() {
+        const loadings = ['loadingTendencia', 'loadingNPS', 'loadingResponsables']
+            .map(id => document.getElementById(id));
+        loadings.forEach(el => { if (el)
+            el.classList.add('show'); });
+        const ocultarLoadings = () => loadings.forEach(el => { if (el)
+            el.classList.remove('show'); });
         const params = this.obtenerFiltros();
-        fetch(this.urls.kpis + '?' + params.toString())
+        fetch(this.urls.paneles + '?' + params.toString())
             .then(r => r.json())
             .then((data) => {
-            this.setTexto('kpiEnviadas', String(data.total_enviadas));
-            this.setTexto('kpiRespondidas', String(data.total_respondidas));
-            this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
-            this.setTexto('kpiPendientes', String(data.total_pendientes));
-            this.setTexto('kpiExpiradas', String(data.total_expiradas));
-            // NPS Score con color semáforo
-            const npsEl = document.getElementById('kpiNPSScore');
-            if (npsEl) {
-                npsEl.textContent = String(data.nps_score);
-                npsEl.className = 'kpi-valor ' + this.claseNPS(data.nps_score);
-            }
-            // Calificación con estrellas
-            this.setTexto('kpiCalificacion', data.calificacion_promedio.toFixed(1));
-            const estrellasEl = document.getElementById('kpiEstrellas');
-            if (estrellasEl)
-                estrellasEl.innerHTML = this.renderizarEstrellas(data.calificacion_promedio);
-            // Sub-métricas
-            this.setTexto('subCalAtencion', data.calificacion_atencion_promedio.toFixed(1) + ' / 5');
-            this.setTexto('subCalTiempo', data.calificacion_tiempo_promedio.toFixed(1) + ' / 5');
-            this.setTexto('subTasaRec', data.tasa_recomendacion + '%');
-            const barraAtencion = document.getElementById('barraAtencion');
-            if (barraAtencion)
-                barraAtencion.style.width = (data.calificacion_atencion_promedio / 5 * 100) + '%';
-            const barraTiempo = document.getElementById('barraTiempo');
-            if (barraTiempo)
-                barraTiempo.style.width = (data.calificacion_tiempo_promedio / 5 * 100) + '%';
-            const barraRec = document.getElementById('barraRecomendacion');
-            if (barraRec)
-                barraRec.style.width = data.tasa_recomendacion + '%';
-            // Badges de tabs
-            this.setTexto('badgePendientes', String(data.total_pendientes));
-            this.setTexto('badgeRespondidas', String(data.total_respondidas));
-            this.setTexto('badgeExpiradas', String(data.total_expiradas));
+            ocultarLoadings();
+            this.renderizarKPIs(data.kpis);
+            this.renderizarChartTendencia(data.tendencia);
+            this.renderizarDistribucionNPS(data.distribucion_nps);
+            this.datosResponsables = data.responsables;
+            this.renderizarChartResponsables();
+            this.renderizarComentarios(data.comentarios);
         })
-            .catch(() => { });
+            .catch(() => ocultarLoadings());
     }
-    // ── Tendencia ────────────────────────────────────────────────────
-    cargarTendencia() {
-        const loading = document.getElementById('loadingTendencia');
-        if (loading)
-            loading.classList.add('show');
-        const params = this.obtenerFiltros();
-        fetch(this.urls.tendencia + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            if (loading)
-                loading.classList.remove('show');
-            this.renderizarChartTendencia(data);
-        })
-            .catch(() => { if (loading)
-            loading.classList.remove('show'); });
+    // ── KPIs ─────────────────────────────────────────────────────────
+    renderizarKPIs(data) {
+        this.setTexto('kpiEnviadas', String(data.total_enviadas));
+        this.setTexto('kpiRespondidas', String(data.total_respondidas));
+        this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
+        this.setTexto('kpiPendientes', String(data.total_pendientes));
+        this.setTexto('kpiExpiradas', String(data.total_expiradas));
+        // NPS Score con color semáforo
+        const npsEl = document.getElementById('kpiNPSScore');
+        if (npsEl) {
+            npsEl.textContent = String(data.nps_score);
+            npsEl.className = 'kpi-valor ' + this.claseNPS(data.nps_score);
+        }
+        // Calificación con estrellas
+        this.setTexto('kpiCalificacion', data.calificacion_promedio.toFixed(1));
+        const estrellasEl = document.getElementById('kpiEstrellas');
+        if (estrellasEl)
+            estrellasEl.innerHTML = this.renderizarEstrellas(data.calificacion_promedio);
+        // Sub-métricas
+        this.setTexto('subCalAtencion', data.calificacion_atencion_promedio.toFixed(1) + ' / 5');
+        this.setTexto('subCalTiempo', data.calificacion_tiempo_promedio.toFixed(1) + ' / 5');
+        this.setTexto('subTasaRec', data.tasa_recomendacion + '%');
+        const barraAtencion = document.getElementById('barraAtencion');
+        if (barraAtencion)
+            barraAtencion.style.width = (data.calificacion_atencion_promedio / 5 * 100) + '%';
+        const barraTiempo = document.getElementById('barraTiempo');
+        if (barraTiempo)
+            barraTiempo.style.width = (data.calificacion_tiempo_promedio / 5 * 100) + '%';
+        const barraRec = document.getElementById('barraRecomendacion');
+        if (barraRec)
+            barraRec.style.width = data.tasa_recomendacion + '%';
+        // Badges de tabs
+        this.setTexto('badgePendientes', String(data.total_pendientes));
+        this.setTexto('badgeRespondidas', String(data.total_respondidas));
+        this.setTexto('badgeExpiradas', String(data.total_expiradas));
     }
+    // ── Tendencia ────────────────────────────────────────────────────
     renderizarChartTendencia(data) {
         var _a;
         const ctx = (_a = document.getElementById('chartTendencia')) === null || _a === void 0 ? void 0 : _a.getContext('2d');
@@ -283,25 +280,13 @@ class DashboardEncuestas {
         });
     }
     // ── Distribución NPS ─────────────────────────────────────────────
-    cargarDistribucionNPS() {
-        const loading = document.getElementById('loadingNPS');
-        if (loading)
-            loading.classList.add('show');
-        const params = this.obtenerFiltros();
-        fetch(this.urls.nps + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            if (loading)
-                loading.classList.remove('show');
-            this.renderizarChartNPS(data);
-            const npsEl = document.getElementById('npsScoreCentral');
-            if (npsEl) {
-                npsEl.textContent = String(data.nps_score);
-                npsEl.className = 'nps-valor ' + this.claseNPS(data.nps_score);
-            }
-        })
-            .catch(() => { if (loading)
-            loading.classList.remove('show'); });
+    renderizarDistribucionNPS(data) {
+        this.renderizarChartNPS(data);
+        const npsEl = document.getElementById('npsScoreCentral');
+        if (npsEl) {
+            npsEl.textContent = String(data.nps_score);
+            npsEl.className = 'nps-valor ' + this.claseNPS(data.nps_score);
+        }
     }
     renderizarChartNPS(data) {
         var _a;
@@ -336,22 +321,6 @@ class DashboardEncuestas {
         });
     }
     // ── Por Responsable ──────────────────────────────────────────────
-    cargarPorResponsable() {
-        const loading = document.getElementById('loadingResponsables');
-        if (loading)
-            loading.classList.add('show');
-        const params = this.obtenerFiltros();
-        fetch(this.urls.responsable + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            if (loading)
-                loading.classList.remove('show');
-            this.datosResponsables = data.responsables;
-            this.renderizarChartResponsables();
-        })
-            .catch(() => { if (loading)
-            loading.classList.remove('show'); });
-    }
     renderizarChartResponsables() {
         var _a;
         const ctx = (_a = document.getElementById('chartResponsables')) === null || _a === void 0 ? void 0 : _a.getContext('2d');
@@ -603,15 +572,6 @@ class DashboardEncuestas {
         });
     }
     // ── Comentarios ──────────────────────────────────────────────────
-    cargarComentarios() {
-        const params = this.obtenerFiltros();
-        fetch(this.urls.comentarios + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            this.renderizarComentarios(data.comentarios);
-        })
-            .catch(() => { });
-    }
     renderizarComentarios(comentarios) {
         const container = document.getElementById('comentariosContainer');
         if (!container)
@@ -18,11 +18,8 @@ class DashboardFeedbackRechazo {
         if (!urlsEl)
             return;
         this.urls = {
-            kpis: urlsEl.dataset.urlKpis || '',
-            porMotivo: urlsEl.dataset.urlPorMotivo || '',
-            tendencia: urlsEl.dataset.urlTendencia || '',
+            paneles: urlsEl.dataset.urlPaneles || '',
             lista: urlsEl.dataset.urlLista || '',
-            comentarios: urlsEl.dataset.urlComentarios || '',
             analisisIA: urlsEl.dataset.urlAnalisisIa || '',
             exportar: urlsEl.dataset.urlExportar || '',
             exportarPdf: urlsEl.dataset.urlExportarPdf || '',
@@ -124,48 +121,48 @@ class DashboardFeedbackRechazo {
         this.cargarTodo();
     }
     cargarTodo() {
-        this.cargarKPIs();
-        this.cargarPorMotivo();
-        this.cargarTendencia();
+        this.cargarPaneles();
         this.cargarTabla();
-        this.cargarComentarios();
     }
-    // ── KPIs ─────────────────────────────────────────────────────────
-    cargarKPIs() {
+    // ── Paneles (KPIs, motivos, tendencia y comentarios) ─────────────
+    /**
+     * Una sola petición para todos los gráficos. El servidor responde con
+     * ETag: si los datos no cambiaron, el navegador reutiliza su copia (304).
+     */
+    cargarPaneles() {
+        const loadings = ['loadingMotivos', 'loadingTendencia']
+            .map(id => document.getElementById(id));
+        loadings.forEach(el => { if (el)
+            el.classList.add('show'); });
+        const ocultarLoadings = () => loadings.forEach(el => { if (el)
+            el.classList.remove('show'); });
         const params = this.obtenerFiltros();
-        fetch(this.urls.kpis + '?' + params.toString())
+        fetch(this.urls.paneles + '?' + params.toString())
             .then(r => r.json())
             .then((data) => {
-            this.setTexto('kpiEnviados', String(data.total_enviados));
-            this.setTexto('kpiRespondidos', String(data.total_respondidos));
-            this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
-            this.setTexto('kpiPendientes', String(data.total_pendientes));
-            this.setTexto('kpiExpirados', String(data.total_expirados));
-            this.setTexto('kpiMotivoPrincipal', data.motivo_mas_frecuente || '—');
-            this.setTexto('kpiMotivoPorcentaje', data.motivo_mas_frecuente_porcentaje ? `${data.motivo_mas_frecuente_porcentaje}% del total` : '');
-            // Badges tabs
-            this.setTexto('badgePendientes', String(data.total_pendientes));
-            this.setTexto('badgeRespondidos', String(data.total_respondidos));
-            this.setTexto('badgeExpirados', String(data.total_expirados));
+            ocultarLoadings();
+            this.renderizarKPIs(data.kpis);
+            this.renderizarChartMotivos(data.por_motivo);
+            this.renderizarChartTendencia(data.tendencia);
+            this.renderizarComentarios(data.comentarios);
         })
-            .catch(() => { });
+            .catch(() => ocultarLoadings());
     }
-    // ── Distribución por Motivo ───────────────────────────────────────
-    cargarPorMotivo() {
-        const loading = document.getElementById('loadingMotivos');
-        if (loading)
-            loading.classList.add('show');
-        const params = this.obtenerFiltros();
-        fetch(this.urls.porMotivo + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            if (loading)
-                loading.classList.remove('show');
-            this.renderizarChartMotivos(data.motivos);
-        })
-            .catch(() => { if (loading)
-            loading.classList.remove('show'); });
+    // ── KPIs ─────────────────────────────────────────────────────────
+    renderizarKPIs(data) {
+        this.setTexto('kpiEnviados', String(data.total_enviados));
+        this.setTexto('kpiRespondidos', String(data.total_respondidos));
+        this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
+        this.setTexto('kpiPendientes', String(data.total_pendientes));
+        this.setTexto('kpiExpirados', String(data.total_expirados));
+        this.setTexto('kpiMotivoPrincipal', data.motivo_mas_frecuente || '—');
+        this.setTexto('kpiMotivoPorcentaje', data.motivo_mas_frecuente_porcentaje ? `${data.motivo_mas_frecuente_porcentaje}% del total` : '');
+        // Badges tabs
+        this.setTexto('badgePendientes', String(data.total_pendientes));
+        this.setTexto('badgeRespondidos', String(data.total_respondidos));
+        this.setTexto('badgeExpirados', String(data.total_expirados));
     }
+    // ── Distribución por Motivo ───────────────────────────────────────
     renderizarChartMotivos(motivos) {
         var _a;
         const ctx = (_a = document.getElementById('chartMotivos')) === null || _a === void 0 ? void 0 : _a.getContext('2d');
@@ -226,21 +223,6 @@ class DashboardFeedbackRechazo {
         });
     }
     // ── Tendencia ─────────────────────────────────────────────────────
-    cargarTendencia() {
-        const loading = document.getElementById('loadingTendencia');
-        if (loading)
-            loading.classList.add('show');
-        const params = this.obtenerFiltros();
-        fetch(this.urls.tendencia + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            if (loading)
-                loading.classList.remove('show');
-            this.renderizarChartTendencia(data);
-        })
-            .catch(() => { if (loading)
-            loading.classList.remove('show'); });
-    }
     renderizarChartTendencia(data) {
         var _a;
         const ctx = (_a = document.getElementById('chartTendencia')) === null || _a === void 0 ? void 0 : _a.getContext('2d');
@@ -421,15 +403,6 @@ class DashboardFeedbackRechazo {
         });
     }
     // ── Comentarios ──────────────────────────────────────────────────
-    cargarComentarios() {
-        const params = this.obtenerFiltros();
-        fetch(this.urls.comentarios + '?' + params.toString())
-            .then(r => r.json())
-            .then((data) => {
-            this.renderizarComentarios(data.comentarios);
-        })
-            .catch(() => { });
-    }
     renderizarComentarios(comentarios) {
         const container = document.getElementById('comentariosContainer');
         if (!container)
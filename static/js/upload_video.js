@@ -178,6 +178,34 @@ class UploadVideo {
         this.mostrarProgreso(0, 'Subiendo…');
         this.ocultarResultado();
         this.ffmpegCont.style.display = 'none';
+        // ── Subida reanudable por bloques (subida_reanudable.ts) ──
+        // Si el navegador no puede (devuelve null) seguimos con el POST clásico.
+        const urlSubida = this.form.dataset.urlSubida;
+        const archivo = this.archivoSeleccionado;
+        if (window.subirVideoReanudable && urlSubida) {
+            window.subirVideoReanudable({
+                urlIniciar: urlSubida,
+                archivo,
+                nombre: archivo.name,
+                campos: {
+                    tipo: tipoRadio.value,
+                    descripcion: String(formData.get('descripcion') || ''),
+                },
+                onProgreso: (pct) => this.mostrarProgreso(pct, `Subiendo… ${pct}%`),
+            }).then((data) => {
+                if (data === null) {
+                    this.enviarClasico(formData);
+                }
+                else {
+                    this.mostrarRespuesta(data);
+                }
+            }).catch(() => this.enviarClasico(formData));
+            return;
+        }
+        this.enviarClasico(formData);
+    }
+    /** POST multipart de un solo request (form_type='subir_video'). */
+    enviarClasico(formData) {
         const xhr = new XMLHttpRequest();
         const url = this.form.action || window.location.href;
         // ── Progreso de upload ──
@@ -199,42 +227,18 @@ class UploadVideo {
         });
         // ── Respuesta del servidor ──
         xhr.addEventListener('load', () => {
-            this.bloquearUI(false);
-            this.progresoCont.style.display = 'none';
-            this.ffmpegCont.style.display = 'none';
+            let data;
             try {
-                const data = JSON.parse(xhr.responseText);
-                if (data.success) {
-                    if (data.task_queued) {
-                        /*
-                         * FLUJO ASÍNCRONO (Celery):
-                         * El servidor guardó el archivo en /tmp y encoló la compresión.
-                         * Mostramos el mensaje de cola y NO recargamos — el usuario
-                         * recibirá una notificación por campanita (y push si está suscrito)
-                         * cuando el video esté listo.
-                         */
-                        this.mostrarResultado(true, `✅ ${data.message || 'Video recibido. Recibirás una notificación cuando esté listo.'}`);
-                        // No recargamos: el técnico puede seguir trabajando
-                        // y el video aparecerá al recargar la página después de la notif
-                    }
-                    else {
-                        // FLUJO SÍNCRONO LEGADO: respuesta con video_id listo
-                        const ahorro = data.porcentaje_compresion != null
-                            ? ` · Compresión: −${data.porcentaje_compresion}%`
-                            : '';
-                        this.mostrarResultado(true, `✅ ${data.message || 'Video guardado.'}${ahorro}`);
-                        // Recargar para mostrar el video en la galería
-                        setTimeout(() => window.location.reload(), 1800);
-                    }
-                }
-                else {
-                    this.mostrarResultado(false, `❌ ${data.error || 'Error desconocido al guardar el video.'}`);
-                    console.error('[UploadVideo] Error:', data);
-                }
+                data = JSON.parse(xhr.responseText);
             }
             catch {
+                this.bloquearUI(false);
+                this.progresoCont.style.display = 'none';
+                this.ffmpegCont.style.display = 'none';
                 this.mostrarResultado(false, `❌ Error inesperado del servidor (código ${xhr.status}). Intenta de nuevo.`);
+                return;
             }
+            this.mostrarRespuesta(data);
         });
         // ── Error de red ──
         xhr.addEventListener('error', () => {
@@ -255,6 +259,39 @@ class UploadVideo {
         xhr.timeout = 360000; // 6 minutos
         xhr.send(formData);
     }
+    /** Muestra el resultado de la subida (clásica o reanudable). */
+    mostrarRespuesta(data) {
+        this.bloquearUI(false);
+        this.progresoCont.style.display = 'none';
+        this.ffmpegCont.style.display = 'none';
+        if (data.success) {
+            if (data.task_queued) {
+                /*
+                 * FLUJO ASÍNCRONO (Celery):
+                 * El servidor guardó el archivo en /tmp y encoló la compresión.
+                 * Mostramos el mensaje de cola y NO recargamos — el usuario
+                 * recibirá una notificación por campanita (y push si está suscrito)
+                 * cuando el video esté listo.
+                 */
+                this.mostrarResultado(true, `✅ ${data.message || 'Video recibido. Recibirás una notificación cuando esté listo.'}`);
+                // No recargamos: el técnico puede seguir trabajando
+                // y el video aparecerá al recargar la página después de la notif
+            }
+            else {
+                // FLUJO SÍNCRONO LEGADO: respuesta con video_id listo
+                const ahorro = data.porcentaje_compresion != null
+                    ? ` · Compresión: −${data.porcentaje_compresion}%`
+                    : '';
+                this.mostrarResultado(true, `✅ ${data.message || 'Video guardado.'}${ahorro}`);
+                // Recargar para mostrar el video en la galería
+                setTimeout(() => window.location.reload(), 1800);
+            }
+        }
+        else {
+            this.mostrarResultado(false, `❌ ${data.error || 'Error desconocido al guardar el video.'}`);
+            console.error('[UploadVideo] Error:', data);
+        }
+    }
     // -------------------------------------------------------------------------
     // UI helpers
     // -------------------------------------------------------------------------
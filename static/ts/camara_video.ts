@@ -512,19 +512,39 @@ class CamaraVideo {
         const nombreArchivo = `grabacion_${Date.now()}.webm`;
         formData.append('video', this.videoBlob, nombreArchivo);
 
+        // ── Subida reanudable por bloques (subida_reanudable.ts) ──
+        // Si el navegador no puede (devuelve null) seguimos con el POST clásico.
+        const formVideo = document.getElementById('form-subir-video');
+        const urlSubida = formVideo ? formVideo.dataset.urlSubida : undefined;
+        if (window.subirVideoReanudable && urlSubida) {
+            try {
+                const data = await window.subirVideoReanudable({
+                    urlIniciar: urlSubida,
+                    archivo: this.videoBlob,
+                    nombre: nombreArchivo,
+                    campos: {
+                        tipo: tipoRadio.value,
+                        descripcion: String(formData.get('descripcion') || ''),
+                        orientacion_video: String(this.cvOrientacionGrabacion),
+                    },
+                    onProgreso: (pct: number) => this.progresoSubida(pct),
+                });
+                if (data !== null) {
+                    this.procesarRespuestaSubida(data);
+                    return;
+                }
+            } catch {
+                // Falla inesperada del cliente: reintentar con el POST clásico
+            }
+        }
+
         // ── XHR — mismo patrón y timeout que upload_video.ts ──
         const xhr = new XMLHttpRequest();
 
         // Progreso de subida → actualizar barra
         xhr.upload.addEventListener('progress', (e: ProgressEvent) => {
             if (e.lengthComputable) {
-                const pct = Math.round((e.loaded / e.total) * 100);
-                this.actualizarProgressSubida(pct);
-                if (pct >= 100) {
-                    // Upload completo → FFmpeg procesando en el servidor
-                    if (this.contProgressSubida) this.contProgressSubida.style.display = 'none';
-                    if (this.contFFmpeg)         this.contFFmpeg.style.display         = 'block';
-                }
+                this.progresoSubida(Math.round((e.loaded / e.total) * 100));
             }
         });
 
@@ -532,45 +552,7 @@ class CamaraVideo {
         xhr.addEventListener('load', () => {
             try {
                 const data: CvVideoUploadResponse = JSON.parse(xhr.responseText);
-                if (data.success) {
-                    if (data.task_queued) {
-                        /*
-                         * FLUJO ASÍNCRONO (Celery):
-                         * El servidor guardó el archivo en /tmp y encoló la compresión.
-                         * Ya no esperamos a FFmpeg en el request — el usuario recibirá
-                         * una notificación por campanita (y push si está suscrito)
-                         * cuando el video esté listo.
-                         *
-                         * UX: actualizamos el spinner de FFmpeg para mostrar el estado
-                         * de "en cola", y cerramos el modal después de 3 segundos.
-                         */
-                        if (this.contFFmpeg) {
-                            this.contFFmpeg.innerHTML = `
-                                <div class="text-center py-3">
-                                    <i class="bi bi-check-circle-fill d-block mb-2" style="font-size:2rem; color:#22c55e;"></i>
-                                    <p class="mb-1 fw-semibold" style="color:#f1f5f9;">Video recibido</p>
-                                    <p class="small mb-0" style="color:#94a3b8;">
-                                        Procesando en segundo plano…<br>
-                                        Recibirás una notificación cuando esté listo.
-                                    </p>
-                                </div>
-                            `;
-                            this.contFFmpeg.style.display = 'block';
-                        }
-                        // Cerrar el modal automáticamente para que el técnico
-                        // pueda seguir trabajando — la campanita avisará cuando termine
-                        setTimeout(() => {
-                            if (this.bsModal) this.bsModal.hide();
-                        }, 3000);
-                    } else {
-                        // FLUJO SÍNCRONO LEGADO: respuesta con video_id listo
-                        // (compatibilidad hacia atrás por si se necesita en el futuro)
-                        setTimeout(() => window.location.reload(), 1200);
-                    }
-                } else {
-                    this.setEstado('preview');
-                    this.mostrarError(data.error || 'Error desconocido al guardar el video.');
-                }
+                this.procesarRespuestaSubida(data);
             } catch {
                 this.setEstado('preview');
                 this.mostrarError(
@@ -596,6 +578,59 @@ class CamaraVideo {
         xhr.send(formData);
     }
 
+    /** Barra de subida; al 100 % se muestra el spinner de FFmpeg. */
+    private progresoSubida(pct: number): void {
+        this.actualizarProgressSubida(pct);
+        if (pct >= 100) {
+            // Upload completo → FFmpeg procesando en el servidor
+            if (this.contProgressSubida) this.contProgressSubida.style.display = 'none';
+            if (this.contFFmpeg)         this.contFFmpeg.style.display         = 'block';
+        }
+    }
+
+    /** Resultado de la subida (clásica o reanudable). */
+    private procesarRespuestaSubida(data: CvVideoUploadResponse): void {
+        if (data.success) {
+            if (data.task_queued) {
+                /*
+                 * FLUJO ASÍNCRONO (Celery):
+                 * El servidor guardó el archivo en /tmp y encoló la compresión.
+                 * Ya no esperamos a FFmpeg en el request — el usuario recibirá
+                 * una notificación por campanita (y push si está suscrito)
+                 * cuando el video esté listo.
+                 *
+                 * UX: actualizamos el spinner de FFmpeg para mostrar el estado
+                 * de "en cola", y cerramos el modal después de 3 segundos.
+                 */
+                if (this.contFFmpeg) {
+                    this.contFFmpeg.innerHTML = `
+                        <div class="text-center py-3">
+                            <i class="bi bi-check-circle-fill d-block mb-2" style="font-size:2rem; color:#22c55e;"></i>
+                            <p class="mb-1 fw-semibold" style="color:#f1f5f9;">Video recibido</p>
+                            <p class="small mb-0" style="color:#94a3b8;">
+                                Procesando en segundo plano…<br>
+                                Recibirás una notificación cuando esté listo.
+                            </p>
+                        </div>
+                    `;
+                    this.contFFmpeg.style.display = 'block';
+                }
+                // Cerrar el modal automáticamente para que el técnico
+                // pueda seguir trabajando — la campanita avisará cuando termine
+                setTimeout(() => {
+                    if (this.bsModal) this.bsModal.hide();
+                }, 3000);
+            } else {
+                // FLUJO SÍNCRONO LEGADO: respuesta con video_id listo
+                // (compatibilidad hacia atrás por si se necesita en el futuro)
+                setTimeout(() => window.location.reload(), 1200);
+            }
+        } else {
+            this.setEstado('preview');
+            this.mostrarError(data.error || 'Error desconocido al guardar el video.');
+        }
+    }
+
     // ────────────────────────────────────────────────────────────────────────
     // DESCARTAR — volver a idle y reactivar stream en vivo
     // ────────────────────────────────────────────────────────────────────────
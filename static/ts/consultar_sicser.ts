@@ -24,3 +24,176 @@ if (document.readyState === 'loading') {
 } else {
     inicializarImportacionSicser();
 }
+
+// ============================================================================
+// IMPORTAR VARIAS (lote en segundo plano)
+// Servidor: views_sicser.importar_ordenes_sicser_lote / estado_importacion_sicser_lote
+// ============================================================================
+
+/**
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ * El formulario se manda con fetch (no recarga la página). El servidor
+ * responde 202 con la URL de estado y aquí se consulta cada 2 s hasta que
+ * la tarea termina; entonces se pinta una fila por folio.
+ */
+
+interface FilaLoteSicser {
+    identificador: string;
+    estado: 'creada' | 'duplicada' | 'error';
+    mensaje: string;
+    orden_id: number | null;
+    numero_orden_interno: string;
+}
+
+interface EstadoLoteSicser {
+    listo: boolean;
+    porcentaje: number;
+    error?: string;
+    filas?: FilaLoteSicser[];
+    creadas?: number;
+    duplicadas?: number;
+    errores?: number;
+}
+
+const INTERVALO_ESTADO_LOTE_MS = 2000;
+
+const CLASES_ESTADO_LOTE: Record<FilaLoteSicser['estado'], string> = {
+    creada: 'bg-success',
+    duplicada: 'bg-secondary',
+    error: 'bg-danger',
+};
+
+function inicializarImportacionLoteSicser(): void {
+    const formulario = document.querySelector<HTMLFormElement>('form.js-sicser-lote-form');
+    const panel = document.getElementById('sicser-lote');
+    if (!formulario || !panel) {
+        return;
+    }
+    const textarea = formulario.querySelector<HTMLTextAreaElement>('textarea[name="identificadores"]');
+    const botonEnviar = formulario.querySelector<HTMLButtonElement>('.js-sicser-lote-enviar');
+    const botonPendientes = formulario.querySelector<HTMLButtonElement>('.js-sicser-lote-pendientes');
+    const progreso = panel.querySelector<HTMLElement>('.js-sicser-lote-progreso');
+    const barra = progreso?.querySelector<HTMLElement>('.progress-bar') ?? null;
+    const mensaje = panel.querySelector<HTMLElement>('.js-sicser-lote-mensaje');
+    const resultados = panel.querySelector<HTMLElement>('.js-sicser-lote-resultados');
+    const urlOrden = formulario.dataset.urlOrden || '';
+
+    botonPendientes?.addEventListener('click', (): void => {
+        if (textarea) {
+            textarea.value = (botonPendientes.dataset.pendientes || '').trim().split(/\s+/).join('\n');
+        }
+    });
+
+    function mostrarAvance(porcentaje: number): void {
+        progreso?.classList.remove('d-none');
+        if (barra) {
+            barra.style.width = `${porcentaje}%`;
+        }
+    }
+
+    function mostrarMensaje(texto: string, clase: string): void {
+        if (mensaje) {
+            mensaje.className = `small mt-2 mb-0 js-sicser-lote-mensaje ${clase}`;
+            mensaje.textContent = texto;
+        }
+    }
+
+    function pintarFilas(filas: FilaLoteSicser[]): void {
+        const cuerpo = resultados?.querySelector('tbody');
+        if (!resultados || !cuerpo) {
+            return;
+        }
+        cuerpo.replaceChildren(...filas.map((fila: FilaLoteSicser): HTMLTableRowElement => {
+            const tr = document.createElement('tr');
+            const folio = document.createElement('td');
+            const codigo = document.createElement('code');
+            codigo.textContent = fila.identificador;
+            folio.append(codigo);
+            const resultado = document.createElement('td');
+            const badge = document.createElement('span');
+            badge.className = `badge ${CLASES_ESTADO_LOTE[fila.estado]} me-1`;
+            badge.textContent = fila.estado;
+            resultado.append(badge, document.createTextNode(fila.mensaje));
+            const orden = document.createElement('td');
+            if (fila.orden_id) {
+                const enlace = document.createElement('a');
+                enlace.href = urlOrden.replace('/0/', `/${fila.orden_id}/`);
+                enlace.textContent = fila.numero_orden_interno;
+                orden.append(enlace);
+            }
+            tr.append(folio, resultado, orden);
+            return tr;
+        }));
+        resultados.classList.remove('d-none');
+    }
+
+    async function consultarEstado(url: string): Promise<void> {
+        let estado: EstadoLoteSicser;
+        try {
+            const respuesta = await fetch(url, { headers: { 'X-Requested-With': 'XMLHttpRequest' } });
+            estado = await respuesta.json();
+        } catch {
+            // Corte momentáneo: se vuelve a preguntar en el siguiente ciclo
+            window.setTimeout(() => consultarEstado(url), INTERVALO_ESTADO_LOTE_MS);
+            return;
+        }
+        mostrarAvance(estado.porcentaje);
+        if (!estado.listo) {
+            window.setTimeout(() => consultarEstado(url), INTERVALO_ESTADO_LOTE_MS);
+            return;
+        }
+
+        if (botonEnviar) {
+            botonEnviar.disabled = false;
+        }
+        if (estado.error) {
+            mostrarMensaje(estado.error, 'text-danger');
+            return;
+        }
+        mostrarMensaje(
+            `${estado.creadas} creadas · ${estado.duplicadas} ya existían · ${estado.errores} con error.`,
+            estado.errores ? 'text-warning' : 'text-success',
+        );
+        pintarFilas(estado.filas || []);
+    }
+
+    formulario.addEventListener('submit', async (evento: SubmitEvent): Promise<void> => {
+        evento.preventDefault();
+        const campoSucursal = formulario.querySelector<HTMLInputElement>('.js-sicser-sucursal');
+        const selectorSucursal = document.querySelector<HTMLSelectElement>('#sicser-sucursal-import');
+        if (campoSucursal && selectorSucursal) {
+            campoSucursal.value = selectorSucursal.value;
+        }
+        if (botonEnviar) {
+            botonEnviar.disabled = true;
+        }
+        resultados?.classList.add('d-none');
+        mostrarAvance(0);
+        mostrarMensaje('Importando en segundo plano… puede seguir trabajando; le avisaremos en la campanita.', 'text-muted');
+
+        try {
+            const respuesta = await fetch(formulario.action, {
+                method: 'POST',
+                body: new FormData(formulario),
+                headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            });
+            const datos = await respuesta.json();
+            if (respuesta.status !== 202) {
+                throw new Error(datos.error || `Código ${respuesta.status}`);
+            }
+            consultarEstado(datos.url_estado);
+        } catch (error) {
+            if (botonEnviar) {
+                botonEnviar.disabled = false;
+            }
+            progreso?.classList.add('d-none');
+            mostrarMensaje(`No se pudo iniciar la importación: ${(error as Error).message}`, 'text-danger');
+        }
+    });
+}
+
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', inicializarImportacionLoteSicser);
+} else {
+    inicializarImportacionLoteSicser();
+}
@@ -88,6 +88,15 @@ interface ComentarioItem {
 
 // ── Análisis de Sentimiento IA ─────────────────────────────────────────────
 
+/** Respuesta de /encuestas/api/paneles/: todos los gráficos en un JSON. */
+interface PanelesData {
+    kpis: KPIsData;
+    tendencia: TendenciaData;
+    responsables: ResponsableItem[];
+    distribucion_nps: NPSDistribucion;
+    comentarios: ComentarioItem[];
+}
+
 interface AnalisisIAData {
     success: boolean;
     desde_cache?: boolean;
@@ -121,12 +130,8 @@ class DashboardEncuestas {
         if (!urlsEl) return;
 
         this.urls = {
-            kpis: urlsEl.dataset.urlKpis || '',
-            tendencia: urlsEl.dataset.urlTendencia || '',
-            responsable: urlsEl.dataset.urlResponsable || '',
-            nps: urlsEl.dataset.urlNps || '',
+            paneles: urlsEl.dataset.urlPaneles || '',
             lista: urlsEl.dataset.urlLista || '',
-            comentarios: urlsEl.dataset.urlComentarios || '',
             exportar: urlsEl.dataset.urlExportar || '',
             exportarPdf: urlsEl.dataset.urlExportarPdf || '',
             analisisIA: urlsEl.dataset.urlAnalisisIa || '',
@@ -238,75 +243,78 @@ class DashboardEncuestas {
     }
 
     private cargarTodo(): void {
-        this.cargarKPIs();
-        this.cargarTendencia();
-        this.cargarDistribucionNPS();
-        this.cargarPorResponsable();
+        this.cargarPaneles();
         this.cargarTabla();
-        this.cargarComentarios();
     }
 
-    // ── KPIs ─────────────────────────────────────────────────────────
+    // ── Paneles (KPIs, tendencia, NPS, responsables y comentarios) ───
+
+    /**
+     * Una sola petición para todos los gráficos. El servidor responde con
+     * ETag: si los datos no cambiaron, el navegador reutiliza su copia (304).
+     */
+    private cargarPaneles(): void {
+        const loadings = ['loadingTendencia', 'loadingNPS', 'loadingResponsables']
+            .map(id => document.getElementById(id));
+        loadings.forEach(el => { if (el) el.classList.add('show'); });
+        const ocultarLoadings = () => loadings.forEach(el => { if (el) el.classList.remove('show'); });
 
-    private cargarKPIs(): void {
         const params = this.obtenerFiltros();
-        fetch(this.urls.kpis + '?' + params.toString())
+        fetch(this.urls.paneles + '?' + params.toString())
             .then(r => r.json())
-            .then((data: KPIsData) => {
-                this.setTexto('kpiEnviadas', String(data.total_enviadas));
-                this.setTexto('kpiRespondidas', String(data.total_respondidas));
-                this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
-                this.setTexto('kpiPendientes', String(data.total_pendientes));
-                this.setTexto('kpiExpiradas', String(data.total_expiradas));
-
-                // NPS Score con color semáforo
-                const npsEl = document.getElementById('kpiNPSScore');
-                if (npsEl) {
-                    npsEl.textContent = String(data.nps_score);
-                    npsEl.className = 'kpi-valor ' + this.claseNPS(data.nps_score);
-                }
-
-                // Calificación con estrellas
-                this.setTexto('kpiCalificacion', data.calificacion_promedio.toFixed(1));
-                const estrellasEl = document.getElementById('kpiEstrellas');
-                if (estrellasEl) estrellasEl.innerHTML = this.renderizarEstrellas(data.calificacion_promedio);
-
-                // Sub-métricas
-                this.setTexto('subCalAtencion', data.calificacion_atencion_promedio.toFixed(1) + ' / 5');
-                this.setTexto('subCalTiempo', data.calificacion_tiempo_promedio.toFixed(1) + ' / 5');
-                this.setTexto('subTasaRec', data.tasa_recomendacion + '%');
-
-                const barraAtencion = document.getElementById('barraAtencion');
-                if (barraAtencion) barraAtencion.style.width = (data.calificacion_atencion_promedio / 5 * 100) + '%';
-                const barraTiempo = document.getElementById('barraTiempo');
-                if (barraTiempo) barraTiempo.style.width = (data.calificacion_tiempo_promedio / 5 * 100) + '%';
-                const barraRec = document.getElementById('barraRecomendacion');
-                if (barraRec) barraRec.style.width = data.tasa_recomendacion + '%';
-
-                // Badges de tabs
-                this.setTexto('badgePendientes', String(data.total_pendientes));
-                this.setTexto('badgeRespondidas', String(data.total_respondidas));
-                this.setTexto('badgeExpiradas', String(data.total_expiradas));
+            .then((data: PanelesData) => {
+                ocultarLoadings();
+                this.renderizarKPIs(data.kpis);
+                this.renderizarChartTendencia(data.tendencia);
+                this.renderizarDistribucionNPS(data.distribucion_nps);
+                this.datosResponsables = data.responsables;
+                this.renderizarChartResponsables();
+                this.renderizarComentarios(data.comentarios);
             })
-            .catch(() => {});
+            .catch(() => ocultarLoadings());
     }
 
-    // ── Tendencia ────────────────────────────────────────────────────
+    // ── KPIs ─────────────────────────────────────────────────────────
 
-    private cargarTendencia(): void {
-        const loading = document.getElementById('loadingTendencia');
-        if (loading) loading.classList.add('show');
+    private renderizarKPIs(data: KPIsData): void {
+        this.setTexto('kpiEnviadas', String(data.total_enviadas));
+        this.setTexto('kpiRespondidas', String(data.total_respondidas));
+        this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
+        this.setTexto('kpiPendientes', String(data.total_pendientes));
+        this.setTexto('kpiExpiradas', String(data.total_expiradas));
+
+        // NPS Score con color semáforo
+        const npsEl = document.getElementById('kpiNPSScore');
+        if (npsEl) {
+            npsEl.textContent = String(data.nps_score);
+            npsEl.className = 'kpi-valor ' + this.claseNPS(data.nps_score);
+        }
 
-        const params = this.obtenerFiltros();
-        fetch(this.urls.tendencia + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: TendenciaData) => {
-                if (loading) loading.classList.remove('show');
-                this.renderizarChartTendencia(data);
-            })
-            .catch(() => { if (loading) loading.classList.remove('show'); });
+        // Calificación con estrellas
+        this.setTexto('kpiCalificacion', data.calificacion_promedio.toFixed(1));
+        const estrellasEl = document.getElementById('kpiEstrellas');
+        if (estrellasEl) estrellasEl.innerHTML = this.renderizarEstrellas(data.calificacion_promedio);
+
+        // Sub-métricas
+        this.setTexto('subCalAtencion', data.calificacion_atencion_promedio.toFixed(1) + ' / 5');
+        this.setTexto('subCalTiempo', data.calificacion_tiempo_promedio.toFixed(1) + ' / 5');
+        this.setTexto('subTasaRec', data.tasa_recomendacion + '%');
+
+        const barraAtencion = document.getElementById('barraAtencion');
+        if (barraAtencion) barraAtencion.style.width = (data.calificacion_atencion_promedio / 5 * 100) + '%';
+        const barraTiempo = document.getElementById('barraTiempo');
+        if (barraTiempo) barraTiempo.style.width = (data.calificacion_tiempo_promedio / 5 * 100) + '%';
+        const barraRec = document.getElementById('barraRecomendacion');
+        if (barraRec) barraRec.style.width = data.tasa_recomendacion + '%';
+
+        // Badges de tabs
+        this.setTexto('badgePendientes', String(data.total_pendientes));
+        this.setTexto('badgeRespondidas', String(data.total_respondidas));
+        this.setTexto('badgeExpiradas', String(data.total_expiradas));
     }
 
+    // ── Tendencia ────────────────────────────────────────────────────
+
     private renderizarChartTendencia(data: TendenciaData): void {
         const ctx = (document.getElementById('chartTendencia') as HTMLCanvasElement)?.getContext('2d');
         if (!ctx) return;
@@ -395,24 +403,14 @@ class DashboardEncuestas {
 
     // ── Distribución NPS ─────────────────────────────────────────────
 
-    private cargarDistribucionNPS(): void {
-        const loading = document.getElementById('loadingNPS');
-        if (loading) loading.classList.add('show');
-
-        const params = this.obtenerFiltros();
-        fetch(this.urls.nps + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: NPSDistribucion) => {
-                if (loading) loading.classList.remove('show');
-                this.renderizarChartNPS(data);
+    private renderizarDistribucionNPS(data: NPSDistribucion): void {
+        this.renderizarChartNPS(data);
 
-                const npsEl = document.getElementById('npsScoreCentral');
-                if (npsEl) {
-                    npsEl.textContent = String(data.nps_score);
-                    npsEl.className = 'nps-valor ' + this.claseNPS(data.nps_score);
-                }
-            })
-            .catch(() => { if (loading) loading.classList.remove('show'); });
+        const npsEl = document.getElementById('npsScoreCentral');
+        if (npsEl) {
+            npsEl.textContent = String(data.nps_score);
+            npsEl.className = 'nps-valor ' + this.claseNPS(data.nps_score);
+        }
     }
 
     private renderizarChartNPS(data: NPSDistribucion): void {
@@ -449,21 +447,6 @@ class DashboardEncuestas {
 
     // ── Por Responsable ──────────────────────────────────────────────
 
-    private cargarPorResponsable(): void {
-        const loading = document.getElementById('loadingResponsables');
-        if (loading) loading.classList.add('show');
-
-        const params = this.obtenerFiltros();
-        fetch(this.urls.responsable + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: { responsables: ResponsableItem[] }) => {
-                if (loading) loading.classList.remove('show');
-                this.datosResponsables = data.responsables;
-                this.renderizarChartResponsables();
-            })
-            .catch(() => { if (loading) loading.classList.remove('show'); });
-    }
-
     private renderizarChartResponsables(): void {
         const ctx = (document.getElementById('chartResponsables') as HTMLCanvasElement)?.getContext('2d');
         if (!ctx) return;
@@ -725,16 +708,6 @@ class DashboardEncuestas {
 
     // ── Comentarios ──────────────────────────────────────────────────
 
-    private cargarComentarios(): void {
-        const params = this.obtenerFiltros();
-        fetch(this.urls.comentarios + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: { comentarios: ComentarioItem[] }) => {
-                this.renderizarComentarios(data.comentarios);
-            })
-            .catch(() => {});
-    }
-
     private renderizarComentarios(comentarios: ComentarioItem[]): void {
         const container = document.getElementById('comentariosContainer');
         if (!container) return;
@@ -61,6 +61,14 @@ interface FbrComentarioItem {
     fecha: string;
 }
 
+/** Respuesta de /feedback-rechazo/api/paneles/: todos los gráficos en un JSON. */
+interface FbrPanelesData {
+    kpis: FbrKPIsData;
+    por_motivo: FbrMotivoItem[];
+    tendencia: FbrTendenciaData;
+    comentarios: FbrComentarioItem[];
+}
+
 /** Respuesta del endpoint de análisis de sentimiento (rechazo). */
 interface FbrAnalisisIAData {
     success: boolean;
@@ -92,11 +100,8 @@ class DashboardFeedbackRechazo {
         if (!urlsEl) return;
 
         this.urls = {
-            kpis: urlsEl.dataset.urlKpis || '',
-            porMotivo: urlsEl.dataset.urlPorMotivo || '',
-            tendencia: urlsEl.dataset.urlTendencia || '',
+            paneles: urlsEl.dataset.urlPaneles || '',
             lista: urlsEl.dataset.urlLista || '',
-            comentarios: urlsEl.dataset.urlComentarios || '',
             analisisIA: urlsEl.dataset.urlAnalisisIa || '',
             exportar: urlsEl.dataset.urlExportar || '',
             exportarPdf: urlsEl.dataset.urlExportarPdf || '',
@@ -204,52 +209,54 @@ class DashboardFeedbackRechazo {
     }
 
     private cargarTodo(): void {
-        this.cargarKPIs();
-        this.cargarPorMotivo();
-        this.cargarTendencia();
+        this.cargarPaneles();
         this.cargarTabla();
-        this.cargarComentarios();
     }
 
-    // ── KPIs ─────────────────────────────────────────────────────────
+    // ── Paneles (KPIs, motivos, tendencia y comentarios) ─────────────
+
+    /**
+     * Una sola petición para todos los gráficos. El servidor responde con
+     * ETag: si los datos no cambiaron, el navegador reutiliza su copia (304).
+     */
+    private cargarPaneles(): void {
+        const loadings = ['loadingMotivos', 'loadingTendencia']
+            .map(id => document.getElementById(id));
+        loadings.forEach(el => { if (el) el.classList.add('show'); });
+        const ocultarLoadings = () => loadings.forEach(el => { if (el) el.classList.remove('show'); });
 
-    private cargarKPIs(): void {
         const params = this.obtenerFiltros();
-        fetch(this.urls.kpis + '?' + params.toString())
+        fetch(this.urls.paneles + '?' + params.toString())
             .then(r => r.json())
-            .then((data: FbrKPIsData) => {
-                this.setTexto('kpiEnviados', String(data.total_enviados));
-                this.setTexto('kpiRespondidos', String(data.total_respondidos));
-                this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
-                this.setTexto('kpiPendientes', String(data.total_pendientes));
-                this.setTexto('kpiExpirados', String(data.total_expirados));
-                this.setTexto('kpiMotivoPrincipal', data.motivo_mas_frecuente || '—');
-                this.setTexto('kpiMotivoPorcentaje', data.motivo_mas_frecuente_porcentaje ? `${data.motivo_mas_frecuente_porcentaje}% del total` : '');
-
-                // Badges tabs
-                this.setTexto('badgePendientes', String(data.total_pendientes));
-                this.setTexto('badgeRespondidos', String(data.total_respondidos));
-                this.setTexto('badgeExpirados', String(data.total_expirados));
+            .then((data: FbrPanelesData) => {
+                ocultarLoadings();
+                this.renderizarKPIs(data.kpis);
+                this.renderizarChartMotivos(data.por_motivo);
+                this.renderizarChartTendencia(data.tendencia);
+                this.renderizarComentarios(data.comentarios);
             })
-            .catch(() => {});
+            .catch(() => ocultarLoadings());
     }
 
-    // ── Distribución por Motivo ───────────────────────────────────────
-
-    private cargarPorMotivo(): void {
-        const loading = document.getElementById('loadingMotivos');
-        if (loading) loading.classList.add('show');
+    // ── KPIs ─────────────────────────────────────────────────────────
 
-        const params = this.obtenerFiltros();
-        fetch(this.urls.porMotivo + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: { motivos: FbrMotivoItem[] }) => {
-                if (loading) loading.classList.remove('show');
-                this.renderizarChartMotivos(data.motivos);
-            })
-            .catch(() => { if (loading) loading.classList.remove('show'); });
+    private renderizarKPIs(data: FbrKPIsData): void {
+        this.setTexto('kpiEnviados', String(data.total_enviados));
+        this.setTexto('kpiRespondidos', String(data.total_respondidos));
+        this.setTexto('kpiTasaRespuesta', `${data.tasa_respuesta}% tasa de respuesta`);
+        this.setTexto('kpiPendientes', String(data.total_pendientes));
+        this.setTexto('kpiExpirados', String(data.total_expirados));
+        this.setTexto('kpiMotivoPrincipal', data.motivo_mas_frecuente || '—');
+        this.setTexto('kpiMotivoPorcentaje', data.motivo_mas_frecuente_porcentaje ? `${data.motivo_mas_frecuente_porcentaje}% del total` : '');
+
+        // Badges tabs
+        this.setTexto('badgePendientes', String(data.total_pendientes));
+        this.setTexto('badgeRespondidos', String(data.total_respondidos));
+        this.setTexto('badgeExpirados', String(data.total_expirados));
     }
 
+    // ── Distribución por Motivo ───────────────────────────────────────
+
     private renderizarChartMotivos(motivos: FbrMotivoItem[]): void {
         const ctx = (document.getElementById('chartMotivos') as HTMLCanvasElement)?.getContext('2d');
         if (!ctx) return;
@@ -312,20 +319,6 @@ class DashboardFeedbackRechazo {
 
     // ── Tendencia ─────────────────────────────────────────────────────
 
-    private cargarTendencia(): void {
-        const loading = document.getElementById('loadingTendencia');
-        if (loading) loading.classList.add('show');
-
-        const params = this.obtenerFiltros();
-        fetch(this.urls.tendencia + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: FbrTendenciaData) => {
-                if (loading) loading.classList.remove('show');
-                this.renderizarChartTendencia(data);
-            })
-            .catch(() => { if (loading) loading.classList.remove('show'); });
-    }
-
     private renderizarChartTendencia(data: FbrTendenciaData): void {
         const ctx = (document.getElementById('chartTendencia') as HTMLCanvasElement)?.getContext('2d');
         if (!ctx) return;
@@ -515,16 +508,6 @@ class DashboardFeedbackRechazo {
 
     // ── Comentarios ──────────────────────────────────────────────────
 
-    private cargarComentarios(): void {
-        const params = this.obtenerFiltros();
-        fetch(this.urls.comentarios + '?' + params.toString())
-            .then(r => r.json())
-            .then((data: { comentarios: FbrComentarioItem[] }) => {
-                this.renderizarComentarios(data.comentarios);
-            })
-            .catch(() => {});
-    }
-
     private renderizarComentarios(comentarios: FbrComentarioItem[]): void {
         const container = document.getElementById('comentariosContainer');
         if (!container) return;
@@ -12,6 +12,25 @@ interface AbrirScannerCodigoOpciones {
     tituloModal?: string;
 }
 
+/** Subida reanudable de videos (static/ts/subida_reanudable.ts). */
+interface OpcionesSubidaReanudable {
+    /** URL de iniciar_subida_video de la orden */
+    urlIniciar: string;
+    archivo: Blob;
+    nombre: string;
+    /** tipo, descripcion, orientacion_video */
+    campos: Record<string, string>;
+    onProgreso?: (porcentaje: number) => void;
+}
+
+interface RespuestaSubidaReanudable {
+    success: boolean;
+    task_queued?: boolean;
+    message?: string;
+    error?: string;
+    form_errors?: Record<string, string[]>;
+}
+
 interface Window {
     sigmaLoader: InstanceType<typeof DashboardLoader> | null;
     /** Abre modal de cámara y escribe el código detectado en un input */
@@ -21,6 +40,8 @@ interface Window {
      * Definido en static/ts/csrf.ts y cargado desde base.html.
      */
     getCsrfToken?: () => string;
+    /** Sube un video por bloques; null si el navegador no puede (usar POST clásico) */
+    subirVideoReanudable?: (opciones: OpcionesSubidaReanudable) => Promise<RespuestaSubidaReanudable | null>;
     /** Venta mostrador (static/ts/venta_mostrador.ts) — onclick del detalle de orden */
     abrirModalVentaMostrador?: () => void;
     abrirModalPiezaVentaMostrador?: (esEdicion?: boolean, piezaId?: number | null) => void;
@@ -0,0 +1,170 @@
+// ============================================================================
+// SUBIDA REANUDABLE DE VIDEOS (por bloques)
+// Servidor: servicio_tecnico/views_subidas_reanudables.py
+// ============================================================================
+
+/**
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ *
+ * Con el Wi-Fi del taller, subir un video de 90 MB en un solo request falla
+ * seguido y hay que empezar de cero. Aquí el archivo se manda en bloques
+ * (PATCH de ~8 MB). Si un bloque falla, se pregunta al servidor cuántos bytes
+ * tiene (HEAD → header Upload-Offset) y se sigue desde ahí, con esperas
+ * crecientes entre intentos (1 s, 2 s, 4 s… hasta 30 s).
+ *
+ * Antes de empezar se calcula el SHA-256 del archivo; el servidor lo compara
+ * antes de comprimir (en la tarea), así un bloque dañado no termina como evidencia.
+ *
+ * Uso (upload_video.ts y camara_video.ts):
+ *     const data = await window.subirVideoReanudable({ urlIniciar, archivo, nombre, campos, onProgreso });
+ * Devuelve null si el navegador no puede (sin crypto.subtle, p. ej. HTTP sin
+ * TLS): el que llama usa entonces la subida clásica de un solo POST.
+ */
+
+(function inicializarSubidaReanudable(): void {
+    const MAX_INTENTOS = 8;
+    const ESPERA_MAX_MS = 30000;
+    const TIMEOUT_BLOQUE_MS = 120000;
+
+    interface RespuestaXhr {
+        status: number;
+        data: RespuestaSubidaReanudable & { offset?: number; id?: string; url?: string; bloque_max?: number };
+    }
+
+    function cabecerasBase(): Record<string, string> {
+        return {
+            'X-Requested-With': 'XMLHttpRequest',
+            'X-CSRFToken': window.getCsrfToken ? window.getCsrfToken() : '',
+        };
+    }
+
+    /** Un request con XHR (para tener progreso de subida). status 0 = error de red. */
+    function enviar(
+        metodo: string,
+        url: string,
+        cuerpo: Blob | FormData | null,
+        cabeceras: Record<string, string>,
+        onSubido?: (bytes: number) => void,
+    ): Promise<RespuestaXhr> {
+        return new Promise((resolve) => {
+            const xhr = new XMLHttpRequest();
+            xhr.open(metodo, url);
+            xhr.timeout = TIMEOUT_BLOQUE_MS;
+            Object.entries({ ...cabecerasBase(), ...cabeceras }).forEach(([k, v]) => xhr.setRequestHeader(k, v));
+            if (onSubido) {
+                xhr.upload.addEventListener('progress', (e: ProgressEvent) => onSubido(e.loaded));
+            }
+            xhr.addEventListener('load', () => {
+                let data = {} as RespuestaXhr['data'];
+                try {
+                    data = JSON.parse(xhr.responseText || '{}');
+                } catch {
+                    // Respuesta no JSON (proxy, 502): se trata como error reintentable
+                }
+                const offset = xhr.getResponseHeader('Upload-Offset');
+                if (offset !== null && data.offset === undefined) {
+                    data.offset = parseInt(offset, 10);
+                }
+                resolve({ status: xhr.status, data });
+            });
+            xhr.addEventListener('error', () => resolve({ status: 0, data: {} as RespuestaXhr['data'] }));
+            xhr.addEventListener('timeout', () => resolve({ status: 0, data: {} as RespuestaXhr['data'] }));
+            xhr.send(cuerpo);
+        });
+    }
+
+    async function sha256Hex(archivo: Blob): Promise<string> {
+        const huella = await crypto.subtle.digest('SHA-256', await archivo.arrayBuffer());
+        return Array.from(new Uint8Array(huella)).map(b => b.toString(16).padStart(2, '0')).join('');
+    }
+
+    function esperar(ms: number): Promise<void> {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    /**
+     * Se reintenta si no hubo respuesta, si la dio un intermediario (502/504
+     * de Cloudflare, sin JSON) o si un envío anterior de la misma subida sigue
+     * escribiendo (423). Cualquier otro error en JSON de la vista es definitivo.
+     */
+    function esReintentable(r: RespuestaXhr): boolean {
+        return r.status === 0 || r.status === 423
+            || (r.data.success === undefined && (r.status === 429 || r.status >= 500));
+    }
+
+    async function subirVideoReanudable(
+        opciones: OpcionesSubidaReanudable,
+    ): Promise<RespuestaSubidaReanudable | null> {
+        if (!window.crypto || !crypto.subtle || !opciones.urlIniciar) {
+            return null;
+        }
+        const { archivo, nombre, campos, onProgreso } = opciones;
+        const tamano = archivo.size;
+
+        // ── 1. Crear la subida ──
+        const datos = new FormData();
+        Object.entries(campos).forEach(([k, v]) => datos.append(k, v));
+        datos.append('nombre', nombre);
+        datos.append('tamano', String(tamano));
+        datos.append('content_type', archivo.type || '');
+        datos.append('sha256', await sha256Hex(archivo));
+
+        const creada = await enviar('POST', opciones.urlIniciar, datos, {});
+        if (creada.status !== 201 || !creada.data.url) {
+            return {
+                success: false,
+                error: creada.data.error || `No se pudo iniciar la subida (código ${creada.status}).`,
+                form_errors: creada.data.form_errors,
+            };
+        }
+        const url = creada.data.url;
+        const bloque = creada.data.bloque_max || 8 * 1024 * 1024;
+
+        // ── 2. Mandar bloques desde el offset del servidor ──
+        let offset = 0;
+        let intentos = 0;
+        while (true) {
+            const fin = Math.min(offset + bloque, tamano);
+            const base = offset;
+            const r = await enviar(
+                'PATCH', url, archivo.slice(offset, fin),
+                { 'Content-Type': 'application/offset+octet-stream', 'Upload-Offset': String(offset) },
+                (bytes) => onProgreso && onProgreso(Math.round(((base + bytes) / tamano) * 100)),
+            );
+
+            if (r.status === 200 && r.data.task_queued !== undefined) {
+                return r.data;  // último bloque: video completo y encolado
+            }
+            if (r.status === 200 && typeof r.data.offset === 'number') {
+                offset = r.data.offset;
+                intentos = 0;
+                continue;
+            }
+            if (r.status === 409 && typeof r.data.offset === 'number') {
+                offset = r.data.offset;  // el servidor tenía otra cosa: seguir desde ahí
+                continue;
+            }
+            if (!esReintentable(r) || ++intentos > MAX_INTENTOS) {
+                return {
+                    success: false,
+                    error: r.data.error || 'Error de conexión. Verifica tu internet e intenta de nuevo.',
+                };
+            }
+
+            // ── 3. Reintento: esperar y preguntar cuántos bytes llegaron ──
+            await esperar(Math.min(1000 * 2 ** (intentos - 1), ESPERA_MAX_MS));
+            const estado = await enviar('HEAD', url, null, {});
+            if (estado.status === 200 && typeof estado.data.offset === 'number') {
+                offset = estado.data.offset;
+            } else if (estado.status === 404 && fin === tamano) {
+                // Se perdió la respuesta del último bloque, pero el servidor
+                // ya encoló el video (por eso la subida ya no existe)
+                return { success: true, task_queued: true };
+            } else if (estado.status === 404) {
+                return { success: false, error: 'La subida venció en el servidor. Vuelve a intentarlo.' };
+            }
+        }
+    }
+
+    window.subirVideoReanudable = subirVideoReanudable;
+})();
@@ -0,0 +1,396 @@
+"use strict";
+/* =============================================================================
+   JAVASCRIPT BASE - Sistema de Inventario
+   Descripción: Funciones JavaScript globales y utilidades del sistema
+   ============================================================================= */
+// Auto-hide de mensajes después de 5 segundos
+document.addEventListener('DOMContentLoaded', function () {
+    // Configurar auto-hide de alertas
+    setTimeout(function () {
+        var alerts = document.querySelectorAll('.alert');
+        alerts.forEach(function (alert) {
+            if (alert.classList.contains('show')) {
+                var bsAlert = new bootstrap.Alert(alert);
+                bsAlert.close();
+            }
+        });
+    }, 5000);
+    // Inicializar tooltips de Bootstrap
+    var tooltipTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="tooltip"]'));
+    var tooltipList = tooltipTriggerList.map(function (tooltipTriggerEl) {
+        return new bootstrap.Tooltip(tooltipTriggerEl);
+    });
+    // Inicializar popovers de Bootstrap
+    var popoverTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="popover"]'));
+    var popoverList = popoverTriggerList.map(function (popoverTriggerEl) {
+        return new bootstrap.Popover(popoverTriggerEl);
+    });
+});
+// Funciones globales para el sistema
+/**
+ * Función para confirmar eliminaciones
+ * @param {string} mensaje - Mensaje personalizado de confirmación
+ * @returns {boolean} - true si el usuario confirma
+ */
+function confirmarEliminacion(mensaje = '¿Estás seguro de que quieres eliminar este elemento?') {
+    return confirm(mensaje);
+}
+/**
+ * Función para mostrar notificaciones toast
+ * @param {string} mensaje - Mensaje a mostrar
+ * @param {string} tipo - Tipo de notificación (success, error, warning, info)
+ */
+function mostrarNotificacion(mensaje, tipo = 'info') {
+    // Crear elemento toast
+    const toastHtml = `
+        <div class="toast align-items-center text-white bg-${tipo === 'error' ? 'danger' : tipo}" role="alert" aria-live="assertive" aria-atomic="true">
+            <div class="d-flex">
+                <div class="toast-body">
+                    ${mensaje}
+                </div>
+                <button type="button" class="btn-close btn-close-white me-2 m-auto" data-bs-dismiss="toast"></button>
+            </div>
+        </div>
+    `;
+    // Agregar al contenedor de toasts (si existe)
+    let toastContainer = document.getElementById('toast-container');
+    if (!toastContainer) {
+        toastContainer = document.createElement('div');
+        toastContainer.id = 'toast-container';
+        toastContainer.className = 'toast-container position-fixed top-0 end-0 p-3';
+        document.body.appendChild(toastContainer);
+    }
+    toastContainer.innerHTML = toastHtml;
+    const toastElement = toastContainer.querySelector('.toast');
+    if (toastElement) {
+        const toast = new bootstrap.Toast(toastElement);
+        toast.show();
+    }
+}
+/**
+ * Función para formatear números con separadores de miles
+ * @param {number} numero - Número a formatear
+ * @returns {string} - Número formateado
+ */
+function formatearNumero(numero) {
+    return numero.toString().replace(/\B(?=(\d{3})+(?!\d))/g, ",");
+}
+/**
+ * Función para validar formularios antes de envío
+ * @param {HTMLFormElement} formulario - Formulario a validar
+ * @returns {boolean} - true si es válido
+ */
+function validarFormulario(formulario) {
+    let esValido = true;
+    const camposRequeridos = formulario.querySelectorAll('[required]');
+    camposRequeridos.forEach(function (campo) {
+        const inputElement = campo;
+        if (!inputElement.value.trim()) {
+            inputElement.classList.add('is-invalid');
+            esValido = false;
+        }
+        else {
+            inputElement.classList.remove('is-invalid');
+            inputElement.classList.add('is-valid');
+        }
+    });
+    return esValido;
+}
+/**
+ * Función para limpiar validaciones de formulario
+ * @param {HTMLFormElement} formulario - Formulario a limpiar
+ */
+function limpiarValidaciones(formulario) {
+    const campos = formulario.querySelectorAll('.form-control, .form-select');
+    campos.forEach(function (campo) {
+        campo.classList.remove('is-valid', 'is-invalid');
+    });
+}
+// Event listeners globales
+document.addEventListener('DOMContentLoaded', function () {
+    // Agregar confirmación a botones de eliminar
+    const botonesEliminar = document.querySelectorAll('.btn-eliminar, [data-action="delete"]');
+    botonesEliminar.forEach(function (boton) {
+        boton.addEventListener('click', function (e) {
+            const mensaje = this.getAttribute('data-confirm-message') ||
+                '¿Estás seguro de que quieres eliminar este elemento?';
+            if (!confirmarEliminacion(mensaje)) {
+                e.preventDefault();
+            }
+        });
+    });
+    // Agregar validación en tiempo real a formularios
+    const formularios = document.querySelectorAll('form');
+    formularios.forEach(function (form) {
+        const campos = form.querySelectorAll('.form-control, .form-select');
+        campos.forEach(function (campo) {
+            campo.addEventListener('blur', function () {
+                if (this.hasAttribute('required')) {
+                    if (!this.value.trim()) {
+                        this.classList.add('is-invalid');
+                        this.classList.remove('is-valid');
+                    }
+                    else {
+                        this.classList.remove('is-invalid');
+                        this.classList.add('is-valid');
+                    }
+                }
+            });
+        });
+    });
+    // Inicializar botón Scroll to Top
+    inicializarScrollToTop();
+});
+/* =============================================================================
+   SCROLL TO TOP - Funcionalidad del botón para volver arriba
+   ============================================================================= */
+/**
+ * Inicializa el botón de Scroll to Top
+ * Muestra/oculta el botón según la posición del scroll
+ * y maneja el click para scroll suave hacia arriba
+ */
+function inicializarScrollToTop() {
+    const scrollButton = document.getElementById('scrollToTop');
+    if (!scrollButton) {
+        return; // Si el botón no existe, salir
+    }
+    // Distancia en píxeles para mostrar el botón
+    const scrollThreshold = 300;
+    /**
+     * Función para mostrar/ocultar el botón según el scroll
+     */
+    function toggleScrollButton() {
+        if (scrollButton) {
+            if (window.pageYOffset > scrollThreshold) {
+                scrollButton.classList.add('visible');
+            }
+            else {
+                scrollButton.classList.remove('visible');
+            }
+        }
+    }
+    /**
+     * Función para hacer scroll suave hacia arriba
+     */
+    function scrollToTop() {
+        // Usar smooth scroll nativo del navegador
+        window.scrollTo({
+            top: 0,
+            behavior: 'smooth'
+        });
+        // Alternativa con animación manual para navegadores antiguos
+        // (comentado, pero disponible si se necesita)
+        /*
+        const scrollStep = -window.scrollY / (500 / 15);
+        const scrollInterval = setInterval(function() {
+            if (window.scrollY !== 0) {
+                window.scrollBy(0, scrollStep);
+            } else {
+                clearInterval(scrollInterval);
+            }
+        }, 15);
+        */
+    }
+    // Event listener para el scroll (con throttle para mejor performance)
+    let scrollTimeout;
+    window.addEventListener('scroll', function () {
+        if (scrollTimeout) {
+            window.cancelAnimationFrame(scrollTimeout);
+        }
+        scrollTimeout = window.requestAnimationFrame(function () {
+            toggleScrollButton();
+        });
+    });
+    // Event listener para el click del botón
+    scrollButton.addEventListener('click', function (e) {
+        e.preventDefault();
+        scrollToTop();
+    });
+    // Verificar posición inicial al cargar la página
+    toggleScrollButton();
+}
+/* =============================================================================
+   NAVBAR MODERNO - Funcionalidad de dropdowns y menú móvil
+   ============================================================================= */
+/**
+ * Inicializa la funcionalidad del navbar moderno
+ */
+function inicializarNavbarModerno() {
+    const mobileToggle = document.getElementById('navbarToggle');
+    const navbarMenu = document.getElementById('navbarMenu');
+    // Referencias para devolver el menú a su lugar en el DOM al cerrar
+    let menuPadreOriginal = null;
+    let menuAnclaOriginal = null;
+    let bloqueadorTouchFondo = null;
+    let scrollPosAlAbrirMenu = 0;
+    const esVistaMovil = () => window.innerWidth <= 992;
+    /**
+     * Mueve el panel del menú al <body> para escapar del overflow:hidden del navbar.
+     * Sin esto, el panel queda recortado dentro del navbar (~70px) y no scrollea.
+     */
+    function portalMenuAlBody() {
+        if (!navbarMenu || navbarMenu.classList.contains('navbar-menu--portal'))
+            return;
+        menuPadreOriginal = navbarMenu.parentElement;
+        if (!menuPadreOriginal)
+            return;
+        menuAnclaOriginal = document.createComment('navbar-menu-ancla');
+        menuPadreOriginal.insertBefore(menuAnclaOriginal, navbarMenu);
+        document.body.appendChild(navbarMenu);
+        navbarMenu.classList.add('navbar-menu--portal');
+    }
+    /** Devuelve el menú a su posición original dentro del navbar */
+    function restaurarMenuEnNavbar() {
+        if (!navbarMenu || !menuPadreOriginal || !menuAnclaOriginal)
+            return;
+        menuPadreOriginal.insertBefore(navbarMenu, menuAnclaOriginal);
+        menuAnclaOriginal.remove();
+        navbarMenu.classList.remove('navbar-menu--portal');
+        menuPadreOriginal = null;
+        menuAnclaOriginal = null;
+    }
+    /** Impide que el scroll táctil mueva la página de fondo (solo el panel del menú scrollea) */
+    function activarBloqueoScrollFondo() {
+        bloqueadorTouchFondo = (e) => {
+            const target = e.target;
+            if (navbarMenu && target && navbarMenu.contains(target))
+                return;
+            e.preventDefault();
+        };
+        document.addEventListener('touchmove', bloqueadorTouchFondo, { passive: false });
+    }
+    function desactivarBloqueoScrollFondo() {
+        if (bloqueadorTouchFondo) {
+            document.removeEventListener('touchmove', bloqueadorTouchFondo);
+            bloqueadorTouchFondo = null;
+        }
+    }
+    /**
+     * Abre o cierra el menú móvil.
+     * Efectos: portal DOM, bloqueo scroll fondo, clase en html/body.
+     */
+    function setMenuMovilAbierto(abierto) {
+        if (!navbarMenu || !mobileToggle)
+            return;
+        if (abierto && esVistaMovil()) {
+            scrollPosAlAbrirMenu = window.scrollY;
+            portalMenuAlBody();
+            mobileToggle.classList.add('active');
+            navbarMenu.classList.add('active');
+            document.documentElement.classList.add('navbar-menu-open');
+            document.body.classList.add('navbar-menu-open');
+            activarBloqueoScrollFondo();
+        }
+        else {
+            mobileToggle.classList.remove('active');
+            navbarMenu.classList.remove('active');
+            document.documentElement.classList.remove('navbar-menu-open');
+            document.body.classList.remove('navbar-menu-open');
+            desactivarBloqueoScrollFondo();
+            restaurarMenuEnNavbar();
+            window.scrollTo(0, scrollPosAlAbrirMenu);
+        }
+    }
+    if (mobileToggle && navbarMenu) {
+        mobileToggle.addEventListener('click', function () {
+            const vaAbrir = !navbarMenu.classList.contains('active');
+            setMenuMovilAbierto(vaAbrir);
+        });
+    }
+    /**
+     * Cierra todos los submenús del navbar (clase .active).
+     * EXPLICACIÓN PARA PRINCIPIANTES: en tablet el menú se abre con .active
+     * (el hover no es fiable al tocar). Hay que quitar esa clase al elegir
+     * un enlace o al volver a pulsar el botón del módulo.
+     */
+    function cerrarTodosLosDropdownsNavbar() {
+        document.querySelectorAll('.navbar-menu-item').forEach(function (item) {
+            item.classList.remove('active');
+        });
+    }
+    /** Tablet landscape / menú por iconos: necesita .active (sin hover fiable) */
+    const esVistaTabletIconos = () => {
+        const w = window.innerWidth;
+        return w > 992 && w <= 1200;
+    };
+    const dropdownLinks = document.querySelectorAll('.navbar-menu-link[data-dropdown]');
+    dropdownLinks.forEach(function (link) {
+        link.addEventListener('click', function (e) {
+            e.preventDefault();
+            const parentItem = this.closest('.navbar-menu-item');
+            if (!parentItem)
+                return;
+            // Móvil y tablet: abrir/cerrar al tocar el botón del módulo
+            if (esVistaMovil() || esVistaTabletIconos()) {
+                const yaEstabaAbierto = parentItem.classList.contains('active');
+                cerrarTodosLosDropdownsNavbar();
+                // Si no estaba abierto, abrirlo (toggle). Si sí, queda cerrado.
+                if (!yaEstabaAbierto) {
+                    parentItem.classList.add('active');
+                }
+            }
+        });
+    });
+    document.addEventListener('click', function (e) {
+        const target = e.target;
+        if (target && !target.closest('.navbar-menu-item') && !target.closest('#navbarToggle')) {
+            cerrarTodosLosDropdownsNavbar();
+        }
+    });
+    // Enlaces reales del menú (no el botón del módulo): al pulsar, cerrar todo
+    const navbarLinks = navbarMenu ? navbarMenu.querySelectorAll('a:not([data-dropdown])') : [];
+    navbarLinks.forEach(function (link) {
+        link.addEventListener('click', function () {
+            cerrarTodosLosDropdownsNavbar();
+            if (esVistaMovil()) {
+                setMenuMovilAbierto(false);
+            }
+        });
+    });
+    window.addEventListener('resize', function () {
+        if (!esVistaMovil()) {
+            setMenuMovilAbierto(false);
+            cerrarTodosLosDropdownsNavbar();
+        }
+    });
+}
+// Llamar inicialización del navbar al cargar el DOM
+document.addEventListener('DOMContentLoaded', function () {
+    inicializarNavbarModerno();
+});
+/* =============================================================================
+   Layout: la sidebar lateral fue retirada (navegación solo en navbar superior).
+   ============================================================================= */
+/* =============================================================================
+   Cursor personalizado: lógica movida a static/ts/cursor_personalizado.ts
+   (preferencias localStorage + variantes). Se carga desde base.html.
+   ============================================================================= */
+// ============================================================
+// PRE-NAV LOADER
+// Muestra un overlay INMEDIATAMENTE al dar clic en un
+// dashboard pesado, antes de que el servidor responda.
+// ============================================================
+(function iniciarPreNavLoader() {
+    const overlay = document.getElementById('nav-pre-loader');
+    if (!overlay)
+        return;
+    // useCapture=true: se ejecuta en fase de captura, antes
+    // que cualquier handler hijo pueda llamar stopPropagation
+    document.addEventListener('click', (e) => {
+        const link = e.target
+            .closest('a[data-nav-loader]');
+        if (!link)
+            return;
+        // Ctrl/Cmd/Shift/Alt + clic → abrir en nueva pestaña, no interceptar
+        if (e.ctrlKey || e.metaKey || e.shiftKey || e.altKey)
+            return;
+        overlay.classList.add('active');
+    }, true);
+    // Restablecer si el usuario vuelve con el botón "Atrás"
+    // (bfcache restaura el DOM con la clase .active todavía presente)
+    window.addEventListener('pageshow', (e) => {
+        if (e.persisted)
+            overlay.classList.remove('active');
+    });
+}());
+//# sourceMappingURL=base.js.5579ccea2c9e.map
\ No newline at end of file
@@ -0,0 +1,821 @@
+"use strict";
+/**
+ * cotizacion_cliente_modal.ts
+ * ===========================
+ * Módulo TypeScript para el modal "Enviar Cotización al Cliente" en
+ * la vista detalle_solicitud.html del módulo almacén.
+ *
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ * --------------------------------
+ * Este archivo maneja toda la interacción del modal en el navegador:
+ * 1. Calculadora de profit en tiempo real (client-side, sin roundtrip al servidor)
+ * 2. Selección del tipo de servicio (botones radiales visuales)
+ * 3. Selección del modo de agrupación (un PDF / dos PDFs)
+ * 4. Previsualización del PDF en un iframe
+ * 5. Envío del formulario como JSON al endpoint API
+ *
+ * Datos de entrada: window.COTIZACION_CLIENTE_CONFIG (inyectado por Django en el template)
+ */
+// ============================================================
+// FUNCIÓN PRINCIPAL DE CÁLCULO
+// Replica la lógica de pdf_cotizacion_cliente.py en TypeScript
+// ============================================================
+/**
+ * Calcula el precio al cliente usando profit por pieza (perfil + overrides).
+ *
+ * Fórmula (espejo del backend en profit_por_pieza.py / pdf_cotizacion_cliente.py):
+ *
+ *   por cada pieza: precio_unit = costo / (1 - profit_efectivo)
+ *   profit_efectivo = max(override o perfil, mínimo_por_costo_unitario)
+ *
+ * Los costos fijos y la mano de obra NO inflan el precio al cliente; solo
+ * alimentan la ganancia bruta de control interno.
+ *
+ * @param tipo         - Perfil de servicio ('estandar', 'alta_gama', etc.)
+ * @param lineas       - Piezas activas con costo unitario y cantidad
+ * @param profitPorPk  - Mapa pk → profit fracción elegido en el modal
+ * @param rangos       - Rangos de mínimo por costo unitario
+ * @param manoObra     - Mano de obra interna (solo auditoría)
+ * @returns ResultadoCalculo con todos los valores
+ */
+function calcularPrecioClientePorPiezas(tipo, lineas, profitPorPk, rangos, manoObra) {
+    var _a, _b, _c, _d;
+    const cfg = (_b = (_a = window.COTIZACION_CLIENTE_CONFIG) === null || _a === void 0 ? void 0 : _a.profitConfig) === null || _b === void 0 ? void 0 : _b[tipo];
+    const profitPerfil = (_c = cfg === null || cfg === void 0 ? void 0 : cfg.profit_target) !== null && _c !== void 0 ? _c : 0.36;
+    const costosFijos = (_d = cfg === null || cfg === void 0 ? void 0 : cfg.costos_fijos) !== null && _d !== void 0 ? _d : [25, 160];
+    const costosFijosTotal = costosFijos.reduce((a, b) => a + b, 0);
+    let costoTotal = 0;
+    let precioPiezasSinIva = 0;
+    let sumaProfitPonderado = 0;
+    // Paso a paso: cada pieza con su propio margen (mínimo según costo unitario)
+    for (const linea of lineas) {
+        const costoUnit = linea.costo;
+        const cantidad = linea.cantidad;
+        costoTotal += costoUnit * cantidad;
+        const override = profitPorPk[linea.pk];
+        const profit = resolverProfitLineaTs(costoUnit, profitPerfil, override !== undefined ? override : null, rangos);
+        const precioUnit = costoUnit > 0 && profit < 1
+            ? costoUnit / (1 - profit)
+            : costoUnit;
+        const subtotal = Math.round(precioUnit * cantidad * 100) / 100;
+        precioPiezasSinIva += subtotal;
+        sumaProfitPonderado += profit * (costoUnit * cantidad);
+    }
+    precioPiezasSinIva = Math.round(precioPiezasSinIva * 100) / 100;
+    const precioSinIva = precioPiezasSinIva;
+    const precioConIva = precioSinIva * 1.16;
+    // Profit “promedio” ponderado por costo (solo para la fila resumen)
+    const profitPromedio = costoTotal > 0
+        ? sumaProfitPonderado / costoTotal
+        : profitPerfil;
+    const totalCostosExcel = costoTotal + manoObra + costosFijosTotal;
+    const gananciaBrutaDinero = precioPiezasSinIva - totalCostosExcel;
+    const gananciaBrutaPct = precioPiezasSinIva > 0
+        ? gananciaBrutaDinero / precioPiezasSinIva
+        : 0;
+    return {
+        subtotal_costo: costoTotal,
+        precio_piezas_sin_iva: precioPiezasSinIva,
+        precio_sin_iva: precioSinIva,
+        precio_con_iva: precioConIva,
+        diagnostico: 0,
+        precio_menos_diag_iva: precioConIva,
+        costos_fijos_total: costosFijosTotal,
+        porcentaje_profit: profitPromedio,
+        mano_obra: manoObra,
+        ganancia_bruta_dinero: gananciaBrutaDinero,
+        ganancia_bruta_pct: gananciaBrutaPct,
+    };
+}
+/**
+ * Profit mínimo según costo unitario (espejo de obtener_profit_minimo en Python).
+ */
+function obtenerProfitMinimoTs(costoUnitario, rangos) {
+    const costo = Math.max(0, costoUnitario);
+    for (const rango of rangos) {
+        if (rango.costo_max === null) {
+            if (costo >= rango.costo_min)
+                return rango.profit_minimo;
+        }
+        else if (costo >= rango.costo_min && costo < rango.costo_max) {
+            return rango.profit_minimo;
+        }
+    }
+    // Defensa: mismo fallback que Python (último tramo semilla = 28%)
+    return 0.28;
+}
+/**
+ * max(override|perfil, mínimo del rango). Espejo de resolver_profit_linea.
+ */
+function resolverProfitLineaTs(costoUnitario, profitPerfil, profitOverride, rangos) {
+    const minimo = obtenerProfitMinimoTs(costoUnitario, rangos);
+    let base = profitOverride !== null && !Number.isNaN(profitOverride)
+        ? profitOverride
+        : profitPerfil;
+    if (base >= 1)
+        base = 0.99;
+    if (base < 0)
+        base = 0;
+    return Math.max(base, minimo);
+}
+/**
+ * Calcula el precio al cliente usando el perfil de profit seleccionado (legacy 1 %).
+ *
+ * Conservada por compatibilidad; la calculadora del modal usa
+ * calcularPrecioClientePorPiezas().
+ */
+function calcularPrecioCliente(tipo, costoTotal, manoObra) {
+    var _a, _b, _c, _d;
+    const cfg = (_b = (_a = window.COTIZACION_CLIENTE_CONFIG) === null || _a === void 0 ? void 0 : _a.profitConfig) === null || _b === void 0 ? void 0 : _b[tipo];
+    const profit = (_c = cfg === null || cfg === void 0 ? void 0 : cfg.profit_target) !== null && _c !== void 0 ? _c : 0.36;
+    const costosFijos = (_d = cfg === null || cfg === void 0 ? void 0 : cfg.costos_fijos) !== null && _d !== void 0 ? _d : [25, 160];
+    const costosFijosTotal = costosFijos.reduce((a, b) => a + b, 0);
+    const precioPiezasSinIva = profit < 1 ? costoTotal / (1 - profit) : costoTotal;
+    const precioSinIva = precioPiezasSinIva;
+    const precioConIva = precioSinIva * 1.16;
+    const totalCostosExcel = costoTotal + manoObra + costosFijosTotal;
+    const gananciaBrutaDinero = precioPiezasSinIva - totalCostosExcel;
+    const gananciaBrutaPct = precioPiezasSinIva > 0
+        ? gananciaBrutaDinero / precioPiezasSinIva
+        : 0;
+    return {
+        subtotal_costo: costoTotal,
+        precio_piezas_sin_iva: precioPiezasSinIva,
+        precio_sin_iva: precioSinIva,
+        precio_con_iva: precioConIva,
+        diagnostico: 0,
+        precio_menos_diag_iva: precioConIva,
+        costos_fijos_total: costosFijosTotal,
+        porcentaje_profit: profit,
+        mano_obra: manoObra,
+        ganancia_bruta_dinero: gananciaBrutaDinero,
+        ganancia_bruta_pct: gananciaBrutaPct,
+    };
+}
+// ============================================================
+// UTILIDADES
+// ============================================================
+/** Formatea un número como precio MXN con 2 decimales */
+function fmtPeso(valor) {
+    return `$${valor.toLocaleString('es-MX', { minimumFractionDigits: 2, maximumFractionDigits: 2 })} MXN`;
+}
+/** Formatea un porcentaje */
+function fmtPct(valor) {
+    return `${(valor * 100).toFixed(0)}%`;
+}
+/** Valida formato básico de email (mismo criterio que el backend) */
+function esEmailValido(email) {
+    return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);
+}
+/** True si el ítem entra al cálculo (pendiente o aprobada; excluye rechazada y compra_generada) */
+function esItemCotizable(estado) {
+    return estado === 'pendiente' || estado === 'aprobada';
+}
+// ============================================================
+// INICIALIZACIÓN DEL MÓDULO
+// Se ejecuta cuando el DOM está listo
+// ============================================================
+document.addEventListener('DOMContentLoaded', () => {
+    var _a, _b, _c, _d;
+    // --- Leer la configuración inyectada por Django ---
+    const config = window
+        .COTIZACION_CLIENTE_CONFIG;
+    // Si el config no existe en esta página, salir silenciosamente
+    if (!config)
+        return;
+    // --------------------------------------------------------
+    // Badges de % profit: se actualizan desde profitConfig (panel BD / .env)
+    // para no mostrar porcentajes hardcodeados desactualizados.
+    // Solo se rellena el %, la palabra "sugerencia" queda fija en el HTML.
+    // --------------------------------------------------------
+    document.querySelectorAll('.profit-badge[data-profit-tipo]').forEach((badge) => {
+        var _a, _b;
+        const tipo = badge.dataset.profitTipo;
+        if (!tipo)
+            return;
+        const target = (_b = (_a = config.profitConfig) === null || _a === void 0 ? void 0 : _a[tipo]) === null || _b === void 0 ? void 0 : _b.profit_target;
+        if (typeof target === 'number') {
+            // EXPLICACIÓN: el badge tiene .profit-badge-pct + .profit-badge-hint
+            const pctEl = badge.querySelector('.profit-badge-pct');
+            if (pctEl) {
+                pctEl.textContent = `${Math.round(target * 100)}%`;
+            }
+        }
+    });
+    // --- Referencias a elementos del DOM ---
+    const tipoServicioInput = document.querySelector('#tipoServicioInput');
+    // manoObraOverride ya no existe como input — el campo es solo informativo.
+    // La mano de obra NO entra en el cálculo de profit. El diagnóstico se cobra
+    // al ingresar el equipo y tampoco entra en esta cotización de reparación.
+    const calcBody = document.querySelector('#calcBody');
+    const btnPreviewPDF = document.querySelector('#btnPreviewPDF');
+    const iframePreview = document.querySelector('#iframePreviewPDF');
+    const previewContainer = document.querySelector('#previewPDFContainer');
+    const previewPlaceholder = document.querySelector('#previewPDFPlaceholder');
+    const btnConfirmar = document.querySelector('#btnConfirmarEnvioCliente');
+    const alertaDiv = document.querySelector('#alertaEnvioModal');
+    const emailClienteInput = document.querySelector('#emailClienteInput');
+    const emailClienteCard = document.querySelector('#emailClienteCard');
+    const emailEstadoLabel = document.querySelector('#emailClienteEstadoLabel');
+    const emailDisplay = document.querySelector('#emailClienteDisplay');
+    const emailHint = document.querySelector('#emailClienteHint');
+    // Email original detectado por Django (referencia para comparar cambios)
+    const emailDetectado = ((_a = config.emailDetectado) !== null && _a !== void 0 ? _a : '').trim();
+    // --- Botones de tipo de servicio (visual radials) ---
+    const botonesTipo = document.querySelectorAll('.servicio-tipo-btn');
+    // Desglose abierto por defecto: ahí están los inputs de profit por pieza
+    let desgloseAbierto = true;
+    // Profit personalizado por pieza (pk → fracción 0–1). El perfil es el default.
+    /**
+     * Devuelve los tramos de mínimo del tipo de cotización activo.
+     * Preferimos el mapa por perfil; si falta, caemos a la lista legacy.
+     */
+    function rangosDelPerfil(tipo) {
+        var _a;
+        const mapa = config.rangosProfitMinimoPorPerfil;
+        if (mapa && mapa[tipo] && mapa[tipo].length > 0) {
+            return mapa[tipo];
+        }
+        return (_a = config.rangosProfitMinimo) !== null && _a !== void 0 ? _a : [];
+    }
+    const profitPorPieza = {};
+    /**
+     * Reinicia cada pieza al % del perfil (elevado al mínimo del rango).
+     * Se llama al cambiar de Mostrador/Estándar/etc. para no mezclar overrides viejos.
+     */
+    function reiniciarProfitDesdePerfil(tipo) {
+        var _a, _b, _c;
+        const perfil = (_c = (_b = (_a = config.profitConfig) === null || _a === void 0 ? void 0 : _a[tipo]) === null || _b === void 0 ? void 0 : _b.profit_target) !== null && _c !== void 0 ? _c : 0.36;
+        const rangos = rangosDelPerfil(tipo);
+        for (const linea of config.lineas) {
+            if (!esItemCotizable(linea.estado_cliente || 'pendiente'))
+                continue;
+            // Si ya había profit guardado en BD y es el primer arranque, lo respetamos
+            // solo cuando el mapa aún está vacío para esa pk (ver inicialización abajo).
+            profitPorPieza[linea.pk] = resolverProfitLineaTs(linea.costo, perfil, null, rangos);
+        }
+    }
+    // Arranque: perfil activo del modal, o profit_aplicado ya persistido
+    {
+        const tipoInicial = (tipoServicioInput === null || tipoServicioInput === void 0 ? void 0 : tipoServicioInput.value) || 'estandar';
+        const perfilInicial = (_d = (_c = (_b = config.profitConfig) === null || _b === void 0 ? void 0 : _b[tipoInicial]) === null || _c === void 0 ? void 0 : _c.profit_target) !== null && _d !== void 0 ? _d : 0.36;
+        const rangosIniciales = rangosDelPerfil(tipoInicial);
+        for (const linea of config.lineas) {
+            if (!esItemCotizable(linea.estado_cliente || 'pendiente'))
+                continue;
+            if (linea.profit_aplicado !== null && linea.profit_aplicado !== undefined) {
+                profitPorPieza[linea.pk] = resolverProfitLineaTs(linea.costo, perfilInicial, Number(linea.profit_aplicado), rangosIniciales);
+            }
+            else {
+                profitPorPieza[linea.pk] = resolverProfitLineaTs(linea.costo, perfilInicial, null, rangosIniciales);
+            }
+        }
+    }
+    /** Serializa el mapa de profit para API/preview */
+    function serializarProfitPorPieza() {
+        return JSON.stringify(profitPorPieza);
+    }
+    // --------------------------------------------------------
+    // FUNCIÓN: Sincronizar tarjeta de email con el input editable
+    // Muestra en tiempo real qué correo se enviará al cliente.
+    // --------------------------------------------------------
+    function actualizarTarjetaEmail() {
+        if (!emailClienteCard || !emailEstadoLabel || !emailDisplay || !emailClienteInput)
+            return;
+        const valorActual = emailClienteInput.value.trim();
+        const valorDetectado = emailDetectado;
+        // Limpiar estados visuales previos
+        emailClienteCard.classList.remove('sin-email', 'modificado', 'invalido');
+        if (emailHint) {
+            emailHint.style.display = 'none';
+            emailHint.textContent = '';
+        }
+        // Caso 1: campo vacío
+        if (!valorActual) {
+            emailClienteCard.classList.add('sin-email');
+            emailEstadoLabel.innerHTML = valorDetectado
+                ? '<i class="bi bi-exclamation-triangle me-1"></i>Email requerido'
+                : '<i class="bi bi-exclamation-triangle me-1"></i>Sin email detectado';
+            emailDisplay.textContent = 'Ingresa el correo del destinatario abajo';
+            emailClienteInput.classList.remove('is-valid', 'is-invalid');
+            return;
+        }
+        // Caso 2: formato inválido
+        if (!esEmailValido(valorActual)) {
+            emailClienteCard.classList.add('invalido');
+            emailEstadoLabel.textContent = 'Formato de correo inválido';
+            emailDisplay.textContent = valorActual;
+            if (emailHint) {
+                emailHint.style.display = 'block';
+                emailHint.textContent = 'Usa un formato como cliente@ejemplo.com';
+            }
+            emailClienteInput.classList.remove('is-valid');
+            emailClienteInput.classList.add('is-invalid');
+            return;
+        }
+        emailClienteInput.classList.remove('is-invalid');
+        emailClienteInput.classList.add('is-valid');
+        // Caso 3: coincide con el detectado (o se ingresó manualmente sin detección previa)
+        if (valorActual.toLowerCase() === valorDetectado.toLowerCase()) {
+            if (valorDetectado) {
+                emailEstadoLabel.textContent = 'Email detectado:';
+                emailDisplay.textContent = valorActual;
+            }
+            else {
+                emailEstadoLabel.textContent = 'Email ingresado manualmente:';
+                emailDisplay.textContent = valorActual;
+            }
+            return;
+        }
+        // Caso 4: el usuario modificó el correo detectado
+        emailClienteCard.classList.add('modificado');
+        emailEstadoLabel.innerHTML = '<i class="bi bi-pencil-square me-1"></i>Email modificado:';
+        emailDisplay.textContent = valorActual;
+        if (emailHint && valorDetectado) {
+            emailHint.style.display = 'block';
+            emailHint.textContent = `Detectado originalmente: ${valorDetectado}`;
+        }
+    }
+    // --------------------------------------------------------
+    // EVENTO: Cambios en el email del cliente
+    // --------------------------------------------------------
+    emailClienteInput === null || emailClienteInput === void 0 ? void 0 : emailClienteInput.addEventListener('input', actualizarTarjetaEmail);
+    emailClienteInput === null || emailClienteInput === void 0 ? void 0 : emailClienteInput.addEventListener('blur', actualizarTarjetaEmail);
+    // --------------------------------------------------------
+    // EVENTO: Clic en botones de tipo de servicio
+    // --------------------------------------------------------
+    botonesTipo.forEach(btn => {
+        btn.addEventListener('click', () => {
+            var _a;
+            // Quitar la clase 'activo' de todos los botones
+            botonesTipo.forEach(b => b.classList.remove('activo'));
+            // Marcar el botón clicado como activo
+            btn.classList.add('activo');
+            // Actualizar el input hidden con el valor del tipo seleccionado
+            const tipo = (_a = btn.dataset['tipo']) !== null && _a !== void 0 ? _a : 'estandar';
+            if (tipoServicioInput)
+                tipoServicioInput.value = tipo;
+            // Al cambiar perfil: resetear % de cada pieza al default del nuevo perfil
+            reiniciarProfitDesdePerfil(tipo);
+            // Recalcular y mostrar resultado
+            actualizarCalculadora();
+        });
+    });
+    // --------------------------------------------------------
+    // EVENTO: Botones de modo de agrupación (visual)
+    // --------------------------------------------------------
+    const agrupacionOptions = document.querySelectorAll('.agrupacion-option');
+    agrupacionOptions.forEach(opt => {
+        opt.addEventListener('click', () => {
+            agrupacionOptions.forEach(o => o.classList.remove('activo'));
+            opt.classList.add('activo');
+        });
+    });
+    // --------------------------------------------------------
+    // FUNCIÓN: Construir HTML del desglose expandible
+    // Muestra cada pieza y servicio con su costo individual.
+    // --------------------------------------------------------
+    /**
+     * Genera el HTML interno del panel de desglose por ítems.
+     *
+     * Se invoca dentro de actualizarCalculadora() y se incrusta en calcBody.
+     * El panel se muestra u oculta según el estado de `desgloseAbierto`.
+     *
+     * @returns Cadena HTML con el contenido del panel .calc-desglose-panel
+     */
+    function renderDesgloseHTML() {
+        var _a, _b, _c;
+        const lineasCotizables = config.lineas.filter(l => esItemCotizable(l.estado_cliente || 'pendiente'));
+        const lineasExcluidas = config.lineas.filter(l => !esItemCotizable(l.estado_cliente || 'pendiente'));
+        const serviciosCotizables = config.servicios.filter(s => esItemCotizable(s.estado_cliente || 'pendiente'));
+        const serviciosExcluidos = config.servicios.filter(s => !esItemCotizable(s.estado_cliente || 'pendiente'));
+        const tipoActual = (tipoServicioInput === null || tipoServicioInput === void 0 ? void 0 : tipoServicioInput.value) || 'estandar';
+        const perfilActual = (_c = (_b = (_a = config.profitConfig) === null || _a === void 0 ? void 0 : _a[tipoActual]) === null || _b === void 0 ? void 0 : _b.profit_target) !== null && _c !== void 0 ? _c : 0.36;
+        const rangosActuales = rangosDelPerfil(tipoActual);
+        // Cada pieza: input de % + precio resultante en vivo
+        const filasLineas = lineasCotizables.map(l => {
+            var _a;
+            const cantTxt = l.cantidad > 1 ? ` <span class="desglose-cant">× ${l.cantidad}</span>` : '';
+            const minimo = obtenerProfitMinimoTs(l.costo, rangosActuales);
+            const profit = resolverProfitLineaTs(l.costo, perfilActual, (_a = profitPorPieza[l.pk]) !== null && _a !== void 0 ? _a : null, rangosActuales);
+            const precioUnit = l.costo > 0 && profit < 1 ? l.costo / (1 - profit) : l.costo;
+            const subtotal = Math.round(precioUnit * l.cantidad * 100) / 100;
+            const pctMostrar = Math.round(profit * 1000) / 10; // 1 decimal
+            const minPct = Math.round(minimo * 100);
+            return `
+            <div class="calc-desglose-item calc-desglose-item-profit" data-linea-pk="${l.pk}">
+                <div class="desglose-profit-fila">
+                    <span class="desglose-nombre">${l.nombre}${cantTxt}</span>
+                    <span class="desglose-val">${fmtPeso(l.costo * l.cantidad)}</span>
+                </div>
+                <div class="desglose-profit-controles">
+                    <label class="desglose-profit-label" for="profitPieza_${l.pk}">
+                        Profit %
+                        <small class="text-muted">(mín. ${minPct}%)</small>
+                    </label>
+                    <input type="number"
+                           class="form-control form-control-sm profit-pieza-input"
+                           id="profitPieza_${l.pk}"
+                           data-linea-pk="${l.pk}"
+                           data-minimo="${minimo}"
+                           min="${minPct}"
+                           max="99"
+                           step="0.5"
+                           value="${pctMostrar}">
+                    <span class="desglose-precio-cliente" title="Precio al cliente sin IVA">
+                        → ${fmtPeso(subtotal)}
+                    </span>
+                </div>
+            </div>`;
+        }).join('');
+        const filasLineasExcluidas = lineasExcluidas.map(l => `
+            <div class="calc-desglose-item text-muted" style="text-decoration: line-through; opacity: 0.75;">
+                <span class="desglose-nombre">${l.nombre} <small>(rechazada — no incluida)</small></span>
+                <span class="desglose-val">${fmtPeso(l.costo * l.cantidad)}</span>
+            </div>`).join('');
+        const filasServicios = serviciosCotizables.length > 0
+            ? `<div class="calc-desglose-grupo-titulo">Servicios adicionales (IVA incluido)</div>
+               ${serviciosCotizables.map(s => `
+               <div class="calc-desglose-item">
+                   <span class="desglose-nombre">${s.nombre}</span>
+                   <span class="desglose-val">${fmtPeso(s.costo)}</span>
+               </div>`).join('')}`
+            : '';
+        const filasServiciosExcluidos = serviciosExcluidos.length > 0
+            ? serviciosExcluidos.map(s => `
+               <div class="calc-desglose-item text-muted" style="text-decoration: line-through; opacity: 0.75;">
+                   <span class="desglose-nombre">${s.nombre} <small>(rechazado — no incluido)</small></span>
+                   <span class="desglose-val">${fmtPeso(s.costo)}</span>
+               </div>`).join('')
+            : '';
+        return `
+            ${lineasCotizables.length > 0
+            ? `<div class="calc-desglose-grupo-titulo">Piezas en cotización (${lineasCotizables.length}) — ajusta el profit por pieza</div>${filasLineas}`
+            : '<div class="calc-desglose-vacio">Sin piezas activas para cotizar</div>'}
+            ${filasLineasExcluidas}
+            ${filasServicios}
+            ${filasServiciosExcluidos}`;
+    }
+    // --------------------------------------------------------
+    // FUNCIÓN: Actualizar calculadora de profit
+    // Lee los costos de las líneas y servicios del config,
+    // aplica el perfil seleccionado y renderiza el resultado.
+    // --------------------------------------------------------
+    function actualizarCalculadora() {
+        if (!calcBody || !tipoServicioInput)
+            return;
+        const tipo = tipoServicioInput.value || 'estandar';
+        // Mano de obra = 0: el campo es solo informativo, no entra en el cálculo.
+        // El diagnóstico tampoco entra: se cobra al ingresar el equipo.
+        const manoObra = 0;
+        const lineasActivas = config.lineas.filter(l => esItemCotizable(l.estado_cliente || 'pendiente'));
+        const serviciosActivos = config.servicios.filter(s => esItemCotizable(s.estado_cliente || 'pendiente'));
+        const costoLineas = lineasActivas.reduce((acc, l) => acc + (l.costo * l.cantidad), 0);
+        const serviciosConIva = serviciosActivos.reduce((acc, s) => acc + s.costo, 0);
+        const soloServicios = lineasActivas.length === 0 && serviciosActivos.length > 0;
+        const sinItemsActivos = lineasActivas.length === 0 && serviciosActivos.length === 0;
+        if (sinItemsActivos) {
+            calcBody.innerHTML = `
+                <div class="alert alert-warning mb-0 py-2 px-3" style="font-size: 0.85rem;">
+                    <i class="bi bi-exclamation-triangle me-1"></i>
+                    No hay piezas ni servicios pendientes o aprobados para cotizar.
+                    Las líneas rechazadas no se incluyen.
+                </div>
+                <div class="calc-desglose-panel" style="display:block; margin-top: 0.5rem;">
+                    ${renderDesgloseHTML()}
+                </div>
+            `;
+            return;
+        }
+        // PDF/cotización solo con servicios activos: suma directa + desglose IVA
+        if (soloServicios) {
+            // EXPLICACIÓN: los servicios ya traen IVA; sin IVA = ÷ 1.16
+            const subtotalSinIvaSoloServ = serviciosConIva / 1.16;
+            const ivaSoloServ = serviciosConIva - subtotalSinIvaSoloServ;
+            calcBody.innerHTML = `
+                <div class="calc-row">
+                    <span class="etq">Servicios adicionales (IVA incluido)</span>
+                    <span class="val">${fmtPeso(serviciosConIva)}</span>
+                </div>
+                <div class="calc-desglose-panel" style="display:block">
+                    ${renderDesgloseHTML()}
+                </div>
+                <div class="calc-row">
+                    <span class="etq">Subtotal (sin IVA)</span>
+                    <span class="val">${fmtPeso(subtotalSinIvaSoloServ)}</span>
+                </div>
+                <div class="calc-row">
+                    <span class="etq">IVA (16%)</span>
+                    <span class="val">${fmtPeso(ivaSoloServ)}</span>
+                </div>
+                <div class="calc-row total-iva">
+                    <span class="etq">TOTAL CON IVA (16%)</span>
+                    <span class="val">${fmtPeso(serviciosConIva)}</span>
+                </div>
+            `;
+            return;
+        }
+        // Profit por pieza (perfil + overrides del modal)
+        const res = calcularPrecioClientePorPiezas(tipo, lineasActivas, profitPorPieza, rangosDelPerfil(tipo), manoObra);
+        // EXPLICACIÓN: servicios ya vienen con IVA; su parte sin IVA se obtiene ÷ 1.16
+        const serviciosSinIva = serviciosConIva > 0 ? serviciosConIva / 1.16 : 0;
+        const subtotalSinIvaTotal = res.precio_sin_iva + serviciosSinIva;
+        const precioConIvaTotal = res.precio_con_iva + serviciosConIva;
+        const ivaTotal = precioConIvaTotal - subtotalSinIvaTotal;
+        // Construir las filas de resultado en HTML
+        calcBody.innerHTML = `
+            <div class="calc-row calc-row-desglose-toggle" role="button" title="Ver desglose por pieza">
+                <span class="etq">
+                    Costo interno piezas
+                    <span class="desglose-chevron">${desgloseAbierto ? '▾' : '▸'}</span>
+                </span>
+                <span class="val">${fmtPeso(costoLineas)}</span>
+            </div>
+            <div class="calc-desglose-panel" style="display:${desgloseAbierto ? 'block' : 'none'}">
+                ${renderDesgloseHTML()}
+            </div>
+            ${serviciosConIva > 0 ? `
+            <div class="calc-row">
+                <span class="etq">Servicios adicionales (IVA incluido, sin profit)</span>
+                <span class="val">${fmtPeso(serviciosConIva)}</span>
+            </div>` : ''}
+            <div class="calc-row">
+                <span class="etq">Costos fijos internos (${tipo}) — no se cobran al cliente</span>
+                <span class="val">${fmtPeso(res.costos_fijos_total)}</span>
+            </div>
+            <div class="calc-row">
+                <span class="etq">Profit promedio ponderado (editable por pieza arriba)</span>
+                <span class="val">${fmtPct(res.porcentaje_profit)}</span>
+            </div>
+            <div class="calc-row">
+                <span class="etq">Subtotal (sin IVA)</span>
+                <span class="val">${fmtPeso(subtotalSinIvaTotal)}</span>
+            </div>
+            <div class="calc-row">
+                <span class="etq">IVA (16%)</span>
+                <span class="val">${fmtPeso(ivaTotal)}</span>
+            </div>
+            <div class="calc-row total-iva">
+                <span class="etq">TOTAL CON IVA (16%)</span>
+                <span class="val">${fmtPeso(precioConIvaTotal)}</span>
+            </div>
+        `;
+    }
+    // --------------------------------------------------------
+    // EVENTO DELEGADO: Toggle del desglose expandible
+    // Se registra UNA SOLA VEZ sobre calcBody para que funcione
+    // incluso después de que actualizarCalculadora() reemplaze el innerHTML.
+    // --------------------------------------------------------
+    calcBody === null || calcBody === void 0 ? void 0 : calcBody.addEventListener('click', (e) => {
+        // Verificar si el clic fue dentro del toggle (o en el mismo toggle)
+        const toggle = e.target.closest('.calc-row-desglose-toggle');
+        if (!toggle)
+            return;
+        // Invertir el estado y volver a renderizar la calculadora con el nuevo estado
+        desgloseAbierto = !desgloseAbierto;
+        actualizarCalculadora();
+    });
+    // --------------------------------------------------------
+    // EVENTO: Cambio de profit % por pieza (inputs del desglose)
+    // --------------------------------------------------------
+    calcBody === null || calcBody === void 0 ? void 0 : calcBody.addEventListener('change', (e) => {
+        var _a;
+        const input = e.target.closest('input.profit-pieza-input');
+        if (!input)
+            return;
+        const pk = Number(input.dataset.lineaPk);
+        const minimo = Number((_a = input.dataset.minimo) !== null && _a !== void 0 ? _a : '0');
+        let pct = parseFloat(input.value);
+        if (Number.isNaN(pct))
+            pct = minimo * 100;
+        // Clampar en UI al mínimo y a 99%
+        const minPct = minimo * 100;
+        if (pct < minPct)
+            pct = minPct;
+        if (pct >= 100)
+            pct = 99;
+        profitPorPieza[pk] = pct / 100;
+        // Mantener desglose abierto al editar
+        desgloseAbierto = true;
+        actualizarCalculadora();
+    });
+    calcBody === null || calcBody === void 0 ? void 0 : calcBody.addEventListener('input', (e) => {
+        var _a;
+        // Feedback inmediato al teclear (sin esperar blur/change)
+        const input = e.target.closest('input.profit-pieza-input');
+        if (!input)
+            return;
+        const pk = Number(input.dataset.lineaPk);
+        const minimo = Number((_a = input.dataset.minimo) !== null && _a !== void 0 ? _a : '0');
+        let pct = parseFloat(input.value);
+        if (Number.isNaN(pct))
+            return;
+        const minPct = minimo * 100;
+        if (pct < minPct)
+            pct = minPct;
+        if (pct >= 100)
+            pct = 99;
+        profitPorPieza[pk] = pct / 100;
+    });
+    // --------------------------------------------------------
+    // EVENTO: Botón "Generar preview" del PDF
+    // Carga el PDF en el iframe usando la vista preview_pdf_cotizacion
+    // --------------------------------------------------------
+    btnPreviewPDF === null || btnPreviewPDF === void 0 ? void 0 : btnPreviewPDF.addEventListener('click', () => {
+        var _a, _b, _c, _d, _e, _f, _g;
+        if (!tipoServicioInput || !iframePreview || !previewContainer || !previewPlaceholder)
+            return;
+        // Modo reacondicionado: preview con parámetros del equipo ofertado
+        if ((_a = window.esModoReacondicionado) === null || _a === void 0 ? void 0 : _a.call(window)) {
+            const marca = (_b = document.querySelector('#reacMarca')) === null || _b === void 0 ? void 0 : _b.value.trim();
+            const modelo = (_c = document.querySelector('#reacModelo')) === null || _c === void 0 ? void 0 : _c.value.trim();
+            const costo = parseFloat((_e = (_d = document.querySelector('#reacCostoProveedor')) === null || _d === void 0 ? void 0 : _d.value) !== null && _e !== void 0 ? _e : '0');
+            if (!marca || !modelo || !costo || costo <= 0) {
+                alert('Completa marca, modelo y costo de proveedor para previsualizar.');
+                return;
+            }
+            const params = (_g = (_f = window.buildPreviewParamsReac) === null || _f === void 0 ? void 0 : _f.call(window)) !== null && _g !== void 0 ? _g : new URLSearchParams();
+            const url = `${config.urlPreview}?${params.toString()}`;
+            btnPreviewPDF.disabled = true;
+            btnPreviewPDF.innerHTML = '<span class="spinner-border spinner-border-sm me-1"></span>Generando...';
+            iframePreview.src = url;
+            previewContainer.style.display = 'block';
+            previewPlaceholder.style.display = 'none';
+            iframePreview.onload = () => {
+                btnPreviewPDF.disabled = false;
+                btnPreviewPDF.innerHTML = '<i class="bi bi-eye me-1"></i>Actualizar preview';
+            };
+            return;
+        }
+        const tipo = tipoServicioInput.value || 'estandar';
+        // Construir la URL del preview con parámetros + profit por pieza
+        const params = new URLSearchParams({
+            tipo_servicio: tipo,
+            mano_de_obra_override: '0',
+            profit_por_pieza: serializarProfitPorPieza(),
+        });
+        const radioAgrupacion = document.querySelector('input[name="modo_agrupacion"]:checked');
+        if (radioAgrupacion === null || radioAgrupacion === void 0 ? void 0 : radioAgrupacion.value) {
+            params.set('modo_agrupacion', radioAgrupacion.value);
+        }
+        const url = `${config.urlPreview}?${params.toString()}`;
+        // Mostrar spinner en el botón mientras carga
+        btnPreviewPDF.disabled = true;
+        btnPreviewPDF.innerHTML = '<span class="spinner-border spinner-border-sm me-1"></span>Cargando...';
+        // Cargar el PDF en el iframe
+        iframePreview.src = url;
+        previewContainer.style.display = 'block';
+        previewPlaceholder.style.display = 'none';
+        // Restaurar el botón cuando el iframe termine de cargar
+        iframePreview.onload = () => {
+            btnPreviewPDF.disabled = false;
+            btnPreviewPDF.innerHTML = '<i class="bi bi-eye me-1"></i>Actualizar preview';
+        };
+    });
+    // --------------------------------------------------------
+    // EVENTO: Botón "Confirmar Envío al Cliente"
+    // Recolecta todos los datos del modal y los envía como
+    // un FormData POST al endpoint API.
+    // --------------------------------------------------------
+    btnConfirmar === null || btnConfirmar === void 0 ? void 0 : btnConfirmar.addEventListener('click', async () => {
+        var _a, _b, _c, _d, _e, _f, _g, _h, _j, _k, _l, _m;
+        if (!tipoServicioInput || !alertaDiv)
+            return;
+        // Ocultar alerta previa
+        alertaDiv.style.display = 'none';
+        alertaDiv.innerHTML = '';
+        // Validar email antes de enviar (usa el valor del input, no el detectado)
+        const emailParaEnvio = ((_a = emailClienteInput === null || emailClienteInput === void 0 ? void 0 : emailClienteInput.value) !== null && _a !== void 0 ? _a : '').trim();
+        if (!emailParaEnvio) {
+            mostrarAlerta('warning', '<i class="bi bi-envelope-exclamation me-1"></i>Debes ingresar el email del cliente.');
+            actualizarTarjetaEmail();
+            emailClienteInput === null || emailClienteInput === void 0 ? void 0 : emailClienteInput.focus();
+            return;
+        }
+        if (!esEmailValido(emailParaEnvio)) {
+            mostrarAlerta('warning', '<i class="bi bi-envelope-x me-1"></i>El email no tiene un formato válido.');
+            actualizarTarjetaEmail();
+            emailClienteInput === null || emailClienteInput === void 0 ? void 0 : emailClienteInput.focus();
+            return;
+        }
+        // Mostrar spinner en el botón
+        const textoBtn = document.querySelector('#btnEnvioTexto');
+        const spinnerBtn = document.querySelector('#btnEnvioSpinner');
+        if (textoBtn)
+            textoBtn.style.display = 'none';
+        if (spinnerBtn)
+            spinnerBtn.style.display = '';
+        if (btnConfirmar)
+            btnConfirmar.disabled = true;
+        try {
+            const formData = new FormData();
+            formData.append('csrfmiddlewaretoken', config.csrfToken);
+            formData.append('email_cliente', emailParaEnvio);
+            formData.append('mensaje_personalizado', (_c = (_b = document.querySelector('#mensajePersonalizado')) === null || _b === void 0 ? void 0 : _b.value) !== null && _c !== void 0 ? _c : '');
+            formData.append('asunto_correo', (_e = (_d = document.querySelector('#asuntoCorreoInput')) === null || _d === void 0 ? void 0 : _d.value) !== null && _e !== void 0 ? _e : '');
+            // Modo reacondicionado: datos del equipo + costeo Excel
+            if ((_f = window.esModoReacondicionado) === null || _f === void 0 ? void 0 : _f.call(window)) {
+                if (!((_g = window.appendDatosReacondicionado) === null || _g === void 0 ? void 0 : _g.call(window, formData))) {
+                    mostrarAlerta('warning', '<i class="bi bi-exclamation-triangle me-1"></i>Marca, modelo y costo de proveedor son obligatorios.');
+                    restaurarBoton();
+                    return;
+                }
+            }
+            else {
+                formData.append('modo_cotizacion', 'reparacion');
+                formData.append('tipo_servicio', tipoServicioInput.value || 'estandar');
+                formData.append('mano_de_obra_override', '0');
+                formData.append('profit_por_pieza', serializarProfitPorPieza());
+                const radioAgrupacion = document.querySelector('input[name="modo_agrupacion"]:checked');
+                formData.append('modo_agrupacion', (_h = radioAgrupacion === null || radioAgrupacion === void 0 ? void 0 : radioAgrupacion.value) !== null && _h !== void 0 ? _h : 'todo_junto');
+            }
+            // CC de empleados (checkboxes marcados)
+            const checksCopia = document.querySelectorAll('input[name="copia_empleados"]:checked');
+            checksCopia.forEach(chk => {
+                formData.append('copia_empleados', chk.value);
+            });
+            // Enviar la petición al endpoint API
+            const response = await fetch(config.urlApi, {
+                method: 'POST',
+                body: formData,
+                headers: { 'X-CSRFToken': (_k = (_j = window.getCsrfToken) === null || _j === void 0 ? void 0 : _j.call(window)) !== null && _k !== void 0 ? _k : config.csrfToken },
+            });
+            // Parsear la respuesta JSON
+            const data = await response.json();
+            if (data.success) {
+                // Éxito: mostrar mensaje y cerrar modal después de 2 segundos
+                mostrarAlerta('success', `<i class="bi bi-check-circle me-1"></i>${(_l = data.mensaje) !== null && _l !== void 0 ? _l : 'Correo enviado correctamente.'}`);
+                setTimeout(() => {
+                    var _a, _b;
+                    const modal = document.querySelector('#modalEnviarCotizacionCliente');
+                    const bsModal = (_b = (_a = window.bootstrap) === null || _a === void 0 ? void 0 : _a.Modal) === null || _b === void 0 ? void 0 : _b.getInstance(modal);
+                    bsModal === null || bsModal === void 0 ? void 0 : bsModal.hide();
+                    // Recargar la página para reflejar el nuevo estado de la solicitud
+                    window.location.reload();
+                }, 2500);
+            }
+            else {
+                // Error: mostrar el mensaje de error
+                mostrarAlerta('danger', `<i class="bi bi-exclamation-triangle me-1"></i>${(_m = data.error) !== null && _m !== void 0 ? _m : 'Error desconocido.'}`);
+                restaurarBoton();
+            }
+        }
+        catch (err) {
+            // Error de red o inesperado
+            mostrarAlerta('danger', `<i class="bi bi-wifi-off me-1"></i>Error de conexión. Intenta de nuevo.`);
+            restaurarBoton();
+        }
+    });
+    // --------------------------------------------------------
+    // FUNCIÓN: Restablecer asunto del correo al abrir el modal
+    // --------------------------------------------------------
+    function actualizarAsuntoCorreo() {
+        const inputAsunto = document.querySelector('#asuntoCorreoInput');
+        if (!inputAsunto)
+            return;
+        inputAsunto.value = config.asuntoCorreoDefault || 'Cotización SIC — ';
+    }
+    // --------------------------------------------------------
+    // FUNCIÓN: Mostrar alerta en el footer del modal
+    // --------------------------------------------------------
+    function mostrarAlerta(tipo, html) {
+        if (!alertaDiv)
+            return;
+        alertaDiv.style.display = 'block';
+        alertaDiv.innerHTML = `<div class="alert alert-${tipo} py-2 mb-0" role="alert">${html}</div>`;
+    }
+    // --------------------------------------------------------
+    // FUNCIÓN: Restaurar estado del botón confirmar
+    // --------------------------------------------------------
+    function restaurarBoton() {
+        const textoBtn = document.querySelector('#btnEnvioTexto');
+        const spinnerBtn = document.querySelector('#btnEnvioSpinner');
+        if (textoBtn)
+            textoBtn.style.display = '';
+        if (spinnerBtn)
+            spinnerBtn.style.display = 'none';
+        if (btnConfirmar)
+            btnConfirmar.disabled = false;
+    }
+    // --------------------------------------------------------
+    // INICIALIZAR: Calcular al cargar el modal por primera vez
+    // Se usa el evento 'show.bs.modal' de Bootstrap
+    // --------------------------------------------------------
+    const modalEl = document.querySelector('#modalEnviarCotizacionCliente');
+    modalEl === null || modalEl === void 0 ? void 0 : modalEl.addEventListener('show.bs.modal', () => {
+        actualizarCalculadora();
+        actualizarTarjetaEmail();
+        actualizarAsuntoCorreo();
+        // Resetear alerta al abrir
+        if (alertaDiv) {
+            alertaDiv.style.display = 'none';
+            alertaDiv.innerHTML = '';
+        }
+        // Restaurar botón por si se abrió después de un error
+        restaurarBoton();
+    });
+    // Ejecutar calculadora y tarjeta de email al cargar la página
+    actualizarCalculadora();
+    actualizarTarjetaEmail();
+});
+//# sourceMappingURL=cotizacion_cliente_modal.js.map
\ No newline at end of file
@@ -0,0 +1,304 @@
+"use strict";
+/**
+ * Dashboard de Distribución Multi-Sucursal - TypeScript Module
+ *
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ * --------------------------------
+ * Este módulo maneja la interactividad del dashboard de distribución de inventario.
+ *
+ * Funcionalidades:
+ * 1. Búsqueda en tiempo real (filtrado de productos sin recargar página)
+ * 2. Ordenamiento de columnas (click en encabezados para ordenar)
+ * 3. Exportación a Excel (con múltiples hojas de análisis)
+ * 4. Tooltips dinámicos (mostrar información adicional al pasar el mouse)
+ *
+ * Estructura:
+ * - Interfaces: Definiciones de tipos para productos y sucursales
+ * - Clase Principal: DashboardDistribucion
+ * - Métodos: Búsqueda, filtrado, ordenamiento, exportación
+ */
+// ============================================================================
+// CLASE PRINCIPAL: DASHBOARD DISTRIBUCIÓN
+// ============================================================================
+class DashboardDistribucion {
+    constructor() {
+        this.productos = [];
+        this.productosFiltrados = [];
+        this.sucursales = [];
+        // Elementos del DOM
+        this.inputBuscar = null;
+        this.selectCategoria = null;
+        this.selectSucursal = null;
+        this.tbodyProductos = null;
+        this.btnExportar = null;
+        // Estado de ordenamiento
+        this.ordenColumna = 'nombre';
+        this.ordenAscendente = true;
+        this.initializeElements();
+        this.attachEventListeners();
+        this.loadInitialData();
+    }
+    /**
+     * Inicializa referencias a elementos del DOM
+     */
+    initializeElements() {
+        this.inputBuscar = document.getElementById('buscar-producto');
+        this.selectCategoria = document.getElementById('filtro-categoria');
+        this.selectSucursal = document.getElementById('filtro-sucursal');
+        this.tbodyProductos = document.getElementById('tbody-productos');
+        this.btnExportar = document.getElementById('exportar-excel');
+    }
+    /**
+     * Adjunta event listeners a los elementos interactivos
+     */
+    attachEventListeners() {
+        // Búsqueda en tiempo real (con debounce)
+        if (this.inputBuscar) {
+            let timeoutId = null;
+            this.inputBuscar.addEventListener('input', () => {
+                if (timeoutId) {
+                    window.clearTimeout(timeoutId);
+                }
+                timeoutId = window.setTimeout(() => {
+                    this.filtrarProductos();
+                }, 300); // 300ms de delay para evitar llamadas excesivas
+            });
+        }
+        // Filtro por categoría
+        if (this.selectCategoria) {
+            this.selectCategoria.addEventListener('change', () => {
+                this.filtrarProductos();
+            });
+        }
+        // Filtro por sucursal
+        if (this.selectSucursal) {
+            this.selectSucursal.addEventListener('change', () => {
+                this.filtrarProductos();
+            });
+        }
+        // Exportar a Excel
+        if (this.btnExportar) {
+            this.btnExportar.addEventListener('click', () => {
+                this.exportarExcel();
+            });
+        }
+        // Ordenamiento por columnas (click en encabezados)
+        const headers = document.querySelectorAll('.table-distribucion thead th');
+        headers.forEach((header, index) => {
+            header.addEventListener('click', () => {
+                this.ordenarPorColumna(index);
+            });
+            // Agregar cursor pointer para indicar que es clickeable
+            header.style.cursor = 'pointer';
+        });
+    }
+    /**
+     * Carga los datos iniciales desde la tabla HTML
+     *
+     * EXPLICACIÓN:
+     * En lugar de hacer una llamada AJAX, leemos los datos que Django
+     * ya renderizó en el HTML. Esto es más eficiente y simple.
+     */
+    loadInitialData() {
+        // Extraer datos de sucursales desde el contexto
+        // (Se pueden pasar vía data attributes o JavaScript embebido)
+        // Extraer productos desde las filas de la tabla
+        if (this.tbodyProductos) {
+            const filas = this.tbodyProductos.querySelectorAll('tr[data-producto-id]');
+            filas.forEach(fila => {
+                const producto = this.extraerProductoDesdeFila(fila);
+                if (producto) {
+                    this.productos.push(producto);
+                }
+            });
+            this.productosFiltrados = [...this.productos];
+        }
+    }
+    /**
+     * Extrae datos de producto desde una fila HTML
+     */
+    extraerProductoDesdeFila(fila) {
+        var _a, _b, _c;
+        try {
+            const id = parseInt(fila.dataset.productoId || '0');
+            const celdas = fila.querySelectorAll('td');
+            if (celdas.length < 4) {
+                return null;
+            }
+            const codigo = ((_a = celdas[0].textContent) === null || _a === void 0 ? void 0 : _a.trim()) || '';
+            const nombreLink = celdas[1].querySelector('a');
+            const nombre = ((_b = nombreLink === null || nombreLink === void 0 ? void 0 : nombreLink.textContent) === null || _b === void 0 ? void 0 : _b.trim()) || '';
+            const categoriaSpan = celdas[2].querySelector('span');
+            const categoria = ((_c = categoriaSpan === null || categoriaSpan === void 0 ? void 0 : categoriaSpan.textContent) === null || _c === void 0 ? void 0 : _c.trim()) || '';
+            // Extraer inventario por sucursal (esto requiere parsear las celdas)
+            const inventario = {};
+            // TODO: Implementar extracción de inventario si se necesita para filtrado/ordenamiento
+            return {
+                id,
+                codigo,
+                nombre,
+                categoria,
+                categoria_id: null,
+                inventario,
+                total_general: 0, // TODO: Extraer de la última celda
+                dias_sin_movimiento: null,
+                tipo: ''
+            };
+        }
+        catch (error) {
+            console.error('Error extrayendo producto de fila:', error);
+            return null;
+        }
+    }
+    /**
+     * Filtra productos según criterios de búsqueda
+     *
+     * EXPLICACIÓN:
+     * Esta función NO recarga la página. Simplemente oculta/muestra
+     * filas de la tabla según los filtros activos.
+     */
+    filtrarProductos() {
+        var _a, _b, _c;
+        const textoBusqueda = ((_a = this.inputBuscar) === null || _a === void 0 ? void 0 : _a.value.toLowerCase()) || '';
+        const categoriaId = ((_b = this.selectCategoria) === null || _b === void 0 ? void 0 : _b.value) || '';
+        const sucursalId = ((_c = this.selectSucursal) === null || _c === void 0 ? void 0 : _c.value) || '';
+        if (!this.tbodyProductos)
+            return;
+        const filas = this.tbodyProductos.querySelectorAll('tr[data-producto-id]');
+        let productosVisibles = 0;
+        filas.forEach(fila => {
+            var _a, _b, _c, _d, _e, _f;
+            const filaElement = fila;
+            const celdas = filaElement.querySelectorAll('td');
+            // Extraer información de la fila
+            const codigo = ((_b = (_a = celdas[0]) === null || _a === void 0 ? void 0 : _a.textContent) === null || _b === void 0 ? void 0 : _b.toLowerCase()) || '';
+            const nombre = ((_d = (_c = celdas[1]) === null || _c === void 0 ? void 0 : _c.textContent) === null || _d === void 0 ? void 0 : _d.toLowerCase()) || '';
+            const categoriaBadge = ((_f = (_e = celdas[2]) === null || _e === void 0 ? void 0 : _e.querySelector('span')) === null || _f === void 0 ? void 0 : _f.textContent) || '';
+            // Evaluar filtros
+            let mostrar = true;
+            // Filtro de búsqueda
+            if (textoBusqueda) {
+                const coincide = codigo.includes(textoBusqueda) ||
+                    nombre.includes(textoBusqueda);
+                if (!coincide) {
+                    mostrar = false;
+                }
+            }
+            // Filtro de categoría
+            // (Por simplicidad, usamos la recarga de página para este filtro)
+            // Filtro de sucursal
+            // (Por simplicidad, usamos la recarga de página para este filtro)
+            // Mostrar/ocultar fila
+            if (mostrar) {
+                filaElement.style.display = '';
+                productosVisibles++;
+            }
+            else {
+                filaElement.style.display = 'none';
+            }
+        });
+        // Mostrar mensaje si no hay resultados
+        this.actualizarMensajeVacio(productosVisibles);
+    }
+    /**
+     * Actualiza el mensaje cuando no hay productos que mostrar
+     */
+    actualizarMensajeVacio(productosVisibles) {
+        if (!this.tbodyProductos)
+            return;
+        let filaVacia = this.tbodyProductos.querySelector('tr.fila-vacia');
+        if (productosVisibles === 0) {
+            if (!filaVacia) {
+                // Crear fila de "sin resultados"
+                filaVacia = document.createElement('tr');
+                filaVacia.classList.add('fila-vacia');
+                filaVacia.innerHTML = `
+                    <td colspan="100" class="text-center py-5">
+                        <i class="bi bi-search fs-1 text-muted d-block mb-3"></i>
+                        <p class="text-muted">No se encontraron productos que coincidan con la búsqueda.</p>
+                        <button class="btn btn-sm btn-outline-primary" id="limpiar-busqueda">
+                            Limpiar búsqueda
+                        </button>
+                    </td>
+                `;
+                this.tbodyProductos.appendChild(filaVacia);
+                // Event listener para limpiar búsqueda
+                const btnLimpiar = filaVacia.querySelector('#limpiar-busqueda');
+                if (btnLimpiar) {
+                    btnLimpiar.addEventListener('click', () => {
+                        if (this.inputBuscar) {
+                            this.inputBuscar.value = '';
+                            this.filtrarProductos();
+                        }
+                    });
+                }
+            }
+        }
+        else {
+            if (filaVacia) {
+                filaVacia.remove();
+            }
+        }
+    }
+    /**
+     * Ordena productos por columna
+     *
+     * NOTA: Por simplicidad, esta versión recarga la página con parámetros de ordenamiento.
+     * En una versión futura se puede implementar ordenamiento client-side.
+     */
+    ordenarPorColumna(indiceColumna) {
+        console.log(`Ordenar por columna ${indiceColumna}`);
+        // TODO: Implementar ordenamiento client-side o redirigir con parámetros
+    }
+    /**
+     * Exporta datos a Excel con múltiples hojas
+     *
+     * EXPLICACIÓN:
+     * Esta función redirige a una vista de Django que genera el archivo Excel.
+     * NO genera el Excel en JavaScript (sería muy complejo y lento).
+     */
+    exportarExcel() {
+        // Construir URL con filtros actuales
+        const params = new URLSearchParams(window.location.search);
+        // Agregar parámetro de exportación
+        params.set('export', 'excel');
+        // Redirigir a la misma URL con parámetro de exportación
+        // La vista de Django detectará este parámetro y generará el Excel
+        const urlExport = `${window.location.pathname}?${params.toString()}`;
+        // Mostrar indicador de carga
+        if (this.btnExportar) {
+            const textoOriginal = this.btnExportar.innerHTML;
+            this.btnExportar.disabled = true;
+            this.btnExportar.innerHTML = '<i class="bi bi-hourglass-split me-1"></i>Generando...';
+            // Usar iframe oculto para descargar sin recargar página
+            const iframe = document.createElement('iframe');
+            iframe.style.display = 'none';
+            iframe.src = urlExport;
+            document.body.appendChild(iframe);
+            // Restaurar botón después de 3 segundos
+            setTimeout(() => {
+                if (this.btnExportar) {
+                    this.btnExportar.disabled = false;
+                    this.btnExportar.innerHTML = textoOriginal;
+                }
+                iframe.remove();
+            }, 3000);
+        }
+    }
+}
+// ============================================================================
+// INICIALIZACIÓN
+// ============================================================================
+document.addEventListener('DOMContentLoaded', () => {
+    console.log('Inicializando Dashboard de Distribución Multi-Sucursal...');
+    // Verificar que estamos en la página correcta
+    const tbody = document.getElementById('tbody-productos');
+    if (tbody) {
+        const dashboard = new DashboardDistribucion();
+        console.log('Dashboard inicializado correctamente');
+    }
+    else {
+        console.warn('No se encontró el elemento tbody-productos. El script no se ejecutará.');
+    }
+});
+//# sourceMappingURL=dashboard-distribucion-sucursales.js.3e86ce85f226.map
\ No newline at end of file
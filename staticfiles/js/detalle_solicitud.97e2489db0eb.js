@@ -0,0 +1,620 @@
+"use strict";
+/**
+ * detalle_solicitud.ts
+ * ====================
+ *
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ * Este módulo TypeScript maneja toda la interactividad del detalle
+ * de una Solicitud de Cotización en el almacén.
+ *
+ * ¿Qué hace?
+ * - Gestiona el modal de imágenes por línea (ver, subir, eliminar)
+ * - Maneja el modal de rechazo de líneas
+ * - Controla el envío de notificación a recepción (FRONTDESK)
+ * - Renderiza galerías de imágenes dinámicamente
+ * - Envía formularios via AJAX para mejor UX
+ *
+ * ESTRUCTURA:
+ * - Interfaces: definen la forma de los datos
+ * - Clase DetalleSolicitud: encapsula toda la lógica
+ * - Inicialización: se ejecuta al cargar la página
+ */
+// ========================================================================
+// CLASE PRINCIPAL
+// ========================================================================
+class DetalleSolicitud {
+    constructor() {
+        // Leer configuración desde JSON embebido en el template
+        const configEl = document.getElementById('solicitudConfig');
+        if (!configEl) {
+            throw new Error('Elemento #solicitudConfig no encontrado');
+        }
+        this.config = JSON.parse(configEl.textContent || '{}');
+        // Leer datos de imágenes desde JSON embebido
+        const imagenesEl = document.getElementById('imagenesData');
+        this.imagenesData = imagenesEl ? JSON.parse(imagenesEl.textContent || '{}') : {};
+    }
+    /**
+     * Inicializa todos los event listeners y funcionalidades
+     */
+    init() {
+        this.initImagenesModal();
+        this.initRechazarModal();
+        this.initAprobarReacModal();
+        this.initNotificarFront();
+        this.initToggleCostosInternos();
+        this.initScrollShadow();
+        this.initMobileDock();
+    }
+    // ====================================================================
+    // MODAL DE IMÁGENES DE LÍNEA
+    // ====================================================================
+    /**
+     * Configura el modal de imágenes: al abrirse, carga los datos de la línea
+     */
+    initImagenesModal() {
+        const modal = document.getElementById('imagenesModal');
+        if (!modal)
+            return;
+        modal.addEventListener('show.bs.modal', (event) => {
+            const bsEvent = event;
+            const button = bsEvent.relatedTarget;
+            if (!button)
+                return;
+            const lineaPk = button.getAttribute('data-linea-pk');
+            const lineaNumero = button.getAttribute('data-linea-numero');
+            const lineaDesc = button.getAttribute('data-linea-desc');
+            // Actualizar encabezado del modal
+            const numeroEl = document.getElementById('imagenesLineaNumero');
+            const descEl = document.getElementById('imagenesLineaDesc');
+            if (numeroEl)
+                numeroEl.textContent = lineaNumero || '';
+            if (descEl)
+                descEl.textContent = lineaDesc || '';
+            // Configurar el formulario de subida
+            const uploadLineaPk = document.getElementById('uploadLineaPk');
+            if (uploadLineaPk && lineaPk) {
+                uploadLineaPk.value = lineaPk;
+            }
+            // Cargar las imágenes de esta línea
+            if (lineaPk) {
+                this.cargarImagenesLinea(lineaPk);
+            }
+        });
+    }
+    /**
+     * Renderiza la galería de imágenes de una línea específica
+     */
+    cargarImagenesLinea(lineaPk) {
+        const container = document.getElementById('imagenesContainer');
+        const contador = document.getElementById('contadorImagenes');
+        const espaciosEl = document.getElementById('espaciosDisponibles');
+        const btnSubir = document.getElementById('btnSubirImagen');
+        const formSubir = document.getElementById('formSubirImagen');
+        if (!container)
+            return;
+        // Obtener datos de la línea
+        const lineaData = this.imagenesData[lineaPk];
+        if (!lineaData) {
+            container.innerHTML = `
+                <div class="col-12 text-center text-muted py-4">
+                    <i class="bi bi-exclamation-triangle fs-1 d-block mb-2"></i>
+                    No se encontraron datos para esta línea
+                </div>
+            `;
+            return;
+        }
+        const imagenes = lineaData.imagenes || [];
+        const totalImagenes = imagenes.length;
+        const espaciosDisponibles = this.config.maxImagenes - totalImagenes;
+        // Actualizar contador
+        if (contador) {
+            contador.textContent = `${totalImagenes}/${this.config.maxImagenes}`;
+            contador.className = `badge ms-2 ${totalImagenes >= this.config.maxImagenes ? 'bg-danger' : 'bg-secondary'}`;
+        }
+        // Actualizar espacios disponibles
+        if (espaciosEl) {
+            espaciosEl.innerHTML = `Espacios disponibles: <strong>${espaciosDisponibles}</strong>`;
+        }
+        // Deshabilitar botón si no hay espacio
+        if (btnSubir && this.config.puedeSubir) {
+            if (espaciosDisponibles <= 0) {
+                btnSubir.disabled = true;
+                btnSubir.innerHTML = '<i class="bi bi-x-circle me-1"></i>Límite alcanzado';
+            }
+            else {
+                btnSubir.disabled = false;
+                btnSubir.innerHTML = '<i class="bi bi-upload me-1"></i>Subir Imagen';
+            }
+        }
+        // Ocultar formulario si no hay espacio
+        if (formSubir && espaciosDisponibles <= 0) {
+            formSubir.innerHTML = `
+                <div class="alert alert-warning mb-0">
+                    <i class="bi bi-exclamation-triangle me-1"></i>
+                    Se alcanzó el límite de ${this.config.maxImagenes} imágenes para esta línea.
+                </div>
+            `;
+        }
+        // Renderizar imágenes
+        if (totalImagenes === 0) {
+            container.innerHTML = `
+                <div class="col-12 text-center text-muted py-4" id="sinImagenes">
+                    <i class="bi bi-image fs-1 d-block mb-2"></i>
+                    No hay imágenes para esta línea
+                </div>
+            `;
+            return;
+        }
+        let html = '';
+        imagenes.forEach((img) => {
+            html += `
+                <div class="col-md-4 col-sm-6">
+                    <div class="card h-100">
+                        <img src="${img.url}" class="card-img-top cursor-pointer" 
+                             alt="${img.descripcion || img.nombre}"
+                             style="height: 150px; object-fit: cover; cursor: pointer;"
+                             data-img-url="${img.url}"
+                             data-img-desc="${img.descripcion || img.nombre}"
+                             title="Clic para ampliar">
+                        <div class="card-body p-2">
+                            <p class="card-text small mb-1 text-truncate" title="${img.descripcion || img.nombre}">
+                                ${img.descripcion || img.nombre}
+                            </p>
+                            <small class="text-muted d-block">
+                                <i class="bi bi-calendar me-1"></i>${img.fecha}
+                                ${img.comprimida ? '<span class="badge bg-info ms-1" title="Imagen comprimida"><i class="bi bi-file-zip"></i></span>' : ''}
+                            </small>
+                            ${img.tamano_kb ? `<small class="text-muted">${img.tamano_kb} KB</small>` : ''}
+                        </div>
+                        ${this.config.puedeSubir ? `
+                        <div class="card-footer p-1 text-center">
+                            <form method="post" 
+                                  action="${this.config.urlEliminarImagen.replace('/0/imagenes/0/', `/${lineaPk}/imagenes/${img.id}/`)}"
+                                  onsubmit="return confirm('¿Eliminar esta imagen?');"
+                                  class="eliminar-imagen-form">
+                                <input type="hidden" name="csrfmiddlewaretoken" value="${this.config.csrfToken}">
+                                <button type="submit" class="btn btn-sm btn-outline-danger">
+                                    <i class="bi bi-trash"></i> Eliminar
+                                </button>
+                            </form>
+                        </div>
+                        ` : ''}
+                    </div>
+                </div>
+            `;
+        });
+        container.innerHTML = html;
+        // Agregar event listeners para ampliar imágenes
+        container.querySelectorAll('img[data-img-url]').forEach((img) => {
+            img.addEventListener('click', () => {
+                const url = img.getAttribute('data-img-url') || '';
+                const desc = img.getAttribute('data-img-desc') || '';
+                this.verImagenAmpliada(url, desc);
+            });
+        });
+    }
+    /**
+     * Abre el modal de imagen ampliada (lightbox)
+     */
+    verImagenAmpliada(url, descripcion) {
+        const srcEl = document.getElementById('imagenAmpliadaSrc');
+        const descEl = document.getElementById('imagenAmpliadaDesc');
+        const modalEl = document.getElementById('imagenAmpliadaModal');
+        if (!srcEl || !modalEl)
+            return;
+        srcEl.src = url;
+        if (descEl)
+            descEl.textContent = descripcion || 'Imagen';
+        // Usar Bootstrap Modal API
+        const bsLib = window['bootstrap'];
+        if (bsLib) {
+            const modal = new bsLib.Modal(modalEl);
+            modal.show();
+        }
+    }
+    // ====================================================================
+    // MODAL DE RECHAZO DE LÍNEA
+    // ====================================================================
+    /**
+     * Configura el modal de rechazo: al abrirse, actualiza la URL del form
+     */
+    initRechazarModal() {
+        const modal = document.getElementById('rechazarLineaModal');
+        if (!modal)
+            return;
+        modal.addEventListener('show.bs.modal', (event) => {
+            const bsEvent = event;
+            const button = bsEvent.relatedTarget;
+            if (!button)
+                return;
+            const lineaPk = button.getAttribute('data-linea-pk');
+            const lineaDesc = button.getAttribute('data-linea-desc');
+            // Actualizar la acción del formulario
+            const form = document.getElementById('rechazarLineaForm');
+            if (form && lineaPk) {
+                form.action = this.config.urlResponderLinea.replace('/0/', `/${lineaPk}/`);
+            }
+            // Actualizar el texto
+            const descEl = document.getElementById('lineaDescModal');
+            if (descEl)
+                descEl.textContent = lineaDesc || '';
+        });
+    }
+    // ====================================================================
+    // MODAL DE APROBACIÓN — EQUIPO REACONDICIONADO (forma de pago)
+    // ====================================================================
+    /**
+     * Lee el snapshot de costeo inyectado por Django (json_script).
+     */
+    obtenerCosteoReacAprobar() {
+        const el = document.getElementById('costeoReacAprobarData');
+        if (!(el === null || el === void 0 ? void 0 : el.textContent))
+            return null;
+        try {
+            return JSON.parse(el.textContent);
+        }
+        catch {
+            return null;
+        }
+    }
+    /**
+     * Arma las 4 opciones de pago con etiqueta y monto con IVA.
+     */
+    construirOpcionesPagoReac(costeo) {
+        const dif = costeo.opciones_diferidas_con_iva || {};
+        return [
+            {
+                valor: 'contado',
+                etiqueta: 'Pago de contado',
+                monto: Number(costeo.total_precio_contado_mxn || 0),
+            },
+            {
+                valor: 'diferido_3_meses',
+                etiqueta: 'Financiamiento 3 meses',
+                monto: Number(dif.diferido_3_meses || 0),
+            },
+            {
+                valor: 'diferido_6_meses',
+                etiqueta: 'Financiamiento 6 meses',
+                monto: Number(dif.diferido_6_meses || 0),
+            },
+            {
+                valor: 'diferido_12_meses',
+                etiqueta: 'Financiamiento 12 meses',
+                monto: Number(dif.diferido_12_meses || 0),
+            },
+        ];
+    }
+    formatearPesoReac(monto) {
+        return new Intl.NumberFormat('es-MX', {
+            style: 'currency',
+            currency: 'MXN',
+        }).format(monto);
+    }
+    /**
+     * Configura el modal de aprobación reac: forma de pago obligatoria.
+     */
+    initAprobarReacModal() {
+        const modal = document.getElementById('aprobarLineaReacModal');
+        if (!modal)
+            return;
+        modal.addEventListener('show.bs.modal', (event) => {
+            const bsEvent = event;
+            const button = bsEvent.relatedTarget;
+            if (!button)
+                return;
+            const lineaPk = button.getAttribute('data-linea-pk');
+            const lineaDesc = button.getAttribute('data-linea-desc') || '';
+            const form = document.getElementById('aprobarLineaReacForm');
+            if (form && lineaPk) {
+                form.action = this.config.urlResponderLinea.replace('/0/', `/${lineaPk}/`);
+            }
+            const descEl = document.getElementById('aprobarReacLineaDesc');
+            if (descEl)
+                descEl.textContent = lineaDesc;
+            const contenedor = document.getElementById('aprobarReacOpcionesPago');
+            const alertaSinCosteo = document.getElementById('aprobarReacSinCosteo');
+            const btnConfirmar = document.getElementById('btnConfirmarAprobarReac');
+            const costeo = this.obtenerCosteoReacAprobar();
+            if (!contenedor)
+                return;
+            contenedor.innerHTML = '';
+            if (!costeo) {
+                if (alertaSinCosteo)
+                    alertaSinCosteo.classList.remove('d-none');
+                if (btnConfirmar)
+                    btnConfirmar.disabled = true;
+                return;
+            }
+            if (alertaSinCosteo)
+                alertaSinCosteo.classList.add('d-none');
+            if (btnConfirmar)
+                btnConfirmar.disabled = false;
+            const opciones = this.construirOpcionesPagoReac(costeo);
+            opciones.forEach((opcion, index) => {
+                const id = `opcionPagoReac_${opcion.valor}`;
+                const wrapper = document.createElement('div');
+                wrapper.className = 'form-check border rounded p-2';
+                wrapper.innerHTML = `
+                    <input class="form-check-input" type="radio" name="opcion_pago_reac"
+                           id="${id}" value="${opcion.valor}" ${index === 0 ? 'checked' : ''} required>
+                    <label class="form-check-label w-100 d-flex justify-content-between align-items-center" for="${id}">
+                        <span>${opcion.etiqueta}</span>
+                        <strong class="text-success">${this.formatearPesoReac(opcion.monto)}</strong>
+                    </label>
+                `;
+                contenedor.appendChild(wrapper);
+            });
+        });
+    }
+    // ====================================================================
+    // NOTIFICAR A FRONT (NUEVA FUNCIONALIDAD)
+    // ====================================================================
+    /**
+     * Configura el modal y envío de notificación a recepción.
+     * Incluye selector de plantilla (cotización lista vs PNC).
+     */
+    initNotificarFront() {
+        const btnEnviar = document.getElementById('btnNotificarFront');
+        const form = document.getElementById('formNotificarFront');
+        if (!btnEnviar || !form)
+            return;
+        // EXPLICACIÓN: al cambiar el radio, actualizamos textos del modal
+        const radios = form.querySelectorAll('input[name="tipo_plantilla"]');
+        radios.forEach((radio) => {
+            radio.addEventListener('change', () => {
+                this.actualizarUiPlantillaNotificar(radio.value || 'cotizacion_lista');
+            });
+        });
+        // Estado inicial según el radio marcado
+        const seleccionado = form.querySelector('input[name="tipo_plantilla"]:checked');
+        this.actualizarUiPlantillaNotificar((seleccionado === null || seleccionado === void 0 ? void 0 : seleccionado.value) || 'cotizacion_lista');
+        btnEnviar.addEventListener('click', (e) => {
+            e.preventDefault();
+            this.enviarNotificacion(form, btnEnviar);
+        });
+    }
+    /**
+     * Ajusta alertas y títulos del modal según la plantilla elegida.
+     *
+     * @param tipo - cotizacion_lista | partes_no_disponibles
+     */
+    actualizarUiPlantillaNotificar(tipo) {
+        const esPnc = tipo === 'partes_no_disponibles';
+        const alertEl = document.getElementById('alertTipoPlantillaNotificar');
+        const tituloAlert = document.getElementById('tituloAlertTipoPlantilla');
+        const textoAlert = document.getElementById('textoAlertTipoPlantilla');
+        const tituloResumen = document.getElementById('tituloResumenNotificar');
+        const ayudaPnc = document.getElementById('ayudaResumenPnc');
+        const labelLista = document.getElementById('labelPlantillaCotizacionLista');
+        const labelPnc = document.getElementById('labelPlantillaPnc');
+        const modalTitle = document.getElementById('notificarFrontModalLabel');
+        const btnEnviar = document.getElementById('btnNotificarFront');
+        if (alertEl) {
+            alertEl.classList.toggle('alert-warning', esPnc);
+            alertEl.classList.toggle('border-warning', esPnc);
+            alertEl.classList.toggle('alert-secondary', !esPnc);
+        }
+        if (tituloAlert) {
+            tituloAlert.innerHTML = esPnc
+                ? '<strong>Partes no disponibles (PNC)</strong>'
+                : '<strong>Cotización lista para Front</strong>';
+        }
+        if (textoAlert) {
+            textoAlert.textContent = esPnc
+                ? 'Se enviará el correo a Front avisando que no hay componentes en mercado. '
+                    + 'Esto NO cambia el estatus en ST; el PNC en ST ocurre al usar '
+                    + '«Notificar cliente: sin piezas (PNC)». '
+                    + 'Ofrece alternativas: reparación a nivel componente o equipo reacondicionado.'
+                : 'Se enviará el correo con precios y el estatus de la orden en ST '
+                    + 'pasará a «Se Recibe Cotización de Proveedores».';
+        }
+        if (tituloResumen) {
+            tituloResumen.textContent = esPnc
+                ? 'Piezas no encontradas'
+                : 'Resumen de la Cotización';
+        }
+        if (ayudaPnc) {
+            ayudaPnc.classList.toggle('d-none', !esPnc);
+        }
+        if (labelLista) {
+            labelLista.classList.toggle('border-success', !esPnc);
+            labelLista.classList.toggle('border-2', !esPnc);
+        }
+        if (labelPnc) {
+            labelPnc.classList.toggle('border-warning', esPnc);
+            labelPnc.classList.toggle('border-2', esPnc);
+        }
+        if (modalTitle) {
+            modalTitle.innerHTML = esPnc
+                ? '<i class="bi bi-exclamation-triangle me-2"></i>Notificar PNC a Recepción'
+                : '<i class="bi bi-envelope-paper me-2"></i>Notificar a Recepción';
+        }
+        if (btnEnviar) {
+            btnEnviar.innerHTML = esPnc
+                ? '<i class="bi bi-send-fill"></i> Enviar notificación PNC'
+                : '<i class="bi bi-send-fill"></i> Enviar Notificación';
+            btnEnviar.classList.toggle('btn-warning', esPnc);
+            btnEnviar.classList.toggle('btn-success', !esPnc);
+        }
+    }
+    /**
+     * Envía la notificación via AJAX y muestra feedback.
+     * FormData incluye tipo_plantilla (radios del formulario).
+     */
+    async enviarNotificacion(form, btn) {
+        // Deshabilitar botón y mostrar loading
+        const textoOriginal = btn.innerHTML;
+        btn.disabled = true;
+        btn.innerHTML = '<span class="spinner-border spinner-border-sm me-2"></span>Enviando...';
+        try {
+            // EXPLICACIÓN: FormData toma csrf, destinatarios, mensaje y tipo_plantilla
+            const formData = new FormData(form);
+            const response = await fetch(this.config.urlNotificarFront, {
+                method: 'POST',
+                body: formData,
+                headers: {
+                    'X-Requested-With': 'XMLHttpRequest',
+                },
+            });
+            const data = await response.json();
+            if (data.success) {
+                // Cerrar modal
+                const modalEl = document.getElementById('notificarFrontModal');
+                if (modalEl) {
+                    const bsLib = window['bootstrap'];
+                    if (bsLib) {
+                        const modal = bsLib.Modal.getInstance(modalEl);
+                        if (modal)
+                            modal.hide();
+                    }
+                }
+                // Mostrar modal de confirmación
+                this.mostrarConfirmacion(data);
+            }
+            else {
+                alert(data.error || '❌ Error al enviar la notificación.');
+            }
+        }
+        catch (error) {
+            console.error('Error en envío de notificación:', error);
+            alert('❌ Error de conexión. Verifica tu conexión a internet e intenta nuevamente.');
+        }
+        finally {
+            // Restaurar botón
+            btn.disabled = false;
+            btn.innerHTML = textoOriginal;
+        }
+    }
+    /**
+     * Muestra modal de confirmación tras envío exitoso
+     */
+    mostrarConfirmacion(data) {
+        var _a, _b, _c;
+        const destinatario = ((_a = data.data) === null || _a === void 0 ? void 0 : _a.destinatario) || '';
+        const solicitud = ((_b = data.data) === null || _b === void 0 ? void 0 : _b.solicitud) || '';
+        const esPnc = ((_c = data.data) === null || _c === void 0 ? void 0 : _c.tipo_plantilla) === 'partes_no_disponibles';
+        const titulo = esPnc ? 'Notificación PNC en Proceso' : 'Notificación en Proceso';
+        const detalleCorreo = esPnc
+            ? 'El correo de partes no disponibles (PNC) se está procesando.'
+            : 'El correo con la cotización se está procesando.';
+        const headerClass = esPnc ? 'bg-warning text-dark' : 'bg-success text-white';
+        const iconColor = esPnc ? '#ffc107' : '#198754';
+        const modalHTML = `
+            <div class="modal fade" id="modalConfirmacionNotificacion" tabindex="-1" aria-hidden="true">
+                <div class="modal-dialog modal-dialog-centered">
+                    <div class="modal-content">
+                        <div class="modal-header ${headerClass}">
+                            <h5 class="modal-title">
+                                <i class="bi bi-send-check"></i> ${titulo}
+                            </h5>
+                        </div>
+                        <div class="modal-body">
+                            <div class="text-center mb-3">
+                                <i class="bi bi-gear" style="font-size: 3rem; color: ${iconColor};"></i>
+                            </div>
+                            <p class="text-center fs-5 mb-2">
+                                ${data.message || 'La notificación se está enviando en segundo plano.'}
+                            </p>
+                            <div class="alert alert-info mb-0">
+                                <i class="bi bi-info-circle me-1"></i>
+                                <strong>Solicitud:</strong> ${solicitud}<br>
+                                <strong>Destinatario:</strong> ${destinatario}<br><br>
+                                ${detalleCorreo}
+                                Puedes continuar trabajando normalmente.
+                            </div>
+                        </div>
+                        <div class="modal-footer">
+                            <button type="button" class="btn btn-primary" onclick="location.reload()">
+                                <i class="bi bi-check-lg"></i> Aceptar
+                            </button>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        `;
+        // Eliminar modal previo si existe y agregar el nuevo
+        const prevModal = document.getElementById('modalConfirmacionNotificacion');
+        if (prevModal)
+            prevModal.remove();
+        document.body.insertAdjacentHTML('beforeend', modalHTML);
+        // Mostrar modal de confirmación
+        const bsConfirm = window['bootstrap'];
+        if (bsConfirm) {
+            const confirmModal = new bsConfirm.Modal(document.getElementById('modalConfirmacionNotificacion'));
+            confirmModal.show();
+        }
+    }
+    // ====================================================================
+    // UI/UX — Toggle costos, scroll shadow, dock móvil
+    // ====================================================================
+    /**
+     * Muestra u oculta las columnas de costo interno del proveedor.
+     * Guarda la preferencia en localStorage para persistir entre visitas.
+     */
+    initToggleCostosInternos() {
+        const toggle = document.getElementById('toggleCostosInternos');
+        const page = document.getElementById('detalleSolicitudPage');
+        if (!toggle || !page)
+            return;
+        const storageKey = 'detalleSolicitudMostrarCostos';
+        const saved = localStorage.getItem(storageKey);
+        if (saved === 'false') {
+            toggle.checked = false;
+            page.classList.add('costos-ocultos');
+        }
+        toggle.addEventListener('change', () => {
+            if (toggle.checked) {
+                page.classList.remove('costos-ocultos');
+                localStorage.setItem(storageKey, 'true');
+            }
+            else {
+                page.classList.add('costos-ocultos');
+                localStorage.setItem(storageKey, 'false');
+            }
+        });
+    }
+    /**
+     * Agrega sombra visual cuando la tabla tiene scroll horizontal pendiente.
+     */
+    initScrollShadow() {
+        const wraps = document.querySelectorAll('.detalle-table-wrap');
+        wraps.forEach((wrap) => {
+            const updateShadow = () => {
+                const hasScroll = wrap.scrollWidth > wrap.clientWidth + 2;
+                const atEnd = wrap.scrollLeft + wrap.clientWidth >= wrap.scrollWidth - 2;
+                wrap.classList.toggle('has-scroll-right', hasScroll && !atEnd);
+            };
+            wrap.addEventListener('scroll', updateShadow, { passive: true });
+            window.addEventListener('resize', updateShadow);
+            updateShadow();
+        });
+    }
+    /**
+     * Clona el panel de acciones al offcanvas móvil al abrirse.
+     */
+    initMobileDock() {
+        const source = document.getElementById('panelAccionesBody');
+        const target = document.getElementById('offcanvasAccionesBody');
+        const offcanvasEl = document.getElementById('offcanvasAcciones');
+        if (!source || !target || !offcanvasEl)
+            return;
+        offcanvasEl.addEventListener('show.bs.offcanvas', () => {
+            target.innerHTML = source.innerHTML;
+        });
+    }
+}
+// ========================================================================
+// INICIALIZACIÓN
+// ========================================================================
+document.addEventListener('DOMContentLoaded', () => {
+    try {
+        const detalle = new DetalleSolicitud();
+        detalle.init();
+    }
+    catch (error) {
+        console.error('Error inicializando DetalleSolicitud:', error);
+    }
+});
+//# sourceMappingURL=detalle_solicitud.js.08f62b0e91b8.map
\ No newline at end of file
@@ -0,0 +1,100 @@
+"use strict";
+/**
+ * Botón "Notificar equipo disponible" en detalle de orden.
+ *
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ * Cuando la orden está en Finalizado, recepción puede avisar al cliente por
+ * correo de que ya puede recolectar el equipo. Este módulo:
+ * 1) Confirma con el usuario
+ * 2) Hace POST a la vista Django (CSRF)
+ * 3) Si OK, deja el botón como "Equipo notificado" (deshabilitado)
+ */
+(function () {
+    'use strict';
+    function marcarBotonNotificado(btn) {
+        btn.disabled = true;
+        btn.classList.remove('btn-success');
+        btn.classList.add('btn-outline-success');
+        btn.innerHTML =
+            '<i class="bi bi-check-circle-fill me-1"></i> Equipo notificado';
+        btn.title = 'Ya se notificó al cliente';
+    }
+    async function enviarNotificacion(btn) {
+        var _a, _b;
+        const url = btn.dataset.url;
+        if (!url) {
+            window.alert('No se encontró la URL de notificación.');
+            return;
+        }
+        const email = btn.dataset.email || 'el cliente';
+        const folio = btn.dataset.folio || '';
+        const confirmar = window.confirm(`¿Enviar el correo de "equipo disponible para recolección" a ${email}` +
+            (folio ? ` (folio ${folio})` : '') +
+            '?\n\nEsta acción no se puede deshacer desde aquí.');
+        if (!confirmar) {
+            return;
+        }
+        const textoOriginal = btn.innerHTML;
+        btn.disabled = true;
+        btn.innerHTML =
+            '<span class="spinner-border spinner-border-sm me-1" role="status"></span> Enviando…';
+        try {
+            const response = await fetch(url, {
+                method: 'POST',
+                headers: {
+                    'X-CSRFToken': (_b = (_a = window.getCsrfToken) === null || _a === void 0 ? void 0 : _a.call(window)) !== null && _b !== void 0 ? _b : '',
+                    Accept: 'application/json',
+                },
+                credentials: 'same-origin',
+            });
+            const data = (await response.json());
+            if (!response.ok || !data.success) {
+                window.alert(data.error || 'No se pudo enviar la notificación.');
+                // Si ya estaba notificado, dejar el botón en estado final
+                if (data.ya_notificado) {
+                    marcarBotonNotificado(btn);
+                    return;
+                }
+                btn.disabled = false;
+                btn.innerHTML = textoOriginal;
+                return;
+            }
+            marcarBotonNotificado(btn);
+            window.alert(data.message ||
+                'Correo encolado. El cliente recibirá el aviso en breve.');
+        }
+        catch (err) {
+            console.error('[notificar_equipo_disponible]', err);
+            window.alert('Error de red al notificar. Intenta de nuevo.');
+            btn.disabled = false;
+            btn.innerHTML = textoOriginal;
+        }
+    }
+    function init() {
+        const btn = document.getElementById('btnNotificarEquipoDisponible');
+        if (!btn) {
+            return;
+        }
+        btn.addEventListener('click', () => {
+            void enviarNotificacion(btn);
+        });
+        // Si la URL trae el ancla, resaltar el bloque al abrir desde la campanita
+        if (window.location.hash === '#notificar-equipo-disponible') {
+            const bloque = document.getElementById('notificar-equipo-disponible');
+            if (bloque) {
+                bloque.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                bloque.classList.add('border', 'border-success', 'rounded', 'p-2');
+                window.setTimeout(() => {
+                    bloque.classList.remove('border', 'border-success', 'rounded', 'p-2');
+                }, 4000);
+            }
+        }
+    }
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init);
+    }
+    else {
+        init();
+    }
+})();
+//# sourceMappingURL=notificar_equipo_disponible.js.d0ff9dc6fe94.map
\ No newline at end of file
@@ -0,0 +1,153 @@
+"use strict";
+/**
+ * pwa_install_seguimiento.ts — Banner de instalación PWA del seguimiento del cliente
+ *
+ * EXPLICACIÓN PARA PRINCIPIANTES:
+ * ================================
+ * Este archivo es una versión independiente de `pwa_install.ts` (el banner que
+ * usan los EMPLEADOS dentro del sistema). Este es exclusivo de la página
+ * pública `/seguimiento/<token>/`, que abren los CLIENTES desde su correo.
+ *
+ * ¿Por qué un archivo separado en vez de reutilizar `pwa_install.ts`?
+ * - `pwa_install.ts` solo se carga en páginas que extienden `base.html`
+ *   y que requieren sesión iniciada (`{% if user.is_authenticated %}`).
+ *   La página de seguimiento es standalone y pública, no pasa por ahí.
+ * - El manifest que se instala aquí es DISTINTO (apunta al token del
+ *   cliente, no al sistema interno), así que conviene mantener la lógica
+ *   de instalación separada para no mezclar los dos flujos.
+ * - Usamos una clave de localStorage diferente para el "cooldown" de cierre,
+ *   porque localStorage se comparte por dominio (no por página): si
+ *   reutilizáramos la misma clave que el banner interno, cerrar uno
+ *   silenciaría el otro sin razón.
+ *
+ * A petición del negocio, este banner es más insistente que el interno:
+ * aparece a los 4 segundos (vs. 7s del banner interno), porque esta página
+ * la usa un cliente externo una sola vez y queremos maximizar que instale
+ * el acceso directo a su seguimiento.
+ *
+ * Mismo flujo que el banner interno:
+ * 1. Android/Chrome/Edge → capturamos 'beforeinstallprompt' y mostramos
+ *    nuestro propio botón "Instalar".
+ * 2. iOS Safari → no existe ese evento; mostramos instrucciones manuales
+ *    ("Compartir" → "Agregar a pantalla de inicio").
+ *
+ * NOTA TÉCNICA: todo el archivo va envuelto en un IIFE (función que se
+ * ejecuta sola) para que sus variables (DISMISSED_KEY, promptEvent, etc.)
+ * no choquen con las de 'pwa_install.ts' — ambos scripts se compilan juntos
+ * y, sin este envoltorio, TypeScript los trataría como si compartieran el
+ * mismo espacio global (ambos declaran nombres iguales).
+ */
+/// <reference path="./eventos_seguimiento.d.ts" />
+(function () {
+    // ── Tipos ──────────────────────────────────────────────────────────────────────
+    // ── Constantes ─────────────────────────────────────────────────────────────────
+    /** Clave de localStorage propia de esta página (no compartida con el banner interno). */
+    const DISMISSED_KEY = 'pwa_install_dismissed_at_seguimiento';
+    /** Días de cooldown tras cerrar el banner. */
+    const COOLDOWN_DIAS = 7;
+    /**
+     * Milisegundos de espera antes de mostrar el banner.
+     * A propósito más corto (4s) que el banner interno (7s): el cliente solo
+     * visita esta página una vez desde su correo, así que se prioriza que
+     * vea la invitación a instalar cuanto antes.
+     */
+    const DELAY_MOSTRAR_MS = 4000;
+    // ── Helpers de detección ───────────────────────────────────────────────────────
+    function yaEstaInstalada() {
+        const esStandalone = window.matchMedia('(display-mode: standalone)').matches;
+        const esStandaloneIOS = navigator.standalone === true;
+        return esStandalone || esStandaloneIOS;
+    }
+    function estaEnCooldown() {
+        const ts = localStorage.getItem(DISMISSED_KEY);
+        if (!ts)
+            return false;
+        const msPasados = Date.now() - parseInt(ts, 10);
+        return msPasados < COOLDOWN_DIAS * 24 * 60 * 60 * 1000;
+    }
+    function esIOSNoInstalado() {
+        const esIOS = /iphone|ipad|ipod/i.test(navigator.userAgent);
+        const noInstalado = !navigator.standalone;
+        return esIOS && noInstalado;
+    }
+    // ── Animación del banner ───────────────────────────────────────────────────────
+    function mostrarBanner() {
+        var _a;
+        const banner = document.getElementById('st-pwa-install-banner');
+        if (!banner)
+            return;
+        banner.style.display = 'block';
+        // Forzamos un reflow para que la transición CSS funcione correctamente.
+        void banner.offsetHeight;
+        banner.classList.add('is-visible');
+        (_a = window.EventosSeguimiento) === null || _a === void 0 ? void 0 : _a.registrarEvento('pwa_banner_mostrado', {}, true);
+    }
+    function ocultarBanner() {
+        const banner = document.getElementById('st-pwa-install-banner');
+        if (!banner)
+            return;
+        banner.classList.remove('is-visible');
+        banner.addEventListener('transitionend', () => {
+            banner.style.display = 'none';
+        }, { once: true });
+    }
+    function guardarDismiss() {
+        var _a;
+        localStorage.setItem(DISMISSED_KEY, Date.now().toString());
+        (_a = window.EventosSeguimiento) === null || _a === void 0 ? void 0 : _a.registrarEvento('pwa_banner_cerrado');
+    }
+    // ── Lógica principal ───────────────────────────────────────────────────────────
+    let promptEvent = null;
+    window.addEventListener('beforeinstallprompt', (e) => {
+        e.preventDefault();
+        promptEvent = e;
+        if (yaEstaInstalada() || estaEnCooldown())
+            return;
+        setTimeout(mostrarBanner, DELAY_MOSTRAR_MS);
+    });
+    document.addEventListener('DOMContentLoaded', () => {
+        var _a;
+        if (yaEstaInstalada() || estaEnCooldown())
+            return;
+        const installBtn = document.getElementById('st-pwa-install-btn');
+        const dismissBtn = document.getElementById('st-pwa-dismiss-btn');
+        const iosInstr = document.getElementById('st-pwa-ios-instructions');
+        const androidBtn = document.getElementById('st-pwa-android-wrapper');
+        // ── iOS: instrucciones manuales (no existe 'beforeinstallprompt') ────────
+        if (esIOSNoInstalado()) {
+            if (iosInstr)
+                iosInstr.style.display = 'flex';
+            if (androidBtn)
+                androidBtn.style.display = 'none';
+            setTimeout(mostrarBanner, DELAY_MOSTRAR_MS);
+        }
+        // ── Botón "Instalar" (Android / Chrome / Edge) ───────────────────────────
+        installBtn === null || installBtn === void 0 ? void 0 : installBtn.addEventListener('click', async () => {
+            var _a;
+            if (!promptEvent)
+                return;
+            await promptEvent.prompt();
+            const { outcome } = await promptEvent.userChoice;
+            (_a = window.EventosSeguimiento) === null || _a === void 0 ? void 0 : _a.registrarEvento(outcome === 'accepted' ? 'pwa_prompt_aceptado' : 'pwa_prompt_rechazado');
+            if (outcome === 'accepted') {
+                ocultarBanner();
+            }
+            promptEvent = null;
+        });
+        // ── Botón "✕" para cerrar el banner ─────────────────────────────────────
+        dismissBtn === null || dismissBtn === void 0 ? void 0 : dismissBtn.addEventListener('click', () => {
+            guardarDismiss();
+            ocultarBanner();
+        });
+        // ── Ocultar automáticamente si la app se instala ─────────────────────────
+        window.addEventListener('appinstalled', () => {
+            var _a;
+            (_a = window.EventosSeguimiento) === null || _a === void 0 ? void 0 : _a.registrarEvento('pwa_instalada');
+            ocultarBanner();
+        });
+        if (yaEstaInstalada()) {
+            (_a = window.EventosSeguimiento) === null || _a === void 0 ? void 0 : _a.registrarEvento('pwa_modo_standalone', {}, true);
+        }
+    });
+})();
+//# sourceMappingURL=pwa_install_seguimiento.js.d0ebe13458c3.map
\ No newline at end of file